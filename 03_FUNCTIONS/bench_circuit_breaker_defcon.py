@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+MICROBENCHMARK: TradingCircuitBreaker.call DEFCON overhead
+==========================================================
+
+Measures per-call latency of a no-op order function guarded by
+TradingCircuitBreaker under three DEFCON sources:
+
+  per_call_query   Previous behaviour: new psycopg2 connection + DEFCON
+                   query on every call
+  cached_provider  DefconStateProvider (LISTEN/NOTIFY + fallback poll)
+  static           StaticDefconProvider - breaker bookkeeping only
+
+The first two need the database (PGHOST/PGPORT/...). Without it they are
+reported as skipped and only the static baseline runs.
+
+Usage:
+    python 03_FUNCTIONS/bench_circuit_breaker_defcon.py
+    python 03_FUNCTIONS/bench_circuit_breaker_defcon.py --iterations 5000 --query-iterations 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import psycopg2  # noqa: E402
+
+from circuit_breaker_wrapper import CircuitBreakerConfig, TradingCircuitBreaker  # noqa: E402
+from defcon_state_provider import (  # noqa: E402
+    DB_CONFIG,
+    DefconStateProvider,
+    StaticDefconProvider,
+    fetch_current_defcon,
+)
+
+
+class PerCallDefconQuery:
+    """Previous _check_defcon: connect, query, close on every call."""
+
+    def get_level(self) -> str:
+        conn = psycopg2.connect(**DB_CONFIG)
+        try:
+            return fetch_current_defcon(conn)[0]
+        finally:
+            conn.close()
+
+
+def _order():
+    return None
+
+
+def measure(provider, iterations: int) -> dict:
+    breaker = TradingCircuitBreaker(
+        CircuitBreakerConfig(name="bench_breaker", fail_max=10**9),
+        defcon_provider=provider
+    )
+    breaker.call(_order)  # warm-up (starts listener, first connection)
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        breaker.call(_order)
+        samples.append((time.perf_counter() - start) * 1e6)
+
+    samples.sort()
+    return {
+        'iterations': iterations,
+        'mean_us': round(statistics.fmean(samples), 2),
+        'p50_us': round(samples[len(samples) // 2], 2),
+        'p99_us': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 2),
+        'max_us': round(samples[-1], 2)
+    }
+
+
+def database_available() -> bool:
+    try:
+        psycopg2.connect(connect_timeout=3, **DB_CONFIG).close()
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TradingCircuitBreaker.call DEFCON overhead')
+    parser.add_argument('--iterations', type=int, default=20000, help='Calls for cached/static runs')
+    parser.add_argument('--query-iterations', type=int, default=200, help='Calls for the per-call query run')
+    args = parser.parse_args()
+
+    results = {}
+    if database_available():
+        results['per_call_query'] = measure(PerCallDefconQuery(), args.query_iterations)
+        provider = DefconStateProvider()
+        try:
+            results['cached_provider'] = measure(provider, args.iterations)
+            results['cached_provider']['provider'] = provider.get_stats()
+        finally:
+            provider.stop()
+    else:
+        results['per_call_query'] = results['cached_provider'] = 'skipped: database unreachable'
+    results['static'] = measure(StaticDefconProvider('GREEN'), args.iterations)
+
+    if isinstance(results['cached_provider'], dict):
+        results['speedup_p50'] = round(
+            results['per_call_query']['p50_us'] / results['cached_provider']['p50_us'], 1
+        )
+
+    print(json.dumps(results, indent=2, default=str))
+
+
+if __name__ == '__main__':
+    main()
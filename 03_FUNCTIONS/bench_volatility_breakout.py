@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: IoS-017 squeeze scan over the asset universe
+=======================================================
+
+Compares VolatilityBreakoutEngine.scan_universe in its two modes:
+
+  per_asset   Previous behaviour: scan_asset per active asset
+              (price query + causal edge query + one query per parent)
+  panel       One price panel query, one ranked edge query, indicators
+              computed over all columns at once
+
+With the database reachable (PGHOST/PGPORT/...) both modes run against
+the real fhq_meta.assets universe. Otherwise a synthetic universe of
+--assets assets is served from memory, and --rtt-ms adds a simulated
+round trip per query so the query count shows up in wall time.
+
+Usage:
+    python 03_FUNCTIONS/bench_volatility_breakout.py
+    python 03_FUNCTIONS/bench_volatility_breakout.py --assets 2000 --rtt-ms 1.0
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import psycopg2  # noqa: E402
+
+from ios017_volatility_breakout_engine import DB_CONFIG, VolatilityBreakoutEngine  # noqa: E402
+
+D0 = date(2024, 1, 1)
+
+
+class SyntheticConn:
+    """In-memory answers to the engine's queries, with an optional RTT."""
+
+    def __init__(self, n_assets: int, bars: int, rtt_s: float, seed: int = 17):
+        rng = np.random.default_rng(seed)
+        self.rtt_s = rtt_s
+        self.queries = 0
+        self.assets = [f"A{i:05d}" for i in range(n_assets)]
+        self.prices = {}
+        for asset in self.assets:
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+            if rng.random() < 0.2:          # tight range ending in a breakout
+                close[-25:-1] = close[-26] * (1 + rng.normal(0, 0.0005, 24))
+                close[-1] = close[-2] * (1 + rng.choice([-0.06, 0.06]))
+            spread = rng.uniform(0.001, 0.01, (2, bars))
+            self.prices[asset] = (close * (1 + spread[0]), close * (1 - spread[1]), close)
+        self.edges = {}
+        for asset in self.assets:
+            sources = rng.choice(self.assets, size=int(rng.integers(0, 5)), replace=False)
+            weights = np.sort(rng.uniform(0.1, 1.0, len(sources)))[::-1]
+            self.edges[asset] = [(s, float(w)) for s, w in zip(sources, weights) if s != asset]
+
+    def cursor(self, cursor_factory=None):
+        return SyntheticCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SyntheticCursor:
+    def __init__(self, conn: SyntheticConn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def fetchall(self):
+        return self.rows
+
+    def _recent(self, asset, limit):
+        high, low, close = self.conn.prices.get(asset, ((), (), ()))
+        n = len(close)
+        return [(rn, D0 + timedelta(days=n - rn), float(high[n - rn]), float(low[n - rn]), float(close[n - rn]))
+                for rn in range(1, min(limit, n) + 1)]
+
+    def execute(self, sql, params=()):
+        self.conn.queries += 1
+        if self.conn.rtt_s:
+            time.sleep(self.conn.rtt_s)
+        if 'fhq_meta.assets' in sql:
+            self.rows = [(a,) for a in self.conn.assets]
+        elif 'causal_edges' in sql and 'ANY(' in sql:
+            self.rows = [{'target_id': t, 'source_id': s, 'edge_weight': w}
+                         for t in params[0] for s, w in self.conn.edges.get(t, [])[:params[1]]]
+        elif 'causal_edges' in sql:
+            self.rows = [{'source_id': s, 'edge_weight': w}
+                         for s, w in self.conn.edges.get(params[0], [])[:params[1]]]
+        elif 'price_series' in sql and 'ANY(' in sql:
+            self.rows = [(a, rn, h, l, c) for a in params[0]
+                         for rn, _, h, l, c in self._recent(a, params[1])]
+        elif 'price_series' in sql:
+            self.rows = [{'date': d, 'open': c, 'high': h, 'low': l, 'close': c, 'volume': 0.0}
+                         for _, d, h, l, c in self._recent(params[0], params[1])]
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+class CountingConn:
+    """Counts cursor.execute calls on a real connection."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.queries = 0
+
+    def cursor(self, *args, **kwargs):
+        cur = self._conn.cursor(*args, **kwargs)
+        execute = cur.execute
+
+        def counted(*a, **kw):
+            self.queries += 1
+            return execute(*a, **kw)
+
+        cur.execute = counted
+        return cur
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def database_available() -> bool:
+    try:
+        psycopg2.connect(connect_timeout=3, **DB_CONFIG).close()
+        return True
+    except Exception:
+        return False
+
+
+def run(engine: VolatilityBreakoutEngine, panel: bool) -> dict:
+    engine.conn.queries = 0
+    start = time.perf_counter()
+    signals = engine.scan_universe(panel=panel)
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': round(elapsed, 3),
+        'queries': engine.conn.queries,
+        'signals': len(signals),
+        'amplified': sum(1 for s in signals if s.causal_bonus > 1.0),
+        '_signals': [(s.canonical_id, s.signal_type, s.confidence, s.causal_bonus) for s in signals],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IoS-017 squeeze scan benchmark')
+    parser.add_argument('--assets', type=int, default=1000, help='Synthetic universe size')
+    parser.add_argument('--bars', type=int, default=150, help='Synthetic bars per asset')
+    parser.add_argument('--rtt-ms', type=float, default=0.0, help='Simulated round trip per query')
+    parser.add_argument('--bb-period', type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)   # one line per breakout otherwise
+
+    engine = VolatilityBreakoutEngine(bb_period=args.bb_period)
+    if database_available():
+        source = 'database'
+        engine.connect()
+        engine.conn = CountingConn(engine.conn)
+    else:
+        source = 'synthetic'
+        engine.conn = SyntheticConn(args.assets, args.bars, args.rtt_ms / 1000.0)
+
+    try:
+        per_asset = run(engine, panel=False)
+        panel = run(engine, panel=True)
+    finally:
+        engine.close()
+
+    identical = per_asset.pop('_signals') == panel.pop('_signals')
+    print(json.dumps({
+        'source': source,
+        'assets': args.assets if source == 'synthetic' else None,
+        'rtt_ms': args.rtt_ms if source == 'synthetic' else None,
+        'per_asset': per_asset,
+        'panel': panel,
+        'speedup': round(per_asset['seconds'] / panel['seconds'], 1) if panel['seconds'] else None,
+        'identical_signals': identical,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
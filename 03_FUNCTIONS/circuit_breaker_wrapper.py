@@ -24,13 +24,14 @@ import json
 import functools
 import threading
 import psycopg2
-from psycopg2.extras import RealDictCursor
 from datetime import datetime, timezone, timedelta
 from typing import Callable, Any, Optional, List, Dict
 from enum import Enum
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
+from defcon_state_provider import get_defcon_provider
+
 load_dotenv()
 
 DB_CONFIG = {
@@ -88,13 +89,15 @@ class TradingCircuitBreaker:
     - HALF-OPEN: Probe mode, limited calls allowed
 
     DEFCON Integration:
-    - Syncs with fhq_monitoring.defcon_status
+    - Reads the process-wide DEFCON cache (defcon_state_provider), no
+      database round trip per call; a stale cache fails closed (RED)
     - Auto-opens on DEFCON YELLOW or worse
     - Logs all state transitions to database
     """
 
-    def __init__(self, config: CircuitBreakerConfig = None):
+    def __init__(self, config: CircuitBreakerConfig = None, defcon_provider=None):
         self.config = config or CircuitBreakerConfig()
+        self._defcon_provider = defcon_provider
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
@@ -183,34 +186,20 @@ class TradingCircuitBreaker:
             print(f"[CIRCUIT_BREAKER] Log error: {e}")
 
     def _check_defcon(self) -> DEFCONLevel:
-        """Check current DEFCON level from database"""
+        """Current DEFCON level from the shared DEFCON cache"""
         if not self.config.defcon_enabled:
             return DEFCONLevel.GREEN
 
-        try:
-            conn = psycopg2.connect(**DB_CONFIG)
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute("""
-                    SELECT current_level, trigger_reason
-                    FROM fhq_monitoring.defcon_status
-                    ORDER BY activated_at DESC
-                    LIMIT 1
-                """)
-                result = cur.fetchone()
-            conn.close()
-
-            if result:
-                level_map = {
-                    'GREEN': DEFCONLevel.GREEN,
-                    'BLUE': DEFCONLevel.BLUE,
-                    'YELLOW': DEFCONLevel.YELLOW,
-                    'ORANGE': DEFCONLevel.ORANGE,
-                    'RED': DEFCONLevel.RED
-                }
-                return level_map.get(result['current_level'], DEFCONLevel.GREEN)
-            return DEFCONLevel.GREEN
-        except Exception:
-            return DEFCONLevel.GREEN
+        provider = self._defcon_provider or get_defcon_provider()
+        level_map = {
+            'GREEN': DEFCONLevel.GREEN,
+            'BLUE': DEFCONLevel.BLUE,
+            'YELLOW': DEFCONLevel.YELLOW,
+            'ORANGE': DEFCONLevel.ORANGE,
+            'RED': DEFCONLevel.RED,
+            'BLACK': DEFCONLevel.RED
+        }
+        return level_map.get(provider.get_level(), DEFCONLevel.RED)
 
     def _record_success(self):
         """Record successful call"""
@@ -0,0 +1,78 @@
+"""
+Shared test plumbing for 03_FUNCTIONS: an in-memory stand-in for a psycopg2
+connection.
+
+Test modules subclass FixtureConn and implement answer() (and, where the
+module under test uses psycopg2.extras.execute_values, answer_values())
+with their own SQL interpretation. Cursors, context management, fetches
+and transaction calls live here.
+
+    from conftest import FixtureConn, fixture_execute_values
+
+    monkeypatch.setattr(module, 'execute_values', fixture_execute_values)
+"""
+
+
+class FixtureConn:
+    """
+    psycopg2 connection stand-in. answer(sql, params, cursor) returns the
+    result rows of one statement (None for statements without rows);
+    cursor.as_dict tells whether a RealDictCursor was requested.
+    """
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    def cursor(self, cursor_factory=None):
+        return FixtureCursor(self, cursor_factory)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+    def answer(self, sql, params, cursor):
+        raise NotImplementedError
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        raise AssertionError(f"Unexpected execute_values: {sql}")
+
+
+class FixtureCursor:
+
+    def __init__(self, conn, cursor_factory=None):
+        self.conn = conn
+        self.as_dict = cursor_factory is not None
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=()):
+        rows = self.conn.answer(sql, params, self)
+        self.rows = list(rows) if rows is not None else []
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+def fixture_execute_values(cur, sql, argslist, template=None, page_size=100, fetch=False):
+    """psycopg2.extras.execute_values stand-in routed to FixtureConn.answer_values."""
+    rows = cur.conn.answer_values(sql, list(argslist), template, fetch, cur)
+    return list(rows or []) if fetch else None
@@ -31,6 +31,8 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -38,7 +40,9 @@ from decimal import Decimal
 from enum import Enum
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+
+from defcon_state_provider import get_defcon_provider
 
 # Configure logging
 logging.basicConfig(
@@ -238,6 +242,63 @@ class TradePacket:
         }
 
 
+# =============================================================================
+# Batched Market Context (signal bursts)
+# =============================================================================
+
+@dataclass
+class MarketContext:
+    """
+    Per-ticker market context used by the precision calculation.
+
+    Populated by CPTOPrecisionEngine.prefetch_market_context with set-based
+    queries so a burst of signals costs a fixed number of round trips.
+    """
+    ticker: str
+    regime: str
+    regime_snapshot_hash: str
+    indicators: Dict[str, float] = field(default_factory=dict)
+    atr: Optional[float] = None
+    spread_pct: Optional[float] = None
+    estimated_depth_usd: Optional[float] = None
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class MarketContextCache:
+    """
+    Short-TTL in-memory cache of MarketContext keyed by ticker.
+
+    Regime, indicators and ATR change on bar/refresh cadence, so reusing them
+    for a few seconds across back-to-back bursts is safe.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, MarketContext] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ticker: str) -> Optional[MarketContext]:
+        with self._lock:
+            ctx = self._entries.get(ticker)
+            if ctx is None:
+                return None
+            if time.monotonic() - ctx.fetched_at > self.ttl_seconds:
+                del self._entries[ticker]
+                return None
+            return ctx
+
+    def put(self, ctx: MarketContext) -> None:
+        with self._lock:
+            self._entries[ctx.ticker] = ctx
+
+    def invalidate(self, ticker: Optional[str] = None) -> None:
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ticker, None)
+
+
 # =============================================================================
 # CEO Amendment C: Friction Monitor
 # =============================================================================
@@ -290,6 +351,39 @@ class FrictionMonitor:
             logger.error(f"Failed to record friction outcome: {e}")
             self.conn.rollback()
 
+    def record_outcomes(
+        self,
+        outcomes: List[Tuple[str, str, bool, Optional[str], str]]
+    ) -> None:
+        """
+        Record many (ticker, signal_id, accepted, refusal_reason, signal_class)
+        outcomes in a single insert. Used by the batch transformation path.
+        """
+        if not outcomes:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO fhq_alpha.cpto_friction_log (
+                        signal_id, ticker, outcome, refusal_reason, recorded_at
+                    ) VALUES %s
+                """, [
+                    (signal_id, ticker, 'ACCEPTED' if accepted else 'REFUSED', reason)
+                    for ticker, signal_id, accepted, reason, _ in outcomes
+                ], template="(%s, %s, %s, %s, NOW())")
+                self.conn.commit()
+
+                # CEO-DIR-2026-110: Track inversion candidates separately
+                for _, signal_id, accepted, _, signal_class in outcomes:
+                    if signal_class == "LOW_CONFIDENCE_INVERSION_CANDIDATE":
+                        logger.info(
+                            f"Inversion candidate {signal_id} recorded: "
+                            f"{'ACCEPTED' if accepted else 'REFUSED'}"
+                        )
+        except Exception as e:
+            logger.error(f"Failed to record friction outcomes: {e}")
+            self.conn.rollback()
+
     def compute_friction_rate(self) -> Tuple[float, int, int]:
         """
         Compute current friction rate over rolling window.
@@ -409,12 +503,19 @@ class CPTOPrecisionEngine:
     # Calculation logic hash for audit (update when logic changes)
     CALCULATION_LOGIC_VERSION = "1.1.0"
 
+    # Market context reuse window for transform_signals bursts
+    CONTEXT_CACHE_TTL_SECONDS = 30.0
+
+    # Indicators consumed by the precision entry calculation
+    ENTRY_INDICATORS = ('ema_21', 'bb_lower', 'bb_upper', 'bb_mid', 'rsi_14')
+
     def __init__(self, db_conn=None):
         """Initialize CPTO engine with database connection"""
         self.params = self._load_active_parameters()
         self.conn = db_conn or self._get_db_connection()
         self._calculation_logic_hash = self._compute_logic_hash()
         self.friction_monitor = FrictionMonitor(self.conn, self.params)
+        self._context_cache = MarketContextCache(self.CONTEXT_CACHE_TTL_SECONDS)
         self._defcon_level = self._get_current_defcon()
         logger.info(
             f"CPTO v{self.CALCULATION_LOGIC_VERSION} initialized with params v{self.params.version}, "
@@ -499,26 +600,8 @@ class CPTOPrecisionEngine:
         return hashlib.sha256(logic_signature.encode()).hexdigest()[:16]
 
     def _get_current_defcon(self) -> DEFCONLevel:
-        """Get current DEFCON level from database"""
-        try:
-            conn = self._get_db_connection()
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT current_level
-                    FROM fhq_governance.defcon_status
-                    ORDER BY changed_at DESC
-                    LIMIT 1
-                """)
-                row = cur.fetchone()
-                conn.close()
-
-                if row:
-                    level_name = row[0].upper()
-                    return DEFCONLevel[level_name]
-        except Exception as e:
-            logger.warning(f"Could not get DEFCON level: {e}")
-
-        return DEFCONLevel.GREEN  # Default to GREEN
+        """Get current DEFCON level from the shared DEFCON cache (RED if stale)"""
+        return DEFCONLevel[get_defcon_provider().get_level()]
 
     def get_behavior_mode(self) -> CPTOBehavior:
         """Get current CPTO behavior mode based on DEFCON"""
@@ -602,9 +685,6 @@ class CPTOPrecisionEngine:
             ticker, direction, current_price, regime, conservative_mode
         )
 
-        # CEO Amendment B: Store mid-market price for slippage calculation
-        mid_market = current_price
-
         # Get ATR for canonical exits
         atr = self._get_canonical_atr(ticker)
         if atr is None or atr <= 0:
@@ -612,6 +692,43 @@ class CPTOPrecisionEngine:
             self._record_refusal(ticker, signal_id, "ATR_UNAVAILABLE")
             return None
 
+        packet = self._build_trade_packet(
+            ticker, direction, confidence, current_price, signal_valid_until,
+            signal_id, signal_ts, regime, regime_hash, entry_price, input_hash,
+            atr, conservative_mode
+        )
+
+        # Log to database for audit
+        self._log_precision_calculation(packet, indicators)
+
+        # CEO Amendment C: Record successful outcome for friction tracking
+        self.friction_monitor.record_outcome(ticker, signal_id or "N/A", accepted=True)
+
+        # Check if friction threshold exceeded
+        self.friction_monitor.check_and_escalate()
+
+        return packet
+
+    def _build_trade_packet(
+        self,
+        ticker: str,
+        direction: str,
+        confidence: float,
+        current_price: float,
+        signal_valid_until: datetime,
+        signal_id: Optional[str],
+        signal_ts: datetime,
+        regime: str,
+        regime_hash: str,
+        entry_price: float,
+        input_hash: str,
+        atr: float,
+        conservative_mode: bool
+    ) -> TradePacket:
+        """Canonical exits, hashes and slippage for a priced entry (shared by single and batch paths)"""
+        # CEO Amendment B: Store mid-market price for slippage calculation
+        mid_market = current_price
+
         # Calculate canonical exits (CEO-DIR-2026-107)
         stop_loss, take_profit, r_value = self._calculate_canonical_exits(
             entry_price, direction, atr
@@ -663,15 +780,6 @@ class CPTOPrecisionEngine:
             refusal_reason=None
         )
 
-        # Log to database for audit
-        self._log_precision_calculation(packet, indicators)
-
-        # CEO Amendment C: Record successful outcome for friction tracking
-        self.friction_monitor.record_outcome(ticker, signal_id or "N/A", accepted=True)
-
-        # Check if friction threshold exceeded
-        self.friction_monitor.check_and_escalate()
-
         logger.info(
             f"CPTO TradePacket: {ticker} {direction} "
             f"Entry={entry_price:.2f} SL={stop_loss:.2f} TP={take_profit:.2f} "
@@ -968,7 +1076,20 @@ class CPTOPrecisionEngine:
         Returns (entry_price, input_features_hash, indicators)
         """
         indicators = self._get_latest_indicators(ticker)
+        return self._compute_precision_entry(
+            ticker, direction, current_price, regime, indicators, conservative_mode
+        )
 
+    def _compute_precision_entry(
+        self,
+        ticker: str,
+        direction: str,
+        current_price: float,
+        regime: str,
+        indicators: Dict[str, float],
+        conservative_mode: bool = False
+    ) -> Tuple[float, str, Dict[str, float]]:
+        """Pure entry calculation over already-loaded TA indicators"""
         # Get regime-specific aggression factor
         # Amendment A: VERIFIED_INVERTED_STRESS explicitly handled
         aggression = self.params.regime_aggression_map.get(
@@ -1109,13 +1230,19 @@ class CPTOPrecisionEngine:
         self,
         ticker: str,
         limit_price: float,
-        position_size_usd: float
+        position_size_usd: float,
+        depth_usd: Optional[float] = None
     ) -> bool:
         """
         CEO Addition C: Liquidity-aware sizing gate.
         Blocks if position > 5% of order book depth.
+
+        depth_usd lets a batch caller pass the depth it already prefetched
+        (MarketContext.estimated_depth_usd); otherwise the NBBO is queried live.
         """
-        depth = self._get_order_book_depth(ticker, limit_price)
+        depth = depth_usd
+        if depth is None:
+            depth = self._get_order_book_depth(ticker, limit_price)
         if depth is None:
             logger.warning(f"No order book data for {ticker}, proceeding")
             return True  # Proceed if no data (log warning)
@@ -1155,13 +1282,7 @@ class CPTOPrecisionEngine:
             row = cur.fetchone()
 
             if row:
-                regime = row['regime_label']
-
-                # Amendment A: Check for verified inversion
-                if regime == 'STRESS' and row['verified_inverted'] == 'true':
-                    regime = 'VERIFIED_INVERTED_STRESS'
-
-                return regime, row['snapshot_hash']
+                return self._regime_from_row(row), row['snapshot_hash']
 
             # Fallback to global regime if ticker-specific not found
             cur.execute("""
@@ -1180,6 +1301,17 @@ class CPTOPrecisionEngine:
             # Default fallback
             return 'NEUTRAL', hashlib.md5(b'NEUTRAL:default').hexdigest()[:8]
 
+    @staticmethod
+    def _regime_from_row(row: Dict[str, Any]) -> str:
+        """Map a regime_classifications row to the CPTO regime label"""
+        regime = row['regime_label']
+
+        # Amendment A: Check for verified inversion
+        if regime == 'STRESS' and row['verified_inverted'] == 'true':
+            regime = 'VERIFIED_INVERTED_STRESS'
+
+        return regime
+
     def _get_latest_indicators(self, ticker: str) -> Dict[str, float]:
         """Get latest TA indicators for ticker"""
         indicators = {}
@@ -1283,30 +1415,11 @@ class CPTOPrecisionEngine:
                     return None
 
                 # Reverse to chronological order
-                rows = list(reversed(rows))
-
-                # Calculate True Range for each bar
-                true_ranges = []
-                for i in range(1, len(rows)):
-                    high = float(rows[i]['high'])
-                    low = float(rows[i]['low'])
-                    prev_close = float(rows[i-1]['close'])
-
-                    # True Range = max(H-L, |H-C_prev|, |L-C_prev|)
-                    tr = max(
-                        high - low,
-                        abs(high - prev_close),
-                        abs(low - prev_close)
-                    )
-                    true_ranges.append(tr)
-
-                if len(true_ranges) < period:
+                atr = self._atr_from_price_rows(list(reversed(rows)), period)
+                if atr is None:
                     logger.warning(f"Not enough True Range values for ATR: {ticker}")
                     return None
 
-                # ATR = SMA of True Range
-                atr = sum(true_ranges[-period:]) / period
-
                 logger.info(f"ATR({period}) for {ticker} calculated on-the-fly: {atr:.4f}")
 
                 # Cache to volatility table for future use
@@ -1329,6 +1442,33 @@ class CPTOPrecisionEngine:
             logger.error(f"Failed to calculate ATR from price data for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def _atr_from_price_rows(rows: List[Dict[str, Any]], period: int = 14) -> Optional[float]:
+        """
+        Unrounded ATR (SMA of True Range) over chronologically ordered
+        high/low/close rows. Returns None when fewer than `period` TR values.
+        """
+        # Calculate True Range for each bar
+        true_ranges = []
+        for i in range(1, len(rows)):
+            high = float(rows[i]['high'])
+            low = float(rows[i]['low'])
+            prev_close = float(rows[i-1]['close'])
+
+            # True Range = max(H-L, |H-C_prev|, |L-C_prev|)
+            tr = max(
+                high - low,
+                abs(high - prev_close),
+                abs(low - prev_close)
+            )
+            true_ranges.append(tr)
+
+        if len(true_ranges) < period:
+            return None
+
+        # ATR = SMA of True Range
+        return sum(true_ranges[-period:]) / period
+
     def _get_order_book_depth(
         self,
         ticker: str,
@@ -1363,32 +1503,10 @@ class CPTOPrecisionEngine:
                 logger.warning(f"No quote data for {ticker}")
                 return None
 
-            quote = quotes[ticker]
-
-            # Extract NBBO data
-            bid_price = float(quote.bid_price) if quote.bid_price else 0
-            ask_price = float(quote.ask_price) if quote.ask_price else 0
-            bid_size = int(quote.bid_size) if quote.bid_size else 0
-            ask_size = int(quote.ask_size) if quote.ask_size else 0
-
-            if bid_price <= 0 or ask_price <= 0:
-                logger.warning(f"Invalid NBBO for {ticker}: bid={bid_price}, ask={ask_price}")
+            liquidity = self._liquidity_from_quote(ticker, quotes[ticker])
+            if liquidity is None:
                 return None
-
-            # Calculate spread as liquidity indicator
-            spread_pct = (ask_price - bid_price) / bid_price if bid_price > 0 else 1.0
-
-            # Estimate depth from NBBO sizes (conservative estimate)
-            # Actual depth would require Level 2 data
-            mid_price = (bid_price + ask_price) / 2
-            estimated_depth_bid = bid_size * bid_price
-            estimated_depth_ask = ask_size * ask_price
-            estimated_total_depth = estimated_depth_bid + estimated_depth_ask
-
-            logger.info(
-                f"Liquidity proxy for {ticker}: spread={spread_pct:.4f}%, "
-                f"bid_depth=${estimated_depth_bid:,.0f}, ask_depth=${estimated_depth_ask:,.0f}"
-            )
+            spread_pct, estimated_total_depth = liquidity
 
             # Log to database for analysis
             self._log_liquidity_check(ticker, price_level, spread_pct, estimated_total_depth)
@@ -1402,6 +1520,37 @@ class CPTOPrecisionEngine:
             logger.error(f"Failed to get order book depth for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def _liquidity_from_quote(ticker: str, quote: Any) -> Optional[Tuple[float, float]]:
+        """
+        Derive (spread_pct, estimated_depth_usd) from an NBBO quote.
+        Returns None if the quote is unusable.
+        """
+        # Extract NBBO data
+        bid_price = float(quote.bid_price) if quote.bid_price else 0
+        ask_price = float(quote.ask_price) if quote.ask_price else 0
+        bid_size = int(quote.bid_size) if quote.bid_size else 0
+        ask_size = int(quote.ask_size) if quote.ask_size else 0
+
+        if bid_price <= 0 or ask_price <= 0:
+            logger.warning(f"Invalid NBBO for {ticker}: bid={bid_price}, ask={ask_price}")
+            return None
+
+        # Calculate spread as liquidity indicator
+        spread_pct = (ask_price - bid_price) / bid_price if bid_price > 0 else 1.0
+
+        # Estimate depth from NBBO sizes (conservative estimate)
+        # Actual depth would require Level 2 data
+        estimated_depth_bid = bid_size * bid_price
+        estimated_depth_ask = ask_size * ask_price
+
+        logger.info(
+            f"Liquidity proxy for {ticker}: spread={spread_pct:.4f}%, "
+            f"bid_depth=${estimated_depth_bid:,.0f}, ask_depth=${estimated_depth_ask:,.0f}"
+        )
+
+        return spread_pct, estimated_depth_bid + estimated_depth_ask
+
     def _log_liquidity_check(
         self,
         ticker: str,
@@ -1459,41 +1608,471 @@ class CPTOPrecisionEngine:
                         %s, %s,
                         NOW()
                     )
-                """, (
-                    packet.ticker,
-                    packet.direction,
-                    packet.signal_timestamp,
-                    packet.confidence,
-                    packet.ttl_valid_until,
-                    packet.mid_market_at_signal,
-                    packet.regime_at_calculation,
-                    packet.regime_snapshot_hash,
-                    packet.limit_price,
-                    self.params.regime_aggression_map.get(
-                        packet.regime_at_calculation, 0.005
-                    ),
-                    indicators.get('ema_21'),
-                    indicators.get('bb_lower'),
-                    indicators.get('bb_upper'),
-                    packet.liquidity_check_passed,
-                    packet.atr_at_entry,
-                    packet.canonical_stop_loss,
-                    packet.canonical_take_profit,
-                    packet.r_value,
-                    packet.parameter_set_version,
-                    packet.input_features_hash,
-                    packet.calculation_logic_hash,
-                    packet.ec_contract_number,
-                    packet.source_signal_id,
-                    packet.mid_market_at_signal,
-                    packet.estimated_slippage_saved_bps
-                ))
+                """, self._precision_log_values(packet, indicators))
                 self.conn.commit()
                 logger.info(f"Logged precision calculation for {packet.ticker}")
         except Exception as e:
             logger.error(f"Failed to log precision calculation: {e}")
             self.conn.rollback()
 
+    def _precision_log_values(
+        self,
+        packet: TradePacket,
+        indicators: Dict[str, float]
+    ) -> Tuple:
+        """Column values for one fhq_alpha.cpto_precision_log row"""
+        return (
+            packet.ticker,
+            packet.direction,
+            packet.signal_timestamp,
+            packet.confidence,
+            packet.ttl_valid_until,
+            packet.mid_market_at_signal,
+            packet.regime_at_calculation,
+            packet.regime_snapshot_hash,
+            packet.limit_price,
+            self.params.regime_aggression_map.get(
+                packet.regime_at_calculation, 0.005
+            ),
+            indicators.get('ema_21'),
+            indicators.get('bb_lower'),
+            indicators.get('bb_upper'),
+            packet.liquidity_check_passed,
+            packet.atr_at_entry,
+            packet.canonical_stop_loss,
+            packet.canonical_take_profit,
+            packet.r_value,
+            packet.parameter_set_version,
+            packet.input_features_hash,
+            packet.calculation_logic_hash,
+            packet.ec_contract_number,
+            packet.source_signal_id,
+            packet.mid_market_at_signal,
+            packet.estimated_slippage_saved_bps
+        )
+
+    # =========================================================================
+    # Batch Transformation: Signal burst -> TradePackets
+    # =========================================================================
+
+    def transform_signals(
+        self,
+        signals: List[Dict[str, Any]],
+        include_depth: bool = True
+    ) -> List[Optional[TradePacket]]:
+        """
+        Batch entry point: transform a burst of IoS-008 signals.
+
+        Each signal is a dict with the keyword arguments of transform_signal.
+        Market context for all tickers is prefetched with set-based queries
+        (see prefetch_market_context), DEFCON is read once per batch, and the
+        precision, liquidity and friction logs are written with one insert
+        each. Returns a list aligned with `signals`; None marks a refusal.
+
+        Gating, entry prices, canonical exits and outputs_hash are identical
+        to calling transform_signal per signal with the same market state.
+        """
+        results: List[Optional[TradePacket]] = [None] * len(signals)
+        if not signals:
+            return results
+
+        now = datetime.now(timezone.utc)
+        outcomes: List[Tuple[str, str, bool, Optional[str], str]] = []
+
+        # DEFCON check first (EC-015 Section 7) - once per batch
+        behavior = self.get_behavior_mode()
+        conservative_mode = (behavior == CPTOBehavior.CONSERVATIVE)
+
+        admitted: List[int] = []
+        for i, sig in enumerate(signals):
+            ticker = sig['ticker']
+            signal_id = sig.get('signal_id')
+            signal_class = sig.get('signal_class', 'STANDARD')
+
+            # CEO-DIR-2026-110 B2: Validate signal class
+            if signal_class not in self.params.valid_signal_classes:
+                logger.warning(f"INVALID_SIGNAL_CLASS: {signal_class} not in valid classes")
+                outcomes.append((ticker, signal_id or "UNKNOWN", False, "INVALID_SIGNAL_CLASS", "STANDARD"))
+                continue
+
+            if behavior == CPTOBehavior.REFUSE_NEW:
+                logger.warning(
+                    f"DEFCON_BLOCK: CPTO in REFUSE_NEW mode (DEFCON={self._defcon_level.name})"
+                )
+                outcomes.append((ticker, signal_id or "UNKNOWN", False, "DEFCON_REFUSE_NEW", signal_class))
+                continue
+
+            # CEO Addition B: TTL check
+            if not self._check_ttl(sig['signal_valid_until']):
+                logger.warning(f"TTL_BLOCK: Signal for {ticker} has insufficient TTL")
+                outcomes.append((ticker, signal_id or "UNKNOWN", False, "TTL_INSUFFICIENT", signal_class))
+                continue
+
+            # CEO-DIR-2026-110 B2: Inversion candidate gating (rare, stays per-signal)
+            if signal_class == "LOW_CONFIDENCE_INVERSION_CANDIDATE":
+                inversion_metadata = sig.get('inversion_metadata')
+                if not self._verify_inversion_candidate(ticker, signal_id, inversion_metadata):
+                    logger.warning(
+                        f"INVERSION_GATE_BLOCK: {ticker} signal lacks verified_inverted evidence"
+                    )
+                    self._record_inversion_refusal(
+                        ticker, signal_id, "INVERSION_UNVERIFIED", inversion_metadata
+                    )
+                    continue
+                logger.info(f"INVERSION_GATE_PASS: {ticker} verified_inverted=true")
+
+            admitted.append(i)
+
+        contexts = self.prefetch_market_context(
+            [signals[i]['ticker'] for i in admitted], include_depth=include_depth
+        )
+
+        precision_rows: List[Tuple[TradePacket, Dict[str, float]]] = []
+        liquidity_rows: List[Tuple[str, float, float, float]] = []
+        for i in admitted:
+            sig = signals[i]
+            ticker = sig['ticker']
+            direction = sig['direction']
+            signal_id = sig.get('signal_id')
+            ctx = contexts[ticker]
+
+            entry_price, input_hash, indicators = self._compute_precision_entry(
+                ticker, direction, sig['current_price'], ctx.regime,
+                ctx.indicators, conservative_mode
+            )
+
+            if ctx.atr is None or ctx.atr <= 0:
+                logger.error(f"ATR_ERROR: Cannot get valid ATR for {ticker}")
+                outcomes.append((ticker, signal_id or "UNKNOWN", False, "ATR_UNAVAILABLE", "STANDARD"))
+                continue
+
+            packet = self._build_trade_packet(
+                ticker, direction, sig['confidence'], sig['current_price'],
+                sig['signal_valid_until'], signal_id, sig.get('signal_timestamp') or now,
+                ctx.regime, ctx.regime_snapshot_hash, entry_price, input_hash,
+                ctx.atr, conservative_mode
+            )
+            results[i] = packet
+            precision_rows.append((packet, indicators))
+            if ctx.estimated_depth_usd is not None:
+                liquidity_rows.append(
+                    (ticker, packet.limit_price, ctx.spread_pct, ctx.estimated_depth_usd)
+                )
+            outcomes.append((ticker, signal_id or "N/A", True, None, "STANDARD"))
+
+        self._log_precision_calculations(precision_rows)
+        self._log_liquidity_checks(liquidity_rows)
+
+        # CEO Amendment C: one friction insert and one threshold check per batch
+        self.friction_monitor.record_outcomes(outcomes)
+        if outcomes:
+            self.friction_monitor.check_and_escalate()
+
+        logger.info(
+            f"CPTO batch: {len(precision_rows)}/{len(signals)} signals transformed "
+            f"across {len(contexts)} tickers"
+        )
+        return results
+
+    def prefetch_market_context(
+        self,
+        tickers: List[str],
+        include_depth: bool = True
+    ) -> Dict[str, MarketContext]:
+        """
+        Load regime, TA indicators, ATR and (optionally) NBBO depth for all
+        tickers with set-based queries, serving fresh entries from the
+        short-TTL context cache. Returns {ticker: MarketContext}.
+        """
+        contexts: Dict[str, MarketContext] = {}
+        missing: List[str] = []
+        for ticker in dict.fromkeys(tickers):
+            ctx = self._context_cache.get(ticker)
+            if ctx is not None:
+                contexts[ticker] = ctx
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return contexts
+
+        regimes = self._get_regime_states(missing)
+        indicators = self._get_latest_indicators_bulk(missing)
+        atrs = self._get_canonical_atrs(missing)
+        depths = self._get_order_book_depths(missing) if include_depth else {}
+
+        for ticker in missing:
+            regime, regime_hash = regimes[ticker]
+            spread_pct, depth = depths.get(ticker, (None, None))
+            ctx = MarketContext(
+                ticker=ticker,
+                regime=regime,
+                regime_snapshot_hash=regime_hash,
+                indicators=indicators.get(ticker, {}),
+                atr=atrs.get(ticker),
+                spread_pct=spread_pct,
+                estimated_depth_usd=depth
+            )
+            self._context_cache.put(ctx)
+            contexts[ticker] = ctx
+
+        return contexts
+
+    def _get_regime_states(self, tickers: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Set-based _get_regime_state: latest classification per ticker, global fallback"""
+        result: Dict[str, Tuple[str, str]] = {}
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT DISTINCT ON (ticker)
+                    ticker,
+                    regime_label,
+                    regime_confidence,
+                    calculated_at,
+                    COALESCE(metadata->>'verified_inverted', 'false') as verified_inverted,
+                    md5(regime_label || ':' || regime_confidence::text || ':' || calculated_at::text) as snapshot_hash
+                FROM fhq_research.regime_classifications
+                WHERE ticker = ANY(%s)
+                ORDER BY ticker, calculated_at DESC
+            """, (list(tickers),))
+            for row in cur.fetchall():
+                result[row['ticker']] = (self._regime_from_row(row), row['snapshot_hash'])
+
+            if len(result) < len(tickers):
+                # Fallback to global regime if ticker-specific not found
+                cur.execute("""
+                    SELECT
+                        current_regime,
+                        md5(current_regime || ':' || updated_at::text) as snapshot_hash
+                    FROM fhq_research.global_regime_state
+                    ORDER BY updated_at DESC
+                    LIMIT 1
+                """)
+                row = cur.fetchone()
+                if row:
+                    fallback = (row['current_regime'], row['snapshot_hash'])
+                else:
+                    fallback = ('NEUTRAL', hashlib.md5(b'NEUTRAL:default').hexdigest()[:8])
+                for ticker in tickers:
+                    result.setdefault(ticker, fallback)
+
+        return result
+
+    def _get_latest_indicators_bulk(self, tickers: List[str]) -> Dict[str, Dict[str, float]]:
+        """Set-based _get_latest_indicators (same row precedence per ticker)"""
+        indicators: Dict[str, Dict[str, float]] = {t: {} for t in tickers}
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT
+                    ticker,
+                    indicator_name,
+                    indicator_value
+                FROM fhq_research.indicator_values
+                WHERE ticker = ANY(%s)
+                AND indicator_name = ANY(%s)
+                AND calculated_at > NOW() - INTERVAL '24 hours'
+                ORDER BY ticker, calculated_at DESC
+            """, (list(tickers), list(self.ENTRY_INDICATORS)))
+
+            for row in cur.fetchall():
+                indicators[row['ticker']][row['indicator_name']] = float(row['indicator_value'])
+
+        return indicators
+
+    def _get_canonical_atrs(self, tickers: List[str], period: int = 14) -> Dict[str, Optional[float]]:
+        """
+        Set-based _get_canonical_atr: each fallback source is queried once
+        for all tickers still unresolved, in the same precedence order.
+        """
+        atrs: Dict[str, Optional[float]] = {}
+        pending = list(tickers)
+
+        sources = [
+            ("fhq_alpha function", """
+                SELECT t.ticker, fhq_alpha.get_canonical_atr(t.ticker)
+                FROM unnest(%s::text[]) AS t(ticker)
+            """),
+            ("indicator_values", """
+                SELECT DISTINCT ON (ticker) ticker, indicator_value
+                FROM fhq_research.indicator_values
+                WHERE ticker = ANY(%s)
+                AND indicator_name = 'atr_14'
+                ORDER BY ticker, calculated_at DESC
+            """),
+            ("volatility table", """
+                SELECT DISTINCT ON (listing_id) listing_id, atr_14
+                FROM fhq_indicators.volatility
+                WHERE listing_id = ANY(%s)
+                ORDER BY listing_id, signal_date DESC
+            """),
+        ]
+        for source_name, sql in sources:
+            if not pending:
+                break
+            try:
+                with self.conn.cursor() as cur:
+                    cur.execute(sql, (pending,))
+                    for ticker, value in cur.fetchall():
+                        if value:
+                            atrs[ticker] = float(value)
+                            logger.info(f"ATR for {ticker} from {source_name}: {value}")
+            except Exception:
+                self.conn.rollback()
+            pending = [t for t in pending if t not in atrs]
+
+        if pending:
+            logger.info(f"Computing ATR on-the-fly for {len(pending)} tickers (no cached data)")
+            atrs.update(self._calculate_atrs_from_price_data(pending, period))
+
+        return atrs
+
+    def _calculate_atrs_from_price_data(
+        self,
+        tickers: List[str],
+        period: int = 14
+    ) -> Dict[str, Optional[float]]:
+        """Set-based _calculate_atr_from_price_data with one cache upsert"""
+        atrs: Dict[str, Optional[float]] = {t: None for t in tickers}
+        rows_by_ticker: Dict[str, List[Dict[str, Any]]] = {t: [] for t in tickers}
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    SELECT listing_id, date, high, low, close
+                    FROM (
+                        SELECT
+                            listing_id, date, high, low, close,
+                            ROW_NUMBER() OVER (PARTITION BY listing_id ORDER BY date DESC) as rn
+                        FROM fhq_data.price_series
+                        WHERE listing_id = ANY(%s)
+                    ) w
+                    WHERE rn <= %s
+                    ORDER BY listing_id, date ASC
+                """, (list(tickers), period + 5))
+                for row in cur.fetchall():
+                    rows_by_ticker[row['listing_id']].append(row)
+        except Exception as e:
+            logger.error(f"Failed to load price data for ATR batch: {e}")
+            self.conn.rollback()
+            return atrs
+
+        cache_rows = []
+        for ticker, rows in rows_by_ticker.items():
+            if len(rows) < period + 1:
+                logger.warning(f"Insufficient price data for ATR: {ticker} ({len(rows)} rows)")
+                continue
+            atr = self._atr_from_price_rows(rows, period)
+            if atr is None:
+                logger.warning(f"Not enough True Range values for ATR: {ticker}")
+                continue
+            atrs[ticker] = round(atr, 4)
+            cache_rows.append((ticker, atrs[ticker]))
+
+        # Cache to volatility table for future use
+        if cache_rows:
+            try:
+                with self.conn.cursor() as cur:
+                    execute_values(cur, """
+                        INSERT INTO fhq_indicators.volatility (
+                            listing_id, signal_date, atr_14, created_at
+                        ) VALUES %s
+                        ON CONFLICT (listing_id, signal_date)
+                        DO UPDATE SET atr_14 = EXCLUDED.atr_14, created_at = NOW()
+                    """, cache_rows, template="(%s, CURRENT_DATE, %s, NOW())")
+                    self.conn.commit()
+            except Exception as cache_err:
+                logger.warning(f"Failed to cache ATR batch: {cache_err}")
+                self.conn.rollback()
+
+        return atrs
+
+    def _get_order_book_depths(self, tickers: List[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Multi-symbol _get_order_book_depth: one Alpaca latest-quote request.
+        Returns {ticker: (spread_pct, estimated_depth_usd)} for usable quotes.
+        """
+        try:
+            from alpaca.data.historical import StockHistoricalDataClient
+            from alpaca.data.requests import StockLatestQuoteRequest
+
+            api_key = os.getenv('ALPACA_API_KEY', '')
+            secret_key = os.getenv('ALPACA_SECRET', os.getenv('ALPACA_SECRET_KEY', ''))
+
+            if not api_key or not secret_key:
+                logger.warning("No Alpaca credentials for order book check")
+                return {}
+
+            data_client = StockHistoricalDataClient(api_key, secret_key)
+            quotes = data_client.get_stock_latest_quote(
+                StockLatestQuoteRequest(symbol_or_symbols=list(tickers))
+            )
+        except ImportError:
+            logger.warning("Alpaca SDK not available for liquidity check")
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to get order book depth batch: {e}")
+            return {}
+
+        depths = {}
+        for ticker in tickers:
+            if ticker not in quotes:
+                logger.warning(f"No quote data for {ticker}")
+                continue
+            liquidity = self._liquidity_from_quote(ticker, quotes[ticker])
+            if liquidity is not None:
+                depths[ticker] = liquidity
+        return depths
+
+    def _log_liquidity_checks(self, rows: List[Tuple[str, float, float, float]]) -> None:
+        """Batched _log_liquidity_check: (ticker, price_level, spread_pct, depth) rows"""
+        if not rows:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO fhq_alpha.cpto_liquidity_log (
+                        ticker, price_level, spread_pct, estimated_depth_usd, checked_at
+                    ) VALUES %s
+                """, rows, template="(%s, %s, %s, %s, NOW())")
+                self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to log liquidity checks: {e}")
+            try:
+                self.conn.rollback()
+            except:
+                pass
+
+    def _log_precision_calculations(
+        self,
+        rows: List[Tuple[TradePacket, Dict[str, float]]]
+    ) -> None:
+        """Batched _log_precision_calculation (Fix #5 + Amendment B)"""
+        if not rows:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO fhq_alpha.cpto_precision_log (
+                        ticker, direction, signal_timestamp,
+                        signal_confidence, signal_ttl_valid_until, current_market_price,
+                        regime_at_calculation, regime_snapshot_hash,
+                        calculated_entry_price, entry_aggression,
+                        ema_21, bb_lower, bb_upper,
+                        liquidity_check_passed,
+                        atr_14, canonical_stop_loss, canonical_take_profit, r_value,
+                        parameter_set_version, input_features_hash, calculation_logic_hash,
+                        ec_contract_number, source_signal_id,
+                        mid_market_at_signal, estimated_slippage_saved_bps,
+                        created_at
+                    ) VALUES %s
+                """, [
+                    self._precision_log_values(packet, indicators)
+                    for packet, indicators in rows
+                ], template="(" + ", ".join(["%s"] * 25) + ", NOW())")
+                self.conn.commit()
+                logger.info(f"Logged {len(rows)} precision calculations")
+        except Exception as e:
+            logger.error(f"Failed to log precision calculations: {e}")
+            self.conn.rollback()
+
     # =========================================================================
     # LINE Handoff Interface
     # =========================================================================
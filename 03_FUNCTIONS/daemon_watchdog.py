@@ -18,24 +18,27 @@ Lifecycle Policy:
 import os
 import sys
 import time
+import signal
+import socket
+import selectors
+import argparse
+import threading
 import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
 import psycopg2
 from psycopg2.extras import Json
 import logging
 from datetime import datetime, timezone
 
-# Set working directory
-os.chdir('C:/fhq-market-system/vision-ios')
-
-# Logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format='[WATCHDOG] %(asctime)s %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('logs/daemon_watchdog.log'),
-        logging.StreamHandler()
-    ]
+# Daemons run from (and the log is written under) the repository root,
+# unless --cwd or FHQ_WATCHDOG_CWD says otherwise
+DEFAULT_WORKDIR = os.getenv(
+    'FHQ_WATCHDOG_CWD',
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )
+
 logger = logging.getLogger(__name__)
 
 DB_CONFIG = {
@@ -52,100 +55,112 @@ DAEMONS = {
     'finn_brain_scheduler': {
         'script': '03_FUNCTIONS/finn_brain_scheduler.py',
         'max_stale_minutes': 35,  # 30min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code
     },
     'finn_crypto_scheduler': {
         'script': '03_FUNCTIONS/finn_crypto_scheduler.py',
         'max_stale_minutes': 35,
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code
     },
     'finn_t_scheduler': {
         'script': '03_FUNCTIONS/finn_t_scheduler.py',
         'max_stale_minutes': 65,  # 60min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code - CEO-DIR-2026-FINN-T-SCHEDULER-001
     },
     'finn_e_scheduler': {
         'script': '03_FUNCTIONS/finn_e_scheduler.py',
         'max_stale_minutes': 35,  # 30min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code - CEO-DIR-2026-FINN-E-SCHEDULER-001
     },
     'hypothesis_death_daemon': {
         'script': '03_FUNCTIONS/hypothesis_death_daemon.py',
         'max_stale_minutes': 20,  # 15min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code - CEO-DIR-2026-HYPOTHESIS-DEATH-001
     },
     'tier1_execution_daemon': {
         'script': '03_FUNCTIONS/tier1_execution_daemon.py',
         'max_stale_minutes': 35,  # 30min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code - CEO-DIR-2026-TIER1-EXECUTION-001
     },
     'economic_outcome_daemon': {
         'script': '03_FUNCTIONS/economic_outcome_daemon.py',
         'max_stale_minutes': 10,
-        'process': None,
         'has_heartbeat': False  # Uses agent_heartbeats (CEIO) - complex table, just check process
     },
     # CEO-DIR-2026-007-A: Reactivated sensory organs
     'g2c_continuous_forecast_engine': {
         'script': '03_FUNCTIONS/g2c_continuous_forecast_engine.py',
         'max_stale_minutes': 35,  # 30min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True
     },
     'ios003b_intraday_regime_delta': {
         'script': '03_FUNCTIONS/ios003b_intraday_regime_delta.py',
         'max_stale_minutes': 1445,  # 24h cycle - crypto regime delta
-        'process': None,
         'has_heartbeat': True
     },
     'pre_tier_scoring_daemon': {
         'script': '03_FUNCTIONS/pre_tier_scoring_daemon.py',
         'max_stale_minutes': 10,  # 5min cycle + 5min buffer
-        'process': None,
         'has_heartbeat': True  # Has heartbeat code - CEO-DIR-2026-PRE-TIER-SCORING-DAEMON-001
     },
     # DIR-006: Add 4 missing ACTIVE daemons
     'mechanism_alpha_trigger': {
         'script': '03_FUNCTIONS/mechanism_alpha_trigger.py',
         'max_stale_minutes': 15,
-        'process': None,
         'has_heartbeat': True
     },
     'mechanism_alpha_outcome': {
         'script': '03_FUNCTIONS/mechanism_alpha_outcome.py',
         'max_stale_minutes': 35,
-        'process': None,
         'has_heartbeat': True
     },
     'orphan_state_cleanup': {
         'script': '03_FUNCTIONS/orphan_state_cleanup.py',
         'max_stale_minutes': 65,
-        'process': None,
         'has_heartbeat': True
     },
     'shadow_roi_calculator': {
         'script': '03_FUNCTIONS/shadow_roi_calculator.py',
         'max_stale_minutes': 1445,
-        'process': None,
         'has_heartbeat': True
     },
     # SUSPENDED: wave15_autonomous_hunter - Reactivate after G1.5 (2026-02-07)
     # See control_room_alerts for reminder
 }
 
-CHECK_INTERVAL_SECONDS = 60  # Check every minute
+CHECK_INTERVAL_SECONDS = 60  # Heartbeat sweep every minute
+
+# Supervision policy
+TERMINATE_TIMEOUT_SECONDS = 5       # SIGTERM -> kill grace period
+RESTART_BACKOFF_BASE_SECONDS = 5    # first restart delay, doubled per failure
+RESTART_BACKOFF_MAX_SECONDS = 600
+STABLE_UPTIME_SECONDS = 300         # uptime that resets the backoff
+CRASH_LOOP_RESTARTS = 5             # restarts within the window = crash loop
+CRASH_LOOP_WINDOW_SECONDS = 900
+CRASH_LOOP_COOLDOWN_SECONDS = 3600  # no restarts while quarantined
+ORPHAN_CHECK_EVERY_SWEEPS = 10
+
+# All heartbeats in one query: daemon_health first, agent_heartbeats for
+# daemons configured with heartbeat_table='agent_heartbeats'
+HEARTBEATS_SQL = """
+    SELECT d.daemon_name,
+           EXTRACT(EPOCH FROM (NOW() - h.last_heartbeat))/60 as minutes_ago,
+           EXTRACT(EPOCH FROM (NOW() - a.last_heartbeat))/60 as agent_minutes_ago
+    FROM unnest(%s::text[], %s::text[]) AS d(daemon_name, agent_id)
+    LEFT JOIN fhq_monitoring.daemon_health h ON h.daemon_name = d.daemon_name
+    LEFT JOIN LATERAL (
+        SELECT last_heartbeat
+        FROM fhq_governance.agent_heartbeats
+        WHERE agent_id = d.agent_id
+        LIMIT 1
+    ) a ON true
+"""
 
 
-def update_watchdog_heartbeat():
-    """Update watchdog's own heartbeat."""
+def update_watchdog_heartbeat(conn, metadata: Optional[Dict] = None):
+    """Update watchdog's own heartbeat (metadata carries restart/uptime stats)."""
+    metadata = metadata or {'managed_daemons': len(DAEMONS)}
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
         with conn.cursor() as cur:
             cur.execute("""
                 INSERT INTO fhq_monitoring.daemon_health (daemon_name, status, last_heartbeat, metadata, lifecycle_status)
@@ -155,20 +170,20 @@ def update_watchdog_heartbeat():
                     last_heartbeat = NOW(),
                     metadata = %s,
                     lifecycle_status = 'ACTIVE'
-            """, (Json({'managed_daemons': len(DAEMONS)}), Json({'managed_daemons': len(DAEMONS)})))
+            """, (Json(metadata), Json(metadata)))
             conn.commit()
-        conn.close()
     except Exception as e:
         logger.error(f"Failed to update watchdog heartbeat: {e}")
+        conn.rollback()
+        raise
 
 
-def check_orphaned_daemons():
+def check_orphaned_daemons(conn):
     """
     CEO-DIR-2026-DAEMON-HYGIENE-001: Escalate ORPHANED daemons.
     These are red flags requiring CEO attention.
     """
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
         with conn.cursor() as cur:
             cur.execute("""
                 SELECT daemon_name, lifecycle_reason, lifecycle_updated_at
@@ -195,119 +210,465 @@ def check_orphaned_daemons():
                     ON CONFLICT DO NOTHING
                 """, (f"{len(orphans)} orphaned daemon(s) require CEO disposition: {', '.join([o[0] for o in orphans])}",))
                 conn.commit()
-        conn.close()
     except Exception as e:
         logger.error(f"Failed to check orphaned daemons: {e}")
+        conn.rollback()
+        raise
+
+
+def raise_crash_loop_alert(conn, daemon_name: str, restarts: int, window_seconds: float):
+    """Escalate a daemon quarantined for crash-looping."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            INSERT INTO fhq_monitoring.control_room_alerts
+                (alert_type, severity, title, message, source_daemon, acknowledged)
+            VALUES ('DAEMON_CRASH_LOOP', 'CRITICAL', 'Daemon Crash Loop Detected',
+                    %s, 'daemon_watchdog', false)
+            ON CONFLICT DO NOTHING
+        """, (f"{daemon_name} restarted {restarts} times in {window_seconds:.0f}s - "
+              f"restarts suspended",))
+        conn.commit()
+
+
+@dataclass
+class DaemonState:
+    """Supervision state and statistics for one managed daemon."""
+    name: str
+    config: Dict
+    process: Optional[subprocess.Popen] = None
+    started_at: Optional[float] = None          # monotonic
+    stop_reason: Optional[str] = None           # set when the watchdog stops it
+    kill_deadline: Optional[float] = None
+    next_start_at: Optional[float] = None
+    consecutive_failures: int = 0
+    recent_restarts: Deque[float] = field(default_factory=deque)
+    crash_loop_until: Optional[float] = None
+    # statistics
+    starts: int = 0
+    restarts: int = 0
+    crashes: int = 0
+    heartbeat_restarts: int = 0
+    crash_loops: int = 0
+    last_exit_code: Optional[int] = None
+    last_exit_reason: Optional[str] = None
+    total_uptime: float = 0.0
+    longest_uptime: float = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    def uptime(self, now: float) -> float:
+        return now - self.started_at if self.alive and self.started_at is not None else 0.0
+
+    def stats(self, now: float) -> Dict:
+        return {
+            'pid': self.process.pid if self.alive else None,
+            'starts': self.starts,
+            'restarts': self.restarts,
+            'crashes': self.crashes,
+            'heartbeat_restarts': self.heartbeat_restarts,
+            'crash_loops': self.crash_loops,
+            'in_crash_loop': self.crash_loop_until is not None and self.crash_loop_until > now,
+            'last_exit_code': self.last_exit_code,
+            'last_exit_reason': self.last_exit_reason,
+            'uptime_seconds': round(self.uptime(now), 1),
+            'total_uptime_seconds': round(self.total_uptime + self.uptime(now), 1),
+            'longest_uptime_seconds': round(max(self.longest_uptime, self.uptime(now)), 1),
+            'next_start_in_seconds': (round(max(0.0, self.next_start_at - now), 1)
+                                      if self.next_start_at is not None else None),
+        }
+
+
+class DaemonSupervisor:
+    """
+    Event-driven daemon supervisor.
+
+    Child exits wake the loop immediately: on POSIX a SIGCHLD handler writes
+    to a wakeup socket (signal.set_wakeup_fd); where that is unavailable
+    (Windows, or when not running in the main thread) one waiter thread per
+    child does. Exited children are reaped with Popen.poll (waitpid).
+    Heartbeats of all daemons are read with one query per sweep over a
+    persistent connection. Restarts back off exponentially and a daemon
+    restarted CRASH_LOOP_RESTARTS times within CRASH_LOOP_WINDOW_SECONDS is
+    quarantined for CRASH_LOOP_COOLDOWN_SECONDS.
+    """
 
-
-def check_daemon_heartbeat(daemon_name):
-    """Check if daemon heartbeat is fresh."""
-    config = DAEMONS[daemon_name]
-    max_stale = config['max_stale_minutes']
-
-    try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        with conn.cursor() as cur:
-            # Check daemon_health table
-            cur.execute("""
-                SELECT EXTRACT(EPOCH FROM (NOW() - last_heartbeat))/60 as minutes_ago
-                FROM fhq_monitoring.daemon_health
-                WHERE daemon_name = %s
-            """, (daemon_name,))
-            row = cur.fetchone()
-
-            if row and row[0] is not None:
-                conn.close()
-                return row[0] < max_stale
-
-            # Also check agent_heartbeats for economic_outcome_daemon
-            if config.get('heartbeat_table') == 'agent_heartbeats':
-                cur.execute("""
-                    SELECT EXTRACT(EPOCH FROM (NOW() - last_heartbeat))/60 as minutes_ago
-                    FROM fhq_governance.agent_heartbeats
-                    WHERE agent_id = %s
-                """, (config.get('heartbeat_id'),))
-                row = cur.fetchone()
-                conn.close()
-                if row and row[0] is not None:
-                    return row[0] < max_stale
-
-            conn.close()
-        return False  # No heartbeat found
-    except Exception as e:
-        logger.error(f"Error checking heartbeat for {daemon_name}: {e}")
-        return False
-
-
-def start_daemon(daemon_name):
-    """Start a daemon process."""
-    config = DAEMONS[daemon_name]
-    script = config['script']
-
-    logger.info(f"Starting {daemon_name}...")
-
-    try:
-        # Start process with subprocess
-        process = subprocess.Popen(
-            [sys.executable, script],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            cwd='C:/fhq-market-system/vision-ios',
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        )
-        config['process'] = process
-        logger.info(f"  Started {daemon_name} (PID: {process.pid})")
+    def __init__(self, daemons: Dict[str, Dict] = None, workdir: str = DEFAULT_WORKDIR,
+                 connection_factory: Optional[Callable] = None,
+                 check_interval: float = CHECK_INTERVAL_SECONDS,
+                 terminate_timeout: float = TERMINATE_TIMEOUT_SECONDS,
+                 backoff_base: float = RESTART_BACKOFF_BASE_SECONDS,
+                 backoff_max: float = RESTART_BACKOFF_MAX_SECONDS,
+                 stable_uptime: float = STABLE_UPTIME_SECONDS,
+                 crash_loop_restarts: int = CRASH_LOOP_RESTARTS,
+                 crash_loop_window: float = CRASH_LOOP_WINDOW_SECONDS,
+                 crash_loop_cooldown: float = CRASH_LOOP_COOLDOWN_SECONDS,
+                 exit_notification: str = 'auto'):
+        daemons = DAEMONS if daemons is None else daemons
+        self.states = {name: DaemonState(name, config) for name, config in daemons.items()}
+        self.workdir = workdir
+        self._connection_factory = connection_factory or (lambda: psycopg2.connect(**DB_CONFIG))
+        self.conn = None
+        self.check_interval = check_interval
+        self.terminate_timeout = terminate_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stable_uptime = stable_uptime
+        self.crash_loop_restarts = crash_loop_restarts
+        self.crash_loop_window = crash_loop_window
+        self.crash_loop_cooldown = crash_loop_cooldown
+        self.exit_notification = exit_notification
+        self.sweeps = 0
+        self.heartbeat_queries = 0
+        self._stopping = False
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._mode = None
+        self._previous_sigchld = None
+        self._previous_wakeup_fd = None
+
+    # -- exit notification --------------------------------------------------
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass    # buffer full or closed: a wakeup is already pending
+
+    def _install_exit_notification(self):
+        mode = self.exit_notification
+        if mode == 'auto':
+            posix = hasattr(signal, 'SIGCHLD')
+            main_thread = threading.current_thread() is threading.main_thread()
+            mode = 'sigchld' if posix and main_thread else 'threads'
+        if mode == 'sigchld':
+            self._previous_sigchld = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+            self._previous_wakeup_fd = signal.set_wakeup_fd(self._wake_w.fileno(),
+                                                            warn_on_full_buffer=False)
+        self._mode = mode
+
+    def _uninstall_exit_notification(self):
+        if self._mode == 'sigchld':
+            signal.set_wakeup_fd(self._previous_wakeup_fd)
+            signal.signal(signal.SIGCHLD, self._previous_sigchld or signal.SIG_DFL)
+        self._mode = None
+
+    def _watch(self, process: subprocess.Popen):
+        if self._mode == 'threads':
+            def wait():
+                process.wait()
+                self._wake()
+            threading.Thread(target=wait, name=f'watchdog-wait-{process.pid}', daemon=True).start()
+
+    def _wait(self, timeout: float):
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wake_r, selectors.EVENT_READ)
+            selector.select(max(0.0, timeout))
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    # -- process control ----------------------------------------------------
+
+    def start_daemon(self, state: DaemonState, now: Optional[float] = None) -> bool:
+        """Start a daemon process."""
+        now = time.monotonic() if now is None else now
+        script = state.config['script']
+        logger.info(f"Starting {state.name}...")
+        state.next_start_at = None
+        try:
+            state.process = subprocess.Popen(
+                [sys.executable, script],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=self.workdir,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            )
+        except Exception as e:
+            logger.error(f"  Failed to start {state.name}: {e}")
+            self._schedule_restart(state, now, 'start failed', uptime=0.0)
+            return False
+        state.started_at = now
+        state.stop_reason = None
+        state.kill_deadline = None
+        state.starts += 1
+        self._watch(state.process)
+        logger.info(f"  Started {state.name} (PID: {state.process.pid})")
         return True
-    except Exception as e:
-        logger.error(f"  Failed to start {daemon_name}: {e}")
-        return False
-
-
-def check_and_restart_daemons():
-    """Check all daemons and restart if needed."""
-    for daemon_name, config in DAEMONS.items():
-        process = config.get('process')
-
-        # Check if process is running
-        process_alive = process is not None and process.poll() is None
-
-        # Determine if we need to restart
-        needs_restart = False
-        reason = ""
-
-        if not process_alive:
-            needs_restart = True
-            reason = "process dead"
-        elif config.get('has_heartbeat', False):
-            # Only check heartbeat for daemons that have heartbeat code
-            heartbeat_fresh = check_daemon_heartbeat(daemon_name)
-            if not heartbeat_fresh:
-                needs_restart = True
-                reason = "stale heartbeat"
-
-        if needs_restart:
-            logger.warning(f"{daemon_name}: {reason} - restarting...")
-
-            # Kill existing process if any
-            if process_alive:
-                try:
-                    process.terminate()
-                    process.wait(timeout=5)
-                except:
-                    process.kill()
 
-            # Start new process
-            start_daemon(daemon_name)
-        else:
-            logger.debug(f"{daemon_name}: OK")
+    def _request_stop(self, state: DaemonState, reason: str, now: float):
+        """SIGTERM now, kill after terminate_timeout if still alive."""
+        if not state.alive or state.stop_reason is not None:
+            return
+        logger.warning(f"{state.name}: {reason} - restarting...")
+        state.stop_reason = reason
+        state.kill_deadline = now + self.terminate_timeout
+        try:
+            state.process.terminate()
+        except OSError:
+            pass
+
+    def _backoff(self, failures: int) -> float:
+        return min(self.backoff_base * (2 ** max(0, failures - 1)), self.backoff_max)
+
+    def _schedule_restart(self, state: DaemonState, now: float, reason: str, uptime: float):
+        if self._stopping:
+            return
+        if uptime >= self.stable_uptime:
+            state.consecutive_failures = 0
+        state.consecutive_failures += 1
+
+        window_start = now - self.crash_loop_window
+        state.recent_restarts.append(now)
+        while state.recent_restarts and state.recent_restarts[0] < window_start:
+            state.recent_restarts.popleft()
+
+        if len(state.recent_restarts) >= self.crash_loop_restarts:
+            state.crash_loops += 1
+            state.crash_loop_until = now + self.crash_loop_cooldown
+            state.next_start_at = state.crash_loop_until
+            state.recent_restarts.clear()
+            logger.error(f"{state.name}: crash loop ({self.crash_loop_restarts} restarts in "
+                         f"{self.crash_loop_window:.0f}s) - restarts suspended for "
+                         f"{self.crash_loop_cooldown:.0f}s")
+            self._db_call(raise_crash_loop_alert, state.name, self.crash_loop_restarts,
+                          self.crash_loop_window)
+            return
+
+        delay = self._backoff(state.consecutive_failures)
+        state.next_start_at = now + delay
+        logger.warning(f"{state.name}: {reason} - restart in {delay:.1f}s")
+
+    def _reap(self, now: float):
+        """Handle every child that has exited (Popen.poll -> waitpid)."""
+        for state in self.states.values():
+            process = state.process
+            if process is None or process.returncode is not None and state.started_at is None:
+                continue
+            code = process.poll()
+            if code is None:
+                if state.kill_deadline is not None and now >= state.kill_deadline:
+                    logger.warning(f"{state.name}: did not stop within "
+                                   f"{self.terminate_timeout:.0f}s - killing")
+                    process.kill()
+                    state.kill_deadline = None
+                continue
+
+            uptime = now - state.started_at
+            state.total_uptime += uptime
+            state.longest_uptime = max(state.longest_uptime, uptime)
+            state.started_at = None
+            state.last_exit_code = code
+            reason = state.stop_reason or f"process dead (exit code {code})"
+            state.last_exit_reason = reason
+            if state.stop_reason is None:
+                state.crashes += 1
+            elif state.stop_reason == 'stale heartbeat':
+                state.heartbeat_restarts += 1
+            state.kill_deadline = None
+            if not self._stopping:
+                state.restarts += 1
+                self._schedule_restart(state, now, reason, uptime)
+
+    def _start_due(self, now: float):
+        for state in self.states.values():
+            if not state.alive and state.next_start_at is not None and state.next_start_at <= now:
+                if state.crash_loop_until is not None and state.crash_loop_until <= now:
+                    state.crash_loop_until = None
+                    state.consecutive_failures = 0
+                self.start_daemon(state, now)
+
+    # -- database -----------------------------------------------------------
+
+    def _db_call(self, fn, *args):
+        """Run fn(conn, *args) on the persistent connection, reconnecting once."""
+        for attempt in (1, 2):
+            try:
+                if self.conn is None or getattr(self.conn, 'closed', 0):
+                    self.conn = self._connection_factory()
+                return fn(self.conn, *args)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                logger.error(f"Database connection lost ({e}) - reconnecting")
+                self._close_connection()
+            except Exception as e:
+                logger.error(f"{fn.__name__} failed: {e}")
+                return None
+        return None
+
+    def _close_connection(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = None
+
+    def _read_heartbeats(self, conn, names: List[str]) -> Dict[str, bool]:
+        agent_ids = [
+            self.states[n].config.get('heartbeat_id')
+            if self.states[n].config.get('heartbeat_table') == 'agent_heartbeats' else None
+            for n in names
+        ]
+        self.heartbeat_queries += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute(HEARTBEATS_SQL, (names, agent_ids))
+                rows = cur.fetchall()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        fresh = {}
+        for name, minutes_ago, agent_minutes_ago in rows:
+            max_stale = self.states[name].config['max_stale_minutes']
+            if minutes_ago is not None:
+                fresh[name] = minutes_ago < max_stale
+            elif agent_minutes_ago is not None:
+                fresh[name] = agent_minutes_ago < max_stale
+            else:
+                fresh[name] = False       # No heartbeat found
+        return fresh
+
+    def check_heartbeats(self, now: float):
+        """
+        One heartbeat query for every running heartbeat daemon. A daemon is
+        checked once it has been up for max_stale_minutes, so it has a full
+        window to write its first heartbeat. If the query fails nothing is
+        restarted: an unreachable database says nothing about the daemons.
+        """
+        due = [
+            s.name for s in self.states.values()
+            if s.config.get('has_heartbeat', False) and s.alive and s.stop_reason is None
+            and s.uptime(now) >= s.config['max_stale_minutes'] * 60
+        ]
+        if not due:
+            return
+        fresh = self._db_call(self._read_heartbeats, due)
+        if fresh is None:
+            logger.error("Heartbeat check skipped this sweep")
+            return
+        for name in due:
+            if fresh.get(name) is False:
+                self._request_stop(self.states[name], 'stale heartbeat', now)
+            else:
+                logger.debug(f"{name}: OK")
+
+    def sweep(self, now: float):
+        """Periodic work: own heartbeat, daemon heartbeats, orphan check."""
+        self.sweeps += 1
+        self._db_call(update_watchdog_heartbeat, {
+            'managed_daemons': len(self.states),
+            'daemons': self.stats(now)
+        })
+        self.check_heartbeats(now)
+        if self.sweeps % ORPHAN_CHECK_EVERY_SWEEPS == 0:
+            self._db_call(check_orphaned_daemons)
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, Dict]:
+        """Per-daemon restart and uptime statistics."""
+        now = time.monotonic() if now is None else now
+        return {name: state.stats(now) for name, state in self.states.items()}
+
+    # -- main loop ----------------------------------------------------------
+
+    def stop(self):
+        """Ask run() to return (thread-safe)."""
+        self._stopping = True
+        self._wake()
+
+    def run(self, duration: Optional[float] = None):
+        """
+        Start all daemons and supervise them until stop() is called or
+        `duration` seconds have passed; then terminate them.
+        """
+        self._install_exit_notification()
+        try:
+            self._db_call(check_orphaned_daemons)
+            now = time.monotonic()
+            end = now + duration if duration is not None else None
+            for state in self.states.values():
+                self.start_daemon(state, now)
+
+            next_sweep = now
+            while not self._stopping:
+                now = time.monotonic()
+                if end is not None and now >= end:
+                    break
+                self._reap(now)
+                if now >= next_sweep:
+                    self.sweep(now)
+                    next_sweep = now + self.check_interval
+                self._start_due(now)
+
+                deadlines = [next_sweep] + [
+                    t for s in self.states.values()
+                    for t in (s.next_start_at, s.kill_deadline) if t is not None
+                ]
+                if end is not None:
+                    deadlines.append(end)
+                self._wait(min(deadlines) - time.monotonic())
+        finally:
+            self.shutdown()
+            self._uninstall_exit_notification()
+
+    def shutdown(self):
+        """Terminate all managed processes."""
+        self._stopping = True
+        logger.info("Shutting down managed daemons...")
+        for state in self.states.values():
+            if state.alive:
+                state.process.terminate()
+        deadline = time.monotonic() + self.terminate_timeout
+        for state in self.states.values():
+            if state.process is None:
+                continue
+            try:
+                state.process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                state.process.kill()
+                state.process.wait()
+            if state.started_at is not None:
+                uptime = time.monotonic() - state.started_at
+                state.total_uptime += uptime
+                state.longest_uptime = max(state.longest_uptime, uptime)
+                state.started_at = None
+                logger.info(f"  Terminated {state.name}")
+        self._close_connection()
+
+    def close(self):
+        self._wake_r.close()
+        self._wake_w.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(description='FjordHQ Daemon Watchdog')
+    parser.add_argument('--cwd', default=DEFAULT_WORKDIR,
+                        help='Working directory for daemons and logs (default: repository root)')
+    parser.add_argument('--interval', type=float, default=CHECK_INTERVAL_SECONDS,
+                        help='Heartbeat sweep interval in seconds')
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(args.cwd, 'logs'), exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[WATCHDOG] %(asctime)s %(levelname)s: %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(args.cwd, 'logs', 'daemon_watchdog.log')),
+            logging.StreamHandler()
+        ]
+    )
+
     logger.info("=" * 60)
-    logger.info("FjordHQ Daemon Watchdog - VERSION 3.0 (LIFECYCLE-AWARE)")
+    logger.info("FjordHQ Daemon Watchdog - VERSION 4.0 (EVENT-DRIVEN SUPERVISOR)")
     logger.info("CEO-DIR-2026-DAEMON-HYGIENE-001")
     logger.info(f"Monitoring {len(DAEMONS)} ACTIVE daemons")
-    logger.info(f"Check interval: {CHECK_INTERVAL_SECONDS} seconds")
+    logger.info(f"Working directory: {args.cwd}")
+    logger.info(f"Heartbeat sweep interval: {args.interval} seconds")
     logger.info("-" * 60)
     logger.info("Lifecycle Policy:")
     logger.info("  ACTIVE: Managed | DEPRECATED/SUSPENDED: Ignored | ORPHANED: Escalate")
@@ -316,42 +677,18 @@ def main():
         logger.info(f"  [ACTIVE] {name}")
     logger.info("=" * 60)
 
-    # Check for orphaned daemons at startup
-    check_orphaned_daemons()
-
-    # Initial startup of all daemons
-    for daemon_name in DAEMONS:
-        start_daemon(daemon_name)
-
-    # Main monitoring loop
-    orphan_check_counter = 0
-    while True:
-        try:
-            update_watchdog_heartbeat()
-            check_and_restart_daemons()
-
-            # Check for orphaned daemons every 10 cycles (10 minutes)
-            orphan_check_counter += 1
-            if orphan_check_counter >= 10:
-                check_orphaned_daemons()
-                orphan_check_counter = 0
-
-            time.sleep(CHECK_INTERVAL_SECONDS)
-        except KeyboardInterrupt:
-            logger.info("Watchdog shutdown requested")
-            break
-        except Exception as e:
-            logger.error(f"Watchdog error: {e}")
-            time.sleep(10)
-
-    # Cleanup - terminate all managed processes
-    logger.info("Shutting down managed daemons...")
-    for daemon_name, config in DAEMONS.items():
-        process = config.get('process')
-        if process and process.poll() is None:
-            process.terminate()
-            logger.info(f"  Terminated {daemon_name}")
-
+    supervisor = DaemonSupervisor(DAEMONS, workdir=args.cwd, check_interval=args.interval)
+    try:
+        supervisor.run()
+    except KeyboardInterrupt:
+        logger.info("Watchdog shutdown requested")
+    finally:
+        supervisor.close()
+
+    for name, stats in supervisor.stats().items():
+        logger.info(f"  {name}: starts={stats['starts']} crashes={stats['crashes']} "
+                    f"heartbeat_restarts={stats['heartbeat_restarts']} "
+                    f"total_uptime={stats['total_uptime_seconds']}s")
     logger.info("Watchdog shutdown complete")
 
 
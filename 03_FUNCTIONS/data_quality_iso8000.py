@@ -15,6 +15,13 @@ Implements ISO 8000 data quality dimensions:
 Scores each data source (Alpaca, IEX, TwelveData, etc.)
 Blocks signals from sources below threshold.
 
+run_all_assessments reads each table once: one grouped aggregation over
+fhq_data.price_series and one over fhq_macro.canonical_series compute all
+four dimensions for every source, and the two scans run concurrently.
+With incremental=True per-source daily aggregates are kept between runs
+and only recent days are re-read. Scores are identical to the per-source
+assess_* functions.
+
 Authority: CEO, STIG (Technical), VEGA (Governance)
 Employment Contract: EC-003
 """
@@ -23,8 +30,11 @@ import os
 import json
 import hashlib
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone, timedelta
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import psycopg2
 from psycopg2.extras import RealDictCursor, Json
@@ -111,13 +121,30 @@ class ISO8000QualityFramework:
         'COINGECKO': 0.5     # 30 minutes for crypto
     }
 
-    def __init__(self):
-        self.conn = None
+    # Sources stored in fhq_data.price_series; all others are macro
+    PRICE_SOURCES = ['ALPACA', 'IEX', 'TWELVEDATA']
+
+    # is_source_usable cache lifetime
+    USABILITY_TTL_SECONDS = 900
+
+    # Incremental mode re-reads days from (previous run date - overlap)
+    # on, so late bars for recent days are picked up
+    INCREMENTAL_OVERLAP_DAYS = 2
+
+    def __init__(self, conn=None, connection_factory: Optional[Callable] = None):
+        self.conn = conn
+        self._connection_factory = connection_factory or (lambda: psycopg2.connect(**DB_CONFIG))
         self._assessments: Dict[str, DataSourceQuality] = {}
+        self._usable: Dict[str, Tuple[bool, float]] = {}
+        self._usable_lock = threading.Lock()
+        # Incremental mode: table -> {(source, day): aggregates} and the
+        # CURRENT_DATE each source was last refreshed on
+        self._daily: Dict[str, Dict[Tuple[str, date], Dict[str, Any]]] = {'price': {}, 'macro': {}}
+        self._daily_refreshed: Dict[str, date] = {}
 
     def connect(self):
         """Connect to database."""
-        self.conn = psycopg2.connect(**DB_CONFIG)
+        self.conn = self._connection_factory()
         logger.info("Connected to database")
 
     def close(self):
@@ -137,7 +164,7 @@ class ISO8000QualityFramework:
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
                 # Check for null values in critical fields
-                if source in ['ALPACA', 'IEX', 'TWELVEDATA']:
+                if source in self.PRICE_SOURCES:
                     cur.execute("""
                         SELECT
                             COUNT(*) as total_records,
@@ -169,49 +196,11 @@ class ISO8000QualityFramework:
                         AND timestamp >= CURRENT_DATE - INTERVAL '30 days'
                     """, (source,))
 
-                row = cur.fetchone()
-
-                if row['total_records'] == 0:
-                    return QualityDimension(
-                        name='completeness',
-                        score=0.0,
-                        issues_detected=1,
-                        records_evaluated=0,
-                        details={'error': 'No data found'}
-                    )
-
-                total = row['total_records']
-                issues = (
-                    (row['null_close'] or 0) +
-                    (row['null_volume'] or 0) +
-                    (row['null_high'] or 0) +
-                    (row['null_low'] or 0)
-                )
-
-                score = max(0, 1 - (issues / (total * 4)))  # 4 critical fields
-
-                return QualityDimension(
-                    name='completeness',
-                    score=round(score, 4),
-                    issues_detected=issues,
-                    records_evaluated=total,
-                    details={
-                        'null_close': row['null_close'],
-                        'null_volume': row['null_volume'],
-                        'unique_symbols': row['unique_symbols'],
-                        'date_range': f"{row['earliest']} to {row['latest']}"
-                    }
-                )
+                return self._completeness_dimension(cur.fetchone())
 
         except Exception as e:
             logger.error(f"Completeness check failed for {source}: {e}")
-            return QualityDimension(
-                name='completeness',
-                score=0.5,
-                issues_detected=0,
-                records_evaluated=0,
-                details={'error': str(e)}
-            )
+            return self._failed_dimension('completeness', e)
 
     def assess_timeliness(self, source: str) -> QualityDimension:
         """
@@ -226,7 +215,7 @@ class ISO8000QualityFramework:
 
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-                if source in ['ALPACA', 'IEX', 'TWELVEDATA']:
+                if source in self.PRICE_SOURCES:
                     cur.execute("""
                         SELECT
                             MAX(date) as latest_date,
@@ -249,51 +238,11 @@ class ISO8000QualityFramework:
                         AND timestamp >= CURRENT_DATE - INTERVAL '7 days'
                     """, (source,))
 
-                row = cur.fetchone()
-
-                if row['total_records'] == 0:
-                    return QualityDimension(
-                        name='timeliness',
-                        score=0.0,
-                        issues_detected=1,
-                        records_evaluated=0,
-                        details={'error': 'No recent data'}
-                    )
-
-                hours_behind = float(row['hours_behind'] or 999)
-
-                # Score based on how fresh data is vs threshold
-                if hours_behind <= threshold_hours:
-                    score = 1.0
-                elif hours_behind <= threshold_hours * 2:
-                    score = 0.8
-                elif hours_behind <= threshold_hours * 4:
-                    score = 0.5
-                else:
-                    score = 0.2
-
-                return QualityDimension(
-                    name='timeliness',
-                    score=round(score, 4),
-                    issues_detected=1 if hours_behind > threshold_hours else 0,
-                    records_evaluated=row['total_records'],
-                    details={
-                        'latest_date': str(row['latest_date']),
-                        'hours_behind': round(hours_behind, 2),
-                        'threshold_hours': threshold_hours,
-                        'trading_days_in_7d': row['trading_days']
-                    }
-                )
+                return self._timeliness_dimension(cur.fetchone(), threshold_hours)
 
         except Exception as e:
             logger.error(f"Timeliness check failed for {source}: {e}")
-            return QualityDimension(
-                name='timeliness',
-                score=0.5,
-                issues_detected=0,
-                records_evaluated=0,
-                details={'error': str(e)}
-            )
+            return self._failed_dimension('timeliness', e)
 
     def assess_accuracy(self, source: str) -> QualityDimension:
         """
@@ -306,7 +255,7 @@ class ISO8000QualityFramework:
         """
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-                if source in ['ALPACA', 'IEX', 'TWELVEDATA']:
+                if source in self.PRICE_SOURCES:
                     cur.execute("""
                         SELECT
                             COUNT(*) as total_records,
@@ -338,49 +287,11 @@ class ISO8000QualityFramework:
                         AND timestamp >= CURRENT_DATE - INTERVAL '30 days'
                     """, (source,))
 
-                row = cur.fetchone()
-
-                if row['total_records'] == 0:
-                    return QualityDimension(
-                        name='accuracy',
-                        score=0.5,
-                        issues_detected=0,
-                        records_evaluated=0,
-                        details={'error': 'No data to evaluate'}
-                    )
-
-                total = row['total_records']
-                issues = (
-                    (row['invalid_hl'] or 0) +
-                    (row['negative_price'] or 0) +
-                    (row['extreme_moves'] or 0) +
-                    (row['close_outside_range'] or 0)
-                )
-
-                score = max(0, 1 - (issues / total))
-
-                return QualityDimension(
-                    name='accuracy',
-                    score=round(score, 4),
-                    issues_detected=issues,
-                    records_evaluated=total,
-                    details={
-                        'invalid_high_low': row['invalid_hl'],
-                        'negative_prices': row['negative_price'],
-                        'extreme_moves': row['extreme_moves'],
-                        'close_outside_range': row['close_outside_range']
-                    }
-                )
+                return self._accuracy_dimension(cur.fetchone())
 
         except Exception as e:
             logger.error(f"Accuracy check failed for {source}: {e}")
-            return QualityDimension(
-                name='accuracy',
-                score=0.5,
-                issues_detected=0,
-                records_evaluated=0,
-                details={'error': str(e)}
-            )
+            return self._failed_dimension('accuracy', e)
 
     def assess_consistency(self, source: str) -> QualityDimension:
         """
@@ -394,7 +305,7 @@ class ISO8000QualityFramework:
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
                 # Check for gaps (missing trading days)
-                if source in ['ALPACA', 'IEX', 'TWELVEDATA']:
+                if source in self.PRICE_SOURCES:
                     cur.execute("""
                         WITH date_series AS (
                             SELECT generate_series(
@@ -433,38 +344,153 @@ class ISO8000QualityFramework:
                         AND timestamp >= CURRENT_DATE - INTERVAL '30 days'
                     """, (source,))
 
-                row = cur.fetchone()
-
-                expected = row['expected_trading_days'] or 20
-                actual = row['actual_days'] or 0
-                missing = row['missing_days'] or (expected - actual)
-
-                # Score based on data coverage
-                score = min(1.0, actual / max(1, expected))
-
-                return QualityDimension(
-                    name='consistency',
-                    score=round(score, 4),
-                    issues_detected=missing,
-                    records_evaluated=expected,
-                    details={
-                        'expected_days': expected,
-                        'actual_days': actual,
-                        'missing_days': missing,
-                        'coverage_pct': round(score * 100, 1)
-                    }
-                )
+                return self._consistency_dimension(cur.fetchone())
 
         except Exception as e:
             logger.error(f"Consistency check failed for {source}: {e}")
+            return self._failed_dimension('consistency', e)
+
+    @staticmethod
+    def _completeness_dimension(row: Dict) -> QualityDimension:
+        """Completeness score from an assess_completeness-shaped row."""
+        if row['total_records'] == 0:
+            return QualityDimension(
+                name='completeness',
+                score=0.0,
+                issues_detected=1,
+                records_evaluated=0,
+                details={'error': 'No data found'}
+            )
+
+        total = row['total_records']
+        issues = (
+            (row['null_close'] or 0) +
+            (row['null_volume'] or 0) +
+            (row['null_high'] or 0) +
+            (row['null_low'] or 0)
+        )
+
+        score = max(0, 1 - (issues / (total * 4)))  # 4 critical fields
+
+        return QualityDimension(
+            name='completeness',
+            score=round(score, 4),
+            issues_detected=issues,
+            records_evaluated=total,
+            details={
+                'null_close': row['null_close'],
+                'null_volume': row['null_volume'],
+                'unique_symbols': row['unique_symbols'],
+                'date_range': f"{row['earliest']} to {row['latest']}"
+            }
+        )
+
+    @staticmethod
+    def _timeliness_dimension(row: Dict, threshold_hours: float) -> QualityDimension:
+        """Timeliness score from an assess_timeliness-shaped row."""
+        if row['total_records'] == 0:
+            return QualityDimension(
+                name='timeliness',
+                score=0.0,
+                issues_detected=1,
+                records_evaluated=0,
+                details={'error': 'No recent data'}
+            )
+
+        hours_behind = float(row['hours_behind'] or 999)
+
+        # Score based on how fresh data is vs threshold
+        if hours_behind <= threshold_hours:
+            score = 1.0
+        elif hours_behind <= threshold_hours * 2:
+            score = 0.8
+        elif hours_behind <= threshold_hours * 4:
+            score = 0.5
+        else:
+            score = 0.2
+
+        return QualityDimension(
+            name='timeliness',
+            score=round(score, 4),
+            issues_detected=1 if hours_behind > threshold_hours else 0,
+            records_evaluated=row['total_records'],
+            details={
+                'latest_date': str(row['latest_date']),
+                'hours_behind': round(hours_behind, 2),
+                'threshold_hours': threshold_hours,
+                'trading_days_in_7d': row['trading_days']
+            }
+        )
+
+    @staticmethod
+    def _accuracy_dimension(row: Dict) -> QualityDimension:
+        """Accuracy score from an assess_accuracy-shaped row."""
+        if row['total_records'] == 0:
             return QualityDimension(
-                name='consistency',
+                name='accuracy',
                 score=0.5,
                 issues_detected=0,
                 records_evaluated=0,
-                details={'error': str(e)}
+                details={'error': 'No data to evaluate'}
             )
 
+        total = row['total_records']
+        issues = (
+            (row['invalid_hl'] or 0) +
+            (row['negative_price'] or 0) +
+            (row['extreme_moves'] or 0) +
+            (row['close_outside_range'] or 0)
+        )
+
+        score = max(0, 1 - (issues / total))
+
+        return QualityDimension(
+            name='accuracy',
+            score=round(score, 4),
+            issues_detected=issues,
+            records_evaluated=total,
+            details={
+                'invalid_high_low': row['invalid_hl'],
+                'negative_prices': row['negative_price'],
+                'extreme_moves': row['extreme_moves'],
+                'close_outside_range': row['close_outside_range']
+            }
+        )
+
+    @staticmethod
+    def _consistency_dimension(row: Dict) -> QualityDimension:
+        """Consistency score from an assess_consistency-shaped row."""
+        expected = row['expected_trading_days'] or 20
+        actual = row['actual_days'] or 0
+        missing = row['missing_days'] or (expected - actual)
+
+        # Score based on data coverage
+        score = min(1.0, actual / max(1, expected))
+
+        return QualityDimension(
+            name='consistency',
+            score=round(score, 4),
+            issues_detected=missing,
+            records_evaluated=expected,
+            details={
+                'expected_days': expected,
+                'actual_days': actual,
+                'missing_days': missing,
+                'coverage_pct': round(score * 100, 1)
+            }
+        )
+
+    @staticmethod
+    def _failed_dimension(name: str, error: Exception) -> QualityDimension:
+        """Neutral score when a dimension could not be evaluated."""
+        return QualityDimension(
+            name=name,
+            score=0.5,
+            issues_detected=0,
+            records_evaluated=0,
+            details={'error': str(error)}
+        )
+
     def assess_source(self, source: str) -> DataSourceQuality:
         """Run full quality assessment for a data source."""
         logger.info(f"Assessing quality for {source}...")
@@ -474,6 +500,12 @@ class ISO8000QualityFramework:
         accuracy = self.assess_accuracy(source)
         consistency = self.assess_consistency(source)
 
+        return self._combine_dimensions(source, completeness, timeliness, accuracy, consistency)
+
+    def _combine_dimensions(self, source: str, completeness: QualityDimension,
+                            timeliness: QualityDimension, accuracy: QualityDimension,
+                            consistency: QualityDimension) -> DataSourceQuality:
+        """Overall score, tier and recommendations from the four dimensions."""
         # Calculate weighted overall score
         overall_score = (
             completeness.score * DIMENSION_WEIGHTS['completeness'] +
@@ -516,6 +548,7 @@ class ISO8000QualityFramework:
         )
 
         self._assessments[source] = assessment
+        self._cache_usability(assessment)
 
         logger.info(
             f"  {source}: {overall_score:.1%} ({quality_tier}) - "
@@ -524,6 +557,332 @@ class ISO8000QualityFramework:
 
         return assessment
 
+    # =========================================================================
+    # SINGLE-SCAN ASSESSMENT
+    # =========================================================================
+
+    # One grouped aggregation per table yields every column the four
+    # per-source dimension queries read.
+    PRICE_SCAN_SQL = """
+        WITH calendar AS (
+            SELECT COUNT(*) FILTER (
+                WHERE EXTRACT(DOW FROM d) NOT IN (0, 6)
+            ) as expected_trading_days
+            FROM generate_series(
+                CURRENT_DATE - INTERVAL '30 days',
+                CURRENT_DATE,
+                '1 day'::interval
+            ) d
+        ),
+        scan AS (
+            SELECT
+                source_provider as source,
+                COUNT(*) as total_records,
+                COUNT(*) FILTER (WHERE close IS NULL) as null_close,
+                COUNT(*) FILTER (WHERE volume IS NULL OR volume = 0) as null_volume,
+                COUNT(*) FILTER (WHERE high IS NULL) as null_high,
+                COUNT(*) FILTER (WHERE low IS NULL) as null_low,
+                COUNT(DISTINCT listing_id) as unique_symbols,
+                MIN(date) as earliest,
+                MAX(date) as latest,
+                MAX(date) FILTER (
+                    WHERE date >= CURRENT_DATE - INTERVAL '7 days'
+                ) as latest_date,
+                EXTRACT(EPOCH FROM (NOW() - MAX(date) FILTER (
+                    WHERE date >= CURRENT_DATE - INTERVAL '7 days'
+                ))) / 3600 as hours_behind,
+                COUNT(DISTINCT date) FILTER (
+                    WHERE date >= CURRENT_DATE - INTERVAL '7 days'
+                ) as trading_days,
+                COUNT(*) FILTER (
+                    WHERE date >= CURRENT_DATE - INTERVAL '7 days'
+                ) as recent_records,
+                COUNT(*) FILTER (WHERE high < low) as invalid_hl,
+                COUNT(*) FILTER (WHERE close < 0) as negative_price,
+                COUNT(*) FILTER (
+                    WHERE ABS((close - open) / NULLIF(open, 0)) > 0.50
+                ) as extreme_moves,
+                COUNT(*) FILTER (
+                    WHERE close NOT BETWEEN low AND high
+                ) as close_outside_range,
+                COUNT(DISTINCT date) FILTER (
+                    WHERE date <= CURRENT_DATE
+                ) as actual_days,
+                COUNT(DISTINCT date) FILTER (
+                    WHERE date <= CURRENT_DATE
+                    AND EXTRACT(DOW FROM date) NOT IN (0, 6)
+                ) as trading_days_present
+            FROM fhq_data.price_series
+            WHERE source_provider = ANY(%s)
+            AND date >= CURRENT_DATE - INTERVAL '30 days'
+            GROUP BY source_provider
+        )
+        SELECT calendar.expected_trading_days, scan.*
+        FROM calendar
+        LEFT JOIN scan ON true
+    """
+
+    MACRO_SCAN_SQL = """
+        SELECT
+            provenance as source,
+            COUNT(*) as total_records,
+            COUNT(DISTINCT feature_id) as unique_symbols,
+            MIN(timestamp::date) as earliest,
+            MAX(timestamp::date) as latest,
+            MAX(timestamp::date) FILTER (
+                WHERE timestamp >= CURRENT_DATE - INTERVAL '7 days'
+            ) as latest_date,
+            EXTRACT(EPOCH FROM (NOW() - MAX(timestamp) FILTER (
+                WHERE timestamp >= CURRENT_DATE - INTERVAL '7 days'
+            ))) / 3600 as hours_behind,
+            COUNT(DISTINCT timestamp::date) FILTER (
+                WHERE timestamp >= CURRENT_DATE - INTERVAL '7 days'
+            ) as trading_days,
+            COUNT(*) FILTER (
+                WHERE timestamp >= CURRENT_DATE - INTERVAL '7 days'
+            ) as recent_records,
+            COUNT(*) FILTER (
+                WHERE ABS(value_raw) > 1000000000
+            ) as extreme_moves,
+            COUNT(DISTINCT timestamp::date) as actual_days
+        FROM fhq_macro.canonical_series
+        WHERE provenance = ANY(%s)
+        AND timestamp >= CURRENT_DATE - INTERVAL '30 days'
+        GROUP BY provenance
+    """
+
+    # Incremental mode: the same counts per (source, day) for days >= %s.
+    # The clock row keeps NOW()/CURRENT_DATE available when no rows match.
+    PRICE_DAILY_SQL = """
+        SELECT clock.now, clock.today, daily.*
+        FROM (SELECT NOW() as now, CURRENT_DATE as today) clock
+        LEFT JOIN (
+            SELECT
+                source_provider as source,
+                date as day,
+                COUNT(*) as total_records,
+                COUNT(*) FILTER (WHERE close IS NULL) as null_close,
+                COUNT(*) FILTER (WHERE volume IS NULL OR volume = 0) as null_volume,
+                COUNT(*) FILTER (WHERE high IS NULL) as null_high,
+                COUNT(*) FILTER (WHERE low IS NULL) as null_low,
+                COUNT(*) FILTER (WHERE high < low) as invalid_hl,
+                COUNT(*) FILTER (WHERE close < 0) as negative_price,
+                COUNT(*) FILTER (
+                    WHERE ABS((close - open) / NULLIF(open, 0)) > 0.50
+                ) as extreme_moves,
+                COUNT(*) FILTER (
+                    WHERE close NOT BETWEEN low AND high
+                ) as close_outside_range,
+                array_agg(DISTINCT listing_id) as symbols,
+                MAX(date)::timestamptz as max_ts
+            FROM fhq_data.price_series
+            WHERE source_provider = ANY(%s)
+            AND date >= GREATEST(%s::date, CURRENT_DATE - INTERVAL '30 days')
+            GROUP BY source_provider, date
+        ) daily ON true
+    """
+
+    MACRO_DAILY_SQL = """
+        SELECT clock.now, clock.today, daily.*
+        FROM (SELECT NOW() as now, CURRENT_DATE as today) clock
+        LEFT JOIN (
+            SELECT
+                provenance as source,
+                timestamp::date as day,
+                COUNT(*) as total_records,
+                COUNT(*) FILTER (
+                    WHERE ABS(value_raw) > 1000000000
+                ) as extreme_moves,
+                array_agg(DISTINCT feature_id) as symbols,
+                MAX(timestamp) as max_ts
+            FROM fhq_macro.canonical_series
+            WHERE provenance = ANY(%s)
+            AND timestamp >= GREATEST(%s::date, CURRENT_DATE - INTERVAL '30 days')
+            GROUP BY provenance, timestamp::date
+        ) daily ON true
+    """
+
+    # Scan row for a source without rows in the window
+    EMPTY_SCAN_ROW = {
+        'total_records': 0, 'null_close': 0, 'null_volume': 0, 'null_high': 0,
+        'null_low': 0, 'unique_symbols': 0, 'earliest': None, 'latest': None,
+        'latest_date': None, 'hours_behind': None, 'trading_days': 0,
+        'recent_records': 0, 'invalid_hl': 0, 'negative_price': 0,
+        'extreme_moves': 0, 'close_outside_range': 0, 'actual_days': 0,
+        'trading_days_present': 0
+    }
+
+    def _table_for(self, source: str) -> str:
+        return 'price' if source in self.PRICE_SOURCES else 'macro'
+
+    def _scan_rows(self, table: str, rows: List[Dict], sources: List[str],
+                   expected_trading_days: Optional[int]) -> Dict[str, Dict]:
+        """Complete per-source scan rows with the derived consistency columns."""
+        by_source = {r['source']: r for r in rows if r.get('source') is not None}
+        result = {}
+        for source in sources:
+            row = {**self.EMPTY_SCAN_ROW, **by_source.get(source, {})}
+            if table == 'price':
+                row['expected_trading_days'] = expected_trading_days
+                row['missing_days'] = expected_trading_days - row['trading_days_present']
+            else:
+                row['expected_trading_days'] = 30
+                row['missing_days'] = 0
+            result[source] = row
+        return result
+
+    def _scan_table(self, conn, table: str, sources: List[str]) -> Dict[str, Dict]:
+        """All four dimensions' inputs for `sources` of one table in one scan."""
+        sql = self.PRICE_SCAN_SQL if table == 'price' else self.MACRO_SCAN_SQL
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(sql, (list(sources),))
+            rows = cur.fetchall()
+        expected = rows[0]['expected_trading_days'] if table == 'price' else None
+        return self._scan_rows(table, rows, sources, expected)
+
+    def _scan_table_incremental(self, conn, table: str, sources: List[str]) -> Dict[str, Dict]:
+        """
+        _scan_table from cached per-(source, day) aggregates.
+
+        Only days from the sources' previous refresh date minus
+        INCREMENTAL_OVERLAP_DAYS are re-read (all 30 days for a source
+        seen for the first time); older cached days are assumed final.
+        """
+        sql = self.PRICE_DAILY_SQL if table == 'price' else self.MACRO_DAILY_SQL
+        cache = self._daily[table]
+        refreshed = [self._daily_refreshed.get(s) for s in sources]
+        since = None
+        if refreshed and None not in refreshed:
+            since = min(refreshed) - timedelta(days=self.INCREMENTAL_OVERLAP_DAYS)
+
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(sql, (list(sources), since))
+            rows = cur.fetchall()
+        now, today = rows[0]['now'], rows[0]['today']
+
+        wanted = set(sources)
+        window_start = today - timedelta(days=30)
+        for key in list(cache):
+            source, day = key
+            if day < window_start or (source in wanted and (since is None or day >= since)):
+                del cache[key]
+        for r in rows:
+            if r['source'] is not None:
+                cache[(r['source'], r['day'])] = {**r, 'symbols': set(r['symbols'])}
+        for source in sources:
+            self._daily_refreshed[source] = today
+
+        return self._rows_from_daily(table, sources, now, today)
+
+    def _rows_from_daily(self, table: str, sources: List[str],
+                         now: datetime, today: date) -> Dict[str, Dict]:
+        """Fold cached daily aggregates into _scan_table rows."""
+        recent_start = today - timedelta(days=7)
+        days_by_source: Dict[str, List[Tuple[date, Dict]]] = {s: [] for s in sources}
+        for (source, day), agg in self._daily[table].items():
+            if source in days_by_source:
+                days_by_source[source].append((day, agg))
+
+        rows = []
+        for source, days in days_by_source.items():
+            if not days:
+                continue
+            row = {'source': source}
+            for column in ('total_records', 'null_close', 'null_volume', 'null_high', 'null_low',
+                           'invalid_hl', 'negative_price', 'extreme_moves', 'close_outside_range'):
+                row[column] = sum(agg.get(column, 0) for _, agg in days)
+            row['unique_symbols'] = len(set().union(*(agg['symbols'] for _, agg in days)))
+            row['earliest'] = min(day for day, _ in days)
+            row['latest'] = max(day for day, _ in days)
+
+            recent = [(day, agg) for day, agg in days if day >= recent_start]
+            row['recent_records'] = sum(agg['total_records'] for _, agg in recent)
+            row['trading_days'] = len(recent)
+            if recent:
+                row['latest_date'] = max(day for day, _ in recent)
+                latest_ts = max(agg['max_ts'] for _, agg in recent)
+                row['hours_behind'] = (now - latest_ts).total_seconds() / 3600
+
+            if table == 'price':
+                past = [day for day, _ in days if day <= today]
+                row['actual_days'] = len(past)
+                row['trading_days_present'] = sum(1 for day in past if day.weekday() < 5)
+            else:
+                row['actual_days'] = len(days)
+            rows.append(row)
+
+        expected = None
+        if table == 'price':
+            # Weekdays in generate_series(CURRENT_DATE - 30 days, CURRENT_DATE)
+            expected = sum(1 for k in range(31) if (today - timedelta(days=k)).weekday() < 5)
+        return self._scan_rows(table, rows, sources, expected)
+
+    def _assess_table(self, conn, table: str, sources: List[str],
+                      incremental: bool) -> Dict[str, DataSourceQuality]:
+        """Scan one table and assess each of its sources."""
+        try:
+            if incremental:
+                rows = self._scan_table_incremental(conn, table, sources)
+            else:
+                rows = self._scan_table(conn, table, sources)
+        except Exception as e:
+            logger.error(f"Quality scan failed for {table} sources {sources}: {e}")
+            conn.rollback()
+            rows = {source: e for source in sources}
+
+        results = {}
+        for source in sources:
+            logger.info(f"Assessing quality for {source}...")
+            row = rows[source]
+            if isinstance(row, Exception):
+                dimensions = [self._failed_dimension(name, row) for name in DIMENSION_WEIGHTS]
+            else:
+                dimensions = [
+                    self._completeness_dimension(row),
+                    self._timeliness_dimension(
+                        {**row, 'total_records': row['recent_records']},
+                        self.FRESHNESS_THRESHOLDS.get(source, 24.0)
+                    ),
+                    self._accuracy_dimension(row),
+                    self._consistency_dimension(row)
+                ]
+            results[source] = self._combine_dimensions(source, *dimensions)
+        return results
+
+    def assess_sources(self, sources: Optional[List[str]] = None, incremental: bool = False,
+                       parallel: bool = True) -> Dict[str, DataSourceQuality]:
+        """
+        assess_source for many sources with one scan per table.
+
+        With parallel=True the price and macro scans run concurrently; the
+        second scan gets its own connection from the connection factory.
+        """
+        sources = list(dict.fromkeys(sources or self.DATA_SOURCES))
+        tables: Dict[str, List[str]] = {}
+        for source in sources:
+            tables.setdefault(self._table_for(source), []).append(source)
+
+        results: Dict[str, DataSourceQuality] = {}
+        items = list(tables.items())
+        if not parallel or len(items) == 1:
+            for table, table_sources in items:
+                results.update(self._assess_table(self.conn, table, table_sources, incremental))
+        else:
+            extra = [self._connection_factory() for _ in items[1:]]
+            try:
+                with ThreadPoolExecutor(max_workers=len(items), thread_name_prefix='iso8000') as pool:
+                    futures = [
+                        pool.submit(self._assess_table, conn, table, table_sources, incremental)
+                        for conn, (table, table_sources) in zip([self.conn] + extra, items)
+                    ]
+                    for future in futures:
+                        results.update(future.result())
+            finally:
+                for conn in extra:
+                    conn.close()
+
+        return {source: results[source] for source in sources}
+
     def save_assessment(self, assessment: DataSourceQuality) -> bool:
         """Save quality assessment to database."""
         try:
@@ -569,20 +928,32 @@ class ISO8000QualityFramework:
             self.conn.rollback()
             return False
 
-    def run_all_assessments(self) -> Dict[str, DataSourceQuality]:
-        """Run quality assessments for all data sources."""
+    def run_all_assessments(self, batch: bool = True, incremental: bool = False,
+                            parallel: bool = True) -> Dict[str, DataSourceQuality]:
+        """
+        Run quality assessments for all data sources.
+
+        batch=True assesses every source from one scan per table (see
+        assess_sources); batch=False runs assess_source per source.
+        """
         logger.info("=" * 60)
         logger.info("ISO 8000 DATA QUALITY ASSESSMENT")
         logger.info("=" * 60)
 
         results = {}
-        for source in self.DATA_SOURCES:
-            try:
-                assessment = self.assess_source(source)
+        if batch:
+            for source, assessment in self.assess_sources(
+                    self.DATA_SOURCES, incremental=incremental, parallel=parallel).items():
                 self.save_assessment(assessment)
                 results[source] = assessment
-            except Exception as e:
-                logger.error(f"Failed to assess {source}: {e}")
+        else:
+            for source in self.DATA_SOURCES:
+                try:
+                    assessment = self.assess_source(source)
+                    self.save_assessment(assessment)
+                    results[source] = assessment
+                except Exception as e:
+                    logger.error(f"Failed to assess {source}: {e}")
 
         # Summary
         blocked = [s for s, a in results.items() if a.is_blocked]
@@ -596,12 +967,29 @@ class ISO8000QualityFramework:
 
         return results
 
+    def _cache_usability(self, assessment: DataSourceQuality):
+        with self._usable_lock:
+            self._usable[assessment.source_name] = (
+                not assessment.is_blocked,
+                time.monotonic() + self.USABILITY_TTL_SECONDS
+            )
+
     def is_source_usable(self, source: str) -> bool:
-        """Check if a source is usable for signals."""
-        if source in self._assessments:
-            return not self._assessments[source].is_blocked
-        # Run assessment if not cached
-        assessment = self.assess_source(source)
+        """
+        Check if a source is usable for signals.
+
+        Served from memory for USABILITY_TTL_SECONDS after the source was
+        last assessed. A miss assesses every known source of the same
+        table in one scan, so neighbouring lookups hit the cache too.
+        """
+        with self._usable_lock:
+            cached = self._usable.get(source)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        table = self._table_for(source)
+        sources = [s for s in self.DATA_SOURCES if self._table_for(s) == table]
+        assessment = self.assess_sources([source] + sources, parallel=False)[source]
         return not assessment.is_blocked
 
 
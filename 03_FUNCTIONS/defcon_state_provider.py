@@ -0,0 +1,320 @@
+"""
+DEFCON State Provider: Process-Wide Cached DEFCON Level
+=======================================================
+ADR Reference: ADR-016 DEFCON Protocol
+
+Keeps the current DEFCON level (fhq_governance.defcon_state, is_current)
+in memory so guarded hot paths - TradingCircuitBreaker.call,
+FINNCognitiveBrain.check_defcon, CPTOPrecisionEngine._get_current_defcon,
+StopConditionChecker.check_defcon - read it without a database round trip.
+
+Freshness:
+  - A background listener holds one autocommit connection, LISTENs on
+    DEFCON_CHANNEL (migration 365 notifies on every defcon_state change)
+    and re-reads the current row on each notification.
+  - Between notifications it re-reads every poll_interval_s, so a lost
+    notification or a missing trigger costs at most one poll interval.
+  - If no successful read happened within max_staleness_s (database down,
+    listener dead), reads FAIL CLOSED and return FAIL_CLOSED_LEVEL (or the
+    last known level if it is more severe).
+
+Usage:
+    from defcon_state_provider import get_defcon_provider
+
+    level = get_defcon_provider().get_level()   # 'GREEN', 'YELLOW', ...
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+DEFCON_CHANNEL = 'defcon_state_changed'
+
+# Numeric levels as in fhq_governance DEFCON functions (lower = more severe)
+DEFCON_LEVEL_NUMBERS = {'GREEN': 5, 'YELLOW': 3, 'ORANGE': 2, 'RED': 1, 'BLACK': 0}
+
+# Returned when the cached level is older than max_staleness_s
+FAIL_CLOSED_LEVEL = 'RED'
+
+DEFAULT_POLL_INTERVAL_S = 10.0
+DEFAULT_MAX_STALENESS_S = 30.0
+CONNECT_TIMEOUT_S = 5
+
+DB_CONFIG = {
+    'host': os.getenv('PGHOST', '127.0.0.1'),
+    'port': int(os.getenv('PGPORT', '54322')),
+    'database': os.getenv('PGDATABASE', 'postgres'),
+    'user': os.getenv('PGUSER', 'postgres'),
+    'password': os.getenv('PGPASSWORD', 'postgres')
+}
+
+
+@dataclass(frozen=True)
+class DefconSnapshot:
+    """DEFCON level as seen by this process."""
+    level: str
+    source: str                        # initial | notify | poll | fail_closed | static
+    age_s: float                       # seconds since the last successful read
+    triggered_at: Optional[datetime] = None
+    stale: bool = False
+
+    @property
+    def number(self) -> int:
+        return DEFCON_LEVEL_NUMBERS.get(self.level, DEFCON_LEVEL_NUMBERS[FAIL_CLOSED_LEVEL])
+
+    @property
+    def is_green(self) -> bool:
+        return self.level == 'GREEN'
+
+
+def fetch_current_defcon(conn) -> Tuple[str, Optional[datetime]]:
+    """
+    Read the current DEFCON level.
+
+    No current row means no active DEFCON event: GREEN. Unknown level
+    strings are treated as FAIL_CLOSED_LEVEL.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT defcon_level, triggered_at
+            FROM fhq_governance.defcon_state
+            WHERE is_current = true
+            ORDER BY triggered_at DESC
+            LIMIT 1
+        """)
+        row = cur.fetchone()
+    if not row:
+        return 'GREEN', None
+    level = str(row[0]).upper()
+    if level not in DEFCON_LEVEL_NUMBERS:
+        logger.error(f"Unknown DEFCON level {row[0]!r} - treating as {FAIL_CLOSED_LEVEL}")
+        level = FAIL_CLOSED_LEVEL
+    return level, row[1]
+
+
+class DefconStateProvider:
+    """
+    In-memory DEFCON level refreshed by LISTEN/NOTIFY plus a fallback poll.
+
+    Reads are lock-free snapshots; only the listener thread touches the
+    database. The first read starts the listener and blocks for one
+    refresh attempt, so a fresh process never serves a default level.
+    """
+
+    def __init__(
+        self,
+        db_config: Optional[Dict[str, Any]] = None,
+        channel: str = DEFCON_CHANNEL,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+        max_staleness_s: float = DEFAULT_MAX_STALENESS_S,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_staleness_s <= poll_interval_s:
+            raise ValueError("max_staleness_s must exceed poll_interval_s")
+        self.db_config = db_config or DB_CONFIG
+        self.channel = channel
+        self.poll_interval_s = poll_interval_s
+        self.max_staleness_s = max_staleness_s
+        self._clock = clock
+
+        # (level, triggered_at, source, refreshed_at), replaced atomically
+        self._state: Optional[Tuple[str, Optional[datetime], str, float]] = None
+
+        self._conn = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started = threading.Event()
+        self._start_lock = threading.Lock()
+        self._was_stale = False
+
+        self._stats = {
+            'refreshes': 0,
+            'notifications': 0,
+            'polls': 0,
+            'errors': 0,
+            'level_changes': 0,
+            'fail_closed_reads': 0
+        }
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> DefconSnapshot:
+        """Current level, or FAIL_CLOSED_LEVEL if the cache is stale."""
+        if not self._started.is_set():
+            self.start()
+        return self._read(record=True)
+
+    def _read(self, record: bool) -> DefconSnapshot:
+        state = self._state
+        age = self._clock() - state[3] if state is not None else float('inf')
+        if age > self.max_staleness_s:
+            # Failing closed never relaxes a more severe last-known level (BLACK)
+            level = FAIL_CLOSED_LEVEL
+            if state is not None and DEFCON_LEVEL_NUMBERS[state[0]] < DEFCON_LEVEL_NUMBERS[level]:
+                level = state[0]
+            if not record:
+                return DefconSnapshot(level, 'fail_closed', age, stale=True)
+            self._stats['fail_closed_reads'] += 1
+            if not self._was_stale:
+                self._was_stale = True
+                logger.error(f"DEFCON state stale (age={age:.1f}s > {self.max_staleness_s}s) - "
+                             f"failing closed to {level}")
+            return DefconSnapshot(level, 'fail_closed', age, stale=True)
+
+        level, triggered_at, source, _ = state
+        return DefconSnapshot(level, source, age, triggered_at)
+
+    def get_level(self) -> str:
+        """Current DEFCON level name (fail-closed when stale)."""
+        return self.snapshot().level
+
+    def get_stats(self) -> Dict[str, Any]:
+        snap = self._read(record=False) if self._started.is_set() else None
+        return {
+            **self._stats,
+            'level': snap.level if snap else None,
+            'source': snap.source if snap else None,
+            'age_s': round(snap.age_s, 3) if snap and snap.age_s != float('inf') else None,
+            'listening': bool(self._thread and self._thread.is_alive())
+        }
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> 'DefconStateProvider':
+        """Connect, read once and start the listener thread (idempotent)."""
+        with self._start_lock:
+            if self._started.is_set():
+                return self
+            self._stop.clear()
+            try:
+                self._connect()
+                self._refresh('initial')
+            except Exception as e:
+                self._on_error(e)
+            self._thread = threading.Thread(target=self._run, name='defcon-listener', daemon=True)
+            self._thread.start()
+            self._started.set()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the listener and close its connection."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._close()
+        self._started.clear()
+
+    # -------------------------------------------------------------------------
+    # Listener
+    # -------------------------------------------------------------------------
+
+    def _connect(self):
+        self._conn = psycopg2.connect(connect_timeout=CONNECT_TIMEOUT_S, **self.db_config)
+        self._conn.autocommit = True
+        with self._conn.cursor() as cur:
+            cur.execute(f"LISTEN {self.channel}")
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _refresh(self, source: str):
+        level, triggered_at = fetch_current_defcon(self._conn)
+        previous = self._state
+        if previous is not None and level != previous[0]:
+            self._stats['level_changes'] += 1
+            logger.warning(f"DEFCON {previous[0]} -> {level} (via {source})")
+        self._state = (level, triggered_at, source, self._clock())
+        self._stats['refreshes'] += 1
+        if self._was_stale:
+            self._was_stale = False
+            logger.info(f"DEFCON state fresh again: {level}")
+
+    def _on_error(self, error: Exception):
+        self._stats['errors'] += 1
+        logger.warning(f"DEFCON listener error: {error}")
+        self._close()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self._conn is None:
+                    self._connect()
+                    self._refresh('poll')
+
+                ready, _, _ = select.select([self._conn], [], [], self.poll_interval_s)
+                if self._stop.is_set():
+                    break
+                if ready:
+                    self._conn.poll()
+                    if self._conn.notifies:
+                        self._stats['notifications'] += len(self._conn.notifies)
+                        self._conn.notifies.clear()
+                        self._refresh('notify')
+                else:
+                    self._stats['polls'] += 1
+                    self._refresh('poll')
+            except Exception as e:
+                self._on_error(e)
+                self._stop.wait(min(self.poll_interval_s, self.max_staleness_s / 3))
+        self._close()
+
+
+class StaticDefconProvider:
+    """Fixed-level provider for dry runs, tests and benchmarks."""
+
+    def __init__(self, level: str = 'GREEN'):
+        self.level = level
+
+    def snapshot(self) -> DefconSnapshot:
+        return DefconSnapshot(self.level, 'static', 0.0)
+
+    def get_level(self) -> str:
+        return self.level
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'level': self.level, 'source': 'static'}
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_defcon_provider():
+    """Shared provider for this process (created and started on first use)."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = DefconStateProvider()
+    return _provider
+
+
+def set_defcon_provider(provider) -> None:
+    """Replace the shared provider (e.g. StaticDefconProvider for dry runs)."""
+    global _provider
+    with _provider_lock:
+        previous, _provider = _provider, provider
+    if isinstance(previous, DefconStateProvider) and previous is not provider:
+        previous.stop()
@@ -23,12 +23,16 @@ import uuid
 import signal
 import logging
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from decimal import Decimal
 import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+
+import numpy as np
+from psycopg2.extras import execute_values
 
 # Add parent directory for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -50,6 +54,7 @@ from ios021_foraging_orchestrator import get_foraging_orchestrator
 
 # Import Phase 1 Safety
 from circuit_breaker_wrapper import TradingCircuitBreaker, CircuitBreakerError, CircuitBreakerConfig
+from defcon_state_provider import get_defcon_provider
 
 # Import Supporting Components
 from kelly_position_sizer import KellyPositionSizer
@@ -203,13 +208,15 @@ except ImportError:
     TRADE_MGMT_AVAILABLE = False
     logger.warning("Trade Management System not available")
 
+LOG_FILE = 'C:/fhq-market-system/vision-ios/logs/finn_cognitive_brain.log'
+_log_handlers = [logging.StreamHandler()]
+if os.path.isdir(os.path.dirname(LOG_FILE)):
+    _log_handlers.insert(0, logging.FileHandler(LOG_FILE))
+
 logging.basicConfig(
     level=logging.INFO,
     format='[FINN-BRAIN] %(asctime)s %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('C:/fhq-market-system/vision-ios/logs/finn_cognitive_brain.log'),
-        logging.StreamHandler()
-    ]
+    handlers=_log_handlers
 )
 logger = logging.getLogger(__name__)
 
@@ -221,6 +228,27 @@ DB_CONFIG = {
     'password': os.getenv('PGPASSWORD', 'postgres')
 }
 
+# Cycle executor
+STRATEGIES = ['STATARB', 'GRID', 'VBO', 'MEANREV']
+STRATEGY_TIME_BUDGET_SEC = {
+    'STATARB': 120.0,
+    'GRID': 30.0,
+    'VBO': 120.0,
+    'MEANREV': 120.0
+}
+DEFAULT_STRATEGY_TIME_BUDGET_SEC = 60.0
+PREWARM_COMPONENTS = (
+    'statarb', 'grid', 'vbo', 'meanrev',
+    'varclus', 'causal_engine', 'causal_rl', 'strategy_bandit',
+    'foraging', 'kelly', 'cohesion',
+    'paper_adapter', 'learning_pipeline', 'trade_manager',
+    'context_retriever', 'cost_controller', 'ikea_engine',
+    'sitc_planner', 'runtime_guardian'
+)
+SIGNAL_INSERT_PAGE_SIZE = 500
+DEFAULT_PRICE = 100.0
+DEFAULT_REGIME = 'UNKNOWN'
+
 
 @dataclass
 class CognitiveState:
@@ -244,6 +272,19 @@ class CognitiveState:
             self.strategies_active = []
 
 
+class CycleTimer:
+    """Per-cycle timing breakdown: each mark() closes the stage since the previous mark."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self.timings[stage] = round(self.timings.get(stage, 0.0) + now - self._last, 4)
+        self._last = now
+
+
 class FINNCognitiveBrain:
     """
     FINN's enhanced cognitive engine integrating all Phase 1-4 components.
@@ -264,7 +305,12 @@ class FINNCognitiveBrain:
     - Budget Constraints: Track and limit daily spend
     """
 
-    def __init__(self, daily_budget_usd: Decimal = Decimal('10.00')):
+    def __init__(
+        self,
+        daily_budget_usd: Decimal = Decimal('10.00'),
+        strategies_per_cycle: int = 1,
+        strategy_budgets_sec: Optional[Dict[str, float]] = None
+    ):
         self.daily_budget = daily_budget_usd
         self.state = CognitiveState()
         self.conn = None
@@ -320,6 +366,13 @@ class FINNCognitiveBrain:
         self._kelly = None
         self._cohesion = None
 
+        # Cycle executor: strategies run on a pool, each within its time budget
+        self.strategies_per_cycle = max(1, min(strategies_per_cycle, len(STRATEGIES)))
+        self.strategy_budgets = {**STRATEGY_TIME_BUDGET_SEC, **(strategy_budgets_sec or {})}
+        self._strategy_pool: Optional[ThreadPoolExecutor] = None
+        self._strategy_futures: Dict[str, Any] = {}
+        self._prewarmed = False
+
         # Shutdown flag
         self._shutdown = False
 
@@ -330,6 +383,10 @@ class FINNCognitiveBrain:
 
     def close(self):
         """Close all connections."""
+        if self._strategy_pool:
+            # Let a worker that overran its budget finish before its engine is closed
+            self._strategy_pool.shutdown(wait=True, cancel_futures=True)
+            self._strategy_pool = None
         if self.conn:
             self.conn.close()
         # Close strategy engines
@@ -385,8 +442,9 @@ class FINNCognitiveBrain:
     @property
     def vbo(self) -> VolatilityBreakoutEngine:
         if self._vbo is None:
-            self._vbo = VolatilityBreakoutEngine()
-            self._vbo.connect()  # VBO requires explicit connect
+            vbo = VolatilityBreakoutEngine()
+            vbo.connect()  # VBO requires explicit connect
+            self._vbo = vbo
         return self._vbo
 
     @property
@@ -405,22 +463,24 @@ class FINNCognitiveBrain:
     @property
     def causal_engine(self) -> ClusterCausalEngine:
         if self._causal_engine is None:
-            self._causal_engine = ClusterCausalEngine()
-            self._causal_engine.connect()
+            causal_engine = ClusterCausalEngine()
+            causal_engine.connect()
+            self._causal_engine = causal_engine
         return self._causal_engine
 
     @property
     def causal_rl(self) -> CausalRLEngine:
         if self._causal_rl is None:
-            self._causal_rl = CausalRLEngine()
-            self._causal_rl.connect()
+            causal_rl = CausalRLEngine()
+            causal_rl.connect()
+            self._causal_rl = causal_rl
         return self._causal_rl
 
     @property
     def strategy_bandit(self) -> ThompsonBandit:
         if self._strategy_bandit is None:
             self._strategy_bandit = ThompsonBandit(
-                actions=['STATARB', 'GRID', 'VBO', 'MEANREV'],
+                actions=list(STRATEGIES),
                 name='STRATEGY_SELECT'
             )
         return self._strategy_bandit
@@ -440,31 +500,35 @@ class FINNCognitiveBrain:
     @property
     def cohesion(self) -> SignalCohesionEngine:
         if self._cohesion is None:
-            self._cohesion = SignalCohesionEngine()
-            self._cohesion.connect()
+            cohesion = SignalCohesionEngine()
+            cohesion.connect()
+            self._cohesion = cohesion
         return self._cohesion
 
     @property
     def paper_adapter(self) -> Optional['AlpacaPaperAdapter']:
         if self._paper_adapter is None and ALPACA_AVAILABLE:
-            self._paper_adapter = AlpacaPaperAdapter()
-            self._paper_adapter.connect()
+            paper_adapter = AlpacaPaperAdapter()
+            paper_adapter.connect()
+            self._paper_adapter = paper_adapter
             logger.info("Alpaca Paper Adapter initialized")
         return self._paper_adapter
 
     @property
     def learning_pipeline(self) -> Optional['LearningFeedbackPipeline']:
         if self._learning_pipeline is None and LEARNING_AVAILABLE:
-            self._learning_pipeline = LearningFeedbackPipeline()
-            self._learning_pipeline.connect()
+            learning_pipeline = LearningFeedbackPipeline()
+            learning_pipeline.connect()
+            self._learning_pipeline = learning_pipeline
             logger.info("Learning Feedback Pipeline initialized")
         return self._learning_pipeline
 
     @property
     def trade_manager(self) -> Optional['TradeManagementSystem']:
         if self._trade_manager is None and TRADE_MGMT_AVAILABLE:
-            self._trade_manager = TradeManagementSystem()
-            self._trade_manager.connect()
+            trade_manager = TradeManagementSystem()
+            trade_manager.connect()
+            self._trade_manager = trade_manager
             logger.info(f"Trade Manager initialized - Capital: ${self._trade_manager.capital_state.total_equity:,.2f}")
         return self._trade_manager
 
@@ -492,8 +556,9 @@ class FINNCognitiveBrain:
     def ikea_engine(self) -> Optional['IKEABoundaryEngine']:
         """EC-022 IKEA: Knowledge boundary classification (Mandate V)."""
         if self._ikea_engine is None and IKEA_AVAILABLE:
-            self._ikea_engine = IKEABoundaryEngine()
-            self._ikea_engine.connect()
+            ikea_engine = IKEABoundaryEngine()
+            ikea_engine.connect()
+            self._ikea_engine = ikea_engine
             logger.info("IKEA Boundary Engine initialized (EC-022)")
         return self._ikea_engine
 
@@ -511,13 +576,14 @@ class FINNCognitiveBrain:
             try:
                 # CEO-DIR-2026-DAY25: Use proper UUID format for session tracking
                 session_uuid = str(uuid.uuid4())
-                self._sitc_planner = SitCPlanner(
+                sitc_planner = SitCPlanner(
                     session_id=session_uuid
                 )
-                self._sitc_planner.connect()
+                sitc_planner.connect()
+                self._sitc_planner = sitc_planner
                 logger.info(f"SitC Planner connected (session: FINN_CYCLE_{self.state.cycle_count})")
                 logger.info(f"SitC Planner initialized (EC-020) - "
-                           f"DEFCON: {self._sitc_planner._defcon_level}")
+                           f"DEFCON: {sitc_planner._defcon_level}")
             except DEFCONViolation as e:
                 logger.warning(f"SitC blocked by DEFCON: {e}")
             except SitCEconomicViolation as e:
@@ -539,23 +605,47 @@ class FINNCognitiveBrain:
                 logger.critical("RUNTIME GUARDIAN FAILED TO INITIALIZE - ECONOMIC SAFETY COMPROMISED")
         return self._runtime_guardian
 
+    def prewarm(self, components: Tuple[str, ...] = PREWARM_COMPONENTS) -> Dict[str, Dict[str, Any]]:
+        """
+        Initialize lazy components concurrently (cold start).
+
+        Every component constructs and connects on its own worker, so the
+        cold start costs the slowest component instead of the sum. Each
+        property touches only its own attribute and sets it only after a
+        successful connect, so a component that fails is reported, left
+        unset and retried by the lazy path on first use.
+
+        Returns {component: {'status': 'ok'|'error', 'duration_sec', ['error']}}.
+        """
+        def build(name: str) -> float:
+            start = time.perf_counter()
+            getattr(self, name)
+            return time.perf_counter() - start
+
+        report = {}
+        with ThreadPoolExecutor(max_workers=max(len(components), 1),
+                                thread_name_prefix='finn-prewarm') as pool:
+            futures = {name: pool.submit(build, name) for name in components}
+            for name, future in futures.items():
+                try:
+                    report[name] = {'status': 'ok', 'duration_sec': round(future.result(), 4)}
+                except Exception as e:
+                    logger.warning(f"Prewarm of {name} failed: {e}")
+                    report[name] = {'status': 'error', 'duration_sec': None, 'error': str(e)}
+
+        self._prewarmed = True
+        failed = [name for name, entry in report.items() if entry['status'] != 'ok']
+        logger.info(f"Prewarmed {len(report) - len(failed)}/{len(report)} components"
+                    + (f" (failed: {', '.join(failed)})" if failed else ""))
+        return report
+
     # =========================================================================
     # DEFCON & SAFETY
     # =========================================================================
 
     def check_defcon(self) -> str:
-        """Check current DEFCON level."""
-        sql = """
-            SELECT current_level FROM fhq_governance.defcon_status
-            ORDER BY updated_at DESC LIMIT 1
-        """
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute(sql)
-                row = cur.fetchone()
-                return row[0] if row else 'GREEN'
-        except:
-            return 'GREEN'
+        """Check current DEFCON level (shared cache; RED if stale)."""
+        return get_defcon_provider().get_level()
 
     def check_budget(self) -> bool:
         """Check if within daily budget."""
@@ -582,9 +672,11 @@ class FINNCognitiveBrain:
         """
         Run one cognitive cycle.
 
-        Returns dict with cycle results.
+        Returns dict with cycle results, including a per-stage 'timings'
+        breakdown (seconds).
         """
         cycle_start = time.time()
+        timer = CycleTimer()
         results = {
             'cycle': self.state.cycle_count,
             'timestamp': datetime.now(timezone.utc).isoformat(),
@@ -594,23 +686,31 @@ class FINNCognitiveBrain:
             'exits_triggered': [],
             'learning_updates': 0,
             'strategy_used': None,
+            'strategies': {},
             'patch': None,
             'capital': None,
             'context': None,  # EC-020/EC-022 system context
             'cost_metrics': None,  # EC-021 InForage cost tracking
-            'duration_sec': 0
+            'duration_sec': 0,
+            'timings': timer.timings
         }
 
         try:
             # Check safety rails
             self.state.defcon_level = self.check_defcon()
-            if self.state.defcon_level in ('RED', 'ORANGE'):
+            if self.state.defcon_level in ('BLACK', 'RED', 'ORANGE'):
                 logger.warning(f"DEFCON {self.state.defcon_level} - cognitive cycle suspended")
                 return results
 
             if not self.check_budget():
                 logger.warning(f"Daily budget exceeded (${self.state.daily_cost_usd})")
                 return results
+            timer.mark('safety')
+
+            # Cold start: initialize all engines concurrently once
+            if not self._prewarmed:
+                results['prewarm'] = self.prewarm()
+                timer.mark('prewarm')
 
             # =========================================================
             # MANDATE II: RuntimeEconomicGuardian - UNBYPASSABLE
@@ -636,6 +736,7 @@ class FINNCognitiveBrain:
                 logger.critical(f"ECONOMIC SAFETY VIOLATION: {e}")
                 results['economic_violation'] = str(e)
                 return results
+            timer.mark('safety')
 
             # =========================================================
             # MANDATE V: IKEA Boundary Check
@@ -709,6 +810,7 @@ class FINNCognitiveBrain:
                     logger.error(f"SitC schema violation: {e}")
                 except Exception as e:
                     logger.warning(f"SitC planning failed: {e}")
+            timer.mark('context')
 
             # Step 0: Exit Monitoring (before generating new signals)
             # Per ADR-020: ACI monitors positions and triggers exits
@@ -726,6 +828,7 @@ class FINNCognitiveBrain:
                             self._execute_exit(exit_info)
                 except Exception as e:
                     logger.warning(f"Exit monitoring failed: {e}")
+            timer.mark('exits')
 
             # Step 1: Foraging Decision
             foraging_decision = self.foraging.decide(
@@ -741,44 +844,71 @@ class FINNCognitiveBrain:
                 self.state.time_in_patch += 0.5  # Assume 30 min per cycle
 
             results['patch'] = self.state.current_patch
+            timer.mark('foraging')
 
             # Step 2: Strategy Selection via Thompson Bandit
-            strategy = self.strategy_bandit.select_action()
+            strategies = self._select_strategies()
+            strategy = strategies[0]
             results['strategy_used'] = strategy
-            logger.info(f"Strategy selected: {strategy}")
-
-            # Step 3: Run Selected Strategy
-            signals = self._run_strategy(strategy)
+            logger.info(f"Strategies selected: {', '.join(strategies)}")
+
+            # Step 3: Run Selected Strategies (parallel, per-strategy time budget)
+            runs = self._run_strategies(strategies)
+            results['strategies'] = {
+                name: {'status': run['status'], 'signals': len(run['signals']),
+                       'duration_sec': run['duration_sec']}
+                for name, run in runs.items()
+            }
+            signals = [sig for run in runs.values() for sig in run['signals']]
             results['signals'] = [asdict(s) if hasattr(s, '__dataclass_fields__') else s for s in signals]
+            timer.mark('strategies')
 
             # Step 4: Validate Signals (Cohesion Check)
-            validated = []
-            for sig in signals:
-                canonical_id = sig.canonical_id if hasattr(sig, 'canonical_id') else sig.get('canonical_id')
-                if canonical_id and self.cohesion.check_cohesion(canonical_id):
-                    validated.append(sig)
-                    self.state.signals_validated += 1
+            validated_by_strategy = []
+            for name, run in runs.items():
+                validated = []
+                for sig in run['signals']:
+                    canonical_id = sig.canonical_id if hasattr(sig, 'canonical_id') else sig.get('canonical_id')
+                    if canonical_id and self.cohesion.check_cohesion(canonical_id):
+                        validated.append(sig)
+                        self.state.signals_validated += 1
+                validated_by_strategy.append((name, validated))
 
-            results['validated'] = [asdict(s) if hasattr(s, '__dataclass_fields__') else s for s in validated]
+                # Step 5: Update Thompson Bandit based on results
+                # (a strategy still running from an earlier cycle was not pulled)
+                if run['status'] != 'busy':
+                    reward = len(validated) / max(len(run['signals']), 1) if run['signals'] else 0
+                    self.strategy_bandit.update(name, reward)
 
-            # Step 5: Update Thompson Bandit based on results
-            reward = len(validated) / max(len(signals), 1) if signals else 0
-            self.strategy_bandit.update(strategy, reward)
+            results['validated'] = [asdict(s) if hasattr(s, '__dataclass_fields__') else s
+                                    for _, validated in validated_by_strategy for s in validated]
+            timer.mark('validation')
 
-            # Step 6: Store signals
-            self._store_signals(validated, strategy)
+            # Step 6: Store signals (one bulk insert for all strategies)
+            self._store_signal_batches(validated_by_strategy)
+            timer.mark('store')
 
             # Step 7: Paper Execution (CD-IOS015-ALPACA-PAPER-001)
-            if self._paper_execution_enabled and validated:
-                executed = self._execute_paper_orders(validated, strategy)
-                results['executed'] = executed
-                self.state.signals_executed += len(executed)
+            if self._paper_execution_enabled and results['validated']:
+                # Prices and regimes for every signal asset, once per cycle
+                prices, regimes = self._prefetch_market_state([
+                    sig.canonical_id if hasattr(sig, 'canonical_id') else sig.get('canonical_id')
+                    for _, validated in validated_by_strategy for sig in validated
+                ])
+                timer.mark('prefetch')
+                for name, validated in validated_by_strategy:
+                    if validated:
+                        executed = self._execute_paper_orders(validated, name, prices, regimes)
+                        results['executed'].extend(executed)
+                        self.state.signals_executed += len(executed)
+                timer.mark('execution')
 
             # Step 8: Process Learning Feedback
             if self.learning_pipeline:
                 learning_result = self.learning_pipeline.process_all_pending()
                 results['learning_updates'] = learning_result.get('updates', 0)
                 self.state.learning_updates_applied += results['learning_updates']
+            timer.mark('learning')
 
             self.state.signals_generated += len(signals)
             self.state.cycle_count += 1
@@ -801,6 +931,9 @@ class FINNCognitiveBrain:
             self.circuit_breaker._record_failure(e)
 
         results['duration_sec'] = time.time() - cycle_start
+        if timer.timings:
+            logger.info("Cycle timings: " + ", ".join(f"{stage}={sec:.3f}s"
+                                                      for stage, sec in timer.timings.items()))
         return results
 
     def _get_active_assets(self, limit: int = 50) -> List[str]:
@@ -816,7 +949,74 @@ class FINNCognitiveBrain:
             cur.execute(sql, (limit,))
             return [r[0] for r in cur.fetchall()]
 
-    def _run_strategy(self, strategy: str) -> List:
+    def _select_strategies(self) -> List[str]:
+        """
+        Select strategies_per_cycle distinct strategies via Thompson Sampling.
+
+        One posterior sample per arm, best first; a single strategy is the
+        bandit's own select_action().
+        """
+        bandit = self.strategy_bandit
+        if self.strategies_per_cycle == 1:
+            return [bandit.select_action()]
+        samples = {action: np.random.beta(bandit.alpha[action], bandit.beta[action])
+                   for action in bandit.actions}
+        return sorted(samples, key=samples.get, reverse=True)[:self.strategies_per_cycle]
+
+    def _run_strategies(self, strategies: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run strategies concurrently, each within its time budget.
+
+        A strategy that overruns its budget is reported as 'timeout' and its
+        signals are dropped for this cycle. Its worker cannot be interrupted,
+        so the strategy is reported as 'busy' (and not run) until the worker
+        has finished - an engine never runs twice at once.
+
+        Returns {strategy: {'status', 'signals', 'duration_sec'}} in
+        selection order.
+        """
+        if self._strategy_pool is None:
+            self._strategy_pool = ThreadPoolExecutor(max_workers=len(STRATEGIES),
+                                                     thread_name_prefix='finn-strategy')
+
+        # Asset universe is read here, on the thread that owns self.conn
+        assets = None
+        if 'MEANREV' in strategies:
+            try:
+                assets = self._get_active_assets(50)
+            except Exception as e:
+                logger.warning(f"Active asset lookup failed: {e}")
+
+        def timed_run(strategy: str) -> Tuple[List, float]:
+            start = time.perf_counter()
+            signals = self._run_strategy(strategy, assets)
+            return signals, time.perf_counter() - start
+
+        runs = {}
+        submitted = {}
+        for strategy in strategies:
+            previous = self._strategy_futures.get(strategy)
+            if previous is not None and not previous.done():
+                logger.warning(f"Strategy {strategy} still running from an earlier cycle - skipped")
+                runs[strategy] = {'status': 'busy', 'signals': [], 'duration_sec': 0.0}
+                continue
+            submitted[strategy] = time.perf_counter()
+            self._strategy_futures[strategy] = self._strategy_pool.submit(timed_run, strategy)
+            runs[strategy] = None
+
+        for strategy, start in submitted.items():
+            budget = self.strategy_budgets.get(strategy, DEFAULT_STRATEGY_TIME_BUDGET_SEC)
+            remaining = max(start + budget - time.perf_counter(), 0.0)
+            try:
+                signals, duration = self._strategy_futures[strategy].result(timeout=remaining)
+                runs[strategy] = {'status': 'ok', 'signals': signals, 'duration_sec': round(duration, 4)}
+            except FuturesTimeout:
+                logger.warning(f"Strategy {strategy} exceeded its {budget:.0f}s budget - signals dropped")
+                runs[strategy] = {'status': 'timeout', 'signals': [],
+                                  'duration_sec': round(time.perf_counter() - start, 4)}
+        return runs
+
+    def _run_strategy(self, strategy: str, assets: Optional[List[str]] = None) -> List:
         """Run the selected strategy engine."""
         try:
             if strategy == 'STATARB':
@@ -833,7 +1033,8 @@ class FINNCognitiveBrain:
                 return self.vbo.scan_universe()
             elif strategy == 'MEANREV':
                 # MeanRev needs asset list
-                assets = self._get_active_assets(50)
+                if assets is None:
+                    assets = self._get_active_assets(50)
                 return self.meanrev.scan_universe(assets)
             else:
                 logger.warning(f"Unknown strategy: {strategy}")
@@ -844,46 +1045,112 @@ class FINNCognitiveBrain:
 
     def _store_signals(self, signals: List, strategy: str):
         """Store validated signals to database."""
-        if not signals:
-            return
+        self._store_signal_batches([(strategy, signals)])
 
-        sql = """
-            INSERT INTO fhq_alpha.alpha_signals (
-                signal_id, canonical_id, signal_type, strategy_source,
-                confidence, signal_metadata, created_at
-            ) VALUES (
-                gen_random_uuid(), %s, %s, %s, %s, %s, NOW()
-            )
-            ON CONFLICT DO NOTHING
+    def _store_signal_batches(self, batches: List[Tuple[str, List]]):
         """
-        with self.conn.cursor() as cur:
+        Store validated signals of several strategies in one bulk INSERT.
+
+        A signal that cannot be converted (or JSON-encoded) is skipped with a
+        warning, as before; a failed INSERT rolls the batch back.
+        """
+        rows = []
+        for strategy, signals in batches:
             for sig in signals:
                 try:
                     canonical_id = sig.canonical_id if hasattr(sig, 'canonical_id') else sig.get('canonical_id')
                     signal_type = sig.signal_type if hasattr(sig, 'signal_type') else sig.get('signal_type')
                     confidence = sig.confidence if hasattr(sig, 'confidence') else sig.get('confidence', 0.5)
                     metadata = asdict(sig) if hasattr(sig, '__dataclass_fields__') else sig
+                    # Encode here so an unserializable signal is skipped alone
+                    # instead of failing the whole batch INSERT
+                    metadata_json = json.dumps(metadata)
 
-                    cur.execute(sql, (
+                    rows.append((
                         canonical_id,
                         signal_type,
                         f'FINN_COGNITIVE_{strategy}',
                         confidence,
-                        Json(metadata)
+                        metadata_json
                     ))
                 except Exception as e:
                     logger.warning(f"Could not store signal: {e}")
 
-        self.conn.commit()
+        if not rows:
+            return
+
+        sql = """
+            INSERT INTO fhq_alpha.alpha_signals (
+                signal_id, canonical_id, signal_type, strategy_source,
+                confidence, signal_metadata, created_at
+            ) VALUES %s
+            ON CONFLICT DO NOTHING
+        """
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, sql, rows,
+                               template="(gen_random_uuid(), %s, %s, %s, %s, %s::jsonb, NOW())",
+                               page_size=SIGNAL_INSERT_PAGE_SIZE)
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not store {len(rows)} signals: {e}")
+            self.conn.rollback()
+
+    def _prefetch_market_state(self, canonical_ids: List[str]) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        Latest price and regime for all assets in two queries.
+
+        Same rows as _get_current_price/_get_current_regime per asset;
+        assets without a row fall back to the same defaults on lookup.
+        """
+        ids = sorted({cid for cid in canonical_ids if cid})
+        prices, regimes = {}, {}
+        if not ids:
+            return prices, regimes
+
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("""
+                    SELECT DISTINCT ON (listing_id) listing_id, close
+                    FROM fhq_data.price_series
+                    WHERE listing_id = ANY(%s)
+                    ORDER BY listing_id, date DESC
+                """, (ids,))
+                prices = {row[0]: float(row[1]) for row in cur.fetchall() if row[1] is not None}
+        except Exception as e:
+            logger.warning(f"Price prefetch failed: {e}")
+
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("""
+                    SELECT DISTINCT ON (canonical_id) canonical_id, regime_label
+                    FROM fhq_perception.regime_log
+                    WHERE canonical_id = ANY(%s)
+                    ORDER BY canonical_id, created_at DESC
+                """, (ids,))
+                regimes = {row[0]: row[1] for row in cur.fetchall()}
+        except Exception as e:
+            logger.warning(f"Regime prefetch failed: {e}")
+
+        return prices, regimes
 
     # =========================================================================
     # PAPER EXECUTION (CD-IOS015-ALPACA-PAPER-001)
     # =========================================================================
 
-    def _execute_paper_orders(self, signals: List, strategy: str) -> List[Dict]:
+    def _execute_paper_orders(
+        self,
+        signals: List,
+        strategy: str,
+        prices: Optional[Dict[str, float]] = None,
+        regimes: Optional[Dict[str, str]] = None
+    ) -> List[Dict]:
         """
         Execute validated signals via Alpaca Paper Trading.
 
+        prices/regimes: prefetched lookups (_prefetch_market_state); when
+        omitted each asset is queried individually.
+
         Per Directive Section 4:
         - Full signal lineage required
         - DEFCON must be GREEN
@@ -915,17 +1182,22 @@ class FINNCognitiveBrain:
                     continue
 
                 # Get current regime
-                regime = self._get_current_regime(canonical_id)
+                if regimes is not None:
+                    regime = regimes.get(canonical_id, DEFAULT_REGIME)
+                else:
+                    regime = self._get_current_regime(canonical_id)
 
                 # Calculate Kelly position size
-                kelly_fraction = self.kelly.calculate_kelly(
-                    win_rate=0.5 + (confidence - 0.5) * 0.2,  # Adjust win rate by confidence
-                    avg_win=0.03,  # 3% average win
-                    avg_loss=0.02  # 2% average loss
+                kelly_fraction = self.kelly.kelly_formula(
+                    win_prob=0.5 + (confidence - 0.5) * 0.2,  # Adjust win rate by confidence
+                    win_loss_ratio=0.03 / 0.02  # 3% average win / 2% average loss
                 )
 
                 # Get current price
-                current_price = self._get_current_price(canonical_id)
+                if prices is not None:
+                    current_price = prices.get(canonical_id, DEFAULT_PRICE)
+                else:
+                    current_price = self._get_current_price(canonical_id)
 
                 # Calculate position size using Trade Manager (capital-aware)
                 # This respects the $200k+ capital base and 5% max position rule
@@ -1072,9 +1344,9 @@ class FINNCognitiveBrain:
                     ORDER BY created_at DESC LIMIT 1
                 """, (canonical_id,))
                 row = cur.fetchone()
-                return row[0] if row else 'UNKNOWN'
+                return row[0] if row else DEFAULT_REGIME
         except:
-            return 'UNKNOWN'
+            return DEFAULT_REGIME
 
     def _get_current_price(self, canonical_id: str) -> float:
         """Get current price for asset."""
@@ -1086,9 +1358,9 @@ class FINNCognitiveBrain:
                     ORDER BY date DESC LIMIT 1
                 """, (canonical_id,))
                 row = cur.fetchone()
-                return float(row[0]) if row else 100.0
+                return float(row[0]) if row else DEFAULT_PRICE
         except:
-            return 100.0
+            return DEFAULT_PRICE
 
     # =========================================================================
     # CAUSAL UPDATE (Periodic)
@@ -1149,6 +1421,9 @@ class FINNCognitiveBrain:
 
         self.connect()
 
+        # Cold start: initialize all engines concurrently
+        self.prewarm()
+
         # Initial causal graph build
         self.update_causal_graph()
 
@@ -1195,9 +1470,12 @@ def main():
     parser.add_argument('--budget', type=float, default=10.0, help='Daily budget USD')
     parser.add_argument('--cycles', type=int, default=None, help='Max cycles (default: infinite)')
     parser.add_argument('--single', action='store_true', help='Run single cycle and exit')
+    parser.add_argument('--strategies-per-cycle', type=int, default=1,
+                        help='Strategies run in parallel per cycle (1-4)')
     args = parser.parse_args()
 
-    brain = FINNCognitiveBrain(daily_budget_usd=Decimal(str(args.budget)))
+    brain = FINNCognitiveBrain(daily_budget_usd=Decimal(str(args.budget)),
+                               strategies_per_cycle=args.strategies_per_cycle)
 
     if args.single:
         results = brain.run_single_cycle()
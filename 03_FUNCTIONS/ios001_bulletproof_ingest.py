@@ -11,6 +11,8 @@ THIS SCRIPT WILL NOT FAIL SILENTLY.
 
 Architecture:
   Layer 1: Multi-Provider Fallback (Alpaca -> Yahoo -> Alert)
+           Calls within a provider fan out concurrently under per-provider
+           token buckets with 429/5xx adaptive backoff (provider_fanout)
   Layer 2: Verification After Every Run
   Layer 3: Multiple Trigger Points
   Layer 4: Alerting on ANY failure
@@ -29,7 +31,6 @@ import json
 import hashlib
 import uuid
 import logging
-import time
 import argparse
 import requests
 from datetime import datetime, timedelta, timezone, date
@@ -44,6 +45,11 @@ import psycopg2
 from psycopg2.extras import execute_values, RealDictCursor
 from dotenv import load_dotenv
 
+from provider_fanout import (
+    ProviderError, ProviderFanout, ProviderLimits, ProviderSkipped,
+    is_retryable_status, raise_for_status, status_of
+)
+
 # Load .env from project root (parent of 03_FUNCTIONS)
 PROJECT_ROOT = Path(__file__).parent.parent
 load_dotenv(PROJECT_ROOT / '.env')
@@ -68,18 +74,23 @@ ALPACA_SECRET_KEY = os.environ.get('ALPACA_SECRET_KEY', '') or os.environ.get('A
 TWELVEDATA_API_KEY = os.environ.get('TWELVEDATA_API_KEY', '')
 # IoS-001 Compliance: 90% of free tier = 720/day, 7/min
 TWELVEDATA_DAILY_LIMIT = 720  # 800 * 0.90
-TWELVEDATA_RATE_PER_MIN = 7   # 8 * 0.90 rounded down
-TWELVEDATA_CALL_DELAY = 60 / TWELVEDATA_RATE_PER_MIN  # ~8.6s between calls
+TWELVEDATA_RATE_PER_MIN = 7   # 8 * 0.90 rounded down (token bucket, shared FX + equity)
+TWELVEDATA_MAX_CONCURRENCY = 2
 
 # Alerting webhook (Slack/Discord)
 ALERT_WEBHOOK_URL = os.environ.get('ALERT_WEBHOOK_URL', '')
 
 # Rate limiting - Conservative
-ALPACA_BATCH_SIZE = 50  # Alpaca is generous (200/min)
-ALPACA_CALL_DELAY = 0.5  # 0.5s between calls = 120/min (safe margin)
+# Pacing is enforced by per-provider token buckets in provider_fanout
+# (429/5xx trigger adaptive backoff) instead of fixed sleeps between calls.
+ALPACA_BATCH_SIZE = 50  # Requests fetched concurrently per chunk
+ALPACA_RATE_PER_MIN = 180  # 200 * 0.90
+ALPACA_MAX_CONCURRENCY = 4
 YAHOO_BATCH_SIZE = 10   # Yahoo needs caution
 YAHOO_CALL_DELAY = 5    # 5s between calls = 12/min
-BATCH_COOLDOWN = 30     # Cooldown between batches
+BATCH_COOLDOWN = 30     # Min spacing between Yahoo batch downloads
+ECB_RATE_PER_MIN = 120  # Free API - be nice
+ECB_MAX_CONCURRENCY = 4
 
 # Staleness threshold
 STALE_THRESHOLD_DAYS = 2
@@ -156,6 +167,54 @@ def send_alert(message: str, severity: str = 'ERROR'):
             logger.warning(f"Webhook alert failed: {e}")
 
 
+# =============================================================================
+# PROVIDER FAN-OUT
+# =============================================================================
+
+_PROVIDER_FANOUT: Optional[ProviderFanout] = None
+
+
+def get_provider_fanout() -> ProviderFanout:
+    """
+    Process-wide fan-out with one gate per provider.
+
+    TwelveData FX and equity share a single gate because they share the quota.
+    Gates persist across provider layers so backoff learned in one layer
+    carries over, and run_bulletproof_ingest reports their histograms.
+    """
+    global _PROVIDER_FANOUT
+    if _PROVIDER_FANOUT is None:
+        _PROVIDER_FANOUT = ProviderFanout({
+            'ALPACA': ProviderLimits(
+                rate_per_minute=ALPACA_RATE_PER_MIN,
+                burst=ALPACA_MAX_CONCURRENCY,
+                max_concurrency=ALPACA_MAX_CONCURRENCY,
+                base_backoff_s=5.0,
+                max_backoff_s=60.0
+            ),
+            'YAHOO': ProviderLimits(
+                rate_per_minute=60 / BATCH_COOLDOWN,
+                burst=1,
+                max_concurrency=1,
+                max_retries=YAHOO_MAX_RETRIES - 1,
+                base_backoff_s=YAHOO_BASE_BACKOFF,
+                max_backoff_s=YAHOO_BASE_BACKOFF * 4
+            ),
+            'ECB': ProviderLimits(
+                rate_per_minute=ECB_RATE_PER_MIN,
+                burst=ECB_MAX_CONCURRENCY,
+                max_concurrency=ECB_MAX_CONCURRENCY
+            ),
+            'TWELVEDATA': ProviderLimits(
+                rate_per_minute=TWELVEDATA_RATE_PER_MIN,
+                burst=1,
+                max_concurrency=TWELVEDATA_MAX_CONCURRENCY,
+                max_retries=0  # Quota-protecting: stop on first 429
+            ),
+        })
+    return _PROVIDER_FANOUT
+
+
 # =============================================================================
 # DATABASE
 # =============================================================================
@@ -408,7 +467,9 @@ def try_alpaca_ingest(
     consecutive_sip_errors = 0  # Track SIP subscription errors for early termination
     MAX_SIP_ERRORS = 5  # If 5 consecutive SIP errors, skip remaining
 
-    for i, asset in enumerate(assets):
+    # Phase 1: Plan requests (DB reads stay on this thread / connection)
+    jobs = []
+    for asset in assets:
         canonical_id = asset['canonical_id']
         asset_class = asset['asset_class']
 
@@ -434,6 +495,21 @@ def try_alpaca_ingest(
                 # No data - fetch 30 days
                 start_time = datetime.now(timezone.utc) - timedelta(days=30)
                 end_time = datetime.now(timezone.utc)
+
+            # Alpaca crypto symbols don't have -USD suffix
+            symbol = canonical_id.replace('-USD', '/USD')
+            # Use hourly timeframe for intraday freshness
+            jobs.append({
+                'canonical_id': canonical_id,
+                'asset_class': asset_class,
+                'symbol_key': symbol,
+                'request': CryptoBarsRequest(
+                    symbol_or_symbols=symbol,
+                    timeframe=TimeFrame.Hour,
+                    start=start_time,
+                    end=end_time
+                )
+            })
         else:
             # CEO-DIR-2026-SITC-DATA-BLACKOUT-FIX-001: Use timestamp-based logic for EQUITY/FX
             # This fixes the date boundary bug where date-based skip caused missed data
@@ -459,88 +535,100 @@ def try_alpaca_ingest(
                 start_date = date.today() - timedelta(days=30)
                 end_date = date.today()
 
-        try:
-            if asset_class == 'CRYPTO':
-                # Alpaca crypto symbols don't have -USD suffix
-                symbol = canonical_id.replace('-USD', '/USD')
-                # Use hourly timeframe for intraday freshness
-                request = CryptoBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Hour,
-                    start=start_time,
-                    end=end_time
-                )
-                bars = crypto_client.get_crypto_bars(request)
-            elif asset_class == 'EQUITY':
-                # Skip non-US equities (Alpaca only has US)
-                if '.OL' in canonical_id or '.DE' in canonical_id or '.PA' in canonical_id:
-                    failed_assets.append(canonical_id)
-                    continue
+            if asset_class != 'EQUITY':
+                # FX - Alpaca doesn't provide FX
+                failed_assets.append(canonical_id)
+                continue
+            # Skip non-US equities (Alpaca only has US)
+            if '.OL' in canonical_id or '.DE' in canonical_id or '.PA' in canonical_id:
+                failed_assets.append(canonical_id)
+                continue
 
-                request = StockBarsRequest(
+            jobs.append({
+                'canonical_id': canonical_id,
+                'asset_class': asset_class,
+                'symbol_key': canonical_id,
+                'request': StockBarsRequest(
                     symbol_or_symbols=canonical_id,
                     timeframe=TimeFrame.Day,
                     start=datetime.combine(start_date, datetime.min.time()),
                     end=datetime.combine(end_date, datetime.max.time())
                 )
-                bars = stock_client.get_stock_bars(request)
-            else:
-                # FX - Alpaca doesn't provide FX
-                failed_assets.append(canonical_id)
-                continue
-
-            # Convert to DataFrame
-            if asset_class == 'CRYPTO':
-                symbol_key = symbol
-            else:
-                symbol_key = canonical_id
-
-            if symbol_key in bars.data and len(bars.data[symbol_key]) > 0:
-                bar_list = bars.data[symbol_key]
-                # CEO-DIR-2026-SITC: Fix OHLC to satisfy DB constraint
-                def fix_ohlc(o, h, l, c):
-                    return o, max(o, h, l, c), min(o, h, l, c), c
-
-                df = pd.DataFrame([{
-                    'timestamp': bar.timestamp,
-                    'open': bar.open,
-                    'high': fix_ohlc(bar.open, bar.high, bar.low, bar.close)[1],
-                    'low': fix_ohlc(bar.open, bar.high, bar.low, bar.close)[2],
-                    'close': bar.close,
-                    'volume': bar.volume
-                } for bar in bar_list])
-                df.set_index('timestamp', inplace=True)
-                df['adj_close'] = df['close']  # Alpaca doesn't have adj_close
-
-                rows = insert_prices_canonical(conn, canonical_id, df, batch_id, 'ALPACA', asset_class)
-                if rows > 0:
-                    results['updated'] += 1
-                    results['rows'] += rows
-                    # CEO-DIR-2026-SITC: Log latest timestamp for audit
-                    latest_ts = df.index.max() if not df.empty else None
-                    logger.info(f"  [{canonical_id}] +{rows} rows via ALPACA (latest: {latest_ts})")
-                    consecutive_sip_errors = 0  # Reset on success
-                else:
-                    logger.warning(f"  [{canonical_id}] 0 rows written despite {len(bar_list)} bars received")
-            else:
-                logger.warning(f"  [{canonical_id}] No data from Alpaca (STALE)")
-                failed_assets.append(canonical_id)
+            })
+
+    def fetch_bars(job):
+        if job['asset_class'] == 'CRYPTO':
+            return crypto_client.get_crypto_bars(job['request'])
+        return stock_client.get_stock_bars(job['request'])
+
+    # CEO-DIR-2026-SITC: Fix OHLC to satisfy DB constraint
+    def fix_ohlc(o, h, l, c):
+        return o, max(o, h, l, c), min(o, h, l, c), c
+
+    # Phase 2/3: Fetch each chunk concurrently (token bucket + adaptive backoff
+    # in the fan-out layer), then write serially in submission order
+    fanout = get_provider_fanout()
+    processed = 0
+    terminated = False
+    for chunk_start in range(0, len(jobs), ALPACA_BATCH_SIZE):
+        chunk = jobs[chunk_start:chunk_start + ALPACA_BATCH_SIZE]
+        fetched = fanout.map('ALPACA', fetch_bars, chunk)
+
+        for j, (job, bars, error) in enumerate(fetched):
+            canonical_id = job['canonical_id']
+            asset_class = job['asset_class']
+            symbol_key = job['symbol_key']
+            processed += 1
+
+            if error is None:
+                try:
+                    if symbol_key in bars.data and len(bars.data[symbol_key]) > 0:
+                        bar_list = bars.data[symbol_key]
+                        df = pd.DataFrame([{
+                            'timestamp': bar.timestamp,
+                            'open': bar.open,
+                            'high': fix_ohlc(bar.open, bar.high, bar.low, bar.close)[1],
+                            'low': fix_ohlc(bar.open, bar.high, bar.low, bar.close)[2],
+                            'close': bar.close,
+                            'volume': bar.volume
+                        } for bar in bar_list])
+                        df.set_index('timestamp', inplace=True)
+                        df['adj_close'] = df['close']  # Alpaca doesn't have adj_close
+
+                        rows = insert_prices_canonical(conn, canonical_id, df, batch_id, 'ALPACA', asset_class)
+                        if rows > 0:
+                            results['updated'] += 1
+                            results['rows'] += rows
+                            # CEO-DIR-2026-SITC: Log latest timestamp for audit
+                            latest_ts = df.index.max() if not df.empty else None
+                            logger.info(f"  [{canonical_id}] +{rows} rows via ALPACA (latest: {latest_ts})")
+                            consecutive_sip_errors = 0  # Reset on success
+                        else:
+                            logger.warning(f"  [{canonical_id}] 0 rows written despite {len(bar_list)} bars received")
+                    else:
+                        logger.warning(f"  [{canonical_id}] No data from Alpaca (STALE)")
+                        failed_assets.append(canonical_id)
+                    continue
+                except Exception as e:
+                    error = e
 
-        except Exception as e:
-            error_msg = str(e)[:200]
-            if '429' in error_msg or 'rate' in error_msg.lower():
-                logger.warning(f"  [{canonical_id}] Rate limited, waiting 60s...")
-                time.sleep(60)
+            error_msg = str(error)[:200]
+            if is_retryable_status(status_of(error)):
+                # Backoff already applied by the fan-out gate
+                logger.warning(f"  [{canonical_id}] Rate limited after retries: {error_msg[:100]}")
             elif 'subscription does not permit' in error_msg:
                 consecutive_sip_errors += 1
                 if consecutive_sip_errors >= MAX_SIP_ERRORS:
+                    remaining_jobs = chunk[j + 1:] + jobs[chunk_start + len(chunk):]
                     logger.warning(f"  [{canonical_id}] SIP subscription error ({consecutive_sip_errors} consecutive)")
                     logger.warning(f"  EARLY TERMINATION: Alpaca SIP subscription not available")
-                    logger.warning(f"  Skipping remaining {len(assets) - i - 1} Alpaca assets - will use fallback provider")
+                    logger.warning(f"  Skipping remaining {len(remaining_jobs)} Alpaca assets - will use fallback provider")
                     # Add all remaining assets to failed list
-                    remaining_assets = [a['canonical_id'] for a in assets[i:]]
-                    failed_assets.extend(remaining_assets)
+                    failed_assets.append(canonical_id)
+                    failed_assets.extend(r['canonical_id'] for r in remaining_jobs)
+                    results['errors'] += 1
                     results['status'] = 'SIP_NOT_AVAILABLE'
+                    terminated = True
                     break
                 else:
                     logger.warning(f"  [{canonical_id}] Alpaca error: {error_msg[:100]}")
@@ -550,12 +638,11 @@ def try_alpaca_ingest(
             failed_assets.append(canonical_id)
             results['errors'] += 1
 
-        # Rate limiting
-        time.sleep(ALPACA_CALL_DELAY)
+        if terminated:
+            break
 
-        # Progress update every 50 assets
-        if (i + 1) % 50 == 0:
-            logger.info(f"  Progress: {i+1}/{len(assets)} assets processed")
+        # Progress update per chunk
+        logger.info(f"  Progress: {processed}/{len(jobs)} Alpaca requests processed")
 
     if results['errors'] > len(assets) * 0.5:
         results['status'] = 'PARTIAL'
@@ -607,14 +694,15 @@ def _batch_download_with_retry(
 
     This is MUCH more efficient than individual ticker.history() calls:
     - 1 API call for 50 symbols vs 50 API calls
-    - Automatic rate limit handling by yfinance
+    - Pacing (BATCH_COOLDOWN) and exponential 429 backoff from the YAHOO
+      fan-out gate, so processing time counts toward the cooldown
     """
     import yfinance as yf
 
-    for attempt in range(max_retries):
+    def download() -> pd.DataFrame:
         try:
             # Use yf.download for batch operations - CRITICAL for rate limiting
-            df = yf.download(
+            return yf.download(
                 symbols,
                 start=start_date.strftime('%Y-%m-%d'),
                 end=(end_date + timedelta(days=1)).strftime('%Y-%m-%d'),
@@ -624,25 +712,19 @@ def _batch_download_with_retry(
                 threads=False,  # Single thread to avoid rate limit issues
                 group_by='ticker'  # Group by ticker for easier processing
             )
-            return df
-
         except Exception as e:
             error_msg = str(e)
             is_rate_limited = (
                 'YFRateLimitError' in type(e).__name__ or
                 '429' in error_msg or
                 'Too Many Requests' in error_msg or
-                'Rate limit' in error_msg.lower()
+                'rate limit' in error_msg.lower()
             )
+            if is_rate_limited:
+                raise ProviderError(f"Yahoo rate limited: {error_msg[:100]}", status_code=429) from e
+            raise
 
-            if is_rate_limited and attempt < max_retries - 1:
-                backoff = YAHOO_BASE_BACKOFF * (2 ** attempt)  # Exponential backoff
-                logger.warning(f"  Rate limited (attempt {attempt + 1}/{max_retries}), waiting {backoff}s...")
-                time.sleep(backoff)
-            else:
-                raise
-
-    return pd.DataFrame()
+    return get_provider_fanout().call('YAHOO', download, max_retries=max_retries - 1)
 
 
 def try_yahoo_ingest(
@@ -781,11 +863,6 @@ def try_yahoo_ingest(
             for sym in batch_symbols:
                 failed_assets.append(symbol_map[sym])
 
-        # Cooldown between batches
-        if i + YAHOO_BATCH_DOWNLOAD_SIZE < len(symbols):
-            logger.info(f"  Batch complete, cooling down {BATCH_COOLDOWN}s...")
-            time.sleep(BATCH_COOLDOWN)
-
     if results['errors'] > len(assets) * 0.5:
         results['status'] = 'PARTIAL'
 
@@ -829,7 +906,7 @@ def try_ecb_fx_ingest(
     """
     logger.info("=" * 60)
     logger.info("ATTEMPTING ECB FX INGEST (Backup Provider)")
-    logger.info(f"Assets: {len(assets)}, Rate limit: NONE (free API)")
+    logger.info(f"Assets: {len(assets)}, Rate limit: NONE (free API, self-paced {ECB_RATE_PER_MIN}/min)")
     logger.info("=" * 60)
 
     results = {'status': 'SUCCESS', 'updated': 0, 'rows': 0, 'errors': 0}
@@ -849,6 +926,8 @@ def try_ecb_fx_ingest(
         logger.info("  No ECB-supported FX pairs to fetch")
         return results, failed_assets
 
+    # Plan requests (DB reads stay on this thread / connection)
+    jobs = []
     for asset in ecb_assets:
         canonical_id = asset['canonical_id']
         currency, base = ECB_FX_MAP[canonical_id]
@@ -864,12 +943,28 @@ def try_ecb_fx_ingest(
             logger.debug(f"  [{canonical_id}] Up to date")
             continue
 
+        # ECB SDMX API
+        days_needed = (date.today() - start_date).days + 5  # Extra buffer
+        jobs.append({
+            'canonical_id': canonical_id,
+            'last_date': last_date,
+            'url': f"https://data-api.ecb.europa.eu/service/data/EXR/D.{currency}.EUR.SP00.A?format=jsondata&lastNObservations={days_needed}"
+        })
+
+    def fetch_ecb(job):
+        resp = requests.get(job['url'], timeout=30)
+        raise_for_status(resp, 'ECB')
+        return resp
+
+    # Fetch concurrently under the ECB gate, write serially
+    for job, resp, error in get_provider_fanout().map('ECB', fetch_ecb, jobs):
+        canonical_id = job['canonical_id']
+        last_date = job['last_date']
+
         try:
-            # ECB SDMX API
-            days_needed = (date.today() - start_date).days + 5  # Extra buffer
-            url = f"https://data-api.ecb.europa.eu/service/data/EXR/D.{currency}.EUR.SP00.A?format=jsondata&lastNObservations={days_needed}"
+            if error is not None:
+                raise error
 
-            resp = requests.get(url, timeout=30)
             if resp.status_code != 200:
                 logger.warning(f"  [{canonical_id}] ECB returned {resp.status_code}")
                 failed_assets.append(canonical_id)
@@ -924,12 +1019,125 @@ def try_ecb_fx_ingest(
             failed_assets.append(canonical_id)
             results['errors'] += 1
 
-        time.sleep(0.5)  # Be nice to ECB
-
     logger.info(f"  ECB ingest complete: {results['updated']} updated, {len(failed_assets)} failed")
     return results, failed_assets
 
 
+# =============================================================================
+# PROVIDER: TWELVEDATA (SHARED FETCH)
+# =============================================================================
+
+def _fetch_twelvedata_series(job: Dict):
+    """Fetch one TwelveData daily time_series (runs under the shared TWELVEDATA gate)."""
+    url = 'https://api.twelvedata.com/time_series'
+    params = {
+        'symbol': job['symbol'],
+        'interval': '1day',
+        'start_date': job['start_date'].strftime('%Y-%m-%d'),
+        'end_date': date.today().strftime('%Y-%m-%d'),
+        'apikey': TWELVEDATA_API_KEY
+    }
+    resp = requests.get(url, params=params, timeout=30)
+    raise_for_status(resp, 'TWELVEDATA')
+    return resp
+
+
+def _ingest_twelvedata_jobs(
+    conn,
+    jobs: List[Dict],
+    batch_id: str,
+    source: str,
+    asset_class: str,
+    results: Dict,
+    failed_assets: List[str]
+) -> None:
+    """
+    Fetch planned TwelveData jobs concurrently and write them serially.
+
+    The TWELVEDATA gate paces calls at TWELVEDATA_RATE_PER_MIN (shared quota
+    for FX and equity). The first 429 stops the fan-out so no more quota is
+    burned; unstarted jobs are marked failed.
+    """
+    fetched = get_provider_fanout().map(
+        'TWELVEDATA', _fetch_twelvedata_series, jobs, stop_on_throttle=True
+    )
+
+    for i, (job, resp, error) in enumerate(fetched):
+        canonical_id = job['canonical_id']
+
+        if isinstance(error, ProviderSkipped):
+            failed_assets.append(canonical_id)
+            continue
+        results['api_calls'] += 1
+
+        if error is not None and status_of(error) == 429:
+            logger.warning(f"  [{canonical_id}] TwelveData rate limited, stopping")
+            failed_assets.append(canonical_id)
+            results['status'] = 'RATE_LIMITED'
+            continue
+
+        try:
+            if error is not None:
+                raise error
+
+            if resp.status_code != 200:
+                logger.warning(f"  [{canonical_id}] TwelveData returned {resp.status_code}")
+                failed_assets.append(canonical_id)
+                results['errors'] += 1
+                continue
+
+            data = resp.json()
+
+            if 'values' not in data:
+                error_msg = data.get('message', 'Unknown error')
+                if 'not found' in error_msg.lower() or 'invalid' in error_msg.lower():
+                    logger.debug(f"  [{canonical_id}] Symbol not found on TwelveData")
+                else:
+                    logger.warning(f"  [{canonical_id}] TwelveData error: {error_msg}")
+                failed_assets.append(canonical_id)
+                results['errors'] += 1
+                continue
+
+            # Build DataFrame from response
+            rows = []
+            for v in data['values']:
+                try:
+                    dt = datetime.strptime(v['datetime'], '%Y-%m-%d')
+                    rows.append({
+                        'timestamp': dt,
+                        'open': float(v['open']),
+                        'high': float(v['high']),
+                        'low': float(v['low']),
+                        'close': float(v['close']),
+                        # FX doesn't have volume in TwelveData
+                        'volume': float(v.get('volume', 0)) if asset_class == 'EQUITY' else 0.0,
+                        'adj_close': float(v['close'])  # TwelveData doesn't provide adj_close
+                    })
+                except Exception as e:
+                    logger.debug(f"  [{canonical_id}] Parse error: {e}")
+                    continue
+
+            if rows:
+                df = pd.DataFrame(rows)
+                df.set_index('timestamp', inplace=True)
+                inserted = insert_prices_canonical(conn, canonical_id, df, batch_id, source, asset_class)
+                if inserted > 0:
+                    results['updated'] += 1
+                    results['rows'] += inserted
+                    logger.info(f"  [{canonical_id}] +{inserted} rows via {source}")
+            else:
+                failed_assets.append(canonical_id)
+
+        except Exception as e:
+            logger.warning(f"  [{canonical_id}] TwelveData error: {str(e)[:100]}")
+            failed_assets.append(canonical_id)
+            results['errors'] += 1
+
+        # Progress update every 50 assets
+        if (i + 1) % 50 == 0:
+            logger.info(f"  Progress: {i+1}/{len(jobs)} assets, {results['api_calls']} API calls")
+
+
 # =============================================================================
 # PROVIDER: TWELVEDATA FX (NON-EUR BACKUP)
 # =============================================================================
@@ -979,11 +1187,9 @@ def try_twelvedata_fx_ingest(
         logger.info("  No FX assets to fetch")
         return results, failed_assets
 
-    for i, asset in enumerate(fx_assets):
-        # Rate limiting at START - IoS-001 compliant (ensures ALL code paths respect rate limit)
-        if i > 0:  # Skip delay on first iteration
-            time.sleep(TWELVEDATA_CALL_DELAY)
-
+    # Plan requests (DB reads stay on this thread / connection)
+    jobs = []
+    for asset in fx_assets:
         canonical_id = asset['canonical_id']
 
         # Get last price date
@@ -1007,81 +1213,9 @@ def try_twelvedata_fx_ingest(
             failed_assets.append(canonical_id)
             continue
 
-        try:
-            url = 'https://api.twelvedata.com/time_series'
-            params = {
-                'symbol': td_symbol,
-                'interval': '1day',
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'end_date': date.today().strftime('%Y-%m-%d'),
-                'apikey': TWELVEDATA_API_KEY
-            }
-
-            resp = requests.get(url, params=params, timeout=30)
-            results['api_calls'] += 1
-
-            if resp.status_code == 429:
-                logger.warning(f"  [{canonical_id}] TwelveData rate limited, stopping")
-                for remaining_asset in fx_assets[i:]:
-                    failed_assets.append(remaining_asset['canonical_id'])
-                results['status'] = 'RATE_LIMITED'
-                break
-
-            if resp.status_code != 200:
-                logger.warning(f"  [{canonical_id}] TwelveData returned {resp.status_code}")
-                failed_assets.append(canonical_id)
-                results['errors'] += 1
-                continue
-
-            data = resp.json()
-
-            if 'values' not in data:
-                error_msg = data.get('message', 'Unknown error')
-                if 'not found' in error_msg.lower() or 'invalid' in error_msg.lower():
-                    logger.debug(f"  [{canonical_id}] Symbol not found on TwelveData")
-                else:
-                    logger.warning(f"  [{canonical_id}] TwelveData error: {error_msg}")
-                failed_assets.append(canonical_id)
-                results['errors'] += 1
-                continue
-
-            # Build DataFrame from response
-            rows = []
-            for v in data['values']:
-                try:
-                    dt = datetime.strptime(v['datetime'], '%Y-%m-%d')
-                    rows.append({
-                        'timestamp': dt,
-                        'open': float(v['open']),
-                        'high': float(v['high']),
-                        'low': float(v['low']),
-                        'close': float(v['close']),
-                        'volume': 0.0,  # FX doesn't have volume in TwelveData
-                        'adj_close': float(v['close'])
-                    })
-                except Exception as e:
-                    logger.debug(f"  [{canonical_id}] Parse error: {e}")
-                    continue
-
-            if rows:
-                df = pd.DataFrame(rows)
-                df.set_index('timestamp', inplace=True)
-                inserted = insert_prices_canonical(conn, canonical_id, df, batch_id, 'TWELVEDATA_FX', 'FX')
-                if inserted > 0:
-                    results['updated'] += 1
-                    results['rows'] += inserted
-                    logger.info(f"  [{canonical_id}] +{inserted} rows via TWELVEDATA_FX")
-            else:
-                failed_assets.append(canonical_id)
-
-        except Exception as e:
-            logger.warning(f"  [{canonical_id}] TwelveData FX error: {str(e)[:100]}")
-            failed_assets.append(canonical_id)
-            results['errors'] += 1
+        jobs.append({'canonical_id': canonical_id, 'symbol': td_symbol, 'start_date': start_date})
 
-        # Progress update every 10 assets
-        if (i + 1) % 10 == 0:
-            logger.info(f"  Progress: {i+1}/{len(fx_assets)} FX assets, {results['api_calls']} API calls")
+    _ingest_twelvedata_jobs(conn, jobs, batch_id, 'TWELVEDATA_FX', 'FX', results, failed_assets)
 
     if results['errors'] > len(fx_assets) * 0.5:
         results['status'] = 'PARTIAL'
@@ -1149,11 +1283,9 @@ def try_twelvedata_equity_ingest(
         for asset in overflow_assets:
             failed_assets.append(asset['canonical_id'])
 
-    for i, asset in enumerate(equity_assets):
-        # Rate limiting at START - IoS-001 compliant (ensures ALL code paths respect rate limit)
-        if i > 0:  # Skip delay on first iteration
-            time.sleep(TWELVEDATA_CALL_DELAY)
-
+    # Plan requests (DB reads stay on this thread / connection)
+    jobs = []
+    for asset in equity_assets:
         canonical_id = asset['canonical_id']
 
         # Get last price date
@@ -1177,82 +1309,9 @@ def try_twelvedata_equity_ingest(
         elif '.PA' in canonical_id:
             td_symbol = canonical_id.replace('.PA', ':XPAR')  # Paris
 
-        try:
-            url = 'https://api.twelvedata.com/time_series'
-            params = {
-                'symbol': td_symbol,
-                'interval': '1day',
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'end_date': date.today().strftime('%Y-%m-%d'),
-                'apikey': TWELVEDATA_API_KEY
-            }
-
-            resp = requests.get(url, params=params, timeout=30)
-            results['api_calls'] += 1
-
-            if resp.status_code == 429:
-                logger.warning(f"  [{canonical_id}] TwelveData rate limited, stopping")
-                # Stop processing to avoid burning more quota
-                for remaining_asset in equity_assets[i:]:
-                    failed_assets.append(remaining_asset['canonical_id'])
-                results['status'] = 'RATE_LIMITED'
-                break
-
-            if resp.status_code != 200:
-                logger.warning(f"  [{canonical_id}] TwelveData returned {resp.status_code}")
-                failed_assets.append(canonical_id)
-                results['errors'] += 1
-                continue
+        jobs.append({'canonical_id': canonical_id, 'symbol': td_symbol, 'start_date': start_date})
 
-            data = resp.json()
-
-            if 'values' not in data:
-                error_msg = data.get('message', 'Unknown error')
-                if 'not found' in error_msg.lower() or 'invalid' in error_msg.lower():
-                    logger.debug(f"  [{canonical_id}] Symbol not found on TwelveData")
-                else:
-                    logger.warning(f"  [{canonical_id}] TwelveData error: {error_msg}")
-                failed_assets.append(canonical_id)
-                results['errors'] += 1
-                continue
-
-            # Build DataFrame from response
-            rows = []
-            for v in data['values']:
-                try:
-                    dt = datetime.strptime(v['datetime'], '%Y-%m-%d')
-                    rows.append({
-                        'timestamp': dt,
-                        'open': float(v['open']),
-                        'high': float(v['high']),
-                        'low': float(v['low']),
-                        'close': float(v['close']),
-                        'volume': float(v.get('volume', 0)),
-                        'adj_close': float(v['close'])  # TwelveData doesn't provide adj_close
-                    })
-                except Exception as e:
-                    logger.debug(f"  [{canonical_id}] Parse error: {e}")
-                    continue
-
-            if rows:
-                df = pd.DataFrame(rows)
-                df.set_index('timestamp', inplace=True)
-                inserted = insert_prices_canonical(conn, canonical_id, df, batch_id, 'TWELVEDATA', 'EQUITY')
-                if inserted > 0:
-                    results['updated'] += 1
-                    results['rows'] += inserted
-                    logger.info(f"  [{canonical_id}] +{inserted} rows via TWELVEDATA")
-            else:
-                failed_assets.append(canonical_id)
-
-        except Exception as e:
-            logger.warning(f"  [{canonical_id}] TwelveData error: {str(e)[:100]}")
-            failed_assets.append(canonical_id)
-            results['errors'] += 1
-
-        # Progress update every 50 assets
-        if (i + 1) % 50 == 0:
-            logger.info(f"  Progress: {i+1}/{len(equity_assets)} assets, {results['api_calls']} API calls")
+    _ingest_twelvedata_jobs(conn, jobs, batch_id, 'TWELVEDATA', 'EQUITY', results, failed_assets)
 
     if results['errors'] > len(equity_assets) * 0.5:
         results['status'] = 'PARTIAL'
@@ -1552,6 +1611,8 @@ def run_bulletproof_ingest(
     results['completed_at'] = datetime.now(timezone.utc).isoformat()
     elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
     results['elapsed_seconds'] = elapsed
+    # Per-provider call counts, retries, error kinds and latency histograms
+    results['provider_stats'] = get_provider_fanout().stats()
 
     record_heartbeat(conn, results['status'], {
         'batch_id': batch_id,
@@ -1585,6 +1646,13 @@ def run_bulletproof_ingest(
     logger.info(f"Verification: {'PASSED' if is_fresh else f'FAILED ({stale_count} stale)'}")
     logger.info(f"Elapsed: {elapsed:.1f}s")
 
+    logger.info("\nProvider Latency:")
+    for provider, stats in results['provider_stats'].items():
+        if stats['calls']:
+            latency = stats['latency']
+            logger.info(f"  {provider}: {stats['calls']} calls, {stats['retries']} retries, "
+                        f"p50={latency['p50_ms']}ms p99={latency['p99_ms']}ms errors={stats['errors']}")
+
     logger.info("\nFreshness by Asset Class:")
     for cls, data in freshness_summary.items():
         logger.info(f"  {cls}: {data['fresh_assets']}/{data['total_assets']} fresh ({data['fresh_pct']}%)")
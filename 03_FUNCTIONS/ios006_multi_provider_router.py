@@ -13,14 +13,18 @@ Routing Logic:
 3. Quota Check - Filter providers at 99% daily limit
 4. Selection - Execute fetch on highest-ranking available provider
 5. Failover - On failure, retry with next provider in stack
+6. Hedging - If the selected provider exceeds its latency budget, the next
+   provider is started in parallel and the first valid response wins
 """
 
 import os
 import json
 import hashlib
 import logging
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
@@ -31,6 +35,11 @@ from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 from datetime import timezone
 
+from provider_fanout import (
+    ProviderError, ProviderFanout, ProviderLimits, is_retryable_status,
+    raise_for_status, status_of
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +56,12 @@ load_dotenv()
 
 ROUTER_LOGIC_VERSION = "1.0.0"
 
+# Fan-out: per-provider token buckets replace fixed sleeps between calls
+DEFAULT_RATE_LIMIT_PER_MINUTE = 30   # When provider_quota_state has no rate
+PROVIDER_MAX_CONCURRENCY = 2
+PROVIDER_LATENCY_BUDGET_S = 10.0     # Hedge to next provider after this
+FEATURE_FETCH_WORKERS = 4
+
 @dataclass
 class ProviderConfig:
     """Provider configuration from database."""
@@ -90,8 +105,20 @@ def get_db_connection():
 # PROVIDER IMPLEMENTATIONS
 # =============================================================================
 
+def _raise_if_throttled(exc: BaseException, provider: str) -> None:
+    """Re-raise a client-library error as ProviderError when it carries a 429/5xx."""
+    code = status_of(exc)
+    if is_retryable_status(code):
+        raise ProviderError(f"{provider} returned {code}: {str(exc)[:100]}", status_code=code) from exc
+
+
 class ProviderFetcher:
-    """Base class for provider-specific data fetchers."""
+    """
+    Base class for provider-specific data fetchers.
+
+    fetch() returns None when the provider has no data for the ticker and
+    raises ProviderError on 429/5xx, so the fan-out gate can back off.
+    """
 
     def __init__(self, provider_id: str, api_key: Optional[str] = None):
         self.provider_id = provider_id
@@ -121,6 +148,7 @@ class TwelveDataFetcher(ProviderFetcher):
             }
 
             response = requests.get(url, params=params, timeout=30)
+            raise_for_status(response, 'TWELVEDATA')
             data = response.json()
 
             if 'values' not in data:
@@ -140,6 +168,8 @@ class TwelveDataFetcher(ProviderFetcher):
             logger.info(f"TWELVEDATA | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"TwelveData fetch failed: {e}")
             return None
@@ -170,6 +200,7 @@ class FinnhubFetcher(ProviderFetcher):
             }
 
             response = requests.get(url, params=params, timeout=30)
+            raise_for_status(response, 'FINNHUB')
             data = response.json()
 
             if data.get('s') != 'ok' or 'c' not in data:
@@ -189,6 +220,8 @@ class FinnhubFetcher(ProviderFetcher):
             logger.info(f"FINNHUB | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"Finnhub fetch failed: {e}")
             return None
@@ -214,6 +247,7 @@ class AlphaVantageFetcher(ProviderFetcher):
             }
 
             response = requests.get(url, params=params, timeout=30)
+            raise_for_status(response, 'ALPHAVANTAGE')
             data = response.json()
 
             time_series_key = 'Time Series (Daily)'
@@ -237,6 +271,8 @@ class AlphaVantageFetcher(ProviderFetcher):
             logger.info(f"ALPHAVANTAGE | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"AlphaVantage fetch failed: {e}")
             return None
@@ -260,6 +296,7 @@ class FMPFetcher(ProviderFetcher):
             params = {'apikey': self.api_key}
 
             response = requests.get(url, params=params, timeout=30)
+            raise_for_status(response, 'FMP')
             data = response.json()
 
             if 'historical' not in data:
@@ -279,6 +316,8 @@ class FMPFetcher(ProviderFetcher):
             logger.info(f"FMP | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"FMP fetch failed: {e}")
             return None
@@ -291,8 +330,6 @@ class YahooFetcher(ProviderFetcher):
         try:
             import yfinance as yf
 
-            time.sleep(2)  # Rate limiting
-
             # Use auto_adjust=False to avoid column issues with new yfinance
             data = yf.download(ticker, period='max', progress=False, timeout=30, auto_adjust=False)
 
@@ -325,7 +362,10 @@ class YahooFetcher(ProviderFetcher):
             logger.info(f"YAHOO | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
+            _raise_if_throttled(e, 'YAHOO')
             logger.error(f"Yahoo fetch failed: {e}")
             return None
 
@@ -345,6 +385,7 @@ class CBOEFetcher(ProviderFetcher):
                 return None
 
             response = requests.get(url, timeout=30)
+            raise_for_status(response, 'CBOE')
 
             if response.status_code != 200:
                 logger.error(f"CBOE returned status {response.status_code}")
@@ -377,6 +418,8 @@ class CBOEFetcher(ProviderFetcher):
             logger.info(f"CBOE | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
             logger.error(f"CBOE fetch failed: {e}")
             return None
@@ -418,7 +461,10 @@ class FREDFetcher(ProviderFetcher):
             except ImportError:
                 return self._fred_fallback(ticker, feature_id)
 
+        except ProviderError:
+            raise
         except Exception as e:
+            _raise_if_throttled(e, 'FRED')
             logger.error(f"FRED fetch failed: {e}")
             return None
 
@@ -449,7 +495,10 @@ class FREDFetcher(ProviderFetcher):
             logger.info(f"FRED (fallback) | {feature_id} ({ticker}): {len(df)} observations")
             return df
 
+        except ProviderError:
+            raise
         except Exception as e:
+            _raise_if_throttled(e, 'FRED')
             logger.error(f"FRED fallback failed: {e}")
             return None
 
@@ -486,6 +535,10 @@ class MultiProviderRouter:
         self.conn = get_db_connection()
         self.router_logic_hash = self._compute_router_hash()
         self.fetch_results: List[FetchResult] = []
+        self.fanout = ProviderFanout(max_workers=FEATURE_FETCH_WORKERS * PROVIDER_MAX_CONCURRENCY)
+        # Connection is shared by concurrent fetch_feature calls
+        self._db_lock = threading.Lock()
+        self._results_lock = threading.Lock()
 
     def _compute_router_hash(self) -> str:
         """Compute hash of routing logic for ADR-011 lineage."""
@@ -494,7 +547,7 @@ class MultiProviderRouter:
 
     def get_providers_for_feature(self, feature_id: str) -> List[Dict]:
         """Get ranked list of providers for a feature."""
-        with self.conn.cursor() as cur:
+        with self._db_lock, self.conn.cursor() as cur:
             cur.execute("""
                 SELECT
                     pqs.provider_id,
@@ -536,7 +589,7 @@ class MultiProviderRouter:
 
     def record_usage(self, provider_id: str, success: bool, response_time_ms: int = None):
         """Record provider usage in database."""
-        with self.conn.cursor() as cur:
+        with self._db_lock, self.conn.cursor() as cur:
             if success:
                 cur.execute("""
                     UPDATE fhq_macro.provider_quota_state
@@ -557,13 +610,29 @@ class MultiProviderRouter:
                         updated_at = NOW()
                     WHERE provider_id = %s
                 """, (provider_id,))
-        self.conn.commit()
+            self.conn.commit()
+
+    def _limits_for(self, provider: Dict) -> ProviderLimits:
+        """Fan-out limits for a provider, from provider_quota_state."""
+        return ProviderLimits(
+            rate_per_minute=provider.get('rate_limit_per_minute') or DEFAULT_RATE_LIMIT_PER_MINUTE,
+            burst=1,
+            max_concurrency=PROVIDER_MAX_CONCURRENCY,
+            latency_budget_s=PROVIDER_LATENCY_BUDGET_S,
+            max_retries=0
+        )
 
     def fetch_feature(self, feature_id: str, max_retries: int = 5) -> FetchResult:
         """
         Fetch data for a feature using multi-provider routing.
 
-        Returns FetchResult with data from the highest-priority available provider.
+        Providers are tried in preference order through the shared fan-out:
+        a failure fails over immediately, and a provider slower than
+        PROVIDER_LATENCY_BUDGET_S is hedged with the next one. Each provider
+        is paced by its own token bucket (rate_limit_per_minute).
+
+        Returns FetchResult with data from the highest-priority provider that
+        answered first.
         """
         providers = self.get_providers_for_feature(feature_id)
 
@@ -580,29 +649,14 @@ class MultiProviderRouter:
 
         logger.info(f"ROUTER | {feature_id}: {len(providers)} providers available")
 
-        excluded_providers = []
-        failover_count = 0
-
-        for attempt in range(max_retries):
-            # Filter providers
-            available = [
-                p for p in providers
-                if p['provider_id'] not in excluded_providers
-                and p['used_today'] < (p['daily_limit'] * 0.99)
-                and (p['cooldown_until'] is None or p['cooldown_until'] < datetime.now(timezone.utc))
-            ]
-
-            if not available:
-                logger.warning(f"ROUTER | {feature_id}: All providers exhausted or at quota")
-                break
-
-            # Select top provider
-            provider = available[0]
+        # Filter providers (quota, cooldown, API key, fetcher)
+        attempts = []
+        for provider in providers:
             provider_id = provider['provider_id']
-            ticker = provider['ticker_symbol']
-
-            logger.info(f"ROUTER | {feature_id}: Trying {provider_id} (pref={provider['preference_rank']}, "
-                       f"used={provider['used_today']}/{provider['daily_limit']})")
+            if provider['used_today'] >= (provider['daily_limit'] * 0.99):
+                continue
+            if provider['cooldown_until'] is not None and provider['cooldown_until'] >= datetime.now(timezone.utc):
+                continue
 
             # Get API key if required
             api_key = None
@@ -611,58 +665,61 @@ class MultiProviderRouter:
                 api_key = os.getenv(provider['api_key_env_var'])
                 if not api_key:
                     logger.warning(f"ROUTER | {feature_id}: {provider_id} API key not set, skipping")
-                    excluded_providers.append(provider_id)
                     continue
             elif not requires_key:
                 # Provider doesn't require API key (e.g., Yahoo, CBOE public feeds)
                 logger.info(f"ROUTER | {feature_id}: {provider_id} (no API key required)")
 
-            # Create fetcher
             fetcher_class = PROVIDER_FETCHERS.get(provider_id)
             if not fetcher_class:
                 logger.warning(f"ROUTER | {feature_id}: No fetcher for {provider_id}")
-                excluded_providers.append(provider_id)
                 continue
 
-            # Execute fetch
-            start_time = time.time()
-            try:
-                fetcher = fetcher_class(provider_id, api_key)
-                data = fetcher.fetch(ticker, feature_id)
-                response_time_ms = int((time.time() - start_time) * 1000)
-
-                if data is not None and len(data) > 0:
-                    self.record_usage(provider_id, success=True, response_time_ms=response_time_ms)
-
-                    result = FetchResult(
-                        success=True,
-                        provider_id=provider_id,
-                        data=data,
-                        error=None,
-                        response_time_ms=response_time_ms,
-                        failover_count=failover_count
-                    )
-                    self.fetch_results.append(result)
-
-                    logger.info(f"ROUTER | {feature_id}: SUCCESS via {provider_id} "
-                               f"({len(data)} obs, {response_time_ms}ms, failovers={failover_count})")
-                    return result
-
-                else:
-                    logger.warning(f"ROUTER | {feature_id}: {provider_id} returned empty data")
-                    self.record_usage(provider_id, success=False)
-                    excluded_providers.append(provider_id)
-                    failover_count += 1
-
-            except Exception as e:
-                response_time_ms = int((time.time() - start_time) * 1000)
-                logger.error(f"ROUTER | {feature_id}: {provider_id} failed - {e}")
-                self.record_usage(provider_id, success=False)
-                excluded_providers.append(provider_id)
-                failover_count += 1
-
-            # Add delay between retries
-            time.sleep(1)
+            self.fanout.ensure_gate(provider_id, self._limits_for(provider))
+            fetcher = fetcher_class(provider_id, api_key)
+            attempts.append((provider_id, partial(fetcher.fetch, provider['ticker_symbol'], feature_id)))
+
+            if len(attempts) >= max_retries:
+                break
+
+        if not attempts:
+            logger.warning(f"ROUTER | {feature_id}: All providers exhausted or at quota")
+            return FetchResult(
+                success=False,
+                provider_id='NONE',
+                data=None,
+                error=f'All {len(providers)} providers exhausted or at quota',
+                response_time_ms=0,
+                failover_count=0
+            )
+
+        logger.info(f"ROUTER | {feature_id}: Routing {' -> '.join(p for p, _ in attempts)}")
+
+        hedged = self.fanout.hedged(attempts, accept=lambda data: data is not None and len(data) > 0)
+
+        # Record outcomes for every provider that answered (abandoned hedges are not penalised)
+        for provider_id, error in hedged.errors.items():
+            logger.warning(f"ROUTER | {feature_id}: {provider_id} failed - {error}")
+            self.record_usage(provider_id, success=False)
+        failover_count = len(hedged.errors)
+
+        if hedged.success:
+            self.record_usage(hedged.provider, success=True, response_time_ms=hedged.elapsed_ms)
+            result = FetchResult(
+                success=True,
+                provider_id=hedged.provider,
+                data=hedged.value,
+                error=None,
+                response_time_ms=hedged.elapsed_ms,
+                failover_count=failover_count
+            )
+            with self._results_lock:
+                self.fetch_results.append(result)
+
+            logger.info(f"ROUTER | {feature_id}: SUCCESS via {hedged.provider} "
+                       f"({len(hedged.value)} obs, {hedged.elapsed_ms}ms, failovers={failover_count}"
+                       f"{', hedged' if hedged.hedged else ''})")
+            return result
 
         # All attempts failed
         return FetchResult(
@@ -670,10 +727,23 @@ class MultiProviderRouter:
             provider_id='NONE',
             data=None,
             error=f'All {len(providers)} providers failed after {failover_count} failovers',
-            response_time_ms=0,
+            response_time_ms=hedged.elapsed_ms,
             failover_count=failover_count
         )
 
+    def fetch_features(self, feature_ids: List[str], max_retries: int = 5) -> Dict[str, FetchResult]:
+        """Fetch several features concurrently; provider gates enforce rate limits."""
+        with ThreadPoolExecutor(max_workers=FEATURE_FETCH_WORKERS) as pool:
+            futures = {
+                feature_id: pool.submit(self.fetch_feature, feature_id, max_retries)
+                for feature_id in feature_ids
+            }
+            return {feature_id: future.result() for feature_id, future in futures.items()}
+
+    def provider_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider call counts, error kinds and latency histograms."""
+        return self.fanout.stats()
+
     def save_to_staging(self, feature_id: str, result: FetchResult):
         """Save fetched data to raw_staging with router lineage."""
         if not result.success or result.data is None:
@@ -715,7 +785,8 @@ class MultiProviderRouter:
         logger.info(f"RAW_STAGING | {feature_id}: {len(records)} records saved via {result.provider_id}")
 
     def close(self):
-        """Close database connection."""
+        """Close database connection and fan-out workers."""
+        self.fanout.close()
         self.conn.close()
 
 
@@ -767,8 +838,7 @@ def run_g2_5_recovery():
         logger.info("PHASE 1: PRIMARY FEATURES")
         logger.info("-" * 50)
 
-        for feature_id in pending_features:
-            result = router.fetch_feature(feature_id)
+        for feature_id, result in router.fetch_features(pending_features).items():
             results[feature_id] = result
 
             if result.success:
@@ -776,15 +846,12 @@ def run_g2_5_recovery():
             else:
                 logger.warning(f"FAILED | {feature_id}: {result.error}")
 
-            time.sleep(2)  # Rate limiting between features
-
         # Phase 2: Fetch supporting features
         logger.info("\n" + "-" * 50)
         logger.info("PHASE 2: SUPPORTING FEATURES")
         logger.info("-" * 50)
 
-        for feature_id in supporting_features:
-            result = router.fetch_feature(feature_id)
+        for feature_id, result in router.fetch_features(supporting_features).items():
             results[feature_id] = result
 
             if result.success:
@@ -792,8 +859,6 @@ def run_g2_5_recovery():
             else:
                 logger.warning(f"FAILED | {feature_id}: {result.error}")
 
-            time.sleep(2)
-
         # Generate summary
         successful = [f for f, r in results.items() if r.success]
         failed = [f for f, r in results.items() if not r.success]
@@ -810,6 +875,11 @@ def run_g2_5_recovery():
         if failed:
             logger.info(f"Still Pending: {', '.join(failed)}")
 
+        for provider_id, stats in router.provider_stats().items():
+            latency = stats['latency']
+            logger.info(f"PROVIDER | {provider_id}: {stats['calls']} calls, "
+                        f"p50={latency['p50_ms']}ms p99={latency['p99_ms']}ms errors={stats['errors']}")
+
         return results
 
     finally:
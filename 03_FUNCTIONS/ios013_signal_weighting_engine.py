@@ -16,6 +16,12 @@ Implements 5-factor signal weighting methodology per IoS-013 spec:
 Populates fhq_signal_context.weighted_signal_plan daily.
 Logs conflicts to signal_conflict_registry.
 
+run_daily_weighting uses compute_signal_weights_batch: regimes, forecast
+skill, causal linkage and upcoming events are prefetched for the whole
+active signal set in five queries, redundancy is counted in one grouped
+pass, and plans/conflicts are written with multi-row inserts. The result
+equals calling compute_signal_weights per signal.
+
 Authority: CEO, LARS (Strategy), STIG (Technical)
 Employment Contract: EC-003
 """
@@ -24,11 +30,13 @@ import os
 import json
 import hashlib
 import logging
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
+import numpy as np
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from dotenv import load_dotenv
 
 # Load environment
@@ -158,6 +166,19 @@ class IoS013SignalWeightingEngine:
         ('GOLDEN_NEEDLE', 'BEARISH'): 0.7,
     }
 
+    # Signal type -> strategy model scoped in forecast_skill_metrics
+    SIGNAL_TO_MODEL = {
+        'MOMENTUM_UP': 'STRAT_DAY_V1',
+        'MOMENTUM_DOWN': 'STRAT_DAY_V1',
+        'MEAN_REVERSION': 'STRAT_HOUR_V1',
+        'VOLATILITY_BREAKOUT': 'STRAT_SEC_V1',
+        'MACRO_ALIGNED': 'STRAT_WEEK_V1',
+        'GOLDEN_NEEDLE': 'STRAT_WEEK_V1',  # Golden Needles are weekly signals
+        'REGIME_EDGE': 'STRAT_DAY_V1',
+        'TIMING': 'STRAT_HOUR_V1',
+        'VOLATILITY': 'STRAT_SEC_V1',
+    }
+
     def __init__(self):
         self.conn = None
         self.conflicts: List[SignalConflict] = []
@@ -214,19 +235,7 @@ class IoS013SignalWeightingEngine:
         Lower Brier = higher skill. Map to 0.1-1.0 weight.
         Uses fhq_research.forecast_skill_metrics with MODEL scope.
         """
-        # Map signal types to strategy models
-        signal_to_model = {
-            'MOMENTUM_UP': 'STRAT_DAY_V1',
-            'MOMENTUM_DOWN': 'STRAT_DAY_V1',
-            'MEAN_REVERSION': 'STRAT_HOUR_V1',
-            'VOLATILITY_BREAKOUT': 'STRAT_SEC_V1',
-            'MACRO_ALIGNED': 'STRAT_WEEK_V1',
-            'GOLDEN_NEEDLE': 'STRAT_WEEK_V1',  # Golden Needles are weekly signals
-            'REGIME_EDGE': 'STRAT_DAY_V1',
-            'TIMING': 'STRAT_HOUR_V1',
-            'VOLATILITY': 'STRAT_SEC_V1',
-        }
-        model = signal_to_model.get(signal_type, 'STRAT_DAY_V1')
+        model = self.SIGNAL_TO_MODEL.get(signal_type, 'STRAT_DAY_V1')
 
         with self.conn.cursor() as cur:
             try:
@@ -241,11 +250,7 @@ class IoS013SignalWeightingEngine:
                 row = cur.fetchone()
 
                 if row and row[0] is not None:
-                    brier_score = float(row[0])
-                    # Map Brier score (0=perfect, 0.25=random) to weight
-                    # 0 -> 1.0, 0.25 -> 0.1
-                    skill_weight = max(0.1, 1.0 - (brier_score * 3.6))
-                    return round(skill_weight, 3)
+                    return self._brier_to_skill(row[0])
 
                 # Fallback to GLOBAL scope
                 cur.execute("""
@@ -258,15 +263,24 @@ class IoS013SignalWeightingEngine:
                 row = cur.fetchone()
 
                 if row and row[0] is not None:
-                    brier_score = float(row[0])
-                    skill_weight = max(0.1, 1.0 - (brier_score * 3.6))
-                    return round(skill_weight, 3)
+                    return self._brier_to_skill(row[0])
 
             except Exception as e:
                 logger.warning(f"Could not get forecast skill for {signal_type}: {e}")
 
         return 0.5  # Default neutral weight
 
+    @staticmethod
+    def _brier_to_skill(brier_score) -> float:
+        """Map Brier score (0=perfect, 0.25=random) to weight: 0 -> 1.0, 0.25 -> 0.1"""
+        skill_weight = max(0.1, 1.0 - (float(brier_score) * 3.6))
+        return round(skill_weight, 3)
+
+    @staticmethod
+    def _asset_class_for(asset_id: str) -> str:
+        """asset_class matched in ontology_path_weights (besides EQUITY)"""
+        return asset_id[:3] if len(asset_id) > 3 else 'EQUITY'
+
     def get_causal_linkage(self, signal_type: str, asset_id: str) -> float:
         """
         Get causal linkage strength from ontology.
@@ -282,20 +296,23 @@ class IoS013SignalWeightingEngine:
                     AND (asset_class = %s OR asset_class = 'EQUITY')
                     ORDER BY updated_at DESC
                     LIMIT 1
-                """, (signal_type, asset_id[:3] if len(asset_id) > 3 else 'EQUITY'))
+                """, (signal_type, self._asset_class_for(asset_id)))
                 row = cur.fetchone()
 
                 if row and row[0] is not None:
-                    # path_weight typically 0-1, map to 0.3-1.2
-                    raw_weight = float(row[0])
-                    causal_weight = 0.3 + (raw_weight * 0.9)
-                    return round(min(1.2, causal_weight), 3)
+                    return self._path_weight_to_causal(row[0])
 
             except Exception as e:
                 logger.warning(f"Could not get causal linkage: {e}")
 
         return 0.5  # Default neutral
 
+    @staticmethod
+    def _path_weight_to_causal(path_weight) -> float:
+        """path_weight typically 0-1, map to 0.3-1.2"""
+        causal_weight = 0.3 + (float(path_weight) * 0.9)
+        return round(min(1.2, causal_weight), 3)
+
     def calculate_redundancy_penalty(
         self,
         signal_id: str,
@@ -321,6 +338,10 @@ class IoS013SignalWeightingEngine:
             )
         )
 
+        return self._redundancy_from_count(same_direction_count)
+
+    @staticmethod
+    def _redundancy_from_count(same_direction_count: int) -> float:
         if same_direction_count == 0:
             return 0.0
 
@@ -349,20 +370,25 @@ class IoS013SignalWeightingEngine:
                 row = cur.fetchone()
 
                 if row and row[2] is not None:
-                    impact = float(row[2])
-                    # High impact events = larger penalty
-                    if impact >= 0.8:
-                        return -0.3
-                    elif impact >= 0.5:
-                        return -0.2
-                    elif impact >= 0.3:
-                        return -0.1
+                    return self._impact_to_penalty(row[2])
 
             except Exception as e:
                 logger.warning(f"Could not check event proximity: {e}")
 
         return 0.0
 
+    @staticmethod
+    def _impact_to_penalty(impact_score) -> float:
+        """High impact events = larger penalty"""
+        impact = float(impact_score)
+        if impact >= 0.8:
+            return -0.3
+        elif impact >= 0.5:
+            return -0.2
+        elif impact >= 0.3:
+            return -0.1
+        return 0.0
+
     def compute_signal_weights(
         self,
         signal: Dict,
@@ -375,13 +401,6 @@ class IoS013SignalWeightingEngine:
         # Get current regime
         regime, regime_conf = self.get_current_regime(asset_id)
 
-        # Factor 1: Regime alignment
-        alignment_key = (signal_type, regime)
-        regime_alignment = self.REGIME_ALIGNMENT_MATRIX.get(
-            alignment_key,
-            0.5  # Default if not in matrix
-        )
-
         # Factor 2: Forecast skill
         forecast_skill = self.get_forecast_skill(signal_type, asset_id)
 
@@ -396,6 +415,30 @@ class IoS013SignalWeightingEngine:
         # Factor 5: Event proximity penalty
         event_penalty = self.calculate_event_proximity_penalty(asset_id)
 
+        return self._build_weighted_signal(
+            signal, regime, forecast_skill, causal_linkage, redundancy_penalty, event_penalty
+        )
+
+    def _build_weighted_signal(
+        self,
+        signal: Dict,
+        regime: str,
+        forecast_skill: float,
+        causal_linkage: float,
+        redundancy_penalty: float,
+        event_penalty: float,
+        weighted_confidence: Optional[float] = None
+    ) -> WeightedSignal:
+        """Assemble a WeightedSignal from its five factors."""
+        signal_type = signal.get('signal_type', 'UNKNOWN')
+
+        # Factor 1: Regime alignment
+        alignment_key = (signal_type, regime)
+        regime_alignment = self.REGIME_ALIGNMENT_MATRIX.get(
+            alignment_key,
+            0.5  # Default if not in matrix
+        )
+
         # Build weight factors
         factors = SignalWeightFactors(
             regime_alignment=regime_alignment,
@@ -407,7 +450,8 @@ class IoS013SignalWeightingEngine:
 
         # Compute weighted confidence
         raw_confidence = float(signal.get('confidence', 0.5))
-        weighted_confidence = raw_confidence * factors.composite_weight
+        if weighted_confidence is None:
+            weighted_confidence = raw_confidence * factors.composite_weight
 
         # Build explanation
         explanation = (
@@ -419,7 +463,7 @@ class IoS013SignalWeightingEngine:
 
         return WeightedSignal(
             signal_id=signal['signal_id'],
-            asset_id=asset_id,
+            asset_id=signal['asset_id'],
             signal_type=signal_type,
             direction=signal.get('direction', 'NEUTRAL'),
             raw_confidence=raw_confidence,
@@ -429,6 +473,196 @@ class IoS013SignalWeightingEngine:
             explanation=explanation
         )
 
+    # =========================================================================
+    # BATCH WEIGHTING
+    # =========================================================================
+
+    def _prefetch(self, description: str, sql: str, params: Tuple) -> List[Dict]:
+        """Run one prefetch query; on failure log, roll back and return no rows."""
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(sql, params)
+                return cur.fetchall()
+        except Exception as e:
+            logger.warning(f"Could not prefetch {description}: {e}")
+            self.conn.rollback()
+            return []
+
+    def prefetch_regimes(self, asset_ids: List[str]) -> Dict[str, str]:
+        """get_current_regime for many assets: latest prediction, else global regime."""
+        rows = self._prefetch('regimes', """
+            SELECT DISTINCT ON (listing_id) listing_id, regime_label, confidence
+            FROM fhq_research.regime_predictions
+            WHERE listing_id = ANY(%s)
+            ORDER BY listing_id, created_at DESC
+        """, (list(asset_ids),))
+        regimes = {r['listing_id']: r['regime_label'] for r in rows if r.get('regime_label')}
+
+        if len(regimes) < len(set(asset_ids)):
+            rows = self._prefetch('global regime', """
+                SELECT current_regime, 0.7 as confidence
+                FROM fhq_research.global_regime_state
+                ORDER BY updated_at DESC
+                LIMIT 1
+            """, ())
+            fallback = rows[0]['current_regime'] if rows and rows[0].get('current_regime') else 'NEUTRAL'
+            for asset_id in asset_ids:
+                regimes.setdefault(asset_id, fallback)
+
+        return regimes
+
+    def prefetch_forecast_skill(self, signal_types: List[str]) -> Dict[str, float]:
+        """get_forecast_skill for many signal types: MODEL scope, else GLOBAL."""
+        models = {st: self.SIGNAL_TO_MODEL.get(st, 'STRAT_DAY_V1') for st in signal_types}
+        rows = self._prefetch('forecast skill', """
+            SELECT DISTINCT ON (metric_scope, scope_value)
+                   metric_scope, scope_value, brier_score_mean
+            FROM fhq_research.forecast_skill_metrics
+            WHERE (metric_scope = 'MODEL' AND scope_value = ANY(%s))
+               OR (metric_scope = 'GLOBAL' AND scope_value = 'ALL_ASSETS')
+            ORDER BY metric_scope, scope_value, computed_at DESC
+        """, (sorted(set(models.values())),))
+        latest = {(r['metric_scope'], r['scope_value']): r['brier_score_mean'] for r in rows}
+
+        global_brier = latest.get(('GLOBAL', 'ALL_ASSETS'))
+        skill = {}
+        for signal_type, model in models.items():
+            brier = latest.get(('MODEL', model))
+            if brier is None:
+                brier = global_brier
+            skill[signal_type] = self._brier_to_skill(brier) if brier is not None else 0.5
+        return skill
+
+    def prefetch_causal_linkage(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """
+        get_causal_linkage for many (signal_type, asset_class) keys.
+
+        Fetches the latest row per (signal_type, asset_class); each key then
+        takes the newer of its own asset_class row and the EQUITY row.
+        """
+        rows = self._prefetch('causal linkage', """
+            SELECT DISTINCT ON (signal_type, asset_class)
+                   signal_type, asset_class, path_weight, updated_at
+            FROM fhq_research.ontology_path_weights
+            WHERE signal_type = ANY(%s)
+              AND (asset_class = ANY(%s) OR asset_class = 'EQUITY')
+            ORDER BY signal_type, asset_class, updated_at DESC
+        """, (sorted({k[0] for k in keys}), sorted({k[1] for k in keys})))
+        latest = {(r['signal_type'], r['asset_class']): r for r in rows}
+
+        linkage = {}
+        for signal_type, asset_class in keys:
+            candidates = [latest[(signal_type, c)] for c in dict.fromkeys([asset_class, 'EQUITY'])
+                          if (signal_type, c) in latest]
+            row = max(candidates, key=lambda r: r['updated_at']) if candidates else None
+            if row and row['path_weight'] is not None:
+                linkage[(signal_type, asset_class)] = self._path_weight_to_causal(row['path_weight'])
+            else:
+                linkage[(signal_type, asset_class)] = 0.5
+        return linkage
+
+    def prefetch_event_penalties(self, asset_ids: List[str]) -> Dict[str, float]:
+        """
+        calculate_event_proximity_penalty for many assets.
+
+        The per-asset query takes the top impact_score among the asset's and
+        GLOBAL events (DESC, so NULL sorts first and means no penalty).
+        """
+        rows = self._prefetch('event proximity', """
+            SELECT DISTINCT ON (asset_id) asset_id, impact_score
+            FROM fhq_calendar.market_events
+            WHERE asset_id = ANY(%s)
+            AND event_date BETWEEN CURRENT_DATE AND CURRENT_DATE + INTERVAL '3 days'
+            ORDER BY asset_id, impact_score DESC
+        """, (sorted(set(asset_ids) | {'GLOBAL'}),))
+        top = {r['asset_id']: r['impact_score'] for r in rows}
+
+        penalties = {}
+        for asset_id in asset_ids:
+            impacts = [top[a] for a in dict.fromkeys([asset_id, 'GLOBAL']) if a in top]
+            if not impacts or any(i is None for i in impacts):
+                penalties[asset_id] = 0.0
+            else:
+                penalties[asset_id] = self._impact_to_penalty(max(float(i) for i in impacts))
+        return penalties
+
+    def redundancy_penalties(self, signals: List[Dict]) -> List[float]:
+        """calculate_redundancy_penalty for every signal in one grouped pass."""
+        if len(signals) <= 1:
+            return [0.0] * len(signals)
+
+        first_direction = {}
+        for s in signals:
+            first_direction.setdefault(s.get('signal_id'), s.get('direction'))
+
+        by_direction = Counter((s.get('asset_id'), s.get('direction')) for s in signals)
+        by_signal = Counter((s.get('asset_id'), s.get('direction'), s.get('signal_id')) for s in signals)
+
+        penalties = []
+        for s in signals:
+            asset_id, signal_id = s.get('asset_id'), s.get('signal_id')
+            direction = first_direction[signal_id]
+            count = by_direction[(asset_id, direction)] - by_signal[(asset_id, direction, signal_id)]
+            penalties.append(self._redundancy_from_count(count))
+        return penalties
+
+    def compute_signal_weights_batch(self, signals: List[Dict]) -> List[WeightedSignal]:
+        """
+        Weight a whole signal set; equal to compute_signal_weights(s, signals)
+        for each s, with factors prefetched in five queries.
+
+        Signals that cannot be weighted are logged and skipped, as in
+        run_daily_weighting's per-signal loop.
+        """
+        # Redundancy counts over the full set, as compute_signal_weights does
+        all_redundancy = self.redundancy_penalties(signals)
+
+        usable, raw, redundancy = [], [], []
+        for signal, penalty in zip(signals, all_redundancy):
+            if 'signal_id' not in signal or 'asset_id' not in signal:
+                logger.error(f"Failed to weight signal {signal.get('signal_id')}: missing signal_id/asset_id")
+                continue
+            try:
+                raw.append(float(signal.get('confidence', 0.5)))
+                usable.append(signal)
+                redundancy.append(penalty)
+            except Exception as e:
+                logger.error(f"Failed to weight signal {signal.get('signal_id')}: {e}")
+        if not usable:
+            return []
+
+        asset_ids = list(dict.fromkeys(s['asset_id'] for s in usable))
+        types = [s.get('signal_type', 'UNKNOWN') for s in usable]
+        linkage_keys = [
+            (t, self._asset_class_for(s['asset_id'])) if isinstance(s['asset_id'], str) else None
+            for t, s in zip(types, usable)
+        ]
+
+        regimes = self.prefetch_regimes(asset_ids)
+        skill = self.prefetch_forecast_skill(list(dict.fromkeys(types)))
+        linkage = self.prefetch_causal_linkage([k for k in dict.fromkeys(linkage_keys) if k is not None])
+        events = self.prefetch_event_penalties(asset_ids)
+
+        # Factor arrays, one entry per signal
+        regime_list = [regimes.get(s['asset_id'], 'NEUTRAL') for s in usable]
+        alignment = np.array([self.REGIME_ALIGNMENT_MATRIX.get((t, r), 0.5) for t, r in zip(types, regime_list)])
+        forecast = np.array([skill[t] for t in types])
+        causal = np.array([linkage[k] if k is not None else 0.5 for k in linkage_keys])
+        redundancy_arr = np.array(redundancy, dtype=float)
+        event = np.array([events[s['asset_id']] for s in usable])
+
+        # SignalWeightFactors.composite_weight, vectorized
+        composite = np.clip(alignment * forecast * causal + (redundancy_arr + event), 0.1, 1.0)
+        weighted = np.array(raw) * composite
+
+        return [
+            self._build_weighted_signal(
+                signal, regime_list[i], float(forecast[i]), float(causal[i]),
+                float(redundancy_arr[i]), float(event[i]), float(weighted[i])
+            )
+            for i, signal in enumerate(usable)
+        ]
+
     def detect_conflicts(
         self,
         weighted_signals: List[WeightedSignal]
@@ -478,17 +712,19 @@ class IoS013SignalWeightingEngine:
         resolved = []
         suppressed_ids = set()
 
+        # Group once by asset instead of rescanning per conflict
+        asset_signals: Dict[str, List[WeightedSignal]] = {}
+        for ws in weighted_signals:
+            asset_signals.setdefault(ws.asset_id, []).append(ws)
+
         # Mark suppressed signals from conflicts
         for conflict in conflicts:
             if conflict.resolution == 'HIGHEST_WEIGHT':
                 # Keep only highest weight signal for conflicted asset
-                asset_signals = [
-                    ws for ws in weighted_signals
-                    if ws.asset_id == conflict.asset_id
-                ]
-                if asset_signals:
-                    winner = max(asset_signals, key=lambda s: s.weighted_confidence)
-                    for s in asset_signals:
+                signals = asset_signals.get(conflict.asset_id, [])
+                if signals:
+                    winner = max(signals, key=lambda s: s.weighted_confidence)
+                    for s in signals:
                         if s.signal_id != winner.signal_id:
                             suppressed_ids.add(s.signal_id)
 
@@ -499,106 +735,161 @@ class IoS013SignalWeightingEngine:
 
         return resolved
 
+    PLAN_INSERT_SQL = """
+        INSERT INTO fhq_signal_context.weighted_signal_plan (
+            plan_id, asset_id, computation_date, regime_context,
+            regime_confidence, raw_signals, weighted_signals,
+            confidence_score, explainability_trace, semantic_conflicts,
+            input_hashes, lineage_hash, computed_by, ios_version, created_at
+        ) VALUES %s
+        ON CONFLICT (asset_id, computation_date) DO UPDATE SET
+            regime_context = EXCLUDED.regime_context,
+            weighted_signals = EXCLUDED.weighted_signals,
+            confidence_score = EXCLUDED.confidence_score,
+            explainability_trace = EXCLUDED.explainability_trace,
+            lineage_hash = EXCLUDED.lineage_hash,
+            created_at = NOW()
+    """
+    PLAN_ROW_TEMPLATE = "(gen_random_uuid(), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
+
+    def _plan_row(self, ws: WeightedSignal, plan_date, conflict_ids: List[str]) -> Tuple:
+        """Parameters for one weighted_signal_plan row (see PLAN_ROW_TEMPLATE)."""
+        # Build input hashes for lineage
+        input_hashes = {
+            'signal_id': ws.signal_id,
+            'regime': ws.regime_context,
+            'weight_factors': asdict(ws.weight_factors)
+        }
+        lineage_hash = hashlib.sha256(
+            json.dumps(input_hashes, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+        return (
+            ws.asset_id,
+            plan_date,
+            ws.regime_context,
+            ws.weight_factors.regime_alignment,
+            Json({'signal_id': ws.signal_id, 'raw_confidence': ws.raw_confidence}),
+            Json({
+                'weighted_confidence': ws.weighted_confidence,
+                'direction': ws.direction,
+                'factors': asdict(ws.weight_factors)
+            }),
+            ws.weighted_confidence,
+            ws.explanation,
+            conflict_ids,
+            Json(input_hashes),
+            lineage_hash,
+            'EC-003',
+            self._version
+        )
+
+    # Columns overwritten by ON CONFLICT DO UPDATE (indices into _plan_row)
+    _PLAN_UPDATE_COLUMNS = (2, 5, 6, 7, 10)
+
     def save_weighted_plan(
         self,
         weighted_signals: List[WeightedSignal],
         conflicts: List[SignalConflict]
     ) -> str:
-        """Save weighted signal plan to database."""
+        """
+        Save weighted signal plan to database (one multi-row upsert).
+
+        A multi-row upsert may not touch the same (asset_id, date) twice, so
+        signals for the same asset are merged into one row the way
+        sequential upserts would leave it: inserted columns from the first
+        signal, updated columns from the last. If the batch fails, rows are
+        retried one by one so a single bad row does not drop the plan.
+        """
         plan_date = datetime.now(timezone.utc).date()
 
-        for ws in weighted_signals:
+        conflict_ids: Dict[str, List[str]] = {}
+        for c in conflicts:
+            conflict_ids.setdefault(c.asset_id, []).append(c.conflict_id)
+
+        rows = [self._plan_row(ws, plan_date, conflict_ids.get(ws.asset_id, []))
+                for ws in weighted_signals]
+
+        merged: Dict[str, List] = {}
+        for row in rows:
+            if row[0] not in merged:
+                merged[row[0]] = list(row)
+            else:
+                for i in self._PLAN_UPDATE_COLUMNS:
+                    merged[row[0]][i] = row[i]
+
+        if merged:
             try:
                 with self.conn.cursor() as cur:
-                    # Build input hashes for lineage
-                    input_hashes = {
-                        'signal_id': ws.signal_id,
-                        'regime': ws.regime_context,
-                        'weight_factors': asdict(ws.weight_factors)
-                    }
-                    lineage_hash = hashlib.sha256(
-                        json.dumps(input_hashes, sort_keys=True).encode()
-                    ).hexdigest()[:16]
-
-                    cur.execute("""
-                        INSERT INTO fhq_signal_context.weighted_signal_plan (
-                            plan_id, asset_id, computation_date, regime_context,
-                            regime_confidence, raw_signals, weighted_signals,
-                            confidence_score, explainability_trace, semantic_conflicts,
-                            input_hashes, lineage_hash, computed_by, ios_version, created_at
-                        ) VALUES (
-                            gen_random_uuid(), %s, %s, %s,
-                            %s, %s, %s,
-                            %s, %s, %s,
-                            %s, %s, %s, %s, NOW()
-                        )
-                        ON CONFLICT (asset_id, computation_date) DO UPDATE SET
-                            regime_context = EXCLUDED.regime_context,
-                            weighted_signals = EXCLUDED.weighted_signals,
-                            confidence_score = EXCLUDED.confidence_score,
-                            explainability_trace = EXCLUDED.explainability_trace,
-                            lineage_hash = EXCLUDED.lineage_hash,
-                            created_at = NOW()
-                    """, (
-                        ws.asset_id,
-                        plan_date,
-                        ws.regime_context,
-                        ws.weight_factors.regime_alignment,
-                        Json({'signal_id': ws.signal_id, 'raw_confidence': ws.raw_confidence}),
-                        Json({
-                            'weighted_confidence': ws.weighted_confidence,
-                            'direction': ws.direction,
-                            'factors': asdict(ws.weight_factors)
-                        }),
-                        ws.weighted_confidence,
-                        ws.explanation,
-                        [c.conflict_id for c in conflicts if ws.asset_id == c.asset_id],
-                        Json(input_hashes),
-                        lineage_hash,
-                        'EC-003',
-                        self._version
-                    ))
-
+                    execute_values(cur, self.PLAN_INSERT_SQL, [tuple(r) for r in merged.values()],
+                                   template=self.PLAN_ROW_TEMPLATE, page_size=len(merged))
                 self.conn.commit()
-
             except Exception as e:
-                logger.error(f"Failed to save weighted plan for {ws.asset_id}: {e}")
+                logger.warning(f"Bulk plan save failed ({e}) - retrying per signal")
                 self.conn.rollback()
+                self._save_plan_rows(rows)
 
         # Save conflicts to registry
-        for conflict in conflicts:
-            self._save_conflict(conflict)
+        self._save_conflicts(conflicts)
 
         logger.info(f"Saved {len(weighted_signals)} weighted signals, {len(conflicts)} conflicts")
         return str(plan_date)
 
+    def _save_plan_rows(self, rows: List[Tuple]):
+        """Per-row fallback for save_weighted_plan."""
+        for row in rows:
+            try:
+                with self.conn.cursor() as cur:
+                    execute_values(cur, self.PLAN_INSERT_SQL, [row], template=self.PLAN_ROW_TEMPLATE)
+                self.conn.commit()
+            except Exception as e:
+                logger.error(f"Failed to save weighted plan for {row[0]}: {e}")
+                self.conn.rollback()
+
+    CONFLICT_INSERT_SQL = """
+        INSERT INTO fhq_signal_context.signal_conflict_registry (
+            conflict_id, asset_id, conflicting_signals, conflict_type,
+            resolution, resolved_direction, detected_at
+        ) VALUES %s
+        ON CONFLICT (conflict_id) DO NOTHING
+    """
+    CONFLICT_ROW_TEMPLATE = "(%s, %s, %s, %s, %s, %s, NOW())"
+
+    @staticmethod
+    def _conflict_row(conflict: SignalConflict) -> Tuple:
+        return (
+            conflict.conflict_id,
+            conflict.asset_id,
+            conflict.conflicting_signals,
+            conflict.conflict_type,
+            conflict.resolution,
+            conflict.resolved_direction
+        )
+
     def _save_conflict(self, conflict: SignalConflict):
         """Save conflict to registry."""
+        self._save_conflicts([conflict])
+
+    def _save_conflicts(self, conflicts: List[SignalConflict]):
+        """Save conflicts to registry (one multi-row insert)."""
+        if not conflicts:
+            return
         try:
             with self.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO fhq_signal_context.signal_conflict_registry (
-                        conflict_id, asset_id, conflicting_signals, conflict_type,
-                        resolution, resolved_direction, detected_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, NOW())
-                    ON CONFLICT (conflict_id) DO NOTHING
-                """, (
-                    conflict.conflict_id,
-                    conflict.asset_id,
-                    conflict.conflicting_signals,
-                    conflict.conflict_type,
-                    conflict.resolution,
-                    conflict.resolved_direction
-                ))
+                execute_values(cur, self.CONFLICT_INSERT_SQL,
+                               [self._conflict_row(c) for c in conflicts],
+                               template=self.CONFLICT_ROW_TEMPLATE, page_size=len(conflicts))
             self.conn.commit()
         except Exception as e:
-            logger.warning(f"Failed to save conflict: {e}")
+            logger.warning(f"Failed to save conflicts: {e}")
             self.conn.rollback()
 
-    def run_daily_weighting(self) -> Dict[str, Any]:
+    def run_daily_weighting(self, batch: bool = True) -> Dict[str, Any]:
         """
         Execute daily signal weighting pipeline.
 
+        batch=False weights signals one at a time (about 4 queries each).
+
         Returns summary of weighted signals and conflicts.
         """
         logger.info("=" * 60)
@@ -613,15 +904,18 @@ class IoS013SignalWeightingEngine:
             logger.warning("No active signals to process")
             return {'status': 'NO_SIGNALS', 'weighted_count': 0, 'conflict_count': 0}
 
-        # Step 2: Compute weights for each signal
-        weighted_signals = []
-        for signal in signals:
-            try:
-                ws = self.compute_signal_weights(signal, signals)
-                weighted_signals.append(ws)
-                logger.info(f"Weighted {ws.asset_id}: {ws.raw_confidence:.2f} -> {ws.weighted_confidence:.2f}")
-            except Exception as e:
-                logger.error(f"Failed to weight signal {signal.get('signal_id')}: {e}")
+        # Step 2: Compute weights for all signals
+        if batch:
+            weighted_signals = self.compute_signal_weights_batch(signals)
+        else:
+            weighted_signals = []
+            for signal in signals:
+                try:
+                    weighted_signals.append(self.compute_signal_weights(signal, signals))
+                except Exception as e:
+                    logger.error(f"Failed to weight signal {signal.get('signal_id')}: {e}")
+        for ws in weighted_signals:
+            logger.info(f"Weighted {ws.asset_id}: {ws.raw_confidence:.2f} -> {ws.weighted_confidence:.2f}")
 
         # Step 3: Detect conflicts
         conflicts = self.detect_conflicts(weighted_signals)
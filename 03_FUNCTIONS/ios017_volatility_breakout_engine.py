@@ -6,6 +6,12 @@ STIG-2025-001 Phase 2 Component
 Detects Bollinger Band squeezes inside Keltner Channels
 and generates breakout signals with causal driver amplification.
 
+scan_universe runs as a panel scan: the lookback window of every active
+asset (and of their causal parents) is loaded in one query into
+bar-aligned wide frames, BB/KC/momentum are computed with rolling
+operations over all columns at once, and causal parents come from one
+ranked edge query. Results are identical to scan_asset per asset.
+
 Authority: ADR-020 (ACI), IoS-017
 """
 
@@ -62,6 +68,10 @@ class VolatilityBreakoutEngine:
     - If causal parent already broke out, amplify signal confidence
     """
 
+    PRICE_LOOKBACK = 100   # bars loaded per asset
+    PARENT_LOOKBACK = 20   # bars used to test a causal parent for breakout
+    MAX_PARENTS = 3
+
     def __init__(self, bb_period: int = 20, bb_std: float = 2.0,
                  kc_period: int = 20, kc_atr_mult: float = 1.5):
         self.bb_period = bb_period
@@ -144,17 +154,28 @@ class VolatilityBreakoutEngine:
         bb_width = (bb_upper - bb_lower) / bb_mid
         kc_width = (kc_upper - kc_lower) / kc_mid
 
+        return self._squeeze_state(
+            bb_upper.to_numpy(), bb_lower.to_numpy(), kc_upper.to_numpy(), kc_lower.to_numpy(),
+            bb_width.to_numpy(), kc_width.to_numpy(), momentum.to_numpy()
+        )
+
+    @staticmethod
+    def _squeeze_state(bb_upper: np.ndarray, bb_lower: np.ndarray,
+                       kc_upper: np.ndarray, kc_lower: np.ndarray,
+                       bb_width: np.ndarray, kc_width: np.ndarray,
+                       momentum: np.ndarray) -> Dict:
+        """Squeeze state from the last two bars of the indicator arrays."""
         # Squeeze: BB inside KC
-        squeeze_on = (bb_lower.iloc[-1] > kc_lower.iloc[-1]) and \
-                     (bb_upper.iloc[-1] < kc_upper.iloc[-1])
+        squeeze_on = (bb_lower[-1] > kc_lower[-1]) and \
+                     (bb_upper[-1] < kc_upper[-1])
 
         # Was in squeeze before?
-        squeeze_prev = (bb_lower.iloc[-2] > kc_lower.iloc[-2]) and \
-                       (bb_upper.iloc[-2] < kc_upper.iloc[-2]) if len(df) > 1 else False
+        squeeze_prev = (bb_lower[-2] > kc_lower[-2]) and \
+                       (bb_upper[-2] < kc_upper[-2]) if len(bb_lower) > 1 else False
 
         # Squeeze intensity
-        if kc_width.iloc[-1] > 0:
-            intensity = max(0, 1 - (bb_width.iloc[-1] / kc_width.iloc[-1]))
+        if kc_width[-1] > 0:
+            intensity = max(0, 1 - (bb_width[-1] / kc_width[-1]))
         else:
             intensity = 0
 
@@ -166,10 +187,10 @@ class VolatilityBreakoutEngine:
             'squeeze_prev': squeeze_prev,
             'breakout': breakout,
             'intensity': intensity,
-            'bb_width': bb_width.iloc[-1],
-            'kc_width': kc_width.iloc[-1],
-            'momentum': momentum.iloc[-1],
-            'momentum_direction': 'UP' if momentum.iloc[-1] > 0 else 'DOWN'
+            'bb_width': bb_width[-1],
+            'kc_width': kc_width[-1],
+            'momentum': momentum[-1],
+            'momentum_direction': 'UP' if momentum[-1] > 0 else 'DOWN'
         }
 
     def get_causal_bonus(self, canonical_id: str) -> float:
@@ -185,11 +206,11 @@ class VolatilityBreakoutEngine:
               AND edge_type = 'CAUSAL_PARENT'
               AND is_active = true
             ORDER BY edge_weight DESC
-            LIMIT 3
+            LIMIT %s
         """
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql, (canonical_id,))
+                cur.execute(sql, (canonical_id, self.MAX_PARENTS))
                 parents = cur.fetchall()
         except:
             return 1.0
@@ -198,20 +219,27 @@ class VolatilityBreakoutEngine:
             return 1.0
 
         # Check if any parent broke out recently
+        breakouts = {}
+        for parent in parents:
+            parent_df = self.get_price_data(parent['source_id'], self.PARENT_LOOKBACK)
+            if parent_df is not None and len(parent_df) >= self.PARENT_LOOKBACK:
+                breakouts[parent['source_id']] = self.detect_squeeze(parent_df)['breakout']
+
+        return self._bonus_from_parents(parents, breakouts)
+
+    @staticmethod
+    def _bonus_from_parents(parents: List[Dict], breakouts: Dict[str, bool]) -> float:
         bonus = 1.0
         for parent in parents:
-            parent_df = self.get_price_data(parent['source_id'], 20)
-            if parent_df is not None and len(parent_df) >= 20:
-                parent_squeeze = self.detect_squeeze(parent_df)
-                if parent_squeeze['breakout']:
-                    # Parent broke out - amplify
-                    bonus += 0.15 * parent['edge_weight']
+            if breakouts.get(parent['source_id']):
+                # Parent broke out - amplify
+                bonus += 0.15 * parent['edge_weight']
 
         return min(bonus, 1.5)  # Cap at 50% bonus
 
     def scan_asset(self, canonical_id: str) -> Optional[SqueezeSignal]:
         """Scan single asset for squeeze breakout."""
-        df = self.get_price_data(canonical_id)
+        df = self.get_price_data(canonical_id, self.PRICE_LOOKBACK)
         if df is None or len(df) < self.bb_period + 5:
             return None
 
@@ -224,6 +252,9 @@ class VolatilityBreakoutEngine:
         # Get causal amplification
         causal_bonus = self.get_causal_bonus(canonical_id)
 
+        return self._build_signal(canonical_id, squeeze, causal_bonus)
+
+    def _build_signal(self, canonical_id: str, squeeze: Dict, causal_bonus: float) -> SqueezeSignal:
         # Signal type based on momentum direction
         signal_type = f"SQUEEZE_{squeeze['momentum_direction']}"
 
@@ -244,8 +275,12 @@ class VolatilityBreakoutEngine:
             timestamp=datetime.now(timezone.utc)
         )
 
-    def scan_universe(self) -> List[SqueezeSignal]:
-        """Scan all active assets for squeeze breakouts."""
+    # =========================================================================
+    # PANEL SCAN
+    # =========================================================================
+
+    def get_active_assets(self) -> List[str]:
+        """Active assets with usable history."""
         sql = """
             SELECT canonical_id FROM fhq_meta.assets
             WHERE active_flag = true
@@ -253,7 +288,171 @@ class VolatilityBreakoutEngine:
         """
         with self.conn.cursor() as cur:
             cur.execute(sql)
-            assets = [r[0] for r in cur.fetchall()]
+            return [r[0] for r in cur.fetchall()]
+
+    def get_price_panel(self, canonical_ids: List[str],
+                        lookback: int = PRICE_LOOKBACK) -> Tuple[Dict[str, pd.DataFrame], pd.Series]:
+        """
+        Last `lookback` daily bars of many assets in one query.
+
+        Returns ({'high','low','close'} -> (lookback x n) frame, bar counts).
+        Frames are aligned by bar position, not date: row -1 is each
+        asset's latest bar, and shorter histories are NaN-padded at the top.
+        This is the same window get_price_data returns per asset.
+        """
+        sql = """
+            SELECT listing_id, rn, high::float8 AS high, low::float8 AS low, close::float8 AS close
+            FROM (
+                SELECT listing_id, high, low, close,
+                       ROW_NUMBER() OVER (PARTITION BY listing_id ORDER BY date DESC) AS rn
+                FROM fhq_data.price_series
+                WHERE listing_id = ANY(%s) AND resolution = '1d'
+            ) recent
+            WHERE rn <= %s
+        """
+        ids = list(dict.fromkeys(canonical_ids))
+        column = {cid: j for j, cid in enumerate(ids)}
+        values = {f: np.full((lookback, len(ids)), np.nan) for f in ('high', 'low', 'close')}
+        counts = np.zeros(len(ids), dtype=int)
+
+        with self.conn.cursor() as cur:
+            cur.execute(sql, (ids, lookback))
+            rows = cur.fetchall()
+
+        for listing_id, rn, high, low, close in rows:
+            j = column[listing_id]
+            i = lookback - rn
+            values['high'][i, j] = high
+            values['low'][i, j] = low
+            values['close'][i, j] = close
+            counts[j] += 1
+
+        frames = {f: pd.DataFrame(v, columns=ids) for f, v in values.items()}
+        return frames, pd.Series(counts, index=ids)
+
+    def get_causal_parents_panel(self, canonical_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Top causal parents for many assets in one ranked query."""
+        sql = """
+            SELECT target_id, source_id, edge_weight
+            FROM (
+                SELECT target_id, source_id, edge_weight,
+                       ROW_NUMBER() OVER (PARTITION BY target_id ORDER BY edge_weight DESC) AS rn
+                FROM fhq_alpha.causal_edges
+                WHERE target_id = ANY(%s)
+                  AND edge_type = 'CAUSAL_PARENT'
+                  AND is_active = true
+            ) ranked
+            WHERE rn <= %s
+            ORDER BY target_id, rn
+        """
+        parents: Dict[str, List[Dict]] = {}
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(sql, (list(canonical_ids), self.MAX_PARENTS))
+                for r in cur.fetchall():
+                    parents.setdefault(r['target_id'], []).append(
+                        {'source_id': r['source_id'], 'edge_weight': r['edge_weight']}
+                    )
+        except Exception as e:
+            # Same fallback as get_causal_bonus: no amplification
+            logger.warning(f"Causal parent lookup failed: {e}")
+            self.conn.rollback()
+        return parents
+
+    def detect_squeeze_panel(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """
+        detect_squeeze for every column of bar-aligned high/low/close frames.
+
+        Rolling, EWM and shift operate column-wise, so each column gets the
+        same values as detect_squeeze on that asset's own frame.
+        """
+        high, low, close = frames['high'], frames['low'], frames['close']
+
+        bb_upper, bb_mid, bb_lower = self.calculate_bollinger_bands(close)
+
+        ema = close.ewm(span=self.kc_period, adjust=False).mean()
+        prev_close = close.shift(1)
+        # max(axis=1) over (H-L, |H-C1|, |L-C1|) skipping NaN, per column
+        tr = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+        atr = tr.rolling(self.kc_period).mean()
+        kc_upper = ema + (self.kc_atr_mult * atr)
+        kc_lower = ema - (self.kc_atr_mult * atr)
+        kc_mid = ema
+
+        momentum = self.calculate_momentum(close)
+        bb_width = (bb_upper - bb_lower) / bb_mid
+        kc_width = (kc_upper - kc_lower) / kc_mid
+
+        # Only the last two bars matter
+        tail = [x.to_numpy()[-2:] for x in (bb_upper, bb_lower, kc_upper, kc_lower,
+                                             bb_width, kc_width, momentum)]
+        return {
+            cid: self._squeeze_state(*(t[:, j] for t in tail))
+            for j, cid in enumerate(close.columns)
+        }
+
+    def scan_universe_panel(self, assets: Optional[List[str]] = None) -> List[SqueezeSignal]:
+        """
+        Panel scan: scan_asset for every asset with three queries in total
+        (active assets, causal parents, price panel).
+        """
+        if assets is None:
+            assets = self.get_active_assets()
+        assets = list(dict.fromkeys(assets))
+        if not assets:
+            return []
+
+        parents = self.get_causal_parents_panel(assets)
+        parent_ids = [p['source_id'] for ps in parents.values() for p in ps]
+        frames, counts = self.get_price_panel(assets + parent_ids, self.PRICE_LOOKBACK)
+
+        # Assets: full lookback window, enough bars for the indicators
+        eligible = [a for a in assets if counts[a] >= self.bb_period + 5]
+        squeezes = self.detect_squeeze_panel({f: df[eligible] for f, df in frames.items()})
+        breakouts = [a for a in eligible if squeezes[a]['breakout']]
+
+        # Parents: last PARENT_LOOKBACK bars, as get_causal_bonus loads them
+        needed = list(dict.fromkeys(
+            p['source_id'] for a in breakouts for p in parents.get(a, [])
+            if counts[p['source_id']] >= self.PARENT_LOOKBACK
+        ))
+        parent_breakouts = {}
+        if needed:
+            window = {f: df[needed].iloc[-self.PARENT_LOOKBACK:].reset_index(drop=True)
+                      for f, df in frames.items()}
+            parent_breakouts = {
+                pid: state['breakout'] for pid, state in self.detect_squeeze_panel(window).items()
+            }
+
+        signals = []
+        for asset in breakouts:
+            asset_parents = parents.get(asset, [])
+            causal_bonus = self._bonus_from_parents(asset_parents, parent_breakouts) if asset_parents else 1.0
+            signals.append(self._build_signal(asset, squeezes[asset], causal_bonus))
+        return signals
+
+    def scan_universe(self, panel: bool = True) -> List[SqueezeSignal]:
+        """
+        Scan all active assets for squeeze breakouts.
+
+        panel=False scans asset by asset (two or more queries per asset).
+        """
+        if panel:
+            try:
+                signals = self.scan_universe_panel()
+            except Exception as e:
+                logger.error(f"Panel scan failed: {e}")
+                try:
+                    self.conn.rollback()
+                except Exception:
+                    pass
+                return []
+            for signal in signals:
+                logger.info(f"SQUEEZE BREAKOUT: {signal.canonical_id} {signal.signal_type} "
+                            f"conf={signal.confidence:.2f} causal_bonus={signal.causal_bonus:.2f}")
+            return signals
+
+        assets = self.get_active_assets()
 
         signals = []
         for asset in assets:
@@ -16,18 +16,26 @@ Strategy:
     3. Probabilistic sizing via Kelly Criterion
     4. Regime-aware entry (low ADX favorable)
 
+Panel mode (default for scan_universe / get_extreme_rsi_assets):
+    All requested assets are loaded into one newest-first PricePanel with a
+    single query; RSI, ATR and confluence are computed across the panel with
+    array operations and signals are logged with one batched INSERT.
+    With incremental=True a panel kept from the previous scan is advanced
+    with only the newest bar per asset.
+
 Usage:
     from ios018_mean_reversion_engine import MeanReversionEngine
 
     engine = MeanReversionEngine()
     signals = engine.scan_universe(['AAPL', 'MSFT', 'GOOGL'])
+    signals = engine.scan_universe(['AAPL', 'MSFT', 'GOOGL'], incremental=True)
 """
 
 import os
 import json
 import numpy as np
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -101,6 +109,31 @@ class MeanRevSignal:
     generated_at: datetime
 
 
+@dataclass
+class PricePanel:
+    """
+    Newest-first price windows for many assets.
+
+    Row i belongs to assets[i]; column k is the asset's (k+1)-th most recent
+    bar, i.e. the order _get_prices returns. Rows with fewer bars than
+    columns are NaN-padded on the right.
+    """
+    assets: List[str]
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    counts: np.ndarray
+    latest: List[Optional[datetime]]    # timestamp of column 0
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return {a: i for i, a in enumerate(self.assets)}
+
+    @property
+    def days(self) -> int:
+        return self.close.shape[1]
+
+
 class MeanReversionEngine:
     """
     Mean Reversion Engine (STIG-2025-001)
@@ -123,11 +156,26 @@ class MeanReversionEngine:
     STOP_LOSS_ATR_MULT = 2.0
     TAKE_PROFIT_ATR_MULT = 3.0
 
-    def __init__(self, capital: float = None):
-        self.conn = psycopg2.connect(**DB_CONFIG)
+    # Bars behind calculate_rsi_data (RSI) and generate_signal (ATR, entry)
+    RSI_DAYS = 100
+    ATR_DAYS = 30
+    MIN_RSI_BARS = 20
+
+    SIGNAL_INSERT_SQL = """
+        INSERT INTO fhq_alpha.meanrev_signals
+        (asset_id, signal_type, rsi_daily, rsi_4h, confluence,
+         confidence, kelly_fraction, position_size, entry_price,
+         stop_loss, take_profit, regime_favorable, generated_at)
+        VALUES %s
+        ON CONFLICT DO NOTHING
+    """
+
+    def __init__(self, capital: float = None, conn=None):
+        self.conn = conn if conn is not None else psycopg2.connect(**DB_CONFIG)
         self.capital = capital or self.DEFAULT_CAPITAL
         self.kelly_sizer = KellyPositionSizer() if KELLY_AVAILABLE else None
         self.regime_classifier = AdvancedRegimeClassifier() if REGIME_AVAILABLE else None
+        self._panel: Optional[PricePanel] = None
 
     def _get_prices(self, asset: str, days: int = 100) -> List[Dict]:
         """Fetch price data"""
@@ -184,9 +232,9 @@ class MeanReversionEngine:
         Daily RSI: Standard 14-period on daily closes
         4H RSI: Simulated by using last 4 days with finer granularity
         """
-        data = self._get_prices(asset, days=100)
+        data = self._get_prices(asset, days=self.RSI_DAYS)
 
-        if len(data) < 20:
+        if len(data) < self.MIN_RSI_BARS:
             return RSIData(
                 rsi_daily=50, rsi_4h=50, rsi_1h=None,
                 signal_type=SignalType.NEUTRAL,
@@ -246,20 +294,30 @@ class MeanReversionEngine:
         if rsi_data.signal_type == SignalType.NEUTRAL:
             return None
 
-        # Check regime
-        regime_favorable = True
-        if self.regime_classifier:
-            regime = self.regime_classifier.classify(asset)
-            regime_favorable = regime.meanrev_favorable
-
         # Get price data
-        data = self._get_prices(asset, days=30)
+        data = self._get_prices(asset, days=self.ATR_DAYS)
         if not data:
             return None
 
         current_price = float(data[0]['close'])
         atr = self._calculate_atr(data)
 
+        signal = self._build_signal(asset, rsi_data, current_price, atr)
+
+        # Log signal
+        self._log_signal(signal)
+
+        return signal
+
+    def _build_signal(self, asset: str, rsi_data: RSIData,
+                      current_price: float, atr: float) -> MeanRevSignal:
+        """Confidence, Kelly sizing and ATR exits for a non-neutral RSI reading."""
+        # Check regime
+        regime_favorable = True
+        if self.regime_classifier:
+            regime = self.regime_classifier.classify(asset)
+            regime_favorable = regime.meanrev_favorable
+
         # Calculate confidence based on RSI extremity and confluence
         base_confidence = 0.5
         if rsi_data.confluence == ConfluenceLevel.STRONG:
@@ -303,7 +361,7 @@ class MeanReversionEngine:
             stop_loss = current_price + (self.STOP_LOSS_ATR_MULT * atr)
             take_profit = current_price - (self.TAKE_PROFIT_ATR_MULT * atr)
 
-        signal = MeanRevSignal(
+        return MeanRevSignal(
             asset=asset,
             signal_type=rsi_data.signal_type,
             rsi_daily=rsi_data.rsi_daily,
@@ -319,10 +377,23 @@ class MeanReversionEngine:
             generated_at=datetime.now(timezone.utc)
         )
 
-        # Log signal
-        self._log_signal(signal)
-
-        return signal
+    @staticmethod
+    def _signal_row(signal: MeanRevSignal) -> Tuple:
+        return (
+            signal.asset,
+            signal.signal_type.value,
+            signal.rsi_daily,
+            signal.rsi_4h,
+            signal.confluence.value,
+            signal.confidence,
+            signal.kelly_fraction,
+            signal.position_size,
+            signal.entry_price,
+            signal.stop_loss,
+            signal.take_profit,
+            signal.regime_favorable,
+            signal.generated_at
+        )
 
     def _log_signal(self, signal: MeanRevSignal):
         """Log signal to database"""
@@ -335,48 +406,241 @@ class MeanReversionEngine:
                      stop_loss, take_profit, regime_favorable, generated_at)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT DO NOTHING
-                """, (
-                    signal.asset,
-                    signal.signal_type.value,
-                    signal.rsi_daily,
-                    signal.rsi_4h,
-                    signal.confluence.value,
-                    signal.confidence,
-                    signal.kelly_fraction,
-                    signal.position_size,
-                    signal.entry_price,
-                    signal.stop_loss,
-                    signal.take_profit,
-                    signal.regime_favorable,
-                    signal.generated_at
-                ))
+                """, self._signal_row(signal))
                 self.conn.commit()
         except Exception as e:
             self.conn.rollback()
             pass
 
-    def scan_universe(self, assets: List[str]) -> List[MeanRevSignal]:
+    def _log_signals(self, signals: List[MeanRevSignal]):
+        """Log many signals with one INSERT and one commit"""
+        if not signals:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, self.SIGNAL_INSERT_SQL,
+                               [self._signal_row(s) for s in signals], page_size=len(signals))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+
+    # Panel computation
+
+    def _get_price_panel(self, assets: List[str], days: int = RSI_DAYS) -> PricePanel:
+        """Last `days` bars of every asset in one query, as a PricePanel."""
+        assets = list(dict.fromkeys(assets))
+        index = {a: i for i, a in enumerate(assets)}
+        high, low, close = (np.full((len(assets), days), np.nan) for _ in range(3))
+        counts = np.zeros(len(assets), dtype=int)
+        latest: List[Optional[datetime]] = [None] * len(assets)
+
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                SELECT canonical_id, rn, timestamp,
+                       high::float8, low::float8, close::float8
+                FROM (
+                    SELECT canonical_id, timestamp, high, low, close,
+                           ROW_NUMBER() OVER (PARTITION BY canonical_id
+                                              ORDER BY timestamp DESC) AS rn
+                    FROM fhq_market.prices
+                    WHERE canonical_id = ANY(%s)
+                ) recent
+                WHERE rn <= %s
+            """, (assets, days))
+            rows = cur.fetchall()
+
+        for asset, rn, ts, h, l, c in rows:
+            i, k = index[asset], rn - 1
+            high[i, k], low[i, k], close[i, k] = h, l, c
+            counts[i] += 1
+            if rn == 1:
+                latest[i] = ts
+
+        return PricePanel(assets, high, low, close, counts, latest)
+
+    def update_price_panel(self, panel: PricePanel) -> int:
+        """
+        Advance a panel with every bar since each row's latest (one query).
+
+        k bars newer than the row's latest shift the row k columns right;
+        a bar with the same timestamp as the latest replaces it (revised bar).
+        Returns the number of assets that gained a bar.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                SELECT canonical_id, rn, timestamp,
+                       high::float8, low::float8, close::float8
+                FROM (
+                    SELECT p.canonical_id, p.timestamp, p.high, p.low, p.close,
+                           ROW_NUMBER() OVER (PARTITION BY p.canonical_id
+                                              ORDER BY p.timestamp DESC) AS rn
+                    FROM fhq_market.prices p
+                    JOIN unnest(%s::text[], %s::timestamptz[]) AS seen(canonical_id, latest)
+                      ON p.canonical_id = seen.canonical_id
+                    WHERE seen.latest IS NULL OR p.timestamp >= seen.latest
+                ) fresh
+                WHERE rn <= %s
+            """, (panel.assets, panel.latest, panel.days))
+            rows = cur.fetchall()
+
+        fresh: Dict[int, list] = {}
+        for asset, rn, ts, h, l, c in rows:
+            fresh.setdefault(panel.index[asset], []).append((rn, ts, h, l, c))
+
+        gained = 0
+        for i, bars in fresh.items():
+            bars.sort()                                    # newest first
+            last = panel.latest[i]
+            k = sum(1 for _, ts, *_ in bars if last is None or ts > last)
+            if k:
+                for values in (panel.high, panel.low, panel.close):
+                    values[i, k:] = values[i, :-k]
+                panel.counts[i] = min(panel.counts[i] + k, panel.days)
+                gained += 1
+            # Columns 0..k-1 are the new bars; column k (if present) the revised latest
+            for col, (_, ts, h, l, c) in enumerate(bars):
+                panel.high[i, col], panel.low[i, col], panel.close[i, col] = h, l, c
+            panel.latest[i] = bars[0][1]
+        return gained
+
+    def load_panel(self, assets: List[str], incremental: bool = False) -> PricePanel:
+        """
+        Price panel for `assets`. With incremental=True the panel from the
+        previous call is advanced by the newest bars if it covers the same
+        assets; otherwise the full window is loaded.
+        """
+        if incremental and self._panel is not None and set(self._panel.assets) == set(assets):
+            self.update_price_panel(self._panel)
+        else:
+            self._panel = self._get_price_panel(assets, self.RSI_DAYS)
+        return self._panel
+
+    @staticmethod
+    def _rsi_panel(panel: PricePanel, period: int = 14) -> np.ndarray:
+        """_calculate_rsi for every row (oldest `period` deltas of the window)."""
+        n = panel.counts
+        # Oldest-first positions 0..period of each row's window
+        cols = np.clip(n[:, None] - 1 - np.arange(period + 1), 0, panel.days - 1)
+        closes = np.take_along_axis(panel.close, cols, axis=1)
+
+        deltas = np.diff(closes, axis=1)
+        gains = np.where(deltas > 0, deltas, 0)
+        losses = np.where(deltas < 0, -deltas, 0)
+        avg_gain = gains.mean(axis=1)
+        avg_loss = losses.mean(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        rsi = np.where(avg_loss == 0, 100.0, rsi)
+        return np.where(n < period + 1, 50.0, rsi)
+
+    @staticmethod
+    def _atr_panel(panel: PricePanel, period: int = 14, days: int = ATR_DAYS) -> np.ndarray:
+        """_calculate_atr for every row over its newest `days` bars."""
+        high = panel.high[:, 1:period + 1]
+        low = panel.low[:, 1:period + 1]
+        prev_close = panel.close[:, :period]     # newest-first, as _calculate_atr indexes it
+
+        tr = np.maximum(np.maximum(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+        atr = tr.mean(axis=1)
+        return np.where(np.minimum(panel.counts, days) < period + 1, 0, atr)
+
+    def calculate_rsi_panel(self, panel: PricePanel) -> Dict[str, RSIData]:
+        """calculate_rsi_data for every asset of the panel."""
+        rsi_daily = self._rsi_panel(panel, 14)
+        rsi_4h = self._rsi_panel(panel, 7)   # 7-period daily as 4H proxy
+
+        daily_oversold = rsi_daily < self.RSI_OVERSOLD
+        daily_overbought = rsi_daily > self.RSI_OVERBOUGHT
+        h4_oversold = rsi_4h < self.RSI_OVERSOLD + 5
+        h4_overbought = rsi_4h > self.RSI_OVERBOUGHT - 5
+
+        strength = np.select(
+            [daily_oversold, daily_overbought],
+            [(self.RSI_OVERSOLD - rsi_daily) / self.RSI_OVERSOLD,
+             (rsi_daily - self.RSI_OVERBOUGHT) / (100 - self.RSI_OVERBOUGHT)],
+            0
+        )
+        signal_types = np.select([daily_oversold, daily_overbought], [0, 1], 2)
+        confluences = np.select(
+            [(daily_oversold & h4_oversold) | (daily_overbought & h4_overbought),
+             daily_oversold | daily_overbought],
+            [0, 1], 2
+        )
+
+        rsi_daily = np.round(rsi_daily, 2)
+        rsi_4h = np.round(rsi_4h, 2)
+        strength = np.round(np.minimum(strength, 1.0), 4)
+
+        signal_enum = [SignalType.OVERSOLD, SignalType.OVERBOUGHT, SignalType.NEUTRAL]
+        confluence_enum = [ConfluenceLevel.STRONG, ConfluenceLevel.MODERATE, ConfluenceLevel.WEAK]
+        result = {}
+        for i, asset in enumerate(panel.assets):
+            if panel.counts[i] < self.MIN_RSI_BARS:
+                result[asset] = RSIData(
+                    rsi_daily=50, rsi_4h=50, rsi_1h=None,
+                    signal_type=SignalType.NEUTRAL,
+                    confluence=ConfluenceLevel.WEAK,
+                    strength=0
+                )
+                continue
+            result[asset] = RSIData(
+                rsi_daily=float(rsi_daily[i]),
+                rsi_4h=float(rsi_4h[i]),
+                rsi_1h=None,
+                signal_type=signal_enum[signal_types[i]],
+                confluence=confluence_enum[confluences[i]],
+                strength=float(strength[i])
+            )
+        return result
+
+    def scan_universe(self, assets: List[str], batch: bool = True,
+                      incremental: bool = False) -> List[MeanRevSignal]:
         """
         Scan multiple assets for mean reversion signals.
 
+        batch=True computes all assets from one price panel and logs the
+        signals in one INSERT; batch=False calls generate_signal per asset.
+
         Returns list of actionable signals sorted by confidence.
         """
         signals = []
 
-        for asset in assets:
-            signal = self.generate_signal(asset)
-            if signal:
-                signals.append(signal)
+        if batch:
+            panel = self.load_panel(assets, incremental)
+            rsi = self.calculate_rsi_panel(panel)
+            atr = self._atr_panel(panel)
+            index = panel.index
+            for asset in assets:
+                rsi_data = rsi[asset]
+                if rsi_data.signal_type == SignalType.NEUTRAL:
+                    continue
+                i = index[asset]
+                signals.append(self._build_signal(asset, rsi_data, float(panel.close[i, 0]), atr[i]))
+            self._log_signals(signals)
+        else:
+            for asset in assets:
+                signal = self.generate_signal(asset)
+                if signal:
+                    signals.append(signal)
 
         # Sort by confidence (highest first)
         signals.sort(key=lambda s: s.confidence, reverse=True)
 
         return signals
 
-    def get_extreme_rsi_assets(self, assets: List[str]) -> Dict[str, RSIData]:
+    def get_extreme_rsi_assets(self, assets: List[str], batch: bool = True,
+                               incremental: bool = False) -> Dict[str, RSIData]:
         """Find assets with extreme RSI readings"""
         extreme = {}
 
+        if batch:
+            rsi = self.calculate_rsi_panel(self.load_panel(assets, incremental))
+            for asset in assets:
+                if rsi[asset].signal_type != SignalType.NEUTRAL:
+                    extreme[asset] = rsi[asset]
+            return extreme
+
         for asset in assets:
             rsi_data = self.calculate_rsi_data(asset)
             if rsi_data.signal_type != SignalType.NEUTRAL:
@@ -408,10 +672,7 @@ if __name__ == "__main__":
 
     # Calculate RSI for all
     print("\n[2] Calculating RSI...")
-    rsi_results = {}
-    for asset in assets:
-        rsi_data = engine.calculate_rsi_data(asset)
-        rsi_results[asset] = rsi_data
+    rsi_results = engine.calculate_rsi_panel(engine.load_panel(assets))
 
     # Show extreme RSI
     print("\n[3] RSI Summary:")
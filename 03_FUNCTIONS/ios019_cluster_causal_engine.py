@@ -43,6 +43,8 @@ try:
 except ImportError:
     VARCLUS_AVAILABLE = False
 
+from lagged_dependence import run_lagged_dependence, significant_links
+
 # PCMCI imports
 try:
     from tigramite import data_processing as pp
@@ -103,6 +105,11 @@ class ClusterCausalEngine:
     PC_ALPHA = 0.05               # Significance level
     MIN_EDGE_STRENGTH = 0.1       # Minimum |strength| to keep edge
 
+    # Fallback discovery without tigramite (see lagged_dependence)
+    FALLBACK_CORRECTION = 'fdr_bh'  # Multiple testing: 'fdr_bh', 'bonferroni', 'none'
+    FALLBACK_CONDITIONING = True    # MCI-style partial-correlation stage
+    FALLBACK_MAX_CONDS = 3          # Parents per node in conditioning sets
+
     def __init__(self):
         self.conn = psycopg2.connect(**DB_CONFIG)
         self.varclus = VarClusEngine() if VARCLUS_AVAILABLE else None
@@ -149,79 +156,56 @@ class ClusterCausalEngine:
                 pc_alpha=self.PC_ALPHA
             )
 
-            # Extract significant edges
-            p_matrix = results['p_matrix']
-            val_matrix = results['val_matrix']
-
-            for i, source in enumerate(var_names):
-                for j, target in enumerate(var_names):
-                    if i == j:
-                        continue
-
-                    for lag in range(1, self.TAU_MAX + 1):
-                        p_val = p_matrix[i, j, lag]
-                        strength = val_matrix[i, j, lag]
-
-                        if p_val < self.PC_ALPHA and abs(strength) > self.MIN_EDGE_STRENGTH:
-                            edges.append(CausalEdge(
-                                source=source,
-                                target=target,
-                                lag=lag,
-                                strength=round(float(strength), 4),
-                                p_value=round(float(p_val), 4),
-                                edge_type='discovered',
-                                discovered_at=datetime.now(timezone.utc)
-                            ))
+            edges = self._edges_from_matrices(
+                var_names, results['val_matrix'], results['p_matrix'], 'discovered'
+            )
         else:
-            # Simplified causal discovery using Granger-like approach
+            # Matrix-based lagged dependence (exact p-values, FDR, optional MCI)
             edges = self._simple_causal_discovery(data, var_names)
 
         return edges
 
-    def _simple_causal_discovery(self, data: Dict[str, np.ndarray], var_names: List[str]) -> List[CausalEdge]:
-        """Simplified causal discovery without PCMCI"""
-        edges = []
-        min_len = min(len(v) for v in data.values())
-
-        for i, source in enumerate(var_names):
-            for j, target in enumerate(var_names):
-                if i == j:
-                    continue
-
-                source_data = data[source][-min_len:]
-                target_data = data[target][-min_len:]
-
-                # Test lagged correlation as proxy for causality
-                for lag in range(1, self.TAU_MAX + 1):
-                    if lag >= min_len:
-                        continue
-
-                    # Correlation of source[t-lag] with target[t]
-                    lagged_source = source_data[:-lag]
-                    current_target = target_data[lag:]
-
-                    if len(lagged_source) < 20:
-                        continue
-
-                    corr = np.corrcoef(lagged_source, current_target)[0, 1]
-
-                    # Simple significance test
-                    n = len(lagged_source)
-                    t_stat = corr * np.sqrt(n - 2) / np.sqrt(1 - corr**2) if abs(corr) < 1 else 0
-                    p_val = 2 * (1 - min(0.999, abs(t_stat) / 10))  # Rough approximation
+    def _edges_from_matrices(self, var_names: List[str], val_matrix: np.ndarray,
+                             p_matrix: np.ndarray, edge_type: str) -> List[CausalEdge]:
+        """Significant cross links of [source, target, lag] matrices as CausalEdges"""
+        discovered_at = datetime.now(timezone.utc)
+        return [
+            CausalEdge(
+                source=var_names[i],
+                target=var_names[j],
+                lag=lag,
+                strength=round(strength, 4),
+                p_value=round(p_val, 4),
+                edge_type=edge_type,
+                discovered_at=discovered_at
+            )
+            for i, j, lag, strength, p_val in significant_links(
+                val_matrix, p_matrix, self.PC_ALPHA, self.MIN_EDGE_STRENGTH
+            )
+        ]
 
-                    if abs(corr) > self.MIN_EDGE_STRENGTH and p_val < self.PC_ALPHA:
-                        edges.append(CausalEdge(
-                            source=source,
-                            target=target,
-                            lag=lag,
-                            strength=round(float(corr), 4),
-                            p_value=round(float(p_val), 4),
-                            edge_type='lagged_corr',
-                            discovered_at=datetime.now(timezone.utc)
-                        ))
+    def _simple_causal_discovery(self, data: Dict[str, np.ndarray], var_names: List[str]) -> List[CausalEdge]:
+        """
+        Lagged-dependence causal discovery without PCMCI.
 
-        return edges
+        All pairs and lags 1..TAU_MAX in one pass, exact t-test p-values,
+        FALLBACK_CORRECTION across the whole link family, and optionally an
+        MCI-style partial-correlation stage.
+        """
+        min_len = min(len(v) for v in data.values())
+        aligned = np.column_stack([np.asarray(data[v], dtype=float)[-min_len:] for v in var_names])
+
+        result = run_lagged_dependence(
+            aligned,
+            var_names,
+            tau_max=self.TAU_MAX,
+            alpha=self.PC_ALPHA,
+            correction=self.FALLBACK_CORRECTION,
+            conditioning=self.FALLBACK_CONDITIONING,
+            max_conds=self.FALLBACK_MAX_CONDS
+        )
+        edge_type = 'lagged_parcorr' if result.conditioned else 'lagged_corr'
+        return self._edges_from_matrices(var_names, result.val_matrix, result.q_matrix, edge_type)
 
     def discover_macro_causality(self, assets: List[str] = None, n_clusters: int = 30) -> CausalGraph:
         """
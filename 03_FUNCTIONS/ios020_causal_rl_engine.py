@@ -25,6 +25,13 @@ Components:
     3. PortfolioRL - Orchestrates multiple CausalRLAgents
     4. RewardCalculator - Computes risk-adjusted rewards
 
+Batching:
+    get_portfolio_actions builds all states with CausalStateBuilder.build_states
+    (a handful of set-based queries for the whole portfolio), samples every
+    agent's bandits in one vectorized draw and writes decisions with a single
+    multi-row insert. batched=False keeps the per-asset path; under the same
+    RNG seed both paths produce the same decisions.
+
 Usage:
     from ios020_causal_rl_engine import CausalRLEngine
 
@@ -36,7 +43,7 @@ import os
 import json
 import numpy as np
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
@@ -49,7 +56,8 @@ try:
         ThompsonBandit,
         SizingAction,
         TimingAction,
-        RegimeAwareBandit
+        RegimeAwareBandit,
+        sample_actions
     )
     THOMPSON_AVAILABLE = True
 except ImportError:
@@ -179,9 +187,11 @@ class CausalStateBuilder:
     """
 
     LOOKBACK_DAYS = 20
+    MAX_MICRO_PARENTS = 5
+    MAX_MACRO_PARENTS = 3
 
-    def __init__(self):
-        self.conn = psycopg2.connect(**DB_CONFIG)
+    def __init__(self, conn=None):
+        self.conn = conn if conn is not None else psycopg2.connect(**DB_CONFIG)
         self._causal_cache = {}
         self._regime_cache = {}
 
@@ -259,10 +269,7 @@ class CausalStateBuilder:
             """, (asset, days + 1))
 
             rows = cur.fetchall()
-            if len(rows) < 2:
-                return 0.0
-
-            return (float(rows[0]['close']) / float(rows[-1]['close'])) - 1
+            return self._return_from_closes([r['close'] for r in rows])
 
     def _get_volatility(self, asset: str, days: int = 20) -> float:
         """Get rolling volatility"""
@@ -276,12 +283,22 @@ class CausalStateBuilder:
             """, (asset, days + 1))
 
             rows = cur.fetchall()
-            if len(rows) < 5:
-                return 0.0
+            return self._volatility_from_closes([r['close'] for r in rows])
 
-            closes = np.array([float(r['close']) for r in rows])
-            returns = np.diff(np.log(closes))
-            return float(np.std(returns) * np.sqrt(252))
+    @staticmethod
+    def _return_from_closes(closes: List) -> float:
+        """Return over closes ordered newest first"""
+        if len(closes) < 2:
+            return 0.0
+        return (float(closes[0]) / float(closes[-1])) - 1
+
+    @staticmethod
+    def _volatility_from_closes(closes: List) -> float:
+        """Annualized volatility of closes ordered newest first"""
+        if len(closes) < 5:
+            return 0.0
+        returns = np.diff(np.log(np.array([float(c) for c in closes])))
+        return float(np.std(returns) * np.sqrt(252))
 
     def _get_regime(self, asset: str) -> str:
         """Get current regime"""
@@ -337,6 +354,178 @@ class CausalStateBuilder:
             timestamp=datetime.now(timezone.utc)
         )
 
+    # =========================================================================
+    # PORTFOLIO (SET-BASED) STATE BUILDING
+    # =========================================================================
+
+    def get_causal_parents_bulk(self, assets: List[str]) -> Dict[str, List[str]]:
+        """get_causal_parents for many assets: micro edges, then macro fallback"""
+        missing = [a for a in dict.fromkeys(assets) if a not in self._causal_cache]
+        if missing:
+            parents = {a: [] for a in missing}
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    SELECT target_asset, source_asset
+                    FROM (
+                        SELECT target_asset, source_asset,
+                               ROW_NUMBER() OVER (PARTITION BY target_asset
+                                                  ORDER BY edge_strength DESC) AS rn
+                        FROM fhq_alpha.micro_causal_edges
+                        WHERE target_asset = ANY(%s)
+                          AND edge_strength > 0.1
+                    ) ranked
+                    WHERE rn <= %s
+                    ORDER BY target_asset, rn
+                """, (missing, self.MAX_MICRO_PARENTS))
+                for r in cur.fetchall():
+                    parents[r['target_asset']].append(r['source_asset'])
+
+                # Cluster-level fallback for assets without micro edges
+                macro = [a for a in missing if not parents[a]]
+                if macro:
+                    cur.execute("""
+                        SELECT asset_id, source_cluster_id
+                        FROM (
+                            SELECT ac.asset_id, me.source_cluster_id,
+                                   ROW_NUMBER() OVER (PARTITION BY ac.asset_id
+                                                      ORDER BY me.edge_strength DESC) AS rn
+                            FROM fhq_alpha.macro_causal_edges me
+                            JOIN fhq_alpha.asset_clusters ac ON ac.cluster_id = me.target_cluster_id
+                            WHERE ac.asset_id = ANY(%s)
+                              AND me.edge_strength > 0.1
+                        ) ranked
+                        WHERE rn <= %s
+                        ORDER BY asset_id, rn
+                    """, (macro, self.MAX_MACRO_PARENTS))
+                    cluster_parents = {}
+                    for r in cur.fetchall():
+                        cluster_parents.setdefault(r['asset_id'], []).append(r['source_cluster_id'])
+
+                    clusters = sorted({c for cs in cluster_parents.values() for c in cs})
+                    representatives = {}
+                    if clusters:
+                        # One random representative per parent cluster
+                        cur.execute("""
+                            SELECT DISTINCT ON (cluster_id) cluster_id, asset_id
+                            FROM fhq_alpha.asset_clusters
+                            WHERE cluster_id = ANY(%s)
+                            ORDER BY cluster_id, RANDOM()
+                        """, (clusters,))
+                        representatives = {r['cluster_id']: r['asset_id'] for r in cur.fetchall()}
+
+                    for asset, cluster_ids in cluster_parents.items():
+                        parents[asset] = [representatives[c] for c in cluster_ids if c in representatives]
+
+            self._causal_cache.update(parents)
+
+        return {a: self._causal_cache[a] for a in assets}
+
+    def get_cluster_centroid_returns(self, assets: List[str]) -> Dict[str, float]:
+        """Latest cluster centroid return per asset"""
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT DISTINCT ON (ac.asset_id) ac.asset_id, cc.centroid_return
+                FROM fhq_alpha.cluster_centroids cc
+                JOIN fhq_alpha.asset_clusters ac ON ac.cluster_id = cc.cluster_id
+                WHERE ac.asset_id = ANY(%s)
+                ORDER BY ac.asset_id, cc.calculated_at DESC
+            """, (list(assets),))
+            found = {r['asset_id']: r['centroid_return'] for r in cur.fetchall()}
+        return {a: found.get(a, 0.0) for a in assets}
+
+    def _get_recent_closes(self, assets: List[str], limit: int) -> Dict[str, List]:
+        """Up to `limit` most recent closes per asset, newest first"""
+        closes = {a: [] for a in assets}
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT canonical_id, close
+                FROM (
+                    SELECT canonical_id, close,
+                           ROW_NUMBER() OVER (PARTITION BY canonical_id
+                                              ORDER BY timestamp DESC) AS rn
+                    FROM fhq_market.prices
+                    WHERE canonical_id = ANY(%s)
+                ) recent
+                WHERE rn <= %s
+                ORDER BY canonical_id, rn
+            """, (list(assets), limit))
+            for r in cur.fetchall():
+                closes[r['canonical_id']].append(r['close'])
+        return closes
+
+    def _get_regimes(self, assets: List[str]) -> Dict[str, str]:
+        """_get_regime for many assets (shares the regime cache)"""
+        missing = [a for a in dict.fromkeys(assets) if a not in self._regime_cache]
+        if missing:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    SELECT DISTINCT ON (asset_id) asset_id, trend_regime
+                    FROM fhq_perception.advanced_regime_log
+                    WHERE asset_id = ANY(%s)
+                    ORDER BY asset_id, created_at DESC
+                """, (missing,))
+                found = {r['asset_id']: r['trend_regime'] for r in cur.fetchall()}
+            for a in missing:
+                self._regime_cache[a] = found.get(a, 'UNKNOWN')
+        return {a: self._regime_cache[a] for a in assets}
+
+    def build_states(self, assets: List[str]) -> 'PortfolioState':
+        """
+        Build causal states for a whole portfolio.
+
+        Same features as build_state, loaded with at most six set-based
+        queries (parents, macro fallback, cluster representatives, prices,
+        regimes, centroids) instead of ~3 per asset and parent.
+        """
+        assets = list(assets)
+        parents = self.get_causal_parents_bulk(assets)
+        universe = list(dict.fromkeys(assets + [p for a in assets for p in parents[a]]))
+
+        closes = self._get_recent_closes(universe, self.LOOKBACK_DAYS + 1)
+        returns = {a: self._return_from_closes(closes[a][:2]) for a in universe}
+        volatilities = {a: self._volatility_from_closes(closes[a]) for a in universe}
+        regimes = self._get_regimes(universe)
+        centroids = self.get_cluster_centroid_returns(assets)
+
+        now = datetime.now(timezone.utc)
+        states = [
+            CausalState(
+                asset=asset,
+                parents=parents[asset],
+                parent_returns={p: returns[p] for p in parents[asset]},
+                parent_volatilities={p: volatilities[p] for p in parents[asset]},
+                parent_regimes={p: regimes[p] for p in parents[asset]},
+                cluster_centroid_return=centroids[asset],
+                own_return=returns[asset],
+                own_volatility=volatilities[asset],
+                own_regime=regimes[asset],
+                timestamp=now
+            )
+            for asset in assets
+        ]
+        return PortfolioState.from_states(states)
+
+
+@dataclass
+class PortfolioState:
+    """Causal states for a portfolio, stacked row-wise"""
+    states: List[CausalState]
+    matrix: np.ndarray        # (n_assets, max_state_dim), NaN-padded to_vector() rows
+    state_dims: np.ndarray    # (n_assets,) unpadded length of each row
+
+    @classmethod
+    def from_states(cls, states: List[CausalState]) -> 'PortfolioState':
+        vectors = [s.to_vector() for s in states]
+        dims = np.array([len(v) for v in vectors], dtype=int)
+        matrix = np.full((len(vectors), int(dims.max()) if len(dims) else 0), np.nan)
+        for i, v in enumerate(vectors):
+            matrix[i, :len(v)] = v
+        return cls(states=states, matrix=matrix, state_dims=dims)
+
+    @property
+    def assets(self) -> List[str]:
+        return [s.asset for s in self.states]
+
 
 class CausalRLAgent:
     """
@@ -361,14 +550,14 @@ class CausalRLAgent:
         'DELAY_3': 3
     }
 
-    def __init__(self, asset: str):
+    def __init__(self, asset: str, state_builder: Optional[CausalStateBuilder] = None):
         self.asset = asset
-        self.state_builder = CausalStateBuilder()
+        self.state_builder = state_builder or CausalStateBuilder()
 
         if THOMPSON_AVAILABLE:
             self.sizing_bandit = RegimeAwareBandit(
-                actions=[SizingAction.QUARTER, SizingAction.HALF,
-                        SizingAction.FULL, SizingAction.AGGRESSIVE],
+                actions=[SizingAction.SIZE_QUARTER, SizingAction.SIZE_HALF,
+                        SizingAction.SIZE_FULL, SizingAction.SIZE_AGGRESSIVE],
                 regimes=['STRONG_TREND', 'MODERATE_TREND', 'WEAK_TREND', 'RANGE_BOUND']
             )
             self.timing_bandit = RegimeAwareBandit(
@@ -382,23 +571,31 @@ class CausalRLAgent:
 
         self._action_history = []
 
-    def select_action(self) -> RLDecision:
+    def select_action(self, rng=None) -> RLDecision:
         """Select action based on current causal state"""
         state = self.state_builder.build_state(self.asset)
         regime = state.own_regime
 
         # Select sizing and timing actions
         if self.sizing_bandit:
-            sizing_action = self.sizing_bandit.select_action(regime)
-            timing_action = self.timing_bandit.select_action(regime)
+            sizing_action = self.sizing_bandit.select_action(regime, rng)
+            timing_action = self.timing_bandit.select_action(regime, rng)
         else:
             # Default: half Kelly, enter now
-            sizing_action = SizingAction.HALF
-            timing_action = TimingAction.DELAY_0
+            sizing_action = 'SIZE_HALF'
+            timing_action = 'DELAY_0'
+
+        return self.decide(state, sizing_action, timing_action)
+
+    def decide(self, state: CausalState, sizing_action, timing_action) -> RLDecision:
+        """Turn sampled sizing/timing actions into a decision for this state"""
+        regime = state.own_regime
+        sizing_key = sizing_action.value if hasattr(sizing_action, 'value') else str(sizing_action)
+        timing_key = timing_action.value if hasattr(timing_action, 'value') else str(timing_action)
 
         # Apply causal boost if parents aligned
         causal_alignment = self._calculate_causal_alignment(state)
-        sizing_multiplier = self.SIZING_MULTIPLIERS.get(sizing_action.value, 0.5)
+        sizing_multiplier = self.SIZING_MULTIPLIERS.get(sizing_key, 0.5)
 
         if causal_alignment > 0.7:
             # Strong causal signal - boost size
@@ -407,15 +604,15 @@ class CausalRLAgent:
             # Weak causal signal - reduce size
             sizing_multiplier *= 0.5
 
-        delay_bars = self.TIMING_DELAYS.get(timing_action.value, 0)
+        delay_bars = self.TIMING_DELAYS.get(timing_key, 0)
 
         # Confidence based on causal alignment and bandit certainty
         confidence = causal_alignment * 0.6 + 0.4  # Base 40% + up to 60% from causal
 
         decision = RLDecision(
             asset=self.asset,
-            sizing_action=sizing_action.value if hasattr(sizing_action, 'value') else str(sizing_action),
-            timing_action=timing_action.value if hasattr(timing_action, 'value') else str(timing_action),
+            sizing_action=sizing_key,
+            timing_action=timing_key,
             sizing_multiplier=round(sizing_multiplier, 4),
             delay_bars=delay_bars,
             confidence=round(confidence, 4),
@@ -461,7 +658,9 @@ class CausalRLAgent:
         timing_reward = 1 if reward.risk_adjusted_return > 0 else 0
 
         # Update sizing bandit
-        sizing_action = SizingAction(reward.action_taken.split('_')[1]) if 'SIZE_' in reward.action_taken else SizingAction.HALF
+        sizing_action = next(
+            (a for a in SizingAction if a.value == reward.action_taken), SizingAction.SIZE_HALF
+        )
         self.sizing_bandit.update(regime, sizing_action, sizing_reward)
 
         # Update timing bandit (timing is harder to attribute)
@@ -482,8 +681,10 @@ class CausalRLEngine:
     MAX_AGENTS = 100
     MIN_CAUSAL_PARENTS = 1  # Minimum parents required for RL
 
-    def __init__(self):
-        self.conn = psycopg2.connect(**DB_CONFIG)
+    def __init__(self, conn=None, seed: Optional[int] = None):
+        self.conn = conn if conn is not None else psycopg2.connect(**DB_CONFIG)
+        self.rng = np.random.default_rng(seed)
+        self.state_builder = CausalStateBuilder(self.conn)
         self.agents: Dict[str, CausalRLAgent] = {}
         self.causal_engine = ClusterCausalEngine() if CAUSAL_AVAILABLE else None
         self.regime_classifier = AdvancedRegimeClassifier() if REGIME_AVAILABLE else None
@@ -497,37 +698,85 @@ class CausalRLEngine:
                            key=lambda a: len(self.agents[a]._action_history))
                 del self.agents[oldest]
 
-            self.agents[asset] = CausalRLAgent(asset)
+            self.agents[asset] = CausalRLAgent(asset, self.state_builder)
 
         return self.agents[asset]
 
-    def get_portfolio_actions(self, assets: List[str]) -> List[RLDecision]:
-        """Get RL decisions for portfolio of assets"""
+    def _no_parent_decision(self, asset: str) -> RLDecision:
+        """Default decision when an asset lacks causal structure"""
+        return RLDecision(
+            asset=asset,
+            sizing_action='SIZE_HALF',
+            timing_action='DELAY_0',
+            sizing_multiplier=0.5,
+            delay_bars=0,
+            confidence=0.3,  # Low confidence without causal structure
+            causal_parents=[],
+            state_dim=0,
+            regime='UNKNOWN',
+            generated_at=datetime.now(timezone.utc)
+        )
+
+    def get_portfolio_actions(self, assets: List[str], batched: bool = True) -> List[RLDecision]:
+        """
+        Get RL decisions for portfolio of assets.
+
+        batched=True builds all states with set-based queries, samples all
+        agents in one vectorized Thompson draw and logs decisions in one
+        insert. batched=False runs the per-asset path. Both consume
+        self.rng in the same order, so a fixed seed gives the same decisions.
+        """
+        if not batched:
+            return self._get_portfolio_actions_per_asset(assets)
+
+        assets = list(assets)
+        if not assets:
+            return []
+
+        portfolio = self.state_builder.build_states(assets)
+        agents = [self._ensure_agent(asset) for asset in assets]
+
+        eligible = [i for i, state in enumerate(portfolio.states)
+                    if len(state.parents) >= self.MIN_CAUSAL_PARENTS]
+
+        if THOMPSON_AVAILABLE:
+            sampled = sample_actions(
+                [[agents[i].sizing_bandit, agents[i].timing_bandit] for i in eligible],
+                [portfolio.states[i].own_regime for i in eligible],
+                self.rng
+            )
+        else:
+            sampled = [('SIZE_HALF', 'DELAY_0')] * len(eligible)
+        actions = dict(zip(eligible, sampled))
+
+        decisions = []
+        for i, (asset, agent, state) in enumerate(zip(assets, agents, portfolio.states)):
+            if i in actions:
+                sizing_action, timing_action = actions[i]
+                decision = agent.decide(state, sizing_action, timing_action)
+            else:
+                # Not enough causal structure - use default
+                decision = self._no_parent_decision(asset)
+            decisions.append(decision)
+
+        self._log_decisions(decisions)
+        return decisions
+
+    def _get_portfolio_actions_per_asset(self, assets: List[str]) -> List[RLDecision]:
+        """Per-asset path: one state build and one insert per asset"""
         decisions = []
 
         for asset in assets:
             agent = self._ensure_agent(asset)
 
             # Check if asset has causal parents
-            state_builder = CausalStateBuilder()
-            parents = state_builder.get_causal_parents(asset)
+            parents = self.state_builder.get_causal_parents(asset)
 
             if len(parents) < self.MIN_CAUSAL_PARENTS:
                 # Not enough causal structure - skip or use default
-                decision = RLDecision(
-                    asset=asset,
-                    sizing_action='SIZE_HALF',
-                    timing_action='DELAY_0',
-                    sizing_multiplier=0.5,
-                    delay_bars=0,
-                    confidence=0.3,  # Low confidence without causal structure
-                    causal_parents=[],
-                    state_dim=0,
-                    regime='UNKNOWN',
-                    generated_at=datetime.now(timezone.utc)
-                )
+                decision = self._no_parent_decision(asset)
             else:
-                decision = agent.select_action()
+                decision = agent.select_action(self.rng)
 
             decisions.append(decision)
 
@@ -536,6 +785,21 @@ class CausalRLEngine:
 
         return decisions
 
+    @staticmethod
+    def _decision_row(decision: RLDecision) -> Tuple:
+        return (
+            decision.asset,
+            decision.sizing_action,
+            decision.timing_action,
+            decision.sizing_multiplier,
+            decision.delay_bars,
+            decision.confidence,
+            json.dumps(decision.causal_parents),
+            decision.state_dim,
+            decision.regime,
+            decision.generated_at
+        )
+
     def _log_decision(self, decision: RLDecision):
         """Log RL decision to database"""
         try:
@@ -547,18 +811,26 @@ class CausalRLEngine:
                      generated_at)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT DO NOTHING
-                """, (
-                    decision.asset,
-                    decision.sizing_action,
-                    decision.timing_action,
-                    decision.sizing_multiplier,
-                    decision.delay_bars,
-                    decision.confidence,
-                    json.dumps(decision.causal_parents),
-                    decision.state_dim,
-                    decision.regime,
-                    decision.generated_at
-                ))
+                """, self._decision_row(decision))
+                self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            pass
+
+    def _log_decisions(self, decisions: List[RLDecision]):
+        """Log a batch of RL decisions with one multi-row insert"""
+        if not decisions:
+            return
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO fhq_alpha.rl_decisions
+                    (asset_id, sizing_action, timing_action, sizing_multiplier,
+                     delay_bars, confidence, causal_parents, state_dim, regime,
+                     generated_at)
+                    VALUES %s
+                    ON CONFLICT DO NOTHING
+                """, [self._decision_row(d) for d in decisions], page_size=len(decisions))
                 self.conn.commit()
         except Exception as e:
             self.conn.rollback()
@@ -632,6 +904,7 @@ class CausalRLEngine:
         result = self.causal_engine.run_full_discovery(assets)
 
         # Clear causal cache in state builders
+        self.state_builder._causal_cache.clear()
         for agent in self.agents.values():
             agent.state_builder._causal_cache.clear()
 
@@ -14,6 +14,13 @@ Implementation:
     Pre-trade correlation check rejects signals with correlation > 0.7
     to existing portfolio positions.
 
+Correlation:
+    Returns for all requested assets are fetched in one query and the
+    pairwise Pearson matrix is computed as Z^T Z over standardized returns
+    (one BLAS call per distinct series length), cached per (asset set,
+    date) with a TTL. Checking one new asset against a cached portfolio
+    matrix only computes the new row/column.
+
 Usage:
     from ios022_signal_cohesion import SignalCohesionEngine, check_signal_cohesion
 
@@ -27,8 +34,8 @@ import json
 import numpy as np
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Tuple, Optional
+from datetime import date, datetime, timezone, timedelta
+from typing import Dict, FrozenSet, List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 from dotenv import load_dotenv
@@ -64,6 +71,115 @@ class CohesionResult:
     checked_at: datetime
 
 
+def _standardize_window(window: np.ndarray) -> np.ndarray:
+    """
+    Center and unit-normalize each column of an (L x m) window.
+
+    Columns with zero standard deviation become all-zero, so their
+    correlations come out as 0.0 (matching _calculate_correlation).
+    """
+    centered = window - window.mean(axis=0)
+    norms = np.sqrt(np.einsum('ij,ij->j', centered, centered))
+    valid = np.std(window, axis=0) != 0
+    z = np.zeros_like(centered)
+    z[:, valid] = centered[:, valid] / norms[valid]
+    return z
+
+
+def _clean_correlations(values: np.ndarray) -> np.ndarray:
+    values = np.clip(values, -1.0, 1.0)
+    values[np.isnan(values)] = 0.0
+    return values
+
+
+class CorrelationMatrix:
+    """
+    Pairwise Pearson correlations of return series with a symbol index.
+
+    Each pair is correlated over its last min(len_a, len_b) returns, as in
+    SignalCohesionEngine._calculate_correlation, so pairs are grouped by
+    that window length: one Z^T Z product per distinct length (a single
+    BLAS call when all series are equally long). Pairs with fewer than
+    MIN_OBSERVATIONS returns, or a constant series, are 0.0.
+    """
+
+    MIN_OBSERVATIONS = 5
+
+    def __init__(self, symbols: List[str], series: List[np.ndarray], values: np.ndarray):
+        self.symbols = symbols
+        self.series = series
+        self.values = values
+        self.index = {s: i for i, s in enumerate(symbols)}
+
+    @classmethod
+    def from_returns(cls, returns: Dict[str, np.ndarray]) -> 'CorrelationMatrix':
+        symbols = list(returns)
+        series = [np.asarray(returns[s], dtype=float) for s in symbols]
+        lengths = np.array([len(x) for x in series], dtype=int)
+        values = np.zeros((len(series), len(series)))
+
+        for length in np.unique(lengths):
+            if length < cls.MIN_OBSERVATIONS:
+                continue
+            cols = np.flatnonzero(lengths >= length)
+            rows = np.flatnonzero(lengths[cols] == length)
+            z = _standardize_window(np.column_stack([series[j][-length:] for j in cols]))
+            block = _clean_correlations(z[:, rows].T @ z)
+            values[np.ix_(cols[rows], cols)] = block
+            values[np.ix_(cols, cols[rows])] = block.T
+
+        np.fill_diagonal(values, 1.0)
+        return cls(symbols, series, values)
+
+    def correlations_with(self, returns: np.ndarray) -> np.ndarray:
+        """Correlation of one more return series with every indexed symbol."""
+        returns = np.asarray(returns, dtype=float)
+        lengths = np.array([len(x) for x in self.series], dtype=int)
+        windows = np.minimum(lengths, len(returns))
+        row = np.zeros(len(self.series))
+
+        for length in np.unique(windows):
+            if length < self.MIN_OBSERVATIONS:
+                continue
+            cols = np.flatnonzero(windows == length)
+            z = _standardize_window(np.column_stack([self.series[j][-length:] for j in cols]))
+            z_new = _standardize_window(returns[-length:, None])[:, 0]
+            row[cols] = _clean_correlations(z.T @ z_new)
+
+        return row
+
+    def with_asset(self, symbol: str, returns: np.ndarray) -> 'CorrelationMatrix':
+        """New matrix bordered with one more symbol (one row/column computed)."""
+        if symbol in self.index:
+            return self
+        row = self.correlations_with(returns)
+        n = len(self.symbols)
+        values = np.empty((n + 1, n + 1))
+        values[:n, :n] = self.values
+        values[n, :n] = row
+        values[:n, n] = row
+        values[n, n] = 1.0
+        return CorrelationMatrix(self.symbols + [symbol], self.series + [np.asarray(returns, dtype=float)], values)
+
+    def get(self, asset_a: str, asset_b: str) -> float:
+        """Correlation of two symbols; 0.0 if either has no returns."""
+        i, j = self.index.get(asset_a), self.index.get(asset_b)
+        if i is None or j is None:
+            return 0.0
+        return float(self.values[i, j])
+
+    def to_dict(self, assets: List[str]) -> Dict[str, Dict[str, float]]:
+        """Nested-dict form returned by get_portfolio_correlation_matrix"""
+        matrix = {}
+        for asset_a in assets:
+            matrix[asset_a] = {}
+            if asset_a not in self.index:
+                continue
+            for asset_b in assets:
+                matrix[asset_a][asset_b] = self.get(asset_a, asset_b)
+        return matrix
+
+
 class SignalCohesionEngine:
     """
     Signal Cohesion Engine (STIG-2025-001)
@@ -82,36 +198,92 @@ class SignalCohesionEngine:
     REDUCE_THRESHOLD = 0.5      # Above this = SIZE_REDUCED
     LOOKBACK_DAYS = 30          # Rolling correlation window
 
-    def __init__(self):
-        self.conn = psycopg2.connect(**DB_CONFIG)
-        self._correlation_cache: Dict[str, Dict[str, float]] = {}
+    def __init__(self, conn=None):
+        self.conn = conn if conn is not None else psycopg2.connect(**DB_CONFIG)
+        self._returns_cache: Dict[str, Optional[np.ndarray]] = {}
+        self._matrix_cache: Dict[Tuple[FrozenSet[str], date], CorrelationMatrix] = {}
         self._cache_timestamp: Optional[datetime] = None
+        self._cache_date: Optional[date] = None
         self._cache_ttl = timedelta(hours=1)
 
     def _get_returns(self, assets: List[str], days: int = 30) -> Dict[str, np.ndarray]:
-        """Fetch daily returns for assets"""
-        returns = {}
+        """Fetch daily returns for assets (one query)"""
+        assets = list(dict.fromkeys(assets))
+        if not assets:
+            return {}
 
+        closes: Dict[str, List[float]] = {}
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            for asset in assets:
-                cur.execute("""
-                    SELECT timestamp::date as date, close
-                    FROM fhq_market.prices
-                    WHERE canonical_id = %s
-                      AND timestamp >= NOW() - INTERVAL '%s days'
-                    ORDER BY timestamp
-                """, (asset, days + 5))  # Extra days for return calc
-
-                rows = cur.fetchall()
-                if len(rows) >= 2:
-                    closes = np.array([float(r['close']) for r in rows])
-                    daily_returns = np.diff(np.log(closes))
-                    returns[asset] = daily_returns
+            cur.execute("""
+                SELECT canonical_id, timestamp::date as date, close
+                FROM fhq_market.prices
+                WHERE canonical_id = ANY(%s)
+                  AND timestamp >= NOW() - INTERVAL '%s days'
+                ORDER BY canonical_id, timestamp
+            """, (assets, days + 5))  # Extra days for return calc
+
+            for r in cur.fetchall():
+                closes.setdefault(r['canonical_id'], []).append(float(r['close']))
 
+        returns = {}
+        for asset in assets:
+            if len(closes.get(asset, [])) >= 2:
+                returns[asset] = np.diff(np.log(np.array(closes[asset])))
         return returns
 
+    # =========================================================================
+    # CORRELATION CACHE
+    # =========================================================================
+
+    def _expire_cache(self):
+        """Drop cached returns/matrices once the TTL passes or the date rolls"""
+        now = datetime.now(timezone.utc)
+        if self._cache_timestamp is None or now - self._cache_timestamp > self._cache_ttl \
+                or now.date() != self._cache_date:
+            self._returns_cache = {}
+            self._matrix_cache = {}
+            self._cache_timestamp = now
+            self._cache_date = now.date()
+
+    def _cached_returns(self, assets: List[str]) -> Dict[str, np.ndarray]:
+        """Returns for assets, fetching only those not cached yet"""
+        missing = [a for a in dict.fromkeys(assets) if a not in self._returns_cache]
+        if missing:
+            fetched = self._get_returns(missing, self.LOOKBACK_DAYS)
+            for asset in missing:
+                self._returns_cache[asset] = fetched.get(asset)
+        return {a: self._returns_cache[a] for a in dict.fromkeys(assets)
+                if self._returns_cache[a] is not None}
+
+    def _correlation_matrix(self, assets: List[str], use_cache: bool = True) -> CorrelationMatrix:
+        """
+        Correlation matrix for an asset set.
+
+        Cached per (asset set, date) within the TTL. If only the matrix for
+        the set minus one asset is cached, that matrix is extended by one
+        row/column instead of being rebuilt.
+        """
+        assets = list(dict.fromkeys(assets))
+        if not use_cache:
+            return CorrelationMatrix.from_returns(self._get_returns(assets, self.LOOKBACK_DAYS))
+
+        self._expire_cache()
+        key = (frozenset(assets), self._cache_date)
+        if key in self._matrix_cache:
+            return self._matrix_cache[key]
+
+        for asset in assets:
+            base = self._matrix_cache.get((key[0] - {asset}, self._cache_date))
+            if base is not None:
+                returns = self._cached_returns([asset])
+                return base.with_asset(asset, returns[asset]) if asset in returns else base
+
+        matrix = CorrelationMatrix.from_returns(self._cached_returns(assets))
+        self._matrix_cache[key] = matrix
+        return matrix
+
     def _calculate_correlation(self, returns_a: np.ndarray, returns_b: np.ndarray) -> float:
-        """Calculate Pearson correlation between two return series"""
+        """Calculate Pearson correlation between two return series (pairwise reference for CorrelationMatrix)"""
         # Align lengths
         min_len = min(len(returns_a), len(returns_b))
         if min_len < 5:
@@ -134,25 +306,7 @@ class SignalCohesionEngine:
 
     def _build_correlation_matrix(self, assets: List[str]) -> Dict[str, Dict[str, float]]:
         """Build correlation matrix for all assets"""
-        returns = self._get_returns(assets, self.LOOKBACK_DAYS)
-
-        matrix = {}
-        for asset_a in assets:
-            matrix[asset_a] = {}
-            if asset_a not in returns:
-                continue
-
-            for asset_b in assets:
-                if asset_b not in returns:
-                    matrix[asset_a][asset_b] = 0.0
-                elif asset_a == asset_b:
-                    matrix[asset_a][asset_b] = 1.0
-                else:
-                    matrix[asset_a][asset_b] = self._calculate_correlation(
-                        returns[asset_a], returns[asset_b]
-                    )
-
-        return matrix
+        return self._correlation_matrix(assets, use_cache=False).to_dict(assets)
 
     def check_cohesion(
         self,
@@ -184,31 +338,19 @@ class SignalCohesionEngine:
                 checked_at=datetime.now(timezone.utc)
             )
 
-        # Check cache
-        if use_cache and self._cache_timestamp:
-            cache_age = datetime.now(timezone.utc) - self._cache_timestamp
-            if cache_age > self._cache_ttl:
-                self._correlation_cache = {}
-
-        # Build correlation matrix
-        all_assets = list(set([new_asset] + portfolio))
-
-        if not use_cache or new_asset not in self._correlation_cache:
-            matrix = self._build_correlation_matrix(all_assets)
-            for asset, correlations in matrix.items():
-                self._correlation_cache[asset] = correlations
-            self._cache_timestamp = datetime.now(timezone.utc)
+        # Portfolio matrix (cached) extended by the new asset
+        if use_cache:
+            self._expire_cache()
+            self._cached_returns(list(portfolio) + [new_asset])
+            self._correlation_matrix(portfolio)
+        matrix = self._correlation_matrix(list(portfolio) + [new_asset], use_cache)
 
         # Calculate correlations with portfolio
         correlations = {}
         for port_asset in portfolio:
             if port_asset == new_asset:
                 continue
-            if new_asset in self._correlation_cache:
-                corr = self._correlation_cache[new_asset].get(port_asset, 0.0)
-            else:
-                corr = 0.0
-            correlations[port_asset] = abs(corr)  # Use absolute correlation
+            correlations[port_asset] = abs(matrix.get(new_asset, port_asset))  # Use absolute correlation
 
         # Compute metrics
         if correlations:
@@ -274,7 +416,7 @@ class SignalCohesionEngine:
 
     def get_portfolio_correlation_matrix(self, portfolio: List[str]) -> Dict[str, Dict[str, float]]:
         """Get full correlation matrix for portfolio"""
-        return self._build_correlation_matrix(portfolio)
+        return self._correlation_matrix(portfolio).to_dict(portfolio)
 
     def find_diversifying_assets(
         self,
@@ -289,6 +431,10 @@ class SignalCohesionEngine:
         """
         results = []
 
+        # One returns query for the portfolio and every candidate
+        self._expire_cache()
+        self._cached_returns(list(portfolio) + list(candidates))
+
         for candidate in candidates:
             if candidate in portfolio:
                 continue
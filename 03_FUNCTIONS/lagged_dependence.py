@@ -0,0 +1,293 @@
+"""
+Lagged Dependence Engine: Matrix-Based Lead-Lag Discovery
+==========================================================
+ADR Reference: STIG-2025-001 Directive - Hierarchical Causal Discovery
+
+Fallback causal discovery for IoS-019 when tigramite is not installed.
+
+Stage 1 - lagged correlation:
+    r[i, j, tau] = corr(x_i[t - tau], x_j[t]) for every pair and every
+    lag 1..tau_max, one matrix product per lag. Exact two-sided
+    t-distribution p-values (dof = n - 2).
+
+Stage 2 - MCI-style conditioning (optional):
+    Approximates PCMCI's MCI step. Each stage-1 significant link
+    (i, tau) -> j is re-tested as a partial correlation given
+    P(j) \\ {(i, tau)} plus P(i) shifted by tau, where P(.) are the
+    strongest stage-1 parents (max_conds per node, autolags included).
+    Residuals come from batched QR least squares, grouped by
+    conditioning-set size (dof = n - 2 - |Z|).
+
+Multiple testing:
+    Benjamini-Hochberg ('fdr_bh') or Bonferroni over all
+    N * (N - 1) * tau_max cross links.
+
+Results use tigramite's layout: val_matrix / p_matrix of shape
+(N, N, tau_max + 1) indexed [source, target, lag]; lag 0 is unused.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy import stats
+
+MIN_SAMPLES = 20          # Lags with fewer aligned samples are not tested
+QR_CHUNK_SIZE = 1024      # Links per batched QR call (bounds memory)
+
+CORRECTION_METHODS = ('fdr_bh', 'bonferroni', 'none')
+
+
+@dataclass
+class LaggedDependenceResult:
+    """Lagged dependence matrices, tigramite layout [source, target, lag]."""
+    val_matrix: np.ndarray            # correlation (partial if conditioned)
+    p_matrix: np.ndarray              # raw p-values
+    q_matrix: np.ndarray              # p-values after multiple-testing correction
+    var_names: List[str]
+    tau_max: int
+    correction: str
+    conditioned: bool
+    n_tests: int
+    n_conditioned: int = 0
+    n_samples: Dict[int, int] = field(default_factory=dict)
+
+    def significant_links(self, alpha: float, min_strength: float = 0.0) -> List[Tuple[int, int, int, float, float]]:
+        """(source, target, lag, strength, q) for cross links with q < alpha and |strength| > min_strength."""
+        return significant_links(self.val_matrix, self.q_matrix, alpha, min_strength)
+
+
+# =============================================================================
+# STAGE 1: LAGGED CORRELATION
+# =============================================================================
+
+def _standardize(block: np.ndarray) -> np.ndarray:
+    """Column z-scores (ddof=0); constant columns become zeros."""
+    centered = block - block.mean(axis=0)
+    std = np.sqrt((centered ** 2).mean(axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(std > 0, centered / std, 0.0)
+    return z
+
+
+def lagged_correlation_matrix(X: np.ndarray, tau_max: int,
+                              min_samples: int = MIN_SAMPLES) -> Tuple[np.ndarray, Dict[int, int]]:
+    """
+    Correlation of x_i[t - tau] with x_j[t] for all i, j and tau in 1..tau_max.
+
+    Args:
+        X: (T, N) aligned series
+        tau_max: Maximum lag
+        min_samples: Minimum aligned samples per lag
+
+    Returns:
+        (val_matrix (N, N, tau_max + 1), {tau: n_samples}); untested entries are NaN
+    """
+    T, N = X.shape
+    val = np.full((N, N, tau_max + 1), np.nan)
+    n_samples = {}
+    for tau in range(1, tau_max + 1):
+        n = T - tau
+        if n < min_samples:
+            continue
+        lagged, current = _standardize(X[:n]), _standardize(X[tau:])
+        val[:, :, tau] = np.clip(lagged.T @ current / n, -1.0, 1.0)
+        n_samples[tau] = n
+    return val, n_samples
+
+
+def correlation_pvalues(r: np.ndarray, dof) -> np.ndarray:
+    """Two-sided p-values of (partial) correlations under H0: rho = 0."""
+    r = np.asarray(r, dtype=float)
+    dof = np.broadcast_to(np.asarray(dof, dtype=float), r.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = r * np.sqrt(dof / (1.0 - r ** 2))
+        p = 2.0 * stats.t.sf(np.abs(t_stat), dof)
+    p = np.where(np.abs(r) >= 1.0, 0.0, p)
+    return np.where(np.isfinite(r) & (dof > 0), p, np.nan)
+
+
+def adjust_pvalues(p: np.ndarray, mask: np.ndarray, method: str = 'fdr_bh') -> np.ndarray:
+    """
+    Multiple-testing correction over the entries selected by mask.
+
+    Untested entries inside the mask (NaN) count as p = 1. Entries outside
+    the mask are returned as NaN.
+    """
+    if method not in CORRECTION_METHODS:
+        raise ValueError(f"Unknown correction method: {method}")
+
+    q = np.full(p.shape, np.nan)
+    family = np.where(np.isnan(p[mask]), 1.0, p[mask])
+    m = family.size
+    if m == 0:
+        return q
+
+    if method == 'none':
+        adjusted = family
+    elif method == 'bonferroni':
+        adjusted = np.minimum(1.0, family * m)
+    else:
+        order = np.argsort(family, kind='stable')
+        ranked = family[order] * m / np.arange(1, m + 1)
+        ranked = np.minimum(1.0, np.minimum.accumulate(ranked[::-1])[::-1])
+        adjusted = np.empty(m)
+        adjusted[order] = ranked
+    q[mask] = adjusted
+    return q
+
+
+def cross_link_mask(n_vars: int, tau_max: int, taus) -> np.ndarray:
+    """Mask of testable cross links: i != j over the given lags."""
+    mask = np.zeros((n_vars, n_vars, tau_max + 1), dtype=bool)
+    for tau in taus:
+        mask[:, :, tau] = True
+    mask[np.arange(n_vars), np.arange(n_vars), :] = False
+    return mask
+
+
+# =============================================================================
+# STAGE 2: MCI-STYLE PARTIAL CORRELATION
+# =============================================================================
+
+def select_parents(val: np.ndarray, p: np.ndarray, alpha: float, max_conds: int) -> List[List[Tuple[int, int]]]:
+    """Per target: up to max_conds (source, lag) links with p < alpha, strongest first (autolags included)."""
+    N = val.shape[0]
+    parents = []
+    for j in range(N):
+        strength = np.where(p[:, j, :] < alpha, np.abs(val[:, j, :]), -1.0)
+        strength[:, 0] = -1.0
+        flat = np.argsort(-strength, axis=None, kind='stable')[:max_conds]
+        parents.append([(int(i), int(tau)) for i, tau in zip(*np.unravel_index(flat, strength.shape))
+                        if strength[i, tau] >= 0])
+    return parents
+
+
+def _conditioning_set(i: int, j: int, tau: int, parents: List[List[Tuple[int, int]]]) -> List[Tuple[int, int]]:
+    """P(j) without the tested link, plus P(i) shifted by tau (deduplicated, order kept)."""
+    conds = [link for link in parents[j] if link != (i, tau)]
+    conds += [(k, lag + tau) for k, lag in parents[i]]
+    return list(dict.fromkeys(c for c in conds if c != (i, tau)))
+
+
+def mci_partial_correlations(X: np.ndarray, val: np.ndarray, p: np.ndarray, tau_max: int,
+                             alpha: float, max_conds: int = 3,
+                             chunk_size: int = QR_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Re-test stage-1 significant cross links as partial correlations.
+
+    All conditioned regressions share the window t in [2 * tau_max, T) so
+    that shifted source parents (lag up to 2 * tau_max) are available.
+
+    Returns:
+        (val_mci, p_mci, n_conditioned). Links that were not re-tested keep
+        their stage-1 value and p-value.
+    """
+    T, N = X.shape
+    max_lag = 2 * tau_max
+    n = T - max_lag
+    val_mci, p_mci = val.copy(), p.copy()
+    if n < MIN_SAMPLES:
+        return val_mci, p_mci, 0
+
+    parents = select_parents(val, p, alpha, max_conds)
+    sources, targets, lags = np.nonzero((p < alpha) & cross_link_mask(N, tau_max, range(1, tau_max + 1)))
+    if sources.size == 0:
+        return val_mci, p_mci, 0
+
+    # embedded[lag] is X shifted by lag over the common window
+    embedded = np.stack([X[max_lag - lag:T - lag] for lag in range(max_lag + 1)])
+
+    groups: Dict[int, List[Tuple[int, int, int, List[Tuple[int, int]]]]] = {}
+    for i, j, tau in zip(sources.tolist(), targets.tolist(), lags.tolist()):
+        conds = _conditioning_set(i, j, tau, parents)
+        groups.setdefault(len(conds), []).append((i, j, tau, conds))
+
+    for k, links in groups.items():
+        for start in range(0, len(links), chunk_size):
+            chunk = links[start:start + chunk_size]
+            m = len(chunk)
+            src = np.array([c[0] for c in chunk])
+            tgt = np.array([c[1] for c in chunk])
+            lag = np.array([c[2] for c in chunk])
+
+            # Y: (m, n, 2) = [x_i(t - tau), x_j(t)]
+            Y = np.stack([embedded[lag, :, src], embedded[np.zeros(m, dtype=int), :, tgt]], axis=2)
+
+            # Z: (m, n, k + 1) conditioning columns plus intercept
+            Z = np.ones((m, n, k + 1))
+            if k:
+                cond_vars = np.array([[v for v, _ in c[3]] for c in chunk])
+                cond_lags = np.array([[l for _, l in c[3]] for c in chunk])
+                Z[:, :, 1:] = np.transpose(embedded[cond_lags, :, cond_vars], (0, 2, 1))
+
+            Q, _ = np.linalg.qr(Z)
+            resid = Y - Q @ (np.transpose(Q, (0, 2, 1)) @ Y)
+            rx, ry = resid[:, :, 0], resid[:, :, 1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                r = (rx * ry).sum(axis=1) / np.sqrt((rx ** 2).sum(axis=1) * (ry ** 2).sum(axis=1))
+            r = np.clip(np.nan_to_num(r), -1.0, 1.0)
+
+            val_mci[src, tgt, lag] = r
+            p_mci[src, tgt, lag] = correlation_pvalues(r, n - 2 - k)
+
+    return val_mci, p_mci, int(sources.size)
+
+
+# =============================================================================
+# ENTRY POINTS
+# =============================================================================
+
+def run_lagged_dependence(X: np.ndarray, var_names: List[str], tau_max: int, alpha: float = 0.05,
+                          correction: str = 'fdr_bh', conditioning: bool = False,
+                          max_conds: int = 3) -> LaggedDependenceResult:
+    """
+    Lagged dependence for all pairs and lags 1..tau_max.
+
+    Args:
+        X: (T, N) aligned series (columns in var_names order)
+        var_names: Column names
+        tau_max: Maximum lag
+        alpha: Stage-1 significance for parent selection and re-testing
+        correction: 'fdr_bh', 'bonferroni' or 'none'
+        conditioning: Run the MCI-style partial-correlation stage
+        max_conds: Parents per node in the conditioning sets
+
+    Returns:
+        LaggedDependenceResult
+    """
+    X = np.asarray(X, dtype=float)
+    T, N = X.shape
+    val, n_samples = lagged_correlation_matrix(X, tau_max)
+    dof = np.array([n_samples.get(tau, 0) - 2 for tau in range(tau_max + 1)])
+    p = correlation_pvalues(val, dof)
+
+    n_conditioned = 0
+    if conditioning:
+        val, p, n_conditioned = mci_partial_correlations(X, val, p, tau_max, alpha, max_conds)
+
+    mask = cross_link_mask(N, tau_max, n_samples)
+    return LaggedDependenceResult(
+        val_matrix=val,
+        p_matrix=p,
+        q_matrix=adjust_pvalues(p, mask, correction),
+        var_names=list(var_names),
+        tau_max=tau_max,
+        correction=correction,
+        conditioned=conditioning,
+        n_tests=int(mask.sum()),
+        n_conditioned=n_conditioned,
+        n_samples=n_samples
+    )
+
+
+def significant_links(val: np.ndarray, q: np.ndarray, alpha: float,
+                      min_strength: float = 0.0) -> List[Tuple[int, int, int, float, float]]:
+    """(source, target, lag, strength, q) in [source, target, lag] order."""
+    N = val.shape[0]
+    with np.errstate(invalid='ignore'):
+        hits = (q < alpha) & (np.abs(val) > min_strength)
+    hits[np.arange(N), np.arange(N), :] = False
+    hits[:, :, 0] = False
+    return [(int(i), int(j), int(tau), float(val[i, j, tau]), float(q[i, j, tau]))
+            for i, j, tau in zip(*np.nonzero(hits))]
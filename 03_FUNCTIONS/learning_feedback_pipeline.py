@@ -23,11 +23,11 @@ import os
 import json
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 
 logging.basicConfig(
     level=logging.INFO,
@@ -110,6 +110,10 @@ class LearningFeedbackPipeline:
     PNL_SCALE = 10.0  # Scale factor for converting PnL% to reward
     WIN_THRESHOLD = 0.0  # PnL threshold for binary win/loss
 
+    # Batch mode
+    PAGE_SIZE = 500
+    STATS_SCALE = Decimal('0.0001')  # NUMERIC(p,4) columns of strategy_performance_stats
+
     def __init__(self):
         self.conn = None
         self.bandit_systems: Dict[str, RegimeBanditSystem] = {}
@@ -137,7 +141,7 @@ class LearningFeedbackPipeline:
             return None
 
         if strategy not in self.bandit_systems:
-            self.bandit_systems[strategy] = RegimeBanditSystem(strategy=strategy)
+            self.bandit_systems[strategy] = RegimeBanditSystem(strategy=strategy, conn=self.conn)
 
         return self.bandit_systems[strategy]
 
@@ -172,7 +176,9 @@ class LearningFeedbackPipeline:
                 cur.execute(sql)
                 rows = cur.fetchall()
 
-            return [TradeOutcome(**row) for row in rows]
+            numeric = ('entry_price', 'exit_price', 'realized_pnl', 'realized_pnl_pct', 'max_drawdown_pct')
+            return [TradeOutcome(**{**row, **{k: float(row[k]) for k in numeric if row[k] is not None}})
+                    for row in rows]
         except Exception as e:
             logger.error(f"Error fetching pending outcomes: {e}")
             return []
@@ -211,17 +217,7 @@ class LearningFeedbackPipeline:
             proposals = self.submit_cognitive_learning_proposals(outcome)
             if proposals:
                 # Log that proposals were submitted (not applied)
-                proposal_update = LearningUpdate(
-                    update_id='',
-                    outcome_id=outcome.outcome_id,
-                    learning_system='COGNITIVE_PROPOSALS',
-                    action='STAGED_FOR_REVIEW',
-                    reward=0.0,
-                    prior_state={},
-                    posterior_state={'proposals': proposals},
-                    created_at=datetime.now(timezone.utc)
-                )
-                updates.append(proposal_update)
+                updates.append(self._proposal_update(outcome, proposals))
         except Exception as e:
             logger.warning(f"Cognitive proposal submission failed: {e}")
 
@@ -230,6 +226,70 @@ class LearningFeedbackPipeline:
 
         return updates
 
+    def process_outcomes_batch(self, outcomes: List[TradeOutcome]) -> Dict[str, List[LearningUpdate]]:
+        """
+        Process many trade outcomes through all learning systems in bulk.
+
+        Same learning systems and final state as process_outcome per
+        outcome, in order:
+        - Thompson Bandit: outcomes grouped by strategy and regime, applied
+          as aggregated posterior increments, states saved once per strategy
+        - Causal RL: per outcome (agents are order-dependent), with causal
+          alignments prefetched in two queries
+        - Strategy statistics: one grouped upsert
+        - Cognitive proposals: one bulk submission (staging only, Mandate IV)
+        - Outcomes marked processed and updates logged in one transaction
+
+        Returns {outcome_id: learning updates applied}.
+        """
+        bandit_updates = self._update_thompson_bandits_batch(outcomes)
+
+        rl_updates = {}
+        if self.rl_engine:
+            alignments = self._get_causal_alignments(outcomes)
+            for outcome in outcomes:
+                rl_updates[outcome.outcome_id] = self._update_causal_rl(
+                    outcome, causal_alignment=alignments.get(outcome.outcome_id)
+                )
+
+        stats_updates = self._update_strategy_stats_batch(outcomes)
+
+        try:
+            proposals = self.submit_cognitive_learning_proposals_batch(outcomes)
+        except Exception as e:
+            logger.warning(f"Cognitive proposal submission failed: {e}")
+            proposals = {}
+
+        updates = {}
+        for outcome in outcomes:
+            outcome_updates = [
+                update for update in (
+                    bandit_updates.get(outcome.outcome_id),
+                    rl_updates.get(outcome.outcome_id),
+                    stats_updates.get(outcome.outcome_id)
+                ) if update
+            ]
+            if proposals.get(outcome.outcome_id):
+                outcome_updates.append(self._proposal_update(outcome, proposals[outcome.outcome_id]))
+            updates[outcome.outcome_id] = outcome_updates
+
+        self._mark_outcomes_processed(updates)
+
+        return updates
+
+    def _proposal_update(self, outcome: TradeOutcome, proposals: Dict[str, Optional[str]]) -> LearningUpdate:
+        """Audit record for proposals staged for review (not applied)."""
+        return LearningUpdate(
+            update_id='',
+            outcome_id=outcome.outcome_id,
+            learning_system='COGNITIVE_PROPOSALS',
+            action='STAGED_FOR_REVIEW',
+            reward=0.0,
+            prior_state={},
+            posterior_state={'proposals': proposals},
+            created_at=datetime.now(timezone.utc)
+        )
+
     # =========================================================================
     # THOMPSON BANDIT UPDATES
     # =========================================================================
@@ -245,16 +305,8 @@ class LearningFeedbackPipeline:
             return None
 
         # Get prior state
-        prior_state = {
-            'sizing_means': {},
-            'timing_means': {}
-        }
-
         regime = self._map_regime(outcome.regime_at_entry)
-        if regime in bandit_system.sizing_bandits:
-            prior_state['sizing_means'] = bandit_system.sizing_bandits[regime].get_estimated_means()
-        if regime in bandit_system.timing_bandits:
-            prior_state['timing_means'] = bandit_system.timing_bandits[regime].get_estimated_means()
+        prior_state = self._bandit_means(bandit_system, regime)
 
         # Convert PnL to reward
         # Positive PnL = success, negative = failure
@@ -277,14 +329,7 @@ class LearningFeedbackPipeline:
             return None
 
         # Get posterior state
-        posterior_state = {
-            'sizing_means': {},
-            'timing_means': {}
-        }
-        if regime in bandit_system.sizing_bandits:
-            posterior_state['sizing_means'] = bandit_system.sizing_bandits[regime].get_estimated_means()
-        if regime in bandit_system.timing_bandits:
-            posterior_state['timing_means'] = bandit_system.timing_bandits[regime].get_estimated_means()
+        posterior_state = self._bandit_means(bandit_system, regime)
 
         update = LearningUpdate(
             update_id='',  # Set by database
@@ -302,6 +347,69 @@ class LearningFeedbackPipeline:
 
         return update
 
+    def _update_thompson_bandits_batch(self, outcomes: List[TradeOutcome]) -> Dict[str, LearningUpdate]:
+        """
+        Thompson Bandit updates for many outcomes, grouped by strategy and regime.
+
+        Each strategy's bandits receive aggregated increments
+        (RegimeBanditSystem.update_many) and are saved once. The audit
+        record of every outcome carries its regime's means before and
+        after the whole group.
+        """
+        groups: Dict[str, Dict[str, List[TradeOutcome]]] = {}
+        for outcome in outcomes:
+            regime = self._map_regime(outcome.regime_at_entry)
+            groups.setdefault(outcome.strategy_source, {}).setdefault(regime, []).append(outcome)
+
+        updates = {}
+        for strategy, by_regime in groups.items():
+            bandit_system = self._get_bandit_system(strategy)
+            if not bandit_system:
+                return {}
+
+            prior_states = {regime: self._bandit_means(bandit_system, regime) for regime in by_regime}
+            try:
+                bandit_system.update_many([
+                    (regime, outcome.sizing_action, outcome.timing_action, outcome.realized_pnl_pct / 100.0)
+                    for regime, group in by_regime.items()
+                    for outcome in group
+                ])
+            except Exception as e:
+                logger.error(f"Bandit batch update failed for {strategy}: {e}")
+                continue
+
+            for regime, group in by_regime.items():
+                posterior_state = {**self._bandit_means(bandit_system, regime), 'batch_outcomes': len(group)}
+                for outcome in group:
+                    updates[outcome.outcome_id] = LearningUpdate(
+                        update_id='',
+                        outcome_id=outcome.outcome_id,
+                        learning_system='THOMPSON_BANDIT',
+                        action=f"{outcome.sizing_action}|{outcome.timing_action}",
+                        reward=outcome.realized_pnl_pct / 100.0,
+                        prior_state=prior_states[regime],
+                        posterior_state=posterior_state,
+                        created_at=datetime.now(timezone.utc)
+                    )
+
+            logger.info(f"Thompson Bandit updated: {strategy} "
+                       f"{sum(len(g) for g in by_regime.values())} outcomes in {len(by_regime)} regimes")
+
+        return updates
+
+    @staticmethod
+    def _bandit_means(bandit_system: 'RegimeBanditSystem', regime: str) -> Dict:
+        """Sizing and timing posterior means of one regime."""
+        state = {
+            'sizing_means': {},
+            'timing_means': {}
+        }
+        if regime in bandit_system.sizing_bandits:
+            state['sizing_means'] = bandit_system.sizing_bandits[regime].get_estimated_means()
+        if regime in bandit_system.timing_bandits:
+            state['timing_means'] = bandit_system.timing_bandits[regime].get_estimated_means()
+        return state
+
     def _map_regime(self, regime: str) -> str:
         """Map regime names to bandit system regimes."""
         mapping = {
@@ -321,11 +429,16 @@ class LearningFeedbackPipeline:
     # CAUSAL RL UPDATES
     # =========================================================================
 
-    def _update_causal_rl(self, outcome: TradeOutcome) -> Optional[LearningUpdate]:
+    def _update_causal_rl(
+        self,
+        outcome: TradeOutcome,
+        causal_alignment: Optional[float] = None
+    ) -> Optional[LearningUpdate]:
         """
         Update Causal RL agent with trade outcome.
 
-        Propagates reward to per-asset agent based on causal alignment.
+        Propagates reward to per-asset agent based on causal alignment
+        (queried unless given, see _get_causal_alignments).
         """
         if not self.rl_engine:
             return None
@@ -340,7 +453,8 @@ class LearningFeedbackPipeline:
             holding_period=outcome.hold_duration_minutes // 60,  # Convert to bars (hourly)
             regime_at_entry=outcome.regime_at_entry,
             regime_at_exit=outcome.regime_at_exit,
-            causal_alignment=self._get_causal_alignment(outcome)
+            causal_alignment=(self._get_causal_alignment(outcome)
+                              if causal_alignment is None else causal_alignment)
         )
 
         # Get prior state
@@ -418,6 +532,80 @@ class LearningFeedbackPipeline:
 
         return aligned / len(parents) if parents else 0.5
 
+    def _get_causal_alignments(self, outcomes: List[TradeOutcome]) -> Dict[str, float]:
+        """
+        _get_causal_alignment for many outcomes with two queries: active
+        causal parents (up to 5 per asset) and the last two closes of every
+        parent.
+
+        Returns {outcome_id: alignment}.
+        """
+        assets = sorted({o.canonical_id for o in outcomes})
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("""
+                    SELECT target_id, source_id
+                    FROM (
+                        SELECT target_id, source_id,
+                               ROW_NUMBER() OVER (PARTITION BY target_id) AS rn
+                        FROM fhq_alpha.causal_edges
+                        WHERE target_id = ANY(%s)
+                          AND is_active = true
+                    ) edges
+                    WHERE rn <= 5
+                """, (assets,))
+                parents: Dict[str, List[str]] = {}
+                for target_id, source_id in cur.fetchall():
+                    parents.setdefault(target_id, []).append(source_id)
+        except Exception as e:
+            logger.warning(f"Causal parents query failed: {e}")
+            self.conn.rollback()
+            return {o.outcome_id: 0.5 for o in outcomes}  # Default neutral alignment
+
+        # Parent return over the last two bars; None where undefined
+        parent_returns: Dict[str, Optional[Decimal]] = {}
+        sources = sorted({source for sources in parents.values() for source in sources})
+        if sources:
+            try:
+                with self.conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT listing_id, close
+                        FROM (
+                            SELECT listing_id, close,
+                                   ROW_NUMBER() OVER (PARTITION BY listing_id ORDER BY date DESC) AS rn
+                            FROM fhq_data.price_series
+                            WHERE listing_id = ANY(%s)
+                        ) recent
+                        WHERE rn <= 2
+                        ORDER BY listing_id, rn
+                    """, (sources,))
+                    closes: Dict[str, List] = {}
+                    for listing_id, close in cur.fetchall():
+                        closes.setdefault(listing_id, []).append(close)
+                for source, recent in closes.items():
+                    if len(recent) == 2 and recent[0] is not None and recent[1]:
+                        parent_returns[source] = Decimal(str(recent[0])) / Decimal(str(recent[1])) - 1
+            except Exception as e:
+                logger.warning(f"Causal parent returns query failed: {e}")
+                self.conn.rollback()
+
+        alignments = {}
+        for outcome in outcomes:
+            asset_parents = parents.get(outcome.canonical_id)
+            if not asset_parents:
+                alignments[outcome.outcome_id] = 0.5
+                continue
+            our_direction = 1 if outcome.realized_pnl > 0 else -1
+            aligned = 0
+            for source in asset_parents:
+                parent_return = parent_returns.get(source)
+                if parent_return:
+                    parent_direction = 1 if parent_return > 0 else -1
+                    if parent_direction == our_direction:
+                        aligned += 1
+            alignments[outcome.outcome_id] = aligned / len(asset_parents)
+        return alignments
+
     # =========================================================================
     # STRATEGY STATISTICS
     # =========================================================================
@@ -483,7 +671,13 @@ class LearningFeedbackPipeline:
             self._ensure_stats_table()
             return None
 
-        update = LearningUpdate(
+        logger.info(f"Strategy stats updated: {outcome.strategy_source}")
+
+        return self._stats_update(outcome)
+
+    def _stats_update(self, outcome: TradeOutcome) -> LearningUpdate:
+        """Audit record for a strategy statistics update."""
+        return LearningUpdate(
             update_id='',
             outcome_id=outcome.outcome_id,
             learning_system='STRATEGY_STATS',
@@ -494,9 +688,121 @@ class LearningFeedbackPipeline:
             created_at=datetime.now(timezone.utc)
         )
 
-        logger.info(f"Strategy stats updated: {outcome.strategy_source}")
+    def _update_strategy_stats_batch(self, outcomes: List[TradeOutcome]) -> Dict[str, LearningUpdate]:
+        """
+        Strategy statistics for many outcomes with one grouped upsert.
 
-        return update
+        The current rows are read (and locked), the per-outcome upserts of
+        _update_strategy_stats are folded in order (_fold_strategy_stats)
+        and the final row of every strategy is written at once, so the
+        table ends up exactly as after sequential processing. If the table
+        is missing it is created and the batch retried once.
+        """
+        strategies = sorted({o.strategy_source for o in outcomes})
+        columns = ('total_trades', 'winning_trades', 'total_pnl', 'total_pnl_pct',
+                   'max_drawdown_pct', 'avg_hold_minutes')
+        sql = """
+            INSERT INTO fhq_execution.strategy_performance_stats (
+                strategy_source,
+                total_trades,
+                winning_trades,
+                total_pnl,
+                total_pnl_pct,
+                max_drawdown_pct,
+                avg_hold_minutes,
+                updated_at
+            ) VALUES %s
+            ON CONFLICT (strategy_source) DO UPDATE SET
+                total_trades = EXCLUDED.total_trades,
+                winning_trades = EXCLUDED.winning_trades,
+                total_pnl = EXCLUDED.total_pnl,
+                total_pnl_pct = EXCLUDED.total_pnl_pct,
+                max_drawdown_pct = EXCLUDED.max_drawdown_pct,
+                avg_hold_minutes = EXCLUDED.avg_hold_minutes,
+                updated_at = NOW()
+        """
+
+        for attempt in range(2):
+            try:
+                with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute("""
+                        SELECT strategy_source, total_trades, winning_trades, total_pnl,
+                               total_pnl_pct, max_drawdown_pct, avg_hold_minutes
+                        FROM fhq_execution.strategy_performance_stats
+                        WHERE strategy_source = ANY(%s)
+                        FOR UPDATE
+                    """, (strategies,))
+                    rows = {row['strategy_source']: dict(row) for row in cur.fetchall()}
+
+                try:
+                    for outcome in outcomes:
+                        rows[outcome.strategy_source] = self._fold_strategy_stats(
+                            rows.get(outcome.strategy_source), outcome
+                        )
+                except Exception as e:
+                    logger.error(f"Strategy stats fold failed for outcome {outcome.outcome_id}: {e}")
+                    self.conn.rollback()
+                    return {}
+
+                with self.conn.cursor() as cur:
+                    execute_values(cur, sql, [
+                        (strategy, *(rows[strategy][column] for column in columns))
+                        for strategy in strategies
+                    ], template="(%s, %s, %s, %s, %s, %s, %s, NOW())", page_size=self.PAGE_SIZE)
+                self.conn.commit()
+                break
+            except Exception as e:
+                logger.warning(f"Strategy stats batch update failed (table may not exist): {e}")
+                self.conn.rollback()
+                if attempt:
+                    return {}
+                self._ensure_stats_table()
+
+        logger.info(f"Strategy stats updated: {len(outcomes)} outcomes, {len(strategies)} strategies")
+
+        return {outcome.outcome_id: self._stats_update(outcome) for outcome in outcomes}
+
+    @classmethod
+    def _fold_strategy_stats(cls, row: Optional[Dict], outcome: TradeOutcome) -> Dict:
+        """
+        The strategy_performance_stats row after _update_strategy_stats for
+        one more outcome: its INSERT ... ON CONFLICT DO UPDATE evaluated in
+        Python (NUMERIC(p,4) columns rounded half away from zero,
+        avg_hold_minutes by truncating integer division, and GREATEST
+        ignoring a NULL max_drawdown_pct).
+        """
+        def numeric(value) -> Optional[Decimal]:
+            if value is None:
+                return None
+            return Decimal(str(value)).quantize(cls.STATS_SCALE, rounding=ROUND_HALF_UP)
+
+        pnl = Decimal(str(outcome.realized_pnl))
+        pnl_pct = Decimal(str(outcome.realized_pnl_pct))
+        drawdown = numeric(outcome.max_drawdown_pct)
+        hold = int(outcome.hold_duration_minutes)
+        win = 1 if outcome.realized_pnl > 0 else 0
+
+        if row is None:
+            return {
+                'total_trades': 1,
+                'winning_trades': win,
+                'total_pnl': numeric(pnl),
+                'total_pnl_pct': numeric(pnl_pct),
+                'max_drawdown_pct': drawdown,
+                'avg_hold_minutes': hold
+            }
+
+        drawdowns = [d for d in (numeric(row['max_drawdown_pct']), drawdown) if d is not None]
+        total = row['total_trades']
+        hold_sum = row['avg_hold_minutes'] * total + hold
+        return {
+            'total_trades': total + 1,
+            'winning_trades': row['winning_trades'] + win,
+            'total_pnl': numeric(Decimal(str(row['total_pnl'])) + pnl),
+            'total_pnl_pct': numeric(Decimal(str(row['total_pnl_pct'])) + pnl_pct),
+            'max_drawdown_pct': max(drawdowns) if drawdowns else None,
+            'avg_hold_minutes': hold_sum // (total + 1) if hold_sum >= 0 else -(-hold_sum // (total + 1))
+        }
 
     def _ensure_stats_table(self):
         """Create strategy stats table if it doesn't exist."""
@@ -545,6 +851,32 @@ class LearningFeedbackPipeline:
 
         Returns: proposal_id if submitted, None otherwise.
         """
+        proposal = self._ikea_proposal(outcome)
+        return self._submit_proposal(proposal) if proposal else None
+
+    def _propose_inforage_update(self, outcome: TradeOutcome) -> Optional[str]:
+        """
+        Propose an update to InForage scent model based on trade outcome.
+
+        Compare predicted information gain to actual ROI to calibrate
+        the scent scoring model.
+
+        Returns: proposal_id if submitted, None otherwise.
+        """
+        return self._submit_proposal(self._inforage_proposal(outcome))
+
+    def _propose_sitc_update(self, outcome: TradeOutcome) -> Optional[str]:
+        """
+        Propose an update to SitC plan priors based on trade outcome.
+
+        Track which plan structures lead to successful trades.
+
+        Returns: proposal_id if submitted, None otherwise.
+        """
+        return self._submit_proposal(self._sitc_proposal(outcome))
+
+    def _ikea_proposal(self, outcome: TradeOutcome) -> Optional[Tuple[str, str, Dict, Dict, Dict]]:
+        """IKEA proposal (engine, type, current, proposed, evidence); losses only."""
         # Only propose updates for significant losses
         if outcome.realized_pnl >= 0:
             return None
@@ -564,44 +896,10 @@ class LearningFeedbackPipeline:
         current_value = {'boundary_strictness': 0.7}  # Placeholder - would query actual
         proposed_value = {'boundary_strictness': 0.85}  # More conservative
 
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    SELECT fhq_governance.fn_submit_learning_proposal(
-                        'IKEA'::varchar(10),
-                        'BOUNDARY_WEIGHT'::varchar(50),
-                        %s::jsonb,
-                        %s::jsonb,
-                        %s::jsonb,
-                        'LEARNING_PIPELINE'::varchar(50)
-                    )
-                """, (
-                    Json(current_value),
-                    Json(proposed_value),
-                    Json([evidence_bundle])
-                ))
-                result = cur.fetchone()
-                proposal_id = str(result[0]) if result else None
-            self.conn.commit()
-
-            if proposal_id:
-                logger.info(f"IKEA learning proposal submitted: {proposal_id}")
-            return proposal_id
+        return ('IKEA', 'BOUNDARY_WEIGHT', current_value, proposed_value, evidence_bundle)
 
-        except Exception as e:
-            logger.warning(f"IKEA proposal submission failed: {e}")
-            self.conn.rollback()
-            return None
-
-    def _propose_inforage_update(self, outcome: TradeOutcome) -> Optional[str]:
-        """
-        Propose an update to InForage scent model based on trade outcome.
-
-        Compare predicted information gain to actual ROI to calibrate
-        the scent scoring model.
-
-        Returns: proposal_id if submitted, None otherwise.
-        """
+    def _inforage_proposal(self, outcome: TradeOutcome) -> Tuple[str, str, Dict, Dict, Dict]:
+        """InForage proposal (engine, type, current, proposed, evidence)."""
         evidence_bundle = {
             'outcome_id': outcome.outcome_id,
             'canonical_id': outcome.canonical_id,
@@ -617,43 +915,10 @@ class LearningFeedbackPipeline:
         current_value = {'scent_decay_factor': 0.85}
         proposed_value = {'scent_decay_factor': 0.80 if actual_gain < 0.3 else 0.90}
 
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    SELECT fhq_governance.fn_submit_learning_proposal(
-                        'INFORAGE'::varchar(10),
-                        'SCENT_MODEL'::varchar(50),
-                        %s::jsonb,
-                        %s::jsonb,
-                        %s::jsonb,
-                        'LEARNING_PIPELINE'::varchar(50)
-                    )
-                """, (
-                    Json(current_value),
-                    Json(proposed_value),
-                    Json([evidence_bundle])
-                ))
-                result = cur.fetchone()
-                proposal_id = str(result[0]) if result else None
-            self.conn.commit()
-
-            if proposal_id:
-                logger.info(f"InForage learning proposal submitted: {proposal_id}")
-            return proposal_id
-
-        except Exception as e:
-            logger.warning(f"InForage proposal submission failed: {e}")
-            self.conn.rollback()
-            return None
+        return ('INFORAGE', 'SCENT_MODEL', current_value, proposed_value, evidence_bundle)
 
-    def _propose_sitc_update(self, outcome: TradeOutcome) -> Optional[str]:
-        """
-        Propose an update to SitC plan priors based on trade outcome.
-
-        Track which plan structures lead to successful trades.
-
-        Returns: proposal_id if submitted, None otherwise.
-        """
+    def _sitc_proposal(self, outcome: TradeOutcome) -> Tuple[str, str, Dict, Dict, Dict]:
+        """SitC proposal (engine, type, current, proposed, evidence)."""
         evidence_bundle = {
             'outcome_id': outcome.outcome_id,
             'strategy_source': outcome.strategy_source,
@@ -670,18 +935,41 @@ class LearningFeedbackPipeline:
             'max_chain_depth': 4 if outcome.realized_pnl < 0 else 6
         }
 
+        return ('SITC', 'PLAN_PRIOR', current_value, proposed_value, evidence_bundle)
+
+    def _proposals_for(self, outcome: TradeOutcome) -> Dict[str, Optional[Tuple[str, str, Dict, Dict, Dict]]]:
+        """Proposals due for an outcome: engine -> proposal (None = nothing to submit)."""
+        proposals = {}
+
+        # IKEA: Only propose on significant losses (hallucination detection)
+        if outcome.realized_pnl_pct < -2.0:  # >2% loss
+            proposals['IKEA'] = self._ikea_proposal(outcome)
+
+        # InForage: Always propose for scent calibration
+        proposals['INFORAGE'] = self._inforage_proposal(outcome)
+
+        # SitC: Propose for all trades to calibrate plan structures
+        proposals['SITC'] = self._sitc_proposal(outcome)
+
+        return proposals
+
+    def _submit_proposal(self, proposal: Tuple[str, str, Dict, Dict, Dict]) -> Optional[str]:
+        """Submit one proposal to fhq_governance.learning_proposals (staging)."""
+        engine, proposal_type, current_value, proposed_value, evidence_bundle = proposal
         try:
             with self.conn.cursor() as cur:
                 cur.execute("""
                     SELECT fhq_governance.fn_submit_learning_proposal(
-                        'SITC'::varchar(10),
-                        'PLAN_PRIOR'::varchar(50),
+                        %s::varchar(10),
+                        %s::varchar(50),
                         %s::jsonb,
                         %s::jsonb,
                         %s::jsonb,
                         'LEARNING_PIPELINE'::varchar(50)
                     )
                 """, (
+                    engine,
+                    proposal_type,
                     Json(current_value),
                     Json(proposed_value),
                     Json([evidence_bundle])
@@ -691,11 +979,11 @@ class LearningFeedbackPipeline:
             self.conn.commit()
 
             if proposal_id:
-                logger.info(f"SitC learning proposal submitted: {proposal_id}")
+                logger.info(f"{engine} learning proposal submitted: {proposal_id}")
             return proposal_id
 
         except Exception as e:
-            logger.warning(f"SitC proposal submission failed: {e}")
+            logger.warning(f"{engine} proposal submission failed: {e}")
             self.conn.rollback()
             return None
 
@@ -707,21 +995,73 @@ class LearningFeedbackPipeline:
 
         Returns: Dict of engine -> proposal_id
         """
+        proposals = {
+            engine: self._submit_proposal(proposal) if proposal else None
+            for engine, proposal in self._proposals_for(outcome).items()
+        }
+
+        submitted = {k: v for k, v in proposals.items() if v}
+        if submitted:
+            logger.info(f"Submitted {len(submitted)} cognitive learning proposals")
+
+        return proposals
+
+    def submit_cognitive_learning_proposals_batch(
+        self,
+        outcomes: List[TradeOutcome]
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Submit the learning proposals of many outcomes in one statement.
+
+        Same proposals as submit_cognitive_learning_proposals per outcome,
+        staged in one transaction; if it fails no proposal is staged.
+
+        Returns: Dict of outcome_id -> engine -> proposal_id
+        """
         proposals = {}
+        pending = []
+        for outcome in outcomes:
+            proposals[outcome.outcome_id] = {}
+            for engine, proposal in self._proposals_for(outcome).items():
+                proposals[outcome.outcome_id][engine] = None
+                if proposal:
+                    pending.append((outcome.outcome_id, proposal))
 
-        # IKEA: Only propose on significant losses (hallucination detection)
-        if outcome.realized_pnl_pct < -2.0:  # >2% loss
-            proposals['IKEA'] = self._propose_ikea_update(outcome)
+        if not pending:
+            return proposals
 
-        # InForage: Always propose for scent calibration
-        proposals['INFORAGE'] = self._propose_inforage_update(outcome)
+        try:
+            with self.conn.cursor() as cur:
+                rows = execute_values(cur, """
+                    SELECT v.idx, fhq_governance.fn_submit_learning_proposal(
+                        v.engine::varchar(10),
+                        v.proposal_type::varchar(50),
+                        v.current_value,
+                        v.proposed_value,
+                        v.evidence,
+                        'LEARNING_PIPELINE'::varchar(50)
+                    )
+                    FROM (VALUES %s) AS v(idx, engine, proposal_type, current_value, proposed_value, evidence)
+                    ORDER BY v.idx
+                """, [
+                    (idx, engine, proposal_type, Json(current_value), Json(proposed_value), Json([evidence_bundle]))
+                    for idx, (_, (engine, proposal_type, current_value, proposed_value, evidence_bundle))
+                    in enumerate(pending)
+                ], template="(%s, %s, %s, %s::jsonb, %s::jsonb, %s::jsonb)",
+                    page_size=self.PAGE_SIZE, fetch=True)
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Cognitive proposal batch submission failed: {e}")
+            self.conn.rollback()
+            return proposals
 
-        # SitC: Propose for all trades to calibrate plan structures
-        proposals['SITC'] = self._propose_sitc_update(outcome)
+        for idx, proposal_id in rows:
+            outcome_id, proposal = pending[idx]
+            proposals[outcome_id][proposal[0]] = str(proposal_id) if proposal_id else None
 
-        submitted = {k: v for k, v in proposals.items() if v}
+        submitted = sum(1 for _, proposal_id in rows if proposal_id)
         if submitted:
-            logger.info(f"Submitted {len(submitted)} cognitive learning proposals")
+            logger.info(f"Submitted {submitted} cognitive learning proposals for {len(outcomes)} outcomes")
 
         return proposals
 
@@ -760,12 +1100,49 @@ class LearningFeedbackPipeline:
 
         self.conn.commit()
 
+    def _mark_outcomes_processed(self, updates: Dict[str, List[LearningUpdate]]):
+        """Mark many outcomes as processed and log their updates in one transaction."""
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                UPDATE fhq_execution.paper_trade_outcomes
+                SET learning_applied = true
+                WHERE outcome_id = ANY(%s::uuid[])
+            """, (list(updates),))
+
+            rows = [
+                (
+                    update.outcome_id,
+                    update.learning_system,
+                    update.action,
+                    update.reward,
+                    Json(update.prior_state),
+                    Json(update.posterior_state)
+                )
+                for outcome_updates in updates.values()
+                for update in outcome_updates
+            ]
+            if rows:
+                execute_values(cur, """
+                    INSERT INTO fhq_execution.learning_updates (
+                        outcome_id, learning_system, action, reward,
+                        prior_state, posterior_state
+                    ) VALUES %s
+                """, rows, template="(%s::uuid, %s, %s, %s, %s, %s)", page_size=self.PAGE_SIZE)
+
+        self.conn.commit()
+
     # =========================================================================
     # BATCH PROCESSING
     # =========================================================================
 
-    def process_all_pending(self) -> Dict:
-        """Process all pending trade outcomes."""
+    def process_all_pending(self, batch: bool = True) -> Dict:
+        """
+        Process all pending trade outcomes.
+
+        Args:
+            batch: Process them together (process_outcomes_batch); False
+                   processes them one by one (process_outcome)
+        """
         outcomes = self.get_pending_outcomes()
 
         if not outcomes:
@@ -773,9 +1150,13 @@ class LearningFeedbackPipeline:
             return {'processed': 0, 'updates': 0}
 
         total_updates = 0
-        for outcome in outcomes:
-            updates = self.process_outcome(outcome)
-            total_updates += len(updates)
+        if batch:
+            updates = self.process_outcomes_batch(outcomes)
+            total_updates = sum(len(outcome_updates) for outcome_updates in updates.values())
+        else:
+            for outcome in outcomes:
+                updates = self.process_outcome(outcome)
+                total_updates += len(updates)
 
         logger.info(f"Processed {len(outcomes)} outcomes, {total_updates} learning updates")
 
@@ -849,12 +1230,14 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Learning Feedback Pipeline')
     parser.add_argument('--process', action='store_true', help='Process pending outcomes')
     parser.add_argument('--summary', action='store_true', help='Show learning summary')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Process outcomes one by one instead of in batch')
     args = parser.parse_args()
 
     pipeline = get_learning_pipeline()
 
     if args.process:
-        result = pipeline.process_all_pending()
+        result = pipeline.process_all_pending(batch=not args.sequential)
         print(f"Processed: {result}")
     elif args.summary:
         summary = pipeline.get_learning_summary()
@@ -28,6 +28,13 @@ SETTLEMENT LOGIC:
 2. For ORPHANED_OUTCOME_MISSING: Create post-mortem row + outcome_settlement_log row
 3. For FAILED: Create post-mortem row + outcome_settlement_log row
 
+SET-BASED SETTLEMENT (default):
+- One query locks a chunk of eligible packs joined to outcome_pack_link/outcome_ledger
+- Post-mortems, status transitions and settlement log rows are bulk-written
+  in one transaction per chunk
+- Chunk size adapts to SETTLEMENT_CHUNK_TARGET_SECONDS until the backlog drains
+- --per-pack keeps the one-pack-at-a-time path (first 50 packs per cycle)
+
 CONSTRAINTS:
 - Read-only on outcome_ledger (via outcome_pack_link layer)
 - Update only execution_status on decision_packs (with fail_reason columns)
@@ -53,13 +60,20 @@ import signal
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 DAEMON_NAME = 'outcome_settlement_daemon'
 DAEMON_VERSION = '3.1.0-CONTINUOUS'
 CYCLE_INTERVAL_SECONDS = 3600  # 1 hour
 PID_FILE = '03_FUNCTIONS/outcome_settlement_daemon.pid'
 
+# Set-based settlement: chunk size adapts to keep each chunk's transaction
+# near the target duration while the backlog drains.
+SETTLEMENT_CHUNK_SIZE = 50
+SETTLEMENT_CHUNK_MIN = 10
+SETTLEMENT_CHUNK_MAX = 2000
+SETTLEMENT_CHUNK_TARGET_SECONDS = 2.0
+
 logging.basicConfig(
     level=logging.INFO,
     format='[OUTCOME_SETTLE] %(asctime)s %(levelname)s: %(message)s',
@@ -106,6 +120,16 @@ def get_connection():
     return psycopg2.connect(**DB_CONFIG)
 
 
+def _utcnow() -> datetime:
+    """Current UTC time (single clock for settlement evidence)."""
+    return datetime.now(timezone.utc)
+
+
+def _pack_age_hours(pack: Dict, now: datetime) -> float:
+    """Pack age in hours relative to now."""
+    return (now - pack['created_at'].replace(tzinfo=timezone.utc)).total_seconds() / 3600
+
+
 def get_pending_decision_packs(conn) -> List[Dict]:
     """Get decision packs with PENDING status that need settlement (24-hour event window)."""
     cur = conn.cursor(cursor_factory=RealDictCursor)
@@ -175,7 +199,7 @@ def create_post_mortem_record(conn, pack: Dict, fail_reason_code: str, fail_deta
         cur.execute("""
             INSERT INTO fhq_learning.post_mortem_settlement
                 (pack_id, hypothesis_id, fail_reason_code, fail_reason_detail, analysis_status, original_fail_at, resolved_by)
-            VALUES (%s, %s, %s, 'PENDING', NOW(), 'OUTCOME_SETTLEMENT_DAEMON')
+            VALUES (%s, %s, %s, %s, 'PENDING', NOW(), 'OUTCOME_SETTLEMENT_DAEMON')
             ON CONFLICT (pack_id) DO NOTHING
             RETURNING post_mortem_id
         """, (pack['pack_id'], pack.get('hypothesis_uuid'), fail_reason_code, fail_detail))
@@ -212,7 +236,7 @@ def create_settlement_log_entry(conn, pack: Dict, prior_status: str, new_status:
             INSERT INTO fhq_learning.outcome_settlement_log
                 (pack_id, prior_status, new_status, outcome_id,
                  settlement_reason_code, settlement_evidence_hash, settled_at, settled_by)
-            VALUES (%s, %s, %s, %s, NOW(), %s)
+            VALUES (%s, %s, %s, %s, %s, %s, NOW(), %s)
             RETURNING settlement_id
         """, (
             pack['pack_id'],
@@ -254,7 +278,7 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
     cur = conn.cursor()
 
     prior_status = pack.get('execution_status', 'PENDING')
-    pack_age_hours = (datetime.now(timezone.utc) - pack['created_at'].replace(tzinfo=timezone.utc)).total_seconds() / 3600
+    pack_age_hours = _pack_age_hours(pack, _utcnow())
     new_status = None
     outcome_id = None
     settlement_reason_code = None
@@ -286,7 +310,8 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
             'ORPHANED_OUTCOME_MISSING',
             'TIMEOUT',
             fail_detail,
-            f"{DAEMON_NAME}@{DAEMON_VERSION}"
+            f"{DAEMON_NAME}@{DAEMON_VERSION}",
+            pack['pack_id']
         ))
 
         logger.info(f"FAIL-CLOSED: pack={pack['pack_id'][:8]}... asset={pack['asset']} -> ORPHANED_OUTCOME_MISSING (age={pack_age_hours:.1f}h)")
@@ -305,7 +330,7 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
             'outcome_hash': outcome['content_hash'],
             'link_method': outcome['link_method'],
             'link_confidence': float(outcome['link_confidence']),
-            'settlement_timestamp': datetime.now(timezone.utc).isoformat(),
+            'settlement_timestamp': _utcnow().isoformat(),
             'pack_age_hours': round(pack_age_hours, 2),
             'daemon_version': DAEMON_VERSION
         }
@@ -327,7 +352,8 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
             outcome['outcome_id'],
             'sha256:' + hashlib.sha256(json.dumps(settlement_evidence_data, sort_keys=True).encode()).hexdigest(),
             outcome['outcome_timestamp'],
-            f"{DAEMON_NAME}@{DAEMON_VERSION}"
+            f"{DAEMON_NAME}@{DAEMON_VERSION}",
+            pack['pack_id']
         ))
 
         logger.info(f"EXECUTED: pack={pack['pack_id'][:8]}... asset={pack['asset']} -> EXECUTED (outcome={outcome['outcome_id'][:8]}...)")
@@ -335,7 +361,7 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
     else:
         # Still waiting - do not settle yet
         logger.debug(f"WAITING: pack={pack['pack_id'][:8]}... asset={pack['asset']} (age={pack_age_hours:.1f}h)")
-        return False, None, None
+        return False, None, None, None
 
     conn.commit()
 
@@ -343,7 +369,7 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
     if new_status:
         settlement_evidence_data = {
             'outcome_id': outcome_id,
-            'settlement_timestamp': datetime.now(timezone.utc).isoformat(),
+            'settlement_timestamp': _utcnow().isoformat(),
             'pack_age_hours': round(pack_age_hours, 2),
             'daemon_version': DAEMON_VERSION
         }
@@ -359,6 +385,305 @@ def settle_decision_pack(conn, pack: Dict, outcome: Optional[Dict]) -> tuple[boo
     return True, new_status, outcome_id, None
 
 
+# Columns returned by find_matching_outcome; the set-based query selects the
+# same columns under an "oc_" prefix so rows split back into (pack, outcome).
+OUTCOME_COLUMNS = (
+    'link_id', 'outcome_id', 'pack_id', 'hypothesis_id', 'linked_at', 'link_method',
+    'link_confidence', 'outcome_type', 'outcome_domain', 'outcome_value',
+    'outcome_timestamp', 'evidence_source', 'evidence_data', 'content_hash'
+)
+
+PACK_COLUMNS = (
+    'pack_id', 'asset', 'direction', 'hypothesis_uuid', 'created_at', 'snapshot_price',
+    'snapshot_timestamp', 'evidence_hash', 'snapshot_ttl_valid_until'
+)
+
+
+def get_settlement_candidates(conn, limit: int) -> List[Dict]:
+    """
+    Lock the next chunk of eligible PENDING packs joined to their outcome.
+
+    One round trip replaces get_pending_decision_packs + find_matching_outcome
+    per pack. Rows are locked FOR UPDATE SKIP LOCKED so the chunk's writes
+    and a concurrent settler never touch the same pack.
+    """
+    outcome_select = ',\n            '.join(f"o.{c} AS oc_{c}" for c in OUTCOME_COLUMNS)
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute(f"""
+        SELECT
+            dp.pack_id,
+            dp.asset,
+            dp.direction,
+            dp.hypothesis_uuid,
+            dp.created_at,
+            dp.snapshot_price,
+            dp.snapshot_timestamp,
+            dp.evidence_hash,
+            dp.snapshot_ttl_valid_until,
+            {outcome_select}
+        FROM fhq_learning.decision_packs dp
+        LEFT JOIN LATERAL (
+            SELECT
+                opl.link_id, opl.outcome_id, opl.pack_id, opl.hypothesis_id,
+                opl.linked_at, opl.link_method, opl.link_confidence,
+                ol.outcome_type, ol.outcome_domain, ol.outcome_value,
+                ol.outcome_timestamp, ol.evidence_source, ol.evidence_data,
+                ol.content_hash
+            FROM fhq_learning.outcome_pack_link opl
+            JOIN fhq_research.outcome_ledger ol ON opl.outcome_id = ol.outcome_id
+            WHERE opl.pack_id = dp.pack_id
+            LIMIT 1
+        ) o ON TRUE
+        WHERE dp.execution_status = 'PENDING'
+          AND dp.created_at < NOW() - INTERVAL '24 hours'
+        ORDER BY dp.created_at ASC
+        LIMIT %s
+        FOR UPDATE OF dp SKIP LOCKED
+    """, (limit,))
+    return cur.fetchall()
+
+
+def split_candidate(row: Dict) -> tuple[Dict, Optional[Dict]]:
+    """Split a candidate row into the pack dict and its outcome (None if unlinked)."""
+    pack = {c: row[c] for c in PACK_COLUMNS}
+    if row.get('oc_outcome_id') is None:
+        return pack, None
+    return pack, {c: row[f'oc_{c}'] for c in OUTCOME_COLUMNS}
+
+
+def plan_settlement(pack: Dict, outcome: Optional[Dict]) -> Optional[Dict]:
+    """
+    Decide the terminal state and audit rows for one pack without touching the DB.
+
+    Mirrors settle_decision_pack + create_post_mortem_record +
+    create_settlement_log_entry field for field. Returns None while the pack
+    is still inside its event window.
+    """
+    now = _utcnow()
+    pack_age_hours = _pack_age_hours(pack, now)
+    settled_by = f"{DAEMON_NAME}@{DAEMON_VERSION}"
+    post_mortem = None
+
+    if not outcome and pack_age_hours >= 24:
+        new_status = 'ORPHANED_OUTCOME_MISSING'
+        outcome_id = None
+        reason_code = 'OUTCOME_MISSING_TIMEOUT'
+        update = (pack['pack_id'], new_status, None, None, None, 'TIMEOUT',
+                  f'No outcome found within 24-hour window (age={pack_age_hours:.1f}h)', settled_by)
+        post_mortem = (
+            pack['pack_id'],
+            pack.get('hypothesis_uuid'),
+            pack.get('fail_reason_code') if pack.get('fail_reason_code') else 'UNKNOWN',
+            pack.get('fail_reason_detail') if pack.get('fail_reason_detail') else f'FAILED pack from batch: {pack["asset"]} {pack["direction"]}'
+        )
+    elif outcome:
+        new_status = 'EXECUTED'
+        outcome_id = str(outcome['outcome_id'])
+        reason_code = 'OUTCOME_LINKED'
+        execution_evidence = {
+            'outcome_id': outcome_id,
+            'outcome_value': outcome['outcome_value'],
+            'outcome_timestamp': outcome['outcome_timestamp'].isoformat() if outcome['outcome_timestamp'] else None,
+            'outcome_hash': outcome['content_hash'],
+            'link_method': outcome['link_method'],
+            'link_confidence': float(outcome['link_confidence']),
+            'settlement_timestamp': now.isoformat(),
+            'pack_age_hours': round(pack_age_hours, 2),
+            'daemon_version': DAEMON_VERSION
+        }
+        update = (
+            pack['pack_id'], new_status, outcome['outcome_id'],
+            'sha256:' + hashlib.sha256(json.dumps(execution_evidence, sort_keys=True).encode()).hexdigest(),
+            outcome['outcome_timestamp'], None, None, settled_by
+        )
+    else:
+        return None
+
+    log_evidence = {
+        'outcome_id': outcome_id,
+        'settlement_timestamp': now.isoformat(),
+        'pack_age_hours': round(pack_age_hours, 2),
+        'daemon_version': DAEMON_VERSION
+    }
+    log_row = (
+        pack['pack_id'],
+        pack.get('execution_status', 'PENDING'),
+        new_status,
+        outcome_id,
+        reason_code,
+        hashlib.sha256(json.dumps(log_evidence, sort_keys=True).encode()).hexdigest(),
+        settled_by
+    )
+
+    return {
+        'pack_id': pack['pack_id'],
+        'asset': pack['asset'],
+        'new_status': new_status,
+        'outcome_id': outcome_id,
+        'reason_code': reason_code,
+        'update': update,
+        'post_mortem': post_mortem,
+        'log': log_row
+    }
+
+
+def apply_settlement_chunk(conn, plans: List[Dict]) -> List[Dict]:
+    """
+    Write one chunk of planned settlements with three bulk statements.
+
+    Post-mortems, status transitions and settlement log rows are written in
+    the caller's transaction; the caller commits or rolls back the chunk as
+    a unit. Returns settlement summaries in plan order.
+    """
+    cur = conn.cursor()
+
+    post_mortem_ids = {}
+    post_mortems = [p['post_mortem'] for p in plans if p['post_mortem']]
+    if post_mortems:
+        rows = execute_values(cur, """
+            INSERT INTO fhq_learning.post_mortem_settlement
+                (pack_id, hypothesis_id, fail_reason_code, fail_reason_detail, analysis_status, original_fail_at, resolved_by)
+            VALUES %s
+            ON CONFLICT (pack_id) DO NOTHING
+            RETURNING pack_id, post_mortem_id
+        """, post_mortems, template="(%s, %s, %s, %s, 'PENDING', NOW(), 'OUTCOME_SETTLEMENT_DAEMON')", fetch=True)
+        post_mortem_ids = {str(pack_id): str(pm_id) for pack_id, pm_id in rows}
+
+    execute_values(cur, """
+        UPDATE fhq_learning.decision_packs dp
+        SET execution_status = v.execution_status,
+            outcome_id = v.outcome_id,
+            evidence_hash = v.evidence_hash,
+            filled_at = v.filled_at,
+            fail_reason_code = v.fail_reason_code,
+            fail_reason_detail = v.fail_reason_detail,
+            terminalized_at = NOW(),
+            settled_by = v.settled_by
+        FROM (VALUES %s) AS v(pack_id, execution_status, outcome_id, evidence_hash,
+                              filled_at, fail_reason_code, fail_reason_detail, settled_by)
+        WHERE dp.pack_id = v.pack_id
+          AND dp.execution_status = 'PENDING'
+    """, [p['update'] for p in plans],
+        template="(%s::uuid, %s, %s::uuid, %s, %s::timestamptz, %s, %s, %s)")
+
+    rows = execute_values(cur, """
+        INSERT INTO fhq_learning.outcome_settlement_log
+            (pack_id, prior_status, new_status, outcome_id,
+             settlement_reason_code, settlement_evidence_hash, settled_at, settled_by)
+        VALUES %s
+        RETURNING pack_id, settlement_id
+    """, [p['log'] for p in plans], template="(%s, %s, %s, %s, %s, %s, NOW(), %s)", fetch=True)
+    log_ids = {str(pack_id): str(log_id) for pack_id, log_id in rows}
+
+    return [{
+        'pack_id': str(p['pack_id']),
+        'asset': p['asset'],
+        'new_status': p['new_status'],
+        'outcome_id': p['outcome_id'],
+        'post_mortem_id': post_mortem_ids.get(str(p['pack_id'])),
+        'settlement_log_id': log_ids.get(str(p['pack_id'])),
+        'settlement_reason_code': p['reason_code']
+    } for p in plans]
+
+
+def _next_chunk_size(size: int, elapsed: float) -> int:
+    """Grow fast chunks, shrink slow ones, within [MIN, MAX]."""
+    if elapsed < SETTLEMENT_CHUNK_TARGET_SECONDS / 2:
+        size *= 2
+    elif elapsed > SETTLEMENT_CHUNK_TARGET_SECONDS:
+        size //= 2
+    return max(SETTLEMENT_CHUNK_MIN, min(SETTLEMENT_CHUNK_MAX, size))
+
+
+def settle_backlog(conn, chunk_size: int = SETTLEMENT_CHUNK_SIZE) -> Dict:
+    """
+    Drain eligible PENDING packs chunk by chunk (set-based path).
+
+    Each chunk is one candidate query plus three bulk writes committed in a
+    single transaction. A failed chunk is rolled back and retried at half
+    size; at the minimum size the cycle stops (fail-closed) and the packs
+    stay PENDING for the next cycle.
+    """
+    settlements = []
+    errors_count = 0
+    chunks = 0
+    pending_evaluated = 0
+
+    while True:
+        started = time.monotonic()
+        try:
+            candidates = get_settlement_candidates(conn, chunk_size)
+            plans = [plan for plan in (plan_settlement(*split_candidate(row)) for row in candidates) if plan]
+            chunk_settlements = apply_settlement_chunk(conn, plans) if plans else []
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            errors_count += 1
+            logger.error(f"Settlement chunk failed (size={chunk_size}): {e}")
+            if chunk_size <= SETTLEMENT_CHUNK_MIN:
+                break
+            chunk_size = max(SETTLEMENT_CHUNK_MIN, chunk_size // 2)
+            continue
+
+        elapsed = time.monotonic() - started
+        chunks += 1
+        pending_evaluated += len(candidates)
+        settlements.extend(chunk_settlements)
+        logger.info(f"Chunk {chunks}: {len(chunk_settlements)}/{len(candidates)} settled in {elapsed:.2f}s (size={chunk_size})")
+
+        # Drained, or nothing in this chunk could settle yet
+        if len(candidates) < chunk_size or not chunk_settlements:
+            break
+        chunk_size = _next_chunk_size(chunk_size, elapsed)
+
+    return {
+        'pending_evaluated': pending_evaluated,
+        'settlements': settlements,
+        'errors_count': errors_count,
+        'chunks': chunks
+    }
+
+
+def settle_pending_per_pack(conn) -> Dict:
+    """Settle up to 50 PENDING packs one at a time (pre-set-based path)."""
+    settlements = []
+    errors_count = 0
+
+    pending_packs = get_pending_decision_packs(conn)
+    logger.info(f"Found {len(pending_packs)} pending decision packs to evaluate")
+
+    for pack in pending_packs:
+        try:
+            # Find matching outcome through outcome_pack_link
+            outcome = find_matching_outcome(conn, pack)
+
+            # Settle pack to terminal state
+            settled, new_status, outcome_id, log_id = settle_decision_pack(conn, pack, outcome)
+
+            if settled:
+                settlements.append({
+                    'pack_id': str(pack['pack_id']),
+                    'asset': pack['asset'],
+                    'new_status': new_status,
+                    'outcome_id': outcome_id,
+                    'post_mortem_id': None,  # EXECUTED doesn't get post_mortem
+                    'settlement_log_id': log_id if log_id else None,
+                    'settlement_reason_code': 'OUTCOME_LINKED' if new_status == 'EXECUTED' else 'OUTCOME_MISSING_TIMEOUT'
+                })
+        except Exception as e:
+            errors_count += 1
+            logger.error(f"Failed to settle pack={pack['pack_id'][:8]}...: {e}")
+
+    # Settlement log rows are written after settle_decision_pack's commit
+    conn.commit()
+
+    return {
+        'pending_evaluated': len(pending_packs),
+        'settlements': settlements,
+        'errors_count': errors_count
+    }
+
+
 def generate_settlement_evidence(settlements: List[Dict]) -> Dict:
     """Generate evidence bundle for settlements."""
     evidence = {
@@ -439,42 +764,24 @@ def system_event_log_heartbeat(conn, settlements_processed: int, errors_count: i
             pass
 
 
-def run_cycle() -> Dict:
-    """Run one settlement cycle."""
+def run_cycle(set_based: bool = True) -> Dict:
+    """
+    Run one settlement cycle.
+
+    Args:
+        set_based: Drain the backlog with chunked bulk settlement; False uses
+                   the per-pack path (50 packs, one round trip per statement).
+    """
     conn = get_connection()
-    settlements = []
-    errors_count = 0
-    last_settled_outcome_id = None
 
     try:
-        # Get pending decision packs
-        pending_packs = get_pending_decision_packs(conn)
-        logger.info(f"Found {len(pending_packs)} pending decision packs to evaluate")
-
-        for pack in pending_packs:
-            try:
-                # Find matching outcome through outcome_pack_link
-                outcome = find_matching_outcome(conn, pack)
-
-                # Settle pack to terminal state
-                settled, new_status, outcome_id, log_id = settle_decision_pack(conn, pack, outcome)
-
-                if settled:
-                    settlements.append({
-                        'pack_id': str(pack['pack_id']),
-                        'asset': pack['asset'],
-                        'new_status': new_status,
-                        'outcome_id': outcome_id,
-                        'post_mortem_id': None,  # EXECUTED doesn't get post_mortem
-                        'settlement_log_id': log_id if log_id else None,
-                        'settlement_reason_code': 'OUTCOME_LINKED' if new_status == 'EXECUTED' else 'OUTCOME_MISSING_TIMEOUT'
-                    })
-                    # Track last settled outcome ID
-                    if outcome_id:
-                        last_settled_outcome_id = outcome_id
-            except Exception as e:
-                errors_count += 1
-                logger.error(f"Failed to settle pack={pack['pack_id'][:8]}...: {e}")
+        result = settle_backlog(conn) if set_based else settle_pending_per_pack(conn)
+        pending_evaluated = result['pending_evaluated']
+        settlements = result['settlements']
+        errors_count = result['errors_count']
+        last_settled_outcome_id = next(
+            (s['outcome_id'] for s in reversed(settlements) if s['outcome_id']), None
+        )
 
         # Generate evidence
         if settlements:
@@ -490,7 +797,7 @@ def run_cycle() -> Dict:
 
         # Heartbeat to daemon_health
         heartbeat(conn, 'ACTIVE', {
-            'pending_evaluated': len(pending_packs),
+            'pending_evaluated': pending_evaluated,
             'settled': len(settlements),
             'executed': sum(1 for s in settlements if s['new_status'] == 'EXECUTED'),
             'failed': sum(1 for s in settlements if s['new_status'] == 'FAILED'),
@@ -501,7 +808,7 @@ def run_cycle() -> Dict:
         system_event_log_heartbeat(conn, len(settlements), errors_count, last_settled_outcome_id)
 
         return {
-            'pending_evaluated': len(pending_packs),
+            'pending_evaluated': pending_evaluated,
             'settlements': settlements,
             'errors_count': errors_count,
             'last_settled_outcome_id': last_settled_outcome_id
@@ -531,6 +838,8 @@ def main():
                         help='Run a single cycle then exit')
     parser.add_argument('--stop', action='store_true',
                         help='Stop running daemon')
+    parser.add_argument('--per-pack', action='store_true',
+                        help='Settle one pack at a time instead of set-based chunks')
     args = parser.parse_args()
 
     logger.info("=" * 60)
@@ -551,7 +860,7 @@ def main():
     cycle_count = 0
     while True:
         try:
-            run_cycle()
+            run_cycle(set_based=not args.per_pack)
             cycle_count += 1
             logger.info(f"Cycle {cycle_count} completed. Next cycle in {CYCLE_INTERVAL_SECONDS}s")
             time.sleep(CYCLE_INTERVAL_SECONDS)
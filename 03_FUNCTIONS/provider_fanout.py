@@ -0,0 +1,505 @@
+"""
+Provider Fan-Out: Concurrent, Rate-Limited Provider Access
+===========================================================
+
+Shared fetch layer for the ingest pipelines (IoS-001 bulletproof ingest,
+IoS-006 multi-provider router).
+
+Replaces fixed time.sleep() pacing with:
+  - Per-provider token bucket (sustained rate + burst)
+  - Per-provider concurrency limit
+  - Adaptive backoff driven by 429/5xx (AIMD rate + cooldown, honours Retry-After)
+  - Hedged requests: start the next provider when the current one exceeds
+    its latency budget, first accepted result wins
+  - Per-provider latency and error histograms
+
+Provider callables stay plain functions. They signal throttling by raising
+ProviderError (see raise_for_status), or any exception carrying a
+status_code / response.status_code attribute.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# AIMD tuning: multiplicative decrease on throttle, additive recovery on success
+RATE_DECREASE_FACTOR = 0.5
+RATE_RECOVERY_FRACTION = 0.1
+MIN_RATE_FRACTION = 1 / 16
+
+
+# =============================================================================
+# ERRORS
+# =============================================================================
+
+class ProviderError(Exception):
+    """Provider call failed with an HTTP-style status."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        return is_retryable_status(self.status_code)
+
+
+class ProviderSkipped(ProviderError):
+    """Call was not attempted because the provider stopped accepting work."""
+
+
+def is_retryable_status(status_code: Optional[int]) -> bool:
+    """429 and 5xx drive backoff; everything else is a hard failure."""
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+def status_of(exc: BaseException) -> Optional[int]:
+    """Best-effort extraction of an HTTP status from an exception."""
+    status = getattr(exc, 'status_code', None)
+    if status is None:
+        response = getattr(exc, 'response', None)
+        status = getattr(response, 'status_code', None)
+    if status is None:
+        text = str(exc)
+        if '429' in text or 'Too Many Requests' in text or 'RateLimit' in type(exc).__name__:
+            status = 429
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def raise_for_status(resp, provider: str = '') -> None:
+    """Raise ProviderError for throttled / server-error responses."""
+    code = getattr(resp, 'status_code', None)
+    if not is_retryable_status(code):
+        return
+    retry_after = None
+    headers = getattr(resp, 'headers', None) or {}
+    try:
+        if headers.get('Retry-After') is not None:
+            retry_after = float(headers['Retry-After'])
+    except (TypeError, ValueError):
+        retry_after = None
+    raise ProviderError(f"{provider or 'provider'} returned {code}",
+                        status_code=code, retry_after=retry_after)
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    rate_per_sec tokens are added continuously up to capacity. The rate can
+    be adjusted at runtime (adaptive backoff) without losing accrued tokens.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate = float(rate_per_sec)
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def set_rate(self, rate_per_sec: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(float(rate_per_sec), 1e-9)
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available. Returns 0.0 on success, else seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available (or timeout). Returns True if acquired."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_s = self.try_acquire(tokens)
+            if wait_s == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_s = min(wait_s, remaining)
+            time.sleep(wait_s)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    def __init__(self, bounds_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        idx = len(self.bounds_ms)
+        for i, bound in enumerate(self.bounds_ms):
+            if latency_ms <= bound:
+                idx = i
+                break
+        with self._lock:
+            self.counts[idx] += 1
+            self.total += 1
+            self.sum_ms += latency_ms
+            self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile, capped at the observed max."""
+        with self._lock:
+            if self.total == 0:
+                return None
+            target = q / 100.0 * self.total
+            running = 0
+            for i, count in enumerate(self.counts):
+                running += count
+                if running >= target and count:
+                    return min(float(self.bounds_ms[i]), self.max_ms) if i < len(self.bounds_ms) else self.max_ms
+            return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b}ms" for b in self.bounds_ms] + [f">{self.bounds_ms[-1]}ms"]
+            buckets = {label: c for label, c in zip(labels, self.counts) if c}
+            count, mean = self.total, (self.sum_ms / self.total if self.total else None)
+            max_ms = self.max_ms
+        return {
+            'count': count,
+            'mean_ms': round(mean, 2) if mean is not None else None,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(max_ms, 2),
+            'buckets': buckets,
+        }
+
+
+# =============================================================================
+# PER-PROVIDER GATE
+# =============================================================================
+
+@dataclass
+class ProviderLimits:
+    """Rate/concurrency/backoff policy for one provider."""
+    rate_per_minute: float
+    burst: int = 1
+    max_concurrency: int = 4
+    latency_budget_s: Optional[float] = None  # hedge to next provider after this
+    max_retries: int = 2                      # retries on 429/5xx
+    base_backoff_s: float = 1.0
+    max_backoff_s: float = 120.0
+
+
+class ProviderGate:
+    """
+    Admission control and telemetry for a single provider.
+
+    Every call takes a concurrency slot and a token. A 429/5xx halves the
+    token rate and opens a cooldown window (exponential, or Retry-After);
+    successes recover the rate additively toward the configured limit.
+    """
+
+    def __init__(self, name: str, limits: ProviderLimits):
+        self.name = name
+        self.limits = limits
+        self.base_rate = limits.rate_per_minute / 60.0
+        self.bucket = TokenBucket(self.base_rate, capacity=limits.burst)
+        self._slots = threading.BoundedSemaphore(max(1, limits.max_concurrency))
+        self._lock = threading.Lock()
+        self._cooldown_until = 0.0
+        self._consecutive_throttles = 0
+        self.latency = LatencyHistogram()
+        self.errors: Dict[str, int] = {}
+        self.calls = 0
+        self.successes = 0
+        self.retries = 0
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    def cooldown_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._cooldown_until - time.monotonic())
+
+    def _admit(self) -> None:
+        while True:
+            remaining = self.cooldown_remaining()
+            if remaining <= 0:
+                break
+            time.sleep(remaining)
+        self.bucket.acquire()
+
+    # -------------------------------------------------------------------------
+    # Feedback
+    # -------------------------------------------------------------------------
+
+    def _record_error(self, kind: str) -> None:
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def _on_throttle(self, retry_after: Optional[float]) -> float:
+        with self._lock:
+            self._consecutive_throttles += 1
+            backoff = self.limits.base_backoff_s * (2 ** (self._consecutive_throttles - 1))
+            if retry_after is not None:
+                backoff = max(backoff, retry_after)
+            backoff = min(backoff, self.limits.max_backoff_s)
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + backoff)
+            new_rate = max(self.bucket.rate * RATE_DECREASE_FACTOR, self.base_rate * MIN_RATE_FRACTION)
+        self.bucket.set_rate(new_rate)
+        logger.warning(f"{self.name}: throttled, backing off {backoff:.1f}s "
+                       f"(rate {new_rate * 60:.1f}/min)")
+        return backoff
+
+    def _on_success(self) -> None:
+        with self._lock:
+            self._consecutive_throttles = 0
+            if self.bucket.rate >= self.base_rate:
+                return
+            new_rate = min(self.base_rate, self.bucket.rate + self.base_rate * RATE_RECOVERY_FRACTION)
+        self.bucket.set_rate(new_rate)
+
+    # -------------------------------------------------------------------------
+    # Call
+    # -------------------------------------------------------------------------
+
+    def call(self, fn: Callable[..., Any], *args, max_retries: Optional[int] = None, **kwargs) -> Any:
+        """Run fn under this provider's limits, retrying 429/5xx with backoff."""
+        retries = self.limits.max_retries if max_retries is None else max_retries
+        attempt = 0
+        while True:
+            self._admit()
+            with self._slots:
+                start = time.monotonic()
+                with self._lock:
+                    self.calls += 1
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    self.latency.record((time.monotonic() - start) * 1000)
+                    status = status_of(e)
+                    if not is_retryable_status(status):
+                        self._record_error(type(e).__name__)
+                        raise
+                    self._record_error('throttled' if status == 429 else 'server_error')
+                    self._on_throttle(getattr(e, 'retry_after', None))
+                    if attempt >= retries:
+                        raise
+                    attempt += 1
+                    with self._lock:
+                        self.retries += 1
+                    continue
+                self.latency.record((time.monotonic() - start) * 1000)
+            with self._lock:
+                self.successes += 1
+            self._on_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            base = {
+                'calls': self.calls,
+                'successes': self.successes,
+                'retries': self.retries,
+                'errors': dict(self.errors),
+                'cooldown_remaining_s': round(max(0.0, self._cooldown_until - time.monotonic()), 2),
+            }
+        base['rate_per_minute'] = round(self.bucket.rate * 60, 2)
+        base['latency'] = self.latency.snapshot()
+        return base
+
+
+# =============================================================================
+# FAN-OUT
+# =============================================================================
+
+@dataclass
+class HedgedResult:
+    """Outcome of a hedged fetch across a provider preference list."""
+    value: Any
+    provider: Optional[str]
+    elapsed_ms: int
+    hedged: bool
+    started: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        return self.provider is not None
+
+
+class ProviderFanout:
+    """
+    Registry of provider gates plus a shared worker pool.
+
+    Usage:
+        fanout = ProviderFanout({'ALPACA': ProviderLimits(rate_per_minute=180)})
+        results = fanout.map('ALPACA', fetch_bars, symbols)
+        hedged = fanout.hedged([('FRED', f1), ('YAHOO', f2)], accept=lambda df: df is not None)
+    """
+
+    def __init__(self, limits: Optional[Dict[str, ProviderLimits]] = None, max_workers: int = 16):
+        self._gates: Dict[str, ProviderGate] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fanout')
+        for name, provider_limits in (limits or {}).items():
+            self._gates[name] = ProviderGate(name, provider_limits)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def gate(self, name: str) -> ProviderGate:
+        try:
+            return self._gates[name]
+        except KeyError:
+            raise KeyError(f"No limits registered for provider {name}") from None
+
+    def ensure_gate(self, name: str, limits: ProviderLimits) -> ProviderGate:
+        """Register a provider on first use; existing gates keep their state."""
+        with self._lock:
+            if name not in self._gates:
+                self._gates[name] = ProviderGate(name, limits)
+            return self._gates[name]
+
+    def call(self, provider: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return self.gate(provider).call(fn, *args, **kwargs)
+
+    def map(
+        self,
+        provider: str,
+        fn: Callable[[Any], Any],
+        items: Sequence[Any],
+        stop_on_throttle: bool = False,
+    ) -> List[Tuple[Any, Any, Optional[BaseException]]]:
+        """
+        Apply fn to each item concurrently under the provider's limits.
+
+        Returns (item, result, error) in input order. With stop_on_throttle,
+        once a call exhausts its retries on 429/5xx, items not yet started
+        are returned with a ProviderSkipped error (quota-protecting mode).
+        """
+        gate = self.gate(provider)
+        stop = threading.Event()
+
+        def run(item):
+            if stop.is_set():
+                raise ProviderSkipped(f"{provider} stopped after throttling", status_code=None)
+            try:
+                return gate.call(fn, item)
+            except Exception as e:
+                if stop_on_throttle and is_retryable_status(status_of(e)):
+                    stop.set()
+                raise
+
+        out: List[Tuple[Any, Any, Optional[BaseException]]] = []
+        if not items:
+            return out
+        with ThreadPoolExecutor(max_workers=max(1, gate.limits.max_concurrency),
+                                thread_name_prefix=f'fanout-{provider}') as pool:
+            futures = [pool.submit(run, item) for item in items]
+            for item, future in zip(items, futures):
+                try:
+                    out.append((item, future.result(), None))
+                except Exception as e:
+                    out.append((item, None, e))
+        return out
+
+    def hedged(
+        self,
+        attempts: Sequence[Tuple[str, Callable[[], Any]]],
+        accept: Optional[Callable[[Any], bool]] = None,
+    ) -> HedgedResult:
+        """
+        Try providers in preference order, hedging on slow responses.
+
+        The next provider is started when the current one fails, or when it
+        has been running longer than its gate's latency_budget_s. The first
+        result passing accept() wins; slower in-flight calls are abandoned.
+        Hedged calls do not retry on throttle - the next provider is the retry.
+        """
+        accept = accept or (lambda value: value is not None)
+        start = time.monotonic()
+        pending: Dict[Any, str] = {}
+        started: List[str] = []
+        errors: Dict[str, str] = {}
+        queue = list(attempts)
+        hedged = False
+
+        def launch() -> Optional[float]:
+            name, fn = queue.pop(0)
+            gate = self.gate(name)
+            started.append(name)
+            pending[self._executor.submit(gate.call, fn, max_retries=0)] = name
+            return gate.limits.latency_budget_s
+
+        budget = launch() if queue else None
+        while pending:
+            done, _ = wait(list(pending), timeout=budget, return_when=FIRST_COMPLETED)
+            if not done:
+                # Latency budget exceeded - hedge to the next provider
+                if queue:
+                    hedged = True
+                    logger.info(f"FANOUT | {started[-1]} over {budget}s budget, hedging to {queue[0][0]}")
+                    budget = launch()
+                else:
+                    budget = None
+                continue
+            failed = False
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    value = future.result()
+                except Exception as e:
+                    errors[name] = str(e)[:200]
+                    failed = True
+                    continue
+                if accept(value):
+                    return HedgedResult(value, name, int((time.monotonic() - start) * 1000),
+                                        hedged, started, errors)
+                errors[name] = 'rejected result'
+                failed = True
+            if failed and queue:
+                # Failover does not wait for the budget
+                budget = launch()
+
+        return HedgedResult(None, None, int((time.monotonic() - start) * 1000), hedged, started, errors)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            gates = dict(self._gates)
+        return {name: gate.stats() for name, gate in gates.items()}
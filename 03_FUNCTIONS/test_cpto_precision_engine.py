@@ -0,0 +1,312 @@
+"""
+Equivalence tests for CPTO batch transformation: transform_signals must
+return the same TradePackets (entry, exits, lineage and outputs hashes)
+and write the same precision, friction and inversion-evidence rows as
+calling transform_signal once per signal, under GREEN, ORANGE and RED.
+
+The signal burst covers invalid classes, DEFCON refuse-new, TTL refusals,
+verified and unverified inversion candidates, the global-regime fallback
+and every ATR source, including the on-the-fly price-series fallback and
+its refusal when history is too short. Both paths run against FixtureDB
+with the clock frozen so input-feature hashes are reproducible.
+
+Run: python -m pytest 03_FUNCTIONS/test_cpto_precision_engine.py -q
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import cpto_precision_engine as cpto  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+from cpto_precision_engine import CPTOParameterSet, CPTOPrecisionEngine  # noqa: E402
+from defcon_state_provider import StaticDefconProvider  # noqa: E402
+
+NOW = datetime(2026, 3, 2, 15, 0, tzinfo=timezone.utc)
+INVERSION = 'LOW_CONFIDENCE_INVERSION_CANDIDATE'
+
+
+class FrozenDatetime(datetime):
+
+    @classmethod
+    def now(cls, tz=None):
+        return NOW if tz is not None else NOW.replace(tzinfo=None)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def fixture_tables():
+    def bars(n, start=100.0):
+        return [(NOW.date() - timedelta(days=d), start + d % 5 + 1.5, start + d % 5 - 1.0, start + (d * 7) % 5)
+                for d in range(n)]                                          # newest first
+
+    return {
+        # ticker -> [(regime_label, confidence, calculated_at, verified_inverted)]
+        'regimes': {
+            'AAPL': [('NEUTRAL', 0.6, NOW - timedelta(hours=30)), ('STRONG_BULL', 0.8, NOW - timedelta(hours=2))],
+            'MSFT': [('STRESS', 0.7, NOW - timedelta(hours=1), 'true')],
+            'NVDA': [('VOLATILE', 0.55, NOW - timedelta(hours=3))],
+            'SPY': [('MODERATE_BULL', 0.65, NOW - timedelta(hours=1))],
+            'AMD': [('STRESS', 0.9, NOW - timedelta(hours=1), 'false')],
+        },
+        'global_regime': ('MODERATE_BEAR', NOW - timedelta(hours=6)),
+        # (ticker, name, value, calculated_at)
+        'indicators': [
+            ('AAPL', 'ema_21', 188.2, NOW - timedelta(hours=1)),
+            ('AAPL', 'ema_21', 187.9, NOW - timedelta(hours=5)),               # older row wins
+            ('MSFT', 'bb_upper', 415.0, NOW - timedelta(hours=2)),
+            ('NVDA', 'bb_lower', 861.0, NOW - timedelta(hours=2)),
+            ('NVDA', 'bb_upper', 893.0, NOW - timedelta(hours=2)),
+            ('NVDA', 'bb_lower', 700.0, NOW - timedelta(hours=30)),            # stale
+            ('TSLA', 'ema_21', 251.0, NOW - timedelta(hours=4)),
+            ('SPY', 'rsi_14', 61.0, NOW - timedelta(hours=1)),
+            ('MSFT', 'atr_14', 6.25, NOW - timedelta(hours=3)),
+            ('MSFT', 'atr_14', 5.75, NOW - timedelta(hours=9)),
+        ],
+        'canonical_atr': {'AAPL': 3.1, 'SPY': 4.4, 'MSFT': None},
+        'volatility': {'NVDA': [(NOW.date(), 21.5), (NOW.date() - timedelta(days=1), 20.0)]},
+        'prices': {'TSLA': bars(30, 250.0), 'AMD': bars(10, 160.0)},
+    }
+
+
+class FixtureDB(conftest.FixtureConn):
+
+    def __init__(self, tables):
+        super().__init__()
+        self.t = tables
+        self.statements = 0
+        self.precision_log = []
+        self.friction_log = []
+        self.inversion_evidence = []
+
+    def _regime(self, ticker):
+        rows = self.t['regimes'].get(ticker)
+        if not rows:
+            return None
+        label, confidence, calculated_at, *flag = max(rows, key=lambda r: r[2])
+        return {'ticker': ticker, 'regime_label': label, 'regime_confidence': confidence,
+                'calculated_at': calculated_at, 'verified_inverted': flag[0] if flag else 'false',
+                'snapshot_hash': hashlib.md5(f"{label}:{confidence}:{calculated_at}".encode()).hexdigest()}
+
+    def _indicators(self, tickers, names):
+        rows = [r for r in self.t['indicators']
+                if r[0] in tickers and r[1] in names and r[3] > NOW - timedelta(hours=24)]
+        return sorted(rows, key=lambda r: (r[0], -r[3].timestamp()))
+
+    def _latest_atr_14(self, ticker):
+        rows = sorted((r for r in self.t['indicators'] if r[0] == ticker and r[1] == 'atr_14'),
+                      key=lambda r: r[3], reverse=True)
+        return rows[0][2] if rows else None
+
+    def _volatility(self, ticker):
+        rows = sorted(self.t['volatility'].get(ticker, []), reverse=True)
+        return rows[0][1] if rows else None
+
+    def _cache_atr(self, ticker, atr):
+        rows = [r for r in self.t['volatility'].get(ticker, []) if r[0] != NOW.date()]
+        self.t['volatility'][ticker] = rows + [(NOW.date(), atr)]
+
+    def _bars(self, ticker, limit):
+        return [{'listing_id': ticker, 'date': d, 'high': h, 'low': l, 'close': c}
+                for d, h, l, c in self.t['prices'].get(ticker, [])[:limit]]
+
+    def answer(self, sql, params, cursor):
+        self.statements += 1
+        sql = ' '.join(sql.split())
+        entry_names = set(CPTOPrecisionEngine.ENTRY_INDICATORS)
+
+        if 'FROM fhq_research.regime_classifications WHERE ticker = %s' in sql:
+            row = self._regime(params[0])
+            return [row] if row else []
+        if 'FROM fhq_research.regime_classifications WHERE ticker = ANY(%s)' in sql:
+            return [r for r in map(self._regime, sorted(params[0])) if r]
+        if 'FROM fhq_research.global_regime_state' in sql:
+            regime, updated_at = self.t['global_regime']
+            return [{'current_regime': regime,
+                     'snapshot_hash': hashlib.md5(f"{regime}:{updated_at}".encode()).hexdigest()}]
+        if "indicator_name IN ('ema_21'" in sql:
+            return [{'indicator_name': n, 'indicator_value': v}
+                    for _, n, v, _ in self._indicators({params[0]}, entry_names)]
+        if 'indicator_name = ANY(%s)' in sql:
+            return [{'ticker': t, 'indicator_name': n, 'indicator_value': v}
+                    for t, n, v, _ in self._indicators(set(params[0]), set(params[1]))]
+        if 'fhq_alpha.get_canonical_atr(%s)' in sql:
+            return [(self.t['canonical_atr'].get(params[0]),)]
+        if 'fhq_alpha.get_canonical_atr(t.ticker)' in sql:
+            return [(t, self.t['canonical_atr'].get(t)) for t in params[0]]
+        if "indicator_name = 'atr_14'" in sql and 'ANY(%s)' in sql:
+            return [(t, self._latest_atr_14(t)) for t in params[0] if self._latest_atr_14(t) is not None]
+        if "indicator_name = 'atr_14'" in sql:
+            value = self._latest_atr_14(params[0])
+            return [(value,)] if value is not None else []
+        if sql.startswith('SELECT atr_14 FROM fhq_indicators.volatility'):
+            value = self._volatility(params[0])
+            return [(value,)] if value is not None else []
+        if 'FROM fhq_indicators.volatility WHERE listing_id = ANY(%s)' in sql:
+            return [(t, self._volatility(t)) for t in params[0] if self._volatility(t) is not None]
+        if sql.startswith('INSERT INTO fhq_indicators.volatility'):
+            self._cache_atr(*params)
+            return None
+        if 'FROM fhq_data.price_series WHERE listing_id = %s' in sql:
+            return self._bars(params[0], params[1])
+        if 'FROM fhq_data.price_series WHERE listing_id = ANY(%s)' in sql:
+            return [bar for t in sorted(params[0]) for bar in reversed(self._bars(t, params[1]))]
+        if sql.startswith('INSERT INTO fhq_alpha.cpto_precision_log'):
+            self.precision_log.append(tuple(params))
+            return None
+        if sql.startswith('INSERT INTO fhq_alpha.cpto_friction_log'):
+            self.friction_log.append(tuple(params))
+            return None
+        if 'fhq_alpha.compute_cpto_friction()' in sql:
+            return [(None,)]
+        if sql.startswith('INSERT INTO fhq_alpha.inversion_candidate_evidence'):
+            self.inversion_evidence.append(tuple(params))
+            return None
+        if sql.startswith('WITH inversion_window'):
+            return [(0, 0, 0)]
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        self.statements += 1
+        sql = ' '.join(sql.split())
+        if sql.startswith('INSERT INTO fhq_alpha.cpto_precision_log'):
+            self.precision_log.extend(tuple(a) for a in argslist)
+        elif sql.startswith('INSERT INTO fhq_alpha.cpto_friction_log'):
+            self.friction_log.extend(tuple(a) for a in argslist)
+        elif sql.startswith('INSERT INTO fhq_indicators.volatility'):
+            for ticker, atr in argslist:
+                self._cache_atr(ticker, atr)
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+VERIFIED_INVERSION = {'verified_inverted': True, 'inversion_verification_source': 'IoS-003',
+                      'historical_inversion_evidence': {'episodes': 4}, 'regime': 'STRESS', 'confidence': 0.41}
+
+
+def signal_burst():
+    valid = NOW + timedelta(minutes=10)
+    specs = [
+        # ticker, direction, price, class, inversion_metadata, valid_until
+        ('AAPL', 'UP', 190.0, 'STANDARD', None, valid),
+        ('AAPL', 'DOWN', 190.5, 'STANDARD', None, valid),
+        ('MSFT', 'UP', 410.0, 'STANDARD', None, valid),             # VERIFIED_INVERTED_STRESS
+        ('MSFT', 'DOWN', 409.0, 'HIGH_CONFIDENCE_VERIFIED', None, valid),
+        ('NVDA', 'UP', 880.0, 'STANDARD', None, valid),             # VOLATILE, volatility-table ATR
+        ('NVDA', 'DOWN', 880.0, 'EXPERIMENTAL', None, valid),
+        ('TSLA', 'UP', 252.0, 'STANDARD', None, valid),             # global regime, on-the-fly ATR
+        ('TSLA', 'DOWN', 250.0, 'STANDARD', None, valid),
+        ('AMD', 'UP', 161.0, 'STANDARD', None, valid),              # too little history: ATR refusal
+        ('SPY', 'UP', 510.0, 'BOGUS', None, valid),                 # invalid class
+        ('SPY', 'UP', 510.0, 'STANDARD', None, NOW + timedelta(seconds=10)),    # TTL
+        ('SPY', 'DOWN', 511.0, 'STANDARD', None, valid.replace(tzinfo=None)),  # naive TTL
+        ('MSFT', 'UP', 410.0, INVERSION, VERIFIED_INVERSION, valid),
+        ('NVDA', 'DOWN', 879.0, INVERSION, {'verified_inverted': False}, valid),
+        ('AAPL', 'UP', 190.0, INVERSION, None, valid),
+        ('SPY', 'UP', 510.0, INVERSION, {**VERIFIED_INVERSION, 'inversion_verification_source': None}, valid),
+    ]
+    return [
+        {'ticker': ticker, 'direction': direction, 'confidence': 0.5 + i / 100, 'current_price': price,
+         'signal_valid_until': valid_until, 'signal_id': f"sig-{i:02d}",
+         'signal_timestamp': NOW - timedelta(minutes=i) if i % 2 else None,
+         'signal_class': signal_class, 'inversion_metadata': metadata}
+        for i, (ticker, direction, price, signal_class, metadata, valid_until) in enumerate(specs)
+    ]
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    monkeypatch.setattr(cpto, 'datetime', FrozenDatetime)
+    monkeypatch.setattr(cpto, 'execute_values', fixture_execute_values)
+    monkeypatch.setattr(CPTOPrecisionEngine, '_load_active_parameters', lambda self: CPTOParameterSet())
+
+    def make(db, defcon='GREEN'):
+        monkeypatch.setattr(cpto, 'get_defcon_provider', lambda: StaticDefconProvider(defcon))
+        return CPTOPrecisionEngine(db_conn=db)
+    return make
+
+
+def inversion_log_lines(caplog):
+    return Counter(r.getMessage() for r in caplog.records if r.getMessage().startswith('Inversion candidate'))
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+@pytest.mark.parametrize('defcon', ['GREEN', 'ORANGE', 'RED'])
+def test_batch_matches_single_signal_path(make_engine, caplog, defcon):
+    caplog.set_level(logging.INFO, logger='CPTO')
+    single_db = FixtureDB(fixture_tables())
+    batch_db = FixtureDB(fixture_tables())
+    signals = signal_burst()
+
+    engine = make_engine(single_db, defcon)
+    single = [engine.transform_signal(**copy.deepcopy(s)) for s in signals]
+    single_lines = inversion_log_lines(caplog)
+    caplog.clear()
+    batch = make_engine(batch_db, defcon).transform_signals(copy.deepcopy(signals))
+    batch_lines = inversion_log_lines(caplog)
+
+    assert batch == single
+    assert [p and (p.input_features_hash, p.outputs_hash, p.regime_snapshot_hash) for p in batch] == \
+           [p and (p.input_features_hash, p.outputs_hash, p.regime_snapshot_hash) for p in single]
+    assert batch_db.precision_log == single_db.precision_log
+    assert Counter(batch_db.friction_log) == Counter(single_db.friction_log)
+    assert batch_db.inversion_evidence == single_db.inversion_evidence
+    assert batch_lines == single_lines
+
+    reasons = {row[3] for row in batch_db.friction_log}
+    if defcon == 'RED':
+        assert batch == [None] * len(signals)
+        assert reasons == {'INVALID_SIGNAL_CLASS', 'DEFCON_REFUSE_NEW'}
+        assert sum(batch_lines.values()) == 4           # inversion candidates refused by DEFCON
+    else:
+        assert reasons == {None, 'INVALID_SIGNAL_CLASS', 'TTL_INSUFFICIENT', 'ATR_UNAVAILABLE',
+                           'INVERSION_UNVERIFIED'}
+        regimes = {p.regime_at_calculation for p in batch if p}
+        assert regimes == {'STRONG_BULL', 'MODERATE_BULL', 'VERIFIED_INVERTED_STRESS', 'VOLATILE',
+                           'MODERATE_BEAR'}
+        assert len(batch_db.inversion_evidence) == 3
+        assert batch_db.statements < single_db.statements
+
+
+def test_batch_reuses_context_for_repeated_tickers(make_engine):
+    db = FixtureDB(fixture_tables())
+    engine = make_engine(db)
+    signals = [s for s in signal_burst() if s['signal_class'] == 'STANDARD' and s['ticker'] != 'SPY']
+
+    engine.transform_signals(signals)
+    statements = db.statements
+    again = engine.transform_signals(signals)
+
+    # Cached market context: only the precision and friction logs hit the database
+    assert db.statements - statements == 2 + 1                  # two inserts + friction check
+    assert sum(p is not None for p in again) == len(signals) - 1
+
+
+def test_check_liquidity_uses_passed_depth_or_queries_live(make_engine, monkeypatch):
+    engine = make_engine(FixtureDB(fixture_tables()))
+    engine.transform_signals(signal_burst())                      # leaves context in the cache
+    live = []
+    monkeypatch.setattr(engine, '_get_order_book_depth', lambda ticker, price: live.append(ticker) or 1_000_000.0)
+
+    assert engine.check_liquidity('AAPL', 190.0, 60_000.0) is False
+    assert live == ['AAPL']
+    assert engine.check_liquidity('AAPL', 190.0, 60_000.0, depth_usd=2_000_000.0) is True
+    assert live == ['AAPL']
@@ -0,0 +1,182 @@
+"""
+Tests for the event-driven DaemonSupervisor: dummy daemon scripts are
+supervised for a few seconds, with heartbeats answered from file mtimes
+by a fixture connection. Covers exit detection without polling, backoff
+and crash-loop quarantine, the single heartbeat query per sweep, stale
+heartbeat restarts (SIGTERM, then kill after the grace period) and the
+no-restart rule while the database is unreachable.
+
+Run: python -m pytest 03_FUNCTIONS/test_daemon_watchdog.py -q
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import daemon_watchdog as dw  # noqa: E402
+from daemon_watchdog import DaemonSupervisor  # noqa: E402
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='POSIX signal semantics')
+
+SCRIPTS = {
+    'crasher': "import sys\nsys.exit(3)\n",
+    'heartbeater': (
+        "import os, sys, time\n"
+        "while True:\n"
+        "    with open(sys.argv[0] + '.hb', 'a'):\n"
+        "        os.utime(sys.argv[0] + '.hb')\n"
+        "    time.sleep(0.05)\n"
+    ),
+    'staller': "import time\ntime.sleep(60)\n",
+    'hang': (
+        "import signal, time\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "time.sleep(60)\n"
+    ),
+}
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+class FixtureConn(conftest.FixtureConn):
+    """Answers the heartbeat query from '<script>.hb' file mtimes."""
+
+    def __init__(self, workdir, daemons, fail=False):
+        super().__init__()
+        self.workdir = workdir
+        self.daemons = daemons
+        self.fail = fail
+        self.heartbeat_queries = 0
+        self.own_heartbeats = []
+
+    def minutes_ago(self, name):
+        path = os.path.join(self.workdir, self.daemons[name]['script'] + '.hb')
+        if not os.path.exists(path):
+            return None
+        return (time.time() - os.path.getmtime(path)) / 60
+
+    def answer(self, sql, params, cursor):
+        if self.fail:
+            raise RuntimeError('server closed the connection unexpectedly')
+        if 'unnest(' in sql:
+            self.heartbeat_queries += 1
+            return [(name, self.minutes_ago(name), None) for name in params[0]]
+        if "VALUES ('daemon_watchdog'" in sql:
+            self.own_heartbeats.append(params[0].adapted)
+            return None
+        if 'ORPHANED' in sql or 'control_room_alerts' in sql:
+            return None
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+@pytest.fixture
+def make_supervisor(tmp_path):
+    (tmp_path / 'bin').mkdir()
+    for name, source in SCRIPTS.items():
+        (tmp_path / 'bin' / f'{name}.py').write_text(source)
+    supervisors = []
+
+    def make(names, max_stale_seconds=0.6, fail=False, **kwargs):
+        daemons = {
+            name: {'script': f'bin/{name}.py', 'max_stale_minutes': max_stale_seconds / 60,
+                   'has_heartbeat': name != 'crasher'}
+            for name in names
+        }
+        conn = FixtureConn(str(tmp_path), daemons, fail=fail)
+        params = dict(check_interval=0.2, terminate_timeout=0.5, backoff_base=0.1,
+                      backoff_max=0.4, stable_uptime=60, crash_loop_restarts=100)
+        params.update(kwargs)
+        supervisor = DaemonSupervisor(daemons, workdir=str(tmp_path),
+                                      connection_factory=lambda: conn, **params)
+        supervisor.fixture = conn
+        supervisors.append(supervisor)
+        return supervisor
+
+    yield make
+    for supervisor in supervisors:
+        supervisor.close()
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestExitDetection:
+
+    @pytest.mark.parametrize('mode', ['sigchld', 'threads'])
+    def test_exit_noticed_without_waiting_for_sweep(self, make_supervisor, mode):
+        supervisor = make_supervisor(['crasher'], check_interval=3600, exit_notification=mode)
+        supervisor.run(duration=1.5)
+        stats = supervisor.stats()['crasher']
+
+        # backoff 0.1, 0.2, 0.4, 0.4, ... -> several restarts within 1.5s
+        assert stats['crashes'] >= 3
+        assert stats['last_exit_code'] == 3
+        assert supervisor.sweeps == 1
+
+    def test_relative_scripts_resolve_against_workdir(self, make_supervisor, tmp_path):
+        supervisor = make_supervisor(['heartbeater'])
+        supervisor.run(duration=0.5)
+        assert (tmp_path / 'bin' / 'heartbeater.py.hb').exists()
+        assert supervisor.stats()['heartbeater']['crashes'] == 0
+
+
+class TestRestartPolicy:
+
+    def test_backoff_doubles_and_caps(self, make_supervisor):
+        supervisor = make_supervisor(['crasher'], backoff_base=5, backoff_max=30)
+        assert [supervisor._backoff(n) for n in range(1, 6)] == [5, 10, 20, 30, 30]
+
+    def test_crash_loop_quarantined_and_alerted(self, make_supervisor, monkeypatch):
+        alerts = []
+        monkeypatch.setattr(dw, 'raise_crash_loop_alert', lambda conn, *args: alerts.append(args))
+        supervisor = make_supervisor(['crasher'], backoff_base=0.01, backoff_max=0.01,
+                                     crash_loop_restarts=3, crash_loop_window=60,
+                                     crash_loop_cooldown=3600)
+        supervisor.run(duration=1.5)
+        stats = supervisor.stats()['crasher']
+
+        assert stats['starts'] == 3
+        assert stats['crash_loops'] == 1
+        assert stats['in_crash_loop']
+        assert alerts == [('crasher', 3, 60)]
+
+
+class TestHeartbeats:
+
+    def test_one_query_per_sweep_and_healthy_daemons_kept(self, make_supervisor):
+        supervisor = make_supervisor(['heartbeater', 'staller'], max_stale_seconds=0.3,
+                                     check_interval=0.1)
+        supervisor.run(duration=1.5)
+
+        # heartbeats are only read once a daemon has been up for max_stale
+        assert 0 < supervisor.fixture.heartbeat_queries <= supervisor.sweeps
+        assert supervisor.stats()['heartbeater']['restarts'] == 0
+        assert supervisor.stats()['staller']['heartbeat_restarts'] >= 1
+        assert supervisor.fixture.own_heartbeats[-1]['managed_daemons'] == 2
+
+    def test_hang_killed_after_terminate_timeout(self, make_supervisor):
+        supervisor = make_supervisor(['hang'], max_stale_seconds=0.2, terminate_timeout=0.3,
+                                     backoff_base=10)
+        supervisor.run(duration=1.5)
+        stats = supervisor.stats()['hang']
+
+        assert stats['heartbeat_restarts'] == 1
+        assert stats['last_exit_code'] == -9
+        assert stats['last_exit_reason'] == 'stale heartbeat'
+
+    def test_database_down_means_no_heartbeat_restarts(self, make_supervisor):
+        supervisor = make_supervisor(['staller'], max_stale_seconds=0.2, fail=True)
+        supervisor.run(duration=1.0)
+        stats = supervisor.stats()['staller']
+
+        assert stats['restarts'] == 0
+        assert stats['uptime_seconds'] == 0.0        # shut down cleanly at the end
+        assert stats['total_uptime_seconds'] >= 0.9
@@ -0,0 +1,365 @@
+"""
+Equivalence tests for the ISO 8000 single-scan assessment: assess_sources
+(one grouped scan per table, run concurrently) and its incremental mode
+(cached per-source daily aggregates) must produce exactly the assessments
+of the per-source assess_* functions, and is_source_usable must be served
+from its cache.
+
+FixtureConn answers the per-source, grouped and daily queries from the
+same in-memory price_series / canonical_series rows.
+
+Run: python -m pytest 03_FUNCTIONS/test_data_quality_iso8000.py -q
+"""
+
+import os
+import sys
+from dataclasses import asdict
+from datetime import datetime, time, timedelta, timezone
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+from data_quality_iso8000 import ISO8000QualityFramework  # noqa: E402
+
+NOW = datetime(2026, 3, 18, 15, 30, tzinfo=timezone.utc)     # a Wednesday
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+class FixtureDB:
+    def __init__(self, seed=4):
+        self.now = NOW
+        self.price = []
+        self.macro = []
+        self.rng = np.random.default_rng(seed)
+        self.queries = []
+        self.saved = []
+        self.connections = 0
+        self.fail_tables = set()
+
+        for offset in range(45, -1, -1):
+            day = self.today - timedelta(days=offset)
+            self.add_day(day)
+        # future-dated bar and a source outside DATA_SOURCES
+        self.add_price('ALPACA', 'L0', self.today + timedelta(days=1))
+        self.add_price('POLYGON', 'L0', self.today)
+
+    @property
+    def today(self):
+        return self.now.date()
+
+    def add_price(self, source, listing, day, **override):
+        close = float(self.rng.uniform(50, 150))
+        row = {'source_provider': source, 'listing_id': listing, 'date': day,
+               'open': close * self.rng.uniform(0.97, 1.03), 'high': close * 1.02,
+               'low': close * 0.98, 'close': close, 'volume': float(self.rng.integers(0, 5))}
+        row.update(override)
+        self.price.append(row)
+
+    def add_macro(self, source, feature, ts, value=None):
+        value = float(self.rng.normal(100, 10)) if value is None else value
+        self.macro.append({'provenance': source, 'feature_id': feature, 'timestamp': ts, 'value_raw': value})
+
+    def add_day(self, day):
+        weekday = day.weekday() < 5
+        age = (self.today - day).days
+        for k in range(4):
+            if weekday or k == 0:
+                self.add_price('ALPACA', f"L{k}", day,
+                               close=None if (k == 1 and day.day % 9 == 0) else self.rng.uniform(50, 150))
+        if weekday and age >= 10 and day.day % 4:
+            self.add_price('IEX', 'L1', day, high=40.0, low=60.0)       # stale, invalid H/L
+            self.add_price('IEX', 'L2', day, open=0.0)
+        for hour in (6, 18):
+            self.add_macro('FRED', 'GDP', datetime.combine(day, time(hour), timezone.utc))
+        if age >= 3 and day.day % 3 == 0:
+            self.add_macro('YAHOO', 'VIX', datetime.combine(day, time(12), timezone.utc),
+                           value=5e9 if day.day % 2 else None)
+
+    def advance(self, days=1):
+        for _ in range(days):
+            self.now += timedelta(days=1)
+            self.add_day(self.today)
+            # late bar for yesterday, inside the incremental overlap
+            self.add_price('ALPACA', 'L9', self.today - timedelta(days=1))
+
+    # -- SQL emulation --------------------------------------------------------
+
+    def hours_behind(self, latest):
+        if latest is None:
+            return None
+        if not isinstance(latest, datetime):
+            latest = datetime.combine(latest, time(), timezone.utc)
+        return (self.now - latest).total_seconds() / 3600
+
+    @staticmethod
+    def price_counts(rows):
+        def ok(*values):
+            return all(v is not None for v in values)
+        return {
+            'total_records': len(rows),
+            'null_close': sum(r['close'] is None for r in rows),
+            'null_volume': sum(r['volume'] is None or r['volume'] == 0 for r in rows),
+            'null_high': sum(r['high'] is None for r in rows),
+            'null_low': sum(r['low'] is None for r in rows),
+            'invalid_hl': sum(ok(r['high'], r['low']) and r['high'] < r['low'] for r in rows),
+            'negative_price': sum(ok(r['close']) and r['close'] < 0 for r in rows),
+            'extreme_moves': sum(ok(r['close'], r['open']) and r['open'] != 0
+                                 and abs((r['close'] - r['open']) / r['open']) > 0.5 for r in rows),
+            'close_outside_range': sum(ok(r['close'], r['low'], r['high'])
+                                       and not (r['low'] <= r['close'] <= r['high']) for r in rows),
+        }
+
+    def price_rows(self, source, start):
+        return [r for r in self.price if r['source_provider'] == source and r['date'] >= start]
+
+    def macro_rows(self, source, start):
+        return [r for r in self.macro if r['provenance'] == source and r['timestamp'].date() >= start]
+
+    def weekdays_in_window(self):
+        return [self.today - timedelta(days=k) for k in range(31)
+                if (self.today - timedelta(days=k)).weekday() < 5]
+
+    def price_timeliness(self, rows):
+        recent = [r for r in rows if r['date'] >= self.today - timedelta(days=7)]
+        latest = max((r['date'] for r in recent), default=None)
+        return {'latest_date': latest, 'hours_behind': self.hours_behind(latest),
+                'trading_days': len({r['date'] for r in recent}), 'recent_records': len(recent)}
+
+    def macro_timeliness(self, rows):
+        recent = [r for r in rows if r['timestamp'].date() >= self.today - timedelta(days=7)]
+        latest = max((r['timestamp'] for r in recent), default=None)
+        return {'latest_date': latest.date() if latest else None,
+                'hours_behind': self.hours_behind(latest),
+                'trading_days': len({r['timestamp'].date() for r in recent}),
+                'recent_records': len(recent)}
+
+    def macro_extreme(self, rows):
+        return sum(r['value_raw'] is not None and abs(r['value_raw']) > 1e9 for r in rows)
+
+    def answer(self, sql, params):
+        month = self.today - timedelta(days=30)
+        if 'data_quality_scores' in sql:
+            self.queries.append('save')
+            self.saved.append(params)
+            return []
+        table = 'macro' if 'canonical_series' in sql else 'price'
+        if table in self.fail_tables:
+            self.queries.append(f'{table}_failed')
+            raise RuntimeError(f'{table} scan failed')
+
+        if 'as day' in sql:
+            self.queries.append(f'{table}_daily')
+            since = max(params[1] or month, month)
+            clock = {'now': self.now, 'today': self.today}
+            out = []
+            for source in params[0]:
+                rows = self.price_rows(source, since) if table == 'price' else self.macro_rows(source, since)
+                day_of = (lambda r: r['date']) if table == 'price' else (lambda r: r['timestamp'].date())
+                for day in sorted({day_of(r) for r in rows}):
+                    if table == 'price':
+                        day_rows = [r for r in rows if r['date'] == day]
+                        out.append({**clock, 'source': source, 'day': day, **self.price_counts(day_rows),
+                                    'symbols': sorted({r['listing_id'] for r in day_rows}),
+                                    'max_ts': datetime.combine(day, time(), timezone.utc)})
+                    else:
+                        day_rows = [r for r in rows if r['timestamp'].date() == day]
+                        out.append({**clock, 'source': source, 'day': day,
+                                    'total_records': len(day_rows), 'extreme_moves': self.macro_extreme(day_rows),
+                                    'symbols': sorted({r['feature_id'] for r in day_rows}),
+                                    'max_ts': max(r['timestamp'] for r in day_rows)})
+            return out or [{**clock, 'source': None}]
+
+        if 'ANY(' in sql:
+            self.queries.append(f'{table}_scan')
+            out = []
+            for source in params[0]:
+                if table == 'price':
+                    rows = self.price_rows(source, month)
+                    if not rows:
+                        continue
+                    past = {r['date'] for r in rows if r['date'] <= self.today}
+                    out.append({'source': source, **self.price_counts(rows),
+                                'unique_symbols': len({r['listing_id'] for r in rows}),
+                                'earliest': min(r['date'] for r in rows),
+                                'latest': max(r['date'] for r in rows),
+                                **self.price_timeliness(rows),
+                                'actual_days': len(past),
+                                'trading_days_present': sum(d.weekday() < 5 for d in past),
+                                'expected_trading_days': len(self.weekdays_in_window())})
+                else:
+                    rows = self.macro_rows(source, month)
+                    if not rows:
+                        continue
+                    out.append({'source': source, 'total_records': len(rows),
+                                'unique_symbols': len({r['feature_id'] for r in rows}),
+                                'earliest': min(r['timestamp'].date() for r in rows),
+                                'latest': max(r['timestamp'].date() for r in rows),
+                                **self.macro_timeliness(rows),
+                                'extreme_moves': self.macro_extreme(rows),
+                                'actual_days': len({r['timestamp'].date() for r in rows})})
+            if table == 'price' and not out:
+                out = [{'expected_trading_days': len(self.weekdays_in_window()), 'source': None}]
+            return out
+
+        # Per-source dimension queries
+        source = params[0]
+        if table == 'price':
+            rows = self.price_rows(source, month)
+            if 'date_series' in sql:
+                self.queries.append('price_consistency')
+                past = {r['date'] for r in rows if r['date'] <= self.today}
+                expected = self.weekdays_in_window()
+                return [{'expected_trading_days': len(expected), 'actual_days': len(past),
+                         'missing_days': sum(d not in past for d in expected)}]
+            if 'hours_behind' in sql:
+                self.queries.append('price_timeliness')
+                t = self.price_timeliness(rows)
+                return [{**t, 'total_records': t['recent_records']}]
+            counts = self.price_counts(rows)
+            if 'null_close' in sql:
+                self.queries.append('price_completeness')
+                return [{**counts, 'unique_symbols': len({r['listing_id'] for r in rows}),
+                         'earliest': min((r['date'] for r in rows), default=None),
+                         'latest': max((r['date'] for r in rows), default=None)}]
+            self.queries.append('price_accuracy')
+            return [counts]
+
+        rows = self.macro_rows(source, month)
+        days = {r['timestamp'].date() for r in rows}
+        if '30 as expected_trading_days' in sql:
+            self.queries.append('macro_consistency')
+            return [{'expected_trading_days': 30, 'actual_days': len(days), 'missing_days': 0}]
+        if 'hours_behind' in sql:
+            self.queries.append('macro_timeliness')
+            t = self.macro_timeliness(rows)
+            return [{**t, 'total_records': t['recent_records']}]
+        if 'null_close' in sql:
+            self.queries.append('macro_completeness')
+            return [{'total_records': len(rows), 'null_close': 0, 'null_volume': 0, 'null_high': 0,
+                     'null_low': 0, 'unique_symbols': len({r['feature_id'] for r in rows}),
+                     'earliest': min(days, default=None), 'latest': max(days, default=None)}]
+        self.queries.append('macro_accuracy')
+        return [{'total_records': len(rows), 'invalid_hl': 0, 'negative_price': 0,
+                 'extreme_moves': self.macro_extreme(rows), 'close_outside_range': 0}]
+
+
+class FixtureConn(conftest.FixtureConn):
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        db.connections += 1
+
+    def answer(self, sql, params, cursor):
+        return self.db.answer(sql, params)
+
+
+@pytest.fixture
+def db():
+    return FixtureDB()
+
+
+def make_framework(db):
+    return ISO8000QualityFramework(conn=FixtureConn(db), connection_factory=lambda: FixtureConn(db))
+
+
+def comparable(assessments):
+    return {s: {k: v for k, v in asdict(a).items() if k != 'assessment_date'}
+            for s, a in assessments.items()}
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestSingleScan:
+
+    def test_matches_per_source_assessment(self, db):
+        batched = make_framework(db).run_all_assessments()
+        per_source = make_framework(db).run_all_assessments(batch=False)
+
+        assert comparable(batched) == comparable(per_source)
+        tiers = {s: a.quality_tier for s, a in batched.items()}
+        assert tiers['ALPACA'] != 'BLOCKED' and tiers['TWELVEDATA'] == 'BLOCKED'
+        assert batched['IEX'].accuracy.issues_detected > 0
+        assert batched['YAHOO'].accuracy.issues_detected > 0
+
+    def test_one_scan_per_table_run_concurrently(self, db):
+        framework = make_framework(db)
+        db.queries.clear()
+        framework.run_all_assessments()
+
+        scans = [q for q in db.queries if q != 'save']
+        assert sorted(scans) == ['macro_scan', 'price_scan']
+        assert db.connections == 2            # main connection + one worker
+
+    def test_failed_scan_matches_failed_queries(self, db):
+        db.fail_tables = {'macro'}
+        batched = make_framework(db).assess_sources(parallel=False)
+        per_source = {s: make_framework(db).assess_source(s) for s in ISO8000QualityFramework.DATA_SOURCES}
+
+        assert comparable(batched) == comparable(per_source)
+        assert batched['FRED'].completeness.details == {'error': 'macro scan failed'}
+
+
+class TestIncremental:
+
+    def test_matches_full_scan_after_new_days(self, db):
+        incremental = make_framework(db)
+        assert comparable(incremental.assess_sources(incremental=True)) == \
+            comparable(make_framework(db).assess_sources())
+
+        for step in range(3):
+            db.advance(days=step + 1)
+            db.queries.clear()
+            result = incremental.assess_sources(incremental=True, parallel=False)
+
+            assert sorted(db.queries) == ['macro_daily', 'price_daily']
+            assert comparable(result) == comparable(make_framework(db).assess_sources(parallel=False))
+
+    def test_reads_only_recent_days(self, db):
+        framework = make_framework(db)
+        framework.assess_sources(incremental=True, parallel=False)
+        seen = []
+        answer = db.answer
+
+        def spy(sql, params):
+            if 'as day' in sql:
+                seen.append(params[1])
+            return answer(sql, params)
+
+        db.answer = spy
+        first_day = db.today
+        db.advance()
+        framework.assess_sources(incremental=True, parallel=False)
+        assert seen == [first_day - timedelta(days=framework.INCREMENTAL_OVERLAP_DAYS)] * 2
+
+
+class TestUsabilityCache:
+
+    def test_served_from_cache_until_ttl(self, db):
+        framework = make_framework(db)
+        results = framework.run_all_assessments()
+        db.queries.clear()
+
+        for source, assessment in results.items():
+            assert framework.is_source_usable(source) == (not assessment.is_blocked)
+        assert db.queries == []
+
+        source, (usable, _) = 'IEX', framework._usable['IEX']
+        framework._usable[source] = (usable, 0.0)          # expired
+        assert framework.is_source_usable(source) == usable
+        assert db.queries == ['price_scan']
+        assert framework.is_source_usable('ALPACA') == (not results['ALPACA'].is_blocked)
+        assert db.queries == ['price_scan']
+
+    def test_miss_for_unknown_source_uses_its_table(self, db):
+        framework = make_framework(db)
+        assert framework.is_source_usable('POLYGON') is False      # not a price source -> macro
+        assert db.queries == ['macro_scan']
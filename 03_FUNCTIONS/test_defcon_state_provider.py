@@ -0,0 +1,357 @@
+"""
+Tests for defcon_state_provider: initial read, NOTIFY-driven refresh, poll
+fallback, fail-closed staleness, BLACK handling and recovery, driven by a
+fake connection, a scripted select() and an injectable clock.
+
+The listener loop (_run) runs inline in the test thread: the scripted
+select() decides per iteration whether a notification arrived, the poll
+interval elapsed or the connection broke, and stops the loop when the
+script is exhausted.
+
+Run: python -m pytest 03_FUNCTIONS/test_defcon_state_provider.py -q
+"""
+
+import os
+import sys
+import threading
+import types
+from datetime import datetime, timezone
+
+import psycopg2
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import defcon_state_provider  # noqa: E402
+from defcon_state_provider import (  # noqa: E402
+    FAIL_CLOSED_LEVEL,
+    DefconStateProvider,
+    fetch_current_defcon,
+)
+
+POLL_S = 10.0
+STALE_S = 30.0
+TRIGGERED_AT = datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+class FakeClock:
+    """Monotonic clock advanced explicitly by the test."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeDefconDB:
+    """fhq_governance.defcon_state current row plus availability."""
+
+    def __init__(self, clock, level='GREEN'):
+        self.clock = clock
+        self.level = level
+        self.triggered_at = TRIGGERED_AT
+        self.down_until = None
+        self.connects = 0
+        self.reads = 0
+        self.conn = None
+
+    @property
+    def up(self):
+        return self.down_until is None or self.clock() >= self.down_until
+
+    def connect(self, **kwargs):
+        self.connects += 1
+        if not self.up:
+            raise psycopg2.OperationalError("could not connect to server")
+        self.conn = FakeListenConn(self)
+        return self.conn
+
+
+class FakeListenConn(conftest.FixtureConn):
+    """Autocommit LISTEN connection: answers the current-row query, holds notifies."""
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.autocommit = False
+        self.listening = []
+        self.notifies = []
+        self.broken = False
+
+    def answer(self, sql, params, cursor):
+        if self.broken or not self.db.up:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        if sql.startswith('LISTEN'):
+            self.listening.append(sql.split()[1])
+            return None
+        if 'fhq_governance.defcon_state' in sql:
+            self.db.reads += 1
+            if self.db.level is None:
+                return []
+            return [(self.db.level, self.db.triggered_at)]
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def poll(self):
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def fileno(self):
+        return -1
+
+
+class ScriptedSelect:
+    """
+    select.select stand-in. Each call pops one step:
+      ('notify', level)  - level changes and a NOTIFY arrives
+      ('idle', level)    - poll interval elapses; level may change silently
+      ('break', down_s)  - connection drops and the DB stays down for down_s
+    An empty script stops the listener loop.
+    """
+
+    def __init__(self, db, clock, provider, steps):
+        self.db = db
+        self.clock = clock
+        self.provider = provider
+        self.steps = list(steps)
+
+    def select(self, rlist, wlist, xlist, timeout=None):
+        if not self.steps:
+            self.provider._stop.set()
+            return [], [], []
+        kind, arg = self.steps.pop(0)
+        conn = rlist[0]
+        if kind == 'notify':
+            self.db.level = arg
+            conn.notifies.append(types.SimpleNamespace(channel='defcon_state_changed', payload=arg))
+            return [conn], [], []
+        if kind == 'idle':
+            if arg is not None:
+                self.db.level = arg
+            self.clock.advance(timeout)
+            return [], [], []
+        if kind == 'break':
+            conn.broken = True
+            self.db.down_until = self.clock() + arg
+            return [conn], [], []
+        raise AssertionError(f"Unknown step {kind}")
+
+
+class ClockEvent(threading.Event):
+    """Stop event whose wait() advances the fake clock instead of sleeping."""
+
+    def __init__(self, clock, on_wait=None):
+        super().__init__()
+        self.clock = clock
+        self.on_wait = on_wait
+
+    def wait(self, timeout=None):
+        if timeout:
+            self.clock.advance(timeout)
+        if self.on_wait:
+            self.on_wait()
+        return self.is_set()
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db(clock, monkeypatch):
+    db = FakeDefconDB(clock)
+    monkeypatch.setattr(defcon_state_provider.psycopg2, 'connect', db.connect)
+    return db
+
+
+@pytest.fixture
+def provider(clock, db):
+    provider = DefconStateProvider(
+        db_config={'host': 'fixture'}, poll_interval_s=POLL_S,
+        max_staleness_s=STALE_S, clock=clock
+    )
+    provider._stop = ClockEvent(clock)
+    return provider
+
+
+def prime(provider):
+    """What start() does, minus the background thread."""
+    provider._connect()
+    provider._refresh('initial')
+    provider._started.set()
+
+
+def run_listener(provider, db, clock, monkeypatch, steps):
+    """Run the listener loop inline until the scripted select() runs out."""
+    script = ScriptedSelect(db, clock, provider, steps)
+    monkeypatch.setattr(defcon_state_provider, 'select', types.SimpleNamespace(select=script.select))
+    provider._stop.clear()
+    provider._run()
+    return script
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+def test_fetch_current_defcon_defaults():
+    db = FakeDefconDB(FakeClock(), level=None)
+    assert fetch_current_defcon(FakeListenConn(db)) == ('GREEN', None)
+
+    db.level = 'orange'
+    assert fetch_current_defcon(FakeListenConn(db)) == ('ORANGE', TRIGGERED_AT)
+
+    db.level = 'PURPLE'
+    assert fetch_current_defcon(FakeListenConn(db)) == (FAIL_CLOSED_LEVEL, TRIGGERED_AT)
+
+
+def test_staleness_must_exceed_poll_interval():
+    with pytest.raises(ValueError):
+        DefconStateProvider(poll_interval_s=30, max_staleness_s=30)
+
+
+def test_initial_read_on_first_use(provider, db, clock, monkeypatch):
+    db.level = 'YELLOW'
+    # Listener thread exits at its first select()
+    script = ScriptedSelect(db, clock, provider, [])
+    monkeypatch.setattr(defcon_state_provider, 'select', types.SimpleNamespace(select=script.select))
+
+    snap = provider.snapshot()
+    provider.stop()
+
+    assert snap.level == 'YELLOW'
+    assert snap.source == 'initial'
+    assert snap.triggered_at == TRIGGERED_AT
+    assert snap.number == 3
+    assert not snap.stale
+    assert db.reads == 1
+    assert db.conn.autocommit
+    assert db.conn.listening == ['defcon_state_changed']
+    assert db.conn.closed
+
+
+def test_reads_are_served_from_memory(provider, db):
+    prime(provider)
+    for _ in range(100):
+        assert provider.get_level() == 'GREEN'
+    assert db.reads == 1
+
+
+def test_notify_refreshes_immediately(provider, db, clock, monkeypatch):
+    prime(provider)
+    start = clock()
+
+    run_listener(provider, db, clock, monkeypatch, [('notify', 'ORANGE')])
+
+    snap = provider.snapshot()
+    assert snap.level == 'ORANGE'
+    assert snap.source == 'notify'
+    assert clock() == start  # no poll interval elapsed
+    stats = provider.get_stats()
+    assert stats['notifications'] == 1
+    assert stats['level_changes'] == 1
+    assert stats['polls'] == 0
+    assert db.conn.notifies == []
+
+
+def test_poll_fallback_catches_lost_notification(provider, db, clock, monkeypatch):
+    prime(provider)
+
+    # Level changes without a NOTIFY (missing trigger): the next poll picks it up
+    run_listener(provider, db, clock, monkeypatch, [('idle', None), ('idle', 'RED')])
+
+    snap = provider.snapshot()
+    assert snap.level == 'RED'
+    assert snap.source == 'poll'
+    assert snap.age_s == 0
+    stats = provider.get_stats()
+    assert stats['polls'] == 2
+    assert stats['notifications'] == 0
+    assert stats['level_changes'] == 1
+    assert db.reads == 3
+
+
+def test_fails_closed_after_max_staleness(provider, db, clock):
+    prime(provider)
+
+    clock.advance(STALE_S)
+    assert provider.get_level() == 'GREEN'
+
+    clock.advance(0.1)
+    snap = provider.snapshot()
+    assert snap.level == FAIL_CLOSED_LEVEL == 'RED'
+    assert snap.source == 'fail_closed'
+    assert snap.stale
+    assert provider.get_stats()['fail_closed_reads'] == 1
+
+
+def test_never_read_fails_closed(provider, db, clock, monkeypatch):
+    db.down_until = clock() + 3600
+    script = ScriptedSelect(db, clock, provider, [])
+    monkeypatch.setattr(defcon_state_provider, 'select', types.SimpleNamespace(select=script.select))
+    # The listener retries until stopped; stop it at its first backoff wait
+    provider._stop.on_wait = provider._stop.set
+
+    snap = provider.snapshot()
+    provider.stop()
+
+    assert snap.level == 'RED'
+    assert snap.stale
+    assert provider.get_stats()['errors'] >= 1
+
+
+def test_black_is_served_and_never_relaxed(provider, db, clock, monkeypatch):
+    prime(provider)
+
+    run_listener(provider, db, clock, monkeypatch, [('notify', 'BLACK')])
+    snap = provider.snapshot()
+    assert snap.level == 'BLACK'
+    assert snap.number == 0
+    assert not snap.is_green
+
+    # Stale BLACK stays BLACK: failing closed must not relax it to RED
+    clock.advance(STALE_S + 1)
+    snap = provider.snapshot()
+    assert snap.stale
+    assert snap.level == 'BLACK'
+
+
+def test_recovers_after_database_returns(provider, db, clock, monkeypatch):
+    prime(provider)
+    seen = []
+
+    def during_outage():
+        db.level = 'YELLOW'  # escalated while this process could not see it
+        seen.append((clock(), provider.get_level()))
+
+    provider._stop.on_wait = during_outage
+
+    # One poll, then the connection drops and the DB is down for 45s
+    script = run_listener(provider, db, clock, monkeypatch, [('idle', None), ('break', 45.0)])
+    assert script.steps == []
+
+    # Backoff waits while down: served from cache at first, RED once older than 30s
+    assert [level for _, level in seen] == ['GREEN', 'GREEN', 'GREEN', 'RED', 'RED']
+    assert provider.get_stats()['errors'] == len(seen)
+
+    # Reconnected, re-subscribed and re-read once the DB came back
+    snap = provider.snapshot()
+    assert not snap.stale
+    assert snap.source == 'poll'
+    assert snap.level == 'YELLOW'
+    assert db.connects == 1 + len(seen)
+    assert db.conn.listening == ['defcon_state_changed']
+    assert not provider._was_stale
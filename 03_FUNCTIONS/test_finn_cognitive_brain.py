@@ -0,0 +1,383 @@
+"""
+Cycle executor tests for FINNCognitiveBrain: a full cognitive cycle runs
+against stubbed engines and FixtureDB, an in-memory stand-in for the
+tables the cycle reads and writes.
+
+Checked:
+- prewarm initializes components concurrently and reports failures; a
+  component whose connect fails is not cached
+- selected strategies run in parallel; an over-budget strategy is dropped
+  ('timeout') and skipped while still running ('busy')
+- prices/regimes are prefetched in two queries and execution matches the
+  per-asset lookups; validated signals are stored in one bulk INSERT
+- the cycle reports a per-stage timing breakdown
+
+Run: python -m pytest 03_FUNCTIONS/test_finn_cognitive_brain.py -q
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import finn_cognitive_brain as brain_module  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+from finn_cognitive_brain import FINNCognitiveBrain, PREWARM_COMPONENTS  # noqa: E402
+from kelly_position_sizer import KellyPositionSizer  # noqa: E402
+
+PRICES = {'AAPL': 190.0, 'MSFT': 410.0, 'NVDA': 880.0, 'SPY': 510.0}
+REGIMES = {'AAPL': 'BULL', 'MSFT': 'NEUTRAL', 'SPY': 'BEAR'}   # NVDA: no regime row
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+class FixtureDB(conftest.FixtureConn):
+    """Tables read by the cycle plus the alpha_signals rows it writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.assets = list(PRICES) + ['TSLA']                   # TSLA: no price row
+        self.alpha_signals = []
+        self.statements = []
+
+    def count(self, fragment):
+        return sum(fragment in sql for sql in self.statements)
+
+    def answer(self, sql, params, cursor):
+        sql = ' '.join(sql.split())
+        self.statements.append(sql)
+        if 'fhq_monitoring.api_budget_log' in sql:
+            return [(0,)]
+        if 'FROM fhq_meta.assets' in sql:
+            return [(a,) for a in self.assets[:params[0]]]
+        if 'FROM fhq_data.price_series WHERE listing_id = ANY(%s)' in sql:
+            return [(a, PRICES[a]) for a in params[0] if a in PRICES]
+        if 'FROM fhq_data.price_series WHERE listing_id = %s' in sql:
+            return [(PRICES[params[0]],)] if params[0] in PRICES else []
+        if 'FROM fhq_perception.regime_log WHERE canonical_id = ANY(%s)' in sql:
+            return [(a, REGIMES[a]) for a in params[0] if a in REGIMES]
+        if 'FROM fhq_perception.regime_log WHERE canonical_id = %s' in sql:
+            return [(REGIMES[params[0]],)] if params[0] in REGIMES else []
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        sql = ' '.join(sql.split())
+        assert sql.startswith('INSERT INTO fhq_alpha.alpha_signals') and 'VALUES %s' in sql, sql
+        assert template.count('%s') == 5 and '%s::jsonb' in template
+        self.statements.append(sql)
+        for canonical_id, signal_type, source, confidence, metadata in argslist:
+            self.alpha_signals.append({'canonical_id': canonical_id, 'signal_type': signal_type,
+                                       'strategy_source': source, 'confidence': confidence,
+                                       'signal_metadata': json.loads(metadata)})
+
+
+# =============================================================================
+# STUB ENGINES
+# =============================================================================
+
+@dataclass
+class StubSignal:
+    canonical_id: str
+    signal_type: str
+    confidence: float
+
+
+class StubStrategy:
+    """Returns fixed signals; optionally blocks until released."""
+
+    def __init__(self, signals, gate=None):
+        self.signals = signals
+        self.gate = gate
+        self.calls = []
+
+    def _run(self, *args):
+        self.calls.append((threading.current_thread().name, args))
+        if self.gate is not None:
+            self.gate.wait(timeout=10)
+        return list(self.signals)
+
+    generate_all_signals = scan_universe = _run
+
+    def get_active_grids(self):
+        return {'SPY': None}
+
+    def check_grid_signals(self, asset):
+        return self._run(asset)
+
+    def close(self):
+        self.closed_while_running = self.gate is not None and not self.gate.is_set()
+
+
+class StubCohesion:
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+
+    def check_cohesion(self, canonical_id):
+        return canonical_id not in self.rejected
+
+
+class StubTradeManager:
+
+    def __init__(self):
+        self.capital_state = SimpleNamespace(total_equity=200_000.0)
+
+    def load_open_positions(self):
+        pass
+
+    def scan_for_exits(self):
+        return []
+
+    def calculate_position_size(self, canonical_id, signal_confidence, current_price, kelly_fraction):
+        notional = 10_000.0 * kelly_fraction * signal_confidence
+        return round(notional / current_price, 4), notional
+
+    def create_exit_strategy(self, entry_price, side, regime, signal_confidence):
+        return SimpleNamespace(stop_loss_price=entry_price * 0.95, take_profit_price=entry_price * 1.1,
+                               max_hold_hours=168)
+
+
+class StubPaperAdapter:
+
+    def __init__(self):
+        self.orders = []
+
+    def submit_order(self, order):
+        self.orders.append(order)
+        return SimpleNamespace(status=SimpleNamespace(value='filled'), filled_qty=order.qty,
+                               filled_avg_price=PRICES.get(order.canonical_id, 100.0))
+
+    def close(self):
+        pass
+
+
+class StubGuardian:
+    is_operational = True
+
+    def check_or_fail(self, step_type, predicted_gain=0.5):
+        return SimpleNamespace(should_abort=False, abort_reason=None)
+
+
+class StubBrain(FINNCognitiveBrain):
+
+    def check_defcon(self):
+        return 'GREEN'
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(brain_module, 'execute_values', fixture_execute_values)
+    # Optional EC-020/021/022 components are not installed in this fixture
+    for flag in ('CONTEXT_INJECTION_AVAILABLE', 'COST_CONTROL_AVAILABLE', 'IKEA_AVAILABLE', 'SITC_AVAILABLE'):
+        monkeypatch.setattr(brain_module, flag, False)
+    return FixtureDB()
+
+
+def make_brain(db, strategies_per_cycle=4, budgets=None, vbo_gate=None):
+    brain = StubBrain(strategies_per_cycle=strategies_per_cycle, strategy_budgets_sec=budgets)
+    brain.conn = db
+    brain._statarb = StubStrategy([StubSignal('AAPL', 'LONG_SPREAD', 0.8), StubSignal('MSFT', 'SHORT', 0.6)])
+    brain._grid = StubStrategy([StubSignal('SPY', 'GRID_BUY', 0.7)])
+    brain._vbo = StubStrategy([StubSignal('NVDA', 'BREAKOUT_UP', 0.9)], gate=vbo_gate)
+    brain._meanrev = StubStrategy([StubSignal('TSLA', 'REVERT_DOWN', 0.65), StubSignal('MSFT', 'LONG', 0.55)])
+    for name in ('_varclus', '_causal_engine', '_causal_rl'):
+        setattr(brain, name, SimpleNamespace())
+    brain._foraging = SimpleNamespace(decide=lambda patch, hours: SimpleNamespace(action='STAY', target_patch=None))
+    brain._kelly = SimpleNamespace(kelly_formula=KellyPositionSizer.kelly_formula)
+    brain._cohesion = StubCohesion(rejected={'MSFT'})
+    brain._paper_adapter = StubPaperAdapter()
+    brain._learning_pipeline = SimpleNamespace(process_all_pending=lambda: {'processed': 3, 'updates': 2},
+                                               close=lambda: None)
+    brain._trade_manager = StubTradeManager()
+    brain._runtime_guardian = StubGuardian()
+    return brain
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+def test_full_cycle_runs_strategies_in_parallel(db):
+    brain = make_brain(db)
+    results = brain.run_cognitive_cycle()
+    brain.close()
+
+    assert set(results['strategies']) == {'STATARB', 'GRID', 'VBO', 'MEANREV'}
+    assert all(run['status'] == 'ok' for run in results['strategies'].values())
+    assert results['strategy_used'] in results['strategies']
+    assert brain.meanrev.calls[0][1] == (db.assets,)                 # universe read once, on the cycle thread
+    assert all(name.startswith('finn-strategy') for engine in (brain.statarb, brain.vbo)
+               for name, _ in engine.calls)
+
+    assert len(results['signals']) == 6
+    validated = {s['canonical_id'] for s in results['validated']}
+    assert validated == {'AAPL', 'SPY', 'NVDA', 'TSLA'}
+    assert {pulls for pulls in brain.strategy_bandit.total_pulls.values()} == {1}
+
+    # One bulk INSERT, tagged per strategy
+    assert db.count('INSERT INTO fhq_alpha.alpha_signals') == 1
+    assert sorted((r['canonical_id'], r['strategy_source']) for r in db.alpha_signals) == [
+        ('AAPL', 'FINN_COGNITIVE_STATARB'), ('NVDA', 'FINN_COGNITIVE_VBO'),
+        ('SPY', 'FINN_COGNITIVE_GRID'), ('TSLA', 'FINN_COGNITIVE_MEANREV')]
+    assert db.alpha_signals[0]['signal_metadata']['confidence'] in (0.8, 0.7, 0.9, 0.65)
+
+    # Prices and regimes: one query each, per-asset defaults for missing rows
+    assert db.count('= ANY(%s)') == 2
+    assert db.count('WHERE listing_id = %s') == db.count('WHERE canonical_id = %s') == 0
+    executed = {e['canonical_id']: e for e in results['executed']}
+    assert set(executed) == validated
+    assert (executed['NVDA']['regime'], executed['AAPL']['regime']) == ('UNKNOWN', 'BULL')
+    assert executed['TSLA']['side'] == 'sell' and executed['TSLA']['price'] == 100.0
+    assert executed['AAPL']['exit_strategy']['stop_loss'] == pytest.approx(190.0 * 0.95)
+    assert all(e['kelly_fraction'] > 0 for e in executed.values())
+    assert results['learning_updates'] == 2
+
+    assert all(entry['status'] == 'ok' for entry in results['prewarm'].values())
+    assert set(results['prewarm']) == set(PREWARM_COMPONENTS)
+    assert list(results['timings']) == ['safety', 'prewarm', 'context', 'exits', 'foraging', 'strategies',
+                                        'validation', 'store', 'prefetch', 'execution', 'learning']
+    assert sum(results['timings'].values()) <= results['duration_sec'] + 1e-3
+
+
+def test_prefetched_execution_matches_per_asset_lookups(db):
+    brain = make_brain(db)
+    signals = [StubSignal(a, 'LONG', c) for a, c in (('AAPL', 0.8), ('NVDA', 0.9), ('TSLA', 0.6), ('SPY', 0.7))]
+
+    per_asset = brain._execute_paper_orders(signals, 'STATARB')
+    per_asset_queries = len(db.statements)
+    prices, regimes = brain._prefetch_market_state([s.canonical_id for s in signals] + ['AAPL', None])
+    prefetched = brain._execute_paper_orders(signals, 'STATARB', prices, regimes)
+
+    assert prefetched == per_asset
+    assert per_asset_queries == 2 * len(signals)
+    assert len(db.statements) - per_asset_queries == 2
+
+
+def test_over_budget_strategy_is_dropped_then_busy(db):
+    gate = threading.Event()
+    brain = make_brain(db, budgets={'VBO': 0.1}, vbo_gate=gate)
+    try:
+        start = time.monotonic()
+        first = brain.run_cognitive_cycle()
+        assert time.monotonic() - start < 5
+        assert first['strategies']['VBO']['status'] == 'timeout'
+        assert first['strategies']['STATARB']['status'] == 'ok'
+        assert 'NVDA' not in {r['canonical_id'] for r in db.alpha_signals}
+        assert brain.strategy_bandit.total_pulls['VBO'] == 1       # a timeout counts as a failed pull
+
+        second = brain.run_cognitive_cycle()
+        assert second['strategies']['VBO'] == {'status': 'busy', 'signals': 0, 'duration_sec': 0.0}
+        assert brain.strategy_bandit.total_pulls['VBO'] == 1
+        assert len(brain.vbo.calls) == 1
+
+        gate.set()
+        brain._strategy_futures['VBO'].result(timeout=5)
+        third = brain.run_cognitive_cycle()
+        assert third['strategies']['VBO']['status'] == 'ok'
+        assert 'prewarm' not in second and 'prewarm' not in third
+    finally:
+        gate.set()
+        brain.close()
+
+
+def test_close_waits_for_timed_out_strategy(db):
+    gate = threading.Event()
+    brain = make_brain(db, budgets={'VBO': 0.1}, vbo_gate=gate)
+    assert brain.run_cognitive_cycle()['strategies']['VBO']['status'] == 'timeout'
+
+    closer = threading.Thread(target=brain.close)
+    closer.start()
+    closer.join(timeout=0.2)
+    assert closer.is_alive()                                      # still waiting on the VBO worker
+
+    gate.set()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
+    assert brain._vbo.closed_while_running is False
+
+
+def test_single_strategy_per_cycle(db):
+    brain = make_brain(db, strategies_per_cycle=1)
+    results = brain.run_cognitive_cycle()
+    brain.close()
+    assert list(results['strategies']) == [results['strategy_used']]
+    assert sum(brain.strategy_bandit.total_pulls.values()) == 1
+
+
+class SlowBrain(StubBrain):
+    """Components that take 0.3s to construct; 'broken' fails."""
+
+    def _slow(self, name):
+        time.sleep(0.3)
+        return name
+
+    statarb = property(lambda self: self._slow('statarb'))
+    grid = property(lambda self: self._slow('grid'))
+    vbo = property(lambda self: self._slow('vbo'))
+    meanrev = property(lambda self: self._slow('meanrev'))
+
+    @property
+    def broken(self):
+        raise ConnectionError('connection refused')
+
+
+def test_prewarm_is_concurrent_and_reports_failures():
+    brain = SlowBrain()
+    start = time.monotonic()
+    report = brain.prewarm(('statarb', 'grid', 'vbo', 'meanrev', 'broken'))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.9                                            # sequential would be >= 1.2s
+    assert [report[n]['status'] for n in ('statarb', 'grid', 'vbo', 'meanrev')] == ['ok'] * 4
+    assert all(report[n]['duration_sec'] >= 0.3 for n in ('statarb', 'grid', 'vbo', 'meanrev'))
+    assert report['broken'] == {'status': 'error', 'duration_sec': None, 'error': 'connection refused'}
+    assert brain._prewarmed
+
+
+def test_failed_connect_is_not_cached(monkeypatch):
+    class FlakyEngine:
+        attempts = 0
+
+        def connect(self):
+            FlakyEngine.attempts += 1
+            if FlakyEngine.attempts == 1:
+                raise ConnectionError('connection refused')
+
+    monkeypatch.setattr(brain_module, 'VolatilityBreakoutEngine', FlakyEngine)
+    brain = StubBrain()
+
+    report = brain.prewarm(('vbo',))
+    assert report['vbo']['status'] == 'error'
+    assert brain._vbo is None
+
+    # The lazy path retries and caches only the connected engine
+    assert isinstance(brain.vbo, FlakyEngine)
+    assert brain.vbo is brain._vbo
+    assert FlakyEngine.attempts == 2
+
+
+def test_unserializable_signal_is_skipped_alone(db):
+    brain = make_brain(db)
+    brain._store_signal_batches([('STATARB', [
+        StubSignal('AAPL', 'LONG', 0.8),
+        {'canonical_id': 'MSFT', 'signal_type': 'SHORT', 'confidence': 0.6, 'payload': object()},
+    ])])
+    brain.close()
+
+    assert [r['canonical_id'] for r in db.alpha_signals] == ['AAPL']
+    assert db.alpha_signals[0]['signal_metadata'] == {'canonical_id': 'AAPL', 'signal_type': 'LONG',
+                                                      'confidence': 0.8}
@@ -0,0 +1,334 @@
+"""
+Equivalence tests for IoS-013 batch signal weighting: the batch path
+(compute_signal_weights_batch + bulk save_weighted_plan) must produce the
+same weighted signals, conflicts and weighted_signal_plan rows as weighting
+each signal with compute_signal_weights and upserting rows one at a time.
+
+Both paths run against FixtureDB, which answers the engine's per-signal
+and prefetch queries from the same fixture tables and applies upserts with
+PostgreSQL semantics (a multi-row ON CONFLICT DO UPDATE may not touch the
+same key twice).
+
+Run: python -m pytest 03_FUNCTIONS/test_ios013_signal_weighting_engine.py -q
+"""
+
+import copy
+import os
+import sys
+from datetime import date, datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ios013_signal_weighting_engine as sw  # noqa: E402
+from ios013_signal_weighting_engine import IoS013SignalWeightingEngine  # noqa: E402
+
+FROZEN_NOW = datetime(2026, 3, 2, 9, 30, tzinfo=timezone.utc)
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz else FROZEN_NOW.replace(tzinfo=None)
+
+
+def signal(signal_id, asset_id, signal_type, direction, confidence):
+    return {'signal_id': signal_id, 'asset_id': asset_id, 'signal_type': signal_type,
+            'direction': direction, 'confidence': confidence}
+
+
+SIGNALS = [
+    signal('s1', 'AAPL', 'MOMENTUM_UP', 'UP', 0.82),
+    signal('s2', 'AAPL', 'MEAN_REVERSION', 'UP', 0.64),
+    signal('s3', 'AAPL', 'MACRO_ALIGNED', 'UP', 0.71),
+    signal('s4', 'AAPL', 'GOLDEN_NEEDLE', 'UP', 0.55),
+    signal('s5', 'MSFT', 'MOMENTUM_UP', 'UP', 0.90),
+    signal('s6', 'MSFT', 'MOMENTUM_DOWN', 'DOWN', 0.35),      # direction conflict
+    signal('s7', 'BTC-USD', 'VOLATILITY_BREAKOUT', 'UP', 0.77),
+    signal('s8', 'BTC-USD', 'VOLATILITY_BREAKOUT', 'NEUTRAL', 0.50),
+    signal('s7', 'BTC-USD', 'TIMING', 'UP', 0.61),            # duplicate signal_id
+    signal('s9', 'SPY', 'REGIME_EDGE', 'DOWN', 0.45),
+    signal('s10', 'ETH-USD', 'UNKNOWN_TYPE', 'UP', 0.66),
+    signal('s11', 'GLD', 'GOLDEN_NEEDLE', 'NEUTRAL', 0.58),
+    signal('s12', 'NVDA', 'VOLATILITY', 'UP', None),          # cannot be weighted
+]
+
+TABLES = {
+    # listing_id, regime_label, confidence, created_at
+    'regime_predictions': [
+        ('AAPL', 'MODERATE_BULL', 0.8, 1), ('AAPL', 'STRONG_BULL', 0.9, 2),
+        ('MSFT', 'VOLATILE', None, 1),
+        ('BTC-USD', 'STRESS', 0.6, 1), ('BTC-USD', None, 0.6, 2),   # latest unlabeled -> global
+        ('NVDA', 'NEUTRAL', 0.5, 1),
+    ],
+    # current_regime, updated_at
+    'global_regime_state': [('MODERATE_BEAR', 1), ('NEUTRAL', 2)],
+    # metric_scope, scope_value, brier_score_mean, forecast_count, computed_at
+    'forecast_skill_metrics': [
+        ('MODEL', 'STRAT_DAY_V1', 0.18, 40, 1), ('MODEL', 'STRAT_DAY_V1', 0.12, 50, 2),
+        ('MODEL', 'STRAT_HOUR_V1', 0.21, 10, 1), ('MODEL', 'STRAT_HOUR_V1', None, 0, 2),
+        ('MODEL', 'STRAT_SEC_V1', 0.30, 12, 1),
+        ('GLOBAL', 'ALL_ASSETS', 0.2, 500, 1), ('GLOBAL', 'ALL_ASSETS', 0.16, 600, 2),
+    ],
+    # signal_type, asset_class, path_weight, updated_at
+    'ontology_path_weights': [
+        ('MOMENTUM_UP', 'EQUITY', 0.6, 1), ('MOMENTUM_UP', 'AAP', 0.9, 2),
+        ('MOMENTUM_UP', 'MSF', 0.4, 0),
+        ('MEAN_REVERSION', 'EQUITY', 0.3, 3), ('MEAN_REVERSION', 'AAP', 0.8, 2),
+        ('VOLATILITY_BREAKOUT', 'BTC', None, 5), ('VOLATILITY_BREAKOUT', 'EQUITY', 0.7, 1),
+        ('GOLDEN_NEEDLE', 'EQUITY', 1.1, 1),
+        ('REGIME_EDGE', 'EQUITY', 0.5, 1),
+    ],
+    # asset_id, event_type, impact_score (all within the 3 day window)
+    'market_events': [
+        ('GLOBAL', 'FOMC', 0.55), ('AAPL', 'EARNINGS', 0.85), ('MSFT', 'EARNINGS', 0.2),
+        ('BTC-USD', 'UPGRADE', None), ('SPY', 'CPI', 0.35),
+    ],
+}
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def _latest(rows, key):
+    return max(rows, key=key) if rows else None
+
+
+def _impact_desc(impact):
+    """ORDER BY impact_score DESC: NULLs first, then highest."""
+    return (impact is not None, -(impact or 0))
+
+
+class FixtureDB:
+    def __init__(self, tables, signals):
+        self.t = tables
+        self.signals = signals
+        self.plans = {}
+        self.conflicts = {}
+        self.statements = 0
+
+    def cursor(self, cursor_factory=None):
+        return FixtureCursor(self, as_dict=cursor_factory is not None)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def upsert_plans(self, rows):
+        keys = [(r[0], r[1]) for r in rows]
+        if len(set(keys)) != len(keys):
+            raise Exception("ON CONFLICT DO UPDATE command cannot affect row a second time")
+        for row in rows:
+            row = [getattr(v, 'adapted', v) for v in row]
+            key = (row[0], row[1])
+            if key in self.plans:
+                for i in (2, 5, 6, 7, 10):
+                    self.plans[key][i] = row[i]
+            else:
+                self.plans[key] = row
+
+    def insert_conflicts(self, rows):
+        for row in rows:
+            self.conflicts.setdefault(row[0], tuple(row))
+
+
+class FixtureCursor:
+    def __init__(self, db, as_dict):
+        self.db = db
+        self.t = db.t
+        self.as_dict = as_dict
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def _set(self, rows):
+        self.rows = rows if self.as_dict else [tuple(r.values()) for r in rows]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def execute(self, sql, params=()):
+        self.db.statements += 1
+        bulk = 'ANY(' in sql
+        t = self.t
+
+        if 'FROM fhq_research.signals' in sql:
+            self._set([dict(s) for s in self.db.signals])
+        elif 'regime_predictions' in sql:
+            assets = params[0] if bulk else [params[0]]
+            out = []
+            for a in assets:
+                row = _latest([r for r in t['regime_predictions'] if r[0] == a], key=lambda r: r[3])
+                if row:
+                    out.append({'listing_id': a, 'regime_label': row[1], 'confidence': row[2]} if bulk
+                               else {'regime_label': row[1], 'confidence': row[2]})
+            self._set(out)
+        elif 'global_regime_state' in sql:
+            row = _latest(t['global_regime_state'], key=lambda r: r[1])
+            self._set([{'current_regime': row[0], 'confidence': 0.7}] if row else [])
+        elif 'forecast_skill_metrics' in sql:
+            rows = t['forecast_skill_metrics']
+            if bulk:
+                wanted = {('MODEL', m) for m in params[0]} | {('GLOBAL', 'ALL_ASSETS')}
+                out = []
+                for scope in sorted({(r[0], r[1]) for r in rows} & wanted):
+                    row = _latest([r for r in rows if (r[0], r[1]) == scope], key=lambda r: r[4])
+                    out.append({'metric_scope': row[0], 'scope_value': row[1], 'brier_score_mean': row[2]})
+                self._set(out)
+            elif "'MODEL'" in sql:
+                row = _latest([r for r in rows if r[:2] == ('MODEL', params[0])], key=lambda r: r[4])
+                self._set([{'brier_score_mean': row[2], 'forecast_count': row[3]}] if row else [])
+            else:
+                row = _latest([r for r in rows if r[:2] == ('GLOBAL', 'ALL_ASSETS')], key=lambda r: r[4])
+                self._set([{'brier_score_mean': row[2]}] if row else [])
+        elif 'ontology_path_weights' in sql:
+            rows = t['ontology_path_weights']
+            if bulk:
+                types, classes = set(params[0]), set(params[1]) | {'EQUITY'}
+                out = []
+                for key in sorted({(r[0], r[1]) for r in rows if r[0] in types and r[1] in classes}):
+                    row = _latest([r for r in rows if (r[0], r[1]) == key], key=lambda r: r[3])
+                    out.append({'signal_type': row[0], 'asset_class': row[1],
+                                'path_weight': row[2], 'updated_at': row[3]})
+                self._set(out)
+            else:
+                row = _latest([r for r in rows if r[0] == params[0] and r[1] in (params[1], 'EQUITY')],
+                              key=lambda r: r[3])
+                self._set([{'path_weight': row[2]}] if row else [])
+        elif 'market_events' in sql:
+            rows = t['market_events']
+            if bulk:
+                out = []
+                for a in sorted(set(params[0])):
+                    matches = sorted((r for r in rows if r[0] == a), key=lambda r: _impact_desc(r[2]))
+                    if matches:
+                        out.append({'asset_id': a, 'impact_score': matches[0][2]})
+                self._set(out)
+            else:
+                matches = sorted((r for r in rows if r[0] in (params[0], 'GLOBAL')),
+                                 key=lambda r: _impact_desc(r[2]))
+                self._set([{'event_type': r[1], 'event_date': date(2026, 3, 3), 'impact_score': r[2]}
+                           for r in matches[:1]])
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def execute_values(self, sql, argslist):
+        self.db.statements += 1
+        if 'weighted_signal_plan' in sql:
+            self.db.upsert_plans(argslist)
+        elif 'signal_conflict_registry' in sql:
+            self.db.insert_conflicts(argslist)
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+def fixture_execute_values(cur, sql, argslist, template=None, page_size=100, fetch=False):
+    return cur.execute_values(sql, [tuple(a) for a in argslist])
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    monkeypatch.setattr(sw, 'execute_values', fixture_execute_values)
+    monkeypatch.setattr(sw, 'datetime', FrozenDatetime)
+
+    def make(signals=SIGNALS, tables=TABLES):
+        engine = IoS013SignalWeightingEngine()
+        engine.conn = FixtureDB(copy.deepcopy(tables), copy.deepcopy(signals))
+        return engine
+    return make
+
+
+def per_signal(engine, signals):
+    weighted = []
+    for s in signals:
+        try:
+            weighted.append(engine.compute_signal_weights(s, signals))
+        except Exception:
+            pass
+    return weighted
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestBatchWeighting:
+
+    def test_weighted_signals_equal_per_signal_path(self, make_engine):
+        engine = make_engine()
+        expected = per_signal(engine, copy.deepcopy(SIGNALS))
+        per_signal_statements = engine.conn.statements
+
+        batch_engine = make_engine()
+        actual = batch_engine.compute_signal_weights_batch(copy.deepcopy(SIGNALS))
+
+        assert actual == expected
+        assert len(actual) == len(SIGNALS) - 1          # NVDA has no confidence
+        assert batch_engine.conn.statements <= 5
+        assert per_signal_statements >= 4 * len(actual)
+
+    def test_factor_edge_cases_are_exercised(self, make_engine):
+        weighted = {(w.signal_id, w.signal_type): w
+                    for w in make_engine().compute_signal_weights_batch(copy.deepcopy(SIGNALS))}
+        btc = weighted[('s7', 'VOLATILITY_BREAKOUT')]
+        assert btc.regime_context == 'NEUTRAL'                            # unlabeled -> global
+        assert btc.weight_factors.causal_linkage == 0.5                   # newest path_weight NULL
+        assert btc.weight_factors.event_proximity_penalty == 0.0          # NULL impact sorts first
+        assert weighted[('s2', 'MEAN_REVERSION')].weight_factors.forecast_skill == 0.424   # GLOBAL fallback
+        assert weighted[('s1', 'MOMENTUM_UP')].weight_factors.redundancy_penalty == -0.2
+        assert weighted[('s1', 'MOMENTUM_UP')].weight_factors.event_proximity_penalty == -0.3
+
+    def test_redundancy_grouped_pass_matches_scan(self, make_engine):
+        engine = make_engine()
+        signals = copy.deepcopy(SIGNALS)
+        expected = [engine.calculate_redundancy_penalty(s['signal_id'], s['asset_id'], signals)
+                    for s in signals]
+        assert engine.redundancy_penalties(signals) == expected
+
+
+class TestBulkSave:
+
+    @pytest.mark.parametrize('preexisting', [False, True])
+    def test_bulk_upsert_matches_sequential_upserts(self, make_engine, preexisting):
+        engine = make_engine()
+        weighted = engine.compute_signal_weights_batch(copy.deepcopy(SIGNALS))
+        conflicts = engine.detect_conflicts(weighted)
+        resolved = engine.resolve_conflicts(weighted, conflicts)
+
+        bulk, sequential = make_engine(), make_engine()
+        if preexisting:
+            stale = ['AAPL', FROZEN_NOW.date()] + ['stale'] * 11
+            bulk.conn.plans = {('AAPL', FROZEN_NOW.date()): list(stale)}
+            sequential.conn.plans = {('AAPL', FROZEN_NOW.date()): list(stale)}
+
+        bulk.save_weighted_plan(resolved, conflicts)
+        plan_date = FROZEN_NOW.date()
+        sequential._save_plan_rows([
+            sequential._plan_row(ws, plan_date, [c.conflict_id for c in conflicts if c.asset_id == ws.asset_id])
+            for ws in resolved
+        ])
+
+        assert bulk.conn.plans == sequential.conn.plans
+        assert len(bulk.conn.conflicts) == len(conflicts) == 1
+        assert bulk.conn.statements == 2                   # one plan upsert, one conflict insert
+
+    def test_daily_run_batch_equals_per_signal(self, make_engine):
+        batch, legacy = make_engine(), make_engine()
+        assert batch.run_daily_weighting(batch=True) == legacy.run_daily_weighting(batch=False)
+        assert batch.conn.plans == legacy.conn.plans
+        assert batch.conn.conflicts == legacy.conn.conflicts
+        assert {k[0] for k in batch.conn.plans} == {'AAPL', 'MSFT', 'BTC-USD', 'SPY', 'ETH-USD', 'GLD'}
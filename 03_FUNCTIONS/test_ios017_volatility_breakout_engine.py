@@ -0,0 +1,179 @@
+"""
+Equivalence tests for the IoS-017 panel squeeze scanner: on a fixture
+universe, scan_universe (panel) must return exactly the signals of the
+per-asset path (scan_asset for every active asset), including causal
+bonuses from parents that broke out, while issuing a constant number of
+queries.
+
+Run: python -m pytest 03_FUNCTIONS/test_ios017_volatility_breakout_engine.py -q
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+from ios017_volatility_breakout_engine import VolatilityBreakoutEngine  # noqa: E402
+
+D0 = date(2026, 1, 1)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def squeeze_breakout(rng, n, direction=1.0, squeeze_len=30, start=100.0):
+    """Trending noise, a tight range for squeeze_len bars, then a breakout bar."""
+    squeeze_len = min(squeeze_len, n // 2)
+    body = start * np.exp(np.cumsum(rng.normal(0, 0.02, n - squeeze_len - 1)))
+    quiet = body[-1] * (1 + rng.normal(0, 0.0005, squeeze_len))
+    jump = quiet[-1] * (1 + direction * 0.06)
+    return np.concatenate([body, quiet, [jump]])
+
+
+def bars(closes, rng, spread=0.01):
+    """(high, low, close) with noise so the true range is not constant."""
+    closes = np.asarray(closes, dtype=float)
+    high = closes * (1 + spread * rng.uniform(0.2, 1.0, len(closes)))
+    low = closes * (1 - spread * rng.uniform(0.2, 1.0, len(closes)))
+    return list(zip(high, low, closes))
+
+
+def fixture_tables(seed=5):
+    rng = np.random.default_rng(seed)
+    prices = {}
+    for i in range(12):
+        n = [140, 100, 60, 30][i % 4]
+        prices[f"UP{i}"] = bars(squeeze_breakout(rng, n, 1.0), rng, spread=0.002)
+        prices[f"DN{i}"] = bars(squeeze_breakout(rng, n, -1.0), rng, spread=0.002)
+        prices[f"RW{i}"] = bars(100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), rng)
+    prices['SHORT'] = bars(squeeze_breakout(rng, 24), rng, spread=0.002)   # < bb_period + 5
+    # Parents with exactly PARENT_LOOKBACK bars, shorter, and longer histories
+    prices['PAR_A'] = bars(squeeze_breakout(rng, 20, squeeze_len=12), rng, spread=0.002)
+    prices['PAR_B'] = bars(squeeze_breakout(rng, 80, squeeze_len=12), rng, spread=0.002)
+    prices['PAR_SHORT'] = bars(squeeze_breakout(rng, 15, squeeze_len=8), rng, spread=0.002)
+    prices['PAR_FLAT'] = bars(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 50))), rng)
+
+    assets = sorted(a for a in prices if not a.startswith('PAR_')) + ['NO_DATA']
+    edges = [
+        # (source, target, weight)
+        ('PAR_A', 'UP0', 0.9), ('PAR_B', 'UP0', 0.8), ('PAR_FLAT', 'UP0', 0.7), ('PAR_SHORT', 'UP0', 0.6),
+        ('PAR_B', 'DN1', 0.5), ('PAR_SHORT', 'DN1', 0.95),
+        ('UP1', 'UP2', 0.4), ('PAR_A', 'UP2', 0.3),
+        ('PAR_A', 'RW0', 0.9),
+        ('PAR_A', 'NO_DATA', 0.9),
+    ]
+    return {'assets': assets, 'prices': prices, 'edges': edges}
+
+
+class FixtureConn(conftest.FixtureConn):
+
+    def __init__(self, tables):
+        super().__init__()
+        self.t = tables
+        self.queries = 0
+
+    def _recent(self, asset, limit):
+        """(rn, date, high, low, close), newest first."""
+        series = self.t['prices'].get(asset, [])
+        dated = [(D0 + timedelta(days=d), *bar) for d, bar in enumerate(series)]
+        return [(rn, *bar) for rn, bar in enumerate(reversed(dated[-limit:]), start=1)]
+
+    def _parents(self, asset, limit):
+        edges = sorted((e for e in self.t['edges'] if e[1] == asset), key=lambda e: -e[2])
+        return edges[:limit]
+
+    def answer(self, sql, params, cursor):
+        self.queries += 1
+        if 'fhq_meta.assets' in sql:
+            return [(a,) for a in self.t['assets']]
+        if 'causal_edges' in sql and 'ANY(' in sql:
+            return [{'target_id': target, 'source_id': source, 'edge_weight': weight}
+                    for target in params[0]
+                    for source, target, weight in self._parents(target, params[1])]
+        if 'causal_edges' in sql:
+            return [{'source_id': source, 'edge_weight': weight}
+                    for source, _, weight in self._parents(params[0], params[1])]
+        if 'price_series' in sql and 'ANY(' in sql:
+            return [(a, rn, h, l, c) for a in params[0]
+                    for rn, _, h, l, c in self._recent(a, params[1])]
+        if 'price_series' in sql:
+            return [{'date': d, 'open': c, 'high': h, 'low': l, 'close': c, 'volume': 0.0}
+                    for _, d, h, l, c in self._recent(params[0], params[1])]
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+def make_engine(**kwargs):
+    engine = VolatilityBreakoutEngine(**kwargs)
+    engine.conn = FixtureConn(fixture_tables())
+    return engine
+
+
+def comparable(signals):
+    return [{k: v for k, v in s.__dict__.items() if k != 'timestamp'} for s in signals]
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestPanelScan:
+
+    @pytest.mark.parametrize('params', [{}, {'bb_period': 10, 'kc_period': 10}])
+    def test_matches_per_asset_scan(self, params):
+        panel = make_engine(**params).scan_universe()
+        per_asset = make_engine(**params).scan_universe(panel=False)
+
+        assert comparable(panel) == comparable(per_asset)
+        assert {s.signal_type for s in panel} == {'SQUEEZE_UP', 'SQUEEZE_DOWN'}
+
+    def test_parent_breakouts_amplify(self):
+        # bb_period 10 lets a 20-bar parent window produce a breakout
+        signals = {s.canonical_id: s for s in make_engine(bb_period=10, kc_period=10).scan_universe()}
+        assert signals['UP0'].causal_bonus > 1.0
+        assert signals['UP0'].causal_bonus <= 1.5
+
+    def test_short_histories_skipped(self):
+        signals = {s.canonical_id for s in make_engine().scan_universe()}
+        assert 'SHORT' not in signals                  # 24 bars < bb_period + 5
+        assert 'SHORT' in {s.canonical_id for s in make_engine(bb_period=10).scan_universe()}
+
+    def test_squeeze_state_matches_detect_squeeze(self):
+        engine = make_engine()
+        assets = [a for a in engine.conn.t['assets'] if a in engine.conn.t['prices']]
+        frames, counts = engine.get_price_panel(assets, engine.PRICE_LOOKBACK)
+        eligible = [a for a in assets if counts[a] >= engine.bb_period + 5]
+        panel = engine.detect_squeeze_panel({f: df[eligible] for f, df in frames.items()})
+
+        for asset in eligible:
+            expected = engine.detect_squeeze(engine.get_price_data(asset, engine.PRICE_LOOKBACK))
+            assert panel[asset] == expected
+
+    def test_constant_round_trips(self):
+        panel = make_engine()
+        per_asset = make_engine()
+        panel.scan_universe()
+        per_asset.scan_universe(panel=False)
+
+        # active assets, causal parents, price panel
+        assert panel.conn.queries == 3
+        assert per_asset.conn.queries > 10 * panel.conn.queries
+
+    def test_failed_edge_query_means_no_bonus(self, monkeypatch):
+        engine = make_engine(bb_period=10, kc_period=10)
+        answer = FixtureConn.answer
+
+        def failing(self, sql, params, cursor):
+            if 'causal_edges' in sql:
+                raise RuntimeError('relation does not exist')
+            return answer(self, sql, params, cursor)
+
+        monkeypatch.setattr(FixtureConn, 'answer', failing)
+        signals = engine.scan_universe()
+        assert signals
+        assert all(s.causal_bonus == 1.0 for s in signals)
@@ -0,0 +1,246 @@
+"""
+Equivalence tests for the IoS-018 price panel: calculate_rsi_panel and
+_atr_panel must reproduce calculate_rsi_data / _calculate_atr per asset,
+scan_universe(batch=True) must return and log the same signals as the
+per-asset path, and incremental panel updates (every bar since the last
+scan) must match a full per-asset recomputation, including after gaps of
+several bars.
+
+Run: python -m pytest 03_FUNCTIONS/test_ios018_mean_reversion_engine.py -q
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import ios018_mean_reversion_engine as mr  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+from ios018_mean_reversion_engine import MeanReversionEngine, SignalType  # noqa: E402
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def price(x):
+    return Decimal(str(round(float(x), 4)))
+
+
+def make_bar(rng, close):
+    return (price(close * (1 + rng.uniform(0, 0.02))), price(close * (1 - rng.uniform(0, 0.02))), price(close))
+
+
+def fixture_prices(seed=8):
+    """{asset: [(timestamp, high, low, close)]} oldest first."""
+    rng = np.random.default_rng(seed)
+    series = {}
+    for i in range(40):
+        n = [150, 100, 99, 60, 25, 20, 19, 15, 10][i % 9]
+        drift = rng.choice([-0.03, -0.01, 0.0, 0.01, 0.03])
+        series[f"R{i:02d}"] = 100 * np.exp(np.cumsum(rng.normal(drift, 0.015, n)))
+    series['DOWN'] = np.linspace(200, 100, 120)        # RSI 0
+    series['UP'] = np.linspace(100, 200, 120)          # no losses -> RSI 100
+    series['FLAT'] = np.full(40, 50.0)                 # no losses -> RSI 100
+    return {
+        asset: [(T0 + timedelta(days=d), *make_bar(rng, c)) for d, c in enumerate(closes)]
+        for asset, closes in series.items()
+    }
+
+
+class FixtureConn(conftest.FixtureConn):
+
+    def __init__(self, prices):
+        super().__init__()
+        self.prices = prices
+        self.queries = []
+        self.logged = []
+
+    def _newest(self, asset, limit):
+        return list(reversed(self.prices.get(asset, [])))[:limit]
+
+    def answer(self, sql, params, cursor):
+        if 'meanrev_signals' in sql:
+            self.queries.append('insert')
+            self.logged.append(tuple(params))
+            return None
+        if 'unnest' in sql:
+            self.queries.append('since')
+            assets, latest, days = params
+            return [(a, rn, ts, float(h), float(l), float(c))
+                    for a, last in zip(assets, latest)
+                    for rn, (ts, h, l, c) in enumerate(self._newest(a, days), start=1)
+                    if last is None or ts >= last]
+        if 'ROW_NUMBER()' in sql:
+            self.queries.append('panel')
+            return [(a, rn, ts, float(h), float(l), float(c))
+                    for a in params[0]
+                    for rn, (ts, h, l, c) in enumerate(self._newest(a, params[1]), start=1)]
+        if 'fhq_market.prices' in sql:
+            self.queries.append('prices')
+            return [{'timestamp': ts, 'open': c, 'high': h, 'low': l, 'close': c, 'volume': 0}
+                    for ts, h, l, c in self._newest(params[0], params[1])]
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        assert 'meanrev_signals' in sql and 'VALUES %s' in sql
+        self.queries.append('insert_batch')
+        self.logged.extend(tuple(a) for a in argslist)
+
+
+class StubRegime:
+    def classify(self, asset):
+        return SimpleNamespace(meanrev_favorable=sum(map(ord, asset)) % 3 != 0)
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    monkeypatch.setattr(mr, 'KELLY_AVAILABLE', False)
+    monkeypatch.setattr(mr, 'REGIME_AVAILABLE', False)
+    monkeypatch.setattr(mr, 'execute_values', fixture_execute_values)
+
+    def make(prices=None):
+        engine = MeanReversionEngine(capital=50000, conn=FixtureConn(prices or fixture_prices()))
+        engine.regime_classifier = StubRegime()
+        return engine
+    return make
+
+
+def comparable(signals):
+    return [{k: v for k, v in s.__dict__.items() if k != 'generated_at'} for s in signals]
+
+
+def logged(conn):
+    return [row[:-1] for row in conn.logged]   # drop generated_at
+
+
+def advance(prices, rng, gap=1):
+    """Append `gap` bars to most assets; revise the latest bar of one in place."""
+    for i, (asset, bars) in enumerate(sorted(prices.items())):
+        last_close = float(bars[-1][3])
+        if i % 7 == 3:
+            continue                                           # no new bar today
+        if i % 11 == 5:
+            bars[-1] = (bars[-1][0], *make_bar(rng, last_close * 1.05))   # revised bar
+            continue
+        for _ in range(gap):
+            close = last_close * np.exp(rng.normal(-0.02 if i % 2 else 0.02, 0.02))
+            bars.append((bars[-1][0] + timedelta(days=1), *make_bar(rng, close)))
+            last_close = close
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestPricePanel:
+
+    def test_rsi_matches_per_asset(self, make_engine):
+        engine = make_engine()
+        assets = sorted(engine.conn.prices) + ['NO_DATA']
+        panel_rsi = engine.calculate_rsi_panel(engine.load_panel(assets))
+
+        assert panel_rsi == {a: engine.calculate_rsi_data(a) for a in assets}
+        assert panel_rsi['DOWN'].signal_type == SignalType.OVERSOLD
+        assert panel_rsi['UP'].rsi_daily == 100.0
+        assert {r.signal_type for r in panel_rsi.values()} == set(SignalType)
+
+    def test_atr_matches_per_asset(self, make_engine):
+        engine = make_engine()
+        assets = sorted(engine.conn.prices) + ['NO_DATA']
+        panel = engine.load_panel(assets)
+        atr = engine._atr_panel(panel)
+
+        for i, asset in enumerate(assets):
+            assert atr[i] == engine._calculate_atr(engine._get_prices(asset, days=engine.ATR_DAYS))
+
+    def test_scan_matches_per_asset(self, make_engine):
+        batched, per_asset = make_engine(), make_engine()
+        assets = sorted(batched.conn.prices) + ['NO_DATA', 'DOWN']   # missing and repeated
+
+        b = batched.scan_universe(assets)
+        p = per_asset.scan_universe(assets, batch=False)
+
+        assert b and comparable(b) == comparable(p)
+        assert sorted(logged(batched.conn)) == sorted(logged(per_asset.conn))
+        assert batched.conn.queries == ['panel', 'insert_batch']
+        assert batched.conn.commits == 1
+
+    def test_extreme_rsi_matches_per_asset(self, make_engine):
+        engine = make_engine()
+        assets = sorted(engine.conn.prices)
+        assert engine.get_extreme_rsi_assets(assets) == engine.get_extreme_rsi_assets(assets, batch=False)
+
+
+class TestIncrementalPanel:
+
+    def test_incremental_matches_full_recompute(self, make_engine):
+        engine = make_engine()
+        prices = engine.conn.prices
+        assets = sorted(prices)
+        rng = np.random.default_rng(21)
+
+        engine.scan_universe(assets, incremental=True)
+        for _ in range(8):
+            advance(prices, rng)
+            engine.conn.queries.clear()
+
+            signals = engine.scan_universe(assets, incremental=True)
+            assert engine.conn.queries[0] == 'since'
+            assert 'panel' not in engine.conn.queries
+
+            reference = make_engine(prices)
+            assert comparable(signals) == comparable(reference.scan_universe(assets, batch=False))
+            assert engine.calculate_rsi_panel(engine._panel) == \
+                {a: reference.calculate_rsi_data(a) for a in assets}
+
+    def test_multi_bar_gap_matches_full_recompute(self, make_engine):
+        engine = make_engine()
+        prices = engine.conn.prices
+        assets = sorted(prices)
+        rng = np.random.default_rng(34)
+
+        engine.load_panel(assets, incremental=True)
+        for gap in [3, 2, engine.RSI_DAYS + 5]:
+            advance(prices, rng, gap)
+            engine.conn.queries.clear()
+
+            signals = engine.scan_universe(assets, incremental=True)
+            assert engine.conn.queries[0] == 'since'
+
+            reference = make_engine(prices)
+            assert comparable(signals) == comparable(reference.scan_universe(assets, batch=False))
+            assert engine.calculate_rsi_panel(engine._panel) == \
+                {a: reference.calculate_rsi_data(a) for a in assets}
+            np.testing.assert_array_equal(engine._panel.close, reference.load_panel(assets).close)
+
+    def test_counts_capped_and_thresholds_crossed(self, make_engine):
+        engine = make_engine()
+        prices = engine.conn.prices
+        assets = sorted(prices)
+        panel = engine.load_panel(assets)
+        before = dict(zip(panel.assets, panel.counts))
+
+        advance(prices, np.random.default_rng(3))
+        engine.load_panel(assets, incremental=True)
+        after = dict(zip(panel.assets, panel.counts))
+
+        assert max(after.values()) == engine.RSI_DAYS
+        assert any(before[a] == engine.MIN_RSI_BARS - 1 and after[a] == engine.MIN_RSI_BARS
+                   for a in assets)
+
+    def test_different_asset_set_reloads(self, make_engine):
+        engine = make_engine()
+        assets = sorted(engine.conn.prices)
+        engine.load_panel(assets, incremental=True)
+        engine.load_panel(assets[:5], incremental=True)
+        assert engine.conn.queries == ['panel', 'panel']
@@ -0,0 +1,244 @@
+"""
+Equivalence tests for IoS-020 batched portfolio actions: under a fixed RNG
+seed, CausalRLEngine.get_portfolio_actions(batched=True) must return and
+log the same decisions as the per-asset path (batched=False), while
+issuing a constant number of queries.
+
+Both paths run against FixtureConn, an in-memory stand-in answering the
+engine's per-asset and set-based queries from the same fixture tables.
+
+Run: python -m pytest 03_FUNCTIONS/test_ios020_causal_rl_engine.py -q
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import ios020_causal_rl_engine as rl  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+from thompson_bandit import RegimeAwareBandit, sample_actions  # noqa: E402
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+PORTFOLIO = ['A', 'B', 'C', 'D', 'G']
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def fixture_tables():
+    rng = np.random.default_rng(11)
+    prices = {}
+    for asset, n in [('A', 25), ('B', 25), ('C', 25), ('E', 25), ('F', 3), ('G', 25), ('H', 25)]:
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        prices[asset] = [(T0 + timedelta(days=d), float(c)) for d, c in enumerate(closes)]
+    return {
+        # (source, target, strength)
+        'micro_edges': [('E', 'A', 0.5), ('F', 'A', 0.3), ('B', 'A', 0.05), ('A', 'B', 0.4),
+                        ('H', 'G', 0.2), ('E', 'G', 0.35), ('A', 'G', 0.15), ('B', 'G', 0.6),
+                        ('C', 'G', 0.25), ('F', 'G', 0.12)],
+        # (source_cluster, target_cluster, strength)
+        'macro_edges': [('K2', 'K1', 0.6), ('K3', 'K1', 0.2), ('K4', 'K1', 0.05)],
+        'clusters': {'A': 'K1', 'B': 'K1', 'C': 'K1', 'E': 'K2', 'F': 'K3', 'H': 'K4'},
+        # (cluster, centroid_return, calculated_at)
+        'centroids': [('K1', 0.01, T0), ('K1', -0.02, T0 + timedelta(days=1)), ('K2', 0.03, T0)],
+        'prices': prices,
+        # (asset, regime, created_at)
+        'regimes': [('A', 'STRONG_TREND', T0), ('B', 'WEAK_TREND', T0),
+                    ('B', 'MODERATE_TREND', T0 + timedelta(days=1)), ('E', 'RANGE_BOUND', T0),
+                    ('G', 'STRONG_TREND', T0)],
+    }
+
+
+class FixtureConn(conftest.FixtureConn):
+
+    def __init__(self, tables):
+        super().__init__()
+        self.t = tables
+        self.statements = 0
+        self.decisions = []
+
+    # -- query answers ------------------------------------------------------
+
+    def _micro(self, asset, limit):
+        edges = sorted((e for e in self.t['micro_edges'] if e[1] == asset and e[2] > 0.1),
+                       key=lambda e: -e[2])
+        return [e[0] for e in edges[:limit]]
+
+    def _macro(self, asset, limit):
+        cluster = self.t['clusters'].get(asset)
+        edges = sorted((e for e in self.t['macro_edges'] if e[1] == cluster and e[2] > 0.1),
+                       key=lambda e: -e[2])
+        return [e[0] for e in edges[:limit]]
+
+    def _representative(self, cluster):
+        members = sorted(a for a, c in self.t['clusters'].items() if c == cluster)
+        return members[0] if members else None
+
+    def _centroid(self, asset):
+        rows = [c for c in self.t['centroids'] if c[0] == self.t['clusters'].get(asset)]
+        return max(rows, key=lambda c: c[2])[1] if rows else None
+
+    def _closes(self, asset, limit):
+        return [c for _, c in sorted(self.t['prices'].get(asset, []), reverse=True)[:limit]]
+
+    def _regime(self, asset):
+        rows = [r for r in self.t['regimes'] if r[0] == asset]
+        return max(rows, key=lambda r: r[2])[1] if rows else None
+
+    def answer(self, sql, params, cursor):
+        self.statements += 1
+        bulk = bool(params) and isinstance(params[0], list)
+        if 'INSERT INTO fhq_alpha.rl_decisions' in sql:
+            self.decisions.append(tuple(params))
+            return None
+        if 'INSERT INTO' in sql:
+            return None
+        if 'micro_causal_edges' in sql:
+            assets = params[0] if bulk else [params[0]]
+            limit = params[1] if bulk else 5
+            return [{'target_asset': a, 'source_asset': s}
+                    for a in assets for s in self._micro(a, limit)]
+        if 'macro_causal_edges' in sql:
+            assets = params[0] if bulk else [params[0]]
+            limit = params[1] if bulk else 3
+            return [{'asset_id': a, 'source_cluster_id': c}
+                    for a in assets for c in self._macro(a, limit)]
+        if 'cluster_centroids' in sql:
+            assets = params[0] if bulk else [params[0]]
+            return [{'asset_id': a, 'centroid_return': self._centroid(a)}
+                    for a in assets if self._centroid(a) is not None]
+        if 'fhq_alpha.asset_clusters' in sql:
+            clusters = params[0] if bulk else [params[0]]
+            return [{'cluster_id': c, 'asset_id': self._representative(c)}
+                    for c in clusters if self._representative(c)]
+        if 'fhq_market.prices' in sql:
+            assets = params[0] if bulk else [params[0]]
+            return [{'canonical_id': a, 'close': c}
+                    for a in assets for c in self._closes(a, params[1])]
+        if 'advanced_regime_log' in sql:
+            assets = params[0] if bulk else [params[0]]
+            return [{'asset_id': a, 'trend_regime': self._regime(a)}
+                    for a in assets if self._regime(a) is not None]
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        self.statements += 1
+        assert 'INSERT INTO fhq_alpha.rl_decisions' in sql
+        self.decisions.extend(tuple(a) for a in argslist)
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    monkeypatch.setattr(rl, 'CAUSAL_AVAILABLE', False)
+    monkeypatch.setattr(rl, 'REGIME_AVAILABLE', False)
+    monkeypatch.setattr(rl, 'execute_values', fixture_execute_values)
+
+    def make(seed=42):
+        conn = FixtureConn(fixture_tables())
+        return rl.CausalRLEngine(conn=conn, seed=seed), conn
+    return make
+
+
+def comparable(decisions):
+    return [{k: v for k, v in d.__dict__.items() if k != 'generated_at'} for d in decisions]
+
+
+def logged(conn):
+    return [row[:-1] for row in conn.decisions]   # drop generated_at
+
+
+def apply_rewards(engine, decisions, cycle):
+    for i, d in enumerate(decisions):
+        engine.process_reward(d.asset, rl.RewardSignal(
+            asset=d.asset, action_taken=d.sizing_action,
+            pnl=1.0 if (i + cycle) % 3 else -1.0,
+            risk_adjusted_return=0.1 if (i + cycle) % 2 else -0.1,
+            holding_period=1, regime_at_entry=d.regime, regime_at_exit=d.regime,
+            causal_alignment=0.5
+        ))
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestBatchedPortfolioActions:
+
+    def test_decisions_match_per_asset_path(self, make_engine):
+        assert rl.THOMPSON_AVAILABLE
+        batched, batched_conn = make_engine()
+        per_asset, per_asset_conn = make_engine()
+
+        for cycle in range(5):
+            b = batched.get_portfolio_actions(PORTFOLIO)
+            p = per_asset.get_portfolio_actions(PORTFOLIO, batched=False)
+            assert comparable(b) == comparable(p)
+            apply_rewards(batched, b, cycle)
+            apply_rewards(per_asset, p, cycle)
+
+        assert logged(batched_conn) == logged(per_asset_conn)
+        assert len(batched_conn.decisions) == 5 * len(PORTFOLIO)
+
+    def test_covers_micro_macro_and_no_parent_assets(self, make_engine):
+        engine, _ = make_engine()
+        decisions = {d.asset: d for d in engine.get_portfolio_actions(PORTFOLIO)}
+
+        assert decisions['A'].causal_parents == ['E', 'F']          # micro, threshold applied
+        assert decisions['C'].causal_parents == ['E', 'F']          # macro fallback
+        assert decisions['G'].causal_parents == ['B', 'E', 'C', 'H', 'A']   # top 5 micro
+        assert decisions['D'].causal_parents == []
+        assert decisions['D'].confidence == 0.3
+
+    def test_constant_round_trips(self, make_engine):
+        batched, batched_conn = make_engine()
+        per_asset, per_asset_conn = make_engine()
+
+        batched.get_portfolio_actions(PORTFOLIO)
+        per_asset.get_portfolio_actions(PORTFOLIO, batched=False)
+
+        # parents, macro fallback, representatives, prices, regimes, centroids + insert
+        assert batched_conn.statements <= 7
+        assert per_asset_conn.statements > 5 * batched_conn.statements
+
+    def test_state_matrix_stacks_build_state_vectors(self, make_engine):
+        engine, _ = make_engine()
+        portfolio = engine.state_builder.build_states(PORTFOLIO)
+
+        assert portfolio.assets == PORTFOLIO
+        assert portfolio.matrix.shape == (len(PORTFOLIO), int(portfolio.state_dims.max()))
+        for row, dim, asset in zip(portfolio.matrix, portfolio.state_dims, PORTFOLIO):
+            expected = engine.state_builder.build_state(asset).to_vector()
+            assert dim == len(expected)
+            np.testing.assert_allclose(row[:dim], expected, rtol=0, atol=1e-12)
+            assert np.isnan(row[dim:]).all()
+
+
+class TestVectorizedThompsonSampling:
+
+    @pytest.mark.parametrize('seed', [0, 1, 2, 3])
+    def test_matches_sequential_select_action(self, seed):
+        regimes = ['STRONG_TREND', 'RANGE_BOUND']
+        setup = np.random.default_rng(100 + seed)
+        agents = []
+        for _ in range(20):
+            pair = [RegimeAwareBandit(['a', 'b', 'c', 'd'], regimes),
+                    RegimeAwareBandit(['x', 'y', 'z'], regimes)]
+            for b in pair:
+                b.alpha += setup.integers(0, 20, b.alpha.shape)
+                b.beta += setup.integers(0, 20, b.beta.shape)
+            agents.append(pair)
+        agent_regimes = [regimes[i % 2] if i % 5 else 'UNKNOWN' for i in range(len(agents))]
+
+        rng = np.random.default_rng(seed)
+        sequential = [[b.select_action(r, rng) for b in pair]
+                      for pair, r in zip(agents, agent_regimes)]
+        vectorized = sample_actions(agents, agent_regimes, np.random.default_rng(seed))
+
+        assert vectorized == sequential
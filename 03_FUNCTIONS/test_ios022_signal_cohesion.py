@@ -0,0 +1,158 @@
+"""
+Tests for IoS-022 matrix-based signal cohesion: CorrelationMatrix must
+reproduce the pairwise _calculate_correlation values to 1e-12 (including
+unequal series lengths, short and constant series), the bordered update
+must equal a full rebuild, and the engine must load returns in one query
+and reuse its (asset set, date) cache.
+
+Run: python -m pytest 03_FUNCTIONS/test_ios022_signal_cohesion.py -q
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+from ios022_signal_cohesion import CohesionDecision, CorrelationMatrix, SignalCohesionEngine  # noqa: E402
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def synthetic_returns(seed=3):
+    """Correlated returns with mixed lengths and degenerate series."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, 40)
+    returns = {}
+    for i in range(12):
+        beta = rng.uniform(-1.5, 1.5)
+        length = [34, 34, 34, 34, 30, 30, 20, 8, 34, 34, 34, 34][i]
+        returns[f"S{i}"] = (beta * market + rng.normal(0, 0.01, 40))[-length:]
+    returns['SHORT'] = rng.normal(0, 0.01, 4)                        # < 5 observations
+    returns['FLAT'] = np.zeros(34)                                   # zero variance
+    returns['FLAT_TAIL'] = np.concatenate([rng.normal(0, 0.01, 26), np.zeros(8)])
+    returns['TWIN'] = returns['S0'] * 2.0                            # exactly collinear
+    return returns
+
+
+def pairwise_reference(returns):
+    engine = SignalCohesionEngine.__new__(SignalCohesionEngine)
+    symbols = list(returns)
+    ref = np.zeros((len(symbols), len(symbols)))
+    for i, a in enumerate(symbols):
+        for j, b in enumerate(symbols):
+            ref[i, j] = 1.0 if a == b else engine._calculate_correlation(returns[a], returns[b])
+    return ref
+
+
+class FixtureConn(conftest.FixtureConn):
+    """Answers the bulk returns query from in-memory closes."""
+
+    def __init__(self, closes):
+        super().__init__()
+        self.closes = closes
+        self.queries = []
+        self.logged = []
+
+    def answer(self, sql, params, cursor):
+        if 'signal_cohesion_log' in sql:
+            self.logged.append(params)
+            return None
+        assert 'canonical_id = ANY(%s)' in sql
+        self.queries.append(list(params[0]))
+        return [
+            {'canonical_id': asset, 'date': (T0 + timedelta(days=d)).date(), 'close': close}
+            for asset in sorted(params[0])
+            for d, close in enumerate(self.closes.get(asset, []))
+        ]
+
+
+def closes_from_returns(returns):
+    return {a: list(100 * np.exp(np.concatenate([[0.0], np.cumsum(r)]))) for a, r in returns.items()}
+
+
+@pytest.fixture
+def engine():
+    return SignalCohesionEngine(conn=FixtureConn(closes_from_returns(synthetic_returns())))
+
+
+class TestCorrelationMatrix:
+
+    def test_matches_pairwise_correlation(self):
+        returns = synthetic_returns()
+        matrix = CorrelationMatrix.from_returns(returns)
+        np.testing.assert_allclose(matrix.values, pairwise_reference(returns), rtol=0, atol=1e-12)
+
+    def test_bordered_update_matches_full_build(self):
+        returns = synthetic_returns()
+        symbols = list(returns)
+        for new in ['S3', 'S6', 'S7', 'SHORT', 'FLAT_TAIL']:
+            base = CorrelationMatrix.from_returns({s: returns[s] for s in symbols if s != new})
+            bordered = base.with_asset(new, returns[new])
+            full = CorrelationMatrix.from_returns({s: returns[s] for s in bordered.symbols})
+            np.testing.assert_allclose(bordered.values, full.values, rtol=0, atol=1e-12)
+            assert bordered.index[new] == len(symbols) - 1
+
+    def test_missing_assets_read_as_zero(self):
+        returns = synthetic_returns()
+        matrix = CorrelationMatrix.from_returns({'S0': returns['S0'], 'S1': returns['S1']})
+        as_dict = matrix.to_dict(['S0', 'S1', 'NONE'])
+        assert as_dict['NONE'] == {}
+        assert as_dict['S0']['NONE'] == 0.0
+        assert as_dict['S0']['S0'] == 1.0
+
+
+class TestEngine:
+
+    def test_returns_loaded_in_one_query(self, engine):
+        returns = synthetic_returns()
+        loaded = engine._get_returns(list(returns) + ['NONE'])
+        assert len(engine.conn.queries) == 1
+        assert set(loaded) == set(returns)
+        for asset, series in returns.items():
+            np.testing.assert_allclose(loaded[asset], series, rtol=0, atol=1e-12)
+
+    def test_check_cohesion_uses_matrix_values(self, engine):
+        returns = synthetic_returns()
+        portfolio = ['S1', 'S2', 'S4', 'S6', 'FLAT', 'NONE']
+        result = engine.check_cohesion('S0', portfolio)
+
+        for asset in portfolio:
+            expected = abs(engine._calculate_correlation(returns['S0'], returns[asset])) \
+                if asset in returns else 0.0
+            assert result.correlation_matrix[asset] == pytest.approx(expected, abs=1e-12)
+        assert engine.conn.logged
+
+    def test_rejects_redundant_signal(self, engine):
+        result = engine.check_cohesion('TWIN', ['S0', 'S1'])
+        assert result.decision == CohesionDecision.REJECTED_REDUNDANT
+        assert result.max_correlated_asset == 'S0'
+        assert result.size_multiplier == 0.0
+
+    def test_diversifier_scan_reuses_portfolio_matrix(self, engine, monkeypatch):
+        builds = []
+        original = CorrelationMatrix.from_returns.__func__
+        monkeypatch.setattr(CorrelationMatrix, 'from_returns',
+                            classmethod(lambda cls, r: builds.append(len(r)) or original(cls, r)))
+
+        portfolio = ['S0', 'S1', 'S2']
+        candidates = [f"S{i}" for i in range(3, 12)] + ['FLAT', 'TWIN']
+        results = engine.find_diversifying_assets(portfolio, candidates, max_results=20)
+
+        assert len(engine.conn.queries) == 1
+        assert builds == [3]                      # candidates only add a row/column
+        assert 'TWIN' not in [a for a, _ in results]
+        assert [c for _, c in results] == sorted(c for _, c in results)
+
+    def test_cache_expires_after_ttl(self, engine):
+        engine.check_cohesion('S0', ['S1', 'S2'])
+        engine.check_cohesion('S3', ['S1', 'S2'])
+        assert engine.conn.queries == [['S1', 'S2', 'S0'], ['S3']]
+
+        engine._cache_timestamp -= engine._cache_ttl + timedelta(seconds=1)
+        engine.check_cohesion('S3', ['S1', 'S2'])
+        assert len(engine.conn.queries) == 3
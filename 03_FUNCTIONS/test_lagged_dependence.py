@@ -0,0 +1,254 @@
+"""
+Tests for lagged_dependence (IoS-019 fallback causal discovery) on synthetic
+returns with planted lead-lag links: correlations against np.corrcoef,
+p-values against scipy.stats.pearsonr, Benjamini-Hochberg against
+scipy.stats.false_discovery_control, the MCI stage against per-link least
+squares, and ClusterCausalEngine's fallback _run_pcmci branch.
+
+Run: python -m pytest 03_FUNCTIONS/test_lagged_dependence.py -q
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from scipy import stats
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ios019_cluster_causal_engine  # noqa: E402
+from ios019_cluster_causal_engine import ClusterCausalEngine  # noqa: E402
+from lagged_dependence import (  # noqa: E402
+    _conditioning_set,
+    adjust_pvalues,
+    cross_link_mask,
+    lagged_correlation_matrix,
+    mci_partial_correlations,
+    run_lagged_dependence,
+    select_parents,
+)
+
+TAU_MAX = 3
+ALPHA = 0.05
+
+# (source, target, lag): a chain 0 -> 1 -> 2 (so 0 -> 2 at lag 2 is indirect)
+# plus an independent 3 -> 4 link; 5 is noise
+PLANTED = [(0, 1, 1), (1, 2, 1), (3, 4, 2)]
+INDIRECT = (0, 2, 2)
+NAMES = ['OIL', 'ENERGY', 'UTILITIES', 'RATES', 'BANKS', 'NOISE']
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+def planted_returns(periods=400, seed=3):
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((periods, len(NAMES))) * 0.01
+    for i, j, lag in PLANTED:
+        X[lag:, j] += 0.7 * X[:-lag, i]
+    return X
+
+
+@pytest.fixture
+def X():
+    return planted_returns()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """ClusterCausalEngine on the fallback branch, without a database."""
+    monkeypatch.setattr(ios019_cluster_causal_engine, 'PCMCI_AVAILABLE', False)
+    monkeypatch.setattr(ios019_cluster_causal_engine.psycopg2, 'connect', lambda **kwargs: None)
+    return ClusterCausalEngine()
+
+
+def links_of(result):
+    return {(i, j, lag) for i, j, lag, _, _ in result.significant_links(ALPHA, ClusterCausalEngine.MIN_EDGE_STRENGTH)}
+
+
+# =============================================================================
+# STAGE 1
+# =============================================================================
+
+def test_correlations_match_corrcoef(X):
+    val, n_samples = lagged_correlation_matrix(X, TAU_MAX)
+    T, N = X.shape
+
+    assert val.shape == (N, N, TAU_MAX + 1)
+    assert np.isnan(val[:, :, 0]).all()
+    assert n_samples == {tau: T - tau for tau in range(1, TAU_MAX + 1)}
+    for tau in range(1, TAU_MAX + 1):
+        for i in range(N):
+            for j in range(N):
+                expected = np.corrcoef(X[:-tau, i], X[tau:, j])[0, 1]
+                assert val[i, j, tau] == pytest.approx(expected, abs=1e-12)
+
+
+def test_short_lags_are_not_tested():
+    X = planted_returns(periods=22)
+    val, n_samples = lagged_correlation_matrix(X, TAU_MAX)
+    assert sorted(n_samples) == [1, 2]
+    assert np.isnan(val[:, :, 3]).all()
+
+
+def test_pvalues_match_pearsonr(X):
+    result = run_lagged_dependence(X, NAMES, TAU_MAX, correction='none')
+    N = X.shape[1]
+    for tau in range(1, TAU_MAX + 1):
+        for i in range(N):
+            for j in range(N):
+                ref = stats.pearsonr(X[:-tau, i], X[tau:, j])
+                assert result.val_matrix[i, j, tau] == pytest.approx(ref.statistic, abs=1e-12)
+                assert result.p_matrix[i, j, tau] == pytest.approx(ref.pvalue, rel=1e-6, abs=1e-300)
+    # correction='none' leaves cross links untouched
+    mask = cross_link_mask(N, TAU_MAX, range(1, TAU_MAX + 1))
+    np.testing.assert_array_equal(result.q_matrix[mask], result.p_matrix[mask])
+
+
+# =============================================================================
+# MULTIPLE TESTING
+# =============================================================================
+
+def test_bh_matches_false_discovery_control(X):
+    result = run_lagged_dependence(X, NAMES, TAU_MAX, correction='fdr_bh')
+    mask = cross_link_mask(X.shape[1], TAU_MAX, range(1, TAU_MAX + 1))
+
+    expected = stats.false_discovery_control(result.p_matrix[mask], method='bh')
+    np.testing.assert_allclose(result.q_matrix[mask], expected, rtol=1e-12)
+    assert np.isnan(result.q_matrix[~mask]).all()
+    assert result.n_tests == mask.sum() == 6 * 5 * TAU_MAX
+
+
+def test_bonferroni_and_untested_entries():
+    p = np.array([[[np.nan, 0.01, np.nan], [np.nan, 0.2, 0.004]],
+                  [[np.nan, 0.03, 0.5], [np.nan, 0.9, 0.9]]])
+    mask = cross_link_mask(2, 2, [1, 2])
+    q = adjust_pvalues(p, mask, 'bonferroni')
+
+    # Family of m = 4 cross links: [0,1,1], [0,1,2], [1,0,1], [1,0,2]
+    assert q[0, 1, 1] == pytest.approx(0.8)
+    assert q[0, 1, 2] == pytest.approx(0.016)
+    assert q[1, 0, 1] == pytest.approx(0.12)
+    assert q[1, 0, 2] == pytest.approx(1.0)
+    assert np.isnan(q[0, 0]).all()
+
+    # An untested entry inside the family counts as p = 1
+    p[0, 1, 2] = np.nan
+    q = adjust_pvalues(p, mask, 'fdr_bh')
+    assert q[0, 1, 2] == 1.0
+    np.testing.assert_allclose(q[mask], stats.false_discovery_control([0.2, 1.0, 0.03, 0.5]))
+
+    with pytest.raises(ValueError):
+        adjust_pvalues(p, mask, 'holm')
+
+
+# =============================================================================
+# STAGE 2: MCI
+# =============================================================================
+
+def test_mci_matches_per_link_least_squares(X):
+    stage1 = run_lagged_dependence(X, NAMES, TAU_MAX, correction='none')
+    val, p, n_conditioned = mci_partial_correlations(
+        X, stage1.val_matrix, stage1.p_matrix, TAU_MAX, ALPHA, max_conds=3
+    )
+    parents = select_parents(stage1.val_matrix, stage1.p_matrix, ALPHA, 3)
+    T = X.shape[0]
+    n = T - 2 * TAU_MAX
+
+    def shifted(var, lag):
+        return X[2 * TAU_MAX - lag:T - lag, var]
+
+    retested = list(zip(*np.nonzero(
+        (stage1.p_matrix < ALPHA) & cross_link_mask(X.shape[1], TAU_MAX, range(1, TAU_MAX + 1))
+    )))
+    assert n_conditioned == len(retested) > len(PLANTED)
+
+    for i, j, tau in retested:
+        conds = _conditioning_set(i, j, tau, parents)
+        Z = np.column_stack([np.ones(n)] + [shifted(k, lag) for k, lag in conds])
+        rx = shifted(i, tau) - Z @ np.linalg.lstsq(Z, shifted(i, tau), rcond=None)[0]
+        ry = shifted(j, 0) - Z @ np.linalg.lstsq(Z, shifted(j, 0), rcond=None)[0]
+        r = stats.pearsonr(rx, ry).statistic
+        t_stat = r * np.sqrt((n - 2 - len(conds)) / (1 - r ** 2))
+        p_ref = 2 * stats.t.sf(abs(t_stat), n - 2 - len(conds))
+
+        assert val[i, j, tau] == pytest.approx(r, abs=1e-10)
+        assert p[i, j, tau] == pytest.approx(p_ref, rel=1e-6)
+
+    # Links that were not re-tested keep their stage-1 values
+    untouched = ~((stage1.p_matrix < ALPHA) & cross_link_mask(X.shape[1], TAU_MAX, range(1, TAU_MAX + 1)))
+    np.testing.assert_array_equal(val[untouched], stage1.val_matrix[untouched])
+
+
+def test_mci_removes_indirect_link(X):
+    stage1 = run_lagged_dependence(X, NAMES, TAU_MAX, conditioning=False)
+    mci = run_lagged_dependence(X, NAMES, TAU_MAX, conditioning=True)
+
+    assert set(PLANTED) <= links_of(stage1)
+    assert INDIRECT in links_of(stage1)
+
+    assert mci.conditioned and mci.n_conditioned > 0
+    assert set(PLANTED) <= links_of(mci)
+    assert INDIRECT not in links_of(mci)
+
+
+def test_mci_chunking_is_transparent(X):
+    stage1 = run_lagged_dependence(X, NAMES, TAU_MAX, correction='none')
+    whole = mci_partial_correlations(X, stage1.val_matrix, stage1.p_matrix, TAU_MAX, ALPHA)
+    chunked = mci_partial_correlations(X, stage1.val_matrix, stage1.p_matrix, TAU_MAX, ALPHA, chunk_size=2)
+    np.testing.assert_allclose(chunked[0], whole[0], atol=1e-12)
+    np.testing.assert_allclose(chunked[1], whole[1], rtol=1e-9)
+
+
+# =============================================================================
+# CLUSTER CAUSAL ENGINE
+# =============================================================================
+
+def test_edges_from_matrices(engine):
+    val = np.zeros((3, 3, 3))
+    q = np.ones((3, 3, 3))
+    val[0, 1, 1], q[0, 1, 1] = 0.41234, 0.001     # kept
+    val[1, 2, 2], q[1, 2, 2] = -0.3, 0.049        # kept (negative)
+    val[2, 0, 1], q[2, 0, 1] = 0.05, 0.0001       # too weak
+    val[0, 2, 1], q[0, 2, 1] = 0.6, 0.05          # not significant
+    val[1, 1, 1], q[1, 1, 1] = 0.9, 0.0           # autolag
+    val[0, 1, 0], q[0, 1, 0] = 0.9, 0.0           # contemporaneous
+
+    edges = engine._edges_from_matrices(['A', 'B', 'C'], val, q, 'lagged_corr')
+
+    assert [(e.source, e.target, e.lag, e.strength, e.p_value) for e in edges] == [
+        ('A', 'B', 1, 0.4123, 0.001),
+        ('B', 'C', 2, -0.3, 0.049),
+    ]
+    assert {e.edge_type for e in edges} == {'lagged_corr'}
+    assert edges[0].discovered_at == edges[1].discovered_at
+
+
+def test_run_pcmci_fallback_returns_planted_edges(engine, X):
+    # Series of unequal length are aligned on their most recent observations
+    data = {name: X[:, k] for k, name in enumerate(NAMES)}
+    data['NOISE'] = np.concatenate([np.random.default_rng(0).standard_normal(50), data['NOISE']])
+
+    edges = engine._run_pcmci(data)
+
+    expected = run_lagged_dependence(
+        X, NAMES, ClusterCausalEngine.TAU_MAX, ClusterCausalEngine.PC_ALPHA,
+        ClusterCausalEngine.FALLBACK_CORRECTION, ClusterCausalEngine.FALLBACK_CONDITIONING,
+        ClusterCausalEngine.FALLBACK_MAX_CONDS
+    ).significant_links(ClusterCausalEngine.PC_ALPHA, ClusterCausalEngine.MIN_EDGE_STRENGTH)
+    assert [(e.source, e.target, e.lag) for e in edges] == [
+        (NAMES[i], NAMES[j], lag) for i, j, lag, _, _ in expected
+    ]
+
+    found = {(e.source, e.target, e.lag) for e in edges}
+    assert {(NAMES[i], NAMES[j], lag) for i, j, lag in PLANTED} <= found
+    assert (NAMES[INDIRECT[0]], NAMES[INDIRECT[1]], INDIRECT[2]) not in found
+    assert {e.edge_type for e in edges} == {'lagged_parcorr'}
+    assert all(e.p_value < ClusterCausalEngine.PC_ALPHA for e in edges)
+    assert all(abs(e.strength) > ClusterCausalEngine.MIN_EDGE_STRENGTH for e in edges)
+
+
+def test_run_pcmci_needs_two_series(engine, X):
+    assert engine._run_pcmci({'OIL': X[:, 0]}) == []
@@ -0,0 +1,370 @@
+"""
+Equivalence tests for LearningFeedbackPipeline batch mode: after
+process_all_pending in batch mode the bandit posteriors, strategy
+statistics, processed flags, audit rows, proposals and causal RL rewards
+must match one-by-one processing (batch=False).
+
+Both modes run against FixtureDB, an in-memory stand-in that interprets
+the pipeline's SQL (NUMERIC(p,4) rounding and integer division included).
+
+Run: python -m pytest 03_FUNCTIONS/test_learning_feedback_pipeline.py -q
+"""
+
+import copy
+import json
+import os
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+import learning_feedback_pipeline as lfp  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+from learning_feedback_pipeline import LearningFeedbackPipeline  # noqa: E402
+from thompson_bandit import RegimeBanditSystem, SizingAction, TimingAction  # noqa: E402
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+STRATEGIES = ['FINN_COGNITIVE_STATARB', 'FINN_COGNITIVE_VBO', 'FINN_COGNITIVE_GRID']
+REGIMES = ['STRONG_TREND', 'RANGE_BOUND', 'HIGH_VOLATILITY', 'BEARISH_TRENDING', 'UNKNOWN', 'CRISIS']
+ASSETS = ['AAPL', 'MSFT', 'NVDA', 'SPY', 'BTC-USD']
+
+
+def numeric4(value):
+    """Assignment to a NUMERIC(p,4) column."""
+    return Decimal(str(value)).quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+class FixtureDB(conftest.FixtureConn):
+
+    def __init__(self, outcomes, stats=None, bandit_states=None, edges=(), closes=None):
+        super().__init__()
+        self.outcomes = outcomes
+        self.stats = dict(stats or {})
+        self.stats_table_exists = True
+        self.bandit_states = dict(bandit_states or {})
+        self.edges = list(edges)
+        self.closes = dict(closes or {})               # listing_id -> closes, newest first
+        self.proposals = []
+        self.learning_updates = []
+        self.statements = 0
+
+    def submit_proposal(self, engine, proposal_type, evidence):
+        proposal_id = str(uuid.UUID(int=len(self.proposals) + 1))
+        self.proposals.append((engine, proposal_type, evidence.adapted[0]['outcome_id']))
+        return proposal_id
+
+    def upsert_stats(self, strategy, row):
+        if not self.stats_table_exists:
+            raise RuntimeError('relation "fhq_execution.strategy_performance_stats" does not exist')
+        self.stats[strategy] = row
+
+    def answer(self, sql, params, cursor):
+        self.statements += 1
+        sql = ' '.join(sql.split())
+
+        if 'FROM fhq_execution.paper_trade_outcomes pto' in sql:
+            pending = sorted((o for o in self.outcomes if not o['learning_applied']), key=lambda o: o['created_at'])
+            columns = ['outcome_id', 'position_id', 'canonical_id', 'strategy_source', 'side', 'entry_price',
+                       'exit_price', 'realized_pnl', 'realized_pnl_pct', 'max_drawdown_pct',
+                       'hold_duration_minutes', 'regime_at_entry', 'regime_at_exit']
+            coalesced = ('regime_at_entry', 'regime_at_exit')
+            return shaped(cursor, columns, [[o[c] if o[c] is not None or c not in coalesced else 'UNKNOWN'
+                                             for c in columns] for o in pending[:100]])
+        if 'FROM fhq_cognition.bandit_states WHERE strategy = %s' in sql:
+            columns = ['bandit_name', 'regime', 'bandit_type', 'alpha', 'beta', 'total_pulls', 'total_reward']
+            return shaped(cursor, columns, [[row[c] for c in columns] for row in self.bandit_states.values()
+                                            if row['strategy'] == params[0]])
+        if sql.startswith('INSERT INTO fhq_cognition.bandit_states'):
+            name, strategy, regime, bandit_type, alpha, beta, pulls, reward = params
+            self.bandit_states[name] = {'bandit_name': name, 'strategy': strategy, 'regime': regime,
+                                        'bandit_type': bandit_type, 'alpha': alpha, 'beta': beta,
+                                        'total_pulls': pulls, 'total_reward': reward}
+            return None
+        if sql.startswith('INSERT INTO fhq_execution.strategy_performance_stats') and '%s, 1,' in sql:
+            self._stats_upsert(*params)
+            return None
+        if 'FROM fhq_execution.strategy_performance_stats WHERE strategy_source = ANY(%s) FOR UPDATE' in sql:
+            if not self.stats_table_exists:
+                raise RuntimeError('relation does not exist')
+            columns = ['strategy_source', 'total_trades', 'winning_trades', 'total_pnl', 'total_pnl_pct',
+                       'max_drawdown_pct', 'avg_hold_minutes']
+            return shaped(cursor, columns, [[s] + [self.stats[s][c] for c in columns[1:]]
+                                            for s in params[0] if s in self.stats])
+        if sql.startswith('CREATE TABLE IF NOT EXISTS fhq_execution.strategy_performance_stats'):
+            self.stats_table_exists = True
+            return None
+        if 'FROM fhq_alpha.causal_edges WHERE target_id = %s' in sql:
+            return shaped(cursor, ['source_id', 'edge_weight'],
+                          [(s, 0.5) for t, s, active in self.edges if t == params[0] and active][:5])
+        if 'FROM fhq_alpha.causal_edges WHERE target_id = ANY(%s)' in sql:
+            per_target = Counter()
+            parents = []
+            for t, s, active in self.edges:
+                if t in params[0] and active and per_target[t] < 5:
+                    per_target[t] += 1
+                    parents.append((t, s))
+            return shaped(cursor, ['target_id', 'source_id'], parents)
+        if sql.startswith('SELECT (SELECT close FROM fhq_data.price_series'):
+            closes = self.closes.get(params[0], [])
+            latest = closes[0] if closes else None
+            previous = closes[1] if len(closes) > 1 and closes[1] != 0 else None
+            ret = latest / previous - 1 if latest is not None and previous is not None else None
+            return shaped(cursor, ['parent_return'], [(ret,)])
+        if 'FROM fhq_data.price_series WHERE listing_id = ANY(%s)' in sql:
+            return shaped(cursor, ['listing_id', 'close'], [(s, c) for s in sorted(params[0])
+                                                            for c in self.closes.get(s, [])[:2]])
+        if 'fhq_governance.fn_submit_learning_proposal' in sql:
+            engine, proposal_type, _, _, evidence = params
+            return shaped(cursor, ['id'], [(self.submit_proposal(engine, proposal_type, evidence),)])
+        if sql.startswith('UPDATE fhq_execution.paper_trade_outcomes'):
+            ids = params[0] if 'ANY(%s::uuid[])' in sql else [params[0]]
+            for outcome in self.outcomes:
+                if outcome['outcome_id'] in ids:
+                    outcome['learning_applied'] = True
+            return None
+        if sql.startswith('INSERT INTO fhq_execution.learning_updates'):
+            self.learning_updates.append(tuple(params[:4]))
+            return None
+        raise AssertionError(f"Unexpected SQL: {sql}")
+
+    def _stats_upsert(self, strategy, pnl_case, pnl, pnl_pct, drawdown, hold,
+                      pnl_case2, pnl2, pnl_pct2, drawdown2, hold2):
+        """INSERT ... VALUES (...) ON CONFLICT (strategy_source) DO UPDATE, as Postgres evaluates it."""
+        old = self.stats.get(strategy)
+        if old is None:
+            row = {'total_trades': 1, 'winning_trades': 1 if pnl_case > 0 else 0, 'total_pnl': numeric4(pnl),
+                   'total_pnl_pct': numeric4(pnl_pct),
+                   'max_drawdown_pct': numeric4(drawdown) if drawdown is not None else None,
+                   'avg_hold_minutes': hold}
+        else:
+            # GREATEST ignores NULLs
+            drawdowns = [d for d in (old['max_drawdown_pct'], drawdown2) if d is not None]
+            row = {
+                'total_trades': old['total_trades'] + 1,
+                'winning_trades': old['winning_trades'] + (1 if pnl_case2 > 0 else 0),
+                'total_pnl': numeric4(old['total_pnl'] + Decimal(str(pnl2))),
+                'total_pnl_pct': numeric4(old['total_pnl_pct'] + Decimal(str(pnl_pct2))),
+                'max_drawdown_pct': numeric4(max(Decimal(str(d)) for d in drawdowns)) if drawdowns else None,
+                # integer / integer truncates toward zero
+                'avg_hold_minutes': int(Decimal(old['avg_hold_minutes'] * old['total_trades'] + hold2)
+                                        / Decimal(old['total_trades'] + 1)),
+            }
+        self.upsert_stats(strategy, row)
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        self.statements += 1
+        sql = ' '.join(sql.split())
+        if sql.startswith('INSERT INTO fhq_execution.strategy_performance_stats'):
+            assert 'DO UPDATE SET total_trades = EXCLUDED.total_trades' in sql
+            columns = ['total_trades', 'winning_trades', 'total_pnl', 'total_pnl_pct', 'max_drawdown_pct',
+                       'avg_hold_minutes']
+            for strategy, *values in argslist:
+                self.upsert_stats(strategy, dict(zip(columns, values)))
+        elif 'fhq_governance.fn_submit_learning_proposal' in sql:
+            return [(idx, self.submit_proposal(engine, proposal_type, evidence))
+                    for idx, engine, proposal_type, _, _, evidence in argslist]
+        elif sql.startswith('INSERT INTO fhq_execution.learning_updates'):
+            self.learning_updates.extend(tuple(args[:4]) for args in argslist)
+        else:
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+
+def shaped(cursor, columns, values):
+    """Result rows shaped like a RealDictCursor's or a plain cursor's."""
+    return [dict(zip(columns, row)) if cursor.as_dict else tuple(row) for row in values]
+
+
+class RecordingRLEngine:
+    """Causal RL stand-in: records reward signals in order."""
+
+    agents = {}
+
+    def __init__(self):
+        self.rewards = []
+
+    def get_agent_stats(self, asset):
+        return {}
+
+    def process_reward(self, asset, reward):
+        self.rewards.append((asset, reward.causal_alignment, reward.risk_adjusted_return, reward.pnl))
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+def build_db(n_outcomes=130, seed=50):
+    rng = np.random.default_rng(seed)
+    outcomes = []
+    for i in range(n_outcomes):
+        pnl_pct = round(float(rng.normal(0.2, 3.0)), 6)
+        pnl = [0.00005, -0.00005, 0.00015][i] if i < 3 else round(float(rng.normal(5, 80)), 6)
+        outcomes.append({
+            'outcome_id': str(uuid.UUID(int=10**6 + i)),
+            'position_id': str(uuid.UUID(int=2 * 10**6 + i)),
+            'canonical_id': ASSETS[int(rng.integers(len(ASSETS)))],
+            'strategy_source': STRATEGIES[int(rng.integers(len(STRATEGIES)))],
+            'side': 'long',
+            'entry_price': Decimal('100.0'),
+            'exit_price': Decimal('101.5'),
+            'realized_pnl': Decimal(str(pnl)),
+            'realized_pnl_pct': Decimal(str(pnl_pct)),
+            'max_drawdown_pct': Decimal(str(round(float(rng.uniform(0, 8)), 6))),
+            'hold_duration_minutes': int(rng.integers(5, 5000)),
+            'regime_at_entry': REGIMES[int(rng.integers(len(REGIMES)))] if i % 9 else None,
+            'regime_at_exit': 'RANGE_BOUND',
+            'created_at': T0 + timedelta(minutes=i),
+            'learning_applied': i % 41 == 40,                  # a few already processed
+        })
+
+    stats = {STRATEGIES[0]: {'total_trades': 7, 'winning_trades': 4, 'total_pnl': Decimal('12.3456'),
+                             'total_pnl_pct': Decimal('3.1000'), 'max_drawdown_pct': Decimal('2.5000'),
+                             'avg_hold_minutes': 333}}
+
+    bandit_states = {}
+    sizing = [a.value for a in SizingAction]
+    bandit_states[f"{STRATEGIES[1]}_RANGE_BOUND_sizing"] = {
+        'bandit_name': f"{STRATEGIES[1]}_RANGE_BOUND_sizing", 'strategy': STRATEGIES[1],
+        'regime': 'RANGE_BOUND', 'bandit_type': 'sizing',
+        'alpha': json.dumps({a: 3.5 for a in sizing}), 'beta': json.dumps({a: 2.25 for a in sizing}),
+        'total_pulls': json.dumps({a: 4 for a in sizing}), 'total_reward': json.dumps({a: 0.125 for a in sizing}),
+    }
+
+    edges = [('AAPL', 'MSFT', True), ('AAPL', 'SPY', True), ('AAPL', 'NVDA', False),
+             ('NVDA', 'SPY', True), ('NVDA', 'BTC-USD', True), ('NVDA', 'AAPL', True),
+             ('SPY', 'ETH-USD', True)]
+    closes = {'MSFT': [Decimal('410.5'), Decimal('400.0')], 'SPY': [Decimal('500'), Decimal('505.25')],
+              'BTC-USD': [Decimal('60000')], 'AAPL': [Decimal('190'), Decimal('190')],
+              'ETH-USD': [Decimal('3000'), Decimal('0')]}
+    return FixtureDB(outcomes, stats=stats, bandit_states=bandit_states, edges=edges, closes=closes)
+
+
+@pytest.fixture(autouse=True)
+def fixture_sql(monkeypatch):
+    monkeypatch.setattr(lfp, 'execute_values', fixture_execute_values)
+
+
+def make_pipeline(db):
+    pipeline = LearningFeedbackPipeline()
+    pipeline.conn = db
+    pipeline.rl_engine = RecordingRLEngine()
+    return pipeline
+
+
+def drain(pipeline, batch):
+    processed = []
+    while True:
+        result = pipeline.process_all_pending(batch=batch)
+        if not result['processed']:
+            return processed
+        processed.append(result)
+
+
+def bandit_state(system):
+    return {
+        (kind, regime): (bandit.alpha, bandit.beta, bandit.total_pulls, bandit.total_reward)
+        for kind, bandits in (('sizing', system.sizing_bandits), ('timing', system.timing_bandits))
+        for regime, bandit in bandits.items()
+    }
+
+
+def assert_bandits_equal(expected, actual):
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        alpha, beta, pulls, reward = expected[key]
+        b_alpha, b_beta, b_pulls, b_reward = actual[key]
+        assert b_pulls == pulls, key
+        for want, got in ((alpha, b_alpha), (beta, b_beta), (reward, b_reward)):
+            assert got.keys() == want.keys()
+            for action in want:
+                assert got[action] == pytest.approx(want[action], rel=1e-12, abs=1e-12), (key, action)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+def test_batch_matches_sequential_processing():
+    sequential_db = build_db()
+    # NULL drawdowns: on the first row of a new strategy and on later rows
+    first = {}
+    for outcome in sequential_db.outcomes:
+        first.setdefault(outcome['strategy_source'], outcome)
+    first[STRATEGIES[1]]['max_drawdown_pct'] = None
+    for outcome in sequential_db.outcomes[10::17]:
+        outcome['max_drawdown_pct'] = None
+    batch_db = copy.deepcopy(sequential_db)
+    sequential, batch = make_pipeline(sequential_db), make_pipeline(batch_db)
+
+    sequential_runs = drain(sequential, batch=False)
+    batch_runs = drain(batch, batch=True)
+
+    assert [r['processed'] for r in batch_runs] == [r['processed'] for r in sequential_runs] == [100, 27]
+    assert [r['updates'] for r in batch_runs] == [r['updates'] for r in sequential_runs]
+    assert all(o['learning_applied'] for o in batch_db.outcomes)
+
+    # Strategy statistics: identical rows (NUMERIC rounding, integer averages)
+    assert batch_db.stats == sequential_db.stats
+    assert sum(row['total_trades'] for row in batch_db.stats.values()) == 7 + 127
+    assert all(row['max_drawdown_pct'] is not None for row in batch_db.stats.values())
+
+    # Bandit posteriors, in memory and as persisted after the batch
+    assert batch.bandit_systems.keys() == sequential.bandit_systems.keys() == set(STRATEGIES)
+    for strategy in STRATEGIES:
+        batch_state = bandit_state(batch.bandit_systems[strategy])
+        assert_bandits_equal(bandit_state(sequential.bandit_systems[strategy]), batch_state)
+        reloaded = RegimeBanditSystem(strategy=strategy, conn=batch_db)
+        assert_bandits_equal(batch_state, bandit_state(reloaded))
+    assert sum(sequential.bandit_systems[STRATEGIES[1]].sizing_bandits['RANGE_BOUND'].total_pulls.values()) > 4 * 4
+
+    # Audit rows, proposals and RL rewards
+    audit = Counter((u[0], u[1]) for u in sequential_db.learning_updates)
+    assert Counter((u[0], u[1]) for u in batch_db.learning_updates) == audit
+    assert Counter(sequential_db.proposals) == Counter(batch_db.proposals)
+    assert any(engine == 'IKEA' for engine, _, _ in batch_db.proposals)
+    assert batch.rl_engine.rewards == sequential.rl_engine.rewards
+    assert len({alignment for _, alignment, _, _ in batch.rl_engine.rewards}) >= 3
+
+    # Round trips: constant per batch instead of per outcome
+    assert batch_db.statements < 100                    # bandit saves: 12 rows per strategy per batch
+    assert sequential_db.statements > 10 * batch_db.statements
+
+
+def test_batch_creates_missing_stats_table_and_retries():
+    db = build_db(n_outcomes=20)
+    db.stats, db.stats_table_exists = {}, False
+    pipeline = make_pipeline(db)
+
+    drain(pipeline, batch=True)
+
+    assert db.stats_table_exists
+    assert sum(row['total_trades'] for row in db.stats.values()) == 20
+
+
+def test_update_many_matches_update():
+    rng = np.random.default_rng(5)
+    db = FixtureDB([])
+    one_by_one = RegimeBanditSystem(strategy='A', conn=db)
+    bulk = RegimeBanditSystem(strategy='B', conn=db)
+    sizing, timing = [a.value for a in SizingAction] + ['SIZE_UNKNOWN'], [a.value for a in TimingAction]
+    updates = [(str(rng.choice(RegimeBanditSystem.REGIMES + ['OTHER'])), str(rng.choice(sizing)),
+                str(rng.choice(timing)), float(rng.normal(0, 0.05))) for _ in range(500)]
+
+    for update in updates:
+        one_by_one.update(*update)
+    statements = db.statements
+    bulk.update_many(updates)
+
+    assert_bandits_equal(bandit_state(one_by_one), bandit_state(bulk))
+    assert db.statements - statements == 2 * len(RegimeBanditSystem.REGIMES)   # one save
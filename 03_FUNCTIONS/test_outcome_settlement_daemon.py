@@ -0,0 +1,395 @@
+"""
+Equivalence tests for outcome_settlement_daemon: the set-based settlement
+path must leave decision_packs, post_mortem_settlement and
+outcome_settlement_log in exactly the state the per-pack path does.
+
+Both paths run against FixtureDB, an in-memory stand-in (conftest.FixtureConn)
+that interprets the daemon's SQL (column lists, placeholders, NOW(), NULL,
+literals) so that parameter wiring is checked, not just call counts.
+
+Run: python -m pytest 03_FUNCTIONS/test_outcome_settlement_daemon.py -q
+"""
+
+import copy
+import importlib
+import os
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402
+from conftest import fixture_execute_values  # noqa: E402
+
+DB_NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+FROZEN_UTC = datetime(2026, 3, 1, 12, 0, 5, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# FIXTURE DATABASE
+# =============================================================================
+
+def _split_top_level(text):
+    parts, depth, current = [], 0, ''
+    for ch in text:
+        if ch == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        depth += ch == '('
+        depth -= ch == ')'
+        current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+class FixtureDB(conftest.FixtureConn):
+    """Committed/working copies of the tables the daemon touches."""
+
+    def __init__(self, packs, links, outcomes, post_mortems=None):
+        super().__init__()
+        self.state = {
+            'decision_packs': {p['pack_id']: dict(p) for p in packs},
+            'outcome_pack_link': [dict(link) for link in links],
+            'outcome_ledger': {o['outcome_id']: dict(o) for o in outcomes},
+            'post_mortem_settlement': {pm['pack_id']: dict(pm) for pm in (post_mortems or [])},
+            'outcome_settlement_log': [],
+        }
+        self.committed = copy.deepcopy(self.state)
+        self.statements = 0
+        self.fail_next = None
+
+    def commit(self):
+        super().commit()
+        self.committed = copy.deepcopy(self.state)
+
+    def rollback(self):
+        super().rollback()
+        self.state = copy.deepcopy(self.committed)
+
+    # -- evaluation -----------------------------------------------------------
+
+    @staticmethod
+    def _value(token, params, row=None):
+        token = token.strip()
+        if token.startswith('%s'):
+            return params.pop(0)
+        if token == 'NOW()':
+            return DB_NOW
+        if token == 'NULL':
+            return None
+        if token.startswith("'"):
+            return token.strip("'")
+        if token.startswith('v.'):
+            return row[token[2:]]
+        raise AssertionError(f"Unsupported SQL value: {token}")
+
+    def answer(self, sql, params, cursor):
+        self.statements += 1
+        if self.fail_next and self.fail_next in sql:
+            self.fail_next = None
+            raise RuntimeError('injected failure')
+        sql = ' '.join(sql.split())
+        params = list(params)
+
+        if 'fhq_monitoring.' in sql:
+            return []
+        if 'LEFT JOIN LATERAL' in sql:
+            return self._candidates(limit=params[0])
+        if sql.startswith('SELECT') and 'FROM fhq_learning.decision_packs dp' in sql:
+            return [self._pack_row(p) for p in self._eligible()[:50]]
+        if 'WHERE opl.pack_id = %s' in sql:
+            outcome = self._outcome_for(params[0])
+            return [outcome] if outcome else []
+        if sql.startswith('INSERT INTO'):
+            return self._insert(sql, params)
+        if sql.startswith('UPDATE fhq_learning.decision_packs SET'):
+            return self._update_one(sql, params)
+        raise AssertionError(f"Unexpected statement: {sql[:80]}")
+
+    def _eligible(self):
+        packs = self.state['decision_packs'].values()
+        eligible = [p for p in packs
+                    if p['execution_status'] == 'PENDING' and p['created_at'] < DB_NOW - timedelta(hours=24)]
+        return sorted(eligible, key=lambda p: p['created_at'])
+
+    @staticmethod
+    def _pack_row(pack):
+        return {c: pack[c] for c in (
+            'pack_id', 'asset', 'direction', 'hypothesis_uuid', 'created_at', 'snapshot_price',
+            'snapshot_timestamp', 'evidence_hash', 'snapshot_ttl_valid_until')}
+
+    def _outcome_for(self, pack_id):
+        for link in self.state['outcome_pack_link']:
+            outcome = self.state['outcome_ledger'].get(link['outcome_id'])
+            if link['pack_id'] == pack_id and outcome:
+                return {**link, **{k: v for k, v in outcome.items() if k != 'outcome_id'}}
+        return None
+
+    def _candidates(self, limit):
+        rows = []
+        for pack in self._eligible()[:limit]:
+            row = self._pack_row(pack)
+            outcome = self._outcome_for(pack['pack_id']) or {}
+            for column in osd_module().OUTCOME_COLUMNS:
+                row[f'oc_{column}'] = outcome.get(column)
+            rows.append(row)
+        return rows
+
+    def _insert(self, sql, params):
+        m = re.match(r'INSERT INTO (\w+)\.(\w+) \((.*?)\) VALUES \((.*?)\)( ON CONFLICT \(pack_id\) DO NOTHING)?'
+                     r'( RETURNING (.*))?$', sql)
+        assert m, sql
+        table, columns = m.group(2), [c.strip() for c in m.group(3).split(',')]
+        values = _split_top_level(m.group(4))
+        assert len(columns) == len(values), f"{table}: {len(columns)} columns, {len(values)} values"
+        row = {c: self._value(v, params) for c, v in zip(columns, values)}
+        assert not params, f"{table}: {len(params)} unused parameters"
+
+        if table == 'post_mortem_settlement':
+            if row['pack_id'] in self.state[table]:
+                return []
+            row['post_mortem_id'] = str(uuid.uuid4())
+            self.state[table][row['pack_id']] = row
+        elif table == 'outcome_settlement_log':
+            row['settlement_id'] = str(uuid.uuid4())
+            self.state[table].append(row)
+        else:
+            raise AssertionError(f"Unexpected insert into {table}")
+
+        returning = [c.strip() for c in m.group(7).split(',')] if m.group(7) else []
+        return [tuple(row[c] for c in returning)] if returning else []
+
+    def _apply_set(self, assignments, params, row=None):
+        changes = {}
+        for assignment in _split_top_level(assignments):
+            column, value = (part.strip() for part in assignment.split('=', 1))
+            changes[column] = self._value(value, params, row)
+        return changes
+
+    def _update_one(self, sql, params):
+        m = re.match(r'UPDATE fhq_learning\.decision_packs SET (.*) WHERE pack_id = %s$', sql)
+        assert m, sql
+        changes = self._apply_set(m.group(1), params)
+        pack_id = params.pop(0)
+        assert not params, f"{len(params)} unused parameters"
+        pack = self.state['decision_packs'].get(pack_id)
+        if pack:
+            pack.update(changes)
+        return None
+
+    def answer_values(self, sql, argslist, template, fetch, cursor):
+        sql = ' '.join(sql.split())
+        template = re.sub(r'::\w+', '', template)
+        if sql.startswith('INSERT INTO'):
+            results = []
+            for args in argslist:
+                results.extend(self.answer(sql.replace('VALUES %s', f'VALUES {template}'), args, cursor))
+            # One round trip for the whole batch
+            self.statements -= len(argslist) - 1
+            return results
+
+        self.statements += 1
+        if self.fail_next and self.fail_next in sql:
+            self.fail_next = None
+            raise RuntimeError('injected failure')
+        m = re.match(r'UPDATE fhq_learning\.decision_packs dp SET (.*) FROM \(VALUES %s\) AS v\((.*?)\) '
+                     r"WHERE dp\.pack_id = v\.pack_id AND dp\.execution_status = 'PENDING'$", sql)
+        assert m, sql
+        v_columns = [c.strip() for c in m.group(2).split(',')]
+        slots = _split_top_level(template.strip()[1:-1])
+        assert len(slots) == len(v_columns)
+        for args in argslist:
+            args = list(args)
+            v = {c: self._value(slot, args) for c, slot in zip(v_columns, slots)}
+            assert not args
+            pack = self.state['decision_packs'].get(v['pack_id'])
+            if pack and pack['execution_status'] == 'PENDING':
+                pack.update(self._apply_set(m.group(1), [], v))
+        return None
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+_MODULE = {}
+
+
+def osd_module():
+    return _MODULE['osd']
+
+
+@pytest.fixture
+def osd(tmp_path, monkeypatch):
+    # The daemon logs to a cwd-relative path at import time
+    (tmp_path / '03_FUNCTIONS').mkdir()
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('outcome_settlement_daemon')
+    _MODULE['osd'] = module
+    monkeypatch.setattr(module, '_utcnow', lambda: FROZEN_UTC)
+    monkeypatch.setattr(module, 'execute_values', fixture_execute_values)
+    return module
+
+
+def _id(prefix, i):
+    return str(uuid.UUID(int=prefix * 10**6 + i))
+
+
+def build_fixture(n_packs=137):
+    """Mixed backlog: linked, unlinked, too young, already settled, pre-existing post-mortem."""
+    packs, links, outcomes, post_mortems = [], [], [], []
+    for i in range(n_packs):
+        pack_id = _id(1, i)
+        age = timedelta(hours=30 + i) if i % 11 else timedelta(hours=6)
+        packs.append({
+            'pack_id': pack_id,
+            'asset': ['BTC-USD', 'ETH-USD', 'SPY', 'EURUSD'][i % 4],
+            'direction': 'LONG' if i % 2 else 'SHORT',
+            'hypothesis_uuid': _id(2, i) if i % 5 else None,
+            'created_at': DB_NOW - age,
+            'snapshot_price': Decimal('100.5') + i,
+            'snapshot_timestamp': DB_NOW - age,
+            'evidence_hash': f'sha256:pack{i}',
+            'snapshot_ttl_valid_until': DB_NOW - age + timedelta(minutes=15),
+            'execution_status': 'EXECUTED' if i % 17 == 0 else 'PENDING',
+            'outcome_id': None,
+            'filled_at': None,
+            'fail_reason_code': None,
+            'fail_reason_detail': None,
+            'terminalized_at': None,
+            'settled_by': None,
+        })
+        if i % 3 == 0:
+            continue
+        for k in range(2 if i % 13 == 0 else 1):
+            outcome_id = _id(3 + k, i)
+            outcomes.append({
+                'outcome_id': outcome_id,
+                'outcome_type': 'PRICE_DIRECTION',
+                'outcome_domain': packs[-1]['asset'],
+                'outcome_value': 'UP' if i % 2 else 'DOWN',
+                'outcome_timestamp': None if i % 19 == 0 else DB_NOW - timedelta(hours=i % 7),
+                'evidence_source': 'fixture',
+                'evidence_data': {'i': i},
+                'content_hash': f'hash{i}-{k}',
+            })
+            links.append({
+                'link_id': _id(5 + k, i),
+                'outcome_id': outcome_id,
+                'pack_id': pack_id,
+                'hypothesis_id': packs[-1]['hypothesis_uuid'],
+                'linked_at': DB_NOW - timedelta(hours=1),
+                'link_method': 'EXACT_MATCH',
+                'link_confidence': Decimal('0.9') - Decimal(k) / 10,
+            })
+    # Post-mortem left by an earlier backfill: ON CONFLICT keeps it untouched
+    post_mortems.append({'pack_id': _id(1, 3), 'fail_reason_code': 'BACKFILL', 'post_mortem_id': 'pm-existing'})
+    return packs, links, outcomes, post_mortems
+
+
+def snapshot(db):
+    state = db.committed
+    post_mortems = {k: {c: v for c, v in row.items() if c != 'post_mortem_id' or v == 'pm-existing'}
+                    for k, row in state['post_mortem_settlement'].items()}
+    log = sorted(({c: v for c, v in row.items() if c != 'settlement_id'}
+                  for row in state['outcome_settlement_log']), key=lambda r: r['pack_id'])
+    return state['decision_packs'], post_mortems, log
+
+
+def drain_per_pack(osd, db):
+    cycles = 0
+    while osd.settle_pending_per_pack(db)['pending_evaluated']:
+        cycles += 1
+    return cycles
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestSetBasedEquivalence:
+    def test_terminal_states_and_audit_rows_match_per_pack(self, osd):
+        reference = FixtureDB(*build_fixture())
+        drain_per_pack(osd, reference)
+
+        db = FixtureDB(*build_fixture())
+        result = osd.settle_backlog(db)
+
+        assert result['errors_count'] == 0
+        assert snapshot(db) == snapshot(reference)
+
+        packs, post_mortems, log = snapshot(db)
+        statuses = [p['execution_status'] for p in packs.values()]
+        assert statuses.count('EXECUTED') > 8
+        assert statuses.count('ORPHANED_OUTCOME_MISSING') > 30
+        assert statuses.count('PENDING') > 0  # packs younger than 24h untouched
+        assert len(log) == len(result['settlements'])
+        assert post_mortems[_id(1, 3)]['post_mortem_id'] == 'pm-existing'
+
+    def test_settlement_summaries_match(self, osd):
+        reference = FixtureDB(*build_fixture())
+        expected = []
+        while True:
+            cycle = osd.settle_pending_per_pack(reference)
+            if not cycle['pending_evaluated']:
+                break
+            expected.extend(cycle['settlements'])
+
+        result = osd.settle_backlog(FixtureDB(*build_fixture()))
+        keys = ('pack_id', 'asset', 'new_status', 'outcome_id', 'settlement_reason_code')
+        assert [{k: s[k] for k in keys} for s in result['settlements']] == \
+               [{k: s[k] for k in keys} for s in expected]
+        # Set-based path also reports the post-mortems it created
+        orphaned = [s for s in result['settlements'] if s['new_status'] == 'ORPHANED_OUTCOME_MISSING']
+        assert all(s['settlement_log_id'] for s in result['settlements'])
+        assert sum(1 for s in orphaned if s['post_mortem_id']) == len(orphaned) - 1
+
+    def test_fewer_round_trips(self, osd):
+        reference = FixtureDB(*build_fixture())
+        drain_per_pack(osd, reference)
+        db = FixtureDB(*build_fixture())
+        result = osd.settle_backlog(db)
+
+        assert result['chunks'] <= 3
+        assert db.statements * 10 < reference.statements
+
+    def test_failed_chunk_rolls_back_and_shrinks(self, osd):
+        reference = FixtureDB(*build_fixture())
+        drain_per_pack(osd, reference)
+
+        db = FixtureDB(*build_fixture())
+        db.fail_next = 'outcome_settlement_log'
+        result = osd.settle_backlog(db)
+
+        assert result['errors_count'] == 1
+        assert snapshot(db) == snapshot(reference)
+
+    def test_persistent_failure_fails_closed(self, osd, monkeypatch):
+        def broken(conn, plans):
+            raise RuntimeError('constraint violation')
+        monkeypatch.setattr(osd, 'apply_settlement_chunk', broken)
+
+        db = FixtureDB(*build_fixture())
+        before = copy.deepcopy(db.committed)
+        result = osd.settle_backlog(db, chunk_size=40)
+
+        assert result['settlements'] == []
+        assert result['errors_count'] == 3  # 40 -> 20 -> 10 (minimum), then stop
+        assert db.committed == before
+
+
+class TestChunkSizing:
+    def test_adapts_to_target(self, osd):
+        target = osd.SETTLEMENT_CHUNK_TARGET_SECONDS
+        assert osd._next_chunk_size(50, target / 10) == 100
+        assert osd._next_chunk_size(50, target * 0.75) == 50
+        assert osd._next_chunk_size(50, target * 3) == 25
+        assert osd._next_chunk_size(osd.SETTLEMENT_CHUNK_MAX, 0) == osd.SETTLEMENT_CHUNK_MAX
+        assert osd._next_chunk_size(osd.SETTLEMENT_CHUNK_MIN, target * 3) == osd.SETTLEMENT_CHUNK_MIN
@@ -0,0 +1,256 @@
+"""
+Tests for provider_fanout: token buckets, adaptive backoff, hedging and
+histograms, driven by local fake providers with scripted latencies/failures.
+
+Run: python -m pytest 03_FUNCTIONS/test_provider_fanout.py -q
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from provider_fanout import (  # noqa: E402
+    LatencyHistogram,
+    ProviderError,
+    ProviderFanout,
+    ProviderLimits,
+    ProviderSkipped,
+    TokenBucket,
+    raise_for_status,
+)
+
+
+class FakeProvider:
+    """Scripted provider: each call pops (latency_s, outcome) from the script."""
+
+    def __init__(self, name, script=None, default=(0.0, 'ok')):
+        self.name = name
+        self.script = list(script or [])
+        self.default = default
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+        self.call_times = []
+        self._lock = threading.Lock()
+
+    def __call__(self, item=None):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            self.call_times.append(time.monotonic())
+            latency, outcome = self.script.pop(0) if self.script else self.default
+        try:
+            time.sleep(latency)
+            if isinstance(outcome, int):
+                raise ProviderError(f"{self.name} returned {outcome}", status_code=outcome)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return f"{self.name}:{item}" if outcome == 'ok' else outcome
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def fast_limits(**overrides):
+    params = dict(rate_per_minute=60000, burst=100, max_concurrency=8,
+                  base_backoff_s=0.01, max_backoff_s=0.05)
+    params.update(overrides)
+    return ProviderLimits(**params)
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate_per_sec=50, capacity=2)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() > 0.0
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        # 5 tokens at 50/s after burst exhausted -> ~0.1s
+        assert time.monotonic() - start >= 0.08
+
+    def test_acquire_timeout(self):
+        bucket = TokenBucket(rate_per_sec=1, capacity=1)
+        assert bucket.acquire()
+        assert not bucket.acquire(timeout=0.02)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_sec=0)
+
+
+class TestLatencyHistogram:
+    def test_percentiles_and_buckets(self):
+        hist = LatencyHistogram(bounds_ms=(10, 100, 1000))
+        for value in [1] * 98 + [50, 5000]:
+            hist.record(value)
+        snap = hist.snapshot()
+        assert snap['count'] == 100
+        assert snap['p50_ms'] == 10
+        assert snap['p99_ms'] == 100
+        assert snap['max_ms'] == 5000
+        assert snap['buckets'] == {'<=10ms': 98, '<=100ms': 1, '>1000ms': 1}
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(50) is None
+
+
+class TestProviderGate:
+    def test_rate_limit_paces_calls(self):
+        fake = FakeProvider('SLOWRATE')
+        with ProviderFanout({'SLOWRATE': fast_limits(rate_per_minute=1200, burst=1)}) as fanout:
+            results = fanout.map('SLOWRATE', fake, list(range(6)))
+        assert all(err is None for _, _, err in results)
+        gaps = [b - a for a, b in zip(fake.call_times, fake.call_times[1:])]
+        # 20/s -> 50ms spacing; allow scheduler jitter
+        assert sum(gaps) >= 5 * 0.05 * 0.8
+
+    def test_concurrency_limit(self):
+        fake = FakeProvider('CONC', default=(0.03, 'ok'))
+        with ProviderFanout({'CONC': fast_limits(max_concurrency=3)}) as fanout:
+            fanout.map('CONC', fake, list(range(12)))
+        assert fake.peak_active == 3
+
+    def test_map_overlaps_latency(self):
+        fake = FakeProvider('PAR', default=(0.05, 'ok'))
+        with ProviderFanout({'PAR': fast_limits(max_concurrency=8)}) as fanout:
+            start = time.monotonic()
+            results = fanout.map('PAR', fake, list(range(8)))
+            elapsed = time.monotonic() - start
+        assert [r for _, r, _ in results] == [f"PAR:{i}" for i in range(8)]
+        assert elapsed < 0.05 * 8 / 2
+
+    def test_retries_on_429_with_adaptive_backoff(self):
+        fake = FakeProvider('THROTTLE', script=[(0, 429), (0, 503), (0, 'ok')])
+        with ProviderFanout({'THROTTLE': fast_limits(max_retries=2)}) as fanout:
+            gate = fanout.gate('THROTTLE')
+            assert fanout.call('THROTTLE', fake, 'x') == 'THROTTLE:x'
+            stats = gate.stats()
+        assert fake.calls == 3
+        assert stats['retries'] == 2
+        assert stats['errors'] == {'throttled': 1, 'server_error': 1}
+        # Two multiplicative decreases, one additive recovery
+        assert stats['rate_per_minute'] == pytest.approx(60000 * (0.25 + 0.1))
+        gaps = [b - a for a, b in zip(fake.call_times, fake.call_times[1:])]
+        assert gaps[0] >= 0.01 * 0.8 and gaps[1] >= 0.02 * 0.8
+
+    def test_retry_after_is_honoured(self):
+        gate_limits = fast_limits(base_backoff_s=0.001, max_backoff_s=1.0, max_retries=1)
+
+        def provider(_):
+            if not provider.failed:
+                provider.failed = True
+                raise ProviderError('busy', status_code=429, retry_after=0.1)
+            return 'ok'
+        provider.failed = False
+
+        with ProviderFanout({'RA': gate_limits}) as fanout:
+            start = time.monotonic()
+            assert fanout.call('RA', provider, None) == 'ok'
+        assert time.monotonic() - start >= 0.09
+
+    def test_non_retryable_error_raises_immediately(self):
+        fake = FakeProvider('BAD', script=[(0, 404)])
+        with ProviderFanout({'BAD': fast_limits()}) as fanout:
+            with pytest.raises(ProviderError):
+                fanout.call('BAD', fake, 'x')
+            assert fanout.gate('BAD').stats()['errors'] == {'ProviderError': 1}
+        assert fake.calls == 1
+
+    def test_stop_on_throttle_skips_remaining(self):
+        fake = FakeProvider('QUOTA', script=[(0, 429)] * 3, default=(0.02, 'ok'))
+        limits = fast_limits(max_concurrency=1, max_retries=2)
+        with ProviderFanout({'QUOTA': limits}) as fanout:
+            results = fanout.map('QUOTA', fake, list(range(5)), stop_on_throttle=True)
+        assert isinstance(results[0][2], ProviderError)
+        assert all(isinstance(err, ProviderSkipped) for _, _, err in results[1:])
+        assert fake.calls == 3
+
+
+class TestHedged:
+    def test_primary_within_budget(self):
+        primary = FakeProvider('P', default=(0.01, 'ok'))
+        backup = FakeProvider('B')
+        limits = {'P': fast_limits(latency_budget_s=0.2), 'B': fast_limits()}
+        with ProviderFanout(limits) as fanout:
+            result = fanout.hedged([('P', lambda: primary(1)), ('B', lambda: backup(1))])
+        assert result.success and result.provider == 'P'
+        assert not result.hedged
+        assert backup.calls == 0
+
+    def test_hedges_slow_primary(self):
+        primary = FakeProvider('P', default=(0.5, 'ok'))
+        backup = FakeProvider('B', default=(0.01, 'ok'))
+        limits = {'P': fast_limits(latency_budget_s=0.05), 'B': fast_limits()}
+        with ProviderFanout(limits) as fanout:
+            start = time.monotonic()
+            result = fanout.hedged([('P', lambda: primary(1)), ('B', lambda: backup(1))])
+            elapsed = time.monotonic() - start
+        assert result.provider == 'B'
+        assert result.hedged
+        assert result.started == ['P', 'B']
+        assert elapsed < 0.3
+
+    def test_failover_without_waiting_for_budget(self):
+        primary = FakeProvider('P', script=[(0, 500)])
+        backup = FakeProvider('B', default=(0.0, 'ok'))
+        limits = {'P': fast_limits(latency_budget_s=5.0), 'B': fast_limits()}
+        with ProviderFanout(limits) as fanout:
+            start = time.monotonic()
+            result = fanout.hedged([('P', lambda: primary(1)), ('B', lambda: backup(1))])
+            assert time.monotonic() - start < 1.0
+            # Hedged calls do not retry - the fallback is the retry
+            assert primary.calls == 1
+            assert fanout.gate('P').stats()['errors'] == {'server_error': 1}
+        assert result.provider == 'B'
+        assert not result.hedged
+        assert 'P' in result.errors
+
+    def test_rejected_result_falls_through(self):
+        primary = FakeProvider('P', default=(0, None))
+        backup = FakeProvider('B')
+        limits = {'P': fast_limits(), 'B': fast_limits()}
+        with ProviderFanout(limits) as fanout:
+            result = fanout.hedged([('P', lambda: primary(1)), ('B', lambda: backup(1))])
+        assert result.provider == 'B'
+        assert result.errors == {'P': 'rejected result'}
+
+    def test_all_fail(self):
+        a = FakeProvider('A', script=[(0, RuntimeError('down'))])
+        b = FakeProvider('B', script=[(0, 429)])
+        with ProviderFanout({'A': fast_limits(), 'B': fast_limits()}) as fanout:
+            result = fanout.hedged([('A', lambda: a(1)), ('B', lambda: b(1))])
+        assert not result.success
+        assert result.value is None
+        assert set(result.errors) == {'A', 'B'}
+
+
+class TestHelpers:
+    def test_raise_for_status(self):
+        class Resp:
+            def __init__(self, code, headers=None):
+                self.status_code = code
+                self.headers = headers or {}
+
+        raise_for_status(Resp(200))
+        raise_for_status(Resp(404))
+        with pytest.raises(ProviderError) as info:
+            raise_for_status(Resp(429, {'Retry-After': '7'}), 'TWELVEDATA')
+        assert info.value.status_code == 429
+        assert info.value.retry_after == 7.0
+
+    def test_unknown_provider(self):
+        with ProviderFanout() as fanout:
+            with pytest.raises(KeyError):
+                fanout.gate('NOPE')
+            gate = fanout.ensure_gate('NEW', fast_limits())
+            assert fanout.ensure_gate('NEW', fast_limits(rate_per_minute=1)) is gate
+            assert set(fanout.stats()) == {'NEW'}
@@ -164,6 +164,25 @@ class ThompsonBandit:
         self.alpha[action] += success_prob
         self.beta[action] += (1 - success_prob)
 
+    def update_continuous_batch(self, action: str, rewards: List[float], scale: float = 10.0):
+        """
+        update_continuous for many rewards of one action as aggregated increments.
+
+        Pulls, reward and fractional successes/failures are summed and added
+        once; the posterior equals calling update_continuous per reward up to
+        floating-point summation order.
+        """
+        if action not in self.actions or len(rewards) == 0:
+            return
+
+        rewards = np.asarray(rewards, dtype=float)
+        success_prob = 1 / (1 + np.exp(-rewards * scale))
+
+        self.total_pulls[action] += len(rewards)
+        self.total_reward[action] += float(rewards.sum())
+        self.alpha[action] += float(success_prob.sum())
+        self.beta[action] += float((1 - success_prob).sum())
+
     def get_estimated_means(self) -> Dict[str, float]:
         """Get estimated mean reward for each action"""
         return {
@@ -214,6 +233,91 @@ class ThompsonBandit:
         self.total_reward = {a: 0.0 for a in self.actions}
 
 
+class RegimeAwareBandit:
+    """
+    Thompson Sampling bandit with one Beta posterior per (regime, action).
+
+    Posteriors are stored as (n_regimes, n_actions) arrays so a portfolio
+    of agents can be sampled in one draw (see sample_actions). Unknown
+    regimes fall back to DEFAULT_REGIME.
+    """
+
+    DEFAULT_REGIME = 'RANGE_BOUND'
+
+    def __init__(self, actions: List, regimes: List[str]):
+        self.actions = list(actions)
+        self.regimes = list(regimes)
+        self._regime_index = {r: i for i, r in enumerate(self.regimes)}
+        self._action_index = {self._key(a): i for i, a in enumerate(self.actions)}
+
+        self.alpha = np.ones((len(self.regimes), len(self.actions)))
+        self.beta = np.ones((len(self.regimes), len(self.actions)))
+
+    @staticmethod
+    def _key(action) -> str:
+        return action.value if hasattr(action, 'value') else str(action)
+
+    def regime_index(self, regime: str) -> int:
+        if regime in self._regime_index:
+            return self._regime_index[regime]
+        return self._regime_index.get(self.DEFAULT_REGIME, 0)
+
+    def select_action(self, regime: str, rng=None):
+        """Sample each arm's posterior for this regime; return the best arm."""
+        rng = rng if rng is not None else np.random
+        r = self.regime_index(regime)
+        samples = rng.beta(self.alpha[r], self.beta[r])
+        return self.actions[int(np.argmax(samples))]
+
+    def update(self, regime: str, action, reward: float, threshold: float = 0.0):
+        """Binary posterior update: success if reward > threshold."""
+        a = self._action_index.get(self._key(action))
+        if a is None:
+            return
+        r = self.regime_index(regime)
+        if reward > threshold:
+            self.alpha[r, a] += 1
+        else:
+            self.beta[r, a] += 1
+
+    def get_estimated_means(self, regime: str) -> Dict[str, float]:
+        r = self.regime_index(regime)
+        means = self.alpha[r] / (self.alpha[r] + self.beta[r])
+        return {self._key(a): float(m) for a, m in zip(self.actions, means)}
+
+
+def sample_actions(bandits: List[List[RegimeAwareBandit]], regimes: List[str], rng=None) -> List[List]:
+    """
+    Vectorized Thompson Sampling across agents.
+
+    bandits[i] is agent i's list of bandits (e.g. [sizing, timing]) and
+    regimes[i] its regime. All posteriors are drawn in a single rng.beta
+    call laid out agent by agent, bandit by bandit, so the result (and the
+    rng stream) is identical to calling select_action on each bandit in
+    that order.
+    """
+    if not bandits:
+        return []
+    rng = rng if rng is not None else np.random
+    alpha = np.concatenate([
+        b.alpha[b.regime_index(regime)] for agent, regime in zip(bandits, regimes) for b in agent
+    ])
+    beta = np.concatenate([
+        b.beta[b.regime_index(regime)] for agent, regime in zip(bandits, regimes) for b in agent
+    ])
+    samples = rng.beta(alpha, beta)
+
+    chosen, offset = [], 0
+    for agent in bandits:
+        picks = []
+        for b in agent:
+            width = len(b.actions)
+            picks.append(b.actions[int(np.argmax(samples[offset:offset + width]))])
+            offset += width
+        chosen.append(picks)
+    return chosen
+
+
 class RegimeBanditSystem:
     """
     Per-Regime Bandit System
@@ -237,9 +341,9 @@ class RegimeBanditSystem:
         'LOW_VOLATILITY'
     ]
 
-    def __init__(self, strategy: str = "default"):
+    def __init__(self, strategy: str = "default", conn=None):
         self.strategy = strategy
-        self.conn = psycopg2.connect(**DB_CONFIG)
+        self.conn = conn if conn is not None else psycopg2.connect(**DB_CONFIG)
 
         # Sizing bandits per regime
         sizing_actions = [a.value for a in SizingAction]
@@ -289,6 +393,29 @@ class RegimeBanditSystem:
         if total_pulls % 10 == 0:
             self._save_states()
 
+    def update_many(self, updates: List[Tuple[str, str, str, float]]):
+        """
+        Apply (regime, sizing_action, timing_action, reward) updates in bulk.
+
+        Rewards are grouped per (regime, action) and applied as aggregated
+        increments (update_continuous_batch); states are saved once.
+        """
+        sizing_rewards: Dict[Tuple[str, str], List[float]] = {}
+        timing_rewards: Dict[Tuple[str, str], List[float]] = {}
+        for regime, sizing_action, timing_action, reward in updates:
+            if regime not in self.REGIMES:
+                regime = 'RANGE_BOUND'
+            sizing_rewards.setdefault((regime, sizing_action), []).append(reward)
+            timing_rewards.setdefault((regime, timing_action), []).append(reward)
+
+        for (regime, action), rewards in sizing_rewards.items():
+            self.sizing_bandits[regime].update_continuous_batch(action, rewards)
+        for (regime, action), rewards in timing_rewards.items():
+            self.timing_bandits[regime].update_continuous_batch(action, rewards)
+
+        if updates:
+            self._save_states()
+
     def get_recommended_actions(self) -> Dict[str, Dict[str, str]]:
         """Get best actions for each regime based on current estimates"""
         recommendations = {}
@@ -429,7 +556,8 @@ class RegimeBanditSystem:
                     bandit.total_reward = reward
 
         except Exception:
-            pass
+            # The connection may be shared - leave it usable
+            self.conn.rollback()
 
 
 if __name__ == "__main__":
@@ -40,6 +40,8 @@ import psycopg2
 from psycopg2.extras import RealDictCursor, Json
 import requests
 
+from defcon_state_provider import get_defcon_provider
+
 # Load environment
 from dotenv import load_dotenv
 load_dotenv('C:/fhq-market-system/vision-ios/.env')
@@ -329,20 +331,9 @@ class StopConditionChecker:
         self.start_time = datetime.now(timezone.utc)
 
     def check_defcon(self) -> Tuple[bool, int]:
-        """Check DEFCON level. Returns (is_green, level)."""
-        try:
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    SELECT defcon_level FROM fhq_monitoring.defcon_state
-                    WHERE is_current = true LIMIT 1
-                """)
-                row = cur.fetchone()
-                if row:
-                    level = row[0]
-                    return (level == DEFCON_GREEN, level)
-        except Exception as e:
-            logger.error(f"DEFCON check failed: {e}")
-        return (True, DEFCON_GREEN)  # Default to GREEN if check fails
+        """Check DEFCON level. Returns (is_green, level). Stale cache reads as RED."""
+        snapshot = get_defcon_provider().snapshot()
+        return (snapshot.number == DEFCON_GREEN, snapshot.number)
 
     def check_budget(self, additional_cost: float = 0) -> Tuple[bool, float]:
         """Check if within budget. Returns (within_budget, remaining)."""
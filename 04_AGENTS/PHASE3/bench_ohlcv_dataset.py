@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: Columnar OHLCVDataset
+================================
+
+Builds and validates large OHLCV datasets three ways:
+
+  legacy       List of OHLCVBar with a full quality rescan on every
+               add_bar (the previous OHLCVDataset), on --legacy-bars bars
+               because it is O(n^2)
+  add_bar      Current OHLCVDataset filled bar by bar (amortized O(1))
+  from_arrays  Current OHLCVDataset built from NumPy columns, no OHLCVBar
+               objects at all
+
+Each build is followed by validate_ohlcv_dataset and to_dataframe.
+
+Usage:
+    python 04_AGENTS/PHASE3/bench_ohlcv_dataset.py
+    python 04_AGENTS/PHASE3/bench_ohlcv_dataset.py --bars 1000000 --legacy-bars 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from line_ohlcv_contracts import (  # noqa: E402
+    OHLCVBar,
+    OHLCVDataset,
+    OHLCVInterval,
+    validate_ohlcv_dataset
+)
+
+INTERVAL = OHLCVInterval.MIN_1
+
+
+class LegacyOHLCVDataset:
+    """The previous list-backed behaviour: rescan all bars on every add."""
+
+    def __init__(self):
+        self.bars = []
+
+    def add_bar(self, bar: OHLCVBar):
+        self.bars.append(bar)
+        total = len(self.bars)
+        self.completeness_pct = sum(1 for b in self.bars if b.is_complete) / total * 100
+        self.volume_coverage_pct = sum(1 for b in self.bars if b.has_volume) / total * 100
+        self.valid_bars_pct = sum(1 for b in self.bars if b.is_valid) / total * 100
+
+
+def synthetic_columns(n: int, seed: int = 41) -> dict:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = rng.uniform(0.0001, 0.002, (2, n))
+    return {
+        'timestamp': pd.date_range('2024-01-01', periods=n, freq='1min'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + spread[0]),
+        'low': np.minimum(open_, close) * (1 - spread[1]),
+        'close': close,
+        'volume': rng.integers(0, 50_000, n),
+    }
+
+
+def make_bars(columns: dict) -> list:
+    rows = zip(columns['timestamp'], columns['open'].tolist(), columns['high'].tolist(),
+               columns['low'].tolist(), columns['close'].tolist(), columns['volume'].tolist())
+    return [OHLCVBar(timestamp=ts, open=o, high=h, low=l, close=c, volume=v,
+                     interval=INTERVAL, symbol='BTC/USD')
+            for ts, o, h, l, c, v in rows]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, round(time.perf_counter() - start, 3)
+
+
+def build_legacy(bars: list) -> LegacyOHLCVDataset:
+    dataset = LegacyOHLCVDataset()
+    for bar in bars:
+        dataset.add_bar(bar)
+    return dataset
+
+
+def build_by_bar(bars: list) -> OHLCVDataset:
+    dataset = OHLCVDataset(symbol='BTC/USD', interval=INTERVAL)
+    for bar in bars:
+        dataset.add_bar(bar)
+    return dataset
+
+
+def run_current(columns: dict, bars: list) -> dict:
+    results = {}
+    for mode, build in (('add_bar', lambda: build_by_bar(bars)),
+                        ('from_arrays', lambda: OHLCVDataset.from_arrays('BTC/USD', INTERVAL, **columns))):
+        dataset, build_s = timed(build)
+        (valid, _), validate_s = timed(lambda: validate_ohlcv_dataset(dataset))
+        df, frame_s = timed(dataset.to_dataframe)
+        results[mode] = {
+            'build_seconds': build_s,
+            'validate_seconds': validate_s,
+            'to_dataframe_seconds': frame_s,
+            'valid': valid,
+            'valid_bars_pct': round(dataset.valid_bars_pct, 4),
+            'rows': len(df),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar OHLCVDataset benchmark')
+    parser.add_argument('--bars', type=int, default=1_000_000)
+    parser.add_argument('--legacy-bars', type=int, default=20_000,
+                        help='Bars for the O(n^2) legacy build (0 to skip)')
+    args = parser.parse_args()
+
+    columns = synthetic_columns(args.bars)
+    bars, bars_s = timed(lambda: make_bars(columns))
+    report = {
+        'bars': args.bars,
+        'make_ohlcv_bars_seconds': bars_s,
+        'current': run_current(columns, bars),
+    }
+
+    if args.legacy_bars:
+        legacy_bars = bars[:args.legacy_bars]
+        legacy, legacy_s = timed(lambda: build_legacy(legacy_bars))
+        current, current_s = timed(lambda: build_by_bar(legacy_bars))
+        report['legacy_comparison'] = {
+            'bars': len(legacy_bars),
+            'legacy_add_bar_seconds': legacy_s,
+            'add_bar_seconds': current_s,
+            'speedup': round(legacy_s / current_s, 1) if current_s else None,
+            'same_metrics': (legacy.completeness_pct, legacy.volume_coverage_pct, legacy.valid_bars_pct)
+                            == (current.completeness_pct, current.volume_coverage_pct, current.valid_bars_pct),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: STIG+ Persistence Tracker
+====================================
+
+Simulates daily regime updates for many symbols (default 10,000 symbols,
+one interval, 30 days, ~10% daily transition probability) three ways:
+
+  legacy        90-day transition counts by rescanning the full transition
+                history on every update (the previous tracker), on
+                --legacy-symbols symbols because it is O(updates x history)
+  rolling       Current tracker: per-key rolling windows, no database
+  write_behind  Current tracker with a database that only counts the
+                batched writes it receives (no I/O), flushed every
+                --flush-batch-size buffered rows
+
+Each run then calls validate_transition_limit and get_c2_value for every
+symbol.
+
+Usage:
+    python 04_AGENTS/PHASE3/bench_stig_persistence.py
+    python 04_AGENTS/PHASE3/bench_stig_persistence.py --symbols 10000 --days 60 --legacy-symbols 1000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stig_persistence_tracker import (  # noqa: E402
+    PersistenceDatabase,
+    RegimeLabel,
+    STIGPersistenceTracker
+)
+
+INTERVAL = '1d'
+REGIMES = list(RegimeLabel)
+
+
+class LegacyTracker(STIGPersistenceTracker):
+    """The previous full-history rescan for 90-day transition counts."""
+
+    def _count_recent_transitions(self, symbol, interval, days=90):
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        key = self._get_key(symbol, interval)
+        return sum(1 for t in self._transition_history
+                   if self._get_key(t.symbol, t.interval) == key and t.transition_timestamp > cutoff)
+
+
+class CountingDatabase(PersistenceDatabase):
+    """Accepts every batch and records its size."""
+
+    def __init__(self):
+        super().__init__()
+        self.record_batches = []
+        self.transition_batches = []
+
+    def save_persistence_records(self, records):
+        self.record_batches.append(len(records))
+        return True
+
+    def save_transitions(self, transitions):
+        self.transition_batches.append(len(transitions))
+        return True
+
+    def load_persistence_records(self):
+        return []
+
+    def load_transitions(self, since):
+        return []
+
+
+def simulated_regimes(symbols: int, days: int, seed: int = 48) -> np.ndarray:
+    """(days, symbols) regime indices; each day ~10% of symbols switch regime."""
+    rng = np.random.default_rng(seed)
+    regimes = np.empty((days, symbols), dtype=np.int64)
+    regimes[0] = rng.integers(0, 3, symbols)
+    for day in range(1, days):
+        switch = rng.random(symbols) < 0.1
+        regimes[day] = np.where(switch, (regimes[day - 1] + rng.integers(1, 3, symbols)) % 3, regimes[day - 1])
+    return regimes
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, round(time.perf_counter() - start, 3)
+
+
+def simulate(tracker: STIGPersistenceTracker, regimes: np.ndarray) -> dict:
+    days, symbols = regimes.shape
+    names = [f"SYM{i:05d}" for i in range(symbols)]
+    start = datetime.now(timezone.utc) - timedelta(days=days)
+
+    def run_updates():
+        for day in range(days):
+            timestamp = start + timedelta(days=day)
+            for name, regime in zip(names, regimes[day].tolist()):
+                tracker.update_regime(name, INTERVAL, REGIMES[regime], 0.7, timestamp=timestamp)
+        tracker.close()
+
+    def run_queries():
+        return sum(not tracker.validate_transition_limit(name, INTERVAL)[0] for name in names), \
+            sum(tracker.get_c2_value(name, INTERVAL) for name in names)
+
+    _, update_s = timed(run_updates)
+    (over_limit, c2_sum), query_s = timed(run_queries)
+    updates = days * symbols
+    return {
+        'updates': updates,
+        'update_seconds': update_s,
+        'updates_per_second': round(updates / update_s) if update_s else None,
+        'query_seconds': query_s,
+        'transitions': tracker.total_transitions,
+        'over_limit': over_limit,
+        'c2_sum': round(c2_sum, 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='STIG+ persistence tracker benchmark')
+    parser.add_argument('--symbols', type=int, default=10_000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--legacy-symbols', type=int, default=500,
+                        help='Symbols for the O(n^2) legacy run (0 to skip)')
+    parser.add_argument('--flush-batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.getLogger("stig_persistence").setLevel(logging.WARNING)
+    regimes = simulated_regimes(args.symbols, args.days)
+
+    database = CountingDatabase()
+    report = {
+        'symbols': args.symbols,
+        'days': args.days,
+        'rolling': simulate(STIGPersistenceTracker(), regimes),
+        'write_behind': simulate(STIGPersistenceTracker(database=database,
+                                                        flush_batch_size=args.flush_batch_size), regimes),
+    }
+    report['write_behind'].update({
+        'record_batches': len(database.record_batches),
+        'records_written': sum(database.record_batches),
+        'transition_batches': len(database.transition_batches),
+        'transitions_written': sum(database.transition_batches),
+    })
+
+    if args.legacy_symbols:
+        subset = regimes[:, :args.legacy_symbols]
+        legacy = simulate(LegacyTracker(), subset)
+        current = simulate(STIGPersistenceTracker(), subset)
+        report['legacy_comparison'] = {
+            'symbols': subset.shape[1],
+            'legacy_update_seconds': legacy['update_seconds'],
+            'rolling_update_seconds': current['update_seconds'],
+            'speedup': round(legacy['update_seconds'] / current['update_seconds'], 1)
+                       if current['update_seconds'] else None,
+            'same_results': (legacy['transitions'], legacy['over_limit'], legacy['c2_sum'])
+                            == (current['transitions'], current['over_limit'], current['c2_sum']),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
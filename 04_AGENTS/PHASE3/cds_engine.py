@@ -43,10 +43,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import hashlib
-import json
 
 # Phase 3 imports
-from finn_signature import Ed25519Signer
+from finn_signature import Ed25519Signer, canonical_json, verify_ed25519, verify_many
 from line_data_quality import DataQualityReport
 
 
@@ -124,8 +123,7 @@ class CDSWeights:
             'version': self.version
         }
 
-        canonical_json = json.dumps(weights_dict, sort_keys=True)
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+        return hashlib.sha256(canonical_json(weights_dict)).hexdigest()
 
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary."""
@@ -530,60 +528,59 @@ class CDSEngine:
 
         Returns: (signature_hex, public_key_hex)
         """
-        # Prepare signing payload
+        signature_bytes = self.signer.private_key.sign(self._signing_payload(result))
+        signature_hex = signature_bytes.hex()
+        public_key_hex = self.signer.get_public_key_hex()
+
+        return signature_hex, public_key_hex
+
+    @staticmethod
+    def _signing_payload(result: CDSResult) -> bytes:
+        """Canonical JSON signing payload (sorted keys, UTF-8)."""
         payload = {
             'cds_value': result.cds_value,
             'components': result.components,
             'weights_hash': result.weights_hash,
             'timestamp': result.timestamp.isoformat()
         }
-
-        # Canonical JSON
-        canonical_json = json.dumps(payload, sort_keys=True)
-        payload_bytes = canonical_json.encode('utf-8')
-
-        # Sign
-        signature_bytes = self.signer.private_key.sign(payload_bytes)
-        signature_hex = signature_bytes.hex()
-        public_key_hex = self.signer.get_public_key_hex()
-
-        return signature_hex, public_key_hex
+        return canonical_json(payload)
 
     @staticmethod
     def verify_signature(result: CDSResult) -> bool:
         """
         Verify Ed25519 signature on CDS result.
 
+        Results verified before are answered from the shared digest cache.
+
         Returns: True if signature valid, False otherwise
         """
         if not result.signature_hex or not result.public_key_hex:
             return False
 
         try:
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-
-            # Reconstruct payload
-            payload = {
-                'cds_value': result.cds_value,
-                'components': result.components,
-                'weights_hash': result.weights_hash,
-                'timestamp': result.timestamp.isoformat()
-            }
-
-            canonical_json = json.dumps(payload, sort_keys=True)
-            payload_bytes = canonical_json.encode('utf-8')
-
-            # Verify
-            public_key_bytes = bytes.fromhex(result.public_key_hex)
-            public_key = Ed25519PublicKey.from_public_bytes(public_key_bytes)
-            signature_bytes = bytes.fromhex(result.signature_hex)
-
-            public_key.verify(signature_bytes, payload_bytes)
-            return True
+            return verify_ed25519(CDSEngine._signing_payload(result), result.signature_hex, result.public_key_hex)
 
         except Exception:
             return False
 
+    @staticmethod
+    def verify_signatures(results: List[CDSResult], max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Verify Ed25519 signatures on many CDS results in parallel.
+
+        Returns: one bool per result, in order (False if unsigned)
+        """
+        signed = [i for i, result in enumerate(results) if result.signature_hex and result.public_key_hex]
+        verified = verify_many(
+            [(CDSEngine._signing_payload(results[i]), results[i].signature_hex, results[i].public_key_hex)
+             for i in signed],
+            max_workers=max_workers
+        )
+        outcome = [False] * len(results)
+        for i, is_valid in zip(signed, verified):
+            outcome[i] = is_valid
+        return outcome
+
     def get_statistics(self) -> Dict[str, int]:
         """Get engine statistics."""
         return {
@@ -21,7 +21,7 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-from finn_signature import SignedPrediction, Ed25519Signer
+from finn_signature import SignedPrediction, Ed25519Signer, verify_predictions
 
 
 class FINNDatabase:
@@ -257,16 +257,12 @@ class FINNDatabase:
 
             # Verify signatures if requested
             if verify_signatures:
-                for pred in predictions:
-                    is_valid = Ed25519Signer.verify_signature(
-                        {k: v for k, v in pred.items()
-                         if k not in ['signature_hex', 'public_key_hex', 'signature_verified',
-                                     'prediction_id', 'created_at', 'created_by',
-                                     'llm_api_calls', 'llm_cost_usd']},
-                        pred['signature_hex'],
-                        pred['public_key_hex']
-                    )
+                excluded = ('prediction_id', 'created_at', 'created_by', 'llm_api_calls', 'llm_cost_usd')
+                verified = verify_predictions(
+                    [{k: v for k, v in pred.items() if k not in excluded} for pred in predictions]
+                )
 
+                for pred, is_valid in zip(predictions, verified):
                     if not is_valid:
                         raise ValueError(
                             f"ADR-008 VIOLATION: Signature verification failed for "
@@ -45,12 +45,15 @@ MiFID II Compliance: Explainability via mathematical formulas
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
 import hashlib
 
+from finn_signature import canonical_json
+
 # =============================================================================
 # ADR-008 ED25519 SIGNATURE INFRASTRUCTURE
 # =============================================================================
@@ -78,8 +81,7 @@ def compute_classification_hash(data: Dict) -> str:
         SHA256 hex digest
     """
     # Normalize data for consistent hashing
-    normalized = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    return hashlib.sha256(canonical_json(data, default=str)).hexdigest()
 
 
 def verify_classification_hash(data: Dict, expected_hash: str) -> bool:
@@ -158,6 +160,79 @@ class RegimeClassification:
         }
 
 
+@dataclass
+class PersistenceState:
+    """Persistence state machine position, carried between classification calls."""
+    current_regime: int = 1    # Start in NEUTRAL (stable baseline)
+    candidate_regime: int = 1
+    candidate_count: int = 0
+
+
+def resolve_regime_persistence(candidates: np.ndarray,
+                               valid: np.ndarray,
+                               persistence_days: int,
+                               state: PersistenceState) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Run the persistence/candidate state machine over precomputed candidates.
+
+    Args:
+        candidates: (3, n) raw regime per row for each current regime
+                    (row r = _classify_with_hysteresis given current_regime r)
+        valid: (n,) rows with enough features
+        persistence_days: Days required to confirm regime change
+        state: Starting state; updated in place to the state after the last row
+
+    Returns:
+        (regime_state, raw_regime, candidate_count) per row
+
+    The loop only does scalar integer work, so it can be compiled as is.
+    """
+    from_bear, from_neutral, from_bull = (c.tolist() for c in candidates)
+    by_regime = (from_bear, from_neutral, from_bull)
+    current = state.current_regime
+    candidate = state.candidate_regime
+    count = state.candidate_count
+
+    n = len(valid)
+    regime_states = [0] * n
+    raw_regimes = [0] * n
+    counts = [0] * n
+
+    for i, is_valid in enumerate(valid.tolist()):
+        if not is_valid:
+            # Maintain current regime on invalid data
+            regime_states[i] = current
+            raw_regimes[i] = current
+            counts[i] = 0
+            continue
+
+        raw = by_regime[current][i]
+        if raw == current:
+            # Same regime - reset candidate tracking
+            candidate = current
+            count = 0
+        elif raw == candidate:
+            # Continuing candidate - increment count
+            count += 1
+            if count >= persistence_days:
+                # Confirmed - switch regime
+                current = candidate
+                count = 0
+        else:
+            # New candidate - start tracking
+            candidate = raw
+            count = 1
+
+        regime_states[i] = current
+        raw_regimes[i] = raw
+        counts[i] = count
+
+    state.current_regime = current
+    state.candidate_regime = candidate
+    state.candidate_count = count
+    return regime_states, raw_regimes, counts
+
+
 class RegimeClassifier:
     """
     Market regime classifier for FINN+.
@@ -448,9 +523,34 @@ class RegimeClassifier:
         # Default: NEUTRAL (stable baseline state)
         return 1
 
+    def _hysteresis_candidates(self, features: pd.DataFrame) -> np.ndarray:
+        """
+        _classify_with_hysteresis for every row and every current regime at once.
+
+        Returns: (3, n) int array; row r is the raw regime given current_regime r
+        """
+        return_z = features['return_z'].to_numpy(dtype=float)
+        drawdown_z = features['drawdown_z'].to_numpy(dtype=float)
+        vol_z = features['volatility_z'].to_numpy(dtype=float)
+
+        enter_bear = (return_z < -1.0) & (drawdown_z < -0.6)
+        enter_bull = (return_z > 0.85) & (drawdown_z > -0.2) & (vol_z < 0.5)
+
+        # Currently BEAR: strong reversal → BULL, improvement → NEUTRAL, else stay
+        from_bear = np.where((return_z > 0.5) & (drawdown_z > -0.2), 2,
+                             np.where(return_z > 0.0, 1, 0))
+        # Currently NEUTRAL: enter BEAR, enter BULL, else stay
+        from_neutral = np.where(enter_bear, 0, np.where(enter_bull, 2, 1))
+        # Currently BULL: enter BEAR, strong reversal → BEAR, decline → NEUTRAL, else stay
+        from_bull = np.where(enter_bear | ((return_z < -0.5) & (drawdown_z < -0.5)), 0,
+                             np.where(return_z < 0.0, 1, 2))
+
+        return np.stack([from_bear, from_neutral, from_bull])
+
     def classify_timeseries_with_persistence(self,
                                             features: pd.DataFrame,
-                                            persistence_days: int = 5) -> pd.DataFrame:
+                                            persistence_days: int = 5,
+                                            state: Optional[PersistenceState] = None) -> pd.DataFrame:
         """
         Classify regime over time with persistence filtering.
 
@@ -459,67 +559,41 @@ class RegimeClassifier:
         - Maximum transitions ≤ 30 per 90 days
 
         Implementation:
-        1. Apply hysteresis (state-dependent thresholds)
+        1. Apply hysteresis (state-dependent thresholds), precomputed for
+           every row and every current regime
         2. Require N consecutive confirmations before regime change
+           (resolve_regime_persistence)
         3. Default to NEUTRAL as stable baseline
 
         Args:
             features: DataFrame with z-scored features (one row per day)
             persistence_days: Days required to confirm regime change
+            state: Resume from this state (updated in place); a fresh
+                   NEUTRAL state if omitted
 
         Returns:
             DataFrame with regime classifications and metadata
         """
-        results = []
-        current_regime = 1  # Start in NEUTRAL (stable baseline)
-        candidate_regime = 1
-        candidate_count = 0
-
-        for idx in features.index:
-            row = features.loc[idx]
-
-            # Skip if features are invalid
-            is_valid, _ = self.validate_features(row)
-            if not is_valid:
-                # Maintain current regime on invalid data
-                results.append({
-                    'regime_state': current_regime,
-                    'regime_label': self.REGIME_LABELS[current_regime],
-                    'raw_regime': current_regime,
-                    'candidate_count': 0,
-                    'is_valid': False
-                })
-                continue
-
-            # Get raw classification with hysteresis
-            raw_regime = self._classify_with_hysteresis(row, current_regime)
-
-            # Persistence logic
-            if raw_regime == current_regime:
-                # Same regime - reset candidate tracking
-                candidate_regime = current_regime
-                candidate_count = 0
-            elif raw_regime == candidate_regime:
-                # Continuing candidate - increment count
-                candidate_count += 1
-                if candidate_count >= persistence_days:
-                    # Confirmed - switch regime
-                    current_regime = candidate_regime
-                    candidate_count = 0
-            else:
-                # New candidate - start tracking
-                candidate_regime = raw_regime
-                candidate_count = 1
+        if len(features) == 0:
+            return pd.DataFrame([], index=features.index)
 
-            results.append({
-                'regime_state': current_regime,
-                'regime_label': self.REGIME_LABELS[current_regime],
-                'raw_regime': raw_regime,
-                'candidate_count': candidate_count,
-                'is_valid': True
-            })
+        valid = self._valid_feature_rows(features)
+        candidates = self._hysteresis_candidates(features)
+        regime_states, raw_regimes, counts = resolve_regime_persistence(
+            candidates, valid, persistence_days, state if state is not None else PersistenceState()
+        )
+
+        return pd.DataFrame({
+            'regime_state': np.array(regime_states, dtype=np.int64),
+            'regime_label': [self.REGIME_LABELS[r] for r in regime_states],
+            'raw_regime': np.array(raw_regimes, dtype=np.int64),
+            'candidate_count': np.array(counts, dtype=np.int64),
+            'is_valid': valid
+        }, index=features.index)
 
-        return pd.DataFrame(results, index=features.index)
+    def _valid_feature_rows(self, features: pd.DataFrame) -> np.ndarray:
+        """validate_features for every row: at least 5 of 7 features non-null."""
+        return features[self.FEATURE_NAMES].notna().to_numpy().sum(axis=1) >= 5
 
     def validate_features(self, features: pd.Series) -> Tuple[bool, str]:
         """
@@ -541,6 +615,197 @@ class RegimeClassifier:
         return True, "Valid"
 
 
+def _ewm_alpha(span: int) -> float:
+    """Smoothing factor exactly as pandas derives it from span."""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+
+def _ewm_step(weighted: float, old_wt: float, cur: float, alpha: float) -> Tuple[float, float]:
+    """One step of pandas' ewm(adjust=False).mean(), same arithmetic."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+def _window_mean_std(window: Deque[float], min_periods: int) -> Tuple[float, float]:
+    """Rolling mean and sample std of a window, NaN-skipping like pandas."""
+    values = np.fromiter(window, dtype=float, count=len(window))
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n < min_periods or n == 0:
+        return np.nan, np.nan
+    if (values == values[0]).all():
+        # pandas returns the value itself and zero variance for a constant window
+        return values[0], (0.0 if n > 1 else np.nan)
+    return values.mean(), (values.std(ddof=1) if n > 1 else np.nan)
+
+
+class IncrementalRegimeClassifier:
+    """
+    Regime classification that appends new bars from saved rolling state.
+
+    compute_features + classify_timeseries_with_persistence reprocess the
+    whole history on every call. This class keeps what the seven features
+    need - last closes, running peak, EMA states, the 14/20-bar windows and
+    the 252-bar z-score windows - plus the persistence state, so each new
+    bar costs O(ZSCORE_WINDOW) regardless of history length.
+
+    EMA and persistence updates use the same arithmetic as the batch path.
+    Rolling means/stds are computed directly over the window, while pandas
+    keeps running sums, so features agree with compute_features to within
+    floating-point rounding rather than bit for bit (pandas' running sums
+    drift most right after a window goes flat).
+
+    The state is plain data: get_state() is JSON-serializable and
+    from_state() restores it.
+    """
+
+    RAW_FEATURES = ['return', 'volatility', 'drawdown', 'macd_diff',
+                    'bb_width', 'rsi_14', 'roc_20']
+
+    def __init__(self, persistence_days: int = 5, classifier: Optional[RegimeClassifier] = None):
+        self.classifier = classifier or RegimeClassifier()
+        self.persistence_days = persistence_days
+        self.persistence = PersistenceState()
+        self.bar_count = 0
+
+        window = self.classifier.ZSCORE_WINDOW
+        self._closes: Deque[float] = deque(maxlen=21)        # roc_20 needs close 20 bars back
+        self._returns: Deque[float] = deque(maxlen=20)
+        self._gains: Deque[float] = deque(maxlen=14)
+        self._losses: Deque[float] = deque(maxlen=14)
+        self._cummax = np.nan
+        self._ema_12 = (np.nan, 1.0)
+        self._ema_26 = (np.nan, 1.0)
+        self._macd_signal = (np.nan, 1.0)
+        self._raw: Dict[str, Deque[float]] = {f: deque(maxlen=window) for f in self.RAW_FEATURES}
+
+    def _raw_features(self, close: float) -> List[float]:
+        prev_close = self._closes[-1] if self._closes else np.nan
+        self._closes.append(close)
+        closes = self._closes
+
+        # 1. Log returns
+        ret = np.log(close / prev_close)
+        self._returns.append(ret)
+
+        # 2. Volatility (20-day rolling std of returns)
+        volatility = _window_mean_std(self._returns, 20)[1] if len(self._returns) == 20 else np.nan
+
+        # 3. Drawdown from peak
+        if close == close and not close <= self._cummax:
+            self._cummax = close
+        drawdown = (close - self._cummax) / self._cummax
+
+        # 4. MACD histogram (12, 26, 9)
+        self._ema_12 = _ewm_step(*self._ema_12, close, _ewm_alpha(12))
+        self._ema_26 = _ewm_step(*self._ema_26, close, _ewm_alpha(26))
+        macd_line = self._ema_12[0] - self._ema_26[0]
+        self._macd_signal = _ewm_step(*self._macd_signal, macd_line, _ewm_alpha(9))
+        macd_diff = macd_line - self._macd_signal[0]
+
+        # 5. Bollinger Band width (20-day, 2 std)
+        last_20 = deque(list(closes)[-20:])
+        bb_middle, bb_std = _window_mean_std(last_20, 20) if len(last_20) == 20 else (np.nan, np.nan)
+        bb_width = (bb_std * 2) / bb_middle
+
+        # 6. RSI-14 (the first, undefined delta counts as no change)
+        delta = close - prev_close
+        self._gains.append(delta if delta > 0 else 0.0)
+        self._losses.append(-(delta if delta < 0 else 0.0))
+        gain = _window_mean_std(self._gains, 14)[0] if len(self._gains) == 14 else np.nan
+        loss = _window_mean_std(self._losses, 14)[0] if len(self._losses) == 14 else np.nan
+        rsi_14 = 100 - (100 / (1 + gain / loss)) if loss != 0 else (100.0 if gain > 0 else np.nan)
+
+        # 7. Rate of change (20-day)
+        roc_20 = (close - closes[0]) / closes[0] if len(closes) == 21 else np.nan
+
+        return [ret, volatility, drawdown, macd_diff, bb_width, rsi_14, roc_20]
+
+    def update_features(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Advance the rolling state by the bars in price_data.
+
+        Returns: z-scored features for those bars (columns as compute_features)
+        """
+        rows = []
+        min_periods = self.classifier.MIN_PERIODS
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for close in price_data['close'].to_numpy(dtype=float).tolist():
+                row = []
+                for name, value in zip(self.RAW_FEATURES, self._raw_features(close)):
+                    window = self._raw[name]
+                    window.append(value)
+                    mean, std = _window_mean_std(window, min_periods)
+                    row.append((value - mean) / std if std != 0 else np.nan)
+                rows.append(row)
+                self.bar_count += 1
+
+        return pd.DataFrame(np.array(rows, dtype=float).reshape(len(rows), len(self.RAW_FEATURES)),
+                            index=price_data.index, columns=self.classifier.FEATURE_NAMES)
+
+    def append(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify new bars, continuing from the saved feature and persistence state.
+
+        Returns: classification frame for the new bars
+                 (columns as classify_timeseries_with_persistence)
+        """
+        features = self.update_features(price_data)
+        return self.classifier.classify_timeseries_with_persistence(
+            features, self.persistence_days, state=self.persistence
+        )
+
+    def get_state(self) -> Dict:
+        """Rolling and persistence state as plain (JSON-serializable) data."""
+        def floats(values):
+            return [None if v != v else v for v in values]
+
+        return {
+            'persistence_days': self.persistence_days,
+            'bar_count': self.bar_count,
+            'persistence': [self.persistence.current_regime, self.persistence.candidate_regime,
+                            self.persistence.candidate_count],
+            'closes': floats(self._closes),
+            'returns': floats(self._returns),
+            'gains': floats(self._gains),
+            'losses': floats(self._losses),
+            'cummax': floats([self._cummax])[0],
+            'ema_12': floats(self._ema_12),
+            'ema_26': floats(self._ema_26),
+            'macd_signal': floats(self._macd_signal),
+            'raw': {name: floats(window) for name, window in self._raw.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict, classifier: Optional[RegimeClassifier] = None) -> 'IncrementalRegimeClassifier':
+        """Restore a classifier saved with get_state()."""
+        def floats(values):
+            return [np.nan if v is None else float(v) for v in values]
+
+        restored = cls(state['persistence_days'], classifier)
+        restored.bar_count = state['bar_count']
+        restored.persistence = PersistenceState(*state['persistence'])
+        restored._closes.extend(floats(state['closes']))
+        restored._returns.extend(floats(state['returns']))
+        restored._gains.extend(floats(state['gains']))
+        restored._losses.extend(floats(state['losses']))
+        restored._cummax = floats([state['cummax']])[0]
+        restored._ema_12 = tuple(floats(state['ema_12']))
+        restored._ema_26 = tuple(floats(state['ema_26']))
+        restored._macd_signal = tuple(floats(state['macd_signal']))
+        for name, values in state['raw'].items():
+            restored._raw[name].extend(floats(values))
+        return restored
+
+
 class RegimePersistence:
     """Utilities for regime prediction persistence."""
 
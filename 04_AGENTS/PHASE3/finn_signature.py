@@ -17,7 +17,12 @@ Security Requirements:
 
 import json
 import hashlib
-from typing import Dict, Tuple
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
@@ -76,6 +81,144 @@ class SignedPrediction:
         return asdict(self)
 
 
+# ============================================================================
+# Canonical Payloads and Verification Cache
+# ============================================================================
+
+# json.dumps builds a new JSONEncoder on every call that passes options;
+# these are built once. Same class and options, so the bytes are identical.
+_CANONICAL_ENCODERS: Dict[Tuple[bool, Optional[Callable]], json.JSONEncoder] = {}
+
+
+def canonical_json(payload: Dict, compact: bool = False, default: Optional[Callable] = None) -> bytes:
+    """
+    Canonical JSON bytes for signing or hashing.
+
+    Byte-identical to json.dumps(payload, sort_keys=True, default=default)
+    .encode('utf-8'), with separators=(',', ':') when compact.
+    """
+    key = (compact, default)
+    encoder = _CANONICAL_ENCODERS.get(key)
+    if encoder is None:
+        encoder = json.JSONEncoder(sort_keys=True,
+                                   separators=(',', ':') if compact else None,
+                                   default=default)
+        _CANONICAL_ENCODERS[key] = encoder
+    return encoder.encode(payload).encode('utf-8')
+
+
+class VerifiedDigestCache:
+    """
+    Thread-safe LRU of (public key, signature, payload) digests already verified.
+
+    Only successful verifications are stored, so a hit proves a valid
+    signature was checked before; repeated audits skip the Ed25519 check.
+    """
+
+    def __init__(self, maxsize: int = 8192):
+        self.maxsize = maxsize
+        self._digests: 'OrderedDict[bytes, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(payload_bytes: bytes, signature: bytes, public_key: bytes) -> bytes:
+        # Ed25519 keys (32 bytes) and signatures (64 bytes) are fixed-size, so
+        # the concatenation is unambiguous
+        return hashlib.sha256(public_key + signature + payload_bytes).digest()
+
+    def contains(self, digest: bytes) -> bool:
+        with self._lock:
+            if digest in self._digests:
+                self._digests.move_to_end(digest)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, digest: bytes):
+        with self._lock:
+            self._digests[digest] = None
+            self._digests.move_to_end(digest)
+            while len(self._digests) > self.maxsize:
+                self._digests.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._digests.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+# Shared by every verifier in the process (FINN+, Tier-2, CDS, STIG+ audits)
+VERIFIED_DIGESTS = VerifiedDigestCache()
+
+
+@lru_cache(maxsize=256)
+def _load_public_key(public_key_hex: str) -> 'Ed25519PublicKey':
+    return Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+
+
+def verify_ed25519(payload_bytes: bytes,
+                   signature_hex: str,
+                   public_key_hex: str,
+                   cache: Optional[VerifiedDigestCache] = VERIFIED_DIGESTS) -> bool:
+    """
+    Verify an Ed25519 signature over payload bytes, consulting the digest cache.
+
+    Returns False for an invalid signature; malformed hex or keys raise
+    ValueError as the underlying library does.
+    """
+    if not CRYPTO_AVAILABLE:
+        raise ImportError("cryptography library required for signature verification")
+
+    signature_bytes = bytes.fromhex(signature_hex)
+    digest = None
+    if cache is not None:
+        digest = cache.digest(payload_bytes, signature_bytes, bytes.fromhex(public_key_hex))
+        if cache.contains(digest):
+            return True
+
+    try:
+        _load_public_key(public_key_hex).verify(signature_bytes, payload_bytes)
+    except InvalidSignature:
+        return False
+
+    if cache is not None:
+        cache.add(digest)
+    return True
+
+
+def verify_many(items: Iterable[Tuple[bytes, str, str]],
+                max_workers: Optional[int] = None,
+                cache: Optional[VerifiedDigestCache] = VERIFIED_DIGESTS) -> List[bool]:
+    """
+    Verify many (payload_bytes, signature_hex, public_key_hex) triples.
+
+    Cached digests are answered directly; the rest are verified on a thread
+    pool (the Ed25519 backend runs outside Python bytecode). Malformed
+    entries verify as False.
+
+    Returns: one bool per item, in order
+    """
+    def verify(item: Tuple[bytes, str, str]) -> bool:
+        try:
+            return verify_ed25519(*item, cache=cache)
+        except Exception:
+            return False
+
+    items = list(items)
+    if max_workers == 1 or len(items) < 2:
+        return [verify(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(verify, items, chunksize=max(1, len(items) // 32)))
+
+
 class Ed25519Signer:
     """
     Ed25519 signature manager for FINN+ predictions.
@@ -167,14 +310,7 @@ class Ed25519Signer:
         Returns:
             UTF-8 encoded JSON bytes
         """
-        # Remove signature fields if present
-        payload = {k: v for k, v in prediction_dict.items()
-                  if k not in ['signature_hex', 'public_key_hex', 'signature_verified']}
-
-        # Canonical JSON: sorted keys, no whitespace
-        canonical_json = json.dumps(payload, sort_keys=True, separators=(',', ':'))
-
-        return canonical_json.encode('utf-8')
+        return prediction_signing_payload(prediction_dict)
 
     def sign_prediction(self, prediction_dict: Dict) -> Tuple[str, str]:
         """
@@ -215,34 +351,29 @@ class Ed25519Signer:
         Returns:
             True if signature valid, False otherwise
         """
-        if not CRYPTO_AVAILABLE:
-            raise ImportError("cryptography library required for signature verification")
-
         try:
-            # Reconstruct public key
-            public_key_bytes = bytes.fromhex(public_key_hex)
-            public_key = Ed25519PublicKey.from_public_bytes(public_key_bytes)
-
-            # Reconstruct signature
-            signature_bytes = bytes.fromhex(signature_hex)
-
-            # Prepare canonical payload (same as signing)
-            signer_temp = Ed25519Signer()  # Temporary instance for payload prep
-            payload_bytes = signer_temp._prepare_signing_payload(prediction_dict)
+            # Canonical payload (same as signing); previously verified
+            # payloads are answered from the digest cache
+            return verify_ed25519(prediction_signing_payload(prediction_dict), signature_hex, public_key_hex)
 
-            # Verify signature
-            public_key.verify(signature_bytes, payload_bytes)
-
-            return True  # Verification successful
-
-        except InvalidSignature:
-            return False  # Verification failed
+        except ImportError:
+            raise
 
         except Exception as e:
             print(f"Signature verification error: {e}")
             return False
 
 
+def prediction_signing_payload(prediction_dict: Dict) -> bytes:
+    """
+    Canonical prediction payload (ADR-008): signature fields removed,
+    sorted keys, no whitespace, UTF-8.
+    """
+    payload = {k: v for k, v in prediction_dict.items()
+               if k not in ('signature_hex', 'public_key_hex', 'signature_verified')}
+    return canonical_json(payload, compact=True)
+
+
 def sign_regime_prediction(prediction_data: Dict,
                           signer: Ed25519Signer) -> SignedPrediction:
     """
@@ -284,6 +415,192 @@ def sign_regime_prediction(prediction_data: Dict,
     return SignedPrediction(**signed_data)
 
 
+def verify_predictions(predictions: Sequence[Dict], max_workers: Optional[int] = None) -> List[bool]:
+    """
+    Verify the signatures of many prediction dicts (each carrying
+    signature_hex and public_key_hex) in parallel.
+
+    Returns: one bool per prediction, in order; payloads that cannot be
+             canonicalized verify as False
+    """
+    items = []
+    for prediction in predictions:
+        try:
+            payload = prediction_signing_payload(prediction)
+        except (TypeError, ValueError):
+            payload = None
+        items.append((payload, prediction.get('signature_hex'), prediction.get('public_key_hex')))
+
+    checkable = [i for i, (payload, signature_hex, public_key_hex) in enumerate(items)
+                 if payload is not None and signature_hex and public_key_hex]
+    verified = verify_many([items[i] for i in checkable], max_workers=max_workers)
+
+    outcome = [False] * len(items)
+    for i, is_valid in zip(checkable, verified):
+        outcome[i] = is_valid
+    return outcome
+
+
+def sign_regime_predictions(prediction_dicts: Sequence[Dict],
+                            signer: Ed25519Signer,
+                            service: Optional['SigningService'] = None,
+                            max_workers: Optional[int] = None) -> List[SignedPrediction]:
+    """
+    Sign a batch of regime predictions; batch counterpart of sign_regime_prediction.
+
+    Payloads are signed through service (its background worker) when given,
+    inline otherwise, then all signatures are verified together (ADR-008).
+
+    Args:
+        prediction_dicts: Prediction dicts (from RegimeClassification.to_dict())
+        signer: Ed25519Signer instance (must be service.signer if service is given)
+        service: Optional SigningService to sign in
+        max_workers: Threads for batch verification
+
+    Returns:
+        SignedPrediction per input, in order, each with a verified signature
+    """
+    if service is not None and service.signer is not signer:
+        raise ValueError("service signs with a different key than signer")
+
+    payloads = [prediction_signing_payload(d) for d in prediction_dicts]
+    if service is not None:
+        signatures = service.sign_many(payloads)
+    else:
+        public_key_hex = signer.get_public_key_hex()
+        signatures = [(signer.private_key.sign(payload).hex(), public_key_hex) for payload in payloads]
+
+    verified = verify_many(
+        [(payload, signature_hex, public_key_hex) for payload, (signature_hex, public_key_hex)
+         in zip(payloads, signatures)],
+        max_workers=max_workers
+    )
+    if not all(verified):
+        raise RuntimeError(
+            "ADR-008 VIOLATION: Signature verification failed immediately after signing. "
+            "This should never happen and indicates a critical cryptographic error."
+        )
+
+    return [
+        SignedPrediction(**prediction_data, signature_hex=signature_hex,
+                         public_key_hex=public_key_hex, signature_verified=True)
+        for prediction_data, (signature_hex, public_key_hex) in zip(prediction_dicts, signatures)
+    ]
+
+
+class SigningService:
+    """
+    Background Ed25519 signing with bounded batching.
+
+    submit() queues canonical payload bytes and returns a Future of
+    (signature_hex, public_key_hex). A single worker thread drains the queue
+    in batches of at most max_batch payloads; at most max_pending payloads
+    wait in the queue, after which submit() blocks (backpressure).
+
+    Ed25519 is deterministic, so signatures are byte-identical to signing
+    inline with signer.private_key.sign.
+    """
+
+    _STOP = object()
+
+    def __init__(self, signer: Ed25519Signer, max_batch: int = 64, max_pending: int = 1024):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.signer = signer
+        self.max_batch = max_batch
+        self.public_key_hex = signer.get_public_key_hex()
+
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Statistics
+        self.signed_count = 0
+        self.batch_count = 0
+        self.largest_batch = 0
+
+    def submit(self, payload_bytes: bytes) -> Future:
+        """Queue a payload for signing; the Future resolves to (signature_hex, public_key_hex)."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SigningService is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='ed25519-signer', daemon=True)
+                self._thread.start()
+            # Under the lock, so nothing lands behind the stop marker; a full
+            # queue blocks here until the worker catches up
+            self._queue.put((payload_bytes, future))
+        return future
+
+    def sign_many(self, payloads: Sequence[bytes]) -> List[Tuple[str, str]]:
+        """Sign payloads through the worker and wait for all of them."""
+        futures = [self.submit(payload) for payload in payloads]
+        return [future.result() for future in futures]
+
+    def close(self, wait: bool = True):
+        """Sign what is already queued, then stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(self._STOP)
+        if thread is not None and wait:
+            thread.join()
+
+    def __enter__(self) -> 'SigningService':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def get_statistics(self) -> Dict[str, int]:
+        return {
+            'signed_count': self.signed_count,
+            'batch_count': self.batch_count,
+            'largest_batch': self.largest_batch,
+            'pending': self._queue.qsize(),
+        }
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._sign_batch(batch)
+            if stop:
+                return
+
+    def _sign_batch(self, batch: List[Tuple[bytes, Future]]):
+        sign = self.signer.private_key.sign
+        for payload_bytes, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result((sign(payload_bytes).hex(), self.public_key_hex))
+            except Exception as e:
+                future.set_exception(e)
+        self.signed_count += len(batch)
+        self.batch_count += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+
 # ============================================================================
 # Example Usage and Testing
 # ============================================================================
@@ -35,16 +35,22 @@ INTEGRATION:
 CDS Engine C4 component receives coherence_score directly from Tier-2.
 """
 
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import time
 import hashlib
+import heapq
 import json
 import re
+import sqlite3
+import threading
 
 # Phase 3 imports
-from finn_signature import Ed25519Signer
+from finn_signature import Ed25519Signer, canonical_json
+from rate_limiter import RateLimitConfig, RateLimiter
 
 
 @dataclass
@@ -114,6 +120,11 @@ class Tier2Result:
             'llm_tokens_output': self.llm_tokens_output
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Tier2Result':
+        """Rebuild a result serialized with to_dict."""
+        return cls(**{**data, 'timestamp': datetime.fromisoformat(data['timestamp'])})
+
 
 # ============================================================================
 # Prompt Engineering
@@ -274,10 +285,17 @@ class MockLLMClient(LLMClient):
     Generates synthetic coherence scores based on z-score alignment.
     """
 
-    def __init__(self):
-        """Initialize mock client."""
+    def __init__(self, latency_seconds: float = 0.0):
+        """
+        Initialize mock client.
+
+        Args:
+            latency_seconds: Artificial delay per call, to simulate API latency
+        """
         super().__init__(api_key=None)
         self.mock_cost_per_call = 0.0024  # $0.0024/call (realistic)
+        self.latency_seconds = latency_seconds
+        self._lock = threading.Lock()
 
     def generate(self, prompt: str) -> Dict[str, Any]:
         """
@@ -286,8 +304,12 @@ class MockLLMClient(LLMClient):
         Uses heuristic: Parse prompt to extract z-scores and regime,
         then compute synthetic coherence based on alignment.
         """
-        self.request_count += 1
-        self.total_cost += self.mock_cost_per_call
+        with self._lock:
+            self.request_count += 1
+            self.total_cost += self.mock_cost_per_call
+
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
 
         # Parse regime and z-scores from prompt
         regime_match = re.search(r'Regime:\s*(\w+)', prompt)
@@ -336,6 +358,159 @@ class MockLLMClient(LLMClient):
         }
 
 
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+class Tier2ResultCache:
+    """
+    Bounded LRU cache of Tier-2 results with a fixed time-to-live.
+
+    Entries live in memory (at most maxsize, least recently used evicted
+    first) and, when path is given, in a SQLite file that survives
+    restarts; a memory miss falls through to the file and promotes the
+    entry. Expired entries are dropped as they age out, not only when
+    looked up. Thread-safe.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300.0,
+                 path: Optional[str] = None, clock: Callable[[], float] = time.time):
+        """
+        Initialize result cache.
+
+        Args:
+            maxsize: Maximum number of entries held in memory
+            ttl_seconds: Lifetime of an entry from the time it is stored
+            path: SQLite file for the persistent tier (None = memory only)
+            clock: Wall-clock time source (seconds since the epoch)
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, tuple[float, Tier2Result]]' = OrderedDict()  # LRU order
+        self._expiry: List[Tuple[float, str]] = []  # min-heap; stale pairs skipped lazily
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS tier2_cache ("
+                    "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload TEXT NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_tier2_cache_expires_at ON tier2_cache (expires_at)"
+                )
+                self._conn.execute("DELETE FROM tier2_cache WHERE expires_at <= ?", (clock(),))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float):
+        """Drop expired memory entries (earliest expiry first, stops at the first live one)."""
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                self.expirations += 1
+
+    def _store(self, key: str, result: Tier2Result, expires_at: float):
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._expiry, (expires_at, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        if len(self._expiry) > 2 * self.maxsize:
+            # Rebuild without the pairs of evicted or overwritten entries
+            self._expiry = [(expires_at, key) for key, (expires_at, _) in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[Tier2Result]:
+        """Return the live result for key, or None (count_miss=False for re-checks)."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT expires_at, payload FROM tier2_cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is not None:
+                    result = Tier2Result.from_dict(json.loads(row[1]))
+                    self._store(key, result, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return result
+
+            if count_miss:
+                self.misses += 1
+            return None
+
+    def put(self, key: str, result: Tier2Result):
+        """Store result under key for ttl_seconds."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            expires_at = now + self.ttl_seconds
+            self._store(key, result, expires_at)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM tier2_cache WHERE expires_at <= ?", (now,))
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO tier2_cache VALUES (?, ?, ?)",
+                        (key, expires_at, json.dumps(result.to_dict()))
+                    )
+
+    def clear(self):
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM tier2_cache")
+
+    def close(self):
+        """Close the SQLite tier, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'persistent': self.path is not None
+            }
+
+
 # ============================================================================
 # FINN+ Tier-2 Engine
 # ============================================================================
@@ -354,32 +529,42 @@ class FINNTier2Engine:
     """
 
     def __init__(self, llm_client: Optional[LLMClient] = None,
-                 use_production_mode: bool = False):
+                 use_production_mode: bool = False,
+                 cache_size: int = 1024,
+                 cache_path: Optional[str] = None):
         """
         Initialize FINN+ Tier-2 engine.
 
         Args:
             llm_client: LLM client implementation (default: MockLLMClient)
             use_production_mode: If True, use real LLM; if False, return placeholder
+            cache_size: Maximum number of results cached in memory
+            cache_path: SQLite file persisting cached results across restarts
         """
         self.llm_client = llm_client or MockLLMClient()
         self.use_production_mode = use_production_mode
         self.signer = Ed25519Signer()
 
-        # Rate limiting (ADR-012)
+        # Rate limiting (ADR-012); limits are applied on every check
         self.max_calls_per_hour = 100
         self.daily_budget_usd = 500.0
-        self.call_timestamps: List[datetime] = []
-        self.daily_cost = 0.0
-        self.daily_reset_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.rate_limiter = RateLimiter(RateLimitConfig(
+            max_requests_per_minute=self.max_calls_per_hour,
+            max_requests_per_hour=self.max_calls_per_hour,
+            max_daily_budget_usd=self.daily_budget_usd
+        ))
 
         # Statistics
         self.computation_count = 0
         self.cache_hits = 0
+        self.single_flight_joins = 0
+        self.cost_saved_usd = 0.0
+        self._stats_lock = threading.Lock()
 
-        # Simple cache (recent results)
-        self.cache: Dict[str, Tier2Result] = {}
-        self.cache_ttl_seconds = 300  # 5 minutes
+        # Result cache (5 minute TTL) and in-flight LLM calls by cache key
+        self.cache = Tier2ResultCache(maxsize=cache_size, ttl_seconds=300, path=cache_path)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def compute_coherence(self, tier2_input: Tier2Input) -> Tier2Result:
         """
@@ -410,17 +595,43 @@ class FINNTier2Engine:
 
         # Check cache
         cache_key = self._compute_cache_key(tier2_input)
-        if cache_key in self.cache:
-            cached_result = self.cache[cache_key]
-            # Check TTL
-            age_seconds = (datetime.now() - cached_result.timestamp).total_seconds()
-            if age_seconds < self.cache_ttl_seconds:
-                self.cache_hits += 1
-                return cached_result
-            else:
-                # Expired, remove from cache
-                del self.cache[cache_key]
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            self._record_saving(cached_result, joined=False)
+            return cached_result
+
+        # Single-flight: identical requests wait for the call already in flight
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                # the previous leader may have finished since the lookup above
+                cached_result = self.cache.get(cache_key, count_miss=False)
+                if cached_result is None:
+                    future = self._inflight[cache_key] = Future()
+
+        if cached_result is not None:
+            self._record_saving(cached_result, joined=False)
+            return cached_result
+        if not leader:
+            result = future.result()
+            self._record_saving(result, joined=True)
+            return result
 
+        try:
+            result = self._compute_uncached(tier2_input, cache_key)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    def _compute_uncached(self, tier2_input: Tier2Input, cache_key: str) -> Tier2Result:
+        """Score tier2_input with the LLM and cache the signed result."""
         # Check rate limits (ADR-012)
         if not self._check_rate_limits():
             # Rate limit exceeded, return placeholder
@@ -493,10 +704,19 @@ class FINNTier2Engine:
         result.public_key_hex = public_key_hex
 
         # [7] Cache result
-        self.cache[cache_key] = result
+        self.cache.put(cache_key, result)
 
         return result
 
+    def _record_saving(self, result: Tier2Result, joined: bool):
+        """Count a result served without its own LLM call."""
+        with self._stats_lock:
+            if joined:
+                self.single_flight_joins += 1
+            else:
+                self.cache_hits += 1
+            self.cost_saved_usd += result.llm_cost_usd
+
     def _compute_cache_key(self, tier2_input: Tier2Input) -> str:
         """Compute cache key for tier2_input."""
         key_dict = {
@@ -507,40 +727,39 @@ class FINNTier2Engine:
             'drawdown_z': round(tier2_input.drawdown_z, 2),
             'macd_diff_z': round(tier2_input.macd_diff_z, 2)
         }
-        canonical_json = json.dumps(key_dict, sort_keys=True)
-        return hashlib.sha256(canonical_json.encode()).hexdigest()[:16]
+        return hashlib.sha256(canonical_json(key_dict)).hexdigest()[:16]
 
     def _check_rate_limits(self) -> bool:
         """
         Check if rate limits allow new API call (ADR-012).
 
+        Takes an hourly slot when allowed; the call's cost is only known
+        afterwards and is charged by _track_cost.
+
         Returns:
             True if call allowed, False if rate limit exceeded
         """
-        now = datetime.now()
-
-        # Reset daily budget at midnight
-        if now >= self.daily_reset_time + timedelta(days=1):
-            self.daily_cost = 0.0
-            self.daily_reset_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        config = self.rate_limiter.config
+        config.max_requests_per_minute = self.max_calls_per_hour
+        config.max_requests_per_hour = self.max_calls_per_hour
+        config.max_daily_budget_usd = self.daily_budget_usd
 
-        # Check daily budget
+        # Check daily budget (reset at midnight UTC)
         if self.daily_cost >= self.daily_budget_usd:
             return False
 
         # Check hourly rate limit
-        one_hour_ago = now - timedelta(hours=1)
-        self.call_timestamps = [ts for ts in self.call_timestamps if ts > one_hour_ago]
-
-        if len(self.call_timestamps) >= self.max_calls_per_hour:
-            return False
-
-        return True
+        allowed, _ = self.rate_limiter.try_acquire()
+        return allowed
 
     def _track_cost(self, cost_usd: float):
         """Track API call cost."""
-        self.call_timestamps.append(datetime.now())
-        self.daily_cost += cost_usd
+        self.rate_limiter.charge(cost_usd)
+
+    @property
+    def daily_cost(self) -> float:
+        """LLM spend so far today (USD)."""
+        return self.rate_limiter.get_statistics()['daily_cost_usd']
 
     def _sign_result(self, result: Tier2Result) -> tuple[str, str]:
         """
@@ -555,10 +774,7 @@ class FINNTier2Engine:
             'timestamp': result.timestamp.isoformat()
         }
 
-        canonical_json = json.dumps(payload, sort_keys=True)
-        payload_bytes = canonical_json.encode('utf-8')
-
-        signature_bytes = self.signer.private_key.sign(payload_bytes)
+        signature_bytes = self.signer.private_key.sign(canonical_json(payload))
         signature_hex = signature_bytes.hex()
         public_key_hex = self.signer.get_public_key_hex()
 
@@ -567,13 +783,21 @@ class FINNTier2Engine:
     def get_statistics(self) -> Dict[str, Any]:
         """Get engine statistics."""
         llm_stats = self.llm_client.get_statistics()
+        rate_stats = self.rate_limiter.get_statistics()
+
+        cache_stats = self.cache.get_statistics()
 
         return {
             'computation_count': self.computation_count,
             'cache_hits': self.cache_hits,
-            'cache_size': len(self.cache),
-            'daily_cost_usd': self.daily_cost,
-            'calls_last_hour': len(self.call_timestamps),
+            'cache_misses': cache_stats['misses'],
+            'cache_hit_rate': cache_stats['hit_rate'],
+            'cache_size': cache_stats['size'],
+            'cache': cache_stats,
+            'single_flight_joins': self.single_flight_joins,
+            'cost_saved_usd': self.cost_saved_usd,
+            'daily_cost_usd': rate_stats['daily_cost_usd'],
+            'calls_last_hour': rate_stats['requests_this_hour'],
             'llm_stats': llm_stats,
             'public_key': self.signer.get_public_key_hex()
         }
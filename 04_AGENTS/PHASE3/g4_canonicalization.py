@@ -560,7 +560,7 @@ class SnapshotGenerator:
         """Snapshot Data Adapters."""
         return self._create_snapshot(
             component='DATA_ADAPTERS',
-            files=['production_data_adapters.py'],
+            files=['production_data_adapters.py', 'rate_limiter.py'],
             schema_version='1.0.0'
         )
 
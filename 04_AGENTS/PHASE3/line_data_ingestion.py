@@ -302,7 +302,7 @@ class MultiIntervalIngestionPipeline:
             print(f"Ingesting {symbol} ({interval.value})...")
             dataset = self.pipeline.ingest_historical(symbol, interval, start_date, end_date)
 
-            if dataset:
+            if dataset is not None:
                 datasets[interval] = dataset
                 print(f"  ✅ {dataset.get_bar_count()} bars ingested")
             else:
@@ -350,7 +350,7 @@ if __name__ == "__main__":
         end_date=end_date
     )
 
-    if dataset_daily:
+    if dataset_daily is not None:
         print(f"    ✅ Ingested {dataset_daily.get_bar_count()} daily bars")
         print(f"    Data quality: {dataset_daily.valid_bars_pct:.1f}% valid")
     else:
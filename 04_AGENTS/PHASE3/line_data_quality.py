@@ -29,17 +29,20 @@ Garbage in → Garbage out. Invalid market data causes:
 LINE+ data quality validation prevents these failures upstream.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import pandas as pd
 import numpy as np
 
 from line_ohlcv_contracts import (
     OHLCVBar, OHLCVDataset, OHLCVInterval,
-    validate_ohlcv_bar, validate_ohlcv_dataset
+    validate_ohlcv_bar, validate_ohlcv_columns, validate_ohlcv_dataset
 )
 
+NANOSECONDS_PER_DAY = 86_400 * 10**9
+
 
 class DataQualitySeverity(Enum):
     """Data quality issue severity (ADR-010 aligned)."""
@@ -156,9 +159,13 @@ class LINEDataQualityValidator:
         """
         Perform complete data quality validation on dataset.
 
+        The dataset's columns are read once and shared by all checks; each
+        check is a mask over them, and issues are only built for flagged bars.
+
         Returns: DataQualityReport with all detected issues
         """
         issues = []
+        columns = dataset.get_columns()
 
         # [1] Basic validation (from contracts)
         is_valid_basic, violations = validate_ohlcv_dataset(dataset)
@@ -171,23 +178,23 @@ class LINEDataQualityValidator:
                 ))
 
         # [2] Individual bar validation
-        bar_issues = self._validate_individual_bars(dataset)
+        bar_issues = self._validate_individual_bars(dataset, columns)
         issues.extend(bar_issues)
 
         # [3] Price sanity checks
-        price_issues = self._validate_price_sanity(dataset)
+        price_issues = self._validate_price_sanity(dataset, columns)
         issues.extend(price_issues)
 
         # [4] Volume validation
-        volume_issues = self._validate_volume_sanity(dataset)
+        volume_issues = self._validate_volume_sanity(dataset, columns)
         issues.extend(volume_issues)
 
         # [5] Continuity checks
-        continuity_issues = self._validate_continuity(dataset)
+        continuity_issues = self._validate_continuity(dataset, columns)
         issues.extend(continuity_issues)
 
         # [6] Statistical distribution checks
-        distribution_issues = self._validate_distribution(dataset)
+        distribution_issues = self._validate_distribution(dataset, columns)
         issues.extend(distribution_issues)
 
         # Generate report
@@ -203,23 +210,40 @@ class LINEDataQualityValidator:
 
         return report
 
-    def _validate_individual_bars(self, dataset: OHLCVDataset) -> List[DataQualityIssue]:
-        """Validate each bar individually."""
-        issues = []
+    def validate_datasets(self, datasets: List[OHLCVDataset],
+                          max_workers: Optional[int] = None) -> List[DataQualityReport]:
+        """
+        Validate several datasets concurrently (one report per dataset, in order).
 
-        for idx, bar in enumerate(dataset.bars):
-            is_valid, error = validate_ohlcv_bar(bar)
-            if not is_valid:
-                issues.append(DataQualityIssue(
-                    check_name="Bar Validation",
-                    severity=DataQualitySeverity.ERROR,
-                    message=error,
-                    bar_index=idx
-                ))
+        The checks spend their time in NumPy, which releases the GIL, so a
+        thread pool is enough.
+        """
+        if len(datasets) < 2 or max_workers == 1:
+            return [self.validate_dataset(dataset) for dataset in datasets]
 
-        return issues
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(datasets), 8)) as executor:
+            return list(executor.map(self.validate_dataset, datasets))
+
+    def _validate_individual_bars(self, dataset: OHLCVDataset,
+                                  columns: Optional[Dict[str, np.ndarray]] = None) -> List[DataQualityIssue]:
+        """
+        Validate each bar individually (validate_ohlcv_columns: the
+        validate_ohlcv_bar checks, column-wise).
+        """
+        if columns is None:
+            columns = dataset.get_columns()
+        return [
+            DataQualityIssue(
+                check_name="Bar Validation",
+                severity=DataQualitySeverity.ERROR,
+                message=error,
+                bar_index=idx
+            )
+            for idx, error in validate_ohlcv_columns(columns)
+        ]
 
-    def _validate_price_sanity(self, dataset: OHLCVDataset) -> List[DataQualityIssue]:
+    def _validate_price_sanity(self, dataset: OHLCVDataset,
+                               columns: Optional[Dict[str, np.ndarray]] = None) -> List[DataQualityIssue]:
         """
         Validate price sanity (outlier detection, spike filtering).
 
@@ -235,10 +259,11 @@ class LINEDataQualityValidator:
             return issues
 
         # Extract prices
-        closes = np.array([bar.close for bar in dataset.bars])
-        opens = np.array([bar.open for bar in dataset.bars])
-        highs = np.array([bar.high for bar in dataset.bars])
-        lows = np.array([bar.low for bar in dataset.bars])
+        if columns is None:
+            columns = dataset.get_columns()
+        closes = columns['close']
+        highs = columns['high']
+        lows = columns['low']
 
         # Check for price spikes using returns
         returns = np.diff(closes) / closes[:-1]
@@ -266,37 +291,36 @@ class LINEDataQualityValidator:
                         ))
 
         # Check for zero or very small prices
-        for idx, bar in enumerate(dataset.bars):
-            if bar.close <= 0.01:
-                issues.append(DataQualityIssue(
-                    check_name="Price Sanity",
-                    severity=DataQualitySeverity.ERROR,
-                    message=f"Suspiciously low price: ${bar.close:.4f}",
-                    bar_index=idx,
-                    actual_value=bar.close
-                ))
+        for idx in np.flatnonzero(closes <= 0.01).tolist():
+            close = closes[idx].item()
+            issues.append(DataQualityIssue(
+                check_name="Price Sanity",
+                severity=DataQualitySeverity.ERROR,
+                message=f"Suspiciously low price: ${close:.4f}",
+                bar_index=idx,
+                actual_value=close
+            ))
 
         # Check for unrealistic high/low spreads (>50% intrabar range)
-        for idx, bar in enumerate(dataset.bars):
-            bar_range = bar.get_range()
-            mid_price = (bar.high + bar.low) / 2.0
-
-            if mid_price > 0:
-                range_pct = (bar_range / mid_price) * 100
-
-                if range_pct > 50.0:  # >50% intrabar range is suspicious
-                    issues.append(DataQualityIssue(
-                        check_name="Intrabar Range",
-                        severity=DataQualitySeverity.WARNING,
-                        message=f"Unusually wide intrabar range: {range_pct:.1f}%",
-                        bar_index=idx,
-                        actual_value=range_pct,
-                        expected_range="<50%"
-                    ))
+        bar_range = highs - lows
+        mid_price = (highs + lows) / 2.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            range_pct = (bar_range / mid_price) * 100
+
+        for idx in np.flatnonzero((mid_price > 0) & (range_pct > 50.0)).tolist():  # >50% is suspicious
+            issues.append(DataQualityIssue(
+                check_name="Intrabar Range",
+                severity=DataQualitySeverity.WARNING,
+                message=f"Unusually wide intrabar range: {range_pct[idx]:.1f}%",
+                bar_index=idx,
+                actual_value=range_pct[idx].item(),
+                expected_range="<50%"
+            ))
 
         return issues
 
-    def _validate_volume_sanity(self, dataset: OHLCVDataset) -> List[DataQualityIssue]:
+    def _validate_volume_sanity(self, dataset: OHLCVDataset,
+                                columns: Optional[Dict[str, np.ndarray]] = None) -> List[DataQualityIssue]:
         """
         Validate volume sanity.
 
@@ -311,7 +335,9 @@ class LINEDataQualityValidator:
             return issues
 
         # Extract volumes
-        volumes = np.array([bar.volume for bar in dataset.bars])
+        if columns is None:
+            columns = dataset.get_columns()
+        volumes = columns['volume']
 
         # Check zero volume percentage
         zero_volume_count = np.sum(volumes == 0)
@@ -362,7 +388,8 @@ class LINEDataQualityValidator:
 
         return issues
 
-    def _validate_continuity(self, dataset: OHLCVDataset) -> List[DataQualityIssue]:
+    def _validate_continuity(self, dataset: OHLCVDataset,
+                             columns: Optional[Dict[str, np.ndarray]] = None) -> List[DataQualityIssue]:
         """
         Validate time series continuity.
 
@@ -376,10 +403,12 @@ class LINEDataQualityValidator:
         if dataset.get_bar_count() < 2:
             return issues
 
-        timestamps = [bar.timestamp for bar in dataset.bars]
+        if columns is None:
+            columns = dataset.get_columns()
+        timestamps = columns['timestamp'].view(np.int64)     # ns since epoch
 
         # Check for duplicates
-        timestamp_counts = pd.Series(timestamps).value_counts()
+        _, timestamp_counts = np.unique(timestamps, return_counts=True)
         duplicates = timestamp_counts[timestamp_counts > 1]
 
         if len(duplicates) > 0:
@@ -391,33 +420,33 @@ class LINEDataQualityValidator:
             ))
 
         # Check for out-of-order timestamps
-        for idx in range(len(timestamps) - 1):
-            if timestamps[idx] >= timestamps[idx + 1]:
-                issues.append(DataQualityIssue(
-                    check_name="Timestamp Order",
-                    severity=DataQualitySeverity.ERROR,
-                    message=f"Out-of-order timestamp at bar {idx}",
-                    bar_index=idx
-                ))
+        for idx in np.flatnonzero(timestamps[:-1] >= timestamps[1:]).tolist():
+            issues.append(DataQualityIssue(
+                check_name="Timestamp Order",
+                severity=DataQualitySeverity.ERROR,
+                message=f"Out-of-order timestamp at bar {idx}",
+                bar_index=idx
+            ))
 
         # Check for large gaps (daily data only)
         if dataset.interval == OHLCVInterval.DAY_1:
-            for idx in range(len(timestamps) - 1):
-                gap_days = (timestamps[idx + 1] - timestamps[idx]).days
-
-                if gap_days > self.max_gap_days:
-                    issues.append(DataQualityIssue(
-                        check_name="Data Continuity",
-                        severity=DataQualitySeverity.WARNING,
-                        message=f"Large gap detected: {gap_days} days",
-                        bar_index=idx,
-                        actual_value=gap_days,
-                        expected_range=f"≤{self.max_gap_days} days"
-                    ))
+            gap_days = np.diff(timestamps) // NANOSECONDS_PER_DAY   # floors, like timedelta.days
+
+            for idx in np.flatnonzero(gap_days > self.max_gap_days).tolist():
+                gap = int(gap_days[idx])
+                issues.append(DataQualityIssue(
+                    check_name="Data Continuity",
+                    severity=DataQualitySeverity.WARNING,
+                    message=f"Large gap detected: {gap} days",
+                    bar_index=idx,
+                    actual_value=gap,
+                    expected_range=f"≤{self.max_gap_days} days"
+                ))
 
         return issues
 
-    def _validate_distribution(self, dataset: OHLCVDataset) -> List[DataQualityIssue]:
+    def _validate_distribution(self, dataset: OHLCVDataset,
+                               columns: Optional[Dict[str, np.ndarray]] = None) -> List[DataQualityIssue]:
         """
         Validate statistical distribution properties.
 
@@ -431,7 +460,9 @@ class LINEDataQualityValidator:
         if dataset.get_bar_count() < 20:
             return issues
 
-        closes = np.array([bar.close for bar in dataset.bars])
+        if columns is None:
+            columns = dataset.get_columns()
+        closes = columns['close']
         returns = np.diff(closes) / closes[:-1]
 
         # Check for zero variance (constant prices)
@@ -495,26 +526,23 @@ def validate_for_finn(dataset: OHLCVDataset) -> Tuple[bool, DataQualityReport]:
     return is_valid, report
 
 
-def validate_multi_interval_for_finn(datasets: List[OHLCVDataset]) -> Tuple[bool, List[DataQualityReport]]:
+def validate_multi_interval_for_finn(datasets: List[OHLCVDataset],
+                                     max_workers: Optional[int] = None) -> Tuple[bool, List[DataQualityReport]]:
     """
     Validate multiple interval datasets for FINN+ classification.
 
+    Datasets are validated concurrently (see validate_datasets);
+    max_workers=1 validates them one after another.
+
     Returns:
         (all_valid, reports)
         all_valid: True if ALL datasets pass validation
         reports: List of DataQualityReports (one per dataset)
     """
     validator = LINEDataQualityValidator()
-    reports = []
-
-    all_valid = True
-
-    for dataset in datasets:
-        report = validator.validate_dataset(dataset)
-        reports.append(report)
+    reports = validator.validate_datasets(datasets, max_workers=max_workers)
 
-        if not report.overall_pass:
-            all_valid = False
+    all_valid = all(report.overall_pass for report in reports)
 
     return all_valid, reports
 
@@ -27,10 +27,12 @@ Compliance:
 - ADR-012: Cost tracking for data API calls
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 from enum import Enum
+import numpy as np
 import pandas as pd
 
 
@@ -162,55 +164,228 @@ class OHLCVBar:
         return self.close > self.open
 
 
-@dataclass
-class OHLCVDataset:
+class OHLCVBarSequence(Sequence):
     """
-    Collection of OHLCV bars for a single interval and symbol.
+    Read-only sequence of OHLCVBar objects over an OHLCVDataset's columns.
 
-    This is the primary data structure consumed by FINN+ for regime classification.
-    All datasets must pass LINE+ data quality validation before FINN+ execution.
+    Bars are materialized on access, so iterating a large dataset does not
+    keep a Python object per bar alive. The sequence covers the bars present
+    when it was created; bars added later are not visible through it.
+    Materialized bars are copies - changing them does not change the dataset.
     """
-    symbol: str
-    interval: OHLCVInterval
-    bars: List[OHLCVBar] = field(default_factory=list)
 
-    # Metadata
-    source: Optional[str] = None
-    fetched_at: datetime = field(default_factory=datetime.now)
+    _CHUNK = 4096
 
-    # ADR-008: Dataset-level signature
-    dataset_hash: Optional[str] = None
-    dataset_signature: Optional[str] = None
+    def __init__(self, dataset: 'OHLCVDataset', start: int = 0, stop: Optional[int] = None):
+        self._dataset = dataset
+        self._start = start
+        self._stop = dataset._n if stop is None else stop
 
-    # Data quality metrics
-    completeness_pct: float = 0.0    # % of bars with complete data
-    volume_coverage_pct: float = 0.0  # % of bars with volume > 0
-    valid_bars_pct: float = 0.0       # % of bars passing validation
+    def __len__(self) -> int:
+        return self._stop - self._start
 
-    def __post_init__(self):
-        """Calculate data quality metrics after initialization."""
-        if self.bars:
-            self._update_quality_metrics()
-
-    def _update_quality_metrics(self):
-        """Recalculate data quality metrics."""
-        if not self.bars:
-            self.completeness_pct = 0.0
-            self.volume_coverage_pct = 0.0
-            self.valid_bars_pct = 0.0
-            return
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._dataset._materialize(self._start + start, self._start + max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bar index out of range")
+        return self._dataset._materialize(self._start + index, self._start + index + 1)[0]
 
-        total = len(self.bars)
-        complete = sum(1 for bar in self.bars if bar.is_complete)
-        has_volume = sum(1 for bar in self.bars if bar.has_volume)
-        valid = sum(1 for bar in self.bars if bar.is_valid)
+    def __iter__(self) -> Iterator[OHLCVBar]:
+        for chunk_start in range(self._start, self._stop, self._CHUNK):
+            yield from self._dataset._materialize(chunk_start, min(chunk_start + self._CHUNK, self._stop))
 
-        self.completeness_pct = (complete / total) * 100
-        self.volume_coverage_pct = (has_volume / total) * 100
-        self.valid_bars_pct = (valid / total) * 100
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (OHLCVBarSequence, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
 
-    def add_bar(self, bar: OHLCVBar):
-        """Add bar and update quality metrics."""
+    def __repr__(self) -> str:
+        return f"OHLCVBarSequence({len(self)} bars)"
+
+
+class OHLCVDataset:
+    """
+    Collection of OHLCV bars for a single interval and symbol.
+
+    This is the primary data structure consumed by FINN+ for regime classification.
+    All datasets must pass LINE+ data quality validation before FINN+ execution.
+
+    Bars are stored column-wise in NumPy arrays (timestamps as int64
+    nanoseconds since the epoch) that grow geometrically, so add_bar is
+    amortized O(1). Quality metrics come from running counters instead of
+    a rescan. `bars` materializes OHLCVBar objects lazily; `get_columns`
+    and `to_dataframe` expose the columns without copying.
+    """
+
+    _INITIAL_CAPACITY = 64
+    _COLUMN_DTYPES = {
+        'timestamp': np.int64,
+        'open': np.float64,
+        'high': np.float64,
+        'low': np.float64,
+        'close': np.float64,
+        'volume': np.int64,         # becomes float64 once a fractional volume arrives
+        'is_complete': np.bool_,
+        'has_volume': np.bool_,
+        'is_valid': np.bool_,
+    }
+    # Per-bar metadata, allocated only once a bar carries a value
+    _METADATA_FIELDS = ('symbol', 'source', 'hash_chain_id', 'signature_hex')
+
+    def __init__(self,
+                 symbol: str,
+                 interval: OHLCVInterval,
+                 bars: Optional[Iterable[OHLCVBar]] = None,
+                 source: Optional[str] = None,
+                 fetched_at: Optional[datetime] = None,
+                 dataset_hash: Optional[str] = None,
+                 dataset_signature: Optional[str] = None):
+        self.symbol = symbol
+        self.interval = interval
+
+        # Metadata
+        self.source = source
+        self.fetched_at = fetched_at if fetched_at is not None else datetime.now()
+
+        # ADR-008: Dataset-level signature
+        self.dataset_hash = dataset_hash
+        self.dataset_signature = dataset_signature
+
+        self._clear()
+        if bars:
+            self._append_bars(list(bars))
+
+    def _clear(self, capacity: int = 0):
+        capacity = max(capacity, self._INITIAL_CAPACITY)
+        self._n = 0
+        self._columns = {name: np.empty(capacity, dtype) for name, dtype in self._COLUMN_DTYPES.items()}
+        self._metadata: Dict[str, Optional[np.ndarray]] = dict.fromkeys(self._METADATA_FIELDS)
+        self._tz = None             # timezone of the first bar; None for naive timestamps
+        self._complete = 0
+        self._with_volume = 0
+        self._valid = 0
+        self._ts_min = None
+        self._ts_max = None
+        self._sorted = True         # timestamps non-decreasing in insertion order
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _reserve(self, extra: int):
+        """Make room for `extra` more bars (capacity doubles)."""
+        needed = self._n + extra
+        capacity = len(self._columns['timestamp'])
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self._n] = column[:self._n]
+            self._columns[name] = grown
+        for name, column in self._metadata.items():
+            if column is not None:
+                grown = np.full(capacity, None, dtype=object)
+                grown[:self._n] = column[:self._n]
+                self._metadata[name] = grown
+
+    def _set_metadata(self, name: str, start: int, values):
+        column = self._metadata[name]
+        if column is None:
+            if all(v is None for v in values):
+                return
+            column = np.full(len(self._columns['timestamp']), None, dtype=object)
+            self._metadata[name] = column
+        column[start:start + len(values)] = values
+
+    def _ensure_float_volume(self):
+        if self._columns['volume'].dtype != np.float64:
+            self._columns['volume'] = self._columns['volume'].astype(np.float64)
+
+    def _timestamps_to_ns(self, timestamps) -> np.ndarray:
+        """Convert timestamps to int64 ns since the epoch (UTC for aware ones)."""
+        index = pd.DatetimeIndex(pd.to_datetime(timestamps))
+        if index.hasnans:
+            raise ValueError("Bar timestamps cannot be missing")
+        if self._n == 0:
+            self._tz = index.tz
+        elif (index.tz is None) != (self._tz is None):
+            raise ValueError("Cannot mix timezone-aware and naive bar timestamps in one dataset")
+        return index.as_unit('ns').asi8
+
+    def _timestamp_to_ns(self, timestamp) -> int:
+        """Scalar _timestamps_to_ns for add_bar."""
+        ts = pd.Timestamp(timestamp)
+        if ts is pd.NaT:
+            raise ValueError("Bar timestamps cannot be missing")
+        if self._n == 0:
+            self._tz = ts.tz
+        elif (ts.tz is None) != (self._tz is None):
+            raise ValueError("Cannot mix timezone-aware and naive bar timestamps in one dataset")
+        return ts.value
+
+    def _append_columns(self, timestamp: np.ndarray, open_: np.ndarray, high: np.ndarray,
+                        low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                        is_complete: np.ndarray, has_volume: np.ndarray, is_valid: np.ndarray,
+                        metadata: Optional[Dict[str, list]] = None):
+        count = len(timestamp)
+        if count == 0:
+            return
+        if volume.dtype.kind not in 'biu':
+            self._ensure_float_volume()
+        self._reserve(count)
+        start, stop = self._n, self._n + count
+        columns = self._columns
+        columns['timestamp'][start:stop] = timestamp
+        columns['open'][start:stop] = open_
+        columns['high'][start:stop] = high
+        columns['low'][start:stop] = low
+        columns['close'][start:stop] = close
+        columns['volume'][start:stop] = volume
+        columns['is_complete'][start:stop] = is_complete
+        columns['has_volume'][start:stop] = has_volume
+        columns['is_valid'][start:stop] = is_valid
+        for name, values in (metadata or {}).items():
+            self._set_metadata(name, start, values)
+
+        self._complete += int(np.count_nonzero(is_complete))
+        self._with_volume += int(np.count_nonzero(has_volume))
+        self._valid += int(np.count_nonzero(is_valid))
+        last = columns['timestamp'][start - 1] if start else None
+        if self._sorted and (np.any(timestamp[1:] < timestamp[:-1])
+                             or (last is not None and timestamp[0] < last)):
+            self._sorted = False
+        batch_min, batch_max = int(timestamp.min()), int(timestamp.max())
+        self._ts_min = batch_min if self._ts_min is None else min(self._ts_min, batch_min)
+        self._ts_max = batch_max if self._ts_max is None else max(self._ts_max, batch_max)
+        self._n = stop
+
+    def _append_bars(self, bars: List[OHLCVBar]):
+        """Append OHLCVBar objects column-wise, keeping their quality flags."""
+        if not bars:
+            return
+        volumes = [bar.volume for bar in bars]
+        integral = all(isinstance(v, (int, np.integer)) for v in volumes)
+        self._append_columns(
+            self._timestamps_to_ns([bar.timestamp for bar in bars]),
+            np.array([bar.open for bar in bars], dtype=np.float64),
+            np.array([bar.high for bar in bars], dtype=np.float64),
+            np.array([bar.low for bar in bars], dtype=np.float64),
+            np.array([bar.close for bar in bars], dtype=np.float64),
+            np.array(volumes, dtype=np.int64 if integral else np.float64),
+            np.array([bar.is_complete for bar in bars], dtype=np.bool_),
+            np.array([bar.has_volume for bar in bars], dtype=np.bool_),
+            np.array([bar.is_valid for bar in bars], dtype=np.bool_),
+            {name: [getattr(bar, name) for bar in bars] for name in self._METADATA_FIELDS},
+        )
+
+    def _check_bar(self, bar: OHLCVBar):
         if bar.interval != self.interval:
             raise ValueError(
                 f"Bar interval ({bar.interval.value}) does not match "
@@ -223,54 +398,232 @@ class OHLCVDataset:
                 f"dataset symbol ({self.symbol})"
             )
 
-        self.bars.append(bar)
-        self._update_quality_metrics()
+    def _timestamp(self, ns: int) -> pd.Timestamp:
+        return pd.Timestamp(ns, tz=self._tz) if self._tz is not None else pd.Timestamp(ns)
+
+    def _materialize(self, start: int, stop: int) -> List[OHLCVBar]:
+        """Build OHLCVBar objects for rows [start, stop)."""
+        columns = {name: column[start:stop].tolist() for name, column in self._columns.items()}
+        metadata = {
+            name: column[start:stop].tolist() if column is not None else [None] * (stop - start)
+            for name, column in self._metadata.items()
+        }
+        timestamps = (pd.DatetimeIndex(self._columns['timestamp'][start:stop].view('M8[ns]'))
+                      .tz_localize('UTC' if self._tz is not None else None))
+        if self._tz is not None:
+            timestamps = timestamps.tz_convert(self._tz)
+        return [
+            OHLCVBar(
+                timestamp=timestamps[i],
+                open=columns['open'][i],
+                high=columns['high'][i],
+                low=columns['low'][i],
+                close=columns['close'][i],
+                volume=columns['volume'][i],
+                interval=self.interval,
+                symbol=metadata['symbol'][i],
+                source=metadata['source'][i],
+                hash_chain_id=metadata['hash_chain_id'][i],
+                signature_hex=metadata['signature_hex'][i],
+                is_complete=columns['is_complete'][i],
+                has_volume=columns['has_volume'][i],
+                is_valid=columns['is_valid'][i],
+            )
+            for i in range(stop - start)
+        ]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_arrays(cls, symbol: str, interval: OHLCVInterval, timestamp, open, high, low,
+                    close, volume, **kwargs) -> 'OHLCVDataset':
+        """
+        Build a dataset from array-likes without creating OHLCVBar objects.
+
+        The OHLCVBar sanity checks and quality flags are applied column-wise.
+        Extra keyword arguments are passed to the constructor (source, ...).
+        """
+        dataset = cls(symbol, interval, **kwargs)
+        dataset.append_arrays(timestamp, open, high, low, close, volume)
+        return dataset
+
+    def append_arrays(self, timestamp, open, high, low, close, volume):
+        """Append bars given as equal-length array-likes (see from_arrays)."""
+        prices = [np.asarray(a, dtype=np.float64) for a in (open, high, low, close)]
+        volume = np.asarray(volume)
+        if volume.dtype.kind not in 'biuf':
+            volume = volume.astype(np.float64)
+        timestamps = self._timestamps_to_ns(timestamp)
+        if len({len(timestamps), len(volume), *(len(p) for p in prices)}) != 1:
+            raise ValueError("OHLCV arrays must have equal length")
+        open_, high, low, close = prices
+
+        # Same checks as OHLCVBar.__post_init__
+        for mask, message in ((high < low, "High cannot be less than Low"),
+                              ((open_ < 0) | (close < 0), "Prices cannot be negative"),
+                              (volume < 0, "Volume cannot be negative")):
+            if mask.any():
+                raise ValueError(f"{message} (bar {int(np.argmax(mask))})")
+        is_valid = (low <= open_) & (open_ <= high) & (low <= close) & (close <= high)
+
+        self._append_columns(timestamps, open_, high, low, close, volume,
+                             np.ones(len(timestamps), dtype=np.bool_), volume != 0, is_valid)
+
+    @property
+    def bars(self) -> OHLCVBarSequence:
+        """Bars in insertion order, materialized lazily."""
+        return OHLCVBarSequence(self)
+
+    @bars.setter
+    def bars(self, bars: Iterable[OHLCVBar]):
+        self._clear()
+        self._append_bars(list(bars))
+
+    # ------------------------------------------------------------------
+    # Data quality metrics (running counters)
+    # ------------------------------------------------------------------
+
+    @property
+    def completeness_pct(self) -> float:
+        """% of bars with complete data."""
+        return (self._complete / self._n) * 100 if self._n else 0.0
+
+    @property
+    def volume_coverage_pct(self) -> float:
+        """% of bars with volume > 0."""
+        return (self._with_volume / self._n) * 100 if self._n else 0.0
+
+    @property
+    def valid_bars_pct(self) -> float:
+        """% of bars passing validation."""
+        return (self._valid / self._n) * 100 if self._n else 0.0
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def add_bar(self, bar: OHLCVBar):
+        """Add bar and update quality metrics."""
+        self._check_bar(bar)
+
+        volume = bar.volume
+        if not isinstance(volume, (int, np.integer)):
+            self._ensure_float_volume()
+        ts = self._timestamp_to_ns(bar.timestamp)
+        self._reserve(1)
+        i = self._n
+        columns = self._columns
+        columns['timestamp'][i] = ts
+        columns['open'][i] = bar.open
+        columns['high'][i] = bar.high
+        columns['low'][i] = bar.low
+        columns['close'][i] = bar.close
+        columns['volume'][i] = volume
+        columns['is_complete'][i] = bar.is_complete
+        columns['has_volume'][i] = bar.has_volume
+        columns['is_valid'][i] = bar.is_valid
+        for name in self._METADATA_FIELDS:
+            value = getattr(bar, name)
+            if value is not None or self._metadata[name] is not None:
+                self._set_metadata(name, i, [value])
+
+        self._complete += bool(bar.is_complete)
+        self._with_volume += bool(bar.has_volume)
+        self._valid += bool(bar.is_valid)
+        if i and ts < columns['timestamp'][i - 1]:
+            self._sorted = False
+        self._ts_min = ts if self._ts_min is None else min(self._ts_min, ts)
+        self._ts_max = ts if self._ts_max is None else max(self._ts_max, ts)
+        self._n = i + 1
+
+    def extend(self, bars: Iterable[OHLCVBar]):
+        """Add several bars at once (same checks as add_bar)."""
+        bars = list(bars)
+        for bar in bars:
+            self._check_bar(bar)
+        self._append_bars(bars)
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Read-only NumPy views of the columns in insertion order: timestamp
+        (datetime64[ns], UTC for timezone-aware data), open, high, low,
+        close, volume and the is_complete/has_volume/is_valid flags.
+        """
+        views = {}
+        for name, column in self._columns.items():
+            view = column[:self._n]
+            if name == 'timestamp':
+                view = view.view('M8[ns]')
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def to_dataframe(self, copy: bool = False) -> pd.DataFrame:
         """
         Convert to pandas DataFrame (FINN+ input format).
 
         Returns DataFrame with columns: date, open, high, low, close, volume
+
+        Bars added in chronological order are returned without copying: the
+        columns are read-only views of the dataset, so modify a copy
+        (copy=True) rather than the frame in place. Out-of-order bars are
+        sorted by date, which copies.
         """
-        if not self.bars:
+        if not self._n:
             return pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume'])
 
-        data = {
-            'date': [bar.timestamp for bar in self.bars],
-            'open': [bar.open for bar in self.bars],
-            'high': [bar.high for bar in self.bars],
-            'low': [bar.low for bar in self.bars],
-            'close': [bar.close for bar in self.bars],
-            'volume': [bar.volume for bar in self.bars]
-        }
-
-        df = pd.DataFrame(data)
-        df = df.sort_values('date').reset_index(drop=True)
+        columns = self.get_columns()
+        if not self._sorted:
+            order = np.argsort(columns['timestamp'], kind='stable')
+            columns = {name: column[order] for name, column in columns.items()}
+
+        date = columns['timestamp']
+        if self._tz is not None:
+            date = pd.DatetimeIndex(date).tz_localize('UTC').tz_convert(self._tz)
+        df = pd.DataFrame({
+            'date': date,
+            'open': columns['open'],
+            'high': columns['high'],
+            'low': columns['low'],
+            'close': columns['close'],
+            'volume': columns['volume']
+        }, copy=copy)
         return df
 
     def get_date_range(self) -> tuple:
         """Get (start_date, end_date) for dataset."""
-        if not self.bars:
+        if not self._n:
             return None, None
 
-        dates = [bar.timestamp for bar in self.bars]
-        return min(dates), max(dates)
+        return self._timestamp(self._ts_min), self._timestamp(self._ts_max)
 
     def get_bar_count(self) -> int:
         """Get total number of bars."""
-        return len(self.bars)
+        return self._n
 
     def filter_valid_bars(self) -> 'OHLCVDataset':
         """Return new dataset with only valid bars."""
-        valid_bars = [bar for bar in self.bars if bar.is_valid]
-
+        mask = self._columns['is_valid'][:self._n]
         filtered = OHLCVDataset(
             symbol=self.symbol,
             interval=self.interval,
-            bars=valid_bars,
             source=self.source,
             fetched_at=self.fetched_at
         )
+        filtered._tz = self._tz
+        if self._columns['volume'].dtype == np.float64:
+            filtered._ensure_float_volume()
+
+        columns = {name: column[:self._n][mask] for name, column in self._columns.items()}
+        metadata = {name: column[:self._n][mask].tolist()
+                    for name, column in self._metadata.items() if column is not None}
+        filtered._append_columns(
+            columns['timestamp'], columns['open'], columns['high'], columns['low'],
+            columns['close'], columns['volume'], columns['is_complete'],
+            columns['has_volume'], columns['is_valid'], metadata
+        )
 
         return filtered
 
@@ -304,6 +657,17 @@ class OHLCVDataset:
             'fetched_at': self.fetched_at.isoformat()
         }
 
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        # A dataset with zero bars is still a dataset; don't let __len__ make it falsy
+        return True
+
+    def __repr__(self) -> str:
+        return (f"OHLCVDataset(symbol={self.symbol!r}, interval={self.interval}, "
+                f"bars={self._n}, source={self.source!r})")
+
 
 @dataclass
 class MultiIntervalDataset:
@@ -374,41 +738,91 @@ class MultiIntervalDataset:
 # Data Contract Validation Functions
 # ============================================================================
 
+# Bar check messages, in check order (shared by the per-bar and column-wise validators)
+_BAR_ERRORS = (
+    "Bar failed internal validation checks",
+    "Incomplete OHLCV data",
+    "High ({high}) < Low ({low})",
+    "Open ({open}) outside [Low, High] range",
+    "Close ({close}) outside [Low, High] range",
+    "Zero prices detected",
+    "Negative values detected",
+)
+
+
+def _bar_error(check: int, open_: float, high: float, low: float, close: float) -> str:
+    return _BAR_ERRORS[check].format(open=open_, high=high, low=low, close=close)
+
+
 def validate_ohlcv_bar(bar: OHLCVBar) -> tuple[bool, Optional[str]]:
     """
     Validate single OHLCV bar against LINE+ quality standards.
 
     Returns: (is_valid, error_message)
     """
+    prices = (bar.open, bar.high, bar.low, bar.close)
+
     # Check if bar is already marked invalid
     if not bar.is_valid:
-        return False, "Bar failed internal validation checks"
+        return False, _bar_error(0, *prices)
 
     # Check completeness
     if not bar.is_complete:
-        return False, "Incomplete OHLCV data"
+        return False, _bar_error(1, *prices)
 
     # Check price consistency
     if bar.high < bar.low:
-        return False, f"High ({bar.high}) < Low ({bar.low})"
+        return False, _bar_error(2, *prices)
 
     if not (bar.low <= bar.open <= bar.high):
-        return False, f"Open ({bar.open}) outside [Low, High] range"
+        return False, _bar_error(3, *prices)
 
     if not (bar.low <= bar.close <= bar.high):
-        return False, f"Close ({bar.close}) outside [Low, High] range"
+        return False, _bar_error(4, *prices)
 
     # Check for zero prices (invalid for most instruments)
     if bar.open == 0 or bar.close == 0:
-        return False, "Zero prices detected"
+        return False, _bar_error(5, *prices)
 
     # Check for negative values
     if any(x < 0 for x in [bar.open, bar.high, bar.low, bar.close, bar.volume]):
-        return False, "Negative values detected"
+        return False, _bar_error(6, *prices)
 
     return True, None
 
 
+def validate_ohlcv_columns(columns: Dict[str, np.ndarray]) -> List[tuple[int, str]]:
+    """
+    validate_ohlcv_bar for every bar at once, on OHLCVDataset.get_columns().
+
+    Same checks, in the same order, with the same messages; a bar is
+    reported once, with the message of the first check it fails.
+
+    Returns: [(bar_index, error_message)] for the failing bars, in bar order
+    """
+    if not len(columns['close']):
+        return []
+
+    opens, highs, lows = columns['open'], columns['high'], columns['low']
+    closes, volumes = columns['close'], columns['volume']
+    failures = np.stack([
+        ~columns['is_valid'],
+        ~columns['is_complete'],
+        highs < lows,
+        ~((lows <= opens) & (opens <= highs)),
+        ~((lows <= closes) & (closes <= highs)),
+        (opens == 0) | (closes == 0),
+        (opens < 0) | (highs < 0) | (lows < 0) | (closes < 0) | (volumes < 0),
+    ])
+    first_failure = failures.argmax(axis=0)
+
+    return [
+        (idx, _bar_error(first_failure[idx], opens[idx].item(), highs[idx].item(),
+                         lows[idx].item(), closes[idx].item()))
+        for idx in np.flatnonzero(failures.any(axis=0)).tolist()
+    ]
+
+
 def validate_ohlcv_dataset(dataset: OHLCVDataset,
                           min_bars: int = 100,
                           min_completeness: float = 95.0,
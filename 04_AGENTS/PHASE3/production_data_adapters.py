@@ -15,7 +15,8 @@ Compliance:
 - ADR-012: Economic safety (rate limiting, cost tracking, budget caps)
 
 Features:
-- Rate limiting with configurable limits per source
+- Rate limiting with configurable limits and burst sizes per source,
+  optionally shared across processes (RATE_LIMIT_STATE_DIR)
 - Retry logic with exponential backoff
 - Cost tracking per request
 - Ed25519 signatures on fetched data
@@ -37,100 +38,24 @@ from enum import Enum
 from line_ohlcv_contracts import OHLCVBar, OHLCVDataset, OHLCVInterval
 from line_data_ingestion import DataSourceAdapter, DataSourceConfig
 
+# Rate limiting (ADR-012) lives in rate_limiter; re-exported for existing callers
+from rate_limiter import (  # noqa: F401
+    RATE_LIMIT_STATE_DIR_ENV,
+    RATE_LIMIT_WINDOWS,
+    SECONDS_PER_DAY,
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitExceeded,
+    _MemoryRateLimitStore,
+    _SQLiteRateLimitStore,
+    shared_state_path
+)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("production_adapters")
 
 
-# =============================================================================
-# RATE LIMITING (ADR-012 Compliance)
-# =============================================================================
-
-@dataclass
-class RateLimitConfig:
-    """Rate limit configuration (ADR-012 compliance)."""
-    max_requests_per_minute: int = 60
-    max_requests_per_hour: int = 1000
-    max_daily_budget_usd: float = 50.0  # Daily cost cap
-    retry_max_attempts: int = 3
-    retry_base_delay_seconds: float = 1.0
-    retry_exponential_base: float = 2.0
-
-
-class RateLimiter:
-    """
-    Rate limiter for API calls (ADR-012 compliance).
-
-    Features:
-    - Per-minute rate limiting
-    - Per-hour rate limiting
-    - Daily budget tracking
-    - Automatic blocking when limits exceeded
-    """
-
-    def __init__(self, config: RateLimitConfig):
-        """Initialize rate limiter."""
-        self.config = config
-        self.minute_requests: List[datetime] = []
-        self.hour_requests: List[datetime] = []
-        self.daily_cost: float = 0.0
-        self.daily_cost_reset_time: datetime = datetime.now(timezone.utc)
-
-    def _cleanup_old_requests(self):
-        """Remove requests older than their window."""
-        now = datetime.now(timezone.utc)
-        one_minute_ago = now - timedelta(minutes=1)
-        one_hour_ago = now - timedelta(hours=1)
-
-        self.minute_requests = [t for t in self.minute_requests if t > one_minute_ago]
-        self.hour_requests = [t for t in self.hour_requests if t > one_hour_ago]
-
-        # Reset daily cost at midnight UTC
-        if now.date() > self.daily_cost_reset_time.date():
-            self.daily_cost = 0.0
-            self.daily_cost_reset_time = now
-
-    def can_make_request(self, estimated_cost: float = 0.0) -> tuple[bool, str]:
-        """
-        Check if a request can be made within rate limits.
-
-        Returns:
-            Tuple of (allowed, reason)
-        """
-        self._cleanup_old_requests()
-
-        # Check per-minute limit
-        if len(self.minute_requests) >= self.config.max_requests_per_minute:
-            return False, f"Per-minute rate limit exceeded ({self.config.max_requests_per_minute}/min)"
-
-        # Check per-hour limit
-        if len(self.hour_requests) >= self.config.max_requests_per_hour:
-            return False, f"Per-hour rate limit exceeded ({self.config.max_requests_per_hour}/hr)"
-
-        # Check daily budget
-        if self.daily_cost + estimated_cost > self.config.max_daily_budget_usd:
-            return False, f"Daily budget exceeded (${self.config.max_daily_budget_usd:.2f}/day)"
-
-        return True, "OK"
-
-    def record_request(self, cost: float = 0.0):
-        """Record a successful request."""
-        now = datetime.now(timezone.utc)
-        self.minute_requests.append(now)
-        self.hour_requests.append(now)
-        self.daily_cost += cost
-
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get rate limiter statistics."""
-        self._cleanup_old_requests()
-        return {
-            'requests_this_minute': len(self.minute_requests),
-            'requests_this_hour': len(self.hour_requests),
-            'daily_cost_usd': self.daily_cost,
-            'daily_budget_remaining_usd': self.config.max_daily_budget_usd - self.daily_cost
-        }
-
-
 # =============================================================================
 # SIGNATURE UTILITIES (ADR-008 Compliance)
 # =============================================================================
@@ -260,8 +185,9 @@ class BinanceAdapter(DataSourceAdapter):
         self.rate_limiter = RateLimiter(RateLimitConfig(
             max_requests_per_minute=min(config.rate_limit_per_minute, 600),
             max_requests_per_hour=10000,
-            max_daily_budget_usd=0.0  # Binance is free
-        ))
+            max_daily_budget_usd=0.0,  # Binance is free
+            burst_size=100
+        ), state_path=shared_state_path(config.source_name))
 
         # Symbol mapping (Vision-IoS format → Binance format)
         self.symbol_map = {
@@ -389,10 +315,8 @@ class BinanceAdapter(DataSourceAdapter):
         Returns:
             List of OHLCVBar objects
         """
-        # Check rate limit
-        can_request, reason = self.rate_limiter.can_make_request()
-        if not can_request:
-            raise Exception(f"Rate limit exceeded: {reason}")
+        # Wait for a rate limit slot (raises RateLimitExceeded on timeout)
+        self.rate_limiter.acquire(timeout=self.config.timeout_seconds)
 
         # Normalize inputs
         binance_symbol = self._normalize_symbol(symbol)
@@ -415,8 +339,6 @@ class BinanceAdapter(DataSourceAdapter):
             end_ms
         )
 
-        # Record request
-        self.rate_limiter.record_request(cost=0.0)  # Binance is free
         self.request_count += 1
 
         # Convert to OHLCVBar objects
@@ -494,8 +416,9 @@ class AlpacaAdapter(DataSourceAdapter):
         self.rate_limiter = RateLimiter(RateLimitConfig(
             max_requests_per_minute=min(config.rate_limit_per_minute, 200),
             max_requests_per_hour=5000,
-            max_daily_budget_usd=0.0  # Alpaca free tier
-        ))
+            max_daily_budget_usd=0.0,  # Alpaca free tier
+            burst_size=50
+        ), state_path=shared_state_path(config.source_name))
 
         # Validate API keys
         if not config.api_key:
@@ -613,10 +536,8 @@ class AlpacaAdapter(DataSourceAdapter):
         end_date: datetime
     ) -> List[OHLCVBar]:
         """Fetch OHLCV data from Alpaca."""
-        # Check rate limit
-        can_request, reason = self.rate_limiter.can_make_request()
-        if not can_request:
-            raise Exception(f"Rate limit exceeded: {reason}")
+        # Wait for a rate limit slot (raises RateLimitExceeded on timeout)
+        self.rate_limiter.acquire(timeout=self.config.timeout_seconds)
 
         # Get Alpaca timeframe
         timeframe = self.INTERVAL_MAP.get(interval)
@@ -637,8 +558,6 @@ class AlpacaAdapter(DataSourceAdapter):
             end_str
         )
 
-        # Record request
-        self.rate_limiter.record_request(cost=0.0)
         self.request_count += 1
 
         # Convert to OHLCVBar objects
@@ -712,8 +631,9 @@ class YahooFinanceAdapter(DataSourceAdapter):
         self.rate_limiter = RateLimiter(RateLimitConfig(
             max_requests_per_minute=min(config.rate_limit_per_minute, 60),
             max_requests_per_hour=500,
-            max_daily_budget_usd=0.0  # Free
-        ))
+            max_daily_budget_usd=0.0,  # Free
+            burst_size=10
+        ), state_path=shared_state_path(config.source_name))
 
         logger.info("YahooFinanceAdapter initialized")
 
@@ -814,10 +734,8 @@ class YahooFinanceAdapter(DataSourceAdapter):
         end_date: datetime
     ) -> List[OHLCVBar]:
         """Fetch OHLCV data from Yahoo Finance."""
-        # Check rate limit
-        can_request, reason = self.rate_limiter.can_make_request()
-        if not can_request:
-            raise Exception(f"Rate limit exceeded: {reason}")
+        # Wait for a rate limit slot (raises RateLimitExceeded on timeout)
+        self.rate_limiter.acquire(timeout=self.config.timeout_seconds)
 
         # Map interval
         yf_interval_map = {
@@ -839,8 +757,6 @@ class YahooFinanceAdapter(DataSourceAdapter):
             end_date
         )
 
-        # Record request
-        self.rate_limiter.record_request(cost=0.0)
         self.request_count += 1
 
         # Convert to OHLCVBar
@@ -927,8 +843,9 @@ class FREDAdapter(DataSourceAdapter):
         self.rate_limiter = RateLimiter(RateLimitConfig(
             max_requests_per_minute=min(config.rate_limit_per_minute, 120),
             max_requests_per_hour=1000,
-            max_daily_budget_usd=0.0  # Free
-        ))
+            max_daily_budget_usd=0.0,  # Free
+            burst_size=20
+        ), state_path=shared_state_path(config.source_name))
 
         # FRED API key
         self.api_key = config.api_key or os.getenv('FRED_API_KEY')
@@ -1035,8 +952,8 @@ class FREDAdapter(DataSourceAdapter):
         end_str = end_date.strftime('%Y-%m-%d')
 
         for series_id in series_ids:
-            # Check rate limit
-            can_request, reason = self.rate_limiter.can_make_request()
+            # Take a rate limit slot
+            can_request, reason = self.rate_limiter.try_acquire()
             if not can_request:
                 logger.warning(f"Rate limit exceeded for {series_id}: {reason}")
                 continue
@@ -1050,8 +967,6 @@ class FREDAdapter(DataSourceAdapter):
                 end_str
             )
 
-            # Record request
-            self.rate_limiter.record_request(cost=0.0)
             self.request_count += 1
 
             # Convert to EconomicIndicator objects
@@ -0,0 +1,399 @@
+"""
+Rate Limiting for Production Data Adapters
+Phase 3: Week 3 — LARS Directive 7 (Priority 2: Production Data Integration)
+
+Authority: LARS G2 Approval (CDS Engine v1.0)
+Canonical ADR Chain: ADR-001 → ADR-015
+
+Purpose: API rate limiting and cost caps shared by the production data
+adapters and FINN+ Tier-2 LLM calls
+
+Features:
+- Per-minute and per-hour sliding windows, optional burst bucket
+- Daily budget cap (reset at midnight UTC)
+- Optional cross-process state in a SQLite file (RATE_LIMIT_STATE_DIR)
+
+Kept free of adapter imports so that importing the limiter does not pull
+in line_data_ingestion (and its logging configuration).
+
+Compliance:
+- ADR-012: Economic safety (rate limiting, cost tracking, budget caps)
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import bisect
+import os
+import sqlite3
+import threading
+import time
+
+
+# Sliding windows enforced by RateLimiter: ring name -> window length (seconds)
+RATE_LIMIT_WINDOWS = {'minute': 60.0, 'hour': 3600.0}
+
+# Directory for per-source limiter state shared by every process (optional)
+RATE_LIMIT_STATE_DIR_ENV = 'RATE_LIMIT_STATE_DIR'
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class RateLimitConfig:
+    """Rate limit configuration (ADR-012 compliance)."""
+    max_requests_per_minute: int = 60
+    max_requests_per_hour: int = 1000
+    max_daily_budget_usd: float = 50.0  # Daily cost cap
+    retry_max_attempts: int = 3
+    retry_base_delay_seconds: float = 1.0
+    retry_exponential_base: float = 2.0
+    burst_size: int = 0  # Token bucket size, refilled at the per-minute rate (0 = off)
+
+
+class RateLimitExceeded(Exception):
+    """Request could not be admitted within its timeout (ADR-012)."""
+
+    def __init__(self, reason: str, retry_after: Optional[float] = None):
+        super().__init__(f"Rate limit exceeded: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _MemoryRateLimitStore:
+    """
+    Limiter state for a single process.
+
+    Each window is a ring of the latest admission times, at least as long as
+    the window's request limit N; a request fits iff the N-th latest
+    admission has left the window. Rings only grow, so lowering and raising
+    a limit keeps the history.
+    """
+
+    def __init__(self, now: float, burst_size: int):
+        self.rings: Dict[str, List[float]] = {ring: [] for ring in RATE_LIMIT_WINDOWS}
+        self.heads: Dict[str, int] = {ring: 0 for ring in RATE_LIMIT_WINDOWS}
+        self.tokens = float(burst_size)
+        self.token_time = now
+        self.daily_cost = 0.0
+        self.cost_day = int(now // SECONDS_PER_DAY)
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+    def capacity(self, ring: str) -> int:
+        return len(self.rings[ring])
+
+    def grow(self, ring: str, capacity: int):
+        ordered = self.timestamps(ring)
+        self.rings[ring] = [0.0] * (capacity - len(ordered)) + ordered
+        self.heads[ring] = 0
+
+    def nth_latest(self, ring: str, n: int) -> float:
+        return self.rings[ring][(self.heads[ring] - n) % len(self.rings[ring])]
+
+    def push(self, ring: str, timestamp: float):
+        head = self.heads[ring]
+        self.rings[ring][head] = timestamp
+        self.heads[ring] = (head + 1) % len(self.rings[ring])
+
+    def timestamps(self, ring: str) -> List[float]:
+        """Ring contents, oldest first."""
+        head = self.heads[ring]
+        return self.rings[ring][head:] + self.rings[ring][:head]
+
+    def close(self):
+        pass
+
+
+class _SQLiteRateLimitStore:
+    """
+    Limiter state in a SQLite file shared by every process that opens it.
+
+    Same ring layout as the in-memory store, one row per slot. Every limiter
+    operation is a single BEGIN IMMEDIATE transaction that reads the state
+    row and one slot per window, so the cost does not grow with the
+    limits and concurrent processes are serialized by SQLite's write lock.
+    """
+
+    _STATE_COLUMNS = ('minute_head', 'minute_capacity', 'hour_head', 'hour_capacity',
+                      'tokens', 'token_time', 'daily_cost', 'cost_day')
+
+    def __init__(self, path: str, now: float, burst_size: int):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_state ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), minute_head INTEGER, minute_capacity INTEGER, "
+                "hour_head INTEGER, hour_capacity INTEGER, tokens REAL, token_time REAL, "
+                "daily_cost REAL, cost_day INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_slots ("
+                "ring TEXT, slot INTEGER, ts REAL, PRIMARY KEY (ring, slot))"
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO rate_limit_state VALUES (1, 0, 0, 0, 0, ?, ?, 0.0, ?)",
+                (float(burst_size), now, int(now // SECONDS_PER_DAY))
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                f"SELECT {', '.join(self._STATE_COLUMNS)} FROM rate_limit_state WHERE id = 1"
+            ).fetchone()
+            state = dict(zip(self._STATE_COLUMNS, row))
+            self.heads = {ring: state[f'{ring}_head'] for ring in RATE_LIMIT_WINDOWS}
+            self.capacities = {ring: state[f'{ring}_capacity'] for ring in RATE_LIMIT_WINDOWS}
+            self.tokens = state['tokens']
+            self.token_time = state['token_time']
+            self.daily_cost = state['daily_cost']
+            self.cost_day = state['cost_day']
+            yield self
+            self.conn.execute(
+                "UPDATE rate_limit_state SET minute_head = ?, minute_capacity = ?, hour_head = ?, "
+                "hour_capacity = ?, tokens = ?, token_time = ?, daily_cost = ?, cost_day = ? WHERE id = 1",
+                (self.heads['minute'], self.capacities['minute'], self.heads['hour'],
+                 self.capacities['hour'], self.tokens, self.token_time, self.daily_cost, self.cost_day)
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def capacity(self, ring: str) -> int:
+        return self.capacities[ring]
+
+    def grow(self, ring: str, capacity: int):
+        ordered = self.timestamps(ring)
+        offset = capacity - len(ordered)
+        self.conn.execute("DELETE FROM rate_limit_slots WHERE ring = ?", (ring,))
+        self.conn.executemany(
+            "INSERT INTO rate_limit_slots VALUES (?, ?, ?)",
+            [(ring, offset + i, t) for i, t in enumerate(ordered) if t > 0]
+        )
+        self.capacities[ring] = capacity
+        self.heads[ring] = 0
+
+    def nth_latest(self, ring: str, n: int) -> float:
+        slot = (self.heads[ring] - n) % self.capacities[ring]
+        row = self.conn.execute(
+            "SELECT ts FROM rate_limit_slots WHERE ring = ? AND slot = ?", (ring, slot)
+        ).fetchone()
+        return row[0] if row else 0.0
+
+    def push(self, ring: str, timestamp: float):
+        head = self.heads[ring]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO rate_limit_slots VALUES (?, ?, ?)", (ring, head, timestamp)
+        )
+        self.heads[ring] = (head + 1) % self.capacities[ring]
+
+    def timestamps(self, ring: str) -> List[float]:
+        """Ring contents, oldest first (empty slots read as 0.0)."""
+        capacity, head = self.capacities[ring], self.heads[ring]
+        slots = [0.0] * capacity
+        for slot, ts in self.conn.execute("SELECT slot, ts FROM rate_limit_slots WHERE ring = ?", (ring,)):
+            if slot < capacity:
+                slots[slot] = ts
+        return slots[head:] + slots[:head]
+
+    def close(self):
+        self.conn.close()
+
+
+class RateLimiter:
+    """
+    Rate limiter for API calls (ADR-012 compliance).
+
+    Features:
+    - Per-minute and per-hour sliding windows with O(1) accounting
+    - Optional token bucket for bursts (RateLimitConfig.burst_size)
+    - Daily budget tracking (reset at midnight UTC)
+    - Thread-safe; with state_path, shared by every process using that file
+    - Non-blocking (try_acquire) and blocking (acquire) admission
+
+    Limits are read from the config on every call, so changing them on a
+    live limiter takes effect immediately. Processes sharing a state file
+    must use the same limits.
+    """
+
+    def __init__(self, config: RateLimitConfig, state_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        """Initialize rate limiter."""
+        self.config = config
+        self.state_path = state_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        if state_path:
+            self._store = _SQLiteRateLimitStore(state_path, now, config.burst_size)
+        else:
+            self._store = _MemoryRateLimitStore(now, config.burst_size)
+
+    def _limits(self) -> Dict[str, int]:
+        return {'minute': max(int(self.config.max_requests_per_minute), 0),
+                'hour': max(int(self.config.max_requests_per_hour), 0)}
+
+    def _refresh(self, store, now: float):
+        """Apply config changes, refill the burst bucket and roll the budget day."""
+        for ring, limit in self._limits().items():
+            if store.capacity(ring) < limit:
+                store.grow(ring, limit)
+
+        burst = self.config.burst_size
+        if burst > 0:
+            rate = self.config.max_requests_per_minute / 60.0
+            store.tokens = min(float(burst), store.tokens + max(now - store.token_time, 0.0) * rate)
+        store.token_time = now
+
+        day = int(now // SECONDS_PER_DAY)
+        if day != store.cost_day:
+            store.daily_cost = 0.0
+            store.cost_day = day
+
+    def _check(self, store, now: float, cost: float) -> tuple[bool, str, Optional[float]]:
+        """
+        Check limits against the store.
+
+        Returns:
+            Tuple of (allowed, reason, retry_after); retry_after is None when
+            waiting cannot help (zero limit, exhausted budget)
+        """
+        labels = {'minute': ('Per-minute', 'min'), 'hour': ('Per-hour', 'hr')}
+        for ring, limit in self._limits().items():
+            label, unit = labels[ring]
+            reason = f"{label} rate limit exceeded ({limit}/{unit})"
+            if limit == 0:
+                return False, reason, None
+            window = RATE_LIMIT_WINDOWS[ring]
+            nth_latest = store.nth_latest(ring, limit)
+            if nth_latest > now - window:
+                return False, reason, nth_latest + window - now
+
+        burst = self.config.burst_size
+        if burst > 0 and store.tokens < 1.0:
+            rate = self.config.max_requests_per_minute / 60.0
+            return False, f"Burst limit exceeded ({burst} requests)", (1.0 - store.tokens) / rate
+
+        if store.daily_cost + cost > self.config.max_daily_budget_usd:
+            return False, f"Daily budget exceeded (${self.config.max_daily_budget_usd:.2f}/day)", None
+
+        return True, "OK", None
+
+    def _record(self, store, now: float, cost: float):
+        for ring in RATE_LIMIT_WINDOWS:
+            if store.capacity(ring):
+                store.push(ring, now)
+        if self.config.burst_size > 0:
+            store.tokens -= 1.0
+        store.daily_cost += cost
+
+    def _attempt(self, cost: float, record: bool) -> tuple[bool, str, Optional[float]]:
+        now = self._clock()
+        with self._lock, self._store.transaction() as store:
+            self._refresh(store, now)
+            allowed, reason, retry_after = self._check(store, now, cost)
+            if allowed and record:
+                self._record(store, now, cost)
+            return allowed, reason, retry_after
+
+    def can_make_request(self, estimated_cost: float = 0.0) -> tuple[bool, str]:
+        """
+        Check if a request can be made within rate limits.
+
+        Returns:
+            Tuple of (allowed, reason)
+        """
+        allowed, reason, _ = self._attempt(estimated_cost, record=False)
+        return allowed, reason
+
+    def try_acquire(self, cost: float = 0.0) -> tuple[bool, str]:
+        """
+        Check limits and, if allowed, record the request in one atomic step.
+
+        Returns:
+            Tuple of (allowed, reason)
+        """
+        allowed, reason, _ = self._attempt(cost, record=True)
+        return allowed, reason
+
+    def acquire(self, cost: float = 0.0, timeout: Optional[float] = None):
+        """
+        Block until the request is admitted, then record it.
+
+        Args:
+            cost: Cost charged against the daily budget
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Raises:
+            RateLimitExceeded if the request cannot be admitted in time, or
+            never can today (zero limit, exhausted budget)
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            allowed, reason, retry_after = self._attempt(cost, record=True)
+            if allowed:
+                return
+            if retry_after is None:
+                raise RateLimitExceeded(reason)
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if retry_after > remaining:
+                    raise RateLimitExceeded(reason, retry_after)
+            time.sleep(retry_after)
+
+    def record_request(self, cost: float = 0.0):
+        """Record a successful request."""
+        now = self._clock()
+        with self._lock, self._store.transaction() as store:
+            self._refresh(store, now)
+            self._record(store, now, cost)
+
+    def charge(self, cost: float):
+        """Add cost known only after the request to today's spend."""
+        now = self._clock()
+        with self._lock, self._store.transaction() as store:
+            self._refresh(store, now)
+            store.daily_cost += cost
+
+    def close(self):
+        """Release the shared state file, if any."""
+        with self._lock:
+            self._store.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get rate limiter statistics."""
+        now = self._clock()
+        with self._lock, self._store.transaction() as store:
+            self._refresh(store, now)
+            counts = {}
+            for ring, window in RATE_LIMIT_WINDOWS.items():
+                timestamps = store.timestamps(ring)
+                counts[ring] = len(timestamps) - bisect.bisect_right(timestamps, now - window)
+            return {
+                'requests_this_minute': counts['minute'],
+                'requests_this_hour': counts['hour'],
+                'burst_tokens': store.tokens if self.config.burst_size > 0 else None,
+                'daily_cost_usd': store.daily_cost,
+                'daily_budget_remaining_usd': self.config.max_daily_budget_usd - store.daily_cost
+            }
+
+
+def shared_state_path(source_name: str) -> Optional[str]:
+    """Limiter state file for a source when RATE_LIMIT_STATE_DIR is set."""
+    state_dir = os.getenv(RATE_LIMIT_STATE_DIR_ENV)
+    if not state_dir:
+        return None
+    return os.path.join(state_dir, f"{source_name}_rate_limit.sqlite")
@@ -11,7 +11,8 @@ C2 Formula: C2 = min(persistence_days / 30.0, 1.0)
 Features:
 - Track regime transitions across symbols/intervals
 - Calculate persistence duration (days since last regime change)
-- Store persistence history (database persistence)
+- Store persistence history (write-behind, batched database persistence)
+- Rebuild in-memory state from the database at startup
 - Provide real-time C2 values for CDS Engine
 - Ed25519 signatures on all persistence records (ADR-008)
 
@@ -22,10 +23,12 @@ Compliance:
 - ADR-012: Zero cost (pure computation, no LLM calls)
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Deque
 from enum import Enum
+import bisect
 import hashlib
 import json
 import logging
@@ -150,32 +153,56 @@ class STIGPersistenceTracker:
     Features:
         - Real-time persistence tracking
         - Transition history logging
-        - 90-day transition count for STIG+ validation (≤30 transitions)
-        - Database persistence (mock for testing)
+        - 90-day transition count for STIG+ validation (≤30 transitions),
+          kept per symbol/interval in a rolling window (amortized O(1))
+        - Write-behind database persistence: records and transitions are
+          buffered and flushed in batched upserts
+        - Recovery of in-memory state from the database at startup
         - Ed25519 signatures on all records
     """
 
     # Configuration constants
     C2_MAX_PERSISTENCE_DAYS = 30.0  # Days for C2 = 1.0
     TRANSITION_LIMIT_90D = 30  # Maximum transitions per 90 days (STIG+ Tier-4)
+    TRANSITION_WINDOW_DAYS = 90
 
-    def __init__(self, use_mock_storage: bool = True):
+    def __init__(self, use_mock_storage: bool = True,
+                 database: Optional['PersistenceDatabase'] = None,
+                 flush_batch_size: int = 1000,
+                 recover: bool = True):
         """
         Initialize persistence tracker.
 
         Args:
             use_mock_storage: If True, use in-memory storage (testing)
                              If False, use database storage (production)
+            database: Connected PersistenceDatabase for write-behind storage
+            flush_batch_size: Buffered records + transitions that trigger a flush
+            recover: Rebuild state from the database before tracking
         """
         self.use_mock_storage = use_mock_storage
+        self.database = database
+        self.flush_batch_size = flush_batch_size
 
         # In-memory storage (mock mode)
         self._persistence_state: Dict[str, PersistenceRecord] = {}  # key: "symbol:interval"
         self._transition_history: List[RegimeTransition] = []
 
+        # Transition timestamps per key, oldest first, for the rolling 90-day counts
+        self._recent_transitions: Dict[str, Deque[datetime]] = {}
+
+        # Write-behind buffers: keys of changed records (insertion-ordered) and new transitions
+        self._dirty_keys: Dict[str, None] = {}
+        self._pending_transitions: List[RegimeTransition] = []
+
         # Statistics
         self.total_updates = 0
         self.total_transitions = 0
+        self.flush_count = 0
+        self.recovered_records = 0
+
+        if database is not None and recover:
+            self.recover_from_database()
 
         logger.info(f"STIGPersistenceTracker initialized (mock_storage={use_mock_storage})")
 
@@ -199,16 +226,103 @@ class STIGPersistenceTracker:
 
     def _count_recent_transitions(self, symbol: str, interval: str, days: int = 90) -> int:
         """Count regime transitions in the last N days."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=days)
         key = self._get_key(symbol, interval)
 
-        count = 0
-        for transition in self._transition_history:
-            if (self._get_key(transition.symbol, transition.interval) == key and
-                transition.transition_timestamp > cutoff):
-                count += 1
+        if days > self.TRANSITION_WINDOW_DAYS:
+            # Beyond the rolling window: scan the full history
+            return sum(1 for t in self._transition_history
+                       if self._get_key(t.symbol, t.interval) == key and t.transition_timestamp > cutoff)
+
+        recent = self._recent_transitions.get(key)
+        if not recent:
+            return 0
+
+        # Drop what has left the rolling window, then count what is newer than the cutoff
+        window_cutoff = now - timedelta(days=self.TRANSITION_WINDOW_DAYS)
+        while recent and recent[0] <= window_cutoff:
+            recent.popleft()
+        return len(recent) - bisect.bisect_right(recent, cutoff)
+
+    def _add_recent_transition(self, key: str, timestamp: datetime):
+        """Add a transition time to the key's rolling window, keeping it sorted."""
+        recent = self._recent_transitions.setdefault(key, deque())
+        if not recent or recent[-1] <= timestamp:
+            recent.append(timestamp)
+        else:
+            # backfilled out of order (rare)
+            recent.insert(bisect.bisect_right(recent, timestamp), timestamp)
+
+    def _mark_dirty(self, key: str, transition: Optional[RegimeTransition] = None):
+        """Queue a changed record (and new transition) for the next flush."""
+        if self.database is None:
+            return
+        self._dirty_keys[key] = None
+        if transition is not None:
+            self._pending_transitions.append(transition)
+        if len(self._dirty_keys) + len(self._pending_transitions) >= self.flush_batch_size:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write buffered transitions and records to the database in batches.
+
+        Buffers are kept on failure and retried by the next flush; both
+        writes are idempotent upserts.
+
+        Returns:
+            True if nothing was pending or everything was written
+        """
+        if self.database is None or not (self._dirty_keys or self._pending_transitions):
+            return True
+
+        if self._pending_transitions:
+            if not self.database.save_transitions(self._pending_transitions):
+                return False
+            self._pending_transitions = []
+
+        records = [self._persistence_state[key] for key in self._dirty_keys]
+        if not self.database.save_persistence_records(records):
+            return False
+        self._dirty_keys = {}
 
-        return count
+        self.flush_count += 1
+        return True
+
+    def close(self):
+        """Flush buffered writes."""
+        if not self.flush():
+            logger.error(
+                f"Unflushed persistence writes: {len(self._dirty_keys)} records, "
+                f"{len(self._pending_transitions)} transitions"
+            )
+
+    def recover_from_database(self) -> int:
+        """
+        Rebuild in-memory state from the database.
+
+        Loads every current persistence record and the transitions of the
+        last 90 days (history and rolling counts).
+
+        Returns:
+            Number of persistence records recovered
+        """
+        records = self.database.load_persistence_records()
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.TRANSITION_WINDOW_DAYS)
+        transitions = sorted(self.database.load_transitions(since=cutoff),
+                             key=lambda t: t.transition_timestamp)
+
+        self._persistence_state = {self._get_key(r.symbol, r.interval): r for r in records}
+        self._transition_history = transitions
+        self._recent_transitions = {}
+        for transition in transitions:
+            self._add_recent_transition(self._get_key(transition.symbol, transition.interval),
+                                        transition.transition_timestamp)
+
+        self.recovered_records = len(records)
+        logger.info(f"Recovered {len(records)} persistence records, {len(transitions)} transitions")
+        return len(records)
 
     def initialize_regime(
         self,
@@ -257,6 +371,7 @@ class STIGPersistenceTracker:
         # Store
         self._persistence_state[key] = record
         self.total_updates += 1
+        self._mark_dirty(key)
 
         logger.info(f"Initialized persistence tracking: {symbol} ({interval}) = {regime.value}")
         return record
@@ -337,6 +452,7 @@ class STIGPersistenceTracker:
         # Store
         self._persistence_state[key] = current_record
         self.total_updates += 1
+        self._mark_dirty(key, transition)
 
         return current_record, transition
 
@@ -375,6 +491,9 @@ class STIGPersistenceTracker:
 
         # Store in history
         self._transition_history.append(transition)
+        self._add_recent_transition(
+            self._get_key(transition.symbol, transition.interval), timestamp
+        )
 
         return transition
 
@@ -491,6 +610,10 @@ class STIGPersistenceTracker:
             'total_updates': self.total_updates,
             'total_transitions': self.total_transitions,
             'transition_history_size': len(self._transition_history),
+            'pending_records': len(self._dirty_keys),
+            'pending_transitions': len(self._pending_transitions),
+            'flush_count': self.flush_count,
+            'recovered_records': self.recovered_records,
             'symbols': list(self._persistence_state.keys())
         }
 
@@ -512,6 +635,16 @@ class PersistenceDatabase:
     - stig_regime_transitions: Transition history
     """
 
+    # Rows per statement for batched upserts
+    PAGE_SIZE = 500
+
+    _RECORD_COLUMNS = ('symbol', 'interval', 'current_regime', 'regime_start_timestamp',
+                       'persistence_days', 'last_updated', 'transition_count_90d',
+                       'c2_value', 'signature_hash')
+    _TRANSITION_COLUMNS = ('transition_id', 'symbol', 'interval', 'previous_regime',
+                           'new_regime', 'transition_timestamp', 'previous_regime_start',
+                           'previous_regime_duration_days', 'confidence', 'signature_hash')
+
     def __init__(self, connection_string: Optional[str] = None):
         """Initialize database connection."""
         self.connection_string = connection_string
@@ -528,19 +661,23 @@ class PersistenceDatabase:
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
 
-    def save_persistence_record(self, record: PersistenceRecord) -> bool:
-        """Save persistence record to database."""
+    def save_persistence_records(self, records: List[PersistenceRecord]) -> bool:
+        """Upsert persistence records (one row per symbol/interval) in batches."""
         if not self.conn:
             return False
+        if not records:
+            return True
+
+        from psycopg2.extras import execute_values
 
         try:
             with self.conn.cursor() as cur:
-                cur.execute("""
+                execute_values(cur, """
                     INSERT INTO fhq_phase3.stig_regime_persistence (
                         symbol, interval, current_regime, regime_start_timestamp,
                         persistence_days, last_updated, transition_count_90d,
                         c2_value, signature_hash
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ) VALUES %s
                     ON CONFLICT (symbol, interval) DO UPDATE SET
                         current_regime = EXCLUDED.current_regime,
                         regime_start_timestamp = EXCLUDED.regime_start_timestamp,
@@ -549,46 +686,114 @@ class PersistenceDatabase:
                         transition_count_90d = EXCLUDED.transition_count_90d,
                         c2_value = EXCLUDED.c2_value,
                         signature_hash = EXCLUDED.signature_hash
-                """, (
+                """, [(
                     record.symbol, record.interval, record.current_regime.value,
                     record.regime_start_timestamp, record.persistence_days,
                     record.last_updated, record.transition_count_90d,
                     record.c2_value, record.signature_hash
-                ))
+                ) for record in records], page_size=self.PAGE_SIZE)
             self.conn.commit()
             return True
         except Exception as e:
-            logger.error(f"Failed to save persistence record: {e}")
+            logger.error(f"Failed to save {len(records)} persistence records: {e}")
             self.conn.rollback()
             return False
 
-    def save_transition(self, transition: RegimeTransition) -> bool:
-        """Save transition record to database."""
+    def save_transitions(self, transitions: List[RegimeTransition]) -> bool:
+        """Insert transition records in batches (already stored ones are skipped)."""
         if not self.conn:
             return False
+        if not transitions:
+            return True
+
+        from psycopg2.extras import execute_values
 
         try:
             with self.conn.cursor() as cur:
-                cur.execute("""
+                execute_values(cur, """
                     INSERT INTO fhq_phase3.stig_regime_transitions (
                         transition_id, symbol, interval, previous_regime,
                         new_regime, transition_timestamp, previous_regime_start,
                         previous_regime_duration_days, confidence, signature_hash
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+                    ) VALUES %s
+                    ON CONFLICT DO NOTHING
+                """, [(
                     transition.transition_id, transition.symbol, transition.interval,
                     transition.previous_regime.value, transition.new_regime.value,
                     transition.transition_timestamp, transition.previous_regime_start,
                     transition.previous_regime_duration_days, transition.confidence,
                     transition.signature_hash
-                ))
+                ) for transition in transitions], page_size=self.PAGE_SIZE)
             self.conn.commit()
             return True
         except Exception as e:
-            logger.error(f"Failed to save transition: {e}")
+            logger.error(f"Failed to save {len(transitions)} transitions: {e}")
             self.conn.rollback()
             return False
 
+    def save_persistence_record(self, record: PersistenceRecord) -> bool:
+        """Save persistence record to database."""
+        return self.save_persistence_records([record])
+
+    def save_transition(self, transition: RegimeTransition) -> bool:
+        """Save transition record to database."""
+        return self.save_transitions([transition])
+
+    def load_persistence_records(self) -> List[PersistenceRecord]:
+        """Load every current persistence record."""
+        if not self.conn:
+            return []
+
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {', '.join(self._RECORD_COLUMNS)}
+                    FROM fhq_phase3.stig_regime_persistence
+                """)
+                rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to load persistence records: {e}")
+            self.conn.rollback()
+            return []
+
+        records = []
+        for row in rows:
+            data = dict(zip(self._RECORD_COLUMNS, row))
+            data['current_regime'] = RegimeLabel(data['current_regime'])
+            data['persistence_days'] = float(data['persistence_days'])
+            data['c2_value'] = float(data['c2_value'])
+            records.append(PersistenceRecord(**data))
+        return records
+
+    def load_transitions(self, since: datetime) -> List[RegimeTransition]:
+        """Load transitions after since, oldest first."""
+        if not self.conn:
+            return []
+
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {', '.join(self._TRANSITION_COLUMNS)}
+                    FROM fhq_phase3.stig_regime_transitions
+                    WHERE transition_timestamp > %s
+                    ORDER BY transition_timestamp
+                """, (since,))
+                rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to load transitions since {since}: {e}")
+            self.conn.rollback()
+            return []
+
+        transitions = []
+        for row in rows:
+            data = dict(zip(self._TRANSITION_COLUMNS, row))
+            data['previous_regime'] = RegimeLabel(data['previous_regime'])
+            data['new_regime'] = RegimeLabel(data['new_regime'])
+            data['previous_regime_duration_days'] = float(data['previous_regime_duration_days'])
+            data['confidence'] = float(data['confidence'])
+            transitions.append(RegimeTransition(**data))
+        return transitions
+
 
 # =============================================================================
 # INTEGRATION WITH CDS ENGINE
@@ -0,0 +1,199 @@
+"""
+FINN+ Regime Classifier — Vectorized and Incremental Classification Tests
+Phase 3: Week 1 — Regime Classification
+
+Test Coverage:
+- classify_timeseries_with_persistence matches the per-row reference loop
+  exactly on the stress bundle and on random features (NaN and invalid
+  rows, every regime transition, several persistence windows)
+- Persistence state resumes across chunks exactly like a single pass
+- IncrementalRegimeClassifier features match compute_features within
+  floating-point rounding; regimes match exactly
+- Incremental state survives a JSON round trip
+"""
+
+import json
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from finn_regime_classifier import (
+    IncrementalRegimeClassifier,
+    PersistenceState,
+    RegimeClassifier
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def reference_classify(classifier, features, persistence_days=5):
+    """The per-row loop classify_timeseries_with_persistence replaced."""
+    results = []
+    current_regime, candidate_regime, candidate_count = 1, 1, 0
+    for idx in features.index:
+        row = features.loc[idx]
+        is_valid, _ = classifier.validate_features(row)
+        if not is_valid:
+            results.append({'regime_state': current_regime,
+                            'regime_label': classifier.REGIME_LABELS[current_regime],
+                            'raw_regime': current_regime, 'candidate_count': 0, 'is_valid': False})
+            continue
+        raw_regime = classifier._classify_with_hysteresis(row, current_regime)
+        if raw_regime == current_regime:
+            candidate_regime = current_regime
+            candidate_count = 0
+        elif raw_regime == candidate_regime:
+            candidate_count += 1
+            if candidate_count >= persistence_days:
+                current_regime = candidate_regime
+                candidate_count = 0
+        else:
+            candidate_regime = raw_regime
+            candidate_count = 1
+        results.append({'regime_state': current_regime,
+                        'regime_label': classifier.REGIME_LABELS[current_regime],
+                        'raw_regime': raw_regime, 'candidate_count': candidate_count, 'is_valid': True})
+    return pd.DataFrame(results, index=features.index)
+
+
+def random_features(rng, n):
+    """Z-scores around the hysteresis thresholds, with NaN and invalid rows."""
+    values = rng.normal(0, 1.2, (n, 7))
+    # long-ish trends so confirmed transitions actually happen
+    values[:, 0] += np.repeat(rng.choice([-1.5, 0.0, 1.5], n // 20 + 1), 20)[:n]
+    values[rng.random((n, 7)) < 0.08] = np.nan
+    values[rng.random(n) < 0.03, :4] = np.nan                  # fewer than 5 features
+    return pd.DataFrame(values, index=pd.date_range('2015-01-01', periods=n),
+                        columns=RegimeClassifier.FEATURE_NAMES)
+
+
+def random_walk(rng, n, flat=None):
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0002, 0.02, n)))
+    if flat:
+        close[flat[0]:flat[1]] = close[flat[0] - 1]
+    return pd.DataFrame({'close': close}, index=pd.date_range('2018-01-01', periods=n))
+
+
+def load_stress_bundle():
+    path = os.path.join(SCRIPT_DIR, 'TEST_DATA_V1.0.csv')
+    if not os.path.exists(path):
+        return None
+    df = pd.read_csv(path)
+    df['date'] = pd.to_datetime(df['date'])
+    return df.set_index('date')
+
+
+class TestVectorizedPersistence(unittest.TestCase):
+    """The array-based pass must reproduce the per-row loop exactly."""
+
+    def setUp(self):
+        self.classifier = RegimeClassifier()
+
+    def test_random_features_match_reference(self):
+        rng = np.random.default_rng(43)
+        transitions = set()
+        for persistence_days in (1, 2, 5, 10):
+            features = random_features(rng, 600)
+            result = self.classifier.classify_timeseries_with_persistence(features, persistence_days)
+            expected = reference_classify(self.classifier, features, persistence_days)
+            pd.testing.assert_frame_equal(result, expected)
+            states = result['regime_state'].to_numpy()
+            transitions.update(zip(states[:-1].tolist(), states[1:].tolist()))
+            self.assertFalse(result['is_valid'].all())
+        # every regime change is exercised
+        self.assertTrue({(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)} <= transitions)
+
+    def test_stress_bundle_matches_reference(self):
+        prices = load_stress_bundle()
+        if prices is None:
+            self.skipTest("Stress Bundle V1.0 (TEST_DATA_V1.0.csv) not found")
+        features = self.classifier.compute_features(prices)
+        pd.testing.assert_frame_equal(
+            self.classifier.classify_timeseries_with_persistence(features),
+            reference_classify(self.classifier, features)
+        )
+
+    def test_chunks_resume_like_single_pass(self):
+        features = random_features(np.random.default_rng(8), 500)
+        single = self.classifier.classify_timeseries_with_persistence(features)
+
+        state = PersistenceState()
+        chunks = [self.classifier.classify_timeseries_with_persistence(features.iloc[start:stop], state=state)
+                  for start, stop in ((0, 1), (1, 97), (97, 97), (97, 350), (350, 500))]
+
+        pd.testing.assert_frame_equal(pd.concat([c for c in chunks if len(c)]), single)
+        self.assertEqual(state.current_regime, single['regime_state'].iloc[-1])
+
+    def test_empty_features(self):
+        features = random_features(np.random.default_rng(0), 10).iloc[:0]
+        self.assertEqual(len(self.classifier.classify_timeseries_with_persistence(features)), 0)
+
+
+class TestIncrementalRegimeClassifier(unittest.TestCase):
+    """Appending bars from saved state must match a full recomputation."""
+
+    def setUp(self):
+        self.classifier = RegimeClassifier()
+
+    def assert_features_close(self, incremental, batch, rtol):
+        self.assertEqual(list(incremental.columns), list(batch.columns))
+        self.assertTrue(incremental.index.equals(batch.index))
+        np.testing.assert_allclose(incremental.to_numpy(), batch.to_numpy(), rtol=rtol, atol=rtol)
+
+    def append_in_chunks(self, prices, chunk, persistence_days=5):
+        incremental = IncrementalRegimeClassifier(persistence_days)
+        features, regimes = [], []
+        for start in range(0, len(prices), chunk):
+            state = json.loads(json.dumps(incremental.get_state()))
+            incremental = IncrementalRegimeClassifier.from_state(state)
+            features.append(incremental.update_features(prices.iloc[start:start + chunk]))
+            regimes.append(self.classifier.classify_timeseries_with_persistence(
+                features[-1], persistence_days, state=incremental.persistence))
+        return pd.concat(features), pd.concat(regimes), incremental
+
+    def test_random_walk_matches_batch(self):
+        prices = random_walk(np.random.default_rng(3), 1200)
+        batch_features = self.classifier.compute_features(prices)
+
+        features, regimes, incremental = self.append_in_chunks(prices, chunk=97)
+
+        self.assert_features_close(features, batch_features, rtol=1e-9)
+        pd.testing.assert_frame_equal(
+            regimes, self.classifier.classify_timeseries_with_persistence(batch_features))
+        self.assertEqual(incremental.bar_count, 1200)
+
+    def test_flat_prices_match_batch(self):
+        # pandas' running sums leave residue after a flat stretch; the direct
+        # window computation does not, so allow a looser tolerance there
+        prices = random_walk(np.random.default_rng(4), 700, flat=(300, 340))
+        batch_features = self.classifier.compute_features(prices)
+
+        features, regimes, _ = self.append_in_chunks(prices, chunk=50)
+
+        self.assert_features_close(features, batch_features, rtol=1e-6)
+        pd.testing.assert_frame_equal(
+            regimes, self.classifier.classify_timeseries_with_persistence(batch_features))
+
+    def test_stress_bundle_bar_by_bar(self):
+        prices = load_stress_bundle()
+        if prices is None:
+            self.skipTest("Stress Bundle V1.0 (TEST_DATA_V1.0.csv) not found")
+        batch_features = self.classifier.compute_features(prices)
+        expected = self.classifier.classify_timeseries_with_persistence(batch_features)
+
+        incremental = IncrementalRegimeClassifier()
+        regimes = pd.concat([incremental.append(prices.iloc[i:i + 1]) for i in range(len(prices))])
+
+        pd.testing.assert_frame_equal(regimes, expected)
+
+    def test_append_empty(self):
+        incremental = IncrementalRegimeClassifier()
+        result = incremental.append(random_walk(np.random.default_rng(0), 5).iloc[:0])
+        self.assertEqual(len(result), 0)
+        self.assertEqual(incremental.bar_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
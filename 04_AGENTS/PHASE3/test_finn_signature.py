@@ -0,0 +1,252 @@
+"""
+FINN+ Ed25519 Signature Module — Batched Signing and Verification Tests
+Phase 3: Week 2 — ADR-008 Compliance
+
+Test Coverage:
+- canonical_json is byte-identical to json.dumps(sort_keys=True) in all
+  variants used for signing and hashing
+- Signatures from CDSEngine, FINNTier2Engine, Ed25519Signer and
+  SigningService are byte-identical to the previous inline signing
+- SigningService: bounded batches, concurrent submitters, close semantics
+- sign_regime_predictions equals sign_regime_prediction per payload
+- verify_many / CDSEngine.verify_signatures / verify_predictions match
+  one-at-a-time verification, including tampered and malformed entries
+- Verified-digest LRU: hits, eviction, failures never cached
+"""
+
+import json
+import threading
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from cds_engine import CDSComponents, CDSEngine
+from finn_signature import (
+    VERIFIED_DIGESTS,
+    Ed25519Signer,
+    SigningService,
+    VerifiedDigestCache,
+    canonical_json,
+    sign_regime_prediction,
+    sign_regime_predictions,
+    verify_ed25519,
+    verify_many,
+    verify_predictions
+)
+from finn_tier2_engine import ConflictSummarizer, FINNTier2Engine, Tier2Input
+
+
+def random_payload(rng, depth=0):
+    """Nested JSON-able payload with the value types predictions carry."""
+    payload = {}
+    for i in range(int(rng.integers(1, 8))):
+        key = rng.choice(['regime', 'confidence', 'z', 'Ä', 'b', 'label', 'ts', 'nested']) + str(i)
+        kind = int(rng.integers(0, 7 if depth < 2 else 6))
+        if kind == 6:
+            payload[key] = random_payload(rng, depth + 1)
+            continue
+        payload[key] = [
+            float(rng.normal()) * 10 ** int(rng.integers(-8, 8)),
+            int(rng.integers(-10**12, 10**12)),
+            bool(rng.random() < 0.5),
+            None,
+            'BULL ✅ "quoted" \\ tab\t',
+            [float(rng.random()), 'x', None],
+        ][kind]
+    return payload
+
+
+def prediction(i, regime='BULL'):
+    return {
+        'regime_label': regime, 'regime_state': 2, 'confidence': 0.5 + i / 1000,
+        'prob_bear': 0.1, 'prob_neutral': 0.2, 'prob_bull': 0.7,
+        'timestamp': f'2024-01-01T00:00:{i % 60:02d}', 'return_z': 0.01 * i,
+        'is_valid': True, 'validation_reason': 'Valid'
+    }
+
+
+def legacy_sign(signer, payload, **dumps_options):
+    """The inline signing every engine used before canonical_json."""
+    return signer.private_key.sign(json.dumps(payload, sort_keys=True, **dumps_options).encode('utf-8')).hex()
+
+
+class TestCanonicalJson(unittest.TestCase):
+
+    def test_byte_identical_to_json_dumps(self):
+        rng = np.random.default_rng(45)
+        for _ in range(300):
+            payload = random_payload(rng)
+            self.assertEqual(canonical_json(payload), json.dumps(payload, sort_keys=True).encode('utf-8'))
+            self.assertEqual(canonical_json(payload, compact=True),
+                             json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+    def test_default_str_and_special_floats(self):
+        payload = {'when': datetime(2024, 5, 1, 12, 30), 'nan': float('nan'), 'inf': float('-inf'), 'z': 1e-300}
+        self.assertEqual(canonical_json(payload, default=str),
+                         json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+        with self.assertRaises(TypeError):
+            canonical_json(payload)
+
+
+class TestByteCompatibleSignatures(unittest.TestCase):
+
+    def test_cds_engine(self):
+        engine = CDSEngine()
+        result = engine.compute_cds(CDSComponents(0.7, 0.5, 0.9, 0.6, 0.8, 0.4))
+        payload = {'cds_value': result.cds_value, 'components': result.components,
+                   'weights_hash': result.weights_hash, 'timestamp': result.timestamp.isoformat()}
+        self.assertEqual(result.signature_hex, legacy_sign(engine.signer, payload))
+        self.assertTrue(CDSEngine.verify_signature(result))
+
+    def test_tier2_engine(self):
+        engine = FINNTier2Engine()
+        result = ConflictSummarizer().compute_coherence_deterministic(Tier2Input(
+            regime_label='BULL', regime_confidence=0.7, return_z=1.2, volatility_z=0.3,
+            drawdown_z=-0.1, macd_diff_z=0.8, price_change_pct=4.2, current_drawdown_pct=-1.0))
+        signature_hex, _ = engine._sign_result(result)
+        payload = {'coherence_score': result.coherence_score, 'summary': result.summary,
+                   'llm_cost_usd': result.llm_cost_usd, 'timestamp': result.timestamp.isoformat()}
+        self.assertEqual(signature_hex, legacy_sign(engine.signer, payload))
+
+    def test_prediction_signer_and_service(self):
+        signer = Ed25519Signer()
+        payloads = [prediction(i) for i in range(20)]
+        expected = [legacy_sign(signer, p, separators=(',', ':')) for p in payloads]
+
+        self.assertEqual([signer.sign_prediction(p)[0] for p in payloads], expected)
+        with SigningService(signer, max_batch=4) as service:
+            signed = sign_regime_predictions(payloads, signer, service=service)
+        self.assertEqual([s.signature_hex for s in signed], expected)
+
+
+class TestSigningService(unittest.TestCase):
+
+    def test_batches_are_bounded_and_results_ordered(self):
+        signer = Ed25519Signer()
+        payloads = [canonical_json(prediction(i)) for i in range(200)]
+        with SigningService(signer, max_batch=16) as service:
+            signatures = service.sign_many(payloads)
+            stats = service.get_statistics()
+
+        self.assertEqual([s for s, _ in signatures], [signer.private_key.sign(p).hex() for p in payloads])
+        self.assertEqual(stats['signed_count'], 200)
+        self.assertLessEqual(stats['largest_batch'], 16)
+        self.assertGreaterEqual(stats['batch_count'], 200 // 16)
+
+    def test_concurrent_submitters(self):
+        signer = Ed25519Signer()
+        results = {}
+        with SigningService(signer, max_batch=8, max_pending=4) as service:
+            def produce(worker):
+                futures = [(i, service.submit(canonical_json(prediction(i + 100 * worker)))) for i in range(50)]
+                results[worker] = [(i, f.result(timeout=10)) for i, f in futures]
+
+            threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for worker, signed in results.items():
+            for i, (signature_hex, public_key_hex) in signed:
+                self.assertTrue(verify_ed25519(canonical_json(prediction(i + 100 * worker)),
+                                               signature_hex, public_key_hex, cache=None))
+
+    def test_close_drains_queue_and_rejects_new_work(self):
+        service = SigningService(Ed25519Signer(), max_batch=2)
+        futures = [service.submit(canonical_json(prediction(i))) for i in range(10)]
+        service.close()
+        self.assertTrue(all(f.done() and f.exception() is None for f in futures))
+        with self.assertRaises(RuntimeError):
+            service.submit(b'{}')
+        service.close()                                    # idempotent
+
+    def test_service_must_use_signer_key(self):
+        with SigningService(Ed25519Signer()) as service:
+            with self.assertRaises(ValueError):
+                sign_regime_predictions([prediction(0)], Ed25519Signer(), service=service)
+
+
+class TestBatchSigningAndVerification(unittest.TestCase):
+
+    def setUp(self):
+        VERIFIED_DIGESTS.clear()
+
+    def test_sign_regime_predictions_matches_single(self):
+        signer = Ed25519Signer()
+        payloads = [prediction(i, regime) for i, regime in enumerate(['BULL', 'BEAR', 'NEUTRAL'] * 5)]
+        batch = sign_regime_predictions(payloads, signer)
+        single = [sign_regime_prediction(p, signer) for p in payloads]
+        self.assertEqual(batch, single)
+        self.assertEqual(sign_regime_predictions([], signer), [])
+
+    def test_verify_many_matches_one_at_a_time(self):
+        signer = Ed25519Signer()
+        items = []
+        for i in range(40):
+            payload = canonical_json(prediction(i), compact=True)
+            signature_hex = signer.private_key.sign(payload).hex()
+            public_key_hex = signer.get_public_key_hex()
+            if i % 5 == 1:
+                payload = payload.replace(b'BULL', b'BEAR')       # tampered
+            elif i % 5 == 2:
+                signature_hex = signature_hex[:-2] + 'zz'          # malformed hex
+            elif i % 5 == 3:
+                public_key_hex = Ed25519Signer().get_public_key_hex()
+            items.append((payload, signature_hex, public_key_hex))
+
+        expected = [i % 5 in (0, 4) for i in range(40)]
+        self.assertEqual(verify_many(items, max_workers=1, cache=None), expected)
+        self.assertEqual(verify_many(items, max_workers=4), expected)
+        self.assertEqual(verify_many(items, max_workers=4), expected)     # from the cache
+        self.assertEqual(len(VERIFIED_DIGESTS), expected.count(True))
+
+    def test_cds_verify_signatures(self):
+        engine = CDSEngine()
+        results = [engine.compute_cds(CDSComponents(0.5, 0.5, 0.9, 0.5, 0.5, 0.1 * i)) for i in range(1, 9)]
+        results[2].cds_value = 0.01                                  # tampered
+        results[5].signature_hex = None                              # unsigned
+        self.assertEqual(CDSEngine.verify_signatures(results),
+                         [CDSEngine.verify_signature(r) for r in results])
+        self.assertEqual(CDSEngine.verify_signatures(results).count(False), 2)
+
+    def test_verify_predictions(self):
+        payloads = [prediction(i) for i in range(6)]
+        signed = [dict(p, signature_hex=s.signature_hex, public_key_hex=s.public_key_hex)
+                  for p, s in zip(payloads, sign_regime_predictions(payloads, Ed25519Signer()))]
+        signed[1]['confidence'] = 0.99                               # tampered
+        signed[3]['timestamp'] = datetime(2024, 1, 1)                # not JSON-serializable
+        del signed[4]['public_key_hex']
+        self.assertEqual(verify_predictions(signed), [True, False, True, False, False, True])
+
+
+class TestVerifiedDigestCache(unittest.TestCase):
+
+    def test_hits_and_failures(self):
+        cache = VerifiedDigestCache()
+        signer = Ed25519Signer()
+        payload = canonical_json(prediction(1))
+        signature_hex = signer.private_key.sign(payload).hex()
+
+        self.assertTrue(verify_ed25519(payload, signature_hex, signer.get_public_key_hex(), cache=cache))
+        self.assertTrue(verify_ed25519(payload, signature_hex, signer.get_public_key_hex(), cache=cache))
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+        for _ in range(2):
+            self.assertFalse(verify_ed25519(payload + b' ', signature_hex, signer.get_public_key_hex(), cache=cache))
+        self.assertEqual(len(cache), 1)                              # failures never cached
+
+    def test_lru_eviction(self):
+        cache = VerifiedDigestCache(maxsize=3)
+        digests = [bytes([i]) * 32 for i in range(4)]
+        for digest in digests[:3]:
+            cache.add(digest)
+        self.assertTrue(cache.contains(digests[0]))                  # now most recent
+        cache.add(digests[3])
+        self.assertFalse(cache.contains(digests[1]))
+        self.assertTrue(all(cache.contains(d) for d in (digests[0], digests[2], digests[3])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+"""
+FINN+ Tier-2 Engine — Result Cache and Single-Flight Tests
+Phase 3: Week 3 — LARS Directive 6 (Priority 1)
+
+Test Coverage:
+- Tier2ResultCache: LRU bound, TTL expiry without lookups, SQLite tier
+  surviving a restart, expired rows never served, entries promoted from
+  disk expiring in expiry order
+- Single-flight: concurrent identical requests make one LLM call (mock
+  client with artificial latency); distinct requests are not merged
+- Hit, miss, single-flight and cost-saved accounting in get_statistics
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from finn_signature import verify_ed25519, canonical_json
+from finn_tier2_engine import (
+    FINNTier2Engine,
+    MockLLMClient,
+    Tier2Input,
+    Tier2Result,
+    Tier2ResultCache
+)
+
+COST = MockLLMClient().mock_cost_per_call
+
+
+class FakeClock:
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_input(return_z=1.2, regime='BULL'):
+    return Tier2Input(regime_label=regime, regime_confidence=0.75, return_z=return_z, volatility_z=0.6,
+                      drawdown_z=-0.3, macd_diff_z=0.8, price_change_pct=15.0, current_drawdown_pct=-2.0)
+
+
+def make_result(score):
+    return Tier2Result(coherence_score=score, summary=f"score {score}", llm_cost_usd=COST, llm_api_calls=1)
+
+
+def run_concurrently(target, args_list):
+    results = [None] * len(args_list)
+
+    def worker(i, args):
+        results[i] = target(*args)
+
+    threads = [threading.Thread(target=worker, args=(i, args)) for i, args in enumerate(args_list)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class FailingLLMClient(MockLLMClient):
+
+    def generate(self, prompt):
+        super().generate(prompt)
+        raise ConnectionError("upstream timeout")
+
+
+class TestTier2ResultCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = Tier2ResultCache(maxsize=2)
+        for key, score in (('a', 0.1), ('b', 0.2)):
+            cache.put(key, make_result(score))
+        self.assertIsNotNone(cache.get('a'))                    # 'b' is now least recent
+        cache.put('c', make_result(0.3))
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([cache.get(k).coherence_score for k in ('a', 'c')], [0.1, 0.3])
+        stats = cache.get_statistics()
+        self.assertEqual((stats['size'], stats['evictions'], stats['hits'], stats['misses']), (2, 1, 3, 1))
+
+    def test_expired_entries_age_out_without_lookup(self):
+        clock = FakeClock()
+        cache = Tier2ResultCache(ttl_seconds=300, clock=clock)
+        for i in range(5):
+            cache.put(f'old{i}', make_result(0.5))
+            clock.now += 10
+        clock.now += 250                                        # old0 is exactly 300s old
+        cache.put('new', make_result(0.6))
+
+        self.assertEqual(len(cache), 5)
+        clock.now += 40
+        self.assertIsNone(cache.get('old4'))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get_statistics()['expirations'], 5)
+
+    def test_sqlite_tier_survives_restart(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tier2.sqlite')
+            cache = Tier2ResultCache(ttl_seconds=300, path=path, clock=clock)
+            cache.put('live', make_result(0.7))
+            clock.now += 200
+            cache.put('later', make_result(0.8))
+            cache.close()
+
+            clock.now += 150                                    # 'live' expired, 'later' not
+            reopened = Tier2ResultCache(ttl_seconds=300, path=path, clock=clock)
+            self.assertIsNone(reopened.get('live'))
+            restored = reopened.get('later')
+            self.assertEqual((restored.coherence_score, restored.summary, restored.llm_cost_usd),
+                             (0.8, "score 0.8", COST))
+            self.assertEqual(reopened.get_statistics()['disk_hits'], 1)
+            self.assertIsNotNone(reopened.get('later'))        # promoted to memory
+            self.assertEqual(reopened.get_statistics()['disk_hits'], 1)
+            reopened.close()
+
+
+    def test_promoted_entry_expires_in_order(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Tier2ResultCache(maxsize=2, ttl_seconds=300, path=os.path.join(tmp, 'tier2.sqlite'),
+                                     clock=clock)
+            for key in ('a', 'b', 'c'):                         # 'a' evicted from memory
+                cache.put(key, make_result(0.5))
+                clock.now += 90
+            self.assertIsNotNone(cache.get('a'))                # promoted from disk, expires first
+            self.assertEqual(cache.get_statistics()['disk_hits'], 1)
+
+            clock.now += 31                                     # 'a' is 301s old, 'c' 121s
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.get_statistics()['expirations'], 1)
+            cache.close()
+
+
+class TestEngineCaching(unittest.TestCase):
+
+    def test_persistent_cache_across_engines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tier2.sqlite')
+            first = FINNTier2Engine(use_production_mode=True, cache_path=path)
+            original = first.compute_coherence(make_input())
+            first.cache.close()
+
+            client = MockLLMClient()
+            second = FINNTier2Engine(llm_client=client, use_production_mode=True, cache_path=path)
+            restored = second.compute_coherence(make_input())
+            second.cache.close()
+
+        self.assertEqual(client.request_count, 0)
+        self.assertEqual(restored.to_dict(), original.to_dict())
+        payload = {'coherence_score': restored.coherence_score, 'summary': restored.summary,
+                   'llm_cost_usd': restored.llm_cost_usd, 'timestamp': restored.timestamp.isoformat()}
+        self.assertTrue(verify_ed25519(canonical_json(payload), restored.signature_hex,
+                                       restored.public_key_hex, cache=None))
+        self.assertAlmostEqual(second.get_statistics()['cost_saved_usd'], COST)
+
+    def test_concurrent_identical_requests_make_one_call(self):
+        client = MockLLMClient(latency_seconds=0.2)
+        engine = FINNTier2Engine(llm_client=client, use_production_mode=True)
+
+        results = run_concurrently(engine.compute_coherence, [(make_input(),)] * 8)
+        stats = engine.get_statistics()
+
+        self.assertEqual(client.request_count, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(stats['single_flight_joins'] + stats['cache_hits'], 7)
+        self.assertAlmostEqual(stats['cost_saved_usd'], 7 * COST)
+        self.assertAlmostEqual(stats['daily_cost_usd'], COST)
+        self.assertEqual(stats['calls_last_hour'], 1)
+
+        engine.compute_coherence(make_input())
+        stats = engine.get_statistics()
+        self.assertAlmostEqual(stats['cost_saved_usd'], 8 * COST)
+        self.assertEqual(client.request_count, 1)
+
+    def test_distinct_requests_are_not_merged(self):
+        client = MockLLMClient(latency_seconds=0.1)
+        engine = FINNTier2Engine(llm_client=client, use_production_mode=True)
+        inputs = [(make_input(return_z=z),) for z in (0.5, 1.0, 1.5)] * 3
+
+        results = run_concurrently(engine.compute_coherence, inputs)
+        stats = engine.get_statistics()
+
+        self.assertEqual(client.request_count, 3)
+        self.assertEqual(len({id(r) for r in results}), 3)
+        self.assertEqual(stats['cache_misses'] - stats['single_flight_joins'], 3)
+        self.assertAlmostEqual(stats['daily_cost_usd'], 3 * COST)
+        self.assertAlmostEqual(stats['cost_saved_usd'], 6 * COST)
+
+    def test_failed_calls_are_shared_but_not_cached(self):
+        client = FailingLLMClient(latency_seconds=0.2)
+        engine = FINNTier2Engine(llm_client=client, use_production_mode=True)
+
+        results = run_concurrently(engine.compute_coherence, [(make_input(),)] * 4)
+        self.assertEqual(client.request_count, 1)
+        self.assertTrue(all(r.summary.startswith("ERROR") for r in results))
+        self.assertEqual(engine.get_statistics()['cache_size'], 0)
+
+        engine.compute_coherence(make_input())
+        self.assertEqual(client.request_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+LINE+ Data Quality Validation — Vectorized Validator Tests
+Phase 3: Week 2 — OHLCV Data Quality Gate
+
+Test Coverage:
+- Property tests: on randomized datasets (spikes, tiny and zero prices,
+  wide ranges, negative lows, zero/fractional volumes, duplicate and
+  out-of-order timestamps, gaps, incomplete bars, constant prices) the
+  column-mask checks produce exactly the issues, in the same order, as
+  the per-bar reference implementation below
+- Multi-interval validation in parallel matches serial validation
+"""
+
+import math
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from line_ohlcv_contracts import (
+    OHLCVBar,
+    OHLCVDataset,
+    OHLCVInterval,
+    validate_ohlcv_bar
+)
+from line_data_quality import (
+    DataQualityIssue,
+    DataQualitySeverity,
+    LINEDataQualityValidator,
+    validate_multi_interval_for_finn
+)
+
+
+class ReferenceValidator(LINEDataQualityValidator):
+    """The per-bar checks the vectorized validator replaced."""
+
+    def _validate_individual_bars(self, dataset, columns=None):
+        issues = []
+        for idx, bar in enumerate(dataset.bars):
+            is_valid, error = validate_ohlcv_bar(bar)
+            if not is_valid:
+                issues.append(DataQualityIssue(
+                    check_name="Bar Validation", severity=DataQualitySeverity.ERROR,
+                    message=error, bar_index=idx))
+        return issues
+
+    def _validate_price_sanity(self, dataset, columns=None):
+        issues = []
+        if dataset.get_bar_count() < 2:
+            return issues
+        closes = np.array([bar.close for bar in dataset.bars])
+        returns = np.diff(closes) / closes[:-1]
+        if len(returns) > 20:
+            return_mean = np.mean(returns)
+            return_std = np.std(returns)
+            if return_std > 0:
+                return_z = (returns - return_mean) / return_std
+                for spike_idx in np.where(np.abs(return_z) > self.price_spike_threshold)[0]:
+                    issues.append(DataQualityIssue(
+                        check_name="Price Spike Detection", severity=DataQualitySeverity.WARNING,
+                        message=f"Abnormal price change detected (z-score: {return_z[spike_idx]:.2f})",
+                        bar_index=spike_idx + 1, actual_value=returns[spike_idx] * 100,
+                        expected_range=f"within {self.price_spike_threshold}σ"))
+        for idx, bar in enumerate(dataset.bars):
+            if bar.close <= 0.01:
+                issues.append(DataQualityIssue(
+                    check_name="Price Sanity", severity=DataQualitySeverity.ERROR,
+                    message=f"Suspiciously low price: ${bar.close:.4f}",
+                    bar_index=idx, actual_value=bar.close))
+        for idx, bar in enumerate(dataset.bars):
+            mid_price = (bar.high + bar.low) / 2.0
+            if mid_price > 0:
+                range_pct = (bar.get_range() / mid_price) * 100
+                if range_pct > 50.0:
+                    issues.append(DataQualityIssue(
+                        check_name="Intrabar Range", severity=DataQualitySeverity.WARNING,
+                        message=f"Unusually wide intrabar range: {range_pct:.1f}%",
+                        bar_index=idx, actual_value=range_pct, expected_range="<50%"))
+        return issues
+
+    def _validate_volume_sanity(self, dataset, columns=None):
+        columns = {'volume': np.array([bar.volume for bar in dataset.bars])}
+        return super()._validate_volume_sanity(dataset, columns)
+
+    def _validate_continuity(self, dataset, columns=None):
+        issues = []
+        if dataset.get_bar_count() < 2:
+            return issues
+        timestamps = [bar.timestamp for bar in dataset.bars]
+        timestamp_counts = pd.Series(timestamps).value_counts()
+        duplicates = timestamp_counts[timestamp_counts > 1]
+        if len(duplicates) > 0:
+            issues.append(DataQualityIssue(
+                check_name="Duplicate Timestamps", severity=DataQualitySeverity.ERROR,
+                message=f"Found {len(duplicates)} duplicate timestamps", actual_value=len(duplicates)))
+        for idx in range(len(timestamps) - 1):
+            if timestamps[idx] >= timestamps[idx + 1]:
+                issues.append(DataQualityIssue(
+                    check_name="Timestamp Order", severity=DataQualitySeverity.ERROR,
+                    message=f"Out-of-order timestamp at bar {idx}", bar_index=idx))
+        if dataset.interval == OHLCVInterval.DAY_1:
+            for idx in range(len(timestamps) - 1):
+                gap_days = (timestamps[idx + 1] - timestamps[idx]).days
+                if gap_days > self.max_gap_days:
+                    issues.append(DataQualityIssue(
+                        check_name="Data Continuity", severity=DataQualitySeverity.WARNING,
+                        message=f"Large gap detected: {gap_days} days", bar_index=idx,
+                        actual_value=gap_days, expected_range=f"≤{self.max_gap_days} days"))
+        return issues
+
+    def _validate_distribution(self, dataset, columns=None):
+        columns = {'close': np.array([bar.close for bar in dataset.bars])}
+        return super()._validate_distribution(dataset, columns)
+
+
+def random_dataset(rng, interval=OHLCVInterval.DAY_1, tz=None):
+    """Random bars with every kind of defect the checks look for."""
+    n = int(rng.choice([0, 1, 2, 5, 21, 22, 60, 250]))
+    dataset = OHLCVDataset(symbol="TEST", interval=interval)
+    price = float(rng.uniform(0.005, 500))
+    constant = rng.random() < 0.1
+    if constant:
+        price = 64.0                                # exact, so np.std is exactly 0
+    timestamp = datetime(2024, 1, 1, tzinfo=tz)
+    step = timedelta(seconds=interval.seconds)
+    float_volume = rng.random() < 0.3
+
+    for _ in range(n):
+        if not constant:
+            shock = rng.choice([0.0, 0.0, 0.0, 0.9, -0.6], p=[0.55, 0.3, 0.05, 0.05, 0.05])
+            price = max(0.01, price * (1 + 0.02 * rng.standard_normal() + shock))
+        close = price if constant else round(price, int(rng.integers(2, 6)))
+        if not constant and rng.random() < 0.02:
+            close = float(rng.choice([0.0, 0.004, 0.01]))   # one bad print
+        open_price = close if constant else max(0.0, close * (1 + 0.01 * rng.standard_normal()))
+        high = max(open_price, close) * (1 + (0 if constant else rng.choice([0.002, 0.8], p=[0.9, 0.1])))
+        low = min(open_price, close) * (1 - (0 if constant else rng.choice([0.002, 0.9], p=[0.9, 0.1])))
+        if rng.random() < 0.05:
+            low = -abs(low) - 0.5                   # negative low, still consistent
+        if rng.random() < 0.05:
+            open_price = high * 1.1                 # OHLC inconsistent -> is_valid False
+        volume = int(rng.choice([0, int(rng.integers(1, 1000)), 10**9], p=[0.15, 0.84, 0.01]))
+        if float_volume:
+            volume = volume + 0.5
+
+        dataset.add_bar(OHLCVBar(
+            timestamp=timestamp, open=open_price, high=high, low=low, close=close,
+            volume=volume, interval=interval, is_complete=rng.random() > 0.03
+        ))
+        move = rng.choice([1, 1, 1, 0, -1, 9], p=[0.8, 0.05, 0.05, 0.04, 0.03, 0.03])
+        timestamp = timestamp + move * step + timedelta(seconds=int(rng.choice([0, 0, -1, 1])))
+    return dataset
+
+
+def comparable(issues):
+    def value(v):
+        if v is None:
+            return None
+        v = float(v)
+        return 'nan' if math.isnan(v) else v
+    return [(i.check_name, i.severity, i.message, None if i.bar_index is None else int(i.bar_index),
+             value(i.actual_value), i.expected_range) for i in issues]
+
+
+class QuietNumpyTestCase(unittest.TestCase):
+    """Zero closes make returns inf/nan, as they always have; keep the output readable."""
+
+    def setUp(self):
+        self._numpy_errors = np.seterr(divide='ignore', invalid='ignore')
+
+    def tearDown(self):
+        np.seterr(**self._numpy_errors)
+
+
+class TestVectorizedValidatorProperties(QuietNumpyTestCase):
+    """Vectorized checks must reproduce the per-bar reference exactly."""
+
+    def assert_same_report(self, dataset, validator=None, reference=None):
+        report = (validator or LINEDataQualityValidator()).validate_dataset(dataset)
+        expected = (reference or ReferenceValidator()).validate_dataset(dataset)
+        self.assertEqual(comparable(report.issues), comparable(expected.issues))
+        self.assertEqual(report.overall_pass, expected.overall_pass)
+        return report
+
+    def test_randomized_daily_datasets(self):
+        rng = np.random.default_rng(2024)
+        checks = set()
+        for _ in range(300):
+            report = self.assert_same_report(random_dataset(rng))
+            checks.update(issue.check_name for issue in report.issues)
+        # the generator exercises every check
+        self.assertTrue({"Bar Validation", "Price Spike Detection", "Price Sanity", "Intrabar Range",
+                         "Zero Volume", "Volume Spike Detection", "Duplicate Timestamps",
+                         "Timestamp Order", "Data Continuity", "Price Variance"} <= checks)
+
+    def test_randomized_intraday_and_timezone_datasets(self):
+        rng = np.random.default_rng(7)
+        for i in range(150):
+            interval = [OHLCVInterval.MIN_5, OHLCVInterval.HOUR_1, OHLCVInterval.DAY_1][i % 3]
+            tz = timezone(timedelta(hours=-5)) if i % 2 else None
+            self.assert_same_report(random_dataset(rng, interval, tz))
+
+    def test_randomized_thresholds(self):
+        rng = np.random.default_rng(11)
+        for _ in range(100):
+            params = dict(price_spike_threshold=float(rng.uniform(1, 6)),
+                          volume_spike_threshold=float(rng.uniform(1, 12)),
+                          zero_volume_max_pct=float(rng.uniform(0, 20)),
+                          max_gap_days=int(rng.integers(0, 6)))
+            self.assert_same_report(random_dataset(rng), LINEDataQualityValidator(**params),
+                                    ReferenceValidator(**params))
+
+
+class TestMultiIntervalValidation(QuietNumpyTestCase):
+
+    def test_parallel_matches_serial(self):
+        rng = np.random.default_rng(5)
+        datasets = [random_dataset(rng, interval) for interval in
+                    (OHLCVInterval.DAY_1, OHLCVInterval.HOUR_1, OHLCVInterval.MIN_15, OHLCVInterval.MIN_5) * 3]
+
+        parallel_valid, parallel = validate_multi_interval_for_finn(datasets)
+        serial_valid, serial = validate_multi_interval_for_finn(datasets, max_workers=1)
+
+        self.assertEqual(parallel_valid, serial_valid)
+        self.assertEqual([r.dataset_interval for r in parallel], [d.interval.value for d in datasets])
+        self.assertEqual([comparable(r.issues) for r in parallel], [comparable(r.issues) for r in serial])
+
+    def test_empty_list(self):
+        self.assertEqual(validate_multi_interval_for_finn([]), (True, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,257 @@
+"""
+LINE+ OHLCV Data Contracts — Columnar OHLCVDataset Tests
+Phase 3: Week 2 — Multi-Interval Market Data Layer
+
+Test Coverage:
+- Running quality metrics match a full rescan of the bars
+- Lazy bar materialization round-trips every OHLCVBar field
+- Zero-copy to_dataframe / get_columns (read-only views)
+- from_arrays applies the OHLCVBar sanity checks and flags
+- Out-of-order bars, timezone-aware timestamps, fractional volumes
+- filter_valid_bars
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from line_ohlcv_contracts import (
+    OHLCVBar,
+    OHLCVDataset,
+    OHLCVInterval,
+    validate_ohlcv_dataset
+)
+
+
+def make_bars(n, seed=7, start=datetime(2024, 1, 1), symbol="BTC/USD"):
+    """Daily bars with some zero volumes and some inconsistent OHLC."""
+    rng = np.random.default_rng(seed)
+    bars = []
+    price = 100.0
+    for i in range(n):
+        close = price * (1 + 0.01 * rng.standard_normal())
+        high = max(price, close) * 1.004
+        low = min(price, close) * 0.996
+        open_price = high * 1.01 if i % 13 == 0 else price      # open above high -> invalid
+        bars.append(OHLCVBar(
+            timestamp=start + timedelta(days=i),
+            open=open_price,
+            high=high,
+            low=low,
+            close=close,
+            volume=0 if i % 7 == 0 else int(rng.integers(1_000, 1_000_000)),
+            interval=OHLCVInterval.DAY_1,
+            symbol=symbol if i % 2 else None,
+            source="test",
+            hash_chain_id=f"chain-{i}" if i % 5 == 0 else None,
+            is_complete=i % 11 != 0
+        ))
+        price = close
+    return bars
+
+
+def rescanned_metrics(bars):
+    total = len(bars)
+    return (
+        sum(1 for bar in bars if bar.is_complete) / total * 100,
+        sum(1 for bar in bars if bar.has_volume) / total * 100,
+        sum(1 for bar in bars if bar.is_valid) / total * 100,
+    )
+
+
+class TestRunningQualityMetrics(unittest.TestCase):
+    """Running counters must equal a full rescan after every add_bar."""
+
+    def test_metrics_match_rescan_after_each_bar(self):
+        bars = make_bars(60)
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+
+        for i, bar in enumerate(bars, start=1):
+            dataset.add_bar(bar)
+            self.assertEqual(
+                (dataset.completeness_pct, dataset.volume_coverage_pct, dataset.valid_bars_pct),
+                rescanned_metrics(bars[:i])
+            )
+
+    def test_constructor_bars_and_extend(self):
+        bars = make_bars(50)
+        built = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=bars)
+        extended = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+        extended.extend(bars[:20])
+        extended.extend(bars[20:])
+
+        for dataset in (built, extended):
+            self.assertEqual(dataset.get_bar_count(), 50)
+            self.assertEqual(
+                (dataset.completeness_pct, dataset.volume_coverage_pct, dataset.valid_bars_pct),
+                rescanned_metrics(bars)
+            )
+
+    def test_empty_dataset(self):
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+        self.assertEqual(dataset.valid_bars_pct, 0.0)
+        self.assertEqual(dataset.get_date_range(), (None, None))
+        self.assertEqual(list(dataset.to_dataframe().columns),
+                         ['date', 'open', 'high', 'low', 'close', 'volume'])
+
+    def test_mismatched_bar_rejected(self):
+        dataset = OHLCVDataset(symbol="ETH/USD", interval=OHLCVInterval.DAY_1)
+        with self.assertRaises(ValueError):
+            dataset.add_bar(make_bars(2)[1])                      # symbol BTC/USD
+        with self.assertRaises(ValueError):
+            dataset.extend(make_bars(3, symbol="ETH/USD")[:1] + [OHLCVBar(
+                timestamp=datetime(2024, 1, 1), open=1, high=1, low=1, close=1,
+                volume=1, interval=OHLCVInterval.MIN_5)])
+        self.assertEqual(dataset.get_bar_count(), 0)
+
+    def test_empty_dataset_is_truthy(self):
+        # Callers check `if dataset:` for ingestion failure (None)
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+        self.assertEqual(len(dataset), 0)
+        self.assertTrue(dataset)
+
+
+class TestLazyBars(unittest.TestCase):
+    """dataset.bars behaves like the former list of OHLCVBar."""
+
+    def test_bars_round_trip(self):
+        bars = make_bars(40)
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+        for bar in bars:
+            dataset.add_bar(bar)
+
+        self.assertEqual(len(dataset.bars), 40)
+        self.assertEqual(dataset.bars, bars)
+        self.assertEqual(dataset.bars[-1], bars[-1])
+        self.assertEqual(dataset.bars[5:9], bars[5:9])
+        self.assertEqual([b.to_dict() for b in dataset.bars], [b.to_dict() for b in bars])
+        self.assertIsInstance(dataset.bars[3].volume, int)
+        with self.assertRaises(IndexError):
+            dataset.bars[40]
+
+    def test_bars_snapshot_ignores_later_appends(self):
+        bars = make_bars(10)
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=bars[:5])
+        snapshot = dataset.bars
+        dataset.extend(bars[5:])
+        self.assertEqual(len(snapshot), 5)
+        self.assertEqual(list(snapshot), bars[:5])
+
+    def test_bars_setter_replaces_contents(self):
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=make_bars(10))
+        dataset.bars = make_bars(4, seed=1)
+        self.assertEqual(dataset.bars, make_bars(4, seed=1))
+
+
+class TestColumnarViews(unittest.TestCase):
+    """to_dataframe and get_columns expose the columns without copying."""
+
+    def setUp(self):
+        self.bars = make_bars(200)
+        self.dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=self.bars)
+
+    def test_dataframe_matches_bar_values(self):
+        df = self.dataset.to_dataframe()
+        self.assertEqual(list(df.columns), ['date', 'open', 'high', 'low', 'close', 'volume'])
+        self.assertEqual(df['close'].tolist(), [b.close for b in self.bars])
+        self.assertEqual(df['volume'].tolist(), [b.volume for b in self.bars])
+        self.assertEqual(list(df['date']), [pd.Timestamp(b.timestamp) for b in self.bars])
+
+    def test_dataframe_is_zero_copy_and_read_only(self):
+        df = self.dataset.to_dataframe()
+        columns = self.dataset.get_columns()
+        self.assertTrue(np.shares_memory(df['close'].to_numpy(), columns['close']))
+        self.assertFalse(columns['close'].flags.writeable)
+        with self.assertRaises(ValueError):
+            df.loc[0, 'close'] = -1.0
+        writable = self.dataset.to_dataframe(copy=True)
+        writable.loc[0, 'close'] = -1.0
+        self.assertEqual(self.dataset.bars[0].close, self.bars[0].close)
+
+    def test_out_of_order_bars_sorted(self):
+        shuffled = [self.bars[i] for i in np.random.default_rng(3).permutation(len(self.bars))]
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1)
+        for bar in shuffled:
+            dataset.add_bar(bar)
+
+        pd.testing.assert_frame_equal(dataset.to_dataframe(), self.dataset.to_dataframe())
+        self.assertEqual(dataset.get_date_range(), self.dataset.get_date_range())
+        self.assertEqual(dataset.bars, shuffled)                 # insertion order kept
+
+    def test_timezone_aware_timestamps(self):
+        bars = make_bars(30, start=datetime(2024, 3, 30, 12, tzinfo=timezone(timedelta(hours=2))))
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=bars)
+
+        self.assertEqual(dataset.bars, bars)
+        self.assertEqual(dataset.get_date_range(), (bars[0].timestamp, bars[-1].timestamp))
+        self.assertEqual(list(dataset.to_dataframe()['date']), [b.timestamp for b in bars])
+        with self.assertRaises(ValueError):
+            dataset.add_bar(make_bars(1)[0])                      # naive timestamp
+
+    def test_fractional_volume_upcasts(self):
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=self.bars[:3])
+        bar = make_bars(4)[3]
+        bar.volume = 12.5
+        dataset.add_bar(bar)
+        self.assertEqual(dataset.to_dataframe()['volume'].tolist(),
+                         [b.volume for b in self.bars[:3]] + [12.5])
+
+
+class TestFromArrays(unittest.TestCase):
+    """from_arrays must flag and reject exactly like OHLCVBar."""
+
+    def test_matches_bar_by_bar_dataset(self):
+        bars = [OHLCVBar(timestamp=b.timestamp, open=b.open, high=b.high, low=b.low,
+                         close=b.close, volume=b.volume, interval=OHLCVInterval.DAY_1)
+                for b in make_bars(120)]
+        columnar = OHLCVDataset.from_arrays(
+            "BTC/USD", OHLCVInterval.DAY_1,
+            timestamp=[b.timestamp for b in bars],
+            open=[b.open for b in bars], high=[b.high for b in bars],
+            low=[b.low for b in bars], close=[b.close for b in bars],
+            volume=[b.volume for b in bars], source="test"
+        )
+
+        self.assertEqual(columnar.bars, bars)
+        self.assertEqual(columnar.source, "test")
+        self.assertEqual(
+            (columnar.completeness_pct, columnar.volume_coverage_pct, columnar.valid_bars_pct),
+            rescanned_metrics(bars)
+        )
+
+    def test_rejects_like_ohlcv_bar(self):
+        ts = pd.date_range("2024-01-01", periods=3)
+        ok = dict(open=[1, 1, 1], high=[2, 2, 2], low=[0.5, 0.5, 0.5], close=[1, 1, 1], volume=[1, 1, 1])
+        for field, values in (('high', [2, 0.1, 2]), ('close', [1, 1, -1]), ('volume', [1, -5, 1])):
+            with self.assertRaises(ValueError):
+                OHLCVDataset.from_arrays("X", OHLCVInterval.DAY_1, ts, **{**ok, field: values})
+
+    def test_validate_dataset_uses_running_metrics(self):
+        n = 5000
+        rng = np.random.default_rng(0)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        dataset = OHLCVDataset.from_arrays(
+            "BTC/USD", OHLCVInterval.MIN_1, pd.date_range("2024-01-01", periods=n, freq="1min"),
+            close, close * 1.001, close * 0.999, close, rng.integers(0, 100, n)
+        )
+        is_valid, violations = validate_ohlcv_dataset(dataset)
+        self.assertTrue(is_valid, violations)
+
+
+class TestFilterValidBars(unittest.TestCase):
+
+    def test_filter_valid_bars(self):
+        bars = make_bars(100)
+        dataset = OHLCVDataset(symbol="BTC/USD", interval=OHLCVInterval.DAY_1, bars=bars, source="s")
+        filtered = dataset.filter_valid_bars()
+
+        self.assertEqual(filtered.bars, [b for b in bars if b.is_valid])
+        self.assertEqual(filtered.valid_bars_pct, 100.0)
+        self.assertEqual(filtered.source, "s")
+        self.assertLess(filtered.get_bar_count(), dataset.get_bar_count())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+"""
+Production Data Source Adapters — Shared Rate Limiter Tests
+Phase 3: Week 3 — LARS Directive 7 (Priority 2: Production Data Integration)
+
+Test Coverage:
+- Ring-buffer windows admit exactly what the list-based limiter admitted
+  on randomized request sequences (per-minute, per-hour, daily budget)
+- Burst bucket, live config changes, blocking acquire and timeouts
+- Concurrency: threads sharing a limiter, processes sharing a SQLite
+  state file, never admit more than the limit
+- Adapters take their slots from a limiter shared through
+  RATE_LIMIT_STATE_DIR
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+
+from line_ohlcv_contracts import OHLCVInterval
+from production_data_adapters import (
+    RATE_LIMIT_STATE_DIR_ENV,
+    DataSourceFactory,
+    RateLimitConfig,
+    RateLimitExceeded,
+    RateLimiter
+)
+
+
+class FakeClock:
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class ReferenceRateLimiter:
+    """The list-based limiter the ring buffers replaced (on a fake clock)."""
+
+    def __init__(self, config, clock):
+        self.config = config
+        self.clock = clock
+        self.requests = []
+        self.daily_cost = 0.0
+        self.day = int(clock() // 86400)
+
+    def can_make_request(self, estimated_cost=0.0):
+        now = self.clock()
+        if int(now // 86400) > self.day:
+            self.daily_cost, self.day = 0.0, int(now // 86400)
+        if len([t for t in self.requests if t > now - 60]) >= self.config.max_requests_per_minute:
+            return False
+        if len([t for t in self.requests if t > now - 3600]) >= self.config.max_requests_per_hour:
+            return False
+        return self.daily_cost + estimated_cost <= self.config.max_daily_budget_usd
+
+    def record_request(self, cost=0.0):
+        self.requests.append(self.clock())
+        self.daily_cost += cost
+
+
+def count_admitted(state_path, attempts, results):
+    limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=150, max_requests_per_hour=1000,
+                                          max_daily_budget_usd=100.0), state_path=state_path)
+    results.put(sum(limiter.try_acquire(cost=0.25)[0] for _ in range(attempts)))
+    limiter.close()
+
+
+class TestRingBufferEquivalence(unittest.TestCase):
+
+    def test_randomized_sequences_match_reference(self):
+        rng = np.random.default_rng(46)
+        for _ in range(40):
+            config = RateLimitConfig(max_requests_per_minute=int(rng.integers(1, 12)),
+                                     max_requests_per_hour=int(rng.integers(5, 60)),
+                                     max_daily_budget_usd=float(rng.uniform(0, 5)))
+            clock = FakeClock(86400 * 19700 + float(rng.uniform(0, 86400)))
+            limiter, reference = RateLimiter(config, clock=clock), ReferenceRateLimiter(config, clock)
+            for _ in range(400):
+                clock.now += float(rng.choice([0.0, rng.exponential(4), 60.0, rng.exponential(600)]))
+                cost = float(rng.choice([0.0, 0.0, rng.uniform(0, 0.5)]))
+                expected = reference.can_make_request(cost)
+                self.assertEqual(limiter.can_make_request(cost)[0], expected)
+                if expected:
+                    self.assertTrue(limiter.try_acquire(cost)[0])
+                    reference.record_request(cost)
+                    self.assertAlmostEqual(limiter.get_statistics()['daily_cost_usd'], reference.daily_cost)
+
+    def test_window_edges_and_reasons(self):
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=2, max_requests_per_hour=3), clock=clock)
+        self.assertTrue(limiter.try_acquire()[0])
+        clock.now += 1
+        self.assertTrue(limiter.try_acquire()[0])
+        self.assertEqual(limiter.try_acquire(), (False, "Per-minute rate limit exceeded (2/min)"))
+        clock.now += 59                                  # first request is exactly 60s old
+        self.assertTrue(limiter.try_acquire()[0])
+        clock.now += 120
+        self.assertEqual(limiter.try_acquire(), (False, "Per-hour rate limit exceeded (3/hr)"))
+        stats = limiter.get_statistics()
+        self.assertEqual((stats['requests_this_minute'], stats['requests_this_hour']), (0, 3))
+
+
+class TestRateLimiterFeatures(unittest.TestCase):
+
+    def test_burst_bucket_refills_at_minute_rate(self):
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=60, burst_size=3), clock=clock)
+        self.assertEqual([limiter.try_acquire()[0] for _ in range(4)], [True, True, True, False])
+        self.assertIn("Burst", limiter.can_make_request()[1])
+        clock.now += 1.0                                 # 60/min -> one token per second
+        self.assertEqual([limiter.try_acquire()[0] for _ in range(2)], [True, False])
+        clock.now += 100.0
+        self.assertEqual(limiter.get_statistics()['burst_tokens'], 3.0)
+
+    def test_limits_follow_config_changes(self):
+        clock = FakeClock()
+        config = RateLimitConfig(max_requests_per_minute=5)
+        limiter = RateLimiter(config, clock=clock)
+        for _ in range(4):
+            self.assertTrue(limiter.try_acquire()[0])
+        config.max_requests_per_minute = 3
+        self.assertFalse(limiter.try_acquire()[0])
+        config.max_requests_per_minute = 10
+        self.assertEqual(sum(limiter.try_acquire()[0] for _ in range(10)), 6)
+        config.max_requests_per_minute = 0
+        self.assertFalse(limiter.can_make_request()[0])
+
+    def test_daily_budget_resets_at_midnight_utc(self):
+        clock = FakeClock(86400 * 19700 + 86399.0)
+        limiter = RateLimiter(RateLimitConfig(max_daily_budget_usd=1.0), clock=clock)
+        self.assertTrue(limiter.try_acquire(cost=0.75)[0])
+        limiter.charge(0.25)
+        self.assertIn("budget", limiter.can_make_request(estimated_cost=0.01)[1])
+        clock.now += 1.0
+        self.assertEqual(limiter.get_statistics()['daily_cost_usd'], 0.0)
+        self.assertTrue(limiter.try_acquire(cost=1.0)[0])
+
+    def test_acquire_blocks_until_admitted(self):
+        limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=600, burst_size=2))
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire(timeout=5)
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)   # two refills at 10/s
+
+    def test_acquire_timeout_and_budget(self):
+        limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=1, max_daily_budget_usd=1.0))
+        limiter.acquire()
+        with self.assertRaises(RateLimitExceeded) as raised:
+            limiter.acquire(timeout=0.05)
+        self.assertGreater(raised.exception.retry_after, 50)
+        self.assertIn("Per-minute", str(raised.exception))
+
+        start = time.monotonic()
+        with self.assertRaises(RateLimitExceeded):
+            RateLimiter(RateLimitConfig(max_daily_budget_usd=1.0)).acquire(cost=2.0)
+        self.assertLess(time.monotonic() - start, 1.0)            # waiting cannot help
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def test_threads_never_exceed_limits(self):
+        limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=500, max_requests_per_hour=5000,
+                                              max_daily_budget_usd=1000.0))
+        admitted = []
+
+        def worker():
+            admitted.append(sum(limiter.try_acquire(cost=0.5)[0] for _ in range(250)))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = limiter.get_statistics()
+        self.assertEqual(sum(admitted), 500)
+        self.assertEqual(stats['requests_this_minute'], 500)
+        self.assertEqual(stats['daily_cost_usd'], 250.0)
+
+    def test_processes_share_sqlite_state(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'limiter.sqlite')
+            context = multiprocessing.get_context('spawn')
+            results = context.Queue()
+            processes = [context.Process(target=count_admitted, args=(path, 80, results)) for _ in range(4)]
+            for process in processes:
+                process.start()
+            admitted = [results.get(timeout=60) for _ in processes]
+            for process in processes:
+                process.join()
+
+            self.assertEqual(sum(admitted), 150)
+            limiter = RateLimiter(RateLimitConfig(max_requests_per_minute=150, max_daily_budget_usd=100.0),
+                                  state_path=path)
+            stats = limiter.get_statistics()
+            self.assertEqual(stats['requests_this_minute'], 150)
+            self.assertEqual(stats['daily_cost_usd'], 37.5)
+            self.assertFalse(limiter.try_acquire()[0])
+            limiter.close()
+
+    def test_sqlite_threads_and_resize(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            clock = FakeClock()
+            config = RateLimitConfig(max_requests_per_minute=40)
+            limiters = [RateLimiter(config, state_path=os.path.join(tmp, 's.sqlite'), clock=clock)
+                        for _ in range(2)]
+            admitted = []
+            threads = [threading.Thread(target=lambda l=l: admitted.append(
+                sum(l.try_acquire()[0] for _ in range(30)))) for l in limiters * 2]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(sum(admitted), 40)
+
+            config.max_requests_per_minute = 50
+            self.assertEqual(sum(limiters[0].try_acquire()[0] for _ in range(20)), 10)
+            clock.now += 60
+            self.assertTrue(limiters[1].try_acquire()[0])
+            for limiter in limiters:
+                limiter.close()
+
+
+class TestAdapterRateLimiting(unittest.TestCase):
+
+    def test_adapters_share_limiter_state(self):
+        end_date = datetime.now(timezone.utc)
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {RATE_LIMIT_STATE_DIR_ENV: tmp}):
+            first = DataSourceFactory.create_adapter('binance')
+            second = DataSourceFactory.create_adapter('binance')
+            first.fetch_ohlcv('BTC/USD', OHLCVInterval.DAY_1, end_date - timedelta(days=3), end_date)
+            second.fetch_ohlcv('ETH/USD', OHLCVInterval.DAY_1, end_date - timedelta(days=3), end_date)
+
+            stats = first.get_statistics()['rate_limiter']
+            self.assertEqual(stats['requests_this_minute'], 2)
+            self.assertLess(stats['burst_tokens'], 99)           # refills at 10/s
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'binance_rate_limit.sqlite')))
+            first.rate_limiter.close()
+            second.rate_limiter.close()
+
+    def test_adapter_raises_when_limit_holds(self):
+        adapter = DataSourceFactory.create_adapter('yahoo', timeout_seconds=0)
+        adapter.rate_limiter.config.max_requests_per_minute = 0
+        end_date = datetime.now(timezone.utc)
+        with self.assertRaises(RateLimitExceeded):
+            adapter.fetch_ohlcv('SPY', OHLCVInterval.DAY_1, end_date - timedelta(days=3), end_date)
+
+    def test_fred_skips_series_over_limit(self):
+        adapter = DataSourceFactory.create_adapter('fred')
+        adapter.rate_limiter.config.max_requests_per_minute = 1
+        end_date = datetime.now(timezone.utc)
+        results = adapter.fetch_economic_indicators(['DGS10', 'DFF'], end_date - timedelta(days=10), end_date)
+        self.assertEqual(list(results), ['DGS10'])
+
+
+if __name__ == '__main__':
+    unittest.main()
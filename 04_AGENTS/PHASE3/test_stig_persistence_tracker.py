@@ -0,0 +1,252 @@
+"""
+STIG+ Persistence Tracker — Rolling Counters, Write-Behind and Recovery Tests
+Phase 3: Week 3 — LARS Directive 7 (Priority 2: Production Data Integration)
+
+Test Coverage:
+- Rolling per-key transition counts equal the full-history rescan on
+  randomized updates (old, future and out-of-order timestamps, other
+  look-back windows)
+- Write-behind: batched flushes, latest record state per key, transitions
+  written once, failed flushes retried
+- Recovery rebuilds records, history and rolling counts from the database
+- Failed loads roll back and return no rows
+"""
+
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from stig_persistence_tracker import (
+    PersistenceDatabase,
+    PersistenceRecord,
+    RegimeLabel,
+    RegimeTransition,
+    STIGPersistenceTracker
+)
+
+logging.getLogger("stig_persistence").setLevel(logging.WARNING)
+
+REGIMES = list(RegimeLabel)
+
+
+class InMemoryPersistenceDatabase(PersistenceDatabase):
+    """Stores rows in dicts; counts batches like the SQL layer would issue them."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = {}
+        self.transitions = {}
+        self.record_batches = []
+        self.transition_batches = []
+        self.fail_next = False
+
+    def save_persistence_records(self, records):
+        if self.fail_next:
+            self.fail_next = False
+            return False
+        self.record_batches.append(len(records))
+        for record in records:
+            self.records[(record.symbol, record.interval)] = record.to_dict()
+        return True
+
+    def save_transitions(self, transitions):
+        if self.fail_next:
+            self.fail_next = False
+            return False
+        self.transition_batches.append(len(transitions))
+        for transition in transitions:
+            self.transitions.setdefault(transition.transition_id, transition.to_dict())
+        return True
+
+    def load_persistence_records(self):
+        records = []
+        for row in self.records.values():
+            records.append(PersistenceRecord(**{
+                **row,
+                'current_regime': RegimeLabel(row['current_regime']),
+                'regime_start_timestamp': datetime.fromisoformat(row['regime_start_timestamp']),
+                'last_updated': datetime.fromisoformat(row['last_updated']),
+            }))
+        return records
+
+    def load_transitions(self, since):
+        transitions = []
+        for row in self.transitions.values():
+            transition = RegimeTransition(**{
+                **row,
+                'previous_regime': RegimeLabel(row['previous_regime']),
+                'new_regime': RegimeLabel(row['new_regime']),
+                'transition_timestamp': datetime.fromisoformat(row['transition_timestamp']),
+                'previous_regime_start': datetime.fromisoformat(row['previous_regime_start']),
+            })
+            if transition.transition_timestamp > since:
+                transitions.append(transition)
+        return sorted(transitions, key=lambda t: t.transition_timestamp)
+
+
+class FailingConnection:
+    """Connection whose every query fails, as after a dropped server."""
+
+    def __init__(self):
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        raise RuntimeError("server closed the connection unexpectedly")
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def reference_count(tracker, symbol, interval, days=90):
+    """The full-history rescan the rolling counters replaced."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    return sum(1 for t in tracker._transition_history
+               if t.symbol == symbol and t.interval == interval and t.transition_timestamp > cutoff)
+
+
+def random_updates(rng, n, symbols=8):
+    """(symbol, interval, regime, timestamp) tuples, mostly in time order per key."""
+    now = datetime.now(timezone.utc)
+    clocks = {}
+    updates = []
+    for _ in range(n):
+        key = (f"SYM{int(rng.integers(symbols))}", str(rng.choice(['1d', '1h'])))
+        clock = clocks.get(key, now - timedelta(days=float(rng.uniform(0, 200))))
+        clock += timedelta(days=float(rng.exponential(2)))
+        if rng.random() < 0.05:
+            clock -= timedelta(days=float(rng.uniform(0, 30)))          # out of order
+        clocks[key] = clock
+        updates.append((*key, REGIMES[int(rng.integers(3))] if rng.random() < 0.4 else None, clock))
+    return updates
+
+
+def apply(tracker, updates):
+    for symbol, interval, regime, timestamp in updates:
+        record = tracker.get_persistence(symbol, interval)
+        if regime is None:
+            regime = record.current_regime if record else RegimeLabel.NEUTRAL
+        tracker.update_regime(symbol, interval, regime, 0.7, timestamp=timestamp)
+
+
+class TestRollingTransitionCounts(unittest.TestCase):
+
+    def test_counts_match_full_rescan(self):
+        rng = np.random.default_rng(48)
+        tracker = STIGPersistenceTracker()
+        updates = random_updates(rng, 3000)
+        for i in range(0, len(updates), 100):
+            apply(tracker, updates[i:i + 100])
+            for record in tracker.get_all_persistence_records():
+                self.assertEqual(tracker._count_recent_transitions(record.symbol, record.interval),
+                                 reference_count(tracker, record.symbol, record.interval))
+                for days in (7, 30, 365):
+                    self.assertEqual(tracker._count_recent_transitions(record.symbol, record.interval, days),
+                                     reference_count(tracker, record.symbol, record.interval, days))
+
+    def test_validate_transition_limit(self):
+        tracker = STIGPersistenceTracker()
+        start = datetime.now(timezone.utc) - timedelta(days=120)
+        for day in range(120):                                       # a transition every day
+            tracker.update_regime('BTC/USD', '1d', REGIMES[day % 3], 0.7,
+                                  timestamp=start + timedelta(days=day))
+
+        count = reference_count(tracker, 'BTC/USD', '1d')
+        is_valid, message = tracker.validate_transition_limit('BTC/USD', '1d')
+        self.assertFalse(is_valid)
+        self.assertIn(f"{count}/30", message)
+        self.assertEqual(tracker.validate_transition_limit('ETH/USD', '1d')[0], True)
+
+
+class TestWriteBehind(unittest.TestCase):
+
+    def test_batched_flushes_and_final_state(self):
+        database = InMemoryPersistenceDatabase()
+        tracker = STIGPersistenceTracker(database=database, flush_batch_size=50)
+        apply(tracker, random_updates(np.random.default_rng(1), 1000, symbols=20))
+        tracker.close()
+
+        self.assertTrue(all(size <= 50 for size in database.record_batches))
+        self.assertLess(len(database.record_batches), 100)
+        self.assertEqual(sum(database.transition_batches), len(tracker._transition_history))
+        self.assertEqual(database.records, {(r.symbol, r.interval): r.to_dict()
+                                            for r in tracker.get_all_persistence_records()})
+        stats = tracker.get_statistics()
+        self.assertEqual((stats['pending_records'], stats['pending_transitions']), (0, 0))
+
+    def test_failed_flush_is_retried(self):
+        database = InMemoryPersistenceDatabase()
+        tracker = STIGPersistenceTracker(database=database, flush_batch_size=1000)
+        now = datetime.now(timezone.utc)
+        tracker.update_regime('BTC/USD', '1d', RegimeLabel.BULL, 0.7, timestamp=now)
+        tracker.update_regime('BTC/USD', '1d', RegimeLabel.BEAR, 0.7, timestamp=now + timedelta(days=1))
+
+        database.fail_next = True
+        self.assertFalse(tracker.flush())
+        self.assertEqual(tracker.get_statistics()['pending_transitions'], 1)
+        self.assertTrue(tracker.flush())
+        self.assertEqual(len(database.transitions), 1)
+        self.assertEqual(database.records[('BTC/USD', '1d')]['current_regime'], 'BEAR')
+
+    def test_no_database_no_buffering(self):
+        tracker = STIGPersistenceTracker()
+        tracker.update_regime('BTC/USD', '1d', RegimeLabel.BULL, 0.7)
+        self.assertEqual(tracker.get_statistics()['pending_records'], 0)
+        self.assertTrue(tracker.flush())
+
+
+class TestRecovery(unittest.TestCase):
+
+    def test_recovered_tracker_continues_like_original(self):
+        rng = np.random.default_rng(7)
+        updates = random_updates(rng, 1500)
+        database = InMemoryPersistenceDatabase()
+        original = STIGPersistenceTracker(database=database, flush_batch_size=64)
+        apply(original, updates[:1000])
+        original.close()
+
+        recovered = STIGPersistenceTracker(database=database)
+        self.assertEqual(recovered.get_statistics()['recovered_records'],
+                         len(original.get_all_persistence_records()))
+        apply(original, updates[1000:])
+        apply(recovered, updates[1000:])
+
+        for record in original.get_all_persistence_records():
+            restored = recovered.get_persistence(record.symbol, record.interval)
+            self.assertEqual(restored.to_dict(), record.to_dict())
+            self.assertEqual(recovered.get_c2_value(record.symbol, record.interval), record.c2_value)
+            self.assertEqual(recovered.validate_transition_limit(record.symbol, record.interval),
+                             original.validate_transition_limit(record.symbol, record.interval))
+
+    def test_recover_false_starts_empty(self):
+        database = InMemoryPersistenceDatabase()
+        tracker = STIGPersistenceTracker(database=database)
+        tracker.update_regime('BTC/USD', '1d', RegimeLabel.BULL, 0.7)
+        tracker.close()
+        fresh = STIGPersistenceTracker(database=database, recover=False)
+        self.assertEqual(fresh.get_statistics()['tracked_symbols'], 0)
+
+
+class TestPersistenceDatabase(unittest.TestCase):
+
+    def test_load_failures_roll_back_and_return_empty(self):
+        database = PersistenceDatabase()
+        database.conn = FailingConnection()
+        with self.assertLogs('stig_persistence', level='ERROR'):
+            self.assertEqual(database.load_persistence_records(), [])
+            self.assertEqual(database.load_transitions(datetime.now(timezone.utc)), [])
+        self.assertEqual(database.conn.rollbacks, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tier-1 Orchestrator — Batch Execution Tests
+Phase 3: Week 3 — Enhanced Context Gathering with CDS Integration
+
+Test Coverage:
+- execute_batch results equal execute_cycle results per dataset
+  (in-process and with a process pool), including LINE+ gate failures
+- Orchestrator counters and cost tracking advance as for single cycles
+- Per-step timings and stage latency histograms
+- LatencyHistogram buckets and percentiles
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from line_ohlcv_contracts import OHLCVDataset, OHLCVInterval
+from tier1_orchestrator import (
+    BATCH_STAGES,
+    LatencyHistogram,
+    Tier1Orchestrator
+)
+
+INTERVAL_FREQ = {OHLCVInterval.DAY_1: '1D', OHLCVInterval.HOUR_1: '1h', OHLCVInterval.MIN_15: '15min'}
+
+
+def make_dataset(symbol, interval, n=300, drift=0.0, seed=0, bad_print=False):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(drift + 0.01 * rng.standard_normal(n)))
+    if bad_print:
+        close[n // 2] = 0.005                        # Price Sanity error -> LINE+ gate fails
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return OHLCVDataset.from_arrays(
+        symbol, interval, pd.date_range('2024-01-01', periods=n, freq=INTERVAL_FREQ[interval]),
+        open_, np.maximum(open_, close) * 1.004, np.minimum(open_, close) * 0.996, close,
+        rng.integers(1_000, 1_000_000, n), source='test'
+    )
+
+
+def make_datasets():
+    datasets = []
+    for i, symbol in enumerate(['BTC/USD', 'ETH/USD', 'SPY']):
+        for j, interval in enumerate(INTERVAL_FREQ):
+            datasets.append(make_dataset(symbol, interval, drift=[0.015, -0.01, 0.0][i], seed=10 * i + j))
+    datasets.insert(4, make_dataset('BAD', OHLCVInterval.DAY_1, seed=99, bad_print=True))
+    return datasets
+
+
+# Fields that legitimately differ between runs (time-dependent or signed over the timestamp)
+VOLATILE_PREDICTION_FIELDS = {'timestamp', 'signature_hex', 'public_key_hex'}
+
+
+def comparable(result):
+    prediction = result.regime_prediction
+    return {
+        'symbol': result.symbol,
+        'interval': result.interval,
+        'data_bar_count': result.data_bar_count,
+        'data_quality_pass': result.data_quality_pass,
+        'data_quality_issues': [(i.check_name, i.message, i.bar_index)
+                                for i in result.data_quality_report.issues],
+        'prediction': None if prediction is None else {
+            k: v for k, v in prediction.to_dict().items() if k not in VOLATILE_PREDICTION_FIELDS},
+        'stig_validation_pass': result.stig_validation_pass,
+        'regime_weight': result.regime_weight,
+        'relevance_score': result.relevance_score,
+        'cds_value': result.cds_value,
+        'cds_components': result.cds_components,
+        'pipeline_success': result.pipeline_success,
+        'failure_step': result.failure_step,
+        'failure_reason': result.failure_reason,
+        'total_cost_usd': result.total_cost_usd,
+    }
+
+
+class TestExecuteBatch(unittest.TestCase):
+    """Batch execution must reproduce the single-cycle path for every dataset."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.datasets = make_datasets()
+        cls.single = Tier1Orchestrator(production_mode=False)
+        cls.expected = [comparable(cls.single.execute_cycle(d, cds_score=0.5)) for d in cls.datasets]
+
+    def assert_batch_matches(self, max_workers):
+        orchestrator = Tier1Orchestrator(production_mode=False)
+        batch = orchestrator.execute_batch(self.datasets, cds_score=0.5, max_workers=max_workers)
+
+        self.assertEqual([comparable(r) for r in batch.results], self.expected)
+        self.assertEqual(orchestrator.cycle_count, self.single.cycle_count)
+        self.assertEqual(orchestrator.total_cost_usd, self.single.total_cost_usd)
+        self.assertEqual(orchestrator.cds_engine.computation_count, self.single.cds_engine.computation_count)
+        self.assertTrue(all(r.regime_prediction.signature_verified
+                            for r in batch.results if r.regime_prediction))
+        self.assertEqual(len({r.cycle_id for r in batch.results}), len(self.datasets))
+        return batch
+
+    def test_in_process_batch_matches_single_cycles(self):
+        batch = self.assert_batch_matches(max_workers=1)
+        self.assertEqual(batch.max_workers, 1)
+
+    def test_process_pool_batch_matches_single_cycles(self):
+        batch = self.assert_batch_matches(max_workers=3)
+        self.assertEqual(batch.max_workers, 3)
+
+    def test_gate_failure_and_success_mix(self):
+        # the fixture exercises both outcomes
+        self.assertIn(False, [e['data_quality_pass'] for e in self.expected])
+        self.assertIn(True, [e['pipeline_success'] for e in self.expected])
+
+    def test_stage_timings_and_histograms(self):
+        batch = Tier1Orchestrator(production_mode=False).execute_batch(self.datasets, max_workers=1)
+
+        self.assertEqual(set(batch.stage_latency), set(BATCH_STAGES))
+        self.assertEqual(batch.stage_latency['execution'].count, len(self.datasets))
+        self.assertEqual(batch.stage_latency['line_validation'].count, len(self.datasets))
+        succeeded = batch.success_count
+        self.assertEqual(batch.stage_latency['cds_computation'].count, succeeded)
+        for result in batch.results:
+            stage_sum = sum(getattr(result, attr) for stage, attr in BATCH_STAGES.items() if stage != 'execution')
+            self.assertAlmostEqual(result.execution_time_ms, stage_sum)
+            self.assertGreater(result.line_validation_time_ms, 0)
+            if result.pipeline_success:
+                self.assertGreater(result.finn_classification_time_ms, 0)
+        report = batch.get_latency_report()
+        self.assertEqual(sum(report['execution']['buckets'].values()), len(self.datasets))
+        self.assertIn('BAD (1d): FAILED at Step 2', batch.get_summary())
+
+    def test_empty_batch(self):
+        batch = Tier1Orchestrator(production_mode=False).execute_batch([])
+        self.assertEqual(batch.results, [])
+        self.assertEqual(batch.stage_latency['execution'].count, 0)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram()
+        for duration_ms in [0.5, 1.0, 1.5, 3, 3, 3, 40, 40, 900, 20000]:
+            histogram.record(duration_ms)
+        report = histogram.to_dict()
+
+        self.assertEqual(report['count'], 10)
+        self.assertEqual(report['buckets']['<=1ms'], 2)
+        self.assertEqual(report['buckets']['<=5ms'], 3)
+        self.assertEqual(report['buckets']['>10000ms'], 1)
+        self.assertEqual((report['min_ms'], report['max_ms']), (0.5, 20000))
+        self.assertEqual(histogram.percentile(50), 5.0)
+        self.assertEqual(histogram.percentile(90), 1000.0)
+        self.assertEqual(histogram.percentile(100), 20000)
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,9 +42,14 @@ Compliance:
 - BIS-239, ISO-8000, GIPS, MiFID II (CDS Engine compliance)
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
+import bisect
+import hashlib
+import os
+import numpy as np
 import pandas as pd
 import time
 
@@ -56,7 +61,12 @@ from line_data_quality import (
     validate_for_finn
 )
 from finn_regime_classifier import RegimeClassifier
-from finn_signature import Ed25519Signer, SignedPrediction, sign_regime_prediction
+from finn_signature import (
+    Ed25519Signer,
+    SignedPrediction,
+    sign_regime_prediction,
+    sign_regime_predictions
+)
 from stig_validator import STIGValidator, ValidationReport
 from relevance_engine import compute_relevance_score, get_regime_weight
 from cds_engine import (
@@ -219,6 +229,201 @@ class OrchestratorCycleResult:
         return "\n".join(summary_lines)
 
 
+# ============================================================================
+# Shared Feature Computation
+# ============================================================================
+
+def compute_latest_features(finn_classifier: RegimeClassifier, price_df: pd.DataFrame) -> pd.Series:
+    """Step 3 features: the latest row of the FINN+ z-scored features."""
+    features = finn_classifier.compute_features(price_df)
+    return features.iloc[-1]
+
+
+def compute_market_inputs(price_df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Step 6 market inputs: Tier-2 z-scores and C5 volatility from the price history.
+
+    Returns: dict with return_z, volatility_z, drawdown_z, macd_diff_z,
+             price_change_pct, current_drawdown_pct and volatility
+    """
+    returns = price_df['close'].pct_change().dropna()
+
+    # Z-scored features (20-bar lookback)
+    lookback = min(20, len(price_df))
+    recent_returns = returns.tail(lookback)
+
+    return_z = (recent_returns.mean() / recent_returns.std()) if len(recent_returns) > 0 and recent_returns.std() > 0 else 0.0
+    volatility = returns.std() if len(returns) > 0 else 0.02
+    volatility_z = (volatility - 0.02) / 0.01 if volatility > 0 else 0.0  # Normalize around 2% baseline
+
+    # Drawdown calculation
+    cumulative_returns = (1 + returns).cumprod()
+    running_max = cumulative_returns.expanding().max()
+    drawdown = (cumulative_returns - running_max) / running_max
+    current_drawdown_pct = drawdown.iloc[-1] * 100 if len(drawdown) > 0 else 0.0
+    drawdown_z = (drawdown.mean() / drawdown.std()) if len(drawdown) > 0 and drawdown.std() > 0 else 0.0
+
+    # MACD (simplified: 12-26 EMA difference)
+    close_prices = price_df['close']
+    if len(close_prices) >= 26:
+        ema12 = close_prices.ewm(span=12, adjust=False).mean()
+        ema26 = close_prices.ewm(span=26, adjust=False).mean()
+        macd_diff = ema12 - ema26
+        macd_diff_z = (macd_diff.iloc[-1] / macd_diff.std()) if macd_diff.std() > 0 else 0.0
+    else:
+        macd_diff_z = 0.0
+
+    # Price change over lookback period
+    price_change_pct = ((price_df['close'].iloc[-1] / price_df['close'].iloc[-lookback]) - 1) * 100 if lookback > 0 else 0.0
+
+    return {
+        'return_z': return_z,
+        'volatility_z': volatility_z,
+        'drawdown_z': drawdown_z,
+        'macd_diff_z': macd_diff_z,
+        'price_change_pct': price_change_pct,
+        'current_drawdown_pct': current_drawdown_pct,
+        'volatility': volatility,
+    }
+
+
+@dataclass
+class PreparedCycleInputs:
+    """CPU-bound, stateless part of a cycle (Steps 2-3 and Step 6 inputs) for one dataset."""
+    data_quality_pass: bool
+    data_quality_report: DataQualityReport
+    latest_features: Optional[pd.Series] = None
+    market_inputs: Optional[Dict[str, float]] = None
+    line_validation_time_ms: float = 0.0
+    feature_time_ms: float = 0.0
+
+
+def prepare_cycle_inputs(line_validator: LINEDataQualityValidator,
+                         finn_classifier: RegimeClassifier,
+                         ohlcv_dataset: OHLCVDataset) -> PreparedCycleInputs:
+    """
+    Validate a dataset and, if it passes, compute its FINN+ features and CDS
+    market inputs from one shared price frame.
+
+    Module-level so it can run in a worker process.
+    """
+    step2_start = time.time()
+    report = line_validator.validate_dataset(ohlcv_dataset)
+    prepared = PreparedCycleInputs(
+        data_quality_pass=report.overall_pass,
+        data_quality_report=report,
+        line_validation_time_ms=(time.time() - step2_start) * 1000
+    )
+    if not prepared.data_quality_pass:
+        return prepared
+
+    features_start = time.time()
+    price_df = ohlcv_dataset.to_dataframe()
+    prepared.latest_features = compute_latest_features(finn_classifier, price_df)
+    prepared.market_inputs = compute_market_inputs(price_df)
+    prepared.feature_time_ms = (time.time() - features_start) * 1000
+    return prepared
+
+
+# ============================================================================
+# Batch Execution
+# ============================================================================
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, duration_ms: float):
+        """Add one observation."""
+        self.bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.min_ms = duration_ms if self.min_ms is None else min(self.min_ms, duration_ms)
+        self.max_ms = duration_ms if self.max_ms is None else max(self.max_ms, duration_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the pct-th observation (capped at max)."""
+        if self.count == 0:
+            return None
+        rank = max(1, int(np.ceil(pct / 100.0 * self.count)))
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets': dict(zip(labels, self.bucket_counts)),
+        }
+
+
+# Histogram name → OrchestratorCycleResult timing field
+BATCH_STAGES = {
+    'line_validation': 'line_validation_time_ms',
+    'finn_classification': 'finn_classification_time_ms',
+    'stig_validation': 'stig_validation_time_ms',
+    'relevance_computation': 'relevance_computation_time_ms',
+    'cds_computation': 'cds_computation_time_ms',
+    'execution': 'execution_time_ms',
+}
+
+
+@dataclass
+class BatchExecutionResult:
+    """Results of Tier1Orchestrator.execute_batch, in input order, with stage latency histograms."""
+    results: List[OrchestratorCycleResult]
+    stage_latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    wall_time_ms: float = 0.0
+    max_workers: int = 1
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for result in self.results if result.pipeline_success)
+
+    def get_latency_report(self) -> Dict[str, Dict[str, Any]]:
+        return {stage: histogram.to_dict() for stage, histogram in self.stage_latency.items()}
+
+    def get_summary(self) -> str:
+        """Get human-readable summary of the batch."""
+        lines = [
+            "=" * 80,
+            f"ORCHESTRATOR BATCH RESULT: {self.success_count}/{len(self.results)} cycles succeeded",
+            "=" * 80,
+            f"Wall time: {self.wall_time_ms:.1f}ms ({self.max_workers} worker{'s' if self.max_workers != 1 else ''})",
+            "",
+            "Cycles:",
+        ]
+        for result in self.results:
+            outcome = (f"{result.regime_label} CDS={result.cds_value:.4f}" if result.pipeline_success
+                       else f"FAILED at {result.failure_step}")
+            lines.append(f"  - {result.symbol} ({result.interval}): {outcome}")
+        lines.extend(["", "Stage latency (p50 / p95 / max ms):"])
+        for stage, histogram in self.stage_latency.items():
+            if histogram.count:
+                lines.append(f"  - {stage}: {histogram.percentile(50):.1f} / "
+                             f"{histogram.percentile(95):.1f} / {histogram.max_ms:.1f} (n={histogram.count})")
+        lines.append("=" * 80)
+        return "\n".join(lines)
+
+
 class Tier1Orchestrator:
     """
     Phase 3 Tier-1 Orchestrator (Steps 1-6: Enhanced Context Gathering + CDS).
@@ -290,13 +495,129 @@ class Tier1Orchestrator:
             OrchestratorCycleResult with complete pipeline output (including CDS)
         """
         cycle_start_time = time.time()
+        result = self._new_cycle_result(ohlcv_dataset)
+
+        # STEP 2: LINE+ Data Quality Validation
+        step2_start = time.time()
+        data_quality_pass, data_quality_report = self._validate_data_quality(ohlcv_dataset)
+        result.line_validation_time_ms = (time.time() - step2_start) * 1000
+
+        if not self._record_data_quality(result, data_quality_pass, data_quality_report):
+            result.execution_time_ms = (time.time() - cycle_start_time) * 1000
+            return result
+
+        # STEP 3: FINN+ Regime Classification
+        step3_start = time.time()
+        regime_prediction = self._classify_regime(ohlcv_dataset)
+        result.finn_classification_time_ms = (time.time() - step3_start) * 1000
+
+        # STEPS 4-6
+        self._complete_cycle(result, regime_prediction, cds_score)
+        result.execution_time_ms = (time.time() - cycle_start_time) * 1000
+
+        return result
+
+    def execute_batch(self,
+                      ohlcv_datasets: List[OHLCVDataset],
+                      cds_score: Optional[float] = None,
+                      max_workers: Optional[int] = None) -> BatchExecutionResult:
+        """
+        Execute orchestrator cycles (Steps 1-6) for many datasets (symbols × intervals).
+
+        LINE+ validation, FINN+ features and the CDS market inputs are
+        CPU-bound and independent per dataset, so they run in a process pool
+        (prepare_cycle_inputs), sharing one price frame per dataset. The
+        stateful steps - signing, STIG+, Tier-2/CDS engines and cost
+        tracking - then run here in input order, with all predictions signed
+        in one pass. Each result therefore equals what execute_cycle returns
+        for the same dataset, apart from cycle ID, timestamps and timings.
+
+        Per-step *_time_ms fields hold each dataset's own stage times and
+        execution_time_ms their sum; stage_latency aggregates them.
+
+        Args:
+            ohlcv_datasets: OHLCV datasets from LINE+ data ingestion
+            cds_score: Optional CDS score for relevance computation (legacy parameter, unused)
+            max_workers: Worker processes (default: one per CPU, at most one
+                         per dataset); 1 runs everything in this process
+
+        Returns:
+            BatchExecutionResult with one OrchestratorCycleResult per dataset
+        """
+        batch_start_time = time.time()
+        datasets = list(ohlcv_datasets)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(datasets)))
+
+        prepared = self._prepare_cycles(datasets, max_workers)
+
+        # STEPS 1-2
+        results = []
+        for dataset, inputs in zip(datasets, prepared):
+            result = self._new_cycle_result(dataset)
+            result.line_validation_time_ms = inputs.line_validation_time_ms
+            self._record_data_quality(result, inputs.data_quality_pass, inputs.data_quality_report)
+            results.append(result)
+
+        # STEP 3: classify every dataset that passed, then sign in one pass
+        passed = [(result, inputs) for result, inputs in zip(results, prepared) if inputs.data_quality_pass]
+        step3_start = time.time()
+        signed_predictions = self._sign_predictions(
+            [self._prediction_dict(inputs.latest_features) for _, inputs in passed]
+        )
+        step3_share_ms = (time.time() - step3_start) * 1000 / len(passed) if passed else 0.0
+
+        # STEPS 4-6
+        for (result, inputs), regime_prediction in zip(passed, signed_predictions):
+            result.finn_classification_time_ms = inputs.feature_time_ms + step3_share_ms
+            self._complete_cycle(result, regime_prediction, cds_score, market_inputs=inputs.market_inputs)
+
+        stage_latency = {stage: LatencyHistogram() for stage in BATCH_STAGES}
+        for result in results:
+            result.execution_time_ms = sum(getattr(result, attr) for stage, attr in BATCH_STAGES.items()
+                                           if stage != 'execution')
+            for stage, attr in BATCH_STAGES.items():
+                if stage == 'execution' or getattr(result, attr) > 0:
+                    stage_latency[stage].record(getattr(result, attr))
+
+        return BatchExecutionResult(
+            results=results,
+            stage_latency=stage_latency,
+            wall_time_ms=(time.time() - batch_start_time) * 1000,
+            max_workers=max_workers
+        )
+
+    def _prepare_cycles(self, datasets: List[OHLCVDataset], max_workers: int) -> List[PreparedCycleInputs]:
+        """Run prepare_cycle_inputs for every dataset, in a process pool if max_workers > 1."""
+        if max_workers <= 1:
+            return [prepare_cycle_inputs(self.line_validator, self.finn_classifier, dataset)
+                    for dataset in datasets]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(prepare_cycle_inputs,
+                                     [self.line_validator] * len(datasets),
+                                     [self.finn_classifier] * len(datasets),
+                                     datasets))
+
+    def _sign_predictions(self, prediction_dicts: List[Dict[str, Any]]) -> List[SignedPrediction]:
+        """
+        Sign (and verify) a batch of prediction payloads (ADR-008).
+
+        Signed inline: the cycle waits for the signatures anyway, and a
+        long-lived SigningService worker thread would outlive the
+        orchestrator and be alive when _prepare_cycles forks its pool.
+        """
+        return sign_regime_predictions(prediction_dicts, self.finn_signer)
+
+    def _new_cycle_result(self, ohlcv_dataset: OHLCVDataset) -> OrchestratorCycleResult:
+        """Step 1: count the cycle and wrap the ingested dataset in a fresh result."""
         self.cycle_count += 1
 
         # Generate cycle ID
         cycle_id = f"T1-{datetime.now().strftime('%Y%m%d%H%M%S')}-{self.cycle_count:04d}"
 
-        # Initialize result
-        result = OrchestratorCycleResult(
+        return OrchestratorCycleResult(
             cycle_id=cycle_id,
             timestamp=datetime.now(),
             symbol=ohlcv_dataset.symbol,
@@ -305,31 +626,33 @@ class Tier1Orchestrator:
             data_bar_count=ohlcv_dataset.get_bar_count()
         )
 
-        # STEP 2: LINE+ Data Quality Validation
-        step2_start = time.time()
-        data_quality_pass, data_quality_report = self._validate_data_quality(ohlcv_dataset)
-        step2_duration = (time.time() - step2_start) * 1000
-
+    @staticmethod
+    def _record_data_quality(result: OrchestratorCycleResult,
+                             data_quality_pass: bool,
+                             data_quality_report: DataQualityReport) -> bool:
+        """Store the Step 2 outcome; returns False (and marks the failure) if the gate failed."""
         result.data_quality_report = data_quality_report
         result.data_quality_pass = data_quality_pass
-        result.line_validation_time_ms = step2_duration
 
         if not data_quality_pass:
             result.pipeline_success = False
             result.failure_step = "Step 2: LINE+ Data Quality Validation"
             result.failure_reason = f"Data quality check failed: {len(data_quality_report.get_failures())} issues"
-            result.execution_time_ms = (time.time() - cycle_start_time) * 1000
-            return result
+        return data_quality_pass
 
-        # STEP 3: FINN+ Regime Classification
-        step3_start = time.time()
-        regime_prediction = self._classify_regime(ohlcv_dataset)
-        step3_duration = (time.time() - step3_start) * 1000
+    def _complete_cycle(self,
+                        result: OrchestratorCycleResult,
+                        regime_prediction: SignedPrediction,
+                        cds_score: Optional[float] = None,
+                        market_inputs: Optional[Dict[str, float]] = None):
+        """
+        Steps 4-6 for a cycle that passed LINE+ validation and was classified.
 
+        Fills result in place (execution_time_ms is left to the caller).
+        """
         result.regime_prediction = regime_prediction
         result.regime_label = regime_prediction.regime_label
         result.regime_confidence = regime_prediction.confidence
-        result.finn_classification_time_ms = step3_duration
 
         # STEP 4: STIG+ Validation
         step4_start = time.time()
@@ -344,8 +667,7 @@ class Tier1Orchestrator:
             result.pipeline_success = False
             result.failure_step = "Step 4: STIG+ Validation"
             result.failure_reason = f"STIG+ validation failed: {len(stig_validation_report.get_failures())} failures"
-            result.execution_time_ms = (time.time() - cycle_start_time) * 1000
-            return result
+            return
 
         # STEP 5: Relevance Engine
         step5_start = time.time()
@@ -362,10 +684,11 @@ class Tier1Orchestrator:
         # STEP 6: CDS Engine (Week 3+)
         step6_start = time.time()
         cds_result = self._compute_cds(
-            ohlcv_dataset=ohlcv_dataset,
+            ohlcv_dataset=result.ohlcv_dataset,
             regime_prediction=regime_prediction,
-            data_quality_report=data_quality_report,
-            regime_weight=regime_weight
+            data_quality_report=result.data_quality_report,
+            regime_weight=regime_weight,
+            market_inputs=market_inputs
         )
         step6_duration = (time.time() - step6_start) * 1000
 
@@ -382,7 +705,6 @@ class Tier1Orchestrator:
 
         # Pipeline success
         result.pipeline_success = True
-        result.execution_time_ms = (time.time() - cycle_start_time) * 1000
 
         # Cost tracking (ADR-012)
         # Note: In production, track actual LLM API calls and costs
@@ -391,8 +713,6 @@ class Tier1Orchestrator:
 
         self.total_cost_usd += result.total_cost_usd
 
-        return result
-
     def _validate_data_quality(self, ohlcv_dataset: OHLCVDataset) -> Tuple[bool, DataQualityReport]:
         """
         Step 2: LINE+ Data Quality Validation.
@@ -409,18 +729,18 @@ class Tier1Orchestrator:
 
         Returns: SignedPrediction with Ed25519 signature
         """
-        # Convert to DataFrame
-        price_df = ohlcv_dataset.to_dataframe()
+        # Convert to DataFrame and compute features
+        latest_features = compute_latest_features(self.finn_classifier, ohlcv_dataset.to_dataframe())
 
-        # Compute features
-        features = self.finn_classifier.compute_features(price_df)
-        latest_features = features.iloc[-1]
+        # Sign prediction (ADR-008)
+        return sign_regime_prediction(self._prediction_dict(latest_features), self.finn_signer)
 
+    def _prediction_dict(self, latest_features: pd.Series) -> Dict[str, Any]:
+        """Classify the latest feature row into the (unsigned) prediction payload."""
         # Classify regime
         regime_result = self.finn_classifier.classify_regime(latest_features)
 
-        # Prepare prediction dictionary
-        prediction_dict = {
+        return {
             'regime_label': regime_result.regime_label,
             'regime_state': regime_result.regime_state,
             'confidence': regime_result.confidence,
@@ -439,11 +759,6 @@ class Tier1Orchestrator:
             'validation_reason': 'Valid'
         }
 
-        # Sign prediction (ADR-008)
-        signed_prediction = sign_regime_prediction(prediction_dict, self.finn_signer)
-
-        return signed_prediction
-
     def _validate_regime_prediction(self, signed_prediction: SignedPrediction) -> Tuple[bool, ValidationReport]:
         """
         Step 4: STIG+ Validation.
@@ -480,16 +795,21 @@ class Tier1Orchestrator:
                     ohlcv_dataset: OHLCVDataset,
                     regime_prediction: SignedPrediction,
                     data_quality_report: DataQualityReport,
-                    regime_weight: float) -> CDSResult:
+                    regime_weight: float,
+                    market_inputs: Optional[Dict[str, float]] = None) -> CDSResult:
         """
         Step 6: CDS Engine (Week 3+).
 
         Computes Composite Decision Score from all pipeline components.
 
+        Args:
+            market_inputs: Precomputed compute_market_inputs() for the dataset
+                           (computed here if omitted)
+
         Returns: CDSResult with CDS value and validation
         """
-        # Extract price DataFrame for volatility calculation
-        price_df = ohlcv_dataset.to_dataframe()
+        if market_inputs is None:
+            market_inputs = compute_market_inputs(ohlcv_dataset.to_dataframe())
 
         # Compute 6 CDS components
 
@@ -505,47 +825,15 @@ class Tier1Orchestrator:
         C3 = compute_data_integrity(data_quality_report)
 
         # C4: Causal Coherence (FINN+ Tier-2, Week 3+ Directive 6)
-        # Compute features for Tier-2 input
-        returns = price_df['close'].pct_change().dropna()
-
-        # Z-scored features (20-bar lookback)
-        lookback = min(20, len(price_df))
-        recent_returns = returns.tail(lookback)
-
-        return_z = (recent_returns.mean() / recent_returns.std()) if len(recent_returns) > 0 and recent_returns.std() > 0 else 0.0
-        volatility = returns.std() if len(returns) > 0 else 0.02
-        volatility_z = (volatility - 0.02) / 0.01 if volatility > 0 else 0.0  # Normalize around 2% baseline
-
-        # Drawdown calculation
-        cumulative_returns = (1 + returns).cumprod()
-        running_max = cumulative_returns.expanding().max()
-        drawdown = (cumulative_returns - running_max) / running_max
-        current_drawdown_pct = drawdown.iloc[-1] * 100 if len(drawdown) > 0 else 0.0
-        drawdown_z = (drawdown.mean() / drawdown.std()) if len(drawdown) > 0 and drawdown.std() > 0 else 0.0
-
-        # MACD (simplified: 12-26 EMA difference)
-        close_prices = price_df['close']
-        if len(close_prices) >= 26:
-            ema12 = close_prices.ewm(span=12, adjust=False).mean()
-            ema26 = close_prices.ewm(span=26, adjust=False).mean()
-            macd_diff = ema12 - ema26
-            macd_diff_z = (macd_diff.iloc[-1] / macd_diff.std()) if macd_diff.std() > 0 else 0.0
-        else:
-            macd_diff_z = 0.0
-
-        # Price change over lookback period
-        price_change_pct = ((price_df['close'].iloc[-1] / price_df['close'].iloc[-lookback]) - 1) * 100 if lookback > 0 else 0.0
-
-        # Create Tier-2 input
         tier2_input = Tier2Input(
             regime_label=regime_prediction.regime_label,
             regime_confidence=regime_prediction.confidence,
-            return_z=return_z,
-            volatility_z=volatility_z,
-            drawdown_z=drawdown_z,
-            macd_diff_z=macd_diff_z,
-            price_change_pct=price_change_pct,
-            current_drawdown_pct=current_drawdown_pct
+            return_z=market_inputs['return_z'],
+            volatility_z=market_inputs['volatility_z'],
+            drawdown_z=market_inputs['drawdown_z'],
+            macd_diff_z=market_inputs['macd_diff_z'],
+            price_change_pct=market_inputs['price_change_pct'],
+            current_drawdown_pct=market_inputs['current_drawdown_pct']
         )
 
         # Compute causal coherence with FINN+ Tier-2
@@ -556,9 +844,7 @@ class Tier1Orchestrator:
         self.total_cost_usd += tier2_result.llm_cost_usd
 
         # C5: Market Stress Modulator (volatility)
-        returns = price_df['close'].pct_change().dropna()
-        volatility = returns.std() if len(returns) > 0 else 0.02
-        C5 = compute_stress_modulator(volatility, max_volatility=0.05)
+        C5 = compute_stress_modulator(market_inputs['volatility'], max_volatility=0.05)
 
         # C6: Relevance Alignment (regime weight normalized)
         relevance_score = regime_weight  # Using regime weight directly
@@ -709,56 +995,26 @@ def run_test_harness(orchestrator: Tier1Orchestrator):
     print("=" * 80)
 
 
-def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, interval: str, adapter: str):
-    """
-    Run a single live production cycle using real data adapters.
+# Interval string → OHLCVInterval
+LIVE_INTERVALS = {
+    "1m": OHLCVInterval.MIN_1,
+    "5m": OHLCVInterval.MIN_5,
+    "15m": OHLCVInterval.MIN_15,
+    "1h": OHLCVInterval.HOUR_1,
+    "4h": OHLCVInterval.HOUR_4,
+    "1d": OHLCVInterval.DAY_1,
+    "1w": OHLCVInterval.WEEK_1,
+}
 
-    Args:
-        orchestrator: Tier1Orchestrator instance
-        symbol: Trading symbol (e.g., "BTC/USDT", "SPY", "AAPL")
-        interval: Time interval (e.g., "1d", "1h", "15m")
-        adapter: Data source adapter ("binance", "yahoo", "alpaca")
-    """
-    import logging
-
-    logging.info("=" * 70)
-    logging.info("PRODUCTION MODE ACTIVE — Live data adapters engaged")
-    logging.info("=" * 70)
-
-    print("\n" + "=" * 80)
-    print("TIER-1 ORCHESTRATOR — LIVE PRODUCTION MODE")
-    print("=" * 80)
-    print(f"\n🔴 PRODUCTION MODE ACTIVE — Live data adapters engaged")
-    print(f"    Symbol: {symbol}")
-    print(f"    Interval: {interval}")
-    print(f"    Adapter: {adapter}")
-    print(f"    FINN+ public key: {orchestrator.finn_signer.get_public_key_hex()}")
 
-    # Import production adapters
-    from datetime import datetime, timedelta, timezone
+def _create_data_adapter(adapter: str):
+    """Production data adapter by name (None if unknown)."""
     from production_data_adapters import (
         BinanceAdapter,
         YahooFinanceAdapter,
         AlpacaAdapter
     )
     from line_data_ingestion import DataSourceConfig
-    from line_ohlcv_contracts import OHLCVInterval, OHLCVDataset
-
-    # Map interval string to OHLCVInterval
-    interval_map = {
-        "1m": OHLCVInterval.MIN_1,
-        "5m": OHLCVInterval.MIN_5,
-        "15m": OHLCVInterval.MIN_15,
-        "1h": OHLCVInterval.HOUR_1,
-        "4h": OHLCVInterval.HOUR_4,
-        "1d": OHLCVInterval.DAY_1,
-        "1w": OHLCVInterval.WEEK_1,
-    }
-
-    ohlcv_interval = interval_map.get(interval, OHLCVInterval.DAY_1)
-
-    # Initialize appropriate adapter
-    print(f"\n[1] Initializing {adapter} adapter...")
 
     if adapter == "binance":
         config = DataSourceConfig(
@@ -766,16 +1022,15 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
             base_url="https://api.binance.com",
             rate_limit_per_minute=1200
         )
-        data_adapter = BinanceAdapter(config)
+        return BinanceAdapter(config)
     elif adapter == "yahoo":
         config = DataSourceConfig(
             source_name="yahoo",
             base_url="https://query1.finance.yahoo.com",
             rate_limit_per_minute=100
         )
-        data_adapter = YahooFinanceAdapter(config)
+        return YahooFinanceAdapter(config)
     elif adapter == "alpaca":
-        import os
         config = DataSourceConfig(
             source_name="alpaca",
             base_url="https://data.alpaca.markets",
@@ -783,12 +1038,15 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
             api_secret=os.environ.get("ALPACA_API_SECRET", ""),
             rate_limit_per_minute=200
         )
-        data_adapter = AlpacaAdapter(config)
-    else:
-        print(f"    ❌ Unknown adapter: {adapter}")
-        return None
+        return AlpacaAdapter(config)
+    return None
 
-    print(f"    ✅ {adapter.capitalize()} adapter initialized")
+
+def _fetch_live_dataset(data_adapter, symbol: str, interval: str, adapter: str) -> Optional[OHLCVDataset]:
+    """Fetch ~300 bars of live data for one symbol/interval (None on failure)."""
+    from datetime import timedelta, timezone
+
+    ohlcv_interval = LIVE_INTERVALS.get(interval, OHLCVInterval.DAY_1)
 
     # Calculate lookback based on interval (need ~300 bars for feature calculation)
     lookback_map = {
@@ -833,20 +1091,15 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
         print(f"    ✅ Fetched {dataset.get_bar_count()} bars")
         print(f"    Date range: {dataset.bars[0].timestamp} → {dataset.bars[-1].timestamp}")
         print(f"    Price: ${dataset.bars[0].close:.2f} → ${dataset.bars[-1].close:.2f}")
+        return dataset
 
     except Exception as e:
         print(f"    ❌ Failed to fetch data: {e}")
         return None
 
-    # Execute production cycle
-    print(f"\n[3] Executing production cycle...")
-
-    result = orchestrator.execute_cycle(dataset)
-
-    print(f"\n{result.get_summary()}")
 
-    # Log to CDS tables (if database available)
-    print(f"\n[4] Logging to CDS tables...")
+def _log_cycle_persistence(result: OrchestratorCycleResult):
+    """Log one cycle to the CDS tables (persistence signature = hash of cycle data)."""
     if result.pipeline_success:
         # Format values safely for logging
         cds_log = f"{result.cds_value:.4f}" if result.cds_value is not None else "N/A"
@@ -855,7 +1108,6 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
         relevance_log = f"{result.relevance:.4f}" if result.relevance is not None else "N/A"
 
         # Generate persistence signature (hash of cycle data)
-        import hashlib
         sig_data = f"{result.cycle_id}:{regime_log}:{cds_log}:{result.timestamp.isoformat()}"
         persistence_sig = hashlib.sha256(sig_data.encode()).hexdigest()[:16].upper()
 
@@ -870,6 +1122,57 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
         print(f"    ⚠️ Pipeline failed - no data to persist")
         print(f"    Failure: {result.failure_reason}")
 
+
+def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, interval: str, adapter: str):
+    """
+    Run a single live production cycle using real data adapters.
+
+    Args:
+        orchestrator: Tier1Orchestrator instance
+        symbol: Trading symbol (e.g., "BTC/USDT", "SPY", "AAPL")
+        interval: Time interval (e.g., "1d", "1h", "15m")
+        adapter: Data source adapter ("binance", "yahoo", "alpaca")
+    """
+    import logging
+
+    logging.info("=" * 70)
+    logging.info("PRODUCTION MODE ACTIVE — Live data adapters engaged")
+    logging.info("=" * 70)
+
+    print("\n" + "=" * 80)
+    print("TIER-1 ORCHESTRATOR — LIVE PRODUCTION MODE")
+    print("=" * 80)
+    print(f"\n🔴 PRODUCTION MODE ACTIVE — Live data adapters engaged")
+    print(f"    Symbol: {symbol}")
+    print(f"    Interval: {interval}")
+    print(f"    Adapter: {adapter}")
+    print(f"    FINN+ public key: {orchestrator.finn_signer.get_public_key_hex()}")
+
+    # Initialize appropriate adapter
+    print(f"\n[1] Initializing {adapter} adapter...")
+
+    data_adapter = _create_data_adapter(adapter)
+    if data_adapter is None:
+        print(f"    ❌ Unknown adapter: {adapter}")
+        return None
+
+    print(f"    ✅ {adapter.capitalize()} adapter initialized")
+
+    dataset = _fetch_live_dataset(data_adapter, symbol, interval, adapter)
+    if dataset is None:
+        return None
+
+    # Execute production cycle
+    print(f"\n[3] Executing production cycle...")
+
+    result = orchestrator.execute_cycle(dataset)
+
+    print(f"\n{result.get_summary()}")
+
+    # Log to CDS tables (if database available)
+    print(f"\n[4] Logging to CDS tables...")
+    _log_cycle_persistence(result)
+
     # Production cycle complete
     print("\n" + "=" * 80)
     status_icon = "✅" if result.pipeline_success else "⚠️"
@@ -891,6 +1194,51 @@ def run_live_production_cycle(orchestrator: Tier1Orchestrator, symbol: str, inte
     return result
 
 
+def run_live_production_batch(orchestrator: Tier1Orchestrator,
+                              symbols: List[str],
+                              intervals: List[str],
+                              adapter: str,
+                              max_workers: Optional[int] = None) -> Optional[BatchExecutionResult]:
+    """
+    Run live production cycles for every symbol × interval with one execute_batch.
+
+    The adapter is created once, all datasets are fetched, processed in one
+    batch, and persisted together.
+    """
+    print("\n" + "=" * 80)
+    print("TIER-1 ORCHESTRATOR — LIVE PRODUCTION BATCH")
+    print("=" * 80)
+    print(f"    Symbols: {', '.join(symbols)}")
+    print(f"    Intervals: {', '.join(intervals)}")
+    print(f"    Adapter: {adapter}")
+
+    print(f"\n[1] Initializing {adapter} adapter...")
+    data_adapter = _create_data_adapter(adapter)
+    if data_adapter is None:
+        print(f"    ❌ Unknown adapter: {adapter}")
+        return None
+
+    datasets = []
+    for symbol in symbols:
+        for interval in intervals:
+            dataset = _fetch_live_dataset(data_adapter, symbol, interval, adapter)
+            if dataset is not None:
+                datasets.append(dataset)
+    if not datasets:
+        print("    ❌ No data fetched")
+        return None
+
+    print(f"\n[3] Executing production batch ({len(datasets)} datasets)...")
+    batch = orchestrator.execute_batch(datasets, max_workers=max_workers)
+    print(f"\n{batch.get_summary()}")
+
+    print(f"\n[4] Logging to CDS tables...")
+    for result in batch.results:
+        _log_cycle_persistence(result)
+
+    return batch
+
+
 if __name__ == "__main__":
     """
     Tier-1 Orchestrator Entry Point
@@ -903,6 +1251,9 @@ if __name__ == "__main__":
             python tier1_orchestrator.py --mode production --live 1 --symbol BTC/USDT --adapter binance
             python tier1_orchestrator.py --live 1 --symbol SPY --adapter yahoo
             python tier1_orchestrator.py --live 1 --symbol AAPL --interval 1h --adapter alpaca
+
+        Production batch (comma-separated symbols and/or intervals):
+            python tier1_orchestrator.py --live 1 --symbol SPY,QQQ,AAPL --interval 1d,1h --adapter yahoo
     """
     import argparse
     import logging
@@ -932,13 +1283,13 @@ if __name__ == "__main__":
         "--symbol",
         type=str,
         default="BTC/USDT",
-        help="Trading symbol (e.g., BTC/USDT, SPY, AAPL)"
+        help="Trading symbol(s), comma-separated for a batch (e.g., BTC/USDT, SPY,AAPL)"
     )
     parser.add_argument(
         "--interval",
         type=str,
         default="1d",
-        help="Time interval (1m, 5m, 15m, 1h, 4h, 1d, 1w)"
+        help="Time interval(s), comma-separated for a batch (1m, 5m, 15m, 1h, 4h, 1d, 1w)"
     )
     parser.add_argument(
         "--adapter",
@@ -946,6 +1297,12 @@ if __name__ == "__main__":
         default="yahoo",
         help="Data source adapter"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch execution (default: one per CPU)"
+    )
 
     args = parser.parse_args()
 
@@ -965,12 +1322,24 @@ if __name__ == "__main__":
 
         logging.info("PRODUCTION MODE ACTIVE — Live data adapters engaged")
 
-        run_live_production_cycle(
-            orchestrator=orchestrator,
-            symbol=args.symbol,
-            interval=args.interval,
-            adapter=args.adapter
-        )
+        symbols = [symbol.strip() for symbol in args.symbol.split(",") if symbol.strip()]
+        intervals = [interval.strip() for interval in args.interval.split(",") if interval.strip()]
+
+        if len(symbols) * len(intervals) > 1:
+            run_live_production_batch(
+                orchestrator=orchestrator,
+                symbols=symbols,
+                intervals=intervals,
+                adapter=args.adapter,
+                max_workers=args.workers
+            )
+        else:
+            run_live_production_cycle(
+                orchestrator=orchestrator,
+                symbol=args.symbol,
+                interval=args.interval,
+                adapter=args.adapter
+            )
 
     else:
         # ==========================================
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- MIGRATION 365: DEFCON STATE CHANGE NOTIFICATIONS
+-- ============================================================================
+-- Authority: ADR-016 DEFCON Protocol
+-- Purpose: Push fhq_governance.defcon_state changes to in-process DEFCON
+--          caches (03_FUNCTIONS/defcon_state_provider.py) via LISTEN/NOTIFY
+-- Executor: STIG (EC-003)
+--
+-- SCOPE:
+--   - pg_notify('defcon_state_changed', ...) after every INSERT/UPDATE/DELETE
+--     on fhq_governance.defcon_state
+--   - Payload is advisory; listeners re-read the is_current row
+--
+-- CONSTRAINTS:
+--   - No change to defcon_state contents or DEFCON functions
+--   - Listeners keep a fallback poll and fail closed when stale, so a
+--     dropped notification cannot leave a stale level in service
+-- ============================================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION fhq_governance.notify_defcon_state_changed()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_row RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_row := OLD;
+    ELSE
+        v_row := NEW;
+    END IF;
+
+    PERFORM pg_notify('defcon_state_changed', json_build_object(
+        'op', TG_OP,
+        'defcon_level', v_row.defcon_level,
+        'is_current', v_row.is_current,
+        'triggered_at', v_row.triggered_at
+    )::text);
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_notify_defcon_state_changed ON fhq_governance.defcon_state;
+
+CREATE TRIGGER trg_notify_defcon_state_changed
+AFTER INSERT OR UPDATE OR DELETE ON fhq_governance.defcon_state
+FOR EACH ROW EXECUTE FUNCTION fhq_governance.notify_defcon_state_changed();
+
+COMMENT ON FUNCTION fhq_governance.notify_defcon_state_changed() IS
+'Migration 365: NOTIFY defcon_state_changed on every defcon_state change for in-process DEFCON caches.';
+
+COMMIT;
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+--
+-- 1. Trigger installed:
+-- SELECT tgname FROM pg_trigger
+-- WHERE tgrelid = 'fhq_governance.defcon_state'::regclass
+--   AND tgname = 'trg_notify_defcon_state_changed';
+--
+-- 2. Notification delivered (in psql):
+-- LISTEN defcon_state_changed;
+-- UPDATE fhq_governance.defcon_state SET is_current = is_current WHERE is_current;
+-- ============================================================================
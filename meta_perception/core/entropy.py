@@ -6,7 +6,8 @@ from datetime import datetime
 
 from meta_perception.models.entropy_models import EntropyMetrics
 from meta_perception.models.config_models import PerceptionConfig
-from meta_perception.utils.math_utils import compute_entropy
+from meta_perception.core.rolling import RollingFeatureCache
+from meta_perception.utils.math_utils import compute_entropy, compute_entropy_rows
 from meta_perception.utils.id_generation import _generate_id
 
 
@@ -15,14 +16,15 @@ def compute_market_entropy(
     window_minutes: int = 60,
     n_bins: int = 50,
     config: Optional[PerceptionConfig] = None,
-    diagnostic_logger: Optional[Any] = None
+    diagnostic_logger: Optional[Any] = None,
+    rolling_cache: Optional[RollingFeatureCache] = None
 ) -> EntropyMetrics:
     """
     Compute information entropy of market.
 
     Pure function: Same inputs → same output.
 
-    Algorithm:
+    Algorithm (all features of equal length in one matrix pass):
     1. Discretize price returns into bins
     2. Compute probability distribution p(x)
     3. H = -Σ p(x) log p(x)
@@ -34,6 +36,7 @@ def compute_market_entropy(
         n_bins: Number of bins for discretization
         config: Optional configuration
         diagnostic_logger: Optional diagnostic logger
+        rolling_cache: Optional cross-cycle cache (returns and entropies reused)
 
     Returns:
         EntropyMetrics with market_entropy, feature_entropy, etc.
@@ -48,16 +51,7 @@ def compute_market_entropy(
         )
 
     # Compute feature-level entropy
-    feature_entropy = {}
-    for feature, values in market_data.items():
-        if len(values) > 1:
-            # Compute returns
-            arr = np.array(values)
-            returns = np.diff(arr) / arr[:-1]
-
-            # Compute entropy
-            h = compute_entropy(returns.tolist(), n_bins=n_bins)
-            feature_entropy[feature] = h
+    feature_entropy = _compute_feature_entropies(market_data, n_bins, rolling_cache)
 
     # Market entropy: average of feature entropies
     if feature_entropy:
@@ -112,3 +106,50 @@ def compute_feature_entropy(feature_values: List[float], n_bins: int = 50) -> fl
         H(feature) in bits
     """
     return compute_entropy(feature_values, n_bins=n_bins)
+
+
+def _compute_feature_entropies(
+    market_data: Dict[str, List[float]],
+    n_bins: int,
+    rolling_cache: Optional[RollingFeatureCache] = None
+) -> Dict[str, float]:
+    """
+    Entropy of returns for every feature with more than one value.
+
+    Equal-length, finite return series are stacked and binned in a single
+    compute_entropy_rows call; anything else (NaN/inf returns) goes through
+    compute_entropy so edge-case behaviour is unchanged.
+    """
+    returns_by_feature = {}
+    for feature, values in market_data.items():
+        if len(values) > 1:
+            if rolling_cache is not None:
+                returns_by_feature[feature] = rolling_cache.returns(feature)
+            else:
+                arr = np.array(values)
+                returns_by_feature[feature] = np.diff(arr) / arr[:-1]
+
+    entropies: Dict[str, float] = {}
+    groups: Dict[int, List[str]] = {}
+    for feature, returns in returns_by_feature.items():
+        if rolling_cache is not None:
+            cached = rolling_cache.peek(feature, ("entropy", n_bins))
+            if cached is not None:
+                entropies[feature] = cached
+                continue
+        if np.isfinite(returns).all():
+            groups.setdefault(len(returns), []).append(feature)
+        else:
+            entropies[feature] = compute_entropy(returns.tolist(), n_bins=n_bins)
+
+    for features in groups.values():
+        matrix = np.vstack([returns_by_feature[f] for f in features]).astype(np.float64)
+        for feature, h in zip(features, compute_entropy_rows(matrix, n_bins=n_bins)):
+            entropies[feature] = float(h)
+
+    if rolling_cache is not None:
+        for feature, h in entropies.items():
+            rolling_cache.store(feature, ("entropy", n_bins), h)
+
+    # Preserve market_data order (market entropy is a mean over this dict)
+    return {feature: entropies[feature] for feature in returns_by_feature}
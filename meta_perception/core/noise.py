@@ -4,6 +4,7 @@ import numpy as np
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from meta_perception.core.rolling import RollingFeatureCache
 from meta_perception.models.noise_models import NoiseScore
 from meta_perception.utils.id_generation import _generate_id
 
@@ -12,7 +13,8 @@ def evaluate_noise_level(
     market_data: Dict[str, List[float]],
     window_minutes: int = 60,
     noise_threshold: float = 0.7,
-    diagnostic_logger: Optional[Any] = None
+    diagnostic_logger: Optional[Any] = None,
+    rolling_cache: Optional[RollingFeatureCache] = None
 ) -> NoiseScore:
     """
     Evaluate noise-to-signal ratio.
@@ -29,6 +31,7 @@ def evaluate_noise_level(
         market_data: Price time series
         window_minutes: Analysis window
         noise_threshold: Acceptable noise level
+        rolling_cache: Optional cross-cycle cache (window arrays reused)
 
     Returns:
         NoiseScore with noise_level, signal_quality, is_acceptable
@@ -48,7 +51,7 @@ def evaluate_noise_level(
         if len(values) < 10:
             continue
 
-        arr = np.array(values)
+        arr = rolling_cache.values(feature) if rolling_cache is not None else np.array(values)
 
         # Simple trend: moving average
         window = min(10, len(arr) // 2)
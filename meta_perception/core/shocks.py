@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 
 from meta_perception.models.shock_models import ShockEvent
 from meta_perception.models.config_models import PerceptionConfig
-from meta_perception.utils.math_utils import detect_outliers
+from meta_perception.core.rolling import RollingFeatureCache
 from meta_perception.utils.id_generation import generate_shock_id
 
 
@@ -15,7 +15,8 @@ def detect_shocks(
     timestamps: Optional[List[datetime]] = None,
     threshold_std_devs: float = 3.0,
     config: Optional[PerceptionConfig] = None,
-    diagnostic_logger: Optional[Any] = None
+    diagnostic_logger: Optional[Any] = None,
+    rolling_cache: Optional[RollingFeatureCache] = None
 ) -> List[ShockEvent]:
     """
     Detect information shocks BEFORE price reacts.
@@ -23,8 +24,8 @@ def detect_shocks(
     Pure function.
 
     Algorithm:
-    1. For each feature, compute rolling mean and std
-    2. Detect outliers: |x - μ| > k×σ
+    1. For each feature, compute rolling mean and std (once)
+    2. Detect outliers: |x - μ| > k×σ (vectorized z-scores)
     3. Compute shock intensity
     4. Classify shock type
 
@@ -34,6 +35,7 @@ def detect_shocks(
         threshold_std_devs: Detection threshold (default 3.0)
         config: Optional configuration
         diagnostic_logger: Optional diagnostic logger
+        rolling_cache: Optional cross-cycle cache (window mean/std reused)
 
     Returns:
         List of ShockEvent objects (sorted by intensity)
@@ -47,23 +49,26 @@ def detect_shocks(
         if len(values) < 10:
             continue
 
-        # Detect outliers
-        outlier_indices = detect_outliers(values, threshold_std=threshold_std_devs)
-
-        for idx in outlier_indices:
-            if idx >= len(timestamps):
-                continue
-
-            # Compute shock statistics
+        # Window statistics, computed once per feature
+        if rolling_cache is not None:
+            arr = rolling_cache.values(feature)
+            mean, std = rolling_cache.memo(feature, "mean_std", lambda a=arr: (np.mean(a), np.std(a)))
+        else:
             arr = np.array(values)
             mean = np.mean(arr)
             std = np.std(arr)
 
-            if std == 0:
-                continue
+        if std == 0:
+            continue
+
+        # Detect outliers: |x - μ| > k×σ (same test as detect_outliers)
+        z_scores = np.abs((arr - mean) / std)
+        outlier_indices = np.flatnonzero(z_scores > threshold_std_devs)
+        outlier_indices = outlier_indices[outlier_indices < len(timestamps)]
 
+        for idx in outlier_indices.tolist():
             shock_value = values[idx]
-            z_score = abs((shock_value - mean) / std)
+            z_score = z_scores[idx]
 
             # Shock intensity
             intensity = z_score / 3.0  # Normalize
@@ -1,7 +1,7 @@
 """Entropy models for Meta-Perception Layer."""
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Literal, Optional
 from datetime import datetime
 from meta_perception.models.base import frozen
 
@@ -68,6 +68,3 @@ class SignalEntropy(BaseModel):
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-
-# Import Optional after class definitions to avoid circular imports
-from typing import Optional
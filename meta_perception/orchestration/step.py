@@ -1,7 +1,9 @@
 """Main orchestration function - the perception cycle."""
 
+import threading
 import time
-from typing import Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, Optional
 from datetime import datetime
 
 from meta_perception.models.perception_state import PerceptionState, PerceptionSnapshot, PerceptionDelta
@@ -17,16 +19,25 @@ from meta_perception.core import (
     compute_total_uncertainty,
     create_perception_state
 )
+from meta_perception.core.rolling import RollingFeatureCache
 from meta_perception.utils.id_generation import generate_snapshot_id, generate_decision_id
 from meta_perception.utils.profiling import PerformanceProfiler
 
 
+# Shared pool for independent perception stages (created on first parallel step)
+_STAGE_POOL_SIZE = 6
+_stage_pool: Optional[ThreadPoolExecutor] = None
+_stage_pool_lock = threading.Lock()
+
+
 def step(
     state: PerceptionState,
     inputs: MetaPerceptionInput,
     config: PerceptionConfig,
     enable_diagnostics: bool = True,
-    enable_importance: bool = True
+    enable_importance: bool = True,
+    parallel: bool = True,
+    rolling_cache: Optional[RollingFeatureCache] = None
 ) -> Tuple[PerceptionState, MetaPerceptionOutput]:
     """
     MAIN ORCHESTRATION FUNCTION.
@@ -37,13 +48,14 @@ def step(
     All sub-computations are delegated to pure functions.
 
     Algorithm:
-    1. Compute entropy metrics
-    2. Evaluate noise level
-    3. Infer participant intent
-    4. Compute reflexivity
-    5. Detect shocks
-    6. Detect regime pivots
-    7. Aggregate into new PerceptionState
+    1. Compute entropy metrics       ┐
+    2. Evaluate noise level          │
+    3. Infer participant intent      │ independent - run concurrently
+    4. Compute reflexivity           │ when parallel=True
+    5. Detect shocks                 │
+    6. Detect regime pivots          ┘
+    7. Compute total uncertainty (waits on 1, 2, 4, 6 only)
+       Aggregate into new PerceptionState
     8. Compute PerceptionDelta (if previous state exists)
     9. Make MetaPerceptionDecision
     10. Generate PerceptionSnapshot
@@ -55,6 +67,10 @@ def step(
         config: Configuration parameters
         enable_diagnostics: Enable diagnostic logging
         enable_importance: Enable feature importance computation
+        parallel: Run independent stages on the shared stage pool.
+            Outputs are identical to sequential execution.
+        rolling_cache: Optional RollingFeatureCache reused across cycles
+            (incremental returns, memoized per-window statistics)
 
     Returns:
         (new_state, output) tuple
@@ -64,56 +80,55 @@ def step(
     profiler = PerformanceProfiler(enabled=True)
     start_time = time.perf_counter()
 
-    # 1. Entropy
-    with profiler.profile("entropy"):
-        entropy_metrics = compute_market_entropy(
+    if rolling_cache is not None:
+        with profiler.profile("rolling_update"):
+            rolling_cache.update(inputs.market_data)
+
+    # Extract leading indicators from features
+    leading_indicators = _extract_leading_indicators(inputs.features)
+
+    # 1-6. Independent stages (each reads only inputs/state)
+    stages = {
+        "entropy": lambda: compute_market_entropy(
             market_data=inputs.market_data,
             window_minutes=config.entropy_window_minutes,
-            config=config
-        )
-
-    # 2. Noise
-    with profiler.profile("noise"):
-        noise_score = evaluate_noise_level(
+            config=config,
+            rolling_cache=rolling_cache
+        ),
+        "noise": lambda: evaluate_noise_level(
             market_data=inputs.market_data,
-            noise_threshold=config.noise_threshold
-        )
-
-    # 3. Intent
-    with profiler.profile("intent"):
-        intent_score = infer_intent(
+            noise_threshold=config.noise_threshold,
+            rolling_cache=rolling_cache
+        ),
+        "intent": lambda: infer_intent(
             features=inputs.features,
             config=config
-        )
-
-    # 4. Reflexivity
-    with profiler.profile("reflexivity"):
-        reflexivity_score = compute_reflexive_impact(
+        ),
+        "reflexivity": lambda: compute_reflexive_impact(
             previous_decisions=inputs.recent_decisions,
             market_data=inputs.market_data,
             lookback_days=config.reflexivity_window_days
-        )
-
-    # 5. Shocks
-    with profiler.profile("shocks"):
-        shock_events = detect_shocks(
+        ),
+        "shocks": lambda: detect_shocks(
             time_series_data=inputs.market_data,
             threshold_std_devs=config.shock_intensity_threshold,
-            config=config
-        )
-
-    # 6. Regime
-    with profiler.profile("regime"):
-        # Extract leading indicators from features
-        leading_indicators = _extract_leading_indicators(inputs.features)
-
-        regime_alert = detect_regime_pivot(
+            config=config,
+            rolling_cache=rolling_cache
+        ),
+        "regime": lambda: detect_regime_pivot(
             perception_state=state,
             leading_indicators=leading_indicators,
             stress_threshold=config.regime_stress_threshold
-        )
+        ),
+    }
+    results = _run_stages(stages, profiler, parallel)
+
+    entropy_metrics = results["entropy"]
+    noise_score = results["noise"]
+    reflexivity_score = results["reflexivity"]
+    regime_alert = results["regime"]
 
-    # 7. Total uncertainty
+    # 7. Total uncertainty (needs entropy, noise, reflexivity, regime)
     with profiler.profile("uncertainty"):
         total_uncertainty = compute_total_uncertainty(
             entropy_metrics=entropy_metrics,
@@ -123,6 +138,10 @@ def step(
             config=config
         )
 
+    # Remaining stages may still be running
+    intent_score = results["intent"]
+    shock_events = results["shocks"]
+
     # 8. Create new state
     with profiler.profile("state_creation"):
         new_state = create_perception_state(
@@ -174,6 +193,52 @@ def step(
     return new_state, output
 
 
+class _Resolved:
+    """Stage results that block on first access (parallel mode)."""
+
+    def __init__(self, futures: Dict[str, Future]):
+        self._futures = futures
+
+    def __getitem__(self, name: str) -> Any:
+        return self._futures[name].result()
+
+
+def _get_stage_pool() -> ThreadPoolExecutor:
+    """Lazily create the process-wide stage pool."""
+    global _stage_pool
+    if _stage_pool is None:
+        with _stage_pool_lock:
+            if _stage_pool is None:
+                _stage_pool = ThreadPoolExecutor(
+                    max_workers=_STAGE_POOL_SIZE,
+                    thread_name_prefix="perception-stage"
+                )
+    return _stage_pool
+
+
+def _run_stages(
+    stages: Dict[str, Callable[[], Any]],
+    profiler: PerformanceProfiler,
+    parallel: bool
+):
+    """
+    Run independent stages, sequentially or on the stage pool.
+
+    Each stage is profiled under its own name in both modes. In parallel
+    mode the returned mapping blocks per stage, so dependants start as soon
+    as their own inputs are ready.
+    """
+    def profiled(name: str, fn: Callable[[], Any]) -> Any:
+        with profiler.profile(name):
+            return fn()
+
+    if not parallel:
+        return {name: profiled(name, fn) for name, fn in stages.items()}
+
+    pool = _get_stage_pool()
+    return _Resolved({name: pool.submit(profiled, name, fn) for name, fn in stages.items()})
+
+
 def _extract_leading_indicators(features: dict) -> dict:
     """Extract leading indicators from feature dict."""
     return {
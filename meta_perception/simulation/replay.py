@@ -0,0 +1,217 @@
+"""Tick-stream replay harness for step() latency profiling."""
+import argparse
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from meta_perception.core.rolling import RollingFeatureCache
+from meta_perception.models.config_models import PerceptionConfig
+from meta_perception.models.decision_models import MetaPerceptionInput, MetaPerceptionOutput
+from meta_perception.models.perception_state import PerceptionState
+from meta_perception.orchestration.step import step
+from meta_perception.utils.profiling import PerformanceProfiler
+
+
+@dataclass
+class ReplayReport:
+    """Per-stage latency percentiles for a replayed tick stream."""
+    n_ticks: int
+    n_steps: int
+    window: int
+    parallel: bool
+    rolling_cache: bool
+    stage_percentiles: Dict[str, Dict[str, float]]
+    performance_gate_pass_rate: float
+    cache_stats: Dict[str, int] = field(default_factory=dict)
+    outputs: List[MetaPerceptionOutput] = field(default_factory=list)
+
+    def format_table(self) -> str:
+        """Human-readable p50/p99 table."""
+        lines = [
+            f"Replay: {self.n_steps} steps over {self.n_ticks} ticks "
+            f"(window={self.window}, parallel={self.parallel}, rolling_cache={self.rolling_cache})",
+            f"{'stage':<16}{'p50 ms':>10}{'p99 ms':>10}{'count':>8}",
+        ]
+        for name, stats in self.stage_percentiles.items():
+            lines.append(f"{name:<16}{stats['p50']:>10.3f}{stats['p99']:>10.3f}{stats['count']:>8}")
+        lines.append(f"Performance gate pass rate: {self.performance_gate_pass_rate:.1%}")
+        if self.cache_stats:
+            lines.append(f"Rolling cache: {self.cache_stats}")
+        return "\n".join(lines)
+
+
+def generate_tick_stream(
+    n_ticks: int = 1000,
+    symbols: Iterable[str] = ("BTC", "ETH", "SOL"),
+    seed: int = 42
+) -> List[Dict[str, Any]]:
+    """
+    Generate a synthetic recorded tick stream.
+
+    Prices follow geometric random walks with occasional jumps, plus a
+    slow-moving funding series, so the shock and entropy stages see
+    realistic work.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = list(symbols)
+    prices = {s: 100.0 * (i + 1) for i, s in enumerate(symbols)}
+    funding = 0.0001
+    start = datetime(2025, 1, 1)
+
+    ticks = []
+    for t in range(n_ticks):
+        for s in symbols:
+            jump = rng.normal(0, 0.05) if rng.random() < 0.01 else 0.0
+            prices[s] *= float(np.exp(rng.normal(0, 0.002) + jump))
+        if t % 60 == 0:
+            funding = float(rng.normal(0.0001, 0.0003))
+
+        ticks.append({
+            "timestamp": (start + timedelta(minutes=t)).isoformat(),
+            "prices": {**{s: prices[s] for s in symbols}, "funding_rate": funding},
+            "features": {
+                "funding_rate": funding,
+                "open_interest_change": float(rng.normal(0, 0.05)),
+                "volatility_acceleration": float(abs(rng.normal(0, 0.01))),
+            },
+        })
+    return ticks
+
+
+def load_tick_stream(path: str) -> List[Dict[str, Any]]:
+    """Load a recorded tick stream (JSONL: timestamp, prices, features)."""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_tick_stream(ticks: List[Dict[str, Any]], path: str) -> None:
+    """Write a tick stream as JSONL."""
+    with open(path, "w") as f:
+        for tick in ticks:
+            f.write(json.dumps(tick) + "\n")
+
+
+def _initial_state() -> PerceptionState:
+    return PerceptionState(
+        state_id="initial",
+        timestamp=datetime.now(),
+        market_entropy=2.0,
+        noise_score=0.5,
+        signal_quality=0.7,
+        participant_intent={"long": 0.5, "short": 0.5},
+        market_pressure="NEUTRAL",
+        reflexivity_coefficient=0.0,
+        system_impact_score=0.0,
+        regime_confidence=0.8,
+        regime_stress=0.3,
+        regime_pivot_probability=0.1,
+        shock_intensity=0.0,
+        total_uncertainty=0.5,
+        should_act=True
+    )
+
+
+def replay(
+    ticks: List[Dict[str, Any]],
+    config: PerceptionConfig,
+    window: int = 100,
+    parallel: bool = True,
+    use_rolling_cache: bool = True,
+    initial_state: Optional[PerceptionState] = None,
+    collect_outputs: bool = False
+) -> ReplayReport:
+    """
+    Feed a tick stream through step() with a sliding window.
+
+    One step runs per tick once the window is full. Stage timings from each
+    step's profiler summary are collected in a PerformanceProfiler and
+    reported as p50/p99.
+
+    Args:
+        ticks: Recorded ticks (see generate_tick_stream)
+        config: Perception configuration
+        window: Number of ticks per market_data window
+        parallel: Run independent stages concurrently
+        use_rolling_cache: Carry a RollingFeatureCache across steps
+        initial_state: Starting state (defaults to a neutral state)
+        collect_outputs: Keep every MetaPerceptionOutput in the report
+
+    Returns:
+        ReplayReport
+    """
+    state = initial_state or _initial_state()
+    cache = RollingFeatureCache() if use_rolling_cache else None
+    windows: Dict[str, Deque[float]] = {}
+    profiler = PerformanceProfiler(enabled=True)
+    outputs = []
+    gate_passed = 0
+    n_steps = 0
+
+    for i, tick in enumerate(ticks):
+        for feature, value in tick["prices"].items():
+            windows.setdefault(feature, deque(maxlen=window)).append(value)
+        if i + 1 < window:
+            continue
+
+        inputs = MetaPerceptionInput(
+            timestamp=datetime.fromisoformat(tick["timestamp"]),
+            market_data={f: list(w) for f, w in windows.items()},
+            features=tick.get("features", {})
+        )
+        state, output = step(state, inputs, config, parallel=parallel, rolling_cache=cache)
+
+        for stage, duration_ms in output.snapshot.metadata["profiler"].items():
+            profiler.record(stage, duration_ms)
+        profiler.record("total", output.computation_time_ms)
+        gate_passed += bool(output.metadata.get("performance_gate_passed"))
+        n_steps += 1
+        if collect_outputs:
+            outputs.append(output)
+
+    return ReplayReport(
+        n_ticks=len(ticks),
+        n_steps=n_steps,
+        window=window,
+        parallel=parallel,
+        rolling_cache=use_rolling_cache,
+        stage_percentiles=profiler.get_percentiles((50, 99)),
+        performance_gate_pass_rate=gate_passed / n_steps if n_steps else 0.0,
+        cache_stats=cache.get_stats() if cache is not None else {},
+        outputs=outputs
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> ReplayReport:
+    """CLI: python -m meta_perception.simulation.replay [--input ticks.jsonl]"""
+    parser = argparse.ArgumentParser(description="Replay a tick stream through step() and report stage p50/p99")
+    parser.add_argument("--input", help="Recorded tick stream (JSONL); synthetic if omitted")
+    parser.add_argument("--ticks", type=int, default=1000, help="Synthetic stream length")
+    parser.add_argument("--symbols", type=int, default=3, help="Synthetic symbol count")
+    parser.add_argument("--window", type=int, default=100, help="Ticks per market_data window")
+    parser.add_argument("--sequential", action="store_true", help="Run stages sequentially")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the rolling feature cache")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        ticks = load_tick_stream(args.input)
+    else:
+        ticks = generate_tick_stream(args.ticks, symbols=[f"SYM{i}" for i in range(args.symbols)])
+
+    config = PerceptionConfig(config_id="replay", version="1.0.0")
+    report = replay(
+        ticks,
+        config,
+        window=args.window,
+        parallel=not args.sequential,
+        use_rolling_cache=not args.no_cache
+    )
+    print(report.format_table())
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Test parallel step execution and the replay harness."""
+from meta_perception.simulation.replay import generate_tick_stream, replay
+
+
+def _fingerprint(output):
+    """Deterministic content of a step output (ids/timestamps depend on wall clock)."""
+    snap = output.snapshot
+    return (
+        snap.entropy_metrics.market_entropy,
+        snap.entropy_metrics.feature_entropy,
+        snap.noise_score.noise_level,
+        snap.intent_score.intent_probabilities,
+        snap.reflexivity_score.reflexivity_coefficient,
+        [(s.affected_features, s.intensity, s.severity) for s in snap.shock_events],
+        snap.regime_alert.regime_stress,
+        snap.state.total_uncertainty,
+        output.decision.should_act,
+        output.decision.recommended_risk_mode,
+        output.decision.rationale,
+        output.decision.key_factors,
+    )
+
+
+def test_parallel_and_cached_outputs_identical(default_config):
+    ticks = generate_tick_stream(140, symbols=["BTC", "ETH", "SOL", "AVAX"], seed=7)
+
+    baseline = replay(ticks, default_config, window=60, parallel=False,
+                      use_rolling_cache=False, collect_outputs=True)
+    fast = replay(ticks, default_config, window=60, parallel=True,
+                  use_rolling_cache=True, collect_outputs=True)
+
+    assert baseline.n_steps == fast.n_steps == 81
+    assert [_fingerprint(o) for o in fast.outputs] == [_fingerprint(o) for o in baseline.outputs]
+    assert fast.cache_stats["shifts"] > 0
+
+
+def test_replay_reports_stage_percentiles(default_config):
+    report = replay(generate_tick_stream(80), default_config, window=50)
+
+    for stage in ["entropy", "noise", "intent", "reflexivity", "shocks", "regime",
+                  "uncertainty", "state_creation", "decision", "total"]:
+        stats = report.stage_percentiles[stage]
+        assert stats["count"] == report.n_steps == 31
+        assert 0 <= stats["p50"] <= stats["p99"]
+    assert "p99" in report.format_table()
@@ -0,0 +1,158 @@
+"""Equivalence tests for the vectorized core and rolling cache."""
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from meta_perception.core.entropy import compute_market_entropy
+from meta_perception.core.noise import evaluate_noise_level
+from meta_perception.core.rolling import RollingFeatureCache
+from meta_perception.core.shocks import detect_shocks, _classify_shock_type
+from meta_perception.utils.math_utils import compute_entropy, compute_entropy_rows, detect_outliers
+from meta_perception.utils.profiling import PerformanceProfiler
+
+
+def _reference_feature_entropy(market_data, n_bins=50):
+    """Per-feature loop as originally implemented."""
+    feature_entropy = {}
+    for feature, values in market_data.items():
+        if len(values) > 1:
+            arr = np.array(values)
+            returns = np.diff(arr) / arr[:-1]
+            feature_entropy[feature] = compute_entropy(returns.tolist(), n_bins=n_bins)
+    return feature_entropy
+
+
+def _reference_shocks(time_series_data, timestamps, threshold):
+    """Per-outlier loop as originally implemented (statistics only)."""
+    out = []
+    for feature, values in time_series_data.items():
+        if len(values) < 10:
+            continue
+        for idx in detect_outliers(values, threshold_std=threshold):
+            if idx >= len(timestamps):
+                continue
+            arr = np.array(values)
+            mean, std = np.mean(arr), np.std(arr)
+            if std == 0:
+                continue
+            z = abs((values[idx] - mean) / std)
+            out.append((feature, timestamps[idx], _classify_shock_type(feature), z / 3.0, z))
+    return sorted(out, key=lambda s: s[3], reverse=True)
+
+
+def _random_market(rng, n_features=12, length=120):
+    data = {}
+    for i in range(n_features):
+        walk = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, length)))
+        walk[rng.integers(0, length)] *= 1.3  # Inject a shock
+        data[f"SYM{i}"] = walk.tolist()
+    data["funding_rate"] = ([0.0001] * (length - 5)) + [0.05] * 5
+    data["short"] = [1.0, 2.0, 3.0]
+    data["flat"] = [5.0] * length
+    return data
+
+
+class TestEntropyRows:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_compute_entropy_bitwise(self, seed):
+        rng = np.random.default_rng(seed)
+        for n_bins in (2, 10, 50):
+            matrix = np.round(rng.normal(size=(8, 200)), 2)
+            matrix[0] = 1.0  # Degenerate range
+            expected = [compute_entropy(row.tolist(), n_bins=n_bins) for row in matrix]
+            assert compute_entropy_rows(matrix, n_bins=n_bins).tolist() == expected
+
+
+class TestMarketEntropy:
+    def test_identical_to_per_feature_loop(self):
+        data = _random_market(np.random.default_rng(1))
+        data["uneven"] = list(np.linspace(10, 20, 57))
+        data["with_nan"] = [1.0, 2.0, float("nan"), 3.0, 4.0, 5.0]
+
+        metrics = compute_market_entropy(data)
+
+        assert metrics.feature_entropy == _reference_feature_entropy(data)
+        assert list(metrics.feature_entropy) == list(_reference_feature_entropy(data))
+
+    def test_rolling_cache_identical(self):
+        rng = np.random.default_rng(2)
+        series = _random_market(rng, length=160)
+        cache = RollingFeatureCache()
+        for start in range(0, 40, 3):
+            window = {f: v[start:start + 120] for f, v in series.items()}
+            cache.update(window)
+            cached = compute_market_entropy(window, rolling_cache=cache)
+            assert cached.feature_entropy == _reference_feature_entropy(window)
+            assert cached.market_entropy == compute_market_entropy(window).market_entropy
+
+
+class TestShocks:
+    def test_identical_to_per_outlier_loop(self):
+        data = _random_market(np.random.default_rng(3), length=100)
+        timestamps = [datetime(2025, 1, 1) + timedelta(minutes=i) for i in range(90)]
+
+        shocks = detect_shocks(data, timestamps=timestamps, threshold_std_devs=2.0)
+        expected = _reference_shocks(data, timestamps, 2.0)
+
+        actual = [(s.affected_features[0], s.timestamp, s.shock_type, s.intensity, s.shock_size_std_devs)
+                  for s in shocks]
+        assert actual == expected
+        assert len(actual) > 0
+
+    def test_rolling_cache_identical(self):
+        data = _random_market(np.random.default_rng(4), length=100)
+        timestamps = [datetime(2025, 1, 1) + timedelta(minutes=i) for i in range(100)]
+        cache = RollingFeatureCache()
+        cache.update(data)
+
+        plain = detect_shocks(data, timestamps=timestamps)
+        cached = detect_shocks(data, timestamps=timestamps, rolling_cache=cache)
+
+        assert [s.shock_id for s in cached] == [s.shock_id for s in plain]
+        assert [s.intensity for s in cached] == [s.intensity for s in plain]
+
+
+class TestRollingFeatureCache:
+    def test_shifted_window_reuses_returns(self):
+        series = list(100 + np.cumsum(np.random.default_rng(5).normal(size=200)))
+        cache = RollingFeatureCache()
+        for start, step in [(0, 0), (1, 1), (4, 3), (4, 0), (50, 46)]:
+            window = series[start:start + 100]
+            cache.update({"X": window})
+            arr = np.array(window)
+            assert np.array_equal(cache.returns("X"), np.diff(arr) / arr[:-1])
+        assert cache.get_stats() == {"hits": 1, "shifts": 3, "rebuilds": 1}
+
+    def test_unrelated_window_rebuilds(self):
+        cache = RollingFeatureCache()
+        cache.update({"X": [1.0, 2.0, 3.0]})
+        cache.update({"X": [7.0, 8.0, 9.0, 10.0]})
+        assert cache.get_stats()["rebuilds"] == 2
+        assert np.array_equal(cache.returns("X"), np.diff([7.0, 8.0, 9.0, 10.0]) / [7.0, 8.0, 9.0])
+
+    def test_noise_uses_cached_arrays(self):
+        data = _random_market(np.random.default_rng(6))
+        cache = RollingFeatureCache()
+        cache.update(data)
+        assert (evaluate_noise_level(data, rolling_cache=cache).noise_level
+                == evaluate_noise_level(data).noise_level)
+
+
+class TestProfilerPercentiles:
+    def test_record_and_percentiles(self):
+        profiler = PerformanceProfiler()
+        for ms in range(1, 101):
+            profiler.record("stage", float(ms))
+        report = profiler.get_percentiles((50, 99))
+        assert report["stage"]["count"] == 100
+        assert report["stage"]["p50"] == pytest.approx(50.5)
+        assert report["stage"]["p99"] == pytest.approx(99.01)
+
+    def test_nested_profile_blocks(self):
+        profiler = PerformanceProfiler()
+        with profiler.profile("outer"):
+            with profiler.profile("inner"):
+                pass
+        summary = profiler.get_summary()
+        assert set(summary) == {"outer", "inner"}
+        assert summary["outer"] >= summary["inner"]
@@ -1,7 +1,10 @@
 """Performance profiling for Meta-Perception Layer."""
 
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -27,6 +30,8 @@ class PerformanceProfiler:
             result = compute_entropy(...)
 
         print(profiler.get_summary())
+
+    Thread-safe: concurrent profile() blocks each track their own entry.
     """
 
     def __init__(self, enabled: bool = True):
@@ -39,6 +44,7 @@ class PerformanceProfiler:
         self.enabled = enabled
         self.entries: List[ProfileEntry] = []
         self._active_entry: Optional[ProfileEntry] = None
+        self._lock = threading.Lock()
 
     def profile(self, name: str, **metadata):
         """
@@ -53,37 +59,59 @@ class PerformanceProfiler:
         """
         return _ProfileContext(self, name, metadata)
 
-    def start(self, name: str, **metadata) -> None:
-        """Start profiling a named section."""
+    def start(self, name: str, **metadata) -> Optional[ProfileEntry]:
+        """Start profiling a named section. Returns the entry (None if disabled)."""
         if not self.enabled:
-            return
+            return None
 
         entry = ProfileEntry(
             name=name,
             start_time=time.perf_counter(),
             metadata=metadata
         )
-        self.entries.append(entry)
+        with self._lock:
+            self.entries.append(entry)
         self._active_entry = entry
+        return entry
 
-    def stop(self) -> Optional[float]:
+    def stop(self, entry: Optional[ProfileEntry] = None) -> Optional[float]:
         """
-        Stop profiling current section.
+        Stop profiling a section.
+
+        Args:
+            entry: Entry returned by start(); defaults to the most recent one
 
         Returns:
             Duration in milliseconds, or None if not profiling
         """
-        if not self.enabled or self._active_entry is None:
+        if entry is None:
+            entry = self._active_entry
+        if not self.enabled or entry is None:
             return None
 
         end_time = time.perf_counter()
-        self._active_entry.end_time = end_time
-        self._active_entry.duration_ms = (end_time - self._active_entry.start_time) * 1000
+        entry.end_time = end_time
+        entry.duration_ms = (end_time - entry.start_time) * 1000
 
-        duration = self._active_entry.duration_ms
-        self._active_entry = None
+        if self._active_entry is entry:
+            self._active_entry = None
 
-        return duration
+        return entry.duration_ms
+
+    def record(self, name: str, duration_ms: float, **metadata) -> None:
+        """Record an externally measured duration (e.g. one stage of a replayed cycle)."""
+        if not self.enabled:
+            return
+
+        entry = ProfileEntry(
+            name=name,
+            start_time=0.0,
+            end_time=duration_ms / 1000,
+            duration_ms=duration_ms,
+            metadata=metadata
+        )
+        with self._lock:
+            self.entries.append(entry)
 
     def get_total_time_ms(self) -> float:
         """Get total profiled time in milliseconds."""
@@ -106,6 +134,30 @@ class PerformanceProfiler:
 
         return summary
 
+    def get_percentiles(self, percentiles: Sequence[float] = (50, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        Per-name latency percentiles across all recorded entries.
+
+        Args:
+            percentiles: Percentiles to report
+
+        Returns:
+            {name: {"p50": ms, "p99": ms, "count": n}}
+        """
+        durations: Dict[str, List[float]] = {}
+        for entry in self.entries:
+            if entry.duration_ms is not None:
+                durations.setdefault(entry.name, []).append(entry.duration_ms)
+
+        report = {}
+        for name, values in durations.items():
+            arr = np.asarray(values)
+            stats = {f"p{q:g}": float(np.percentile(arr, q)) for q in percentiles}
+            stats["count"] = len(values)
+            report[name] = stats
+
+        return report
+
     def get_detailed_report(self) -> List[Dict]:
         """Get detailed report of all entries."""
         return [
@@ -145,9 +197,9 @@ class _ProfileContext:
         self.metadata = metadata
 
     def __enter__(self):
-        self.profiler.start(self.name, **self.metadata)
+        self.entry = self.profiler.start(self.name, **self.metadata)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.profiler.stop()
+        self.profiler.stop(self.entry)
         return False
@@ -62,6 +62,12 @@ from prediction_ledger.storage import (
     load_evaluations,
 )
 
+from prediction_ledger.sqlite_storage import (
+    append_records,
+    iter_records,
+    import_jsonl_to_sqlite,
+)
+
 from prediction_ledger.serialization import (
     save_calibration_curve_to_json,
     load_calibration_curve_from_json,
@@ -131,6 +137,9 @@ __all__ = [
     "load_forecasts",
     "load_outcomes",
     "load_evaluations",
+    "append_records",
+    "iter_records",
+    "import_jsonl_to_sqlite",
     # Serialization
     "save_calibration_curve_to_json",
     "load_calibration_curve_from_json",
@@ -0,0 +1,8 @@
+"""
+Prediction Ledger Benchmarks
+
+Standalone benchmark scripts (not collected by pytest).
+
+Author: FjordHQ Engineering Team
+Date: 2025-11-18
+"""
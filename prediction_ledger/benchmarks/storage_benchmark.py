@@ -0,0 +1,103 @@
+"""
+Prediction Ledger Storage Benchmark
+
+Compares the JSON lines backend with the indexed SQLite backend on
+bulk append, filtered loads (forecast id, target + horizon) and a full scan.
+
+Usage:
+    python -m prediction_ledger.benchmarks.storage_benchmark --records 10000000
+    python -m prediction_ledger.benchmarks.storage_benchmark --records 100000 --jsonl
+
+The JSONL side is opt-in (--jsonl) because every JSONL load validates the
+entire history, which at 10M records takes a long time.
+
+Author: FjordHQ Engineering Team
+Date: 2025-11-18
+ADR: ADR-061
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+from prediction_ledger.models import ForecastRecord
+from prediction_ledger.storage import append_forecast_to_file, load_forecasts
+from prediction_ledger import sqlite_storage
+
+HORIZONS = [timedelta(days=d) for d in (1, 5, 10, 20, 30)]
+
+
+def _generate(n: int, n_targets: int) -> Iterator[ForecastRecord]:
+    start = datetime(2020, 1, 1)
+    for i in range(n):
+        yield ForecastRecord(
+            forecast_id=f"f_{i:09d}",
+            timestamp=start + timedelta(minutes=i),
+            horizon=HORIZONS[i % len(HORIZONS)],
+            target_id=f"target_{i % n_targets:05d}",
+            target_type="REGIME_TRANSITION_PROB",
+            forecast_value=(i % 100) / 100,
+            input_state_hash="bench",
+        )
+
+
+def _timed(label: str, fn: Callable[[], object]) -> object:
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    size = len(result) if hasattr(result, "__len__") else result
+    print(f"  {label:<42} {elapsed:10.3f}s   result={size}")
+    return result
+
+
+def run(records: int, n_targets: int, include_jsonl: bool, workdir: Path) -> None:
+    db_path = workdir / "forecasts.sqlite"
+    probe_id = f"f_{records // 2:09d}"
+    probe_filter = {"target_id": "target_00007", "horizon": HORIZONS[2]}
+
+    print(f"SQLite backend ({records:,} records, {n_targets} targets)")
+    _timed("bulk append", lambda: sqlite_storage.append_records(db_path, _generate(records, n_targets)))
+    _timed("load by forecast_id", lambda: load_forecasts(db_path, {"forecast_id": probe_id}))
+    _timed("load by target_id + horizon", lambda: load_forecasts(db_path, probe_filter))
+    _timed(
+        "count by target_id + horizon (no models)",
+        lambda: sqlite_storage.count_records(db_path, ForecastRecord, probe_filter),
+    )
+    print(f"  database size: {db_path.stat().st_size / 1e6:,.1f} MB")
+
+    if include_jsonl:
+        jsonl_path = workdir / "forecasts.jsonl"
+        print(f"JSONL backend ({records:,} records)")
+        _timed(
+            "append (one call per record)",
+            lambda: sum(1 for f in _generate(records, n_targets) if append_forecast_to_file(jsonl_path, f) is None),
+        )
+        _timed("load by forecast_id", lambda: load_forecasts(jsonl_path, {"forecast_id": probe_id}))
+        _timed("load by target_id + horizon", lambda: load_forecasts(jsonl_path, probe_filter))
+        _timed(
+            "one-shot import into SQLite",
+            lambda: sqlite_storage.import_jsonl_to_sqlite(jsonl_path, workdir / "imported.sqlite", "forecast"),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prediction ledger storage benchmark")
+    parser.add_argument("--records", type=int, default=10_000_000)
+    parser.add_argument("--targets", type=int, default=1_000)
+    parser.add_argument("--jsonl", action="store_true", help="Also benchmark the JSONL backend")
+    parser.add_argument("--workdir", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        run(args.records, args.targets, args.jsonl, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            run(args.records, args.targets, args.jsonl, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
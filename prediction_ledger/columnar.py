@@ -0,0 +1,544 @@
+"""
+Columnar Evaluation Core
+
+Vectorized counterpart of prediction_ledger.evaluation for long histories.
+Forecast-outcome pairs are flattened once into NumPy columns; Brier scores,
+Murphy decomposition (reliability / resolution / uncertainty), calibration
+bins, log loss, hit rate, baseline skill and bootstrap confidence intervals
+are then computed for every (model, target type, horizon) group in a single
+pass using group codes and bincount/reduceat.
+
+Results agree with the per-list functions in evaluation.py (same binning,
+same binary conversion, same baseline) up to floating point summation order.
+
+Requires NumPy. pandas is optional and only used by EvaluationFrame.from_dataframe.
+
+Author: FjordHQ Engineering Team
+Date: 2025-11-18
+ADR: ADR-061
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from prediction_ledger.models import (
+    ForecastOutcomePair,
+    CalibrationBin,
+    CalibrationCurve,
+    SkillMetrics,
+    SkillReport,
+)
+from prediction_ledger.utils import derive_horizon_bucket
+from prediction_ledger.exceptions import InsufficientDataException
+
+
+DEFAULT_GROUP_BY: Tuple[str, ...] = ("model_id", "target_type", "horizon_bucket")
+
+# Same clipping as utils.compute_log_score_single
+LOG_SCORE_EPS = 1e-15
+
+
+# ============================================================================
+# FRAME
+# ============================================================================
+
+@dataclass
+class EvaluationFrame:
+    """
+    Column arrays for a set of forecast-outcome pairs.
+
+    forecast_prob and realized hold the raw float values; key columns are
+    object arrays used for grouping. timestamp holds forecast timestamps.
+    """
+    forecast_prob: np.ndarray
+    realized: np.ndarray
+    timestamp: np.ndarray
+    keys: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.forecast_prob)
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Sequence[ForecastOutcomePair],
+        model_id_key: str = "model_id",
+    ) -> "EvaluationFrame":
+        """
+        Flatten pairs into columns.
+
+        model_id is read from forecast.metadata[model_id_key] (None if absent);
+        horizon_bucket is derived with utils.derive_horizon_bucket.
+        """
+        n = len(pairs)
+        forecast_prob = np.empty(n, dtype=float)
+        realized = np.empty(n, dtype=float)
+        timestamp = np.empty(n, dtype=object)
+        model_id = np.empty(n, dtype=object)
+        target_id = np.empty(n, dtype=object)
+        target_type = np.empty(n, dtype=object)
+        horizon_bucket = np.empty(n, dtype=object)
+
+        for i, pair in enumerate(pairs):
+            forecast = pair.forecast
+            forecast_prob[i] = float(forecast.forecast_value)
+            realized[i] = float(pair.outcome.realized_value)
+            timestamp[i] = forecast.timestamp
+            model_id[i] = forecast.metadata.get(model_id_key)
+            target_id[i] = forecast.target_id
+            target_type[i] = forecast.target_type
+            horizon_bucket[i] = derive_horizon_bucket(forecast.horizon)
+
+        return cls(
+            forecast_prob=forecast_prob,
+            realized=realized,
+            timestamp=timestamp,
+            keys={
+                "model_id": model_id,
+                "target_id": target_id,
+                "target_type": target_type,
+                "horizon_bucket": horizon_bucket,
+            },
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> "EvaluationFrame":
+        """
+        Build from a pandas DataFrame with columns forecast_prob, realized,
+        timestamp and any key columns (model_id, target_type, ...).
+        """
+        keys = {
+            col: df[col].to_numpy(dtype=object)
+            for col in df.columns
+            if col not in ("forecast_prob", "realized", "timestamp")
+        }
+        return cls(
+            forecast_prob=df["forecast_prob"].to_numpy(dtype=float),
+            realized=df["realized"].to_numpy(dtype=float),
+            timestamp=df["timestamp"].to_numpy(dtype=object),
+            keys=keys,
+        )
+
+    def concat(self, other: "EvaluationFrame") -> "EvaluationFrame":
+        """Return a new frame with other's rows appended."""
+        return EvaluationFrame(
+            forecast_prob=np.concatenate([self.forecast_prob, other.forecast_prob]),
+            realized=np.concatenate([self.realized, other.realized]),
+            timestamp=np.concatenate([self.timestamp, other.timestamp]),
+            keys={k: np.concatenate([v, other.keys[k]]) for k, v in self.keys.items()},
+        )
+
+
+def _group_codes(
+    frame: EvaluationFrame,
+    group_by: Sequence[str],
+) -> Tuple[np.ndarray, List[Tuple[Any, ...]]]:
+    """Dense group code per row and the key tuple for each code (sorted)."""
+    n = len(frame)
+    if not group_by:
+        return np.zeros(n, dtype=np.intp), [()]
+
+    combined = np.zeros(n, dtype=np.int64)
+    uniques_per_key = []
+    for key in group_by:
+        # Stringify for a total order (None / mixed types are allowed as keys)
+        values = frame.keys[key]
+        as_str = np.array(["\x00" if v is None else str(v) for v in values], dtype=object)
+        uniq, inverse = np.unique(as_str, return_inverse=True)
+        originals = {}
+        for v, s in zip(values, as_str):
+            originals.setdefault(s, v)
+        uniques_per_key.append([originals[u] for u in uniq])
+        combined = combined * len(uniq) + inverse
+
+    codes_uniq, codes = np.unique(combined, return_inverse=True)
+
+    labels: List[Tuple[Any, ...]] = []
+    for c in codes_uniq:
+        parts = []
+        for uniq in reversed(uniques_per_key):
+            c, r = divmod(int(c), len(uniq))
+            parts.append(uniq[r])
+        labels.append(tuple(reversed(parts)))
+    return codes, labels
+
+
+def _bin_index(probs: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Calibration bin per probability, matching utils.bin_probabilities:
+    bin i holds i*w <= p < (i+1)*w, the last bin also holds p == 1.0.
+    Returns -1 for probabilities outside every bin.
+    """
+    bin_width = 1.0 / n_bins
+    edges = np.arange(n_bins + 1) * bin_width
+    idx = np.searchsorted(edges, probs, side="right") - 1
+    idx = np.where(probs == 1.0, n_bins - 1, idx)
+    valid = (idx >= 0) & (idx < n_bins) & ~np.isnan(probs)
+    return np.where(valid, idx, -1)
+
+
+# ============================================================================
+# SUFFICIENT STATISTICS (incremental)
+# ============================================================================
+
+@dataclass
+class GroupedSkillState:
+    """
+    Per-group sufficient statistics for skill metrics.
+
+    Everything except bootstrap intervals can be derived from these sums, so
+    new reconciled outcomes are folded in with update() without touching the
+    history. Groups are keyed by the tuple of group_by values.
+    """
+    group_by: Tuple[str, ...] = DEFAULT_GROUP_BY
+    n_bins: int = 10
+    index: Dict[Tuple[Any, ...], int] = field(default_factory=dict)
+    period_start: List[datetime] = field(default_factory=list)
+    period_end: List[datetime] = field(default_factory=list)
+    sums: Dict[str, np.ndarray] = field(default_factory=dict)
+    bin_sums: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    _SCALARS = ("n", "sum_brier", "sum_log", "sum_realized", "sum_binary", "hits")
+    _BINS = ("count", "sum_prob", "sum_binary")
+
+    def __post_init__(self) -> None:
+        self.group_by = tuple(self.group_by)
+        for name in self._SCALARS:
+            self.sums.setdefault(name, np.zeros(0))
+        for name in self._BINS:
+            self.bin_sums.setdefault(name, np.zeros((0, self.n_bins)))
+
+    @property
+    def groups(self) -> List[Tuple[Any, ...]]:
+        return list(self.index)
+
+    def _grow(self, labels: List[Tuple[Any, ...]]) -> np.ndarray:
+        """Map batch labels to state rows, appending new groups."""
+        rows = np.empty(len(labels), dtype=np.intp)
+        added = 0
+        for i, label in enumerate(labels):
+            row = self.index.get(label)
+            if row is None:
+                row = len(self.index)
+                self.index[label] = row
+                self.period_start.append(None)
+                self.period_end.append(None)
+                added += 1
+            rows[i] = row
+        if added:
+            for name in self._SCALARS:
+                self.sums[name] = np.concatenate([self.sums[name], np.zeros(added)])
+            for name in self._BINS:
+                self.bin_sums[name] = np.vstack(
+                    [self.bin_sums[name], np.zeros((added, self.n_bins))]
+                )
+        return rows
+
+    def update(self, frame: EvaluationFrame) -> "GroupedSkillState":
+        """Fold a frame of newly reconciled pairs into the statistics."""
+        if len(frame) == 0:
+            return self
+
+        codes, labels = _group_codes(frame, self.group_by)
+        rows = self._grow(labels)[codes]
+        n_groups = len(self.index)
+
+        p = frame.forecast_prob
+        realized = frame.realized
+        binary = (realized > 0.5).astype(float)
+        brier = (p - binary) ** 2
+        log_score = -np.log(np.maximum(np.where(binary == 1, p, 1 - p), LOG_SCORE_EPS))
+        hits = ((p > 0.5) == (binary == 1)).astype(float)
+
+        for name, values in (
+            ("n", np.ones_like(p)),
+            ("sum_brier", brier),
+            ("sum_log", log_score),
+            ("sum_realized", realized),
+            ("sum_binary", binary),
+            ("hits", hits),
+        ):
+            self.sums[name] += np.bincount(rows, weights=values, minlength=n_groups)
+
+        bins = _bin_index(p, self.n_bins)
+        in_bin = bins >= 0
+        flat = rows[in_bin] * self.n_bins + bins[in_bin]
+        size = n_groups * self.n_bins
+        for name, values in (
+            ("count", np.ones(int(in_bin.sum()))),
+            ("sum_prob", p[in_bin]),
+            ("sum_binary", binary[in_bin]),
+        ):
+            self.bin_sums[name] += np.bincount(
+                flat, weights=values, minlength=size
+            ).reshape(n_groups, self.n_bins)
+
+        # Period bounds per group
+        for row in np.unique(rows):
+            ts = frame.timestamp[rows == row]
+            lo, hi = min(ts), max(ts)
+            if self.period_start[row] is None or lo < self.period_start[row]:
+                self.period_start[row] = lo
+            if self.period_end[row] is None or hi > self.period_end[row]:
+                self.period_end[row] = hi
+        return self
+
+    def metrics(
+        self,
+        baseline_type: str = "historical_frequency",
+        min_samples_per_bin: int = 5,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized metrics for every group (arrays aligned with self.groups).
+
+        Keys: n, brier_score, brier_score_baseline, brier_skill_score,
+        log_loss, directional_accuracy, base_rate, reliability, resolution,
+        uncertainty, mean_calibration_error (build_calibration_curve_v2
+        semantics with min_samples_per_bin).
+        """
+        s = self.sums
+        n = s["n"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            brier = s["sum_brier"] / n
+            base_rate = s["sum_binary"] / n
+
+            if baseline_type == "uniform":
+                baseline_prob = np.full_like(n, 0.5)
+            elif baseline_type == "historical_frequency":
+                baseline_prob = s["sum_realized"] / n
+            else:
+                raise ValueError(f"Unknown baseline_type: {baseline_type}")
+            # mean((b - o)^2) for binary o with base rate p: (b - p)^2 + p(1 - p)
+            baseline_brier = (baseline_prob - base_rate) ** 2 + base_rate * (1 - base_rate)
+            bss = np.where(baseline_brier == 0, 0.0, 1 - brier / baseline_brier)
+
+            count = self.bin_sums["count"]
+            f_k = self.bin_sums["sum_prob"] / count
+            o_k = self.bin_sums["sum_binary"] / count
+            occupied = count > 0
+
+            # Murphy decomposition over all occupied bins
+            reliability = np.where(occupied, count * (f_k - o_k) ** 2, 0.0).sum(axis=1) / n
+            resolution = np.where(
+                occupied, count * (o_k - base_rate[:, None]) ** 2, 0.0
+            ).sum(axis=1) / n
+            uncertainty = base_rate * (1 - base_rate)
+
+            # Calibration error over bins that pass the sample threshold
+            kept = occupied & (count >= min_samples_per_bin)
+            kept_count = np.where(kept, count, 0.0).sum(axis=1)
+            weighted = np.where(kept, np.abs(f_k - o_k) * count, 0.0).sum(axis=1)
+            mce = np.where(kept_count > 0, weighted / kept_count, 0.0)
+
+        return {
+            "n": n,
+            "brier_score": brier,
+            "brier_score_baseline": baseline_brier,
+            "brier_skill_score": bss,
+            "log_loss": s["sum_log"] / n,
+            "directional_accuracy": s["hits"] / n,
+            "base_rate": base_rate,
+            "reliability": reliability,
+            "resolution": resolution,
+            "uncertainty": uncertainty,
+            "mean_calibration_error": mce,
+        }
+
+    def calibration_bins(
+        self,
+        group: Tuple[Any, ...],
+        min_samples_per_bin: int = 5,
+    ) -> List[CalibrationBin]:
+        """CalibrationBin list for one group (build_calibration_curve_v2 semantics)."""
+        row = self.index[group]
+        count = self.bin_sums["count"][row]
+        bin_width = 1.0 / self.n_bins
+        bins = []
+        for i in range(self.n_bins):
+            c = count[i]
+            if c == 0 or c < min_samples_per_bin:
+                continue
+            bins.append(CalibrationBin(
+                lower_bound=i * bin_width,
+                upper_bound=(i + 1) * bin_width,
+                forecast_mean=float(self.bin_sums["sum_prob"][row, i] / c),
+                observed_frequency=float(self.bin_sums["sum_binary"][row, i] / c),
+                count=int(c),
+            ))
+        return bins
+
+
+# ============================================================================
+# ONE-PASS ENTRY POINTS
+# ============================================================================
+
+def compute_grouped_skill(
+    frame: EvaluationFrame,
+    group_by: Sequence[str] = DEFAULT_GROUP_BY,
+    n_bins: int = 10,
+    baseline_type: str = "historical_frequency",
+    min_samples_per_bin: int = 5,
+) -> Tuple[List[Tuple[Any, ...]], Dict[str, np.ndarray]]:
+    """
+    Compute skill metrics for every group of a frame in one pass.
+
+    Returns:
+        (groups, metrics) where metrics arrays are aligned with groups
+
+    Raises:
+        InsufficientDataException: If frame is empty
+    """
+    if len(frame) == 0:
+        raise InsufficientDataException("Need at least 1 pair for skill metrics")
+    state = GroupedSkillState(group_by=tuple(group_by), n_bins=n_bins).update(frame)
+    return state.groups, state.metrics(baseline_type, min_samples_per_bin)
+
+
+def bootstrap_brier_ci(
+    frame: EvaluationFrame,
+    group_by: Sequence[str] = DEFAULT_GROUP_BY,
+    n_boot: int = 1000,
+    confidence_level: float = 0.95,
+    seed: int | None = None,
+    chunk_size: int = 100,
+) -> Tuple[List[Tuple[Any, ...]], np.ndarray]:
+    """
+    Percentile bootstrap confidence intervals of the Brier score per group.
+
+    All groups are resampled together: rows are sorted by group, each
+    bootstrap draw picks positions within the row's own group, and group
+    means come from np.add.reduceat. Draws are processed in chunks of
+    chunk_size to bound memory at chunk_size * len(frame).
+
+    Returns:
+        (groups, ci) where ci has shape (n_groups, 2) = (lower, upper)
+    """
+    if len(frame) == 0:
+        raise InsufficientDataException("Need at least 1 pair for bootstrap")
+
+    codes, labels = _group_codes(frame, tuple(group_by))
+    order = np.argsort(codes, kind="stable")
+    codes_sorted = codes[order]
+    binary = (frame.realized[order] > 0.5).astype(float)
+    brier = (frame.forecast_prob[order] - binary) ** 2
+
+    sizes = np.bincount(codes_sorted, minlength=len(labels))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    row_start = starts[codes_sorted]
+    row_size = sizes[codes_sorted]
+
+    rng = np.random.default_rng(seed)
+    draws = np.empty((n_boot, len(labels)))
+    for lo in range(0, n_boot, chunk_size):
+        hi = min(lo + chunk_size, n_boot)
+        u = rng.random((hi - lo, len(brier)))
+        idx = row_start + (u * row_size).astype(np.intp)
+        draws[lo:hi] = np.add.reduceat(brier[idx], starts, axis=1) / sizes
+
+    alpha = (1 - confidence_level) / 2
+    ci = np.quantile(draws, [alpha, 1 - alpha], axis=0).T
+    return labels, ci
+
+
+def build_skill_reports(
+    frame: EvaluationFrame,
+    group_by: Sequence[str] = DEFAULT_GROUP_BY,
+    baseline_type: str = "historical_frequency",
+    n_boot: int = 0,
+    seed: int | None = None,
+    state: GroupedSkillState | None = None,
+) -> List[SkillReport]:
+    """
+    SkillReport per group, equivalent to calling build_skill_report per group.
+
+    Brier decomposition, log loss and (if n_boot > 0) a bootstrap Brier CI
+    are attached via SkillMetrics.log_score and SkillReport.metadata.
+    Pass a maintained GroupedSkillState to report incrementally; frame is
+    then only used for the bootstrap.
+
+    group_by must contain target_type and horizon_bucket; model_id is used
+    when present.
+    """
+    if state is None:
+        state = GroupedSkillState(group_by=tuple(group_by)).update(frame)
+    groups = state.groups
+    m = state.metrics(baseline_type)
+
+    ci_by_group: Dict[Tuple[Any, ...], np.ndarray] = {}
+    if n_boot > 0:
+        ci_groups, ci = bootstrap_brier_ci(frame, state.group_by, n_boot=n_boot, seed=seed)
+        ci_by_group = dict(zip(ci_groups, ci))
+
+    pos = {k: i for i, k in enumerate(state.group_by)}
+    created_at = datetime.utcnow()
+    reports = []
+    for row, group in enumerate(groups):
+        target_type = group[pos["target_type"]]
+        horizon_bucket = group[pos["horizon_bucket"]]
+        model_id = group[pos["model_id"]] if "model_id" in pos else None
+        period_start = state.period_start[row]
+        period_end = state.period_end[row]
+
+        metadata: Dict[str, Any] = {
+            "reliability": float(m["reliability"][row]),
+            "resolution": float(m["resolution"][row]),
+            "uncertainty": float(m["uncertainty"][row]),
+            "mean_calibration_error": float(m["mean_calibration_error"][row]),
+        }
+        if group in ci_by_group:
+            metadata["brier_ci"] = [float(x) for x in ci_by_group[group]]
+
+        n = int(m["n"][row])
+        reports.append(SkillReport(
+            report_id=f"skill_{target_type}_{horizon_bucket}_{period_start.strftime('%Y%m')}",
+            target_type=target_type,
+            horizon_bucket=horizon_bucket,
+            model_id=model_id,
+            period_start=period_start,
+            period_end=period_end,
+            metrics=SkillMetrics(
+                brier_score=float(m["brier_score"][row]),
+                brier_score_baseline=float(m["brier_score_baseline"][row]),
+                brier_skill_score=float(m["brier_skill_score"][row]),
+                directional_accuracy=float(m["directional_accuracy"][row]),
+                log_score=float(m["log_loss"][row]),
+            ),
+            sample_size=n,
+            baseline_description=baseline_type,
+            is_well_calibrated=bool(m["mean_calibration_error"][row] < 0.10),
+            has_positive_skill=bool(m["brier_skill_score"][row] > 0.05),
+            sufficient_sample=n >= 20,
+            created_at=created_at,
+            metadata=metadata,
+        ))
+    return reports
+
+
+def build_calibration_curves(
+    state: GroupedSkillState,
+    min_samples_per_bin: int = 5,
+) -> Dict[Tuple[Any, ...], CalibrationCurve]:
+    """CalibrationCurve per group from a GroupedSkillState (v2 semantics)."""
+    m = state.metrics(min_samples_per_bin=min_samples_per_bin)
+    pos = {k: i for i, k in enumerate(state.group_by)}
+    created_at = datetime.utcnow()
+    curves = {}
+    for row, group in enumerate(state.groups):
+        target_type = group[pos["target_type"]] if "target_type" in pos else "mixed"
+        horizon_bucket = group[pos["horizon_bucket"]] if "horizon_bucket" in pos else "mixed"
+        period_start = state.period_start[row]
+        curves[group] = CalibrationCurve(
+            curve_id=f"cal_{target_type}_{horizon_bucket}_{period_start.strftime('%Y%m')}",
+            target_type=target_type,
+            horizon_bucket=horizon_bucket,
+            bins=state.calibration_bins(group, min_samples_per_bin),
+            period_start=period_start,
+            period_end=state.period_end[row],
+            sample_size=int(m["n"][row]),
+            mean_calibration_error=float(m["mean_calibration_error"][row]),
+            created_at=created_at,
+        )
+    return curves
@@ -0,0 +1,408 @@
+"""
+Prediction Ledger SQLite Storage
+
+Indexed, append-only SQLite backend with the same API as the JSON lines
+storage. Each record is kept verbatim as its JSON payload next to a few
+indexed key columns (ids, target, horizon, timestamp), so equality filters
+on those columns are pushed down into SQL and only matching rows are
+parsed and validated.
+
+Selected automatically by prediction_ledger.storage for paths ending in
+.db, .sqlite or .sqlite3.
+
+Author: FjordHQ Engineering Team
+Date: 2025-11-18
+ADR: ADR-061
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from prediction_ledger.models import ForecastRecord, OutcomeRecord, EvaluationRecord
+from prediction_ledger.exceptions import StorageException
+
+
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+# Rows per transaction for bulk appends and JSONL import
+DEFAULT_BATCH_SIZE = 10_000
+
+
+# ============================================================================
+# TABLE LAYOUT
+# ============================================================================
+
+# record type -> (table, {filter field: column}, index definitions)
+_TABLES: Dict[Type[BaseModel], Tuple[str, Dict[str, str], List[str]]] = {
+    ForecastRecord: (
+        "forecasts",
+        {
+            "forecast_id": "forecast_id",
+            "target_id": "target_id",
+            "target_type": "target_type",
+            "horizon": "horizon_us",
+            "scenario_set_id": "scenario_set_id",
+        },
+        [
+            "CREATE INDEX IF NOT EXISTS ix_forecasts_forecast_id ON forecasts (forecast_id)",
+            "CREATE INDEX IF NOT EXISTS ix_forecasts_target_horizon ON forecasts (target_id, horizon_us)",
+            "CREATE INDEX IF NOT EXISTS ix_forecasts_type_horizon ON forecasts (target_type, horizon_us)",
+            "CREATE INDEX IF NOT EXISTS ix_forecasts_timestamp ON forecasts (timestamp)",
+        ],
+    ),
+    OutcomeRecord: (
+        "outcomes",
+        {
+            "outcome_id": "outcome_id",
+            "target_id": "target_id",
+            "target_type": "target_type",
+        },
+        [
+            "CREATE INDEX IF NOT EXISTS ix_outcomes_outcome_id ON outcomes (outcome_id)",
+            "CREATE INDEX IF NOT EXISTS ix_outcomes_target ON outcomes (target_id)",
+            "CREATE INDEX IF NOT EXISTS ix_outcomes_type ON outcomes (target_type)",
+            "CREATE INDEX IF NOT EXISTS ix_outcomes_timestamp ON outcomes (timestamp)",
+        ],
+    ),
+    EvaluationRecord: (
+        "evaluations",
+        {
+            "evaluation_id": "evaluation_id",
+            "target_id": "target_id",
+            "target_type": "target_type",
+            "metric_name": "metric_name",
+        },
+        [
+            "CREATE INDEX IF NOT EXISTS ix_evaluations_evaluation_id ON evaluations (evaluation_id)",
+            "CREATE INDEX IF NOT EXISTS ix_evaluations_target_metric ON evaluations (target_id, metric_name)",
+            "CREATE INDEX IF NOT EXISTS ix_evaluations_timestamp ON evaluations (timestamp)",
+        ],
+    ),
+}
+
+_KIND_TO_MODEL: Dict[str, Type[BaseModel]] = {
+    "forecast": ForecastRecord,
+    "outcome": OutcomeRecord,
+    "evaluation": EvaluationRecord,
+}
+
+
+def is_sqlite_path(file_path: str | Path) -> bool:
+    """Return True if the path selects the SQLite backend."""
+    return Path(file_path).suffix.lower() in SQLITE_SUFFIXES
+
+
+def _horizon_to_us(horizon: timedelta) -> int:
+    """Exact integer microseconds for a timedelta (equality-preserving)."""
+    return (horizon.days * 86_400 + horizon.seconds) * 1_000_000 + horizon.microseconds
+
+
+def _connect(file_path: Path) -> sqlite3.Connection:
+    """Open the ledger database, creating tables and indexes on first use."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(file_path))
+    # WAL + NORMAL sync: appends write one WAL frame instead of rewriting pages
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS forecasts (
+            seq INTEGER PRIMARY KEY,
+            forecast_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            horizon_us INTEGER NOT NULL,
+            target_id TEXT NOT NULL,
+            target_type TEXT NOT NULL,
+            scenario_set_id TEXT,
+            payload TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS outcomes (
+            seq INTEGER PRIMARY KEY,
+            outcome_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            target_id TEXT NOT NULL,
+            target_type TEXT NOT NULL,
+            payload TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS evaluations (
+            seq INTEGER PRIMARY KEY,
+            evaluation_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            target_id TEXT NOT NULL,
+            target_type TEXT NOT NULL,
+            metric_name TEXT NOT NULL,
+            payload TEXT NOT NULL
+        );
+    """)
+    for _, _, indexes in _TABLES.values():
+        for ddl in indexes:
+            conn.execute(ddl)
+    return conn
+
+
+def _row_for(record: BaseModel) -> Tuple:
+    """Key columns + JSON payload for one record (insert order of _INSERT_SQL)."""
+    payload = json.dumps(record.model_dump(mode="json"), default=str)
+    timestamp = record.timestamp.isoformat()
+    if isinstance(record, ForecastRecord):
+        return (
+            record.forecast_id, timestamp, _horizon_to_us(record.horizon),
+            record.target_id, record.target_type, record.scenario_set_id, payload,
+        )
+    if isinstance(record, OutcomeRecord):
+        return (record.outcome_id, timestamp, record.target_id, record.target_type, payload)
+    return (
+        record.evaluation_id, timestamp, record.target_id, record.target_type,
+        record.metric_name, payload,
+    )
+
+
+_INSERT_SQL: Dict[Type[BaseModel], str] = {
+    ForecastRecord: (
+        "INSERT INTO forecasts (forecast_id, timestamp, horizon_us, target_id, "
+        "target_type, scenario_set_id, payload) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    ),
+    OutcomeRecord: (
+        "INSERT INTO outcomes (outcome_id, timestamp, target_id, target_type, payload) "
+        "VALUES (?, ?, ?, ?, ?)"
+    ),
+    EvaluationRecord: (
+        "INSERT INTO evaluations (evaluation_id, timestamp, target_id, target_type, "
+        "metric_name, payload) VALUES (?, ?, ?, ?, ?, ?)"
+    ),
+}
+
+
+# ============================================================================
+# APPEND
+# ============================================================================
+
+def append_records(
+    file_path: str | Path,
+    records: Iterable[BaseModel],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Append records of one type in batched transactions.
+
+    Args:
+        file_path: Path to SQLite database
+        records: ForecastRecord, OutcomeRecord or EvaluationRecord instances
+        batch_size: Rows per transaction
+
+    Returns:
+        Number of records appended
+
+    Raises:
+        StorageException: If write fails
+    """
+    file_path = Path(file_path)
+    written = 0
+    try:
+        with closing(_connect(file_path)) as conn:
+            batch: List[Tuple] = []
+            sql = None
+            for record in records:
+                record_sql = _INSERT_SQL[type(record)]
+                if sql is not None and record_sql != sql:
+                    raise StorageException("append_records expects records of a single type")
+                sql = record_sql
+                batch.append(_row_for(record))
+                if len(batch) >= batch_size:
+                    with conn:
+                        conn.executemany(sql, batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                with conn:
+                    conn.executemany(sql, batch)
+                written += len(batch)
+        return written
+
+    except StorageException:
+        raise
+    except Exception as e:
+        raise StorageException(f"Failed to append records to {file_path}: {e}") from e
+
+
+def append_forecast(file_path: str | Path, forecast: ForecastRecord) -> None:
+    """Append one forecast (single-row transaction)."""
+    append_records(file_path, [forecast])
+
+
+def append_outcome(file_path: str | Path, outcome: OutcomeRecord) -> None:
+    """Append one outcome (single-row transaction)."""
+    append_records(file_path, [outcome])
+
+
+def append_evaluation(file_path: str | Path, evaluation: EvaluationRecord) -> None:
+    """Append one evaluation (single-row transaction)."""
+    append_records(file_path, [evaluation])
+
+
+# ============================================================================
+# LOAD
+# ============================================================================
+
+def _split_filters(
+    model: Type[BaseModel],
+    filters: Dict[str, Any] | None,
+) -> Tuple[List[str], List[Any], Dict[str, Any]]:
+    """
+    Split equality filters into SQL predicates on indexed columns and a
+    residual dict evaluated in Python after model construction.
+
+    Only values whose SQL comparison is exactly Python equality are pushed
+    down (str on text columns, timedelta on horizon).
+    """
+    _, columns, _ = _TABLES[model]
+    clauses: List[str] = []
+    params: List[Any] = []
+    residual: Dict[str, Any] = {}
+    for field, value in (filters or {}).items():
+        column = columns.get(field)
+        if column == "horizon_us" and isinstance(value, timedelta):
+            clauses.append("horizon_us = ?")
+            params.append(_horizon_to_us(value))
+        elif column is not None and column != "horizon_us" and isinstance(value, str):
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        else:
+            residual[field] = value
+    return clauses, params, residual
+
+
+def iter_records(
+    file_path: str | Path,
+    model: Type[BaseModel],
+    filters: Dict[str, Any] | None = None,
+) -> Iterator[BaseModel]:
+    """
+    Lazily yield records in append order.
+
+    Indexed filters run in SQLite; models are only validated for rows that
+    pass them, and rows are streamed rather than materialized.
+
+    Raises:
+        StorageException: If read fails
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return
+
+    table, _, _ = _TABLES[model]
+    clauses, params, residual = _split_filters(model, filters)
+    sql = f"SELECT payload FROM {table}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY seq"
+
+    try:
+        with closing(sqlite3.connect(str(file_path))) as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if not exists:
+                return
+            for (payload,) in conn.execute(sql, params):
+                record = model.model_validate(json.loads(payload))
+                if residual and not _matches_filters(record, residual):
+                    continue
+                yield record
+
+    except Exception as e:
+        raise StorageException(f"Failed to load {table} from {file_path}: {e}") from e
+
+
+def load_records(
+    file_path: str | Path,
+    model: Type[BaseModel],
+    filters: Dict[str, Any] | None = None,
+) -> List[BaseModel]:
+    """Materialize iter_records into a list."""
+    return list(iter_records(file_path, model, filters))
+
+
+def count_records(
+    file_path: str | Path,
+    model: Type[BaseModel],
+    filters: Dict[str, Any] | None = None,
+) -> int:
+    """
+    Count records matching indexed filters without constructing models.
+
+    Raises:
+        StorageException: If a filter cannot be pushed down to SQL
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return 0
+    table, _, _ = _TABLES[model]
+    clauses, params, residual = _split_filters(model, filters)
+    if residual:
+        raise StorageException(f"Filters not indexable for count: {sorted(residual)}")
+    sql = f"SELECT COUNT(*) FROM {table}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    with closing(_connect(file_path)) as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+# ============================================================================
+# JSONL IMPORT
+# ============================================================================
+
+def import_jsonl_to_sqlite(
+    jsonl_path: str | Path,
+    db_path: str | Path,
+    kind: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    One-shot import of a JSON lines ledger file into a SQLite ledger.
+
+    Every line is validated against its model so the imported payloads are
+    exactly what the JSONL loaders would have returned.
+
+    Args:
+        jsonl_path: Source JSON lines file
+        db_path: Target SQLite database (created if missing)
+        kind: "forecast", "outcome" or "evaluation"
+        batch_size: Rows per transaction
+
+    Returns:
+        Number of records imported
+
+    Raises:
+        StorageException: If read or write fails
+    """
+    if kind not in _KIND_TO_MODEL:
+        raise StorageException(f"Unknown record kind: {kind}")
+    model = _KIND_TO_MODEL[kind]
+    jsonl_path = Path(jsonl_path)
+
+    def _records() -> Iterator[BaseModel]:
+        with open(jsonl_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield model.model_validate(json.loads(line))
+
+    try:
+        return append_records(db_path, _records(), batch_size=batch_size)
+    except StorageException:
+        raise
+    except Exception as e:
+        raise StorageException(f"Failed to import {jsonl_path} into {db_path}: {e}") from e
+
+
+def _matches_filters(obj: Any, filters: Dict[str, Any]) -> bool:
+    """Same semantics as prediction_ledger.storage._matches_filters."""
+    for field, value in filters.items():
+        if not hasattr(obj, field) or getattr(obj, field) != value:
+            return False
+    return True
@@ -3,6 +3,9 @@ Prediction Ledger File Storage
 
 File-based storage using JSON lines format (append-only).
 
+Paths ending in .db, .sqlite or .sqlite3 are routed to the indexed SQLite
+backend in prediction_ledger.sqlite_storage; the API is identical.
+
 Author: FjordHQ Engineering Team
 Date: 2025-11-18
 ADR: ADR-061
@@ -14,6 +17,7 @@ from typing import Any, Dict, List
 
 from prediction_ledger.models import ForecastRecord, OutcomeRecord, EvaluationRecord
 from prediction_ledger.exceptions import StorageException
+from prediction_ledger import sqlite_storage
 
 
 def append_forecast_to_file(file_path: str | Path, forecast: ForecastRecord) -> None:
@@ -29,6 +33,9 @@ def append_forecast_to_file(file_path: str | Path, forecast: ForecastRecord) ->
     Raises:
         StorageException: If write fails
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.append_forecast(file_path, forecast)
+
     try:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -52,6 +59,9 @@ def append_outcome_to_file(file_path: str | Path, outcome: OutcomeRecord) -> Non
     Raises:
         StorageException: If write fails
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.append_outcome(file_path, outcome)
+
     try:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -77,6 +87,9 @@ def append_evaluation_to_file(
     Raises:
         StorageException: If write fails
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.append_evaluation(file_path, evaluation)
+
     try:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -108,6 +121,9 @@ def load_forecasts(
     Raises:
         StorageException: If read fails
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.load_records(file_path, ForecastRecord, filters)
+
     try:
         file_path = Path(file_path)
 
@@ -151,6 +167,9 @@ def load_outcomes(
     Raises:
         StorageException: If read fails
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.load_records(file_path, OutcomeRecord, filters)
+
     try:
         file_path = Path(file_path)
 
@@ -191,6 +210,9 @@ def load_evaluations(
     Returns:
         List of EvaluationRecord objects
     """
+    if sqlite_storage.is_sqlite_path(file_path):
+        return sqlite_storage.load_records(file_path, EvaluationRecord, filters)
+
     try:
         file_path = Path(file_path)
 
@@ -0,0 +1,220 @@
+"""
+Columnar Evaluation Tests
+
+Randomized equivalence of prediction_ledger.columnar against the
+per-list functions in prediction_ledger.evaluation.
+
+Author: FjordHQ Engineering Team
+Date: 2025-11-18
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from prediction_ledger import (
+    ForecastRecord,
+    OutcomeRecord,
+    ForecastOutcomePair,
+    compute_brier_score,
+    compute_calibration_curve,
+    compute_baseline_brier_score,
+    compute_directional_accuracy,
+    build_calibration_curve_v2,
+    build_skill_report,
+    EvaluationConfig,
+)
+from prediction_ledger.columnar import (
+    EvaluationFrame,
+    GroupedSkillState,
+    bootstrap_brier_ci,
+    build_calibration_curves,
+    build_skill_reports,
+    compute_grouped_skill,
+)
+from prediction_ledger.utils import compute_log_score_single, derive_horizon_bucket
+
+TOL = 1e-12
+MODELS = ["m_alpha", "m_beta", None]
+TARGET_TYPES = ["REGIME_TRANSITION_PROB", "DIRECTION_PROB"]
+HORIZONS = [timedelta(days=1), timedelta(days=5), timedelta(days=10)]
+
+
+def _random_pairs(seed: int, n: int):
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(n):
+        ts = datetime(2025, 1, 1) + timedelta(hours=rng.randint(0, 24 * 300))
+        horizon = rng.choice(HORIZONS)
+        target_type = rng.choice(TARGET_TYPES)
+        model_id = rng.choice(MODELS)
+        # Include exact bin edges, 0.0 and 1.0
+        prob = rng.choice([rng.random(), round(rng.random(), 1), 0.0, 1.0])
+        realized = rng.choice([0, 1, 1, rng.random()])
+        pairs.append(ForecastOutcomePair(
+            forecast=ForecastRecord(
+                forecast_id=f"f_{i}",
+                timestamp=ts,
+                horizon=horizon,
+                target_id=f"{target_type}_t",
+                target_type=target_type,
+                forecast_value=prob,
+                input_state_hash="h",
+                metadata={"model_id": model_id} if model_id else {},
+            ),
+            outcome=OutcomeRecord(
+                outcome_id=f"o_{i}",
+                timestamp=ts + horizon,
+                target_id=f"{target_type}_t",
+                target_type=target_type,
+                realized_value=realized,
+            ),
+        ))
+    return pairs
+
+
+def _group(pairs):
+    groups = {}
+    for p in pairs:
+        key = (
+            p.forecast.metadata.get("model_id"),
+            p.forecast.target_type,
+            derive_horizon_bucket(p.forecast.horizon),
+        )
+        groups.setdefault(key, []).append(p)
+    return groups
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_grouped_metrics_match_per_group_functions(seed):
+    pairs = _random_pairs(seed, 600)
+    frame = EvaluationFrame.from_pairs(pairs)
+    groups, m = compute_grouped_skill(frame)
+    expected = _group(pairs)
+
+    assert set(groups) == set(expected)
+    for row, key in enumerate(groups):
+        group_pairs = expected[key]
+        assert m["n"][row] == len(group_pairs)
+        assert abs(m["brier_score"][row] - compute_brier_score(group_pairs).metric_value) < TOL
+        assert abs(
+            m["brier_score_baseline"][row] - compute_baseline_brier_score(group_pairs)
+        ) < TOL
+        assert abs(
+            m["directional_accuracy"][row]
+            - compute_directional_accuracy(group_pairs).metric_value
+        ) < TOL
+        log_loss = sum(
+            compute_log_score_single(
+                float(p.forecast.forecast_value),
+                1 if float(p.outcome.realized_value) > 0.5 else 0,
+            )
+            for p in group_pairs
+        ) / len(group_pairs)
+        assert abs(m["log_loss"][row] - log_loss) < TOL
+
+        curve = build_calibration_curve_v2(group_pairs, key[1], key[2])
+        assert abs(m["mean_calibration_error"][row] - curve.mean_calibration_error) < TOL
+
+
+@pytest.mark.parametrize("seed", [3, 11])
+def test_skill_reports_match_build_skill_report(seed):
+    pairs = _random_pairs(seed, 500)
+    reports = build_skill_reports(EvaluationFrame.from_pairs(pairs))
+    expected = _group(pairs)
+
+    assert len(reports) == len(expected)
+    for report in reports:
+        group_pairs = expected[(report.model_id, report.target_type, report.horizon_bucket)]
+        ref = build_skill_report(
+            target_type=report.target_type,
+            horizon_bucket=report.horizon_bucket,
+            pairs=group_pairs,
+            period_start=report.period_start,
+            period_end=report.period_end,
+            model_id=report.model_id,
+        )
+        for name in ("brier_score", "brier_score_baseline", "brier_skill_score",
+                     "directional_accuracy"):
+            assert abs(getattr(report.metrics, name) - getattr(ref.metrics, name)) < TOL
+        assert report.sample_size == ref.sample_size
+        assert report.is_well_calibrated == ref.is_well_calibrated
+        assert report.has_positive_skill == ref.has_positive_skill
+        assert report.sufficient_sample == ref.sufficient_sample
+        assert report.report_id == ref.report_id
+
+
+@pytest.mark.parametrize("n_bins", [10, 7])
+def test_calibration_bins_match_v1_and_v2(n_bins):
+    pairs = _random_pairs(5, 800)
+    frame = EvaluationFrame.from_pairs(pairs)
+    state = GroupedSkillState(group_by=("target_type",), n_bins=n_bins).update(frame)
+
+    for (target_type,), group_pairs in {
+        (tt,): [p for p in pairs if p.forecast.target_type == tt] for tt in TARGET_TYPES
+    }.items():
+        v2 = build_calibration_curve_v2(
+            group_pairs, target_type, "mixed", num_bins=n_bins, min_samples_per_bin=5
+        )
+        ours = state.calibration_bins((target_type,), min_samples_per_bin=5)
+        assert len(ours) == len(v2.bins)
+        for a, b in zip(ours, v2.bins):
+            assert (a.lower_bound, a.upper_bound, a.count) == (b.lower_bound, b.upper_bound, b.count)
+            assert abs(a.forecast_mean - b.forecast_mean) < TOL
+            assert abs(a.observed_frequency - b.observed_frequency) < TOL
+
+        # v1 uses the same bins with bin centers as forecast_mean
+        v1 = compute_calibration_curve(
+            group_pairs, EvaluationConfig(n_calibration_bins=n_bins, min_samples_per_bin=5)
+        )
+        assert [b.count for b in v1.bins] == [b.count for b in ours]
+        for a, b in zip(ours, v1.bins):
+            assert abs(a.observed_frequency - b.observed_frequency) < TOL
+
+    curves = build_calibration_curves(state)
+    assert set(curves) == {(tt,) for tt in TARGET_TYPES}
+
+
+def test_brier_decomposition_identity():
+    pairs = _random_pairs(9, 400)
+    frame = EvaluationFrame.from_pairs(pairs)
+    # Decomposition is exact when every forecast equals its bin mean
+    frame.forecast_prob = (np.floor(frame.forecast_prob * 10).clip(0, 9) + 0.5) / 10
+    _, m = compute_grouped_skill(frame)
+    recomposed = m["reliability"] - m["resolution"] + m["uncertainty"]
+    assert np.allclose(recomposed, m["brier_score"], atol=1e-12)
+
+
+def test_incremental_update_matches_full_pass():
+    pairs = _random_pairs(21, 900)
+    full = GroupedSkillState().update(EvaluationFrame.from_pairs(pairs))
+
+    incremental = GroupedSkillState()
+    for lo in range(0, len(pairs), 250):
+        incremental.update(EvaluationFrame.from_pairs(pairs[lo:lo + 250]))
+
+    m_full = full.metrics()
+    m_inc = incremental.metrics()
+    order = [incremental.index[g] for g in full.groups]
+    for name, values in m_full.items():
+        assert np.allclose(values, m_inc[name][order], atol=TOL, rtol=0), name
+    for g in full.groups:
+        assert full.period_start[full.index[g]] == incremental.period_start[incremental.index[g]]
+        assert full.period_end[full.index[g]] == incremental.period_end[incremental.index[g]]
+
+
+def test_bootstrap_ci_brackets_point_estimate():
+    pairs = _random_pairs(2, 1000)
+    frame = EvaluationFrame.from_pairs(pairs)
+    groups, m = compute_grouped_skill(frame)
+    ci_groups, ci = bootstrap_brier_ci(frame, n_boot=400, seed=0)
+
+    assert ci_groups == groups
+    assert np.all(ci[:, 0] <= m["brier_score"] + TOL)
+    assert np.all(ci[:, 1] >= m["brier_score"] - TOL)
+
+    _, ci_again = bootstrap_brier_ci(frame, n_boot=400, seed=0, chunk_size=37)
+    assert np.array_equal(ci, ci_again)
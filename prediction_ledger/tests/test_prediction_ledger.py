@@ -41,6 +41,7 @@ from prediction_ledger import (
     save_calibration_curve_to_json,
     load_calibration_curve_from_json,
     calibration_curve_to_dict,
+    import_jsonl_to_sqlite,
 )
 from prediction_ledger.exceptions import InvalidForecastException, InsufficientDataException
 
@@ -296,12 +297,18 @@ class TestEvaluation:
         assert eval_record.metric_value == 0.8  # 80% hit rate
 
 
+@pytest.fixture(params=["jsonl", "sqlite"])
+def storage_suffix(request):
+    """Run storage tests against both the JSON lines and SQLite backends."""
+    return request.param
+
+
 class TestStorage:
     """Test file-based storage."""
 
-    def test_append_and_load_forecasts(self, tmp_path):
+    def test_append_and_load_forecasts(self, tmp_path, storage_suffix):
         """Test appending and loading forecasts."""
-        file_path = tmp_path / "forecasts.jsonl"
+        file_path = tmp_path / f"forecasts.{storage_suffix}"
 
         # Create and append forecasts
         forecasts = [
@@ -327,9 +334,9 @@ class TestStorage:
         assert loaded_forecasts[0].forecast_id == "f_000"
         assert loaded_forecasts[4].forecast_id == "f_004"
 
-    def test_load_forecasts_with_filter(self, tmp_path):
+    def test_load_forecasts_with_filter(self, tmp_path, storage_suffix):
         """Test loading forecasts with filters."""
-        file_path = tmp_path / "forecasts.jsonl"
+        file_path = tmp_path / f"forecasts.{storage_suffix}"
 
         # Create forecasts with different targets
         for i in range(10):
@@ -349,6 +356,76 @@ class TestStorage:
 
         assert len(loaded) == 5  # Half of the forecasts
 
+    def test_load_forecasts_with_horizon_and_residual_filter(self, tmp_path, storage_suffix):
+        """Test indexed horizon filter combined with a non-indexed field."""
+        file_path = tmp_path / f"forecasts.{storage_suffix}"
+
+        for i in range(12):
+            append_forecast_to_file(file_path, ForecastRecord(
+                forecast_id=f"f_{i:03d}",
+                timestamp=datetime(2025, 9, 1) + timedelta(days=i),
+                horizon=timedelta(days=5 if i % 3 else 10),
+                target_id="target_001",
+                target_type="REGIME_TRANSITION_PROB",
+                forecast_value=0.25 if i % 2 else 0.75,
+                input_state_hash="abc123",
+            ))
+
+        loaded = load_forecasts(
+            file_path,
+            filters={"horizon": timedelta(days=10), "forecast_value": 0.75},
+        )
+
+        assert [f.forecast_id for f in loaded] == ["f_000", "f_006"]
+
+    def test_append_and_load_outcomes(self, tmp_path, storage_suffix):
+        """Test appending and loading outcomes."""
+        file_path = tmp_path / f"outcomes.{storage_suffix}"
+
+        outcomes = [
+            OutcomeRecord(
+                outcome_id=f"o_{i:03d}",
+                timestamp=datetime(2025, 9, 6) + timedelta(days=i),
+                target_id=f"target_{i % 2:03d}",
+                target_type="REGIME_TRANSITION_PROB",
+                realized_value=i % 2,
+            )
+            for i in range(6)
+        ]
+        for outcome in outcomes:
+            append_outcome_to_file(file_path, outcome)
+
+        assert load_outcomes(file_path) == outcomes
+        assert load_outcomes(file_path, filters={"target_id": "target_001"}) == outcomes[1::2]
+
+    def test_load_missing_file_returns_empty(self, tmp_path, storage_suffix):
+        """Test loading from a path that does not exist."""
+        assert load_forecasts(tmp_path / f"missing.{storage_suffix}") == []
+
+    def test_import_jsonl_to_sqlite(self, tmp_path):
+        """Test one-shot JSONL import yields identical records."""
+        jsonl_path = tmp_path / "forecasts.jsonl"
+        db_path = tmp_path / "forecasts.sqlite"
+
+        for i in range(8):
+            append_forecast_to_file(jsonl_path, ForecastRecord(
+                forecast_id=f"f_{i:03d}",
+                timestamp=datetime(2025, 9, 1) + timedelta(hours=i),
+                horizon=timedelta(days=5),
+                target_id=f"target_{i % 2:03d}",
+                target_type="REGIME_TRANSITION_PROB",
+                forecast_value=i / 10,
+                input_state_hash="abc123",
+                metadata={"model": "m1"},
+            ))
+
+        assert import_jsonl_to_sqlite(jsonl_path, db_path, kind="forecast", batch_size=3) == 8
+        assert load_forecasts(db_path) == load_forecasts(jsonl_path)
+        assert (
+            load_forecasts(db_path, filters={"forecast_id": "f_005"})
+            == load_forecasts(jsonl_path, filters={"forecast_id": "f_005"})
+        )
+
 
 # ============================================================================
 # CALIBRATION & SKILL METRICS TESTS (v1.1)